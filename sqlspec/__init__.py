@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any
 
 from sqlspec import adapters, base, builder, core, driver, exceptions, extensions, loader, migrations, typing, utils
 from sqlspec.__metadata__ import __version__
+from sqlspec._transfer import TransferCheckpoint, TransferResult, transfer, transfer_async
 from sqlspec.base import SQLSpec
 from sqlspec.builder import (
     Column,
@@ -36,16 +37,21 @@ from sqlspec.builder import (
 from sqlspec.config import AsyncDatabaseConfig, SyncDatabaseConfig
 from sqlspec.core import (
     SQL,
+    AdmissionLimiter,
     ArrowResult,
     CacheConfig,
     CacheStats,
+    CircuitBreaker,
     ParameterConverter,
     ParameterDeclaration,
     ParameterProcessor,
     ParameterStyle,
     ParameterStyleConfig,
     ParamTypeMatcher,
+    PoolSizingPolicy,
     ProcessedState,
+    RetryBudget,
+    RetryPolicy,
     SQLResult,
     StackOperation,
     StackResult,
@@ -88,6 +94,7 @@ if TYPE_CHECKING:
 
 __all__ = (
     "SQL",
+    "AdmissionLimiter",
     "ArrowResult",
     "AsyncDatabaseConfig",
     "AsyncDriverAdapterBase",
@@ -95,6 +102,7 @@ __all__ = (
     "AsyncEventListener",
     "CacheConfig",
     "CacheStats",
+    "CircuitBreaker",
     "Column",
     "ColumnExpression",
     "ConnectionT",
@@ -115,10 +123,13 @@ __all__ = (
     "ParameterProcessor",
     "ParameterStyle",
     "ParameterStyleConfig",
+    "PoolSizingPolicy",
     "PoolT",
     "ProcessedState",
     "QueryBuilder",
     "RedactionConfig",
+    "RetryBudget",
+    "RetryPolicy",
     "SQLFactory",
     "SQLFile",
     "SQLFileLoader",
@@ -141,6 +152,8 @@ __all__ = (
     "SyncEventChannel",
     "SyncEventListener",
     "TelemetryConfig",
+    "TransferCheckpoint",
+    "TransferResult",
     "Update",
     "__version__",
     "adapters",
@@ -162,6 +175,8 @@ __all__ = (
     "register_param_type",
     "resolve_param_type",
     "sql",
+    "transfer",
+    "transfer_async",
     "typing",
     "utils",
 )
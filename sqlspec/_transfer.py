@@ -0,0 +1,417 @@
+"""Streaming table-to-table transfer between two driver sessions.
+
+:func:`transfer` and :func:`transfer_async` read a query from one session as
+Arrow RecordBatches (``select_stream_arrow``) and write each batch to a table in
+another session (``load_from_arrow``), so only a few batches are in memory at a
+time. Reading the next batch overlaps with writing the current one: a worker
+thread reads ahead for :func:`transfer` and a background task reads ahead for
+:func:`transfer_async`.
+"""
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple, cast
+
+from sqlglot import exp
+
+from sqlspec.driver import AsyncDriverAdapterBase, SyncDriverAdapterBase
+from sqlspec.driver._storage_helpers import DEFAULT_STORAGE_BATCH_SIZE
+from sqlspec.exceptions import ImproperConfigurationError
+from sqlspec.utils.logging import get_logger, log_with_context
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+
+    from sqlspec.builder import QueryBuilder
+    from sqlspec.core import Statement, StatementConfig
+    from sqlspec.typing import ArrowRecordBatch
+
+__all__ = ("TransferCheckpoint", "TransferMode", "TransferResult", "transfer", "transfer_async")
+
+logger = get_logger("sqlspec.transfer")
+
+TransferMode = Literal["append", "replace", "upsert"]
+_TRANSFER_MODES: Final[frozenset[str]] = frozenset({"append", "replace", "upsert"})
+_ON_CONFLICT_DIALECTS: Final[frozenset[str]] = frozenset({"postgres", "postgresql", "sqlite", "duckdb", "cockroachdb"})
+_DUPLICATE_KEY_DIALECTS: Final[frozenset[str]] = frozenset({"mysql", "mariadb"})
+_END: Final = object()
+
+
+class TransferCheckpoint(NamedTuple):
+    """Progress after a batch has been written to the target.
+
+    Pass the last checkpoint as ``resume_from`` to continue an interrupted
+    transfer. The first ``rows`` source rows are then read and skipped, so the
+    query must return rows in a stable order (``ORDER BY`` a unique key).
+    """
+
+    rows: int
+    batches: int
+    bytes: int
+
+
+class TransferResult(NamedTuple):
+    """Totals and throughput for a finished transfer."""
+
+    rows: int
+    batches: int
+    bytes: int
+    elapsed_s: float
+    rows_per_second: float
+    bytes_per_second: float
+    checkpoint: TransferCheckpoint
+
+
+class _TransferState:
+    """Running totals plus the resume offset shared by the sync and async loops."""
+
+    __slots__ = ("batches", "bytes", "rows", "skip", "started")
+
+    def __init__(self, resume_from: "TransferCheckpoint | None") -> None:
+        self.rows = resume_from.rows if resume_from is not None else 0
+        self.batches = resume_from.batches if resume_from is not None else 0
+        self.bytes = resume_from.bytes if resume_from is not None else 0
+        self.skip = self.rows
+        self.started = time.perf_counter()
+
+    def trim(self, batch: "ArrowRecordBatch") -> "ArrowRecordBatch | None":
+        """Drop rows already written by the run being resumed; None when nothing is left."""
+        if not self.skip:
+            return batch if batch.num_rows else None
+        if batch.num_rows <= self.skip:
+            self.skip -= batch.num_rows
+            return None
+        batch = batch.slice(self.skip)
+        self.skip = 0
+        return batch
+
+    def record(self, batch: "ArrowRecordBatch") -> TransferCheckpoint:
+        self.rows += batch.num_rows
+        self.batches += 1
+        self.bytes += batch.nbytes
+        return TransferCheckpoint(self.rows, self.batches, self.bytes)
+
+    def result(self, table: str) -> TransferResult:
+        elapsed = time.perf_counter() - self.started
+        result = TransferResult(
+            rows=self.rows,
+            batches=self.batches,
+            bytes=self.bytes,
+            elapsed_s=elapsed,
+            rows_per_second=self.rows / elapsed if elapsed else 0.0,
+            bytes_per_second=self.bytes / elapsed if elapsed else 0.0,
+            checkpoint=TransferCheckpoint(self.rows, self.batches, self.bytes),
+        )
+        log_with_context(
+            logger,
+            logging.DEBUG,
+            "transfer.complete",
+            table=table,
+            rows=result.rows,
+            batches=result.batches,
+            bytes=result.bytes,
+            elapsed_s=round(elapsed, 6),
+        )
+        return result
+
+
+def _validate(mode: str, key_columns: "list[str] | tuple[str, ...] | None", batch_size: int, prefetch: int) -> None:
+    if mode not in _TRANSFER_MODES:
+        msg = f"mode must be one of 'append', 'replace' or 'upsert', got {mode!r}"
+        raise ValueError(msg)
+    if mode == "upsert" and not key_columns:
+        msg = "mode='upsert' requires key_columns"
+        raise ValueError(msg)
+    if batch_size < 1:
+        msg = "batch_size must be greater than or equal to 1"
+        raise ValueError(msg)
+    if prefetch < 0:
+        msg = "prefetch must be greater than or equal to 0"
+        raise ValueError(msg)
+
+
+def _identifier(name: str, dialect: str) -> str:
+    return exp.to_identifier(name).sql(dialect=dialect)
+
+
+def build_upsert_sql(table: str, columns: "list[str]", key_columns: "list[str] | tuple[str, ...]", dialect: str) -> str:
+    """Return a named-parameter upsert statement for one row of ``columns``.
+
+    PostgreSQL, SQLite and DuckDB use ``INSERT ... ON CONFLICT``, MySQL uses
+    ``ON DUPLICATE KEY UPDATE`` and Oracle uses ``MERGE ... USING dual``.
+
+    Raises:
+        ImproperConfigurationError: The dialect has no supported upsert form.
+    """
+    missing = [column for column in key_columns if column not in columns]
+    if missing:
+        msg = f"key_columns {missing} are not in the transferred columns {columns}"
+        raise ImproperConfigurationError(msg)
+    dialect_name = dialect.lower()
+    target = exp.to_table(table).sql(dialect=dialect_name)
+    quoted = {column: _identifier(column, dialect_name) for column in columns}
+    updates = [column for column in columns if column not in key_columns]
+    column_list = ", ".join(quoted[column] for column in columns)
+    values = ", ".join(f":{column}" for column in columns)
+    if dialect_name in _ON_CONFLICT_DIALECTS:
+        keys = ", ".join(quoted[column] for column in key_columns)
+        if not updates:
+            return f"INSERT INTO {target} ({column_list}) VALUES ({values}) ON CONFLICT ({keys}) DO NOTHING"
+        assignments = ", ".join(f"{quoted[column]} = EXCLUDED.{quoted[column]}" for column in updates)
+        return (
+            f"INSERT INTO {target} ({column_list}) VALUES ({values}) ON CONFLICT ({keys}) DO UPDATE SET {assignments}"
+        )
+    if dialect_name in _DUPLICATE_KEY_DIALECTS:
+        refresh = updates or list(key_columns[:1])
+        assignments = ", ".join(f"{quoted[column]} = VALUES({quoted[column]})" for column in refresh)
+        return f"INSERT INTO {target} ({column_list}) VALUES ({values}) ON DUPLICATE KEY UPDATE {assignments}"
+    if dialect_name == "oracle":
+        selected = ", ".join(f":{column} AS {quoted[column]}" for column in columns)
+        match = " AND ".join(f"t.{quoted[column]} = s.{quoted[column]}" for column in key_columns)
+        inserted = ", ".join(f"s.{quoted[column]}" for column in columns)
+        statement = f"MERGE INTO {target} t USING (SELECT {selected} FROM dual) s ON ({match})"
+        if updates:
+            assignments = ", ".join(f"t.{quoted[column]} = s.{quoted[column]}" for column in updates)
+            statement += f" WHEN MATCHED THEN UPDATE SET {assignments}"
+        return f"{statement} WHEN NOT MATCHED THEN INSERT ({column_list}) VALUES ({inserted})"
+    msg = f"mode='upsert' is not supported for dialect {dialect!r}"
+    raise ImproperConfigurationError(msg)
+
+
+def _target_dialect(target: Any) -> str:
+    return str(target.statement_config.dialect or "")
+
+
+def _write_batch_sync(
+    target: SyncDriverAdapterBase, table: str, batch: "ArrowRecordBatch", overwrite: bool, upsert_sql: "str | None"
+) -> None:
+    if upsert_sql is None:
+        target.load_from_arrow(table, batch, overwrite=overwrite)
+    else:
+        target.execute_many(upsert_sql, batch.to_pylist())
+
+
+def _read_ahead(batches: "Iterator[ArrowRecordBatch]", prefetch: int) -> "Iterator[ArrowRecordBatch]":
+    """Yield ``batches`` while a worker thread keeps up to ``prefetch`` batches read ahead."""
+    if prefetch <= 0:
+        yield from batches
+        return
+    pending: queue.Queue[Any] = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def _offer(item: Any) -> bool:
+        while not stop.is_set():
+            with contextlib.suppress(queue.Full):
+                pending.put(item, timeout=0.1)
+                return True
+        return False
+
+    def _produce() -> None:
+        try:
+            for batch in batches:
+                if not _offer((batch, None)):
+                    return
+            _offer((_END, None))
+        except BaseException as exc:
+            _offer((_END, exc))
+
+    worker = threading.Thread(target=_produce, name="sqlspec-transfer-read", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item, error = pending.get()
+            if error is not None:
+                raise error
+            if item is _END:
+                return
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def transfer(
+    source: SyncDriverAdapterBase,
+    query: "Statement | QueryBuilder",
+    target: SyncDriverAdapterBase,
+    table: str,
+    *,
+    batch_size: int = DEFAULT_STORAGE_BATCH_SIZE,
+    mode: TransferMode = "append",
+    key_columns: "list[str] | tuple[str, ...] | None" = None,
+    prefetch: int = 1,
+    arrow_schema: Any = None,
+    statement_config: "StatementConfig | None" = None,
+    resume_from: "TransferCheckpoint | None" = None,
+    on_checkpoint: "Callable[[TransferCheckpoint], None] | None" = None,
+    commit_each_batch: bool = False,
+) -> TransferResult:
+    """Stream the rows of ``query`` on ``source`` into ``table`` on ``target``.
+
+    Batches come from the source's native Arrow path (binary COPY, DuckDB/ADBC
+    readers, Oracle ``fetch_df_batches`` or cursor chunks) and are written with
+    the target's ``load_from_arrow`` (COPY, ADBC ingest, DuckDB Arrow scans,
+    Oracle array DML or ``executemany``).
+
+    Args:
+        source: Session the query runs on.
+        query: SELECT statement producing the rows to copy.
+        target: Session that receives the rows. Use a different session than ``source``.
+        table: Target table name.
+        batch_size: Rows per batch.
+        mode: ``"append"`` adds rows, ``"replace"`` empties the table before the
+            first batch, and ``"upsert"`` inserts or updates by ``key_columns``.
+        key_columns: Conflict key for ``mode="upsert"``.
+        prefetch: Batches read ahead on a worker thread while the target writes; 0 disables.
+        arrow_schema: Optional schema every batch is cast to.
+        statement_config: Optional statement configuration for ``query``.
+        resume_from: Checkpoint of an interrupted run to continue from.
+        on_checkpoint: Called with a checkpoint after each batch is written.
+        commit_each_batch: Commit the target after each batch so checkpoints match committed rows.
+
+    Returns:
+        Row, batch and byte totals with throughput and the final checkpoint.
+    """
+    _validate(mode, key_columns, batch_size, prefetch)
+    state = _TransferState(resume_from)
+    overwrite = mode == "replace" and resume_from is None
+    upsert_sql: str | None = None
+    stream = source.select_stream_arrow(
+        query, statement_config=statement_config, batch_size=batch_size, arrow_schema=arrow_schema
+    )
+    with stream:
+        for raw_batch in _read_ahead(iter(stream), prefetch):
+            batch = state.trim(raw_batch)
+            if batch is None:
+                continue
+            if mode == "upsert" and upsert_sql is None:
+                upsert_sql = build_upsert_sql(
+                    table, batch.schema.names, cast("list[str]", key_columns), _target_dialect(target)
+                )
+            _write_batch_sync(target, table, batch, overwrite, upsert_sql)
+            overwrite = False
+            if commit_each_batch:
+                target.commit()
+            checkpoint = state.record(batch)
+            if on_checkpoint is not None:
+                on_checkpoint(checkpoint)
+    if overwrite and stream.schema is not None:
+        target.load_from_arrow(table, stream.schema.empty_table(), overwrite=True)
+        if commit_each_batch:
+            target.commit()
+    return state.result(table)
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _iter_source(stream: Any) -> "AsyncIterator[ArrowRecordBatch]":
+    if hasattr(stream, "__anext__"):
+        async for batch in stream:
+            yield batch
+        return
+    for batch in stream:
+        yield batch
+
+
+async def _read_ahead_async(
+    batches: "AsyncIterator[ArrowRecordBatch]", prefetch: int
+) -> "AsyncIterator[ArrowRecordBatch]":
+    """Yield ``batches`` while a background task keeps up to ``prefetch`` batches read ahead."""
+    if prefetch <= 0:
+        async for batch in batches:
+            yield batch
+        return
+    pending: asyncio.Queue[Any] = asyncio.Queue(maxsize=prefetch)
+
+    async def _produce() -> None:
+        try:
+            async for batch in batches:
+                await pending.put((batch, None))
+            await pending.put((_END, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as exc:
+            await pending.put((_END, exc))
+
+    task = asyncio.ensure_future(_produce())
+    try:
+        while True:
+            item, error = await pending.get()
+            if error is not None:
+                raise error
+            if item is _END:
+                return
+            yield item
+    finally:
+        if not task.done():
+            task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def transfer_async(
+    source: "AsyncDriverAdapterBase | SyncDriverAdapterBase",
+    query: "Statement | QueryBuilder",
+    target: "AsyncDriverAdapterBase | SyncDriverAdapterBase",
+    table: str,
+    *,
+    batch_size: int = DEFAULT_STORAGE_BATCH_SIZE,
+    mode: TransferMode = "append",
+    key_columns: "list[str] | tuple[str, ...] | None" = None,
+    prefetch: int = 1,
+    arrow_schema: Any = None,
+    statement_config: "StatementConfig | None" = None,
+    resume_from: "TransferCheckpoint | None" = None,
+    on_checkpoint: "Callable[[TransferCheckpoint], Awaitable[None] | None] | None" = None,
+    commit_each_batch: bool = False,
+) -> TransferResult:
+    """Async :func:`transfer`; either session may be sync or async.
+
+    Reading ahead runs in a background task. A sync session is called inline,
+    so it blocks the event loop while it reads or writes.
+    """
+    _validate(mode, key_columns, batch_size, prefetch)
+    state = _TransferState(resume_from)
+    overwrite = mode == "replace" and resume_from is None
+    upsert_sql: str | None = None
+    stream: Any = source.select_stream_arrow(
+        query, statement_config=statement_config, batch_size=batch_size, arrow_schema=arrow_schema
+    )
+    is_async_source = isinstance(source, AsyncDriverAdapterBase)
+    try:
+        async for raw_batch in _read_ahead_async(_iter_source(stream), prefetch):
+            batch = state.trim(raw_batch)
+            if batch is None:
+                continue
+            if mode == "upsert" and upsert_sql is None:
+                upsert_sql = build_upsert_sql(
+                    table, batch.schema.names, cast("list[str]", key_columns), _target_dialect(target)
+                )
+            if upsert_sql is None:
+                await _maybe_await(target.load_from_arrow(table, batch, overwrite=overwrite))
+            else:
+                await _maybe_await(target.execute_many(upsert_sql, batch.to_pylist()))
+            overwrite = False
+            if commit_each_batch:
+                await _maybe_await(target.commit())
+            checkpoint = state.record(batch)
+            if on_checkpoint is not None:
+                await _maybe_await(on_checkpoint(checkpoint))
+    finally:
+        if is_async_source:
+            await stream.aclose()
+        else:
+            stream.close()
+    if overwrite and stream.schema is not None:
+        await _maybe_await(target.load_from_arrow(table, stream.schema.empty_table(), overwrite=True))
+        if commit_each_batch:
+            await _maybe_await(target.commit())
+    return state.result(table)
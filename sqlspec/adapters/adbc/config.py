@@ -367,7 +367,7 @@ class AdbcConfig(NoPoolSyncConfig[AdbcConnection, AdbcDriver]):
         handler = _AdbcSessionConnectionHandler(self)
 
         return AdbcSessionContext(
-            acquire_connection=handler.acquire_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
             release_connection=handler.release_connection,
             statement_config=statement_config,
             driver_features=self.driver_features,
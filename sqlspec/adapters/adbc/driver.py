@@ -439,6 +439,7 @@ class AdbcDriver(SyncDriverAdapterBase):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         return_format: "ArrowReturnFormat" = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -454,6 +455,7 @@ class AdbcDriver(SyncDriverAdapterBase):
             statement: SQL statement, string, or QueryBuilder
             *parameters: Query parameters or filters
             statement_config: Optional statement configuration override
+            timeout: Statement timeout in seconds (overrides ``statement_config``)
             return_format: "table" for pyarrow.Table (default), "batch" for RecordBatch,
                 "batches" for list of RecordBatch, "reader" for RecordBatchReader
             native_only: Ignored for ADBC (always uses native path)
@@ -464,6 +466,21 @@ class AdbcDriver(SyncDriverAdapterBase):
         Returns:
             ArrowResult with native Arrow data
         """
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
+            return self._call_with_statement_timeout(
+                timeout,
+                lambda: self.select_to_arrow(
+                    statement,
+                    *parameters,
+                    statement_config=statement_config,
+                    return_format=return_format,
+                    native_only=native_only,
+                    batch_size=batch_size,
+                    arrow_schema=arrow_schema,
+                    **kwargs,
+                ),
+            )
         ensure_pyarrow()
 
         # Prepare statement
@@ -571,7 +588,7 @@ class AdbcDriver(SyncDriverAdapterBase):
         arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
         sync_pipeline = self._storage_pipeline()
         telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline
+            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline, partitioner=partitioner
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -633,10 +650,22 @@ class AdbcDriver(SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Read an artifact from storage and ingest it via ADBC."""
 
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     # ─────────────────────────────────────────────────────────────────────────────
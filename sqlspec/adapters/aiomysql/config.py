@@ -29,7 +29,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from sqlspec.core import StatementConfig
-    from sqlspec.observability import ObservabilityConfig
+    from sqlspec.observability import ObservabilityConfig, PoolGauges
 
 
 __all__ = ("AiomysqlConfig", "AiomysqlConnectionParams", "AiomysqlDriverFeatures", "AiomysqlPoolParams")
@@ -353,6 +353,19 @@ class AiomysqlConfig(AsyncDatabaseConfig[AiomysqlConnection, "AiomysqlPool", Aio
             self.connection_instance = await self.create_pool()
         return self.connection_instance
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        size = pool.size
+        idle = pool.freesize
+        return {"size": size, "checked_out": size - idle, "idle": idle, "max_size": pool.maxsize}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         """Get the signature namespace for aiomysql types.
 
@@ -110,6 +110,9 @@ class AiosqliteSessionContext:
     async def __aexit__(
         self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
     ) -> "bool | None":
+        if self._driver is not None:
+            await self._driver.release_writer()
+            self._driver = None
         if self._connection is not None:
             await self._release_connection(self._connection)
             self._connection = None
@@ -34,7 +34,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from sqlspec.core import StatementConfig
-    from sqlspec.observability import ObservabilityConfig
+    from sqlspec.observability import ObservabilityConfig, PoolGauges
 
 __all__ = (
     "AiosqliteAggregateConfig",
@@ -76,6 +76,9 @@ class AiosqlitePoolParams(AiosqliteConnectionParams):
     idle_timeout: NotRequired[float]
     operation_timeout: NotRequired[float]
     health_check_interval: NotRequired[float]
+    max_lifetime: NotRequired[float]
+    max_lifetime_jitter: NotRequired[float]
+    pool_mode: NotRequired[Literal["pooled", "single_writer"]]
     enable_optimizations: NotRequired[bool]
     enable_foreign_keys: NotRequired[bool]
     extra: NotRequired["dict[str, Any]"]
@@ -170,6 +173,7 @@ class AiosqliteDriverFeatures(TypedDict):
 _PRAGMA_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _PRAGMA_VALUE_PATTERN = re.compile(r"^[A-Za-z0-9_.\-]+$")
 _ROW_FACTORY_LITERALS = frozenset({"dict", "row", "tuple"})
+_POOL_MODES = frozenset({"pooled", "single_writer"})
 _RUNTIME_FEATURE_KEYS = (
     "authorizer_callback",
     "custom_aggregates",
@@ -251,6 +255,7 @@ class AiosqliteConfig(AsyncDatabaseConfig["AiosqliteConnection", AiosqliteConnec
     supports_native_parquet_export: "ClassVar[bool]" = True
     supports_native_parquet_import: "ClassVar[bool]" = True
     supports_native_row_streaming: "ClassVar[bool]" = True
+    supports_pool_resizing: "ClassVar[bool]" = True
     _connection_context_class: "ClassVar[type[AiosqliteConnectionContext]]" = AiosqliteConnectionContext
     _session_factory_class: "ClassVar[type[_AiosqliteSessionFactory]]" = _AiosqliteSessionFactory
     _session_context_class: "ClassVar[type[AiosqliteSessionContext]]" = AiosqliteSessionContext
@@ -298,6 +303,7 @@ class AiosqliteConfig(AsyncDatabaseConfig["AiosqliteConnection", AiosqliteConnec
                 config_dict["uri"] = True
 
         config_dict = normalize_connection_config(config_dict)
+        _validate_pool_mode(config_dict)
 
         statement_config = statement_config or default_statement_config
         statement_config, driver_features = apply_driver_features(statement_config, driver_features)
@@ -371,6 +377,44 @@ class AiosqliteConfig(AsyncDatabaseConfig["AiosqliteConnection", AiosqliteConnec
             self.connection_instance = await self.create_pool()
         return self.connection_instance
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        size = pool.size()
+        checked_out = pool.checked_out()
+        return {"size": size, "checked_out": checked_out, "idle": size - checked_out, "max_size": pool.max_size}
+
+    def _resize_pool(self, size: int) -> "Awaitable[None] | None":
+        """Resize the live pool for adaptive pool sizing.
+
+        Args:
+            size: New maximum number of connections.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        return pool.resize(size)
+
+    async def _open_warm_connections(self, count: int) -> int:
+        """Open ``count`` pooled connections concurrently without checking them out.
+
+        Returns:
+            Number of connections held by the pool, up to ``count``.
+        """
+        pool = self.connection_instance
+        if pool is None or count <= 0:
+            return 0
+        await pool.warm(count)
+        warmed = min(count, pool.size())
+        self._pool_warmed(count, warmed)
+        return warmed
+
     async def _create_pool(self) -> AiosqliteConnectionPool:
         """Create the connection pool instance.
 
@@ -378,6 +422,8 @@ class AiosqliteConfig(AsyncDatabaseConfig["AiosqliteConnection", AiosqliteConnec
             AiosqliteConnectionPool: The connection pool instance.
         """
         pool_size = self.connection_config.get("pool_size") or 5
+        if self._pool_autoscaler is not None:
+            pool_size = self._pool_autoscaler.size
         min_size = self.connection_config.get("min_size")
         if min_size is None:
             min_size = 0
@@ -388,6 +434,14 @@ class AiosqliteConfig(AsyncDatabaseConfig["AiosqliteConnection", AiosqliteConnec
         if health_check_interval is None:
             health_check_interval = 30.0
         pool_kwargs: dict[str, Any] = {}
+        max_lifetime = self.connection_config.get("max_lifetime")
+        if max_lifetime is not None:
+            pool_kwargs["max_lifetime"] = max_lifetime
+        max_lifetime_jitter = self.connection_config.get("max_lifetime_jitter")
+        if max_lifetime_jitter is not None:
+            pool_kwargs["max_lifetime_jitter"] = max_lifetime_jitter
+        if self.connection_config.get("pool_mode") == "single_writer":
+            pool_kwargs["single_writer"] = True
         enable_optimizations = self.connection_config.get("enable_optimizations")
         if enable_optimizations is not None:
             pool_kwargs["enable_optimizations"] = enable_optimizations
@@ -405,6 +459,7 @@ class AiosqliteConfig(AsyncDatabaseConfig["AiosqliteConnection", AiosqliteConnec
             health_check_interval=health_check_interval,
             on_connection_create=self._user_connection_hook,
             runtime_setup=self._runtime_setup,
+            metrics=self.get_observability_runtime().pool_metrics,
             **pool_kwargs,
         )
 
@@ -413,6 +468,14 @@ class AiosqliteConfig(AsyncDatabaseConfig["AiosqliteConnection", AiosqliteConnec
 
         return pool
 
+    def _prepare_driver(self, driver: AiosqliteDriver) -> AiosqliteDriver:
+        """Attach the writer connection of a single-writer pool to the driver."""
+        driver = super()._prepare_driver(driver)
+        pool = self.connection_instance
+        if pool is not None and pool.single_writer:
+            driver.attach_writer_pool(pool)
+        return driver
+
     def _register_type_adapters(self) -> None:
         """Register custom type adapters and converters for SQLite.
 
@@ -431,6 +494,20 @@ class AiosqliteConfig(AsyncDatabaseConfig["AiosqliteConnection", AiosqliteConnec
             self.connection_instance = None
 
 
+def _validate_pool_mode(config_dict: "dict[str, Any]") -> None:
+    pool_mode = config_dict.get("pool_mode")
+    if pool_mode is None:
+        return
+    if pool_mode not in _POOL_MODES:
+        msg = f"connection_config['pool_mode'] must be 'pooled' or 'single_writer'; got {pool_mode!r}"
+        raise ImproperConfigurationError(msg)
+    if pool_mode == "single_writer" and "mode=memory" in str(config_dict["database"]):
+        msg = (
+            "connection_config['pool_mode'] = 'single_writer' needs a database file; in-memory databases cannot use WAL"
+        )
+        raise ImproperConfigurationError(msg)
+
+
 def _extension_pragma_statements(config: Any, extension_name: str) -> "tuple[str, ...]":
     extension_config = cast("dict[str, Any]", config.extension_config)
     settings = cast("dict[str, Any]", extension_config.get(extension_name, {}))
@@ -266,15 +266,30 @@ class AiosqliteStreamSource:
         self._cursor = cursor
         await cursor.execute(self._sql, normalize_execute_parameters(self._parameters))
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     async def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         rows = await self._driver._run_with_exception_handler(handler, self._cursor.fetchmany, self._chunk_size)
         self._driver._check_pending_exception(handler)
         if not rows:
             return []
-        if self._column_names is None:
-            self._column_names = [description[0] for description in self._cursor.description]
-        return rows_to_dicts(rows, self._column_names)
+        return rows_to_dicts(rows, self._resolve_column_names())
+
+    async def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        handler = self._driver.handle_database_exceptions()
+        rows = await self._driver._run_with_exception_handler(handler, self._cursor.fetchmany, self._chunk_size)
+        self._driver._check_pending_exception(handler)
+        return list(rows or ()), self._resolve_column_names(), None
+
+    def _resolve_column_names(self) -> "list[str]":
+        column_names = self._column_names
+        if column_names is None:
+            description = self._cursor.description if self._cursor is not None else None
+            column_names = [column[0] for column in description or ()]
+            self._column_names = column_names
+        return column_names
 
     async def close(self, error: bool = False) -> None:
         cursor = self._cursor
@@ -314,6 +329,9 @@ def build_connection_config(connection_config: "Mapping[str, Any]") -> "dict[str
         "idle_timeout",
         "operation_timeout",
         "health_check_interval",
+        "max_lifetime",
+        "max_lifetime_jitter",
+        "pool_mode",
         "extra",
         "pool_min_size",
         "pool_max_size",
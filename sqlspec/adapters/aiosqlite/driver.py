@@ -3,6 +3,7 @@
 import asyncio
 import random
 import sqlite3
+from contextlib import asynccontextmanager, nullcontext
 from typing import TYPE_CHECKING, Any, cast
 
 import aiosqlite
@@ -29,6 +30,7 @@ from sqlspec.core.result import DMLResult
 from sqlspec.driver import (
     AsyncDriverAdapterBase,
     AsyncRowStream,
+    AsyncStatementTimeout,
     BaseAsyncExceptionHandler,
     parameter_value_needs_processing,
     type_coercion_fallbacks,
@@ -37,9 +39,10 @@ from sqlspec.exceptions import SQLSpecError
 from sqlspec.utils.type_guards import resolve_row_format
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncGenerator, Awaitable, Sequence
 
     from sqlspec.adapters.aiosqlite._typing import AiosqliteConnection
+    from sqlspec.adapters.aiosqlite.pool import AiosqliteConnectionPool, AiosqlitePoolConnection
     from sqlspec.builder import QueryBuilder
     from sqlspec.core import SQL, SQLResult, Statement, StatementConfig, StatementFilter
     from sqlspec.core.compiler import OperationType
@@ -53,8 +56,12 @@ __all__ = (
     "AiosqliteExceptionHandler",
     "AiosqliteRawCursor",
     "AiosqliteSessionContext",
+    "AiosqliteStatementTimeout",
 )
 
+_PROGRESS_HANDLER_INSTRUCTIONS = 1000
+"""SQLite VM instructions between statement timeout deadline checks."""
+
 
 class AiosqliteExceptionHandler(BaseAsyncExceptionHandler):
     """Async context manager for handling aiosqlite database exceptions.
@@ -77,10 +84,35 @@ class AiosqliteExceptionHandler(BaseAsyncExceptionHandler):
         return False
 
 
+class AiosqliteStatementTimeout(AsyncStatementTimeout):
+    """Statement timeout enforced through a SQLite progress handler.
+
+    Cancelling the awaiting task would leave the statement running on the
+    aiosqlite worker thread, so the deadline is checked inside SQLite instead.
+    """
+
+    __slots__ = ()
+
+    async def arm(self) -> None:
+        await self.connection.set_progress_handler(self._check_deadline, _PROGRESS_HANDLER_INSTRUCTIONS)
+
+    async def disarm(self) -> None:
+        await self.connection.set_progress_handler(None, 0)
+
+    async def run(self, awaitable: "Awaitable[Any]") -> Any:
+        return await awaitable
+
+    def _check_deadline(self) -> int:
+        if self.expired:
+            self.timed_out = True
+            return 1
+        return 0
+
+
 class AiosqliteDriver(AsyncDriverAdapterBase):
     """AIOSQLite driver for async SQLite database operations."""
 
-    __slots__ = ("_data_dictionary", "_rowid_target_cache")
+    __slots__ = ("_data_dictionary", "_reader_connection", "_rowid_target_cache", "_writer", "_writer_pool")
     dialect = "sqlite"
 
     def __init__(
@@ -97,6 +129,9 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
         super().__init__(connection=connection, statement_config=statement_config, driver_features=driver_features)
         self._data_dictionary: AiosqliteDataDictionary | None = None
         self._rowid_target_cache: dict[tuple[str | None, str], bool] = {}
+        self._writer_pool: AiosqliteConnectionPool | None = None
+        self._writer: AiosqlitePoolConnection | None = None
+        self._reader_connection: AiosqliteConnection | None = None
 
     # ─────────────────────────────────────────────────────────────────────────────
     # CORE DISPATCH METHODS
@@ -104,6 +139,9 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
 
     async def dispatch_execute(self, cursor: "AiosqliteRawCursor", statement: "SQL") -> "ExecutionResult":
         """Execute single SQL statement."""
+        if self._routes_to_writer(statement.operation_type):
+            async with self._writer_cursor(statement) as writer_cursor:
+                return await self.dispatch_execute(writer_cursor, statement)
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         self._invalidate_rowid_target_cache(statement.operation_type)
         normalized_parameters = normalize_execute_parameters(prepared_parameters)
@@ -148,6 +186,9 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
 
     async def dispatch_execute_many(self, cursor: "AiosqliteRawCursor", statement: "SQL") -> "ExecutionResult":
         """Execute SQL with multiple parameter sets."""
+        if self._routes_to_writer(statement.operation_type):
+            async with self._writer_cursor(statement) as writer_cursor:
+                return await self.dispatch_execute_many(writer_cursor, statement)
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         self._invalidate_rowid_target_cache(statement.operation_type)
 
@@ -162,6 +203,9 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
 
     async def dispatch_execute_script(self, cursor: "AiosqliteRawCursor", statement: "SQL") -> "ExecutionResult":
         """Execute SQL script."""
+        if self._routes_to_writer("SCRIPT"):
+            async with self._writer_cursor(statement) as writer_cursor:
+                return await self.dispatch_execute_script(writer_cursor, statement)
         self._rowid_target_cache.clear()
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         statements = self.split_script_statements(sql, statement.statement_config, strip_trailing_semicolon=True)
@@ -199,6 +243,10 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
             and self.observability.is_idle
             and self._can_use_execute_many_thin_path(statement, parameters, config)
         ):
+            operation = self._resolve_dml_operation_type(statement)
+            if self._routes_to_writer(operation):
+                async with self._writer_connection():
+                    return await self.execute_many(statement, parameters)
             try:
                 cursor = await self.connection.executemany(statement, parameters)
             except (aiosqlite.Error, sqlite3.Error) as exc:
@@ -206,7 +254,6 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
 
             rowcount = cursor.rowcount
             affected_rows = rowcount if isinstance(rowcount, int) and rowcount > 0 else 0
-            operation = self._resolve_dml_operation_type(statement)
             self._invalidate_rowid_target_cache(operation)
             return DMLResult(operation, affected_rows)
         return await super().execute_many(statement, parameters, *filters, statement_config=statement_config, **kwargs)
@@ -216,7 +263,13 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
     # ─────────────────────────────────────────────────────────────────────────────
 
     async def begin(self) -> None:
-        """Begin a database transaction."""
+        """Begin a database transaction.
+
+        With a single-writer pool the writer connection is taken first and
+        held until ``commit()`` or ``rollback()``.
+        """
+        if self._routes_to_writer("COMMAND"):
+            await self._acquire_writer()
         try:
             if not self.connection.in_transaction:
                 await self.connection.execute("BEGIN IMMEDIATE")
@@ -230,6 +283,7 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
         except aiosqlite.Error as e:
             msg = f"Failed to commit transaction: {e}"
             raise SQLSpecError(msg) from e
+        await self._release_writer_if_idle()
 
     async def rollback(self) -> None:
         """Rollback the current transaction."""
@@ -238,6 +292,7 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
         except aiosqlite.Error as e:
             msg = f"Failed to rollback transaction: {e}"
             raise SQLSpecError(msg) from e
+        await self._release_writer_if_idle()
 
     def with_cursor(self, connection: "AiosqliteConnection") -> "AiosqliteCursor":
         """Create async context manager for AIOSQLite cursor."""
@@ -254,6 +309,82 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
         """Handle AIOSQLite-specific exceptions."""
         return AiosqliteExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "AiosqliteStatementTimeout":
+        return AiosqliteStatementTimeout(connection, timeout)
+
+    # ─────────────────────────────────────────────────────────────────────────────
+    # SINGLE-WRITER ROUTING
+    # ─────────────────────────────────────────────────────────────────────────────
+
+    def attach_writer_pool(self, pool: "AiosqliteConnectionPool") -> None:
+        """Route writes through the single writer connection of ``pool``.
+
+        Every statement except SELECT, ``begin()`` and Arrow loads take the writer
+        and keep it until the transaction they open ends, so reads inside that
+        transaction see its writes. All other reads stay on the session's reader.
+
+        Args:
+            pool: Single-writer pool the session's reader came from
+        """
+        self._writer_pool = pool
+
+    async def release_writer(self) -> None:
+        """Return a held writer connection to the pool and switch back to the reader.
+
+        Like any pooled aiosqlite connection, an open transaction is rolled back.
+        """
+        writer = self._writer
+        reader = self._reader_connection
+        pool = self._writer_pool
+        if writer is None or reader is None or pool is None:
+            return
+        self.connection = reader
+        self._writer = None
+        self._reader_connection = None
+        await pool.release_writer(writer)
+
+    def _routes_to_writer(self, operation_type: "OperationType") -> bool:
+        return self._writer_pool is not None and self._writer is None and operation_type != "SELECT"
+
+    async def _acquire_writer(self) -> None:
+        pool = cast("AiosqliteConnectionPool", self._writer_pool)
+        writer = await pool.acquire_writer()
+        self._writer = writer
+        self._reader_connection = self.connection
+        self.connection = writer.connection
+
+    async def _release_writer_if_idle(self) -> None:
+        if self._writer is not None and not self.connection.in_transaction:
+            await self.release_writer()
+
+    @asynccontextmanager
+    async def _writer_connection(self) -> "AsyncGenerator[None, None]":
+        """Hold the writer while the block runs, keeping it if a transaction stays open.
+
+        Yields:
+            None once ``self.connection`` is the writer.
+        """
+        await self._acquire_writer()
+        try:
+            yield
+        finally:
+            await self._release_writer_if_idle()
+
+    @asynccontextmanager
+    async def _writer_cursor(self, statement: "SQL") -> "AsyncGenerator[Any, None]":
+        """Open a writer cursor with the statement timeout armed on the writer.
+
+        Yields:
+            Cursor on the writer connection.
+        """
+        async with self._writer_connection():
+            timeout = statement.statement_config.statement_timeout
+            timeout_scope = (
+                nullcontext() if timeout is None else self._create_statement_timeout(self.connection, timeout)
+            )
+            async with timeout_scope, self.with_cursor(self.connection) as cursor:
+                yield cursor
+
     # ─────────────────────────────────────────────────────────────────────────────
     # STORAGE API METHODS
     # ─────────────────────────────────────────────────────────────────────────────
@@ -273,10 +404,15 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
         """Execute a query and stream Arrow results into storage."""
 
         self._require_capability("arrow_export_enabled")
-        arrow_result = await self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        async_pipeline = self._storage_pipeline()
-        telemetry_payload = await self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=async_pipeline
+        telemetry_payload = await self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -293,6 +429,11 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
         """Load Arrow data into SQLite using batched inserts."""
 
         self._require_capability("arrow_import_enabled")
+        if self._routes_to_writer("COPY_FROM"):
+            async with self._writer_connection():
+                return await self.load_from_arrow(
+                    table, source, partitioner=partitioner, overwrite=overwrite, telemetry=telemetry
+                )
         arrow_table = self._coerce_arrow_table(source)
         columns, records = self._arrow_table_to_rows(arrow_table)
         prepared_records = (
@@ -332,10 +473,24 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts from storage into SQLite."""
 
-        arrow_table, inbound = await self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return await self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = await self._read_storage_arrow(
+            source, file_format=file_format, columns=columns, filter=filter
+        )
         return await self.load_from_arrow(
             table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound
         )
@@ -371,6 +526,9 @@ class AiosqliteDriver(AsyncDriverAdapterBase):
         self, sql: str, params: "tuple[Any, ...] | list[Any] | dict[str, Any]", cached: Any
     ) -> "SQLResult":
         """Execute cached queries through the async cursor fast path."""
+        if self._routes_to_writer(cached.operation_type):
+            async with self._writer_connection():
+                return await self._execute_cache_hit(sql, params, cached)
         prepared_params = self.prepare_driver_parameters(params, self.statement_config, prepared_statement=cached)
         normalized_parameters = normalize_execute_parameters(prepared_params)
         direct_statement: SQL | None = None
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 import sqlite3
 import time
 from contextlib import suppress
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from sqlspec.adapters.aiosqlite._typing import AiosqliteConnection
+    from sqlspec.observability import PoolMetrics
 
 __all__ = (
     "AiosqliteConnectTimeoutError",
@@ -53,6 +55,11 @@ def _resolve_row_factory(row_factory: Any) -> Any:
     return row_factory
 
 
+def _is_memory_database(connection_parameters: "dict[str, Any]") -> bool:
+    database = str(connection_parameters.get("database", ":memory:"))
+    return ":memory:" in database or "mode=memory" in database
+
+
 def _has_active_transaction(connection: "AiosqliteConnection") -> bool:
     return bool(getattr(connection, "in_transaction", False))
 
@@ -125,7 +132,7 @@ class AiosqliteConnectTimeoutError(SQLSpecError):
 class AiosqlitePoolConnection:
     """Wrapper for database connections in the pool."""
 
-    __slots__ = ("_closed", "_healthy", "connection", "id", "idle_since")
+    __slots__ = ("_closed", "_healthy", "connection", "created_at", "expires_at", "id", "idle_since")
 
     def __init__(self, connection: "AiosqliteConnection") -> None:
         """Initialize pool connection wrapper.
@@ -135,6 +142,8 @@ class AiosqlitePoolConnection:
         """
         self.id = uuid4().hex
         self.connection = connection
+        self.created_at = time.monotonic()
+        self.expires_at: float | None = None
         self.idle_since: float | None = None
         self._closed = False
         self._healthy = True
@@ -150,6 +159,17 @@ class AiosqlitePoolConnection:
             return 0.0
         return time.time() - self.idle_since
 
+    def is_expired(self, now: float) -> bool:
+        """Check if connection has outlived its maximum lifetime.
+
+        Args:
+            now: Current ``time.monotonic()`` value
+
+        Returns:
+            True if the connection should be replaced
+        """
+        return self.expires_at is not None and now >= self.expires_at
+
     @property
     def is_closed(self) -> bool:
         """Check if connection is closed.
@@ -265,15 +285,25 @@ class AiosqliteConnectionPool:
         "_enable_optimizations",
         "_health_check_interval",
         "_idle_timeout",
+        "_lifetime_task",
         "_lock_instance",
+        "_max_lifetime",
+        "_max_lifetime_jitter",
+        "_metrics",
         "_min_size",
         "_on_connection_create",
         "_operation_timeout",
         "_pool_id",
         "_pool_size",
         "_queue_instance",
+        "_replacement_tasks",
+        "_replacing",
         "_runtime_setup",
+        "_single_writer",
+        "_waiting",
         "_warmed",
+        "_writer",
+        "_writer_lock_instance",
     )
 
     def __init__(
@@ -285,10 +315,14 @@ class AiosqliteConnectionPool:
         idle_timeout: float = 24 * 60 * 60,
         operation_timeout: float = 10.0,
         health_check_interval: float = 30.0,
+        max_lifetime: "float | None" = None,
+        max_lifetime_jitter: float = 0.1,
+        single_writer: bool = False,
         enable_optimizations: bool = SQLITE_DEFAULT_ENABLE_OPTIMIZATIONS,
         enable_foreign_keys: bool = SQLITE_DEFAULT_ENABLE_FOREIGN_KEYS,
         on_connection_create: "Callable[[AiosqliteConnection], Awaitable[None]] | None" = None,
         runtime_setup: "dict[str, Any] | None" = None,
+        metrics: "PoolMetrics | None" = None,
     ) -> None:
         """Initialize connection pool.
 
@@ -300,11 +334,26 @@ class AiosqliteConnectionPool:
             idle_timeout: Maximum time a connection can remain idle
             operation_timeout: Maximum time for connection operations
             health_check_interval: Seconds of idle time before running health check
+            max_lifetime: Seconds after which a connection is replaced, or None to keep it
+            max_lifetime_jitter: Fraction (0 <= jitter < 1) by which each connection's
+                lifetime is randomly shortened, so connections opened together expire apart
+            single_writer: Force WAL, make the pooled connections read-only and send writes
+                through one extra writer connection taken with ``acquire_writer``
             enable_optimizations: Whether to apply performance PRAGMAs
             enable_foreign_keys: Whether to enable foreign-key enforcement
             on_connection_create: Async callback executed when connection is created
             runtime_setup: Runtime feature setup to apply to new connections
+            metrics: Pool metrics that record connection creation latency and age
         """
+        if max_lifetime is not None and max_lifetime <= 0:
+            msg = "max_lifetime must be positive"
+            raise ValueError(msg)
+        if not 0 <= max_lifetime_jitter < 1:
+            msg = "max_lifetime_jitter must be in [0, 1)"
+            raise ValueError(msg)
+        if single_writer and _is_memory_database(connection_parameters):
+            msg = "single_writer pools need a database file; in-memory databases cannot use WAL"
+            raise ValueError(msg)
         self._connection_parameters = connection_parameters
         self._pool_size = pool_size
         self._min_size = min(min_size, pool_size)
@@ -312,24 +361,38 @@ class AiosqliteConnectionPool:
         self._idle_timeout = idle_timeout
         self._operation_timeout = operation_timeout
         self._health_check_interval = health_check_interval
+        self._max_lifetime = max_lifetime
+        self._max_lifetime_jitter = max_lifetime_jitter
+        self._single_writer = single_writer
         self._enable_optimizations = enable_optimizations
         self._enable_foreign_keys = enable_foreign_keys
         self._on_connection_create = on_connection_create
         self._runtime_setup = runtime_setup
+        self._metrics = metrics
 
         self._connection_registry: dict[str, AiosqlitePoolConnection] = {}
+        self._waiting = 0
         self._warmed = False
+        self._replacing = 0
+        self._lifetime_task: asyncio.Task[None] | None = None
+        self._replacement_tasks: set[asyncio.Task[int]] = set()
+        self._writer: AiosqlitePoolConnection | None = None
         self._pool_id = uuid4().hex[:8]  # Short ID for logging
 
         self._queue_instance: asyncio.Queue[AiosqlitePoolConnection] | None = None
         self._lock_instance: asyncio.Lock | None = None
         self._closed_event_instance: asyncio.Event | None = None
+        self._writer_lock_instance: asyncio.Lock | None = None
 
     @property
     def _queue(self) -> "asyncio.Queue[AiosqlitePoolConnection]":
-        """Lazy initialization of asyncio.Queue for Python 3.9 compatibility."""
+        """Lazy initialization of asyncio.Queue for Python 3.9 compatibility.
+
+        The queue is unbounded because ``resize`` can grow the pool; the
+        connection registry enforces the pool size.
+        """
         if self._queue_instance is None:
-            self._queue_instance = asyncio.Queue(maxsize=self._pool_size)
+            self._queue_instance = asyncio.Queue()
         return self._queue_instance
 
     @property
@@ -339,6 +402,18 @@ class AiosqliteConnectionPool:
             self._lock_instance = asyncio.Lock()
         return self._lock_instance
 
+    @property
+    def _writer_lock(self) -> asyncio.Lock:
+        """Lazy initialization of the FIFO lock that queues callers for the writer."""
+        if self._writer_lock_instance is None:
+            self._writer_lock_instance = asyncio.Lock()
+        return self._writer_lock_instance
+
+    @property
+    def single_writer(self) -> bool:
+        """Return True when writes go through a dedicated writer connection."""
+        return self._single_writer
+
     @property
     def _closed_event(self) -> asyncio.Event:
         """Lazy initialization of asyncio.Event for Python 3.9 compatibility."""
@@ -455,12 +530,25 @@ class AiosqliteConnectionPool:
             return len(self._connection_registry)
         return len(self._connection_registry) - self._queue.qsize()
 
-    async def _create_connection(self) -> AiosqlitePoolConnection:
+    @property
+    def max_size(self) -> int:
+        """Get the maximum number of connections.
+
+        Returns:
+            Pool capacity
+        """
+        return self._pool_size
+
+    async def _create_connection(self, *, writer: bool = False) -> AiosqlitePoolConnection:
         """Create a new connection.
 
+        Args:
+            writer: Create the single-writer connection, which is kept out of the registry
+
         Returns:
             New pool connection instance
         """
+        started = time.perf_counter()
         connect_proxy = aiosqlite.connect(**self._connection_parameters)
         self._set_connect_proxy_daemon(connect_proxy)
         connection = await connect_proxy
@@ -513,6 +601,9 @@ class AiosqliteConnectionPool:
                     await connection.execute("PRAGMA foreign_keys = ON")
                 await connection.commit()
 
+            if self._single_writer:
+                await self._enforce_wal(connection, read_only=not writer)
+
             if self._runtime_setup is not None:
                 await _apply_runtime_setup(connection, self._runtime_setup)
 
@@ -521,16 +612,33 @@ class AiosqliteConnectionPool:
 
             pool_connection = AiosqlitePoolConnection(connection)
             pool_connection.mark_as_idle()
+            if self._max_lifetime is not None:
+                lifetime = self._max_lifetime * (1.0 - self._max_lifetime_jitter * random.random())  # noqa: S311
+                pool_connection.expires_at = pool_connection.created_at + lifetime
 
-            async with self._lock:
-                self._connection_registry[pool_connection.id] = pool_connection
+            if not writer:
+                async with self._lock:
+                    self._connection_registry[pool_connection.id] = pool_connection
         except BaseException:
             with suppress(BaseException):
                 await connection.close()
             raise
 
+        if self._metrics is not None:
+            self._metrics.observe_connection_created(time.perf_counter() - started)
         return pool_connection
 
+    async def _enforce_wal(self, connection: "AiosqliteConnection", *, read_only: bool) -> None:
+        """Switch a single-writer pool connection to WAL and make readers read-only."""
+        cursor = await connection.execute("PRAGMA journal_mode = WAL")
+        row = await cursor.fetchone()
+        await cursor.close()
+        if row is None or str(row[0]).lower() != "wal":
+            msg = f"SQLite database {self._database_name} could not switch to WAL journal mode"
+            raise SQLSpecError(msg)
+        if read_only:
+            await connection.execute("PRAGMA query_only = ON")
+
     async def _claim_if_healthy(self, connection: AiosqlitePoolConnection) -> bool:
         """Check if connection is healthy and claim it.
 
@@ -585,6 +693,7 @@ class AiosqliteConnectionPool:
         async with self._lock:
             self._connection_registry.pop(connection.id, None)
 
+        self._record_connection_closed(connection)
         try:
             await asyncio.wait_for(connection.close(), timeout=self._operation_timeout)
         except asyncio.TimeoutError:
@@ -599,6 +708,11 @@ class AiosqliteConnectionPool:
             )
             await self._force_stop_connection(connection, reason="retire_close_timeout")
 
+    def _record_connection_closed(self, connection: AiosqlitePoolConnection) -> None:
+        """Record the lifetime of a connection leaving the pool."""
+        if self._metrics is not None and not connection.is_closed:
+            self._metrics.observe_connection_closed(time.monotonic() - connection.created_at)
+
     async def _try_provision_new_connection(self) -> "AiosqlitePoolConnection | None":
         """Try to create a new connection if under capacity.
 
@@ -638,6 +752,13 @@ class AiosqliteConnectionPool:
         Raises:
             AiosqlitePoolClosedError: If pool is closed while waiting
         """
+        self._waiting += 1
+        try:
+            return await self._wait_for_queued_connection()
+        finally:
+            self._waiting -= 1
+
+    async def _wait_for_queued_connection(self) -> AiosqlitePoolConnection:
         while True:
             get_connection_task = asyncio.create_task(self._queue.get())
             pool_closed_task = asyncio.create_task(self._closed_event.wait())
@@ -661,6 +782,54 @@ class AiosqliteConnectionPool:
                     with suppress(asyncio.CancelledError):
                         await task
 
+    async def resize(self, pool_size: int) -> None:
+        """Change the maximum number of connections.
+
+        Growing opens connections for callers already waiting. Shrinking closes
+        idle connections above the new size right away; checked-out connections
+        above it are closed when they are released.
+
+        Args:
+            pool_size: New maximum number of connections
+        """
+        if pool_size < 1:
+            msg = "pool_size must be at least 1"
+            raise ValueError(msg)
+        previous_size = self._pool_size
+        self._pool_size = pool_size
+        self._min_size = min(self._min_size, pool_size)
+        if self.is_closed or pool_size == previous_size:
+            return
+        log_with_context(
+            logger,
+            logging.DEBUG,
+            "pool.resize",
+            adapter=_ADAPTER_NAME,
+            pool_id=self._pool_id,
+            previous_size=previous_size,
+            pool_size=pool_size,
+            waiting=self._waiting,
+        )
+        if pool_size > previous_size:
+            connections_needed = min(self._waiting, pool_size - len(self._connection_registry))
+            for _ in range(connections_needed):
+                try:
+                    connection = await self._create_connection()
+                except Exception as e:
+                    log_with_context(
+                        logger,
+                        logging.WARNING,
+                        "pool.resize.connection.error",
+                        adapter=_ADAPTER_NAME,
+                        pool_id=self._pool_id,
+                        error=str(e),
+                    )
+                    return
+                self._queue.put_nowait(connection)
+            return
+        while len(self._connection_registry) > pool_size and not self._queue.empty():
+            await self._retire_connection(self._queue.get_nowait(), reason="pool_resized")
+
     async def _warm_pool(self) -> None:
         """Pre-create minimum connections for pool warming.
 
@@ -671,10 +840,24 @@ class AiosqliteConnectionPool:
             return
 
         self._warmed = True
-        connections_needed = self._min_size - len(self._connection_registry)
+        await self.warm(self._min_size)
+
+    async def warm(self, count: int) -> int:
+        """Open connections concurrently until ``count`` exist in the pool.
 
+        Args:
+            count: Number of connections the pool should hold, capped at the pool size
+
+        Returns:
+            Number of connections opened
+        """
+        if self.is_closed:
+            return 0
+        if self._max_lifetime is not None and self._lifetime_task is None:
+            self._start_lifetime_task()
+        connections_needed = min(count, self._pool_size) - len(self._connection_registry)
         if connections_needed <= 0:
-            return
+            return 0
 
         log_with_context(
             logger,
@@ -684,23 +867,117 @@ class AiosqliteConnectionPool:
             pool_id=self._pool_id,
             database=self._database_name,
             connections_needed=connections_needed,
-            min_size=self._min_size,
+            target_size=count,
         )
-        tasks = [self._create_connection() for _ in range(connections_needed)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return await self._open_idle_connections(connections_needed, error_event="pool.warmup.connection.error")
 
+    async def _open_idle_connections(self, count: int, *, error_event: str) -> int:
+        """Create ``count`` connections concurrently and queue them as idle.
+
+        Returns:
+            Number of connections opened
+        """
+        results = await asyncio.gather(*(self._create_connection() for _ in range(count)), return_exceptions=True)
+        opened = 0
         for result in results:
             if isinstance(result, AiosqlitePoolConnection):
+                if self.is_closed:
+                    await self._retire_connection(result)
+                    continue
                 self._queue.put_nowait(result)
+                opened += 1
             elif isinstance(result, Exception):
                 log_with_context(
                     logger,
                     logging.WARNING,
-                    "pool.warmup.connection.error",
+                    error_event,
                     adapter=_ADAPTER_NAME,
                     pool_id=self._pool_id,
                     error=str(result),
                 )
+        return opened
+
+    def _start_lifetime_task(self) -> None:
+        self._lifetime_task = asyncio.get_running_loop().create_task(self._lifetime_loop())
+
+    async def _lifetime_loop(self) -> None:
+        """Replace idle connections past their lifetime until the pool closes."""
+        max_lifetime = self._max_lifetime
+        if max_lifetime is None:
+            return
+        interval = min(60.0, max_lifetime / 10)
+        while not self.is_closed:
+            await asyncio.sleep(interval)
+            try:
+                await self.replace_expired_connections()
+            except Exception as e:
+                log_with_context(
+                    logger,
+                    logging.WARNING,
+                    "pool.lifetime.replace.error",
+                    adapter=_ADAPTER_NAME,
+                    pool_id=self._pool_id,
+                    error=str(e),
+                )
+
+    async def replace_expired_connections(self) -> int:
+        """Swap idle connections past their lifetime for fresh ones.
+
+        Replacements are opened before the expired connections are closed, so
+        callers keep finding idle connections during the swap. Expired
+        connections that are checked out are replaced when they are released.
+
+        Returns:
+            Number of connections replaced
+        """
+        if self.is_closed:
+            return 0
+        now = time.monotonic()
+        queue = self._queue
+        idle = [queue.get_nowait() for _ in range(queue.qsize())]
+        expired_count = 0
+        for connection in idle:
+            queue.put_nowait(connection)
+            if connection.is_expired(now):
+                expired_count += 1
+        if not expired_count:
+            return 0
+
+        self._replacing += expired_count
+        try:
+            replaced = await self._open_idle_connections(expired_count, error_event="pool.lifetime.replace.error")
+        finally:
+            self._replacing -= expired_count
+
+        retired = 0
+        idle = [queue.get_nowait() for _ in range(queue.qsize())]
+        for connection in idle:
+            if retired < replaced and connection.is_expired(now):
+                retired += 1
+                await self._retire_connection(connection, reason="max_lifetime")
+            else:
+                queue.put_nowait(connection)
+        log_with_context(
+            logger,
+            logging.DEBUG,
+            "pool.lifetime.replaced",
+            adapter=_ADAPTER_NAME,
+            pool_id=self._pool_id,
+            expired=expired_count,
+            replaced=replaced,
+        )
+        return replaced
+
+    def _replace_in_background(self, count: int) -> None:
+        """Open replacement connections without blocking the caller releasing one."""
+        missing = min(count, self._pool_size - len(self._connection_registry))
+        if missing <= 0 or self.is_closed:
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._open_idle_connections(missing, error_event="pool.lifetime.replace.error")
+        )
+        self._replacement_tasks.add(task)
+        task.add_done_callback(self._replacement_tasks.discard)
 
     async def _get_connection(self) -> AiosqlitePoolConnection:
         """Run the three-phase connection acquisition cycle.
@@ -719,6 +996,9 @@ class AiosqliteConnectionPool:
         if not self._warmed and self._min_size > 0:
             await self._warm_pool()
 
+        if self._max_lifetime is not None and self._lifetime_task is None:
+            self._start_lifetime_task()
+
         # Fast path: try to get from queue without health check overhead for fresh connections
         while not self._queue.empty():
             connection = self._queue.get_nowait()
@@ -782,6 +1062,15 @@ class AiosqliteConnectionPool:
             )
             return
 
+        if len(self._connection_registry) - self._replacing > self._pool_size:
+            await self._retire_connection(connection, reason="pool_resized")
+            return
+
+        if connection.is_expired(time.monotonic()):
+            await self._retire_connection(connection, reason="max_lifetime")
+            self._replace_in_background(1)
+            return
+
         try:
             # Fast path: skip timeout wrapper for reset, just do the rollback directly
             # The rollback itself is fast for SQLite; timeout is overkill for hot path
@@ -803,6 +1092,79 @@ class AiosqliteConnectionPool:
             connection.mark_unhealthy()
             await self._retire_connection(connection)
 
+    async def acquire_writer(self) -> AiosqlitePoolConnection:
+        """Wait in line for the writer connection of a single-writer pool.
+
+        Callers are served in FIFO order. The writer is opened on first use and
+        reopened after it fails.
+
+        Returns:
+            The writer, held exclusively until ``release_writer``
+
+        Raises:
+            AiosqlitePoolClosedError: If the pool is closed
+            AiosqliteConnectTimeoutError: If the writer is not released within ``connect_timeout``
+            SQLSpecError: If the pool is not in single-writer mode
+        """
+        if not self._single_writer:
+            msg = "acquire_writer() requires a pool created with single_writer=True"
+            raise SQLSpecError(msg)
+        if self.is_closed:
+            msg = "Cannot acquire the writer from a closed pool"
+            raise AiosqlitePoolClosedError(msg)
+        try:
+            await asyncio.wait_for(self._writer_lock.acquire(), timeout=self._connect_timeout)
+        except asyncio.TimeoutError as e:
+            msg = f"Writer acquisition timed out after {self._connect_timeout}s"
+            raise AiosqliteConnectTimeoutError(msg) from e
+
+        try:
+            writer = self._writer
+            if writer is None or writer.is_closed or not writer.is_healthy:
+                self._writer = None
+                if writer is not None:
+                    await self._retire_writer(writer)
+                writer = await self._create_connection(writer=True)
+                self._writer = writer
+        except BaseException:
+            self._writer_lock.release()
+            raise
+        writer.mark_as_in_use()
+        return writer
+
+    async def release_writer(self, connection: AiosqlitePoolConnection) -> None:
+        """Roll back any open transaction on the writer and hand it to the next caller in line.
+
+        Args:
+            connection: Writer obtained from ``acquire_writer``
+        """
+        try:
+            if _has_active_transaction(connection.connection):
+                try:
+                    await connection.connection.rollback()
+                except Exception:
+                    connection.mark_unhealthy()
+            connection.mark_as_idle()
+            if self.is_closed and self._writer is connection:
+                self._writer = None
+                await self._retire_writer(connection)
+        finally:
+            self._writer_lock.release()
+
+    async def _retire_writer(self, connection: AiosqlitePoolConnection) -> None:
+        self._record_connection_closed(connection)
+        try:
+            await asyncio.wait_for(connection.close(), timeout=self._operation_timeout)
+        except Exception:
+            log_with_context(
+                logger,
+                logging.WARNING,
+                "pool.writer.close.error",
+                adapter=_ADAPTER_NAME,
+                pool_id=self._pool_id,
+                connection_id=connection.id,
+            )
+
     def get_connection(self) -> "AiosqlitePoolConnectionContext":
         """Get a connection with automatic release."""
         return AiosqlitePoolConnectionContext(self)
@@ -813,13 +1175,28 @@ class AiosqliteConnectionPool:
             return
         self._closed_event.set()
 
+        background_tasks: list[asyncio.Task[Any]] = list(self._replacement_tasks)
+        if self._lifetime_task is not None:
+            background_tasks.append(self._lifetime_task)
+            self._lifetime_task = None
+        for task in background_tasks:
+            task.cancel()
+        if background_tasks:
+            await asyncio.gather(*background_tasks, return_exceptions=True)
+
         while not self._queue.empty():
             self._queue.get_nowait()
 
         async with self._lock:
             connections = list(self._connection_registry.values())
             self._connection_registry.clear()
+        writer = self._writer
+        if writer is not None and not self._writer_lock.locked():
+            self._writer = None
+            connections.append(writer)
 
+        for connection in connections:
+            self._record_connection_closed(connection)
         if connections:
             close_tasks = [asyncio.wait_for(conn.close(), timeout=self._operation_timeout) for conn in connections]
             results = await asyncio.gather(*close_tasks, return_exceptions=True)
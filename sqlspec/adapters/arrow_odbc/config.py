@@ -209,7 +209,7 @@ class ArrowOdbcConfig(NoPoolSyncConfig[ArrowOdbcConnection, ArrowOdbcDriver]):
         """Provide a driver session context manager."""
         handler = _ArrowOdbcSessionConnectionHandler(self)
         return ArrowOdbcSessionContext(
-            acquire_connection=handler.acquire_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
             release_connection=handler.release_connection,
             statement_config=statement_config or self.statement_config,
             driver_features=self.driver_features,
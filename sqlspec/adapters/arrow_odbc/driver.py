@@ -267,6 +267,7 @@ class ArrowOdbcDriver(SyncDriverAdapterBase):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         return_format: "ArrowReturnFormat" = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -274,6 +275,21 @@ class ArrowOdbcDriver(SyncDriverAdapterBase):
         **kwargs: Any,
     ) -> "ArrowResult":
         """Execute a query and return native Arrow results."""
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
+            return self._call_with_statement_timeout(
+                timeout,
+                lambda: self.select_to_arrow(
+                    statement,
+                    *parameters,
+                    statement_config=statement_config,
+                    return_format=return_format,
+                    native_only=native_only,
+                    batch_size=batch_size,
+                    arrow_schema=arrow_schema,
+                    **kwargs,
+                ),
+            )
         ensure_pyarrow()
         config = statement_config or self.statement_config
         prepared_statement = self.prepare_statement(statement, parameters, statement_config=config, kwargs=kwargs)
@@ -359,9 +375,21 @@ class ArrowOdbcDriver(SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts from storage into a table via arrow-odbc bulk insert."""
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     def _connection_in_transaction(self) -> bool:
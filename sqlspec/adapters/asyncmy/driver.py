@@ -25,27 +25,35 @@ from sqlspec.adapters.asyncmy.core import (
     normalize_execute_many_parameters,
     normalize_execute_parameters,
     normalize_lastrowid,
+    resolve_column_types,
     resolve_many_rowcount,
     resolve_row_plan,
     resolve_rowcount,
 )
 from sqlspec.adapters.asyncmy.data_dictionary import AsyncmyDataDictionary
 from sqlspec.core import ArrowResult, get_cache_config, register_driver_profile
-from sqlspec.driver import AsyncDriverAdapterBase, AsyncRowStream, BaseAsyncExceptionHandler
+from sqlspec.driver import AsyncDriverAdapterBase, AsyncRowStream, AsyncStatementTimeout, BaseAsyncExceptionHandler
+from sqlspec.driver._timeout import add_max_execution_time_hint
 from sqlspec.exceptions import SQLSpecError
 from sqlspec.utils.logging import get_logger
 from sqlspec.utils.serializers import from_json
 from sqlspec.utils.type_guards import supports_json_type
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
     from sqlspec.adapters.asyncmy._typing import AsyncmyConnection
     from sqlspec.core import SQL, StatementConfig
     from sqlspec.driver import ExecutionResult
     from sqlspec.storage import StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
 
-__all__ = ("AsyncmyCursor", "AsyncmyDriver", "AsyncmyExceptionHandler", "AsyncmySessionContext")
+__all__ = (
+    "AsyncmyCursor",
+    "AsyncmyDriver",
+    "AsyncmyExceptionHandler",
+    "AsyncmySessionContext",
+    "AsyncmyStatementTimeout",
+)
 
 logger = get_logger(__name__)
 
@@ -54,40 +62,6 @@ json_type_value = (
 )
 ASYNCMY_JSON_TYPE_CODES: Final[set[int]] = {json_type_value} if json_type_value is not None else set()
 
-_MYSQL_TYPE_CODE_TOKENS: Final[dict[int, str]] = {
-    0: "decimal",
-    1: "int32",
-    2: "int32",
-    3: "int64",
-    4: "float32",
-    5: "float64",
-    7: "timestamp",
-    8: "int64",
-    10: "date",
-    11: "time",
-    12: "timestamp",
-    246: "decimal",
-    252: "binary",
-    253: "string",
-    254: "string",
-}
-
-
-def _resolve_column_types(description: Any) -> "dict[str, str] | None":
-    """Map MySQL cursor column FIELD_TYPE codes to neutral Arrow type tokens.
-
-    Returns ``None`` when the cursor has no description or reports no
-    recognizable type codes.
-    """
-    if not description:
-        return None
-    column_types: dict[str, str] = {}
-    for col in description:
-        token = _MYSQL_TYPE_CODE_TOKENS.get(col[1])
-        if token is not None:
-            column_types[col[0]] = token
-    return column_types or None
-
 
 class AsyncmyExceptionHandler(BaseAsyncExceptionHandler):
     """Async context manager for handling asyncmy (MySQL) database exceptions.
@@ -114,6 +88,20 @@ class AsyncmyExceptionHandler(BaseAsyncExceptionHandler):
         return False
 
 
+class AsyncmyStatementTimeout(AsyncStatementTimeout):
+    """Statement timeout enforced by the server through a ``MAX_EXECUTION_TIME`` optimizer hint.
+
+    The driver adds the hint to ``SELECT`` statements, the only kind MySQL
+    limits, so the session is never modified. The task is not cancelled
+    client-side so the connection protocol stays in sync.
+    """
+
+    __slots__ = ()
+
+    async def run(self, awaitable: "Awaitable[Any]") -> Any:
+        return await awaitable
+
+
 class AsyncmyDriver(AsyncDriverAdapterBase):
     """MySQL/MariaDB database driver using AsyncMy client library.
 
@@ -157,6 +145,7 @@ class AsyncmyDriver(AsyncDriverAdapterBase):
             ExecutionResult: Statement execution results with data or row counts
         """
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        sql = add_max_execution_time_hint(sql, statement.statement_config.statement_timeout)
         await cursor.execute(sql, normalize_execute_parameters(prepared_parameters))
 
         if statement.returns_rows():
@@ -165,7 +154,7 @@ class AsyncmyDriver(AsyncDriverAdapterBase):
             row_plan = resolve_row_plan(description, ASYNCMY_JSON_TYPE_CODES)
             deserializer = cast("Callable[[Any], Any]", self.driver_features.get("json_deserializer", from_json))
             rows, column_names, row_format = collect_rows(fetched_data, row_plan, deserializer, logger=logger)
-            column_types = _resolve_column_types(description)
+            column_types = resolve_column_types(description)
 
             return self.create_execution_result(
                 cursor,
@@ -290,6 +279,7 @@ class AsyncmyDriver(AsyncDriverAdapterBase):
         if not statement.returns_rows():
             return None
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        sql = add_max_execution_time_hint(sql, statement.statement_config.statement_timeout)
         return AsyncRowStream(AsyncmyStreamSource(self, sql, prepared_parameters, chunk_size, ASYNCMY_JSON_TYPE_CODES))
 
     def handle_database_exceptions(self) -> "AsyncmyExceptionHandler":
@@ -300,6 +290,9 @@ class AsyncmyDriver(AsyncDriverAdapterBase):
         """
         return AsyncmyExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "AsyncmyStatementTimeout":
+        return AsyncmyStatementTimeout(connection, timeout)
+
     # ─────────────────────────────────────────────────────────────────────────────
     # STORAGE API METHODS
     # ─────────────────────────────────────────────────────────────────────────────
@@ -319,10 +312,15 @@ class AsyncmyDriver(AsyncDriverAdapterBase):
         """Execute a query and stream Arrow-formatted results into storage."""
 
         self._require_capability("arrow_export_enabled")
-        arrow_result = await self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        async_pipeline = self._storage_pipeline()
-        telemetry_payload = await self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=async_pipeline
+        telemetry_payload = await self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -376,10 +374,24 @@ class AsyncmyDriver(AsyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts from storage into MySQL."""
 
-        arrow_table, inbound = await self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return await self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = await self._read_storage_arrow(
+            source, file_format=file_format, columns=columns, filter=filter
+        )
         return await self.load_from_arrow(
             table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound
         )
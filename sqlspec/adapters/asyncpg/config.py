@@ -28,6 +28,7 @@ from sqlspec.adapters.asyncpg.core import (
 )
 from sqlspec.adapters.asyncpg.driver import AsyncpgDriver, AsyncpgExceptionHandler
 from sqlspec.config import AsyncDatabaseConfig, ExtensionConfigs
+from sqlspec.core.pool_sizing import AsyncCapacityGate
 from sqlspec.driver._async import AsyncPoolConnectionContext, AsyncPoolSessionFactory
 from sqlspec.exceptions import ImproperConfigurationError, MissingDependencyError
 from sqlspec.extensions.events import EventRuntimeHints
@@ -41,7 +42,7 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from sqlspec.core import StatementConfig
-    from sqlspec.observability import ObservabilityConfig
+    from sqlspec.observability import ObservabilityConfig, PoolGauges
 
 
 __all__ = (
@@ -168,6 +169,14 @@ class AsyncpgDriverFeatures(TypedDict):
      - "notify_queue": Durable queue plus a PostgreSQL notification wakeup hint
      - "poll_queue": Durable queue discovered by polling
      Defaults to "notify".
+    enable_copy_arrow_export: Export SELECT results for select_to_arrow/select_to_storage
+     through ``COPY ... TO STDOUT (FORMAT BINARY)`` decoded straight into Arrow batches.
+     Defaults to True. Results with numeric, json, array or other unsupported column types
+     use the row path.
+    enable_copy_arrow_import: Load Arrow data in load_from_arrow/load_from_storage through
+     ``COPY ... FROM STDIN (FORMAT BINARY)`` encoded straight from the Arrow buffers.
+     Defaults to True. Target columns with numeric, json, array or other unsupported types,
+     and Arrow types that do not match the target column, use the row path.
     """
 
     json_serializer: NotRequired["Callable[[Any], str]"]
@@ -185,6 +194,8 @@ class AsyncpgDriverFeatures(TypedDict):
     alloydb_ip_type: NotRequired[str]
     enable_events: NotRequired[bool]
     events_backend: NotRequired[Literal["notify", "notify_queue", "poll_queue"]]
+    enable_copy_arrow_export: NotRequired[bool]
+    enable_copy_arrow_import: NotRequired[bool]
     connection_instance: NotRequired["AsyncpgPool"]
     on_connection_create: NotRequired["Callable[[AsyncpgConnection], Awaitable[None]]"]
 
@@ -250,12 +261,56 @@ class _AsyncpgAlloydbConnector:
 class _AsyncpgSessionFactory(AsyncPoolSessionFactory):
     __slots__ = ()
 
+    async def acquire_connection(self) -> "AsyncpgConnection":
+        gate = self._config._pool_gate
+        if gate is None:
+            return cast("AsyncpgConnection", await super().acquire_connection())
+        await gate.acquire()
+        try:
+            return cast("AsyncpgConnection", await super().acquire_connection())
+        except BaseException:
+            gate.release()
+            raise
+
+    async def release_connection(self, _conn: "AsyncpgConnection", **kwargs: Any) -> None:
+        if self._connection is None:
+            return
+        try:
+            await super().release_connection(_conn, **kwargs)
+        finally:
+            gate = self._config._pool_gate
+            if gate is not None:
+                gate.release()
+
 
 class AsyncpgConnectionContext(AsyncPoolConnectionContext):
     """Async context manager for AsyncPG connections."""
 
     __slots__ = ()
 
+    async def __aenter__(self) -> "AsyncpgConnection":
+        gate = self._config._pool_gate
+        if gate is None:
+            return cast("AsyncpgConnection", await super().__aenter__())
+        await gate.acquire()
+        try:
+            return cast("AsyncpgConnection", await super().__aenter__())
+        except BaseException:
+            gate.release()
+            raise
+
+    async def __aexit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: Any
+    ) -> "bool | None":
+        if self._connection is None:
+            return None
+        try:
+            return await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            gate = self._config._pool_gate
+            if gate is not None:
+                gate.release()
+
 
 @mypyc_attr(native_class=False)
 class AsyncpgConfig(AsyncDatabaseConfig[AsyncpgConnection, "Pool[Record]", AsyncpgDriver]):
@@ -270,6 +325,7 @@ class AsyncpgConfig(AsyncDatabaseConfig[AsyncpgConnection, "Pool[Record]", Async
     supports_native_parquet_export: "ClassVar[bool]" = True
     supports_native_parquet_import: "ClassVar[bool]" = True
     supports_native_row_streaming: "ClassVar[bool]" = True
+    supports_pool_resizing: "ClassVar[bool]" = True
     _connection_context_class: "ClassVar[type[AsyncpgConnectionContext]]" = AsyncpgConnectionContext
     _session_factory_class: "ClassVar[type[_AsyncpgSessionFactory]]" = _AsyncpgSessionFactory
     _session_context_class: "ClassVar[type[AsyncpgSessionContext]]" = AsyncpgSessionContext
@@ -324,6 +380,9 @@ class AsyncpgConfig(AsyncDatabaseConfig[AsyncpgConnection, "Pool[Record]", Async
 
         self._cloud_sql_connector: Any | None = None
         self._alloydb_connector: Any | None = None
+        self._pool_gate: AsyncCapacityGate | None = (
+            AsyncCapacityGate(self._pool_autoscaler.size) if self._pool_autoscaler is not None else None
+        )
         self._pgvector_available: bool | None = None
         self._paradedb_available: bool | None = None
 
@@ -433,6 +492,12 @@ class AsyncpgConfig(AsyncDatabaseConfig[AsyncpgConnection, "Pool[Record]", Async
 
         config.setdefault("init", self._init_connection)
 
+        if self.pool_sizing is not None:
+            # asyncpg pools cannot be resized, so the pool is opened at the policy maximum and
+            # the capacity gate admits only the autoscaled number of concurrent holders.
+            config["max_size"] = self.pool_sizing.max_size
+            config["min_size"] = min(config.get("min_size", 10), self.pool_sizing.initial_size)
+
         return await asyncpg_create_pool(**config)
 
     async def _init_connection(self, connection: "AsyncpgConnection") -> None:
@@ -471,6 +536,15 @@ class AsyncpgConfig(AsyncDatabaseConfig[AsyncpgConnection, "Pool[Record]", Async
         if self._user_connection_hook is not None:
             await self._user_connection_hook(connection)
 
+    def _resize_pool(self, size: int) -> None:
+        """Resize the capacity gate for adaptive pool sizing.
+
+        Args:
+            size: New number of connections that may be checked out at once.
+        """
+        if self._pool_gate is not None:
+            self._pool_gate.resize(size)
+
     async def _close_pool(self) -> None:
         """Close the actual async connection pool and cleanup connectors."""
         if self.connection_instance:
@@ -512,8 +586,8 @@ class AsyncpgConfig(AsyncDatabaseConfig[AsyncpgConnection, "Pool[Record]", Async
         """
         factory = _AsyncpgSessionFactory(self)
         return AsyncpgSessionContext(
-            acquire_connection=factory.acquire_connection,
-            release_connection=factory.release_connection,
+            acquire_connection=self._guard_acquire(factory.acquire_connection),
+            release_connection=self._guard_release(factory.release_connection),
             statement_config=statement_config
             or (lambda: resolve_runtime_statement_config(None, self.statement_config, default_statement_config)),
             driver_features=self.driver_features,
@@ -530,6 +604,19 @@ class AsyncpgConfig(AsyncDatabaseConfig[AsyncpgConnection, "Pool[Record]", Async
             self.connection_instance = await self.create_pool()
         return self.connection_instance
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        size = pool.get_size()
+        idle = pool.get_idle_size()
+        return {"size": size, "checked_out": size - idle, "idle": idle, "max_size": pool.get_max_size()}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         """Get the signature namespace for AsyncPG types.
 
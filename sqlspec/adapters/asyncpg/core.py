@@ -1,9 +1,11 @@
 """AsyncPG adapter compiled helpers."""
 
+import asyncio
 import contextlib
 import datetime
 import re
-from collections.abc import Sized
+import time
+from collections.abc import Sequence, Sized
 from typing import TYPE_CHECKING, Any, Final, NamedTuple
 
 import asyncpg
@@ -45,6 +47,7 @@ if TYPE_CHECKING:
     from sqlspec.core import SQL, ParameterStyleConfig, StackOperation
 
 __all__ = (
+    "AsyncpgCopySource",
     "AsyncpgStreamSource",
     "NormalizedStackOperation",
     "apply_driver_features",
@@ -61,6 +64,7 @@ __all__ = (
     "parse_status",
     "register_json_codecs",
     "register_pgvector_support",
+    "resolve_column_types",
     "resolve_many_rowcount",
     "resolve_postgres_extension_state",
     "resolve_runtime_statement_config",
@@ -387,18 +391,73 @@ def collect_rows(records: "list[Any] | None") -> "tuple[list[Any], list[str]]":
     return records, column_names
 
 
+_ASYNCPG_TYPE_TOKENS: "dict[str, str]" = {
+    "bool": "bool",
+    "bpchar": "string",
+    "bytea": "binary",
+    "date": "date",
+    "float4": "float32",
+    "float8": "float64",
+    "int2": "int16",
+    "int4": "int32",
+    "int8": "int64",
+    "interval": "duration",
+    "json": "string",
+    "jsonb": "string",
+    "numeric": "decimal",
+    "text": "string",
+    "time": "time",
+    "timestamp": "timestamp",
+    "timestamptz": "timestamptz",
+    "uuid": "string",
+    "varchar": "string",
+}
+
+
+def resolve_column_types(attributes: "Sequence[Any]") -> "dict[str, str] | None":
+    """Map asyncpg prepared-statement attribute types to neutral Arrow type tokens.
+
+    Returns ``None`` when no attribute has a recognizable type.
+    """
+    column_types: dict[str, str] = {}
+    for attribute in attributes:
+        token = _ASYNCPG_TYPE_TOKENS.get(attribute.type.name)
+        if token is not None:
+            column_types[attribute.name] = token
+    return column_types or None
+
+
 class AsyncpgStreamSource:
-    """Compiled async chunk source streaming dict rows from an asyncpg cursor in a stream-owned transaction."""
+    """Compiled async chunk source streaming dict rows from an asyncpg cursor in a stream-owned transaction.
+
+    With a ``timeout`` every round trip gets the time left before the deadline
+    as asyncpg's native ``timeout=``.
+    """
 
-    __slots__ = ("_chunk_size", "_cursor", "_driver", "_parameters", "_sql", "_transaction")
+    __slots__ = (
+        "_attributes",
+        "_chunk_size",
+        "_cursor",
+        "_deadline",
+        "_driver",
+        "_parameters",
+        "_sql",
+        "_timeout",
+        "_transaction",
+    )
 
-    def __init__(self, driver: Any, sql: str, parameters: "tuple[Any, ...]", chunk_size: int) -> None:
+    def __init__(
+        self, driver: Any, sql: str, parameters: "tuple[Any, ...]", chunk_size: int, timeout: "float | None" = None
+    ) -> None:
         self._driver = driver
         self._sql = sql
         self._parameters = parameters
         self._chunk_size = chunk_size
+        self._timeout = timeout
+        self._deadline = 0.0
         self._cursor: Any = None
         self._transaction: Any = None
+        self._attributes: tuple[Any, ...] = ()
 
     async def start(self) -> None:
         handler = self._driver.handle_database_exceptions()
@@ -406,23 +465,45 @@ class AsyncpgStreamSource:
         self._driver._check_pending_exception(handler)
 
     async def _start(self) -> None:
+        if self._timeout is not None:
+            self._deadline = time.monotonic() + self._timeout
         transaction = self._driver.connection.transaction()
         await transaction.start()
         self._transaction = transaction
         try:
-            self._cursor = await self._driver.connection.cursor(self._sql, *self._parameters)
+            prepared = await self._driver._get_prepared_statement(self._sql, timeout=self._remaining())
+            self._attributes = tuple(prepared.get_attributes())
+            self._cursor = await prepared.cursor(*self._parameters, timeout=self._remaining())
         except BaseException:
             await transaction.rollback()
             self._transaction = None
             raise
 
+    def _remaining(self) -> "float | None":
+        if self._timeout is None:
+            return None
+        return max(0.001, self._deadline - time.monotonic())
+
+    async def _fetch(self) -> Any:
+        return await self._cursor.fetch(self._chunk_size, timeout=self._remaining())
+
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     async def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
-        records = await self._driver._run_with_exception_handler(handler, self._cursor.fetch, self._chunk_size)
+        records = await self._driver._run_with_exception_handler(handler, self._fetch)
         self._driver._check_pending_exception(handler)
         assert records is not None
         return [dict(record) for record in records]
 
+    async def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        handler = self._driver.handle_database_exceptions()
+        records = await self._driver._run_with_exception_handler(handler, self._fetch)
+        self._driver._check_pending_exception(handler)
+        attributes = self._attributes
+        return list(records or ()), [attribute.name for attribute in attributes], resolve_column_types(attributes)
+
     async def close(self, error: bool = False) -> None:
         self._cursor = None
         transaction = self._transaction
@@ -438,6 +519,61 @@ class AsyncpgStreamSource:
                     await transaction.rollback()
 
 
+class AsyncpgCopySource:
+    """Compiled pull source over asyncpg's push-style ``copy_from_query`` output.
+
+    The COPY runs in a task that hands each chunk over through a bounded queue,
+    so the server waits while the consumer catches up. An empty read marks the
+    end of the stream.
+    """
+
+    __slots__ = ("_driver", "_error", "_parameters", "_queue", "_sql", "_task")
+
+    def __init__(self, driver: Any, sql: str, parameters: "tuple[Any, ...]", max_pending: int = 8) -> None:
+        self._driver = driver
+        self._sql = sql
+        self._parameters = parameters
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Future[None] | None = None
+        self._error: Exception | None = None
+
+    async def read(self) -> bytes:
+        handler = self._driver.handle_database_exceptions()
+        data = await self._driver._run_with_exception_handler(handler, self._read)
+        self._driver._check_pending_exception(handler)
+        return data or b""
+
+    async def _read(self) -> bytes:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._copy())
+        data = await self._queue.get()
+        if not data and self._error is not None:
+            raise self._error
+        return data
+
+    async def _copy(self) -> None:
+        try:
+            await self._driver.connection.copy_from_query(
+                self._sql, *self._parameters, output=self._push, format="binary"
+            )
+        except Exception as exc:
+            self._error = exc
+        await self._queue.put(b"")
+
+    async def _push(self, data: bytes) -> None:
+        if data:
+            await self._queue.put(data)
+
+    async def close(self, error: bool = False) -> None:
+        _ = error
+        task = self._task
+        self._task = None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+
 def _convert_datetime_param(value: Any) -> Any:
     """Convert datetime parameter, handling ISO strings."""
 
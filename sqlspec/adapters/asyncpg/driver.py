@@ -1,5 +1,6 @@
 """AsyncPG PostgreSQL driver implementation for async PostgreSQL operations."""
 
+import asyncio
 import re
 from collections import OrderedDict
 from collections.abc import Mapping
@@ -12,6 +13,7 @@ from sqlglot.errors import ParseError
 from sqlspec.adapters.asyncpg._typing import AsyncpgCursor, AsyncpgPostgresError, AsyncpgSessionContext
 from sqlspec.adapters.asyncpg.core import (
     PREPARED_STATEMENT_CACHE_SIZE,
+    AsyncpgCopySource,
     AsyncpgStreamSource,
     NormalizedStackOperation,
     collect_rows,
@@ -36,25 +38,34 @@ from sqlspec.core import (
 from sqlspec.driver import (
     AsyncDriverAdapterBase,
     AsyncRowStream,
+    AsyncStatementTimeout,
     BaseAsyncExceptionHandler,
     StackExecutionObserver,
     describe_stack_statement,
 )
 from sqlspec.exceptions import ImproperConfigurationError, SQLSpecError, StackExecutionError
 from sqlspec.utils.logging import get_logger
+from sqlspec.utils.pgcopy import aiter_copy_batches, aiter_pgcopy_chunks, create_pgcopy_decoder, create_pgcopy_encoder
 from sqlspec.utils.text import normalize_identifier, quote_identifier
 from sqlspec.utils.type_guards import has_sqlstate
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncGenerator, Awaitable, Sequence
 
     from sqlspec.adapters.asyncpg._typing import AsyncpgConnection, AsyncpgPreparedStatement
     from sqlspec.core import ArrowResult, SQLResult, StatementConfig
     from sqlspec.driver import ExecutionResult
     from sqlspec.storage import StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
+    from sqlspec.typing import ArrowRecordBatch, ArrowTable
 
 
-__all__ = ("AsyncpgCursor", "AsyncpgDriver", "AsyncpgExceptionHandler", "AsyncpgSessionContext")
+__all__ = (
+    "AsyncpgCursor",
+    "AsyncpgDriver",
+    "AsyncpgExceptionHandler",
+    "AsyncpgSessionContext",
+    "AsyncpgStatementTimeout",
+)
 
 _COPY_FROM_STDIN_RE: re.Pattern[str] = re.compile(
     r'COPY\s+((?:"[^"]+"|\w+)(?:\.(?:"[^"]+"|\w+))?)(?:\s*\([^)]*\))?\s+FROM\s+STDIN', re.IGNORECASE
@@ -86,6 +97,24 @@ class AsyncpgExceptionHandler(BaseAsyncExceptionHandler):
         return False
 
 
+class AsyncpgStatementTimeout(AsyncStatementTimeout):
+    """Statement timeout enforced through asyncpg's native ``timeout=`` argument.
+
+    The driver passes the timeout to ``fetch``/``execute``/``executemany`` and
+    to the stream cursor; asyncpg cancels the query on the server and raises
+    ``asyncio.TimeoutError``, which becomes ``StatementTimeoutError`` here.
+    """
+
+    __slots__ = ()
+
+    async def run(self, awaitable: "Awaitable[Any]") -> Any:
+        try:
+            return await awaitable
+        except asyncio.TimeoutError:
+            self.timed_out = True
+            raise self.timeout_error() from None
+
+
 class AsyncpgDriver(AsyncDriverAdapterBase):
     """AsyncPG PostgreSQL driver for async database operations.
 
@@ -130,9 +159,10 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
         """
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         params: tuple[Any, ...] = cast("tuple[Any, ...]", prepared_parameters) if prepared_parameters else ()
+        timeout = statement.statement_config.statement_timeout
 
         if statement.returns_rows():
-            records = await cursor.fetch(sql, *params) if params else await cursor.fetch(sql)
+            records = await cursor.fetch(sql, *params, timeout=timeout)
             data, column_names = collect_rows(records)
 
             return self.create_execution_result(
@@ -144,7 +174,7 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
                 row_format="record",
             )
 
-        result = await cursor.execute(sql, *params) if params else await cursor.execute(sql)
+        result = await cursor.execute(sql, *params, timeout=timeout)
 
         affected_rows = parse_status(result)
 
@@ -164,7 +194,7 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
 
         if prepared_parameters:
             parameter_sets = cast("list[Sequence[object]]", prepared_parameters)
-            await cursor.executemany(sql, parameter_sets)
+            await cursor.executemany(sql, parameter_sets, timeout=statement.statement_config.statement_timeout)
             affected_rows = resolve_many_rowcount(parameter_sets)
         else:
             affected_rows = 0
@@ -187,8 +217,9 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
         successful_count = 0
         last_result = None
 
+        timeout = statement.statement_config.statement_timeout
         for stmt in statements:
-            result = await cursor.execute(stmt)
+            result = await cursor.execute(stmt, timeout=timeout)
             last_result = result
             successful_count += 1
 
@@ -278,12 +309,40 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
             return None
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         params: tuple[Any, ...] = cast("tuple[Any, ...]", prepared_parameters) if prepared_parameters else ()
-        return AsyncRowStream(AsyncpgStreamSource(self, sql, params, chunk_size))
+        return AsyncRowStream(
+            AsyncpgStreamSource(self, sql, params, chunk_size, statement.statement_config.statement_timeout)
+        )
+
+    async def dispatch_arrow_export(
+        self, statement: "SQL", batch_size: int
+    ) -> "AsyncGenerator[ArrowRecordBatch, None] | None":
+        """Export a SELECT through binary ``COPY ... TO STDOUT`` decoded into Arrow batches.
+
+        Returns None when ``enable_copy_arrow_export`` is off or a result column
+        has a type the binary COPY decoder does not handle (numeric, json, arrays,
+        ...). Column types come from the driver's prepared statement
+        cache, which the row path reuses when the export is declined.
+        """
+        if not self.driver_features.get("enable_copy_arrow_export", True):
+            return None
+        sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        params: tuple[Any, ...] = cast("tuple[Any, ...]", prepared_parameters) if prepared_parameters else ()
+        exc_handler = self.handle_database_exceptions()
+        prepared = await self._run_with_exception_handler(exc_handler, self._get_prepared_statement, sql)
+        self._check_pending_exception(exc_handler)
+        attributes = prepared.get_attributes() if prepared is not None else ()
+        decoder = create_pgcopy_decoder([(attribute.name, attribute.type.oid) for attribute in attributes], batch_size)
+        if decoder is None:
+            return None
+        return aiter_copy_batches(AsyncpgCopySource(self, sql, params), decoder)
 
     def handle_database_exceptions(self) -> "AsyncpgExceptionHandler":
         """Handle database exceptions with PostgreSQL error codes."""
         return AsyncpgExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "AsyncpgStatementTimeout":
+        return AsyncpgStatementTimeout(connection, timeout)
+
     # ─────────────────────────────────────────────────────────────────────────────
     # STACK EXECUTION METHODS
     # ─────────────────────────────────────────────────────────────────────────────
@@ -317,10 +376,15 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
         """Execute a query and persist results to storage once native COPY is available."""
 
         self._require_capability("arrow_export_enabled")
-        arrow_result = await self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        async_pipeline = self._storage_pipeline()
-        telemetry_payload = await self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=async_pipeline
+        telemetry_payload = await self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -344,11 +408,12 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
             except AsyncpgPostgresError as exc:
                 msg = f"Failed to truncate table '{table}': {exc}"
                 raise SQLSpecError(msg) from exc
-        columns, records = self._arrow_table_to_rows(arrow_table)
-        if records:
-            await self.connection.copy_records_to_table(
-                table_name, records=records, columns=columns, schema_name=schema_name
-            )
+        if not await self._copy_arrow_binary(arrow_table, table_name, schema_name, quoted_target):
+            columns, records = self._arrow_table_to_rows(arrow_table)
+            if records:
+                await self.connection.copy_records_to_table(
+                    table_name, records=records, columns=columns, schema_name=schema_name
+                )
         telemetry_payload = self._ingest_telemetry(arrow_table)
         telemetry_payload["destination"] = table
         self._attach_partition_telemetry(telemetry_payload, partitioner)
@@ -424,10 +489,24 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Read an artifact from storage and ingest it via COPY."""
 
-        arrow_table, inbound = await self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return await self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = await self._read_storage_arrow(
+            source, file_format=file_format, columns=columns, filter=filter
+        )
         return await self.load_from_arrow(
             table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound
         )
@@ -460,6 +539,34 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
         """Resolve rowcount from asyncpg status for the direct execution path."""
         return parse_status(cursor)
 
+    async def _copy_arrow_binary(
+        self, arrow_table: "ArrowTable", table_name: str, schema_name: "str | None", quoted_target: str
+    ) -> bool:
+        """Stream Arrow data into binary COPY without building Python rows.
+
+        Returns False when ``enable_copy_arrow_import`` is off or a column needs the
+        row path (unsupported target type or Arrow type).
+        """
+        if not self.driver_features.get("enable_copy_arrow_import", True):
+            return False
+        if arrow_table.num_rows == 0:
+            return True
+        column_list = ", ".join(quote_identifier(name) for name in arrow_table.column_names)
+        prepared = await self.connection.prepare(f"SELECT {column_list} FROM {quoted_target} LIMIT 0")
+        encoder = create_pgcopy_encoder(
+            arrow_table.schema, [(attribute.name, attribute.type.oid) for attribute in prepared.get_attributes()]
+        )
+        if encoder is None:
+            return False
+        await self.connection.copy_to_table(
+            table_name,
+            source=aiter_pgcopy_chunks(arrow_table, encoder),
+            columns=encoder.column_names,
+            schema_name=schema_name,
+            format="binary",
+        )
+        return True
+
     @staticmethod
     def _copy_target(table: str) -> "tuple[str, str | None, str]":
         try:
@@ -589,13 +696,13 @@ class AsyncpgDriver(AsyncDriverAdapterBase):
         """Check if connection is in transaction."""
         return bool(self.connection.is_in_transaction())
 
-    async def _get_prepared_statement(self, sql: str) -> "AsyncpgPreparedStatement":
+    async def _get_prepared_statement(self, sql: str, timeout: "float | None" = None) -> "AsyncpgPreparedStatement":
         cached = self._prepared_statements.get(sql)
         if cached is not None:
             self._prepared_statements.move_to_end(sql)
             return cached
 
-        prepared = cast("AsyncpgPreparedStatement", await self.connection.prepare(sql))
+        prepared = cast("AsyncpgPreparedStatement", await self.connection.prepare(sql, timeout=timeout))
         self._prepared_statements[sql] = prepared
         if len(self._prepared_statements) > PREPARED_STATEMENT_CACHE_SIZE:
             self._prepared_statements.popitem(last=False)
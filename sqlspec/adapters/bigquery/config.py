@@ -338,7 +338,7 @@ class BigQueryConfig(NoPoolSyncConfig[BigQueryConnection, BigQueryDriver]):
         handler = _BigQuerySessionConnectionHandler(self)
 
         return BigQuerySessionContext(
-            acquire_connection=handler.acquire_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
             release_connection=handler.release_connection,
             statement_config=statement_config or self.statement_config or default_statement_config,
             driver_features=self.driver_features,
@@ -50,7 +50,7 @@ if TYPE_CHECKING:
     from sqlspec.storage import StorageTelemetry
     from sqlspec.typing import StatementParameters
 
-    BigQueryLoadFormat = Literal["jsonl", "json", "parquet", "arrow-ipc", "csv", "avro", "orc"]
+    BigQueryLoadFormat = Literal["jsonl", "json", "parquet", "arrow-ipc", "arrow-stream", "csv", "avro", "orc"]
 
 
 __all__ = (
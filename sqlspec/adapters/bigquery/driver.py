@@ -349,6 +349,7 @@ class BigQueryDriver(SyncDriverAdapterBase):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         return_format: "ArrowReturnFormat" = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -365,6 +366,7 @@ class BigQueryDriver(SyncDriverAdapterBase):
             statement: SQL statement, string, or QueryBuilder
             *parameters: Query parameters or filters
             statement_config: Optional statement configuration override
+            timeout: Statement timeout in seconds (overrides ``statement_config``)
             return_format: "table" for pyarrow.Table (default), "batch" for RecordBatch,
                 "batches" for list of RecordBatch, "reader" for RecordBatchReader
             native_only: If True, raise error if Storage API unavailable (default: False)
@@ -378,6 +380,21 @@ class BigQueryDriver(SyncDriverAdapterBase):
         Raises:
             MissingDependencyError: If pyarrow is not installed.
         """
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
+            return self._call_with_statement_timeout(
+                timeout,
+                lambda: self.select_to_arrow(
+                    statement,
+                    *parameters,
+                    statement_config=statement_config,
+                    return_format=return_format,
+                    native_only=native_only,
+                    batch_size=batch_size,
+                    arrow_schema=arrow_schema,
+                    **kwargs,
+                ),
+            )
         ensure_pyarrow()
 
         if return_format in {"reader", "batches"}:
@@ -501,7 +518,7 @@ class BigQueryDriver(SyncDriverAdapterBase):
         arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
         sync_pipeline = self._storage_pipeline()
         telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline
+            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline, partitioner=partitioner
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -576,11 +593,33 @@ class BigQueryDriver(SyncDriverAdapterBase):
         file_format: "BigQueryLoadFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts from storage into BigQuery."""
 
-        job_config = build_load_job_config(file_format, overwrite)
         gcs_source = _normalize_bigquery_gcs_uri(source)
+        arrow_read = columns is not None or filter is not None or file_format in {"arrow-ipc", "arrow-stream"}
+        if (gcs_source is None or arrow_read) and self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        if arrow_read:
+            # Load jobs ingest whole files and cannot read Arrow IPC; projection, row filters,
+            # and IPC artifacts go through the Arrow read path.
+            arrow_table, inbound = self._read_storage_arrow(
+                source, file_format=cast("StorageFormat", file_format), columns=columns, filter=filter
+            )
+            return self.load_from_arrow(
+                table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound
+            )
+        job_config = build_load_job_config(file_format, overwrite)
         if gcs_source is not None:
             job = self.connection.load_table_from_uri(
                 gcs_source, table, job_config=job_config, retry=self._job_retry, timeout=self._job_request_timeout()
@@ -31,7 +31,7 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from sqlspec.core import StatementConfig
-    from sqlspec.observability import ObservabilityConfig
+    from sqlspec.observability import ObservabilityConfig, PoolGauges
 
 __all__ = (
     "CockroachAsyncpgConfig",
@@ -250,7 +250,7 @@ class CockroachAsyncpgConfig(
             driver_features["default_staleness"] = staleness
 
         return CockroachAsyncpgSessionContext(
-            acquire_connection=factory.acquire_connection,
+            acquire_connection=self._guard_acquire(factory.acquire_connection),
             release_connection=factory.release_connection,
             statement_config=statement_config
             or (lambda: resolve_runtime_statement_config(None, self.statement_config, default_statement_config)),
@@ -263,6 +263,19 @@ class CockroachAsyncpgConfig(
             self.connection_instance = await self.create_pool()
         return self.connection_instance
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        size = pool.get_size()
+        idle = pool.get_idle_size()
+        return {"size": size, "checked_out": size - idle, "idle": idle, "max_size": pool.get_max_size()}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         namespace = super().get_signature_namespace()
         namespace.update({
@@ -1,16 +1,16 @@
 """CockroachDB AsyncPG adapter helpers."""
 
-import secrets
 from typing import TYPE_CHECKING, Any, Final
 
 from mypy_extensions import mypyc_attr
 
-from sqlspec.utils.type_guards import has_sqlstate
+from sqlspec.core.retry import RetryPolicy
+from sqlspec.exceptions import SerializationConflictError
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
-__all__ = ("CockroachAsyncpgRetryConfig", "calculate_backoff_seconds", "is_retryable_error")
+__all__ = ("CockroachAsyncpgRetryConfig",)
 
 # Retry configuration defaults (module-level for mypyc compatibility)
 _DEFAULT_MAX_RETRIES: Final[int] = 10
@@ -47,19 +47,13 @@ class CockroachAsyncpgRetryConfig:
             enable_logging=bool(driver_features.get("enable_retry_logging", _DEFAULT_ENABLE_LOGGING)),
         )
 
-
-def is_retryable_error(error: BaseException) -> bool:
-    """Return True when the error should trigger a CockroachDB retry."""
-    if has_sqlstate(error):
-        return str(error.sqlstate) == "40001"
-    return False
-
-
-def calculate_backoff_seconds(attempt: int, config: "CockroachAsyncpgRetryConfig") -> float:
-    """Calculate exponential backoff delay in seconds."""
-    base: float = config.base_delay_ms * (2**attempt)
-    scale: int = 1000
-    max_jitter: int = max(int(base * scale), 0)
-    jitter: float = secrets.randbelow(max_jitter + 1) / scale if max_jitter else 0.0
-    delay_ms: float = min(base + jitter, config.max_delay_ms)
-    return delay_ms / 1000.0
+    def to_retry_policy(self) -> RetryPolicy:
+        """Return the equivalent generic policy retrying serialization conflicts."""
+        return RetryPolicy(
+            self.max_retries + 1,
+            base_delay=self.base_delay_ms / 1000.0,
+            max_delay=self.max_delay_ms / 1000.0,
+            retry_on=(SerializationConflictError,),
+            retry_sqlstates=("40001",),
+            log_retries=self.enable_logging,
+        )
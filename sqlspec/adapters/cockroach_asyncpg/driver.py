@@ -1,30 +1,25 @@
 """CockroachDB AsyncPG driver implementation."""
 
-import asyncio
-import contextlib
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from sqlspec.adapters.asyncpg.core import create_mapped_exception, driver_profile
 from sqlspec.adapters.asyncpg.driver import AsyncpgDriver
 from sqlspec.adapters.cockroach_asyncpg._typing import CockroachAsyncpgPostgresError, CockroachAsyncpgSessionContext
-from sqlspec.adapters.cockroach_asyncpg.core import (
-    CockroachAsyncpgRetryConfig,
-    calculate_backoff_seconds,
-    is_retryable_error,
-)
+from sqlspec.adapters.cockroach_asyncpg.core import CockroachAsyncpgRetryConfig
 from sqlspec.adapters.cockroach_asyncpg.data_dictionary import CockroachAsyncpgDataDictionary
 from sqlspec.core import SQL, register_driver_profile
 from sqlspec.driver import BaseAsyncExceptionHandler
-from sqlspec.exceptions import SerializationConflictError, TransactionRetryError
+from sqlspec.exceptions import SerializationConflictError
 from sqlspec.utils.logging import get_logger
 from sqlspec.utils.type_guards import has_sqlstate
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncGenerator, Awaitable, Callable
 
     from sqlspec.adapters.cockroach_asyncpg._typing import CockroachAsyncpgConnection
-    from sqlspec.core import StatementConfig
+    from sqlspec.core import RetryPolicy, StatementConfig
     from sqlspec.driver import ExecutionResult
+    from sqlspec.typing import ArrowRecordBatch
 
 __all__ = ("CockroachAsyncpgDriver", "CockroachAsyncpgExceptionHandler", "CockroachAsyncpgSessionContext")
 
@@ -67,33 +62,19 @@ class CockroachAsyncpgDriver(AsyncpgDriver):
         # Data dictionary is lazily initialized in property; use parent slot
         self._data_dictionary = None
 
-    async def run_transaction_with_retry(self, operation: "Callable[[], Awaitable[_T]]") -> _T:
-        """Execute a full CockroachDB transaction callback with serialization retries."""
-        if not self._enable_retry or self._connection_in_transaction():
-            return await operation()
-
-        last_error: BaseException | None = None
-
-        for attempt in range(self._retry_config.max_retries + 1):
-            try:
-                await self.begin()
-                result = await operation()
-                await self.commit()
-            except Exception as exc:
-                last_error = exc
-                with contextlib.suppress(Exception):
-                    await self.rollback()
-                if not is_retryable_error(exc) or attempt >= self._retry_config.max_retries:
-                    raise
-            else:
-                return result
-            delay = calculate_backoff_seconds(attempt, self._retry_config)
-            if self._retry_config.enable_logging:
-                logger.debug("CockroachDB retry %s/%s after %.3fs", attempt + 1, self._retry_config.max_retries, delay)
-            await asyncio.sleep(delay)
-
-        msg = "CockroachDB transaction retry limit exceeded"
-        raise TransactionRetryError(msg) from last_error
+    async def run_transaction_with_retry(
+        self, operation: "Callable[[], Awaitable[_T]]", *, retry_policy: "RetryPolicy | None" = None
+    ) -> _T:
+        """Execute a full CockroachDB transaction callback with serialization retries.
+
+        Without an explicit ``retry_policy`` the ``enable_auto_retry`` and ``max_retries``
+        / ``retry_delay_*`` driver features decide how conflicts are retried.
+        """
+        if retry_policy is None:
+            if not self._enable_retry:
+                return await operation()
+            retry_policy = self._retry_config.to_retry_policy()
+        return await super().run_transaction_with_retry(operation, retry_policy=retry_policy)
 
     async def dispatch_execute(self, cursor: Any, statement: SQL) -> "ExecutionResult":
         return await self._dispatch_execute_impl(cursor, statement)
@@ -104,6 +85,12 @@ class CockroachAsyncpgDriver(AsyncpgDriver):
     async def dispatch_execute_script(self, cursor: Any, statement: SQL) -> "ExecutionResult":
         return await self._dispatch_execute_script_impl(cursor, statement)
 
+    async def dispatch_arrow_export(
+        self, statement: SQL, batch_size: int
+    ) -> "AsyncGenerator[ArrowRecordBatch, None] | None":
+        """CockroachDB has no binary ``COPY ... TO STDOUT``; Arrow exports use the row path."""
+        return None
+
     def handle_database_exceptions(self) -> "CockroachAsyncpgExceptionHandler":  # type: ignore[override]
         return CockroachAsyncpgExceptionHandler()
 
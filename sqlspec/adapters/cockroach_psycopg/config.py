@@ -32,7 +32,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from sqlspec.core import StatementConfig
-    from sqlspec.observability import ObservabilityConfig
+    from sqlspec.observability import ObservabilityConfig, PoolGauges
 
 __all__ = (
     "CockroachPsycopgAsyncConfig",
@@ -301,7 +301,7 @@ class CockroachPsycopgSyncConfig(
             driver_features["default_staleness"] = staleness
 
         return CockroachPsycopgSyncSessionContext(
-            acquire_connection=handler.acquire_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
             release_connection=handler.release_connection,
             statement_config=statement_config
             or (lambda: resolve_runtime_statement_config(None, self.statement_config, default_statement_config)),
@@ -314,6 +314,20 @@ class CockroachPsycopgSyncConfig(
             self.connection_instance = self.create_pool()
         return self.connection_instance
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        idle = stats.get("pool_available", 0)
+        return {"size": size, "checked_out": size - idle, "idle": idle, "max_size": pool.max_size}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         namespace = super().get_signature_namespace()
         namespace.update({
@@ -517,7 +531,7 @@ class CockroachPsycopgAsyncConfig(
             driver_features["default_staleness"] = staleness
 
         return CockroachPsycopgAsyncSessionContext(
-            acquire_connection=handler.acquire_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
             release_connection=handler.release_connection,
             statement_config=statement_config
             or (lambda: resolve_runtime_statement_config(None, self.statement_config, default_statement_config)),
@@ -530,6 +544,31 @@ class CockroachPsycopgAsyncConfig(
             self.connection_instance = await self.create_pool()
         return self.connection_instance
 
+    def pool_spare_capacity(self) -> int:
+        """Return how many connections the pool can hand out without queuing.
+
+        Returns:
+            Idle plus growable connection slots, or 0 while callers are already waiting.
+        """
+        pool = self.connection_instance
+        if pool is None or pool.get_stats().get("requests_waiting", 0) > 0:
+            return 0
+        return super().pool_spare_capacity()
+
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        idle = stats.get("pool_available", 0)
+        return {"size": size, "checked_out": size - idle, "idle": idle, "max_size": pool.max_size}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         namespace = super().get_signature_namespace()
         namespace.update({
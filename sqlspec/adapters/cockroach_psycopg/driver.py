@@ -1,8 +1,5 @@
 """CockroachDB psycopg driver implementation."""
 
-import asyncio
-import contextlib
-import time
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import psycopg
@@ -13,13 +10,7 @@ from sqlspec.adapters.cockroach_psycopg._typing import (
     CockroachPsycopgSyncSessionContext,
     CockroachSyncConnection,
 )
-from sqlspec.adapters.cockroach_psycopg.core import (
-    CockroachPsycopgRetryConfig,
-    build_statement_config,
-    calculate_backoff_seconds,
-    driver_profile,
-    is_retryable_error,
-)
+from sqlspec.adapters.cockroach_psycopg.core import CockroachPsycopgRetryConfig, build_statement_config, driver_profile
 from sqlspec.adapters.cockroach_psycopg.data_dictionary import (
     CockroachPsycopgAsyncDataDictionary,
     CockroachPsycopgSyncDataDictionary,
@@ -28,15 +19,17 @@ from sqlspec.adapters.psycopg.core import create_mapped_exception
 from sqlspec.adapters.psycopg.driver import PsycopgAsyncDriver, PsycopgSyncDriver
 from sqlspec.core import SQL, StatementConfig, get_cache_config, register_driver_profile
 from sqlspec.driver import BaseAsyncExceptionHandler, BaseSyncExceptionHandler
-from sqlspec.exceptions import SerializationConflictError, TransactionRetryError
+from sqlspec.exceptions import SerializationConflictError
 from sqlspec.utils.logging import get_logger
 from sqlspec.utils.type_guards import has_sqlstate
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 
     from sqlspec.adapters.cockroach_psycopg._typing import CockroachAsyncCursor, CockroachSyncCursor
+    from sqlspec.core import RetryPolicy
     from sqlspec.driver import ExecutionResult
+    from sqlspec.typing import ArrowRecordBatch
 
 __all__ = (
     "CockroachPsycopgAsyncDriver",
@@ -110,33 +103,19 @@ class CockroachPsycopgSyncDriver(PsycopgSyncDriver):
         # Data dictionary is lazily initialized in property; use parent slot
         self._data_dictionary = None
 
-    def run_transaction_with_retry(self, operation: "Callable[[], _T]") -> _T:
-        """Execute a full CockroachDB transaction callback with serialization retries."""
-        if not self._enable_retry or self._connection_in_transaction():
-            return operation()
-
-        last_error: BaseException | None = None
-
-        for attempt in range(self._retry_config.max_retries + 1):
-            try:
-                self.begin()
-                result = operation()
-                self.commit()
-            except Exception as exc:
-                last_error = exc
-                with contextlib.suppress(Exception):
-                    self.rollback()
-                if not is_retryable_error(exc) or attempt >= self._retry_config.max_retries:
-                    raise
-            else:
-                return result
-            delay = calculate_backoff_seconds(attempt, self._retry_config)
-            if self._retry_config.enable_logging:
-                logger.debug("CockroachDB retry %s/%s after %.3fs", attempt + 1, self._retry_config.max_retries, delay)
-            time.sleep(delay)
-
-        msg = "CockroachDB transaction retry limit exceeded"
-        raise TransactionRetryError(msg) from last_error
+    def run_transaction_with_retry(
+        self, operation: "Callable[[], _T]", *, retry_policy: "RetryPolicy | None" = None
+    ) -> _T:
+        """Execute a full CockroachDB transaction callback with serialization retries.
+
+        Without an explicit ``retry_policy`` the ``enable_auto_retry`` and ``max_retries``
+        / ``retry_delay_*`` driver features decide how conflicts are retried.
+        """
+        if retry_policy is None:
+            if not self._enable_retry:
+                return operation()
+            retry_policy = self._retry_config.to_retry_policy()
+        return super().run_transaction_with_retry(operation, retry_policy=retry_policy)
 
     def dispatch_execute(self, cursor: "CockroachSyncCursor", statement: SQL) -> "ExecutionResult":
         return self._dispatch_execute_impl(cursor, statement)
@@ -147,6 +126,12 @@ class CockroachPsycopgSyncDriver(PsycopgSyncDriver):
     def dispatch_execute_script(self, cursor: "CockroachSyncCursor", statement: SQL) -> "ExecutionResult":
         return self._dispatch_execute_script_impl(cursor, statement)
 
+    def dispatch_arrow_export(
+        self, statement: SQL, batch_size: int
+    ) -> "Generator[ArrowRecordBatch, None, None] | None":
+        """CockroachDB has no binary ``COPY ... TO STDOUT``; Arrow exports use the row path."""
+        return None
+
     def handle_database_exceptions(self) -> "CockroachPsycopgSyncExceptionHandler":  # type: ignore[override]
         return CockroachPsycopgSyncExceptionHandler()
 
@@ -201,33 +186,19 @@ class CockroachPsycopgAsyncDriver(PsycopgAsyncDriver):
         # Data dictionary is lazily initialized in property; use parent slot
         self._data_dictionary = None
 
-    async def run_transaction_with_retry(self, operation: "Callable[[], Awaitable[_T]]") -> _T:
-        """Execute a full CockroachDB transaction callback with serialization retries."""
-        if not self._enable_retry or self._connection_in_transaction():
-            return await operation()
-
-        last_error: BaseException | None = None
-
-        for attempt in range(self._retry_config.max_retries + 1):
-            try:
-                await self.begin()
-                result = await operation()
-                await self.commit()
-            except Exception as exc:
-                last_error = exc
-                with contextlib.suppress(Exception):
-                    await self.rollback()
-                if not is_retryable_error(exc) or attempt >= self._retry_config.max_retries:
-                    raise
-            else:
-                return result
-            delay = calculate_backoff_seconds(attempt, self._retry_config)
-            if self._retry_config.enable_logging:
-                logger.debug("CockroachDB retry %s/%s after %.3fs", attempt + 1, self._retry_config.max_retries, delay)
-            await asyncio.sleep(delay)
-
-        msg = "CockroachDB transaction retry limit exceeded"
-        raise TransactionRetryError(msg) from last_error
+    async def run_transaction_with_retry(
+        self, operation: "Callable[[], Awaitable[_T]]", *, retry_policy: "RetryPolicy | None" = None
+    ) -> _T:
+        """Execute a full CockroachDB transaction callback with serialization retries.
+
+        Without an explicit ``retry_policy`` the ``enable_auto_retry`` and ``max_retries``
+        / ``retry_delay_*`` driver features decide how conflicts are retried.
+        """
+        if retry_policy is None:
+            if not self._enable_retry:
+                return await operation()
+            retry_policy = self._retry_config.to_retry_policy()
+        return await super().run_transaction_with_retry(operation, retry_policy=retry_policy)
 
     async def dispatch_execute(self, cursor: "CockroachAsyncCursor", statement: SQL) -> "ExecutionResult":
         return await self._dispatch_execute_impl(cursor, statement)
@@ -238,6 +209,12 @@ class CockroachPsycopgAsyncDriver(PsycopgAsyncDriver):
     async def dispatch_execute_script(self, cursor: "CockroachAsyncCursor", statement: SQL) -> "ExecutionResult":
         return await self._dispatch_execute_script_impl(cursor, statement)
 
+    async def dispatch_arrow_export(
+        self, statement: SQL, batch_size: int
+    ) -> "AsyncGenerator[ArrowRecordBatch, None] | None":
+        """CockroachDB has no binary ``COPY ... TO STDOUT``; Arrow exports use the row path."""
+        return None
+
     def handle_database_exceptions(self) -> "CockroachPsycopgAsyncExceptionHandler":  # type: ignore[override]
         return CockroachPsycopgAsyncExceptionHandler()
 
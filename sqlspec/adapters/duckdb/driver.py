@@ -27,7 +27,9 @@ from sqlspec.core import (
     register_driver_profile,
 )
 from sqlspec.core.result import DMLResult
-from sqlspec.driver import BaseSyncExceptionHandler, SyncDriverAdapterBase, SyncRowStream
+from sqlspec.driver import BaseSyncExceptionHandler, SyncDriverAdapterBase, SyncRowStream, SyncStatementTimeout
+from sqlspec.driver._stream import SyncTimeoutIterator
+from sqlspec.driver._timeout import resolve_statement_timeout
 from sqlspec.exceptions import SQLSpecError
 from sqlspec.utils.logging import get_logger
 from sqlspec.utils.module_loader import ensure_pyarrow
@@ -45,7 +47,7 @@ if TYPE_CHECKING:
     from sqlspec.typing import ArrowReturnFormat, StatementParameters
 
 
-__all__ = ("DuckDBCursor", "DuckDBDriver", "DuckDBExceptionHandler", "DuckDBSessionContext")
+__all__ = ("DuckDBCursor", "DuckDBDriver", "DuckDBExceptionHandler", "DuckDBSessionContext", "DuckDBStatementTimeout")
 
 logger = get_logger("sqlspec.adapters.duckdb")
 
@@ -72,6 +74,18 @@ class DuckDBExceptionHandler(BaseSyncExceptionHandler):
         return False
 
 
+class DuckDBStatementTimeout(SyncStatementTimeout):
+    """Statement timeout enforced by interrupting the DuckDB connection."""
+
+    __slots__ = ()
+
+    def arm(self) -> None:
+        self.start_watchdog()
+
+    def interrupt(self) -> None:
+        self.connection.interrupt()
+
+
 class DuckDBDriver(SyncDriverAdapterBase):
     """Synchronous DuckDB database driver.
 
@@ -285,6 +299,9 @@ class DuckDBDriver(SyncDriverAdapterBase):
         """
         return DuckDBExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "DuckDBStatementTimeout":
+        return DuckDBStatementTimeout(connection, timeout)
+
     # ─────────────────────────────────────────────────────────────────────────────
     # ARROW API METHODS
     # ─────────────────────────────────────────────────────────────────────────────
@@ -295,6 +312,7 @@ class DuckDBDriver(SyncDriverAdapterBase):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         return_format: "ArrowReturnFormat" = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -310,6 +328,8 @@ class DuckDBDriver(SyncDriverAdapterBase):
             statement: SQL statement, string, or QueryBuilder
             *parameters: Query parameters or filters
             statement_config: Optional statement configuration override
+            timeout: Statement timeout in seconds; for "reader"/"batches" it also
+                covers reading the batches
             return_format: "table" for pyarrow.Table (default), "batch" for RecordBatch,
                 "batches" for list of RecordBatch, "reader" for RecordBatchReader
             native_only: Ignored for DuckDB (always uses native path)
@@ -323,38 +343,56 @@ class DuckDBDriver(SyncDriverAdapterBase):
         ensure_pyarrow()
 
         config = statement_config or self.statement_config
+        if timeout is not None:
+            config = config.replace(statement_timeout=timeout)
         prepared_statement = self.prepare_statement(statement, parameters, statement_config=config, kwargs=kwargs)
 
         exc_handler = self.handle_database_exceptions()
         arrow_result: ArrowResult | None = None
+        timeout_scope = self._statement_timeout_scope(self.connection, prepared_statement)
+        reading = False
 
-        with self.with_cursor(self.connection) as cursor, exc_handler:
-            sql, driver_params = self._compiled_sql(prepared_statement, config)
-
-            cursor.execute(sql, driver_params or ())
-
-            if return_format in {"reader", "batches"}:
-                arrow_reader = (
-                    cursor.to_arrow_reader(batch_size) if batch_size is not None else cursor.to_arrow_reader()
-                )
-                return build_arrow_result_from_reader(
+        timeout_scope.__enter__()
+        try:
+            with self.with_cursor(self.connection) as cursor, exc_handler:
+                sql, driver_params = self._compiled_sql(prepared_statement, config)
+
+                cursor.execute(sql, driver_params or ())
+
+                if return_format in {"reader", "batches"}:
+                    arrow_reader = (
+                        cursor.to_arrow_reader(batch_size) if batch_size is not None else cursor.to_arrow_reader()
+                    )
+                    if timeout_scope.timeout is not None:
+                        import pyarrow as pa
+
+                        arrow_reader = pa.RecordBatchReader.from_batches(
+                            arrow_reader.schema, SyncTimeoutIterator(iter(arrow_reader), timeout_scope, entered=True)
+                        )
+                    arrow_result = build_arrow_result_from_reader(
+                        prepared_statement,
+                        arrow_reader,
+                        return_format=return_format,
+                        batch_size=batch_size,
+                        arrow_schema=arrow_schema,
+                    )
+                    reading = timeout_scope.timeout is not None
+                    return arrow_result
+
+                arrow_table = cursor.to_arrow_table()
+
+                arrow_result = build_arrow_result_from_table(
                     prepared_statement,
-                    arrow_reader,
+                    arrow_table,
                     return_format=return_format,
                     batch_size=batch_size,
                     arrow_schema=arrow_schema,
                 )
+        finally:
+            if not reading:
+                timeout_scope.__exit__(None, None, None)
 
-            arrow_table = cursor.to_arrow_table()
-
-            arrow_result = build_arrow_result_from_table(
-                prepared_statement,
-                arrow_table,
-                return_format=return_format,
-                batch_size=batch_size,
-                arrow_schema=arrow_schema,
-            )
-
+        resolve_statement_timeout(timeout_scope, exc_handler)
         if exc_handler.pending_exception is not None:
             raise exc_handler.pending_exception from None
 
@@ -387,7 +425,7 @@ class DuckDBDriver(SyncDriverAdapterBase):
         arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
         sync_pipeline = self._storage_pipeline()
         telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline
+            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline, partitioner=partitioner
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -450,10 +488,22 @@ class DuckDBDriver(SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Read an artifact from storage and load it into DuckDB."""
 
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     # ─────────────────────────────────────────────────────────────────────────────
@@ -490,6 +540,8 @@ class DuckDBDriver(SyncDriverAdapterBase):
             return None
         if not isinstance(expression.this, exp.Schema):
             return None
+        if expression.args.get("conflict") is not None or expression.args.get("returning") is not None:
+            return None
 
         table_expr = expression.this.this
         if not isinstance(table_expr, exp.Table):
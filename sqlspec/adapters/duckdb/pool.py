@@ -17,6 +17,8 @@ from sqlspec.utils.uuids import uuid4
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
 
+    from sqlspec.observability import PoolMetrics
+
 __all__ = ("DuckDBConnectionPool",)
 
 
@@ -54,6 +56,7 @@ class DuckDBConnectionPool:
         "_installed_signatures",
         "_is_memory_db",
         "_lock",
+        "_metrics",
         "_on_connection_create",
         "_pool_id",
         "_recycle",
@@ -70,6 +73,7 @@ class DuckDBConnectionPool:
         extension_flags: "dict[str, Any] | None" = None,
         secrets: "list[dict[str, Any]] | None" = None,
         on_connection_create: "Callable[[DuckDBConnection], DuckDBConnection | None] | None" = None,
+        metrics: "PoolMetrics | None" = None,
     ) -> None:
         """Initialize the thread-local connection manager.
 
@@ -81,6 +85,7 @@ class DuckDBConnectionPool:
             extension_flags: Connection-level SET statements applied after creation
             secrets: List of secrets to create
             on_connection_create: Callback executed when connection is created
+            metrics: Pool metrics that record connection creation latency and age
         """
         self._connection_config = connection_config
         self._recycle = pool_recycle_seconds
@@ -89,6 +94,7 @@ class DuckDBConnectionPool:
         self._extension_flags = extension_flags or {}
         self._secrets = secrets or []
         self._on_connection_create = on_connection_create
+        self._metrics = metrics
         self._installed_signatures: set[tuple[Any, ...]] = set()
         self._thread_local = threading.local()
         self._lock = threading.RLock()
@@ -262,6 +268,20 @@ class DuckDBConnectionPool:
         escaped = str(value).replace("'", "''")
         return f"'{escaped}'"
 
+    def _create_measured_connection(self) -> DuckDBConnection:
+        """Create a connection, recording its creation latency in the pool metrics."""
+        if self._metrics is None:
+            return self._create_connection()
+        started = time.perf_counter()
+        connection = self._create_connection()
+        self._metrics.observe_connection_created(time.perf_counter() - started)
+        return connection
+
+    def _record_connection_closed(self) -> None:
+        """Record the lifetime of the current thread's connection before it is closed."""
+        if self._metrics is not None and "created_at" in self._thread_local.__dict__:
+            self._metrics.observe_connection_closed(time.time() - self._thread_local.created_at)
+
     def _get_thread_connection(self) -> DuckDBConnection:
         """Get or create a connection for the current thread.
 
@@ -270,15 +290,16 @@ class DuckDBConnectionPool:
         """
         thread_state = self._thread_local.__dict__
         if "connection" not in thread_state:
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
             self._thread_local.last_used = time.time()
             return cast("DuckDBConnection", self._thread_local.connection)
 
         if self._recycle > 0 and time.time() - self._thread_local.created_at > self._recycle:
+            self._record_connection_closed()
             with suppress(Exception):
                 self._thread_local.connection.close()
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
             self._thread_local.last_used = time.time()
             return cast("DuckDBConnection", self._thread_local.connection)
@@ -295,9 +316,10 @@ class DuckDBConnectionPool:
                 idle_seconds=round(idle_time, 1),
                 reason="failed_health_check",
             )
+            self._record_connection_closed()
             with suppress(Exception):
                 self._thread_local.connection.close()
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
 
         self._thread_local.last_used = time.time()
@@ -307,6 +329,7 @@ class DuckDBConnectionPool:
         """Close the connection for the current thread."""
         thread_state = self._thread_local.__dict__
         if "connection" in thread_state:
+            self._record_connection_closed()
             with suppress(Exception):
                 self._thread_local.connection.close()
             del self._thread_local.connection
@@ -479,7 +479,7 @@ class MysqlConnectorAsyncConfig(NoPoolAsyncConfig[MysqlConnectorAsyncConnection,
         handler = _MysqlConnectorAsyncSessionConnectionHandler(self)
 
         return MysqlConnectorAsyncSessionContext(
-            acquire_connection=handler.acquire_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
             release_connection=handler.release_connection,
             statement_config=statement_config,
             driver_features=self.driver_features,
@@ -6,7 +6,7 @@
 
 import contextlib
 from collections.abc import Callable, Sized
-from typing import TYPE_CHECKING, Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Final, Literal, cast
 
 from sqlspec.core import DriverParameterProfile, ParameterStyle, StatementConfig, build_statement_config_from_profile
 from sqlspec.driver import rows_to_dicts
@@ -55,6 +55,7 @@ __all__ = (
     "normalize_execute_parameters",
     "normalize_lastrowid",
     "resolve_column_names",
+    "resolve_column_types",
     "resolve_many_rowcount",
     "resolve_row_plan",
     "resolve_rowcount",
@@ -173,6 +174,41 @@ def normalize_execute_parameters(parameters: Any) -> Any:
     return parameters or None
 
 
+_MYSQL_TYPE_CODE_TOKENS: Final[dict[int, str]] = {
+    0: "decimal",
+    1: "int32",
+    2: "int32",
+    3: "int64",
+    4: "float32",
+    5: "float64",
+    7: "timestamp",
+    8: "int64",
+    10: "date",
+    11: "time",
+    12: "timestamp",
+    246: "decimal",
+    252: "binary",
+    253: "string",
+    254: "string",
+}
+
+
+def resolve_column_types(description: Any) -> "dict[str, str] | None":
+    """Map MySQL cursor column FIELD_TYPE codes to neutral Arrow type tokens.
+
+    Returns ``None`` when the cursor has no description or reports no
+    recognizable type codes.
+    """
+    if not description:
+        return None
+    column_types: dict[str, str] = {}
+    for col in description:
+        token = _MYSQL_TYPE_CODE_TOKENS.get(col[1])
+        if token is not None:
+            column_types[col[0]] = token
+    return column_types or None
+
+
 class MysqlConnectorSyncStreamSource:
     """Compiled chunk source streaming dict rows from an unbuffered mysql-connector cursor."""
 
@@ -215,6 +251,9 @@ class MysqlConnectorSyncStreamSource:
             self._row_plan = resolve_row_plan(self._cursor.description, self._json_type_codes)
         self._driver._check_pending_exception(handler)
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         rows: list[Any] = []
@@ -228,6 +267,20 @@ class MysqlConnectorSyncStreamSource:
         deserializer = cast("Callable[[Any], Any]", self._driver.driver_features.get("json_deserializer", from_json))
         return collect_stream_rows(rows, self._row_plan, deserializer)
 
+    def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        handler = self._driver.handle_database_exceptions()
+        rows: list[Any] = []
+        with handler:
+            rows = self._cursor.fetchmany(self._chunk_size)
+        self._driver._check_pending_exception(handler)
+        if self._row_plan is None:
+            self._row_plan = resolve_row_plan(self._cursor.description, self._json_type_codes)
+        deserializer = cast("Callable[[Any], Any]", self._driver.driver_features.get("json_deserializer", from_json))
+        data, column_names, row_format = collect_rows(rows or [], self._row_plan, deserializer)
+        if row_format == "dict":
+            data = [tuple(row.values()) for row in data]
+        return data, column_names, resolve_column_types(self._cursor.description)
+
     def close(self, error: bool = False) -> None:
         cursor = self._cursor
         self._cursor = None
@@ -286,6 +339,9 @@ class MysqlConnectorAsyncStreamSource:
         await cursor.execute(self._sql, normalize_execute_parameters(self._parameters))
         self._row_plan = resolve_row_plan(self._cursor.description, self._json_type_codes)
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     async def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         rows = await self._driver._run_with_exception_handler(handler, self._cursor.fetchmany, self._chunk_size)
@@ -297,6 +353,18 @@ class MysqlConnectorAsyncStreamSource:
         deserializer = cast("Callable[[Any], Any]", self._driver.driver_features.get("json_deserializer", from_json))
         return collect_stream_rows(rows, self._row_plan, deserializer)
 
+    async def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        handler = self._driver.handle_database_exceptions()
+        rows = await self._driver._run_with_exception_handler(handler, self._cursor.fetchmany, self._chunk_size)
+        self._driver._check_pending_exception(handler)
+        if self._row_plan is None:
+            self._row_plan = resolve_row_plan(self._cursor.description, self._json_type_codes)
+        deserializer = cast("Callable[[Any], Any]", self._driver.driver_features.get("json_deserializer", from_json))
+        data, column_names, row_format = collect_rows(rows or [], self._row_plan, deserializer)
+        if row_format == "dict":
+            data = [tuple(row.values()) for row in data]
+        return data, column_names, resolve_column_types(self._cursor.description)
+
     async def close(self, error: bool = False) -> None:
         cursor = self._cursor
         self._cursor = None
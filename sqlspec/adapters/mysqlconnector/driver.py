@@ -31,6 +31,7 @@ from sqlspec.adapters.mysqlconnector.core import (
     normalize_execute_many_parameters,
     normalize_execute_parameters,
     normalize_lastrowid,
+    resolve_column_types,
     resolve_many_rowcount,
     resolve_row_plan,
     resolve_rowcount,
@@ -43,18 +44,21 @@ from sqlspec.core import ArrowResult, get_cache_config, register_driver_profile
 from sqlspec.driver import (
     AsyncDriverAdapterBase,
     AsyncRowStream,
+    AsyncStatementTimeout,
     BaseAsyncExceptionHandler,
     BaseSyncExceptionHandler,
     SyncDriverAdapterBase,
     SyncRowStream,
+    SyncStatementTimeout,
 )
+from sqlspec.driver._timeout import add_max_execution_time_hint
 from sqlspec.exceptions import SQLSpecError
 from sqlspec.utils.logging import get_logger
 from sqlspec.utils.serializers import from_json
 from sqlspec.utils.type_guards import supports_json_type
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
     from sqlspec.adapters.mysqlconnector._typing import MysqlConnectorAsyncConnection, MysqlConnectorSyncConnection
     from sqlspec.core import SQL, StatementConfig
@@ -66,10 +70,12 @@ __all__ = (
     "MysqlConnectorAsyncDriver",
     "MysqlConnectorAsyncExceptionHandler",
     "MysqlConnectorAsyncSessionContext",
+    "MysqlConnectorAsyncStatementTimeout",
     "MysqlConnectorSyncCursor",
     "MysqlConnectorSyncDriver",
     "MysqlConnectorSyncExceptionHandler",
     "MysqlConnectorSyncSessionContext",
+    "MysqlConnectorSyncStatementTimeout",
 )
 
 logger = get_logger("sqlspec.adapters.mysqlconnector")
@@ -77,40 +83,6 @@ logger = get_logger("sqlspec.adapters.mysqlconnector")
 json_type_value = MysqlConnectorFieldType.JSON if supports_json_type(MysqlConnectorFieldType) else None
 MYSQLCONNECTOR_JSON_TYPE_CODES: Final[set[int]] = {json_type_value} if json_type_value is not None else set()
 
-_MYSQL_TYPE_CODE_TOKENS: Final[dict[int, str]] = {
-    0: "decimal",
-    1: "int32",
-    2: "int32",
-    3: "int64",
-    4: "float32",
-    5: "float64",
-    7: "timestamp",
-    8: "int64",
-    10: "date",
-    11: "time",
-    12: "timestamp",
-    246: "decimal",
-    252: "binary",
-    253: "string",
-    254: "string",
-}
-
-
-def _resolve_column_types(description: Any) -> "dict[str, str] | None":
-    """Map MySQL cursor column FIELD_TYPE codes to neutral Arrow type tokens.
-
-    Returns ``None`` when the cursor has no description or reports no
-    recognizable type codes.
-    """
-    if not description:
-        return None
-    column_types: dict[str, str] = {}
-    for col in description:
-        token = _MYSQL_TYPE_CODE_TOKENS.get(col[1])
-        if token is not None:
-            column_types[col[0]] = token
-    return column_types or None
-
 
 class MysqlConnectorSyncExceptionHandler(BaseSyncExceptionHandler):
     """Context manager for handling mysql-connector sync exceptions."""
@@ -129,6 +101,16 @@ class MysqlConnectorSyncExceptionHandler(BaseSyncExceptionHandler):
         return False
 
 
+class MysqlConnectorSyncStatementTimeout(SyncStatementTimeout):
+    """Statement timeout enforced by the server through a ``MAX_EXECUTION_TIME`` optimizer hint.
+
+    The driver adds the hint to ``SELECT`` statements, the only kind MySQL
+    limits, so the session is never modified.
+    """
+
+    __slots__ = ()
+
+
 class MysqlConnectorSyncDriver(SyncDriverAdapterBase):
     """MySQL/MariaDB database driver using mysql-connector sync library."""
 
@@ -151,6 +133,7 @@ class MysqlConnectorSyncDriver(SyncDriverAdapterBase):
 
     def dispatch_execute(self, cursor: Any, statement: "SQL") -> "ExecutionResult":
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        sql = add_max_execution_time_hint(sql, statement.statement_config.statement_timeout)
         cursor.execute(sql, normalize_execute_parameters(prepared_parameters))
 
         if statement.returns_rows() or getattr(cursor, "with_rows", False):
@@ -159,7 +142,7 @@ class MysqlConnectorSyncDriver(SyncDriverAdapterBase):
             row_plan = resolve_row_plan(description, MYSQLCONNECTOR_JSON_TYPE_CODES)
             deserializer = cast("Callable[[Any], Any]", self.driver_features.get("json_deserializer", from_json))
             rows, column_names, row_format = collect_rows(fetched_data, row_plan, deserializer, logger=logger)
-            column_types = _resolve_column_types(description)
+            column_types = resolve_column_types(description)
 
             return self.create_execution_result(
                 cursor,
@@ -231,6 +214,7 @@ class MysqlConnectorSyncDriver(SyncDriverAdapterBase):
         if not statement.returns_rows():
             return None
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        sql = add_max_execution_time_hint(sql, statement.statement_config.statement_timeout)
         cursor_options = cast("dict[str, Any]", self.driver_features.get("cursor_options") or {})
         return SyncRowStream(
             MysqlConnectorSyncStreamSource(
@@ -241,6 +225,9 @@ class MysqlConnectorSyncDriver(SyncDriverAdapterBase):
     def handle_database_exceptions(self) -> "MysqlConnectorSyncExceptionHandler":
         return MysqlConnectorSyncExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "MysqlConnectorSyncStatementTimeout":
+        return MysqlConnectorSyncStatementTimeout(connection, timeout)
+
     def select_to_storage(
         self,
         statement: "SQL | str",
@@ -254,10 +241,15 @@ class MysqlConnectorSyncDriver(SyncDriverAdapterBase):
         **kwargs: Any,
     ) -> "StorageBridgeJob":
         self._require_capability("arrow_export_enabled")
-        arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        pipeline = self._storage_pipeline()
-        telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=pipeline
+        telemetry_payload = self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -325,8 +317,20 @@ class MysqlConnectorSyncDriver(SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     @property
@@ -371,6 +375,20 @@ class MysqlConnectorAsyncExceptionHandler(BaseAsyncExceptionHandler):
         return False
 
 
+class MysqlConnectorAsyncStatementTimeout(AsyncStatementTimeout):
+    """Statement timeout enforced by the server through a ``MAX_EXECUTION_TIME`` optimizer hint.
+
+    The driver adds the hint to ``SELECT`` statements, the only kind MySQL
+    limits, so the session is never modified. The task is not cancelled
+    client-side so the connection protocol stays in sync.
+    """
+
+    __slots__ = ()
+
+    async def run(self, awaitable: "Awaitable[Any]") -> Any:
+        return await awaitable
+
+
 class MysqlConnectorAsyncDriver(AsyncDriverAdapterBase):
     """MySQL/MariaDB database driver using mysql-connector async library."""
 
@@ -393,6 +411,7 @@ class MysqlConnectorAsyncDriver(AsyncDriverAdapterBase):
 
     async def dispatch_execute(self, cursor: Any, statement: "SQL") -> "ExecutionResult":
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        sql = add_max_execution_time_hint(sql, statement.statement_config.statement_timeout)
         await cursor.execute(sql, normalize_execute_parameters(prepared_parameters))
 
         if statement.returns_rows() or getattr(cursor, "with_rows", False):
@@ -401,7 +420,7 @@ class MysqlConnectorAsyncDriver(AsyncDriverAdapterBase):
             row_plan = resolve_row_plan(description, MYSQLCONNECTOR_JSON_TYPE_CODES)
             deserializer = cast("Callable[[Any], Any]", self.driver_features.get("json_deserializer", from_json))
             rows, column_names, row_format = collect_rows(fetched_data, row_plan, deserializer, logger=logger)
-            column_types = _resolve_column_types(description)
+            column_types = resolve_column_types(description)
 
             return self.create_execution_result(
                 cursor,
@@ -473,6 +492,7 @@ class MysqlConnectorAsyncDriver(AsyncDriverAdapterBase):
         if not statement.returns_rows():
             return None
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        sql = add_max_execution_time_hint(sql, statement.statement_config.statement_timeout)
         cursor_options = cast("dict[str, Any]", self.driver_features.get("cursor_options") or {})
         return AsyncRowStream(
             MysqlConnectorAsyncStreamSource(
@@ -483,6 +503,9 @@ class MysqlConnectorAsyncDriver(AsyncDriverAdapterBase):
     def handle_database_exceptions(self) -> "MysqlConnectorAsyncExceptionHandler":
         return MysqlConnectorAsyncExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "MysqlConnectorAsyncStatementTimeout":
+        return MysqlConnectorAsyncStatementTimeout(connection, timeout)
+
     async def select_to_storage(
         self,
         statement: "SQL | str",
@@ -496,10 +519,15 @@ class MysqlConnectorAsyncDriver(AsyncDriverAdapterBase):
         **kwargs: Any,
     ) -> "StorageBridgeJob":
         self._require_capability("arrow_export_enabled")
-        arrow_result = await self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        async_pipeline = self._storage_pipeline()
-        telemetry_payload = await self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=async_pipeline
+        telemetry_payload = await self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -567,8 +595,22 @@ class MysqlConnectorAsyncDriver(AsyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
-        arrow_table, inbound = await self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return await self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = await self._read_storage_arrow(
+            source, file_format=file_format, columns=columns, filter=filter
+        )
         return await self.load_from_arrow(
             table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound
         )
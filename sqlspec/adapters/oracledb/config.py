@@ -41,6 +41,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from sqlspec.core import StatementConfig
+    from sqlspec.observability import PoolGauges
 
 
 __all__ = (
@@ -361,6 +362,19 @@ class OracleSyncConfig(SyncDatabaseConfig[OracleSyncConnection, "OracleSyncConne
             self.connection_instance = self.create_pool()
         return self.connection_instance
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        opened = pool.opened
+        busy = pool.busy
+        return {"size": opened, "checked_out": busy, "idle": opened - busy, "max_size": pool.max}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         """Get the signature namespace for OracleDB types.
 
@@ -564,6 +578,19 @@ class OracleAsyncConfig(AsyncDatabaseConfig[OracleAsyncConnection, "OracleAsyncC
             self.connection_instance = await self.create_pool()
         return self.connection_instance
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        opened = pool.opened
+        busy = pool.busy
+        return {"size": opened, "checked_out": busy, "idle": opened - busy, "max_size": pool.max}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         """Get the signature namespace for OracleAsyncConfig types.
 
@@ -670,6 +670,11 @@ class OracleSyncStreamSource:
             cast("Any", cursor).execute(self._sql, parameters or {}, **fetch_kwargs)
         self._driver._check_pending_exception(handler)
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+        if self._cursor is not None:
+            self._cursor.arraysize = chunk_size
+
     def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         cursor = self._cursor
@@ -740,6 +745,11 @@ class OracleAsyncStreamSource:
         )
         await cast("Any", cursor).execute(self._sql, parameters or {}, **fetch_kwargs)
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+        if self._cursor is not None:
+            self._cursor.arraysize = chunk_size
+
     async def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         cursor = self._cursor
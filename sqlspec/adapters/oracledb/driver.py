@@ -61,11 +61,13 @@ from sqlspec.core.explain import ORACLE_EXPLAIN_PREFIX, ORACLE_MANAGED_EXPLAIN_M
 from sqlspec.driver import (
     AsyncDriverAdapterBase,
     AsyncRowStream,
+    AsyncStatementTimeout,
     BaseAsyncExceptionHandler,
     BaseSyncExceptionHandler,
     StackExecutionObserver,
     SyncDriverAdapterBase,
     SyncRowStream,
+    SyncStatementTimeout,
     describe_stack_statement,
     hash_stack_operations,
 )
@@ -77,22 +79,31 @@ from sqlspec.utils.type_guards import has_pipeline_capability, is_async_readable
 from sqlspec.utils.uuids import uuid4
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Awaitable, Iterator, Sequence
 
     from sqlspec.builder import QueryBuilder
     from sqlspec.core import ArrowResult, Statement, StatementFilter
     from sqlspec.core.stack import StackOperation
-    from sqlspec.driver import ExecutionResult
+    from sqlspec.driver import AdaptiveChunkSizing, ExecutionResult
     from sqlspec.storage import StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
-    from sqlspec.typing import ArrowRecordBatch, ArrowReturnFormat, ArrowSchema, SchemaT, StatementParameters
+    from sqlspec.typing import (
+        ArrowRecordBatch,
+        ArrowReturnFormat,
+        ArrowSchema,
+        ArrowTable,
+        SchemaT,
+        StatementParameters,
+    )
 
 __all__ = (
     "OracleAsyncDriver",
     "OracleAsyncExceptionHandler",
     "OracleAsyncSessionContext",
+    "OracleAsyncStatementTimeout",
     "OracleSyncDriver",
     "OracleSyncExceptionHandler",
     "OracleSyncSessionContext",
+    "OracleSyncStatementTimeout",
 )
 
 
@@ -312,6 +323,22 @@ class OracleAsyncExceptionHandler(BaseAsyncExceptionHandler):
         return False
 
 
+class OracleSyncStatementTimeout(SyncStatementTimeout):
+    """Statement timeout enforced through ``Connection.call_timeout``.
+
+    The previous ``call_timeout`` is restored once the statement finishes.
+    """
+
+    __slots__ = ("_previous_call_timeout",)
+
+    def arm(self) -> None:
+        self._previous_call_timeout = self.connection.call_timeout
+        self.connection.call_timeout = self.timeout_milliseconds
+
+    def disarm(self) -> None:
+        self.connection.call_timeout = self._previous_call_timeout
+
+
 class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
     """Synchronous Oracle Database driver.
 
@@ -564,8 +591,11 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT]",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "SyncRowStream[SchemaT]": ...
 
@@ -577,8 +607,11 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: None = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "SyncRowStream[dict[str, Any]]": ...
 
@@ -589,8 +622,11 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT] | None" = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "SyncRowStream[SchemaT] | SyncRowStream[dict[str, Any]]":
         """Execute a query and stream rows in chunks with Oracle fetch tuning."""
@@ -598,17 +634,31 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         if chunk_size < 1:
             msg = "chunk_size must be greater than or equal to 1"
             raise ValueError(msg)
+        if prefetch < 0:
+            msg = "prefetch must be greater than or equal to 0"
+            raise ValueError(msg)
         config = statement_config or self.statement_config
+        if timeout is not None:
+            config = config.replace(statement_timeout=timeout)
         sql_statement = self.prepare_statement(statement, parameters, statement_config=config, kwargs=kwargs)
         stream = self.dispatch_select_stream(sql_statement, chunk_size, fetch_lobs=fetch_lobs)
         if stream is not None:
-            return stream._with_schema_type(schema_type)
+            if config.statement_timeout is not None:
+                stream = stream._with_timeout(self._create_statement_timeout(self.connection, config.statement_timeout))
+            return (
+                stream
+                ._with_adaptive_chunks(adaptive_chunks, chunk_size)
+                ._with_prefetch(prefetch)
+                ._with_schema_type(schema_type)
+            )
         return super().select_stream(
             sql_statement,
             schema_type=schema_type,
             statement_config=config,
             chunk_size=chunk_size,
             native_only=native_only,
+            prefetch=prefetch,
+            adaptive_chunks=adaptive_chunks,
         )
 
     def dispatch_select_stream(
@@ -625,6 +675,9 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         """Handle database-specific exceptions and wrap them appropriately."""
         return OracleSyncExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "OracleSyncStatementTimeout":
+        return OracleSyncStatementTimeout(connection, timeout)
+
     # ─────────────────────────────────────────────────────────────────────────────
     # ARROW API METHODS
     # ─────────────────────────────────────────────────────────────────────────────
@@ -635,6 +688,7 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         return_format: "ArrowReturnFormat" = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -653,6 +707,7 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
             statement: SQL query string, Statement, or QueryBuilder
             *parameters: Query parameters (same format as execute()/select())
             statement_config: Optional statement configuration override
+            timeout: Statement timeout in seconds (overrides ``statement_config``)
             return_format: "table" for pyarrow.Table (default), "batch" for RecordBatch,
                 "batches" for list of RecordBatch, "reader" for RecordBatchReader
             native_only: If True, raise error if native Arrow is unavailable
@@ -663,6 +718,21 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         Returns:
             ArrowResult containing pyarrow.Table or RecordBatch
         """
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
+            return self._call_with_statement_timeout(
+                timeout,
+                lambda: self.select_to_arrow(
+                    statement,
+                    *parameters,
+                    statement_config=statement_config,
+                    return_format=return_format,
+                    native_only=native_only,
+                    batch_size=batch_size,
+                    arrow_schema=arrow_schema,
+                    **kwargs,
+                ),
+            )
         ensure_pyarrow()
 
         import pyarrow as pa
@@ -753,10 +823,15 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
     ) -> "StorageBridgeJob":
         """Execute a query and stream Arrow-formatted output to storage (sync)."""
         self._require_capability("arrow_export_enabled")
-        arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        sync_pipeline = self._storage_pipeline()
-        telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline
+        telemetry_payload = self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -814,9 +889,21 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts into Oracle."""
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     # ─────────────────────────────────────────────────────────────────────────────
@@ -948,34 +1035,57 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         batch_size: int | None,
         arrow_schema: "ArrowSchema | None",
     ) -> "tuple[list[ArrowRecordBatch], ArrowSchema | None]":
-        import pyarrow as pa
-
-        params = parameters if parameters is not None else []
         record_batches: list[ArrowRecordBatch] = []
         batch_schema: ArrowSchema | None = None
+        for oracle_df in self._open_df_batches(sql, parameters, batch_size):
+            batch_table = self._oracle_df_to_table(oracle_df, arrow_schema)
+            if batch_schema is None:
+                batch_schema = batch_table.schema
+            record_batches.extend(batch_table.to_batches())
+        return record_batches, batch_schema
+
+    def dispatch_arrow_stream(
+        self, statement: "SQL", batch_size: int, arrow_schema: Any = None
+    ) -> "Iterator[ArrowRecordBatch] | None":
+        """Stream ``fetch_df_batches`` DataFrames as RecordBatches when the connection supports it."""
+        if not (
+            statement.returns_rows() and statement.operation_type == "SELECT" and supports_df_batches(self.connection)
+        ):
+            return super().dispatch_arrow_stream(statement, batch_size, arrow_schema)
+        sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        return self._iter_arrow_record_batches(sql, prepared_parameters, batch_size, arrow_schema)
+
+    def _iter_arrow_record_batches(
+        self, sql: str, parameters: "StatementParameters | None", batch_size: int, arrow_schema: "ArrowSchema | None"
+    ) -> "Iterator[ArrowRecordBatch]":
+        for oracle_df in self._open_df_batches(sql, parameters, batch_size):
+            yield from self._oracle_df_to_table(oracle_df, arrow_schema).to_batches()
+
+    def _open_df_batches(self, sql: str, parameters: "StatementParameters | None", batch_size: int | None) -> Any:
+        params = parameters if parameters is not None else []
         fetch_kwargs = build_arrow_fetch_kwargs(self.driver_features)
         try:
-            oracle_dfs = self.connection.fetch_df_batches(
+            return self.connection.fetch_df_batches(
                 statement=sql, parameters=params, size=batch_size or 1000, **fetch_kwargs
             )
         except TypeError as exc:
             retry_kwargs = _retry_arrow_without_fetch_lobs(exc, fetch_kwargs)
             if retry_kwargs is None:
                 raise
-            oracle_dfs = self.connection.fetch_df_batches(
+            return self.connection.fetch_df_batches(
                 statement=sql, parameters=params, size=batch_size or 1000, **retry_kwargs
             )
-        for oracle_df in oracle_dfs:
-            batch_table = pa.table(oracle_df)
-            column_names = normalize_column_names(batch_table.column_names, self.driver_features)
-            if column_names != batch_table.column_names:
-                batch_table = batch_table.rename_columns(column_names)
-            if arrow_schema is not None:
-                batch_table = batch_table.cast(arrow_schema)
-            if batch_schema is None:
-                batch_schema = batch_table.schema
-            record_batches.extend(batch_table.to_batches())
-        return record_batches, batch_schema
+
+    def _oracle_df_to_table(self, oracle_df: Any, arrow_schema: "ArrowSchema | None") -> "ArrowTable":
+        import pyarrow as pa
+
+        batch_table = pa.table(oracle_df)
+        column_names = normalize_column_names(batch_table.column_names, self.driver_features)
+        if column_names != batch_table.column_names:
+            batch_table = batch_table.rename_columns(column_names)
+        if arrow_schema is not None:
+            batch_table = batch_table.cast(arrow_schema)
+        return batch_table
 
     def _execute_stack_native(self, stack: "StatementStack", *, continue_on_error: bool) -> "tuple[StackResult, ...]":
 
@@ -1025,6 +1135,26 @@ class OracleSyncDriver(OraclePipelineMixin, SyncDriverAdapterBase):
         return False
 
 
+class OracleAsyncStatementTimeout(AsyncStatementTimeout):
+    """Statement timeout enforced through ``AsyncConnection.call_timeout``.
+
+    The awaiting task is not cancelled client-side; the driver aborts the round
+    trip and the previous ``call_timeout`` is restored afterwards.
+    """
+
+    __slots__ = ("_previous_call_timeout",)
+
+    async def arm(self) -> None:
+        self._previous_call_timeout = self.connection.call_timeout
+        self.connection.call_timeout = self.timeout_milliseconds
+
+    async def disarm(self) -> None:
+        self.connection.call_timeout = self._previous_call_timeout
+
+    async def run(self, awaitable: "Awaitable[Any]") -> Any:
+        return await awaitable
+
+
 class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
     """Asynchronous Oracle Database driver.
 
@@ -1282,8 +1412,11 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT]",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[SchemaT]": ...
 
@@ -1295,8 +1428,11 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: None = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[dict[str, Any]]": ...
 
@@ -1307,8 +1443,11 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT] | None" = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[SchemaT] | AsyncRowStream[dict[str, Any]]":
         """Execute a query and stream rows in chunks with Oracle fetch tuning."""
@@ -1316,17 +1455,31 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         if chunk_size < 1:
             msg = "chunk_size must be greater than or equal to 1"
             raise ValueError(msg)
+        if prefetch < 0:
+            msg = "prefetch must be greater than or equal to 0"
+            raise ValueError(msg)
         config = statement_config or self.statement_config
+        if timeout is not None:
+            config = config.replace(statement_timeout=timeout)
         sql_statement = self.prepare_statement(statement, parameters, statement_config=config, kwargs=kwargs)
         stream = self.dispatch_select_stream(sql_statement, chunk_size, fetch_lobs=fetch_lobs)
         if stream is not None:
-            return stream._with_schema_type(schema_type)
+            if config.statement_timeout is not None:
+                stream = stream._with_timeout(self._create_statement_timeout(self.connection, config.statement_timeout))
+            return (
+                stream
+                ._with_adaptive_chunks(adaptive_chunks, chunk_size)
+                ._with_prefetch(prefetch)
+                ._with_schema_type(schema_type)
+            )
         return super().select_stream(
             sql_statement,
             schema_type=schema_type,
             statement_config=config,
             chunk_size=chunk_size,
             native_only=native_only,
+            prefetch=prefetch,
+            adaptive_chunks=adaptive_chunks,
         )
 
     def dispatch_select_stream(
@@ -1343,6 +1496,9 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         """Handle database-specific exceptions and wrap them appropriately."""
         return OracleAsyncExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "OracleAsyncStatementTimeout":
+        return OracleAsyncStatementTimeout(connection, timeout)
+
     # ─────────────────────────────────────────────────────────────────────────────
     # ARROW API METHODS
     # ─────────────────────────────────────────────────────────────────────────────
@@ -1353,6 +1509,7 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         return_format: "ArrowReturnFormat" = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -1371,6 +1528,7 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
             statement: SQL query string, Statement, or QueryBuilder
             *parameters: Query parameters (same format as execute()/select())
             statement_config: Optional statement configuration override
+            timeout: Statement timeout in seconds (overrides ``statement_config``)
             return_format: "table" for pyarrow.Table (default), "batch" for RecordBatch,
                 "batches" for list of RecordBatch, "reader" for RecordBatchReader
             native_only: If True, raise error if native Arrow is unavailable
@@ -1381,6 +1539,21 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         Returns:
             ArrowResult containing pyarrow.Table or RecordBatch
         """
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
+            return await self._call_with_statement_timeout(
+                timeout,
+                lambda: self.select_to_arrow(
+                    statement,
+                    *parameters,
+                    statement_config=statement_config,
+                    return_format=return_format,
+                    native_only=native_only,
+                    batch_size=batch_size,
+                    arrow_schema=arrow_schema,
+                    **kwargs,
+                ),
+            )
         ensure_pyarrow()
 
         import pyarrow as pa
@@ -1473,10 +1646,15 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
     ) -> "StorageBridgeJob":
         """Execute a query and write Arrow-compatible output to storage (async)."""
         self._require_capability("arrow_export_enabled")
-        arrow_result = await self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        async_pipeline = self._storage_pipeline()
-        telemetry_payload = await self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=async_pipeline
+        telemetry_payload = await self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -1534,9 +1712,23 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Asynchronously load staged artifacts into Oracle."""
-        arrow_table, inbound = await self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return await self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = await self._read_storage_arrow(
+            source, file_format=file_format, columns=columns, filter=filter
+        )
         return await self.load_from_arrow(
             table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound
         )
@@ -1679,34 +1871,58 @@ class OracleAsyncDriver(OraclePipelineMixin, AsyncDriverAdapterBase):
         batch_size: int | None,
         arrow_schema: "ArrowSchema | None",
     ) -> "tuple[list[ArrowRecordBatch], ArrowSchema | None]":
-        import pyarrow as pa
-
-        params = parameters if parameters is not None else []
         record_batches: list[ArrowRecordBatch] = []
         batch_schema: ArrowSchema | None = None
+        async for oracle_df in self._open_df_batches(sql, parameters, batch_size):
+            batch_table = self._oracle_df_to_table(oracle_df, arrow_schema)
+            if batch_schema is None:
+                batch_schema = batch_table.schema
+            record_batches.extend(batch_table.to_batches())
+        return record_batches, batch_schema
+
+    async def dispatch_arrow_stream(
+        self, statement: "SQL", batch_size: int, arrow_schema: Any = None
+    ) -> "AsyncIterator[ArrowRecordBatch] | None":
+        """Stream ``fetch_df_batches`` DataFrames as RecordBatches when the connection supports it."""
+        if not (
+            statement.returns_rows() and statement.operation_type == "SELECT" and supports_df_batches(self.connection)
+        ):
+            return await super().dispatch_arrow_stream(statement, batch_size, arrow_schema)
+        sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        return self._iter_arrow_record_batches(sql, prepared_parameters, batch_size, arrow_schema)
+
+    async def _iter_arrow_record_batches(
+        self, sql: str, parameters: "StatementParameters | None", batch_size: int, arrow_schema: "ArrowSchema | None"
+    ) -> "AsyncIterator[ArrowRecordBatch]":
+        async for oracle_df in self._open_df_batches(sql, parameters, batch_size):
+            for batch in self._oracle_df_to_table(oracle_df, arrow_schema).to_batches():
+                yield batch
+
+    def _open_df_batches(self, sql: str, parameters: "StatementParameters | None", batch_size: int | None) -> Any:
+        params = parameters if parameters is not None else []
         fetch_kwargs = build_arrow_fetch_kwargs(self.driver_features)
         try:
-            oracle_dfs = self.connection.fetch_df_batches(
+            return self.connection.fetch_df_batches(
                 statement=sql, parameters=params, size=batch_size or 1000, **fetch_kwargs
             )
         except TypeError as exc:
             retry_kwargs = _retry_arrow_without_fetch_lobs(exc, fetch_kwargs)
             if retry_kwargs is None:
                 raise
-            oracle_dfs = self.connection.fetch_df_batches(
+            return self.connection.fetch_df_batches(
                 statement=sql, parameters=params, size=batch_size or 1000, **retry_kwargs
             )
-        async for oracle_df in oracle_dfs:
-            batch_table = pa.table(oracle_df)
-            column_names = normalize_column_names(batch_table.column_names, self.driver_features)
-            if column_names != batch_table.column_names:
-                batch_table = batch_table.rename_columns(column_names)
-            if arrow_schema is not None:
-                batch_table = batch_table.cast(arrow_schema)
-            if batch_schema is None:
-                batch_schema = batch_table.schema
-            record_batches.extend(batch_table.to_batches())
-        return record_batches, batch_schema
+
+    def _oracle_df_to_table(self, oracle_df: Any, arrow_schema: "ArrowSchema | None") -> "ArrowTable":
+        import pyarrow as pa
+
+        batch_table = pa.table(oracle_df)
+        column_names = normalize_column_names(batch_table.column_names, self.driver_features)
+        if column_names != batch_table.column_names:
+            batch_table = batch_table.rename_columns(column_names)
+        if arrow_schema is not None:
+            batch_table = batch_table.cast(arrow_schema)
+        return batch_table
 
     async def _execute_stack_native(
         self, stack: "StatementStack", *, continue_on_error: bool
@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     from psqlpy import ConnectionPool
 
     from sqlspec.core import StatementConfig
+    from sqlspec.observability import PoolGauges
 
 __all__ = ("PsqlpyConfig", "PsqlpyConnectionParams", "PsqlpyCursor", "PsqlpyDriverFeatures", "PsqlpyPoolParams")
 
@@ -115,6 +116,10 @@ class PsqlpyDriverFeatures(TypedDict):
      - "notify_queue": Durable queue plus a PostgreSQL notification wakeup hint
      - "poll_queue": Durable queue discovered by polling
      Defaults to "notify".
+    enable_copy_arrow_import: Load Arrow data in load_from_arrow/load_from_storage through
+     ``COPY ... FROM STDIN (FORMAT BINARY)`` encoded straight from the Arrow buffers.
+     Defaults to True. Target columns with numeric, json, array or other unsupported types,
+     and Arrow types that do not match the target column, use the row path.
     """
 
     enable_cast_detection: NotRequired[bool]
@@ -125,6 +130,7 @@ class PsqlpyDriverFeatures(TypedDict):
     on_connection_create: "NotRequired[Callable[[PsqlpyConnection], Awaitable[None]]]"
     enable_events: NotRequired[bool]
     events_backend: NotRequired[Literal["notify", "notify_queue", "poll_queue"]]
+    enable_copy_arrow_import: NotRequired[bool]
 
 
 class _PsqlpySessionFactory(AsyncPoolSessionFactory):
@@ -319,7 +325,7 @@ class PsqlpyConfig(AsyncDatabaseConfig[PsqlpyConnection, "ConnectionPool", Psqlp
         """
         factory = _PsqlpySessionFactory(self)
         return PsqlpySessionContext(
-            acquire_connection=factory.acquire_connection,
+            acquire_connection=self._guard_acquire(factory.acquire_connection),
             release_connection=factory.release_connection,
             statement_config=statement_config
             or (lambda: resolve_runtime_statement_config(None, self.statement_config, default_statement_config)),
@@ -337,6 +343,34 @@ class PsqlpyConfig(AsyncDatabaseConfig[PsqlpyConnection, "ConnectionPool", Psqlp
             self.connection_instance = await self.create_pool()
         return self.connection_instance
 
+    def pool_spare_capacity(self) -> int:
+        """Return how many connections the pool can hand out without queuing.
+
+        Returns:
+            Idle plus growable connection slots, or 0 while callers are already waiting.
+        """
+        pool = self.connection_instance
+        if pool is None or pool.status().waiting > 0:
+            return 0
+        return super().pool_spare_capacity()
+
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        status = pool.status()
+        return {
+            "size": status.size,
+            "checked_out": status.size - status.available,
+            "idle": status.available,
+            "max_size": status.max_size,
+        }
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         """Get the signature namespace for Psqlpy types.
 
@@ -56,6 +56,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
 
 __all__ = (
+    "COPY_TARGET_TYPES_SQL",
     "PsqlpyStreamSource",
     "apply_driver_features",
     "build_connection_config",
@@ -102,6 +103,10 @@ PSQLPY_STATUS_REGEX: "re.Pattern[str]" = re.compile(r"^([A-Z]+)(?:\s+(\d+))?\s+(
 _DML_COUNT_CTE_ALIAS: Final = "_sqlspec_affected"
 _DML_COUNT_COLUMN: Final = "_sqlspec_rows_affected"
 _DML_COUNT_QUERY_CACHE_SIZE: Final = 1024
+COPY_TARGET_TYPES_SQL: Final = (
+    "SELECT attname::text AS name, atttypid::int8 AS type_oid FROM pg_catalog.pg_attribute "
+    "WHERE attrelid = to_regclass($1::text) AND attnum > 0 AND NOT attisdropped"
+)
 
 logger = get_logger("sqlspec.adapters.psqlpy.core")
 _NUMERIC_COERCE_TYPES: "tuple[type[Any], ...]" = (float, decimal.Decimal, list, tuple, dict)
@@ -236,6 +241,9 @@ class PsqlpyStreamSource:
                 await transaction.rollback()
             raise
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     async def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         query_result = await self._driver._run_with_exception_handler(handler, self._cursor.fetchmany, self._chunk_size)
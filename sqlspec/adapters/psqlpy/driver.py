@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any, cast
 from sqlspec.adapters.psqlpy._typing import PsqlpyCursor, PsqlpyDatabaseError, PsqlpyError, PsqlpySessionContext
 from sqlspec.adapters.psqlpy.core import (
     _DML_COUNT_COLUMN,
+    COPY_TARGET_TYPES_SQL,
     PsqlpyStreamSource,
     _dml_count_query,
     build_insert_statement,
@@ -32,6 +33,7 @@ from sqlspec.core import SQL, StatementConfig, get_cache_config, register_driver
 from sqlspec.driver import AsyncDriverAdapterBase, AsyncRowStream, BaseAsyncExceptionHandler
 from sqlspec.exceptions import SQLSpecError
 from sqlspec.utils.logging import get_logger
+from sqlspec.utils.pgcopy import create_pgcopy_encoder, iter_pgcopy_chunks
 from sqlspec.utils.text import normalize_identifier, quote_identifier
 
 if TYPE_CHECKING:
@@ -41,6 +43,7 @@ if TYPE_CHECKING:
     from sqlspec.core import ArrowResult, SQLResult
     from sqlspec.driver import ExecutionResult
     from sqlspec.storage import StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
+    from sqlspec.typing import ArrowTable
 
 __all__ = ("PsqlpyCursor", "PsqlpyDriver", "PsqlpyExceptionHandler", "PsqlpySessionContext")
 
@@ -295,10 +298,15 @@ class PsqlpyDriver(AsyncDriverAdapterBase):
         """Execute a query and stream Arrow results to a storage backend."""
 
         self._require_capability("arrow_export_enabled")
-        arrow_result = await self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        async_pipeline = self._storage_pipeline()
-        telemetry_payload = await self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=async_pipeline
+        telemetry_payload = await self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -324,6 +332,49 @@ class PsqlpyDriver(AsyncDriverAdapterBase):
             if exc_handler.pending_exception is not None:
                 raise exc_handler.pending_exception from None
 
+        if not await self._copy_arrow_binary(table, arrow_table):
+            await self._copy_arrow_rows(table, arrow_table)
+
+        telemetry_payload = self._ingest_telemetry(arrow_table)
+        telemetry_payload["destination"] = table
+        self._attach_partition_telemetry(telemetry_payload, partitioner)
+        return self._storage_job(telemetry_payload, telemetry)
+
+    async def _copy_arrow_binary(self, table: str, arrow_table: "ArrowTable") -> bool:
+        """Write Arrow data through binary COPY without building Python rows.
+
+        Returns False when ``enable_copy_arrow_import`` is off or a column needs the
+        row path (unsupported target type or Arrow type).
+        """
+        if not self.driver_features.get("enable_copy_arrow_import", True):
+            return False
+        if arrow_table.num_rows == 0:
+            return True
+        schema_name, table_name = split_schema_and_table(table)
+        exc_handler = self.handle_database_exceptions()
+        async with exc_handler, self.with_cursor(self.connection) as cursor:
+            type_rows, _ = collect_rows(await cursor.fetch(COPY_TARGET_TYPES_SQL, [format_table_identifier(table)]))
+        if exc_handler.pending_exception is not None:
+            raise exc_handler.pending_exception from None
+        encoder = create_pgcopy_encoder(arrow_table.schema, [(row["name"], row["type_oid"]) for row in type_rows])
+        if encoder is None:
+            return False
+        copy_kwargs: dict[str, Any] = {"columns": encoder.column_names}
+        if schema_name:
+            copy_kwargs["schema_name"] = schema_name
+        exc_handler = self.handle_database_exceptions()
+        async with exc_handler, self.with_cursor(self.connection) as cursor:
+            copy_operation = cursor.binary_copy_to_table(
+                b"".join(iter_pgcopy_chunks(arrow_table, encoder)), table_name, **copy_kwargs
+            )
+            if inspect.isawaitable(copy_operation):
+                await copy_operation
+        if exc_handler.pending_exception is not None:
+            raise exc_handler.pending_exception from None
+        return True
+
+    async def _copy_arrow_rows(self, table: str, arrow_table: "ArrowTable") -> None:
+        """Write Arrow data from Python rows, falling back to INSERT when COPY is rejected."""
         columns, records = self._arrow_table_to_rows(arrow_table)
         if records:
             schema_name, table_name = split_schema_and_table(table)
@@ -355,11 +406,6 @@ class PsqlpyDriver(AsyncDriverAdapterBase):
             if exc_handler.pending_exception is not None:
                 raise exc_handler.pending_exception from None
 
-        telemetry_payload = self._ingest_telemetry(arrow_table)
-        telemetry_payload["destination"] = table
-        self._attach_partition_telemetry(telemetry_payload, partitioner)
-        return self._storage_job(telemetry_payload, telemetry)
-
     async def load_from_storage(
         self,
         table: str,
@@ -368,10 +414,24 @@ class PsqlpyDriver(AsyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts from storage using the storage bridge pipeline."""
 
-        arrow_table, inbound = await self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return await self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = await self._read_storage_arrow(
+            source, file_format=file_format, columns=columns, filter=filter
+        )
         return await self.load_from_arrow(
             table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound
         )
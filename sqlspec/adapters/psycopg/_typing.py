@@ -14,6 +14,7 @@ from psycopg.sql import Composed as PsycopgComposed
 from psycopg.sql import Identifier as PsycopgIdentifier
 
 if TYPE_CHECKING:
+    from collections import OrderedDict
     from collections.abc import Callable
     from types import TracebackType
     from typing import TypeAlias
@@ -95,6 +96,7 @@ class PsycopgPipelineDriver(Protocol):
     """Protocol for psycopg pipeline driver methods used in stack execution."""
 
     statement_config: "StatementConfig"
+    _copy_columns: "OrderedDict[str, list[tuple[str, int]]]"
 
     def prepare_statement(
         self,
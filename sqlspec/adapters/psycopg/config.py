@@ -47,6 +47,8 @@ if TYPE_CHECKING:
     from psycopg_pool.abc import AsyncConnectFailedCB, AsyncConnectionCB, ConnectFailedCB, ConnectionCB
 
     from sqlspec.core import StatementConfig
+    from sqlspec.core.pool_sizing import PoolAutoscaler
+    from sqlspec.observability import PoolGauges
 
 __all__ = (
     "PsycopgAsyncConfig",
@@ -148,6 +150,14 @@ class PsycopgDriverFeatures(TypedDict):
     enable_alloydb_iam_auth: Enable AlloyDB IAM database authentication for sync connector connections.
      Defaults to False.
     alloydb_ip_type: AlloyDB connector IP type. Defaults to PRIVATE.
+    enable_copy_arrow_export: Export SELECT results for select_to_arrow/select_to_storage
+     through ``COPY ... TO STDOUT (FORMAT BINARY)`` decoded straight into Arrow batches.
+     Defaults to True. Results with numeric, json, array or other unsupported column types
+     use the row path.
+    enable_copy_arrow_import: Load Arrow data in load_from_arrow/load_from_storage through
+     ``COPY ... FROM STDIN (FORMAT BINARY)`` encoded straight from the Arrow buffers.
+     Defaults to True. Target columns with numeric, json, array or other unsupported types,
+     and Arrow types that do not match the target column, use the row path.
     """
 
     enable_pgvector: NotRequired[bool]
@@ -161,6 +171,8 @@ class PsycopgDriverFeatures(TypedDict):
     alloydb_instance_uri: NotRequired[str]
     enable_alloydb_iam_auth: NotRequired[bool]
     alloydb_ip_type: NotRequired[str]
+    enable_copy_arrow_export: NotRequired[bool]
+    enable_copy_arrow_import: NotRequired[bool]
 
 
 def _make_alloydb_connection_class(
@@ -203,6 +215,14 @@ def _make_alloydb_connection_class(
     return _AlloyDBPsycopgConnection
 
 
+def _apply_autoscaled_size(pool_parameters: "dict[str, Any]", autoscaler: "PoolAutoscaler | None") -> None:
+    """Start the pool at the autoscaler's size; ``min_size`` never exceeds it."""
+    if autoscaler is None:
+        return
+    pool_parameters["max_size"] = autoscaler.size
+    pool_parameters["min_size"] = min(pool_parameters["min_size"], autoscaler.size)
+
+
 class PsycopgSyncConnectionContext(SyncPoolConnectionContext):
     """Context manager for Psycopg connections."""
 
@@ -266,6 +286,7 @@ class PsycopgSyncConfig(SyncDatabaseConfig[PsycopgSyncConnection, ConnectionPool
     supports_native_parquet_export: "ClassVar[bool]" = True
     supports_native_parquet_import: "ClassVar[bool]" = True
     supports_native_row_streaming: "ClassVar[bool]" = True
+    supports_pool_resizing: "ClassVar[bool]" = True
     _connection_context_class: "ClassVar[type[PsycopgSyncConnectionContext]]" = PsycopgSyncConnectionContext
     _session_factory_class: "ClassVar[type[_PsycopgSyncSessionConnectionHandler]]" = (
         _PsycopgSyncSessionConnectionHandler
@@ -399,6 +420,7 @@ class PsycopgSyncConfig(SyncDatabaseConfig[PsycopgSyncConnection, ConnectionPool
         }
 
         pool_parameters["configure"] = all_config.pop("configure", self._configure_connection)
+        _apply_autoscaled_size(pool_parameters, self._pool_autoscaler)
 
         pool_parameters = {k: v for k, v in pool_parameters.items() if v is not None}
 
@@ -419,6 +441,15 @@ class PsycopgSyncConfig(SyncDatabaseConfig[PsycopgSyncConnection, ConnectionPool
 
         return pool
 
+    def _resize_pool(self, size: int) -> None:
+        """Resize the live pool for adaptive pool sizing.
+
+        Args:
+            size: New maximum number of connections.
+        """
+        if self.connection_instance is not None:
+            self.connection_instance.resize(min(self.connection_config.get("min_size", 4), size), size)
+
     def _configure_connection(self, conn: "PsycopgSyncConnection") -> None:
         autocommit_setting = self.connection_config.get("autocommit")
         if autocommit_setting is not None:
@@ -489,8 +520,8 @@ class PsycopgSyncConfig(SyncDatabaseConfig[PsycopgSyncConnection, ConnectionPool
         handler = _PsycopgSyncSessionConnectionHandler(self)
 
         return PsycopgSyncSessionContext(
-            acquire_connection=handler.acquire_connection,
-            release_connection=handler.release_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
+            release_connection=self._guard_release(handler.release_connection),
             statement_config=statement_config
             or (lambda: resolve_runtime_statement_config(None, self.statement_config, default_statement_config)),
             driver_features=self.driver_features,
@@ -507,6 +538,20 @@ class PsycopgSyncConfig(SyncDatabaseConfig[PsycopgSyncConnection, ConnectionPool
             self.connection_instance = self.create_pool()
         return self.connection_instance
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        idle = stats.get("pool_available", 0)
+        return {"size": size, "checked_out": size - idle, "idle": idle, "max_size": pool.max_size}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         """Get the signature namespace for Psycopg types.
 
@@ -595,6 +640,7 @@ class PsycopgAsyncConfig(AsyncDatabaseConfig[PsycopgAsyncConnection, AsyncConnec
     supports_native_parquet_export: ClassVar[bool] = True
     supports_native_parquet_import: ClassVar[bool] = True
     supports_native_row_streaming: ClassVar[bool] = True
+    supports_pool_resizing: ClassVar[bool] = True
     _connection_context_class: "ClassVar[type[PsycopgAsyncConnectionContext]]" = PsycopgAsyncConnectionContext
     _session_factory_class: "ClassVar[type[_PsycopgAsyncSessionConnectionHandler]]" = (
         _PsycopgAsyncSessionConnectionHandler
@@ -675,6 +721,7 @@ class PsycopgAsyncConfig(AsyncDatabaseConfig[PsycopgAsyncConnection, AsyncConnec
         pool_parameters["open"] = False if open_pool is True else open_pool
 
         pool_parameters["configure"] = all_config.pop("configure", self._configure_async_connection)
+        _apply_autoscaled_size(pool_parameters, self._pool_autoscaler)
 
         pool_parameters = {k: v for k, v in pool_parameters.items() if v is not None}
 
@@ -691,6 +738,17 @@ class PsycopgAsyncConfig(AsyncDatabaseConfig[PsycopgAsyncConnection, AsyncConnec
 
         return pool
 
+    def _resize_pool(self, size: int) -> "Awaitable[None] | None":
+        """Resize the live pool for adaptive pool sizing.
+
+        Args:
+            size: New maximum number of connections.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        return pool.resize(min(self.connection_config.get("min_size", 4), size), size)
+
     async def _configure_async_connection(self, conn: "PsycopgAsyncConnection") -> None:
         autocommit_setting = self.connection_config.get("autocommit")
         if autocommit_setting is not None:
@@ -744,6 +802,20 @@ class PsycopgAsyncConfig(AsyncDatabaseConfig[PsycopgAsyncConnection, AsyncConnec
             self.connection_instance = await self.create_pool()
         return cast("PsycopgAsyncConnection", await self.connection_instance.getconn())  # pyright: ignore
 
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None before the pool exists.
+        """
+        pool = self.connection_instance
+        if pool is None:
+            return None
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        idle = stats.get("pool_available", 0)
+        return {"size": size, "checked_out": size - idle, "idle": idle, "max_size": pool.max_size}
+
     def get_signature_namespace(self) -> "dict[str, Any]":
         """Get the signature namespace for PsycopgAsyncConfig types.
 
@@ -779,8 +851,8 @@ class PsycopgAsyncConfig(AsyncDatabaseConfig[PsycopgAsyncConnection, AsyncConnec
         handler = _PsycopgAsyncSessionConnectionHandler(self)
 
         return PsycopgAsyncSessionContext(
-            acquire_connection=handler.acquire_connection,
-            release_connection=handler.release_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
+            release_connection=self._guard_release(handler.release_connection),
             statement_config=statement_config
             or (lambda: resolve_runtime_statement_config(None, self.statement_config, default_statement_config)),
             driver_features=self.driver_features,
@@ -797,6 +869,17 @@ class PsycopgAsyncConfig(AsyncDatabaseConfig[PsycopgAsyncConnection, AsyncConnec
             self.connection_instance = await self.create_pool()
         return self.connection_instance
 
+    def pool_spare_capacity(self) -> int:
+        """Return how many connections the pool can hand out without queuing.
+
+        Returns:
+            Idle plus growable connection slots, or 0 while callers are already waiting.
+        """
+        pool = self.connection_instance
+        if pool is None or pool.get_stats().get("requests_waiting", 0) > 0:
+            return 0
+        return super().pool_spare_capacity()
+
     def get_event_runtime_hints(self) -> "EventRuntimeHints":
         """Return polling defaults for PostgreSQL queue fallback."""
 
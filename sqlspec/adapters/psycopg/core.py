@@ -59,11 +59,14 @@ if TYPE_CHECKING:
 __all__ = (
     "PipelineCursorEntry",
     "PreparedStackOperation",
+    "PsycopgAsyncCopySource",
     "PsycopgAsyncStreamSource",
+    "PsycopgSyncCopySource",
     "PsycopgSyncStreamSource",
     "apply_driver_features",
     "build_async_pipeline_execution_result",
     "build_copy_from_command",
+    "build_copy_target_describe_command",
     "build_pipeline_execution_result",
     "build_postgres_extension_probe_names",
     "build_profile",
@@ -76,6 +79,7 @@ __all__ = (
     "execute_with_optional_parameters",
     "execute_with_optional_parameters_async",
     "pipeline_supported",
+    "resolve_column_types",
     "resolve_many_rowcount",
     "resolve_postgres_extension_state",
     "resolve_rowcount",
@@ -120,12 +124,20 @@ def pipeline_supported() -> bool:
         return False
 
 
-def build_copy_from_command(table: str, columns: "list[str]") -> "PsycopgComposed":
+def build_copy_from_command(table: str, columns: "list[str]", *, binary: bool = False) -> "PsycopgComposed":
     table_identifier = _compose_table_identifier(table)
     column_sql = PsycopgSQL(", ").join([PsycopgIdentifier(column) for column in columns])
+    if binary:
+        return PsycopgSQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(table_identifier, column_sql)
     return PsycopgSQL("COPY {} ({}) FROM STDIN").format(table_identifier, column_sql)
 
 
+def build_copy_target_describe_command(table: str, columns: "list[str]") -> "PsycopgComposed":
+    """Select no rows from the COPY target so the cursor description carries its column type OIDs."""
+    column_sql = PsycopgSQL(", ").join([PsycopgIdentifier(column) for column in columns])
+    return PsycopgSQL("SELECT {} FROM {} LIMIT 0").format(column_sql, _compose_table_identifier(table))
+
+
 def build_truncate_command(table: str) -> "PsycopgComposed":
     return PsycopgSQL("TRUNCATE TABLE {}").format(_compose_table_identifier(table))
 
@@ -226,6 +238,44 @@ async def execute_with_optional_parameters_async(cursor: Any, sql: str, paramete
         await cursor.execute(sql)
 
 
+_PSYCOPG_OID_TOKENS: "dict[int, str]" = {
+    16: "bool",
+    17: "binary",
+    20: "int64",
+    21: "int16",
+    23: "int32",
+    25: "string",
+    114: "string",
+    700: "float32",
+    701: "float64",
+    1043: "string",
+    1082: "date",
+    1083: "time",
+    1114: "timestamp",
+    1184: "timestamptz",
+    1700: "decimal",
+    2950: "string",
+    3802: "string",
+}
+
+
+def resolve_column_types(description: Any) -> "dict[str, str] | None":
+    """Map psycopg cursor column OIDs to neutral Arrow type tokens.
+
+    Returns ``None`` when the cursor has no description or reports no
+    recognizable OIDs, so callers can pass the result straight through
+    without adding a code path for the empty case.
+    """
+    if not description:
+        return None
+    column_types: dict[str, str] = {}
+    for col in description:
+        token = _PSYCOPG_OID_TOKENS.get(col.type_code)
+        if token is not None:
+            column_types[col.name] = token
+    return column_types or None
+
+
 class PsycopgSyncStreamSource:
     """Compiled chunk source streaming dict rows from a psycopg server-side named cursor.
 
@@ -262,6 +312,9 @@ class PsycopgSyncStreamSource:
                 raise
         self._driver._check_pending_exception(handler)
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         rows: list[Any] = []
@@ -274,6 +327,15 @@ class PsycopgSyncStreamSource:
             self._column_names = [column.name for column in self._cursor.description]
         return rows_to_dicts(rows, self._column_names)
 
+    def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        handler = self._driver.handle_database_exceptions()
+        rows: list[Any] = []
+        with handler:
+            rows = self._cursor.fetchmany(self._chunk_size)
+        self._driver._check_pending_exception(handler)
+        description = self._cursor.description if self._cursor is not None else None
+        return list(rows), [column.name for column in description or ()], resolve_column_types(description)
+
     def close(self, error: bool = False) -> None:
         cursor = self._cursor
         self._cursor = None
@@ -328,6 +390,9 @@ class PsycopgAsyncStreamSource:
                 await transaction.__aexit__(type(exc), exc, exc.__traceback__)
             raise
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     async def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         rows = await self._driver._run_with_exception_handler(handler, self._cursor.fetchmany, self._chunk_size)
@@ -338,6 +403,13 @@ class PsycopgAsyncStreamSource:
             self._column_names = [column.name for column in self._cursor.description]
         return rows_to_dicts(rows, self._column_names)
 
+    async def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        handler = self._driver.handle_database_exceptions()
+        rows = await self._driver._run_with_exception_handler(handler, self._cursor.fetchmany, self._chunk_size)
+        self._driver._check_pending_exception(handler)
+        description = self._cursor.description if self._cursor is not None else None
+        return list(rows or ()), [column.name for column in description or ()], resolve_column_types(description)
+
     async def close(self, error: bool = False) -> None:
         cursor = self._cursor
         self._cursor = None
@@ -354,6 +426,95 @@ class PsycopgAsyncStreamSource:
                     await transaction.__aexit__(None, None, None)
 
 
+class PsycopgSyncCopySource:
+    """Compiled pull source for the bytes of a ``COPY ... TO STDOUT`` statement.
+
+    The cursor and its ``Copy`` context are opened on the first read; an empty
+    read marks the end of the stream.
+    """
+
+    __slots__ = ("_context", "_copy", "_cursor", "_driver", "_parameters", "_sql")
+
+    def __init__(self, driver: Any, sql: str, parameters: Any) -> None:
+        self._driver = driver
+        self._sql = sql
+        self._parameters = parameters
+        self._cursor: Any = None
+        self._context: Any = None
+        self._copy: Any = None
+
+    def read(self) -> Any:
+        handler = self._driver.handle_database_exceptions()
+        data: Any = b""
+        with handler:
+            if self._copy is None:
+                self._cursor = self._driver.connection.cursor()
+                self._context = self._cursor.copy(self._sql, self._parameters or None)
+                self._copy = self._context.__enter__()
+            data = self._copy.read()
+        self._driver._check_pending_exception(handler)
+        return data
+
+    def close(self, error: bool = False) -> None:
+        context = self._context
+        self._context = None
+        self._copy = None
+        if context is not None:
+            with contextlib.suppress(Exception):
+                if error:
+                    context.__exit__(RuntimeError, RuntimeError("export failed"), None)
+                else:
+                    context.__exit__(None, None, None)
+        cursor = self._cursor
+        self._cursor = None
+        if cursor is not None:
+            with contextlib.suppress(Exception):
+                cursor.close()
+
+
+class PsycopgAsyncCopySource:
+    """Compiled async pull source for the bytes of a ``COPY ... TO STDOUT`` statement."""
+
+    __slots__ = ("_context", "_copy", "_cursor", "_driver", "_parameters", "_sql")
+
+    def __init__(self, driver: Any, sql: str, parameters: Any) -> None:
+        self._driver = driver
+        self._sql = sql
+        self._parameters = parameters
+        self._cursor: Any = None
+        self._context: Any = None
+        self._copy: Any = None
+
+    async def read(self) -> Any:
+        handler = self._driver.handle_database_exceptions()
+        data = await self._driver._run_with_exception_handler(handler, self._read)
+        self._driver._check_pending_exception(handler)
+        return data
+
+    async def _read(self) -> Any:
+        if self._copy is None:
+            self._cursor = self._driver.connection.cursor()
+            self._context = self._cursor.copy(self._sql, self._parameters or None)
+            self._copy = await self._context.__aenter__()
+        return await self._copy.read()
+
+    async def close(self, error: bool = False) -> None:
+        context = self._context
+        self._context = None
+        self._copy = None
+        if context is not None:
+            with contextlib.suppress(Exception):
+                if error:
+                    await context.__aexit__(RuntimeError, RuntimeError("export failed"), None)
+                else:
+                    await context.__aexit__(None, None, None)
+        cursor = self._cursor
+        self._cursor = None
+        if cursor is not None:
+            with contextlib.suppress(Exception):
+                await cursor.close()
+
+
 def resolve_rowcount(cursor: Any) -> int:
     """Resolve rowcount from a psycopg cursor.
 
@@ -528,6 +689,7 @@ def _create_postgres_error(
     return exc
 
 
+COPY_DESCRIBE_CACHE_SIZE: Final[int] = 32
 _EXCEPTION_MAPPING: Final[dict[type[Any], tuple[str, type[SQLSpecError], str]]] = {}
 _EXCEPTION_MAPPING_CACHE: Final[dict[type[Any], tuple[str, type[SQLSpecError], str]]] = {}
 
@@ -1,5 +1,6 @@
 """PostgreSQL psycopg driver implementation."""
 
+from collections import OrderedDict
 from collections.abc import Sized
 from contextlib import AsyncExitStack, ExitStack
 from typing import TYPE_CHECKING, Any, cast
@@ -18,13 +19,17 @@ from sqlspec.adapters.psycopg._typing import (
     PsycopgSyncSessionContext,
 )
 from sqlspec.adapters.psycopg.core import (
+    COPY_DESCRIBE_CACHE_SIZE,
     TRANSACTION_STATUS_IDLE,
     PipelineCursorEntry,
     PreparedStackOperation,
+    PsycopgAsyncCopySource,
     PsycopgAsyncStreamSource,
+    PsycopgSyncCopySource,
     PsycopgSyncStreamSource,
     build_async_pipeline_execution_result,
     build_copy_from_command,
+    build_copy_target_describe_command,
     build_pipeline_execution_result,
     build_truncate_command,
     create_mapped_exception,
@@ -33,6 +38,7 @@ from sqlspec.adapters.psycopg.core import (
     execute_with_optional_parameters,
     execute_with_optional_parameters_async,
     pipeline_supported,
+    resolve_column_types,
     resolve_many_rowcount,
     resolve_rowcount,
 )
@@ -57,10 +63,20 @@ from sqlspec.driver import (
     StackExecutionObserver,
     SyncDriverAdapterBase,
     SyncRowStream,
+    SyncStatementTimeout,
     describe_stack_statement,
 )
 from sqlspec.exceptions import SQLSpecError, StackExecutionError
 from sqlspec.utils.logging import get_logger
+from sqlspec.utils.pgcopy import (
+    aiter_copy_batches,
+    build_copy_describe_sql,
+    build_copy_to_stdout_sql,
+    create_pgcopy_decoder,
+    create_pgcopy_encoder,
+    iter_copy_batches,
+    iter_pgcopy_chunks,
+)
 from sqlspec.utils.text import normalize_identifier, quote_identifier
 from sqlspec.utils.type_guards import is_readable, resolve_row_format
 
@@ -71,6 +87,7 @@ if TYPE_CHECKING:
     from sqlspec.core import ArrowResult
     from sqlspec.driver import ExecutionResult
     from sqlspec.storage import StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
+    from sqlspec.typing import ArrowRecordBatch, ArrowTable
 
 
 __all__ = (
@@ -82,47 +99,11 @@ __all__ = (
     "PsycopgSyncDriver",
     "PsycopgSyncExceptionHandler",
     "PsycopgSyncSessionContext",
+    "PsycopgSyncStatementTimeout",
 )
 
 logger = get_logger("sqlspec.adapters.psycopg")
 
-_PSYCOPG_OID_TOKENS: "dict[int, str]" = {
-    16: "bool",
-    17: "binary",
-    20: "int64",
-    21: "int16",
-    23: "int32",
-    25: "string",
-    114: "string",
-    700: "float32",
-    701: "float64",
-    1043: "string",
-    1082: "date",
-    1083: "time",
-    1114: "timestamp",
-    1184: "timestamptz",
-    1700: "decimal",
-    2950: "string",
-    3802: "string",
-}
-
-
-def _resolve_column_types(description: Any) -> "dict[str, str] | None":
-    """Map psycopg cursor column OIDs to neutral Arrow type tokens.
-
-    Returns ``None`` when the cursor has no description or reports no
-    recognizable OIDs, so callers can pass the result straight through
-    without adding a code path for the empty case.
-    """
-    if not description:
-        return None
-    column_types: dict[str, str] = {}
-    for col in description:
-        token = _PSYCOPG_OID_TOKENS.get(col.type_code)
-        if token is not None:
-            column_types[col.name] = token
-    return column_types or None
-
 
 def pipeline_operation_failed(cursor: Any, statement: "SQL") -> bool:
     """Return True when a synced pipeline cursor reflects a failed non-select operation.
@@ -146,6 +127,19 @@ class PsycopgPipelineMixin:
 
     __slots__ = ()
 
+    def _cached_copy_columns(self, sql: str) -> "list[tuple[str, int]] | None":
+        cache = cast("PsycopgPipelineDriver", self)._copy_columns
+        columns = cache.get(sql)
+        if columns is not None:
+            cache.move_to_end(sql)
+        return columns
+
+    def _cache_copy_columns(self, sql: str, columns: "list[tuple[str, int]]") -> None:
+        cache = cast("PsycopgPipelineDriver", self)._copy_columns
+        cache[sql] = columns
+        if len(cache) > COPY_DESCRIBE_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def _prepare_records_for_arrow(
         self, records: "abc.Sequence[abc.Mapping[str, Any]] | abc.Sequence[abc.Sequence[Any]]"
     ) -> "abc.Sequence[abc.Mapping[str, Any]] | abc.Sequence[abc.Sequence[Any]]":
@@ -210,6 +204,22 @@ class PsycopgSyncExceptionHandler(BaseSyncExceptionHandler):
         return False
 
 
+class PsycopgSyncStatementTimeout(SyncStatementTimeout):
+    """Statement timeout enforced by sending a cancel request to the server."""
+
+    __slots__ = ()
+
+    def arm(self) -> None:
+        self.start_watchdog()
+
+    def interrupt(self) -> None:
+        cancel_safe = getattr(self.connection, "cancel_safe", None)
+        if cancel_safe is not None:
+            cancel_safe()
+        else:
+            self.connection.cancel()
+
+
 class PsycopgSyncDriver(PsycopgPipelineMixin, SyncDriverAdapterBase):
     """PostgreSQL psycopg synchronous driver.
 
@@ -220,7 +230,7 @@ class PsycopgSyncDriver(PsycopgPipelineMixin, SyncDriverAdapterBase):
     bulk data transfer, and PostgreSQL-specific error handling.
     """
 
-    __slots__ = ("_data_dictionary", "_restore_autocommit", "_transaction_active")
+    __slots__ = ("_copy_columns", "_data_dictionary", "_restore_autocommit", "_transaction_active")
     dialect = "postgres"
 
     def __init__(
@@ -236,6 +246,7 @@ class PsycopgSyncDriver(PsycopgPipelineMixin, SyncDriverAdapterBase):
 
         super().__init__(connection=connection, statement_config=statement_config, driver_features=driver_features)
         self._data_dictionary: PsycopgSyncDataDictionary | None = None
+        self._copy_columns: OrderedDict[str, list[tuple[str, int]]] = OrderedDict()
         self._restore_autocommit = False
         self._transaction_active = False
 
@@ -261,7 +272,7 @@ class PsycopgSyncDriver(PsycopgPipelineMixin, SyncDriverAdapterBase):
             fetched_data = cursor.fetchall()
             data = cast("list[Any] | None", fetched_data) or []
             column_names = self._resolve_column_names(cursor.description)
-            column_types = _resolve_column_types(cursor.description)
+            column_types = resolve_column_types(cursor.description)
             row_format = resolve_row_format(data)
 
             return self.create_execution_result(
@@ -461,10 +472,91 @@ class PsycopgSyncDriver(PsycopgPipelineMixin, SyncDriverAdapterBase):
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         return SyncRowStream(PsycopgSyncStreamSource(self, sql, prepared_parameters, chunk_size))
 
+    def dispatch_arrow_export(
+        self, statement: "SQL", batch_size: int
+    ) -> "abc.Generator[ArrowRecordBatch, None, None] | None":
+        """Export a SELECT through ``COPY ... TO STDOUT (FORMAT BINARY)`` decoded into Arrow batches.
+
+        Returns None when ``enable_copy_arrow_export`` is off or a result column
+        has a type the binary COPY decoder does not handle (numeric, json, arrays,
+        ...). Binary COPY output carries no column types, so they are
+        described once per statement and cached on the driver.
+        """
+        if not self.driver_features.get("enable_copy_arrow_export", True):
+            return None
+        sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        columns = self._cached_copy_columns(sql)
+        if columns is None:
+            exc_handler = self.handle_database_exceptions()
+            with exc_handler, self.with_cursor(self.connection) as cursor:
+                execute_with_optional_parameters(cursor, build_copy_describe_sql(sql), prepared_parameters)
+                columns = [(column.name, column.type_code) for column in cursor.description or ()]
+            self._check_pending_exception(exc_handler)
+            self._cache_copy_columns(sql, columns)
+        decoder = create_pgcopy_decoder(columns, batch_size)
+        if decoder is None:
+            return None
+        return iter_copy_batches(
+            PsycopgSyncCopySource(self, build_copy_to_stdout_sql(sql), prepared_parameters), decoder
+        )
+
+    def _copy_arrow_binary(self, table: str, arrow_table: "ArrowTable") -> bool:
+        """Write Arrow data through binary COPY without building Python rows.
+
+        Returns False when ``enable_copy_arrow_import`` is off or a column needs the
+        row path (unsupported target type or Arrow type).
+        """
+        if not self.driver_features.get("enable_copy_arrow_import", True):
+            return False
+        if arrow_table.num_rows == 0:
+            return True
+        columns = arrow_table.column_names
+        exc_handler = self.handle_database_exceptions()
+        with exc_handler, self.with_cursor(self.connection) as cursor:
+            cursor.execute(build_copy_target_describe_command(table, columns))
+            target_columns = [(column.name, column.type_code) for column in cursor.description or ()]
+        self._check_pending_exception(exc_handler)
+        encoder = create_pgcopy_encoder(arrow_table.schema, target_columns)
+        if encoder is None:
+            return False
+        exc_handler = self.handle_database_exceptions()
+        with ExitStack() as stack:
+            stack.enter_context(exc_handler)
+            cursor = stack.enter_context(self.with_cursor(self.connection))
+            copy_ctx = stack.enter_context(cursor.copy(build_copy_from_command(table, columns, binary=True)))
+            for chunk in iter_pgcopy_chunks(arrow_table, encoder):
+                copy_ctx.write(chunk)
+        self._check_pending_exception(exc_handler)
+        return True
+
+    def _copy_arrow_rows(self, table: str, arrow_table: "ArrowTable") -> None:
+        """Write Arrow data through text COPY one Python row at a time."""
+        columns, records = self._arrow_table_to_rows(arrow_table)
+        prepared_records = cast(
+            "list[Any]",
+            self.prepare_driver_parameters(records, self.statement_config, is_many=True)
+            if records and self._arrow_rows_need_preparation(arrow_table)
+            else records,
+        )
+        if records:
+            copy_sql = build_copy_from_command(table, columns)
+            exc_handler = self.handle_database_exceptions()
+            with ExitStack() as stack:
+                stack.enter_context(exc_handler)
+                cursor = stack.enter_context(self.with_cursor(self.connection))
+                copy_ctx = stack.enter_context(cursor.copy(copy_sql))
+                for record in prepared_records:
+                    copy_ctx.write_row(record)
+            if exc_handler.pending_exception is not None:
+                raise exc_handler.pending_exception from None
+
     def handle_database_exceptions(self) -> "PsycopgSyncExceptionHandler":
         """Handle database-specific exceptions and wrap them appropriately."""
         return PsycopgSyncExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "PsycopgSyncStatementTimeout":
+        return PsycopgSyncStatementTimeout(connection, timeout)
+
     # ─────────────────────────────────────────────────────────────────────────────
     # STACK EXECUTION METHODS
     # ─────────────────────────────────────────────────────────────────────────────
@@ -506,10 +598,15 @@ class PsycopgSyncDriver(PsycopgPipelineMixin, SyncDriverAdapterBase):
         """Execute a query and stream Arrow results to storage (sync)."""
 
         self._require_capability("arrow_export_enabled")
-        arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        sync_pipeline = self._storage_pipeline()
-        telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline
+        telemetry_payload = self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -534,24 +631,8 @@ class PsycopgSyncDriver(PsycopgPipelineMixin, SyncDriverAdapterBase):
                 cursor.execute(truncate_sql)
             if exc_handler.pending_exception is not None:
                 raise exc_handler.pending_exception from None
-        columns, records = self._arrow_table_to_rows(arrow_table)
-        prepared_records = cast(
-            "list[Any]",
-            self.prepare_driver_parameters(records, self.statement_config, is_many=True)
-            if records and self._arrow_rows_need_preparation(arrow_table)
-            else records,
-        )
-        if records:
-            copy_sql = build_copy_from_command(table, columns)
-            exc_handler = self.handle_database_exceptions()
-            with ExitStack() as stack:
-                stack.enter_context(exc_handler)
-                cursor = stack.enter_context(self.with_cursor(self.connection))
-                copy_ctx = stack.enter_context(cursor.copy(copy_sql))
-                for record in prepared_records:
-                    copy_ctx.write_row(record)
-            if exc_handler.pending_exception is not None:
-                raise exc_handler.pending_exception from None
+        if not self._copy_arrow_binary(table, arrow_table):
+            self._copy_arrow_rows(table, arrow_table)
         telemetry_payload = self._ingest_telemetry(arrow_table)
         telemetry_payload["destination"] = table
         self._attach_partition_telemetry(telemetry_payload, partitioner)
@@ -565,10 +646,22 @@ class PsycopgSyncDriver(PsycopgPipelineMixin, SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts into PostgreSQL via COPY."""
 
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     # ─────────────────────────────────────────────────────────────────────────────
@@ -748,7 +841,7 @@ class PsycopgAsyncDriver(PsycopgPipelineMixin, AsyncDriverAdapterBase):
     and async pub/sub support.
     """
 
-    __slots__ = ("_data_dictionary", "_restore_autocommit", "_transaction_active")
+    __slots__ = ("_copy_columns", "_data_dictionary", "_restore_autocommit", "_transaction_active")
     dialect = "postgres"
 
     def __init__(
@@ -764,6 +857,7 @@ class PsycopgAsyncDriver(PsycopgPipelineMixin, AsyncDriverAdapterBase):
 
         super().__init__(connection=connection, statement_config=statement_config, driver_features=driver_features)
         self._data_dictionary: PsycopgAsyncDataDictionary | None = None
+        self._copy_columns: OrderedDict[str, list[tuple[str, int]]] = OrderedDict()
         self._restore_autocommit = False
         self._transaction_active = False
 
@@ -789,7 +883,7 @@ class PsycopgAsyncDriver(PsycopgPipelineMixin, AsyncDriverAdapterBase):
             fetched_data = await cursor.fetchall()
             data = cast("list[Any] | None", fetched_data) or []
             column_names = self._resolve_column_names(cursor.description)
-            column_types = _resolve_column_types(cursor.description)
+            column_types = resolve_column_types(cursor.description)
             row_format = resolve_row_format(data)
 
             return self.create_execution_result(
@@ -992,6 +1086,92 @@ class PsycopgAsyncDriver(PsycopgPipelineMixin, AsyncDriverAdapterBase):
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         return AsyncRowStream(PsycopgAsyncStreamSource(self, sql, prepared_parameters, chunk_size))
 
+    async def dispatch_arrow_export(
+        self, statement: "SQL", batch_size: int
+    ) -> "abc.AsyncGenerator[ArrowRecordBatch, None] | None":
+        """Export a SELECT through ``COPY ... TO STDOUT (FORMAT BINARY)`` decoded into Arrow batches.
+
+        Returns None when ``enable_copy_arrow_export`` is off or a result column
+        has a type the binary COPY decoder does not handle (numeric, json, arrays,
+        ...). Binary COPY output carries no column types, so they are
+        described once per statement and cached on the driver.
+        """
+        if not self.driver_features.get("enable_copy_arrow_export", True):
+            return None
+        sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        columns = self._cached_copy_columns(sql)
+        if columns is None:
+            exc_handler = self.handle_database_exceptions()
+            columns = await self._run_with_exception_handler(
+                exc_handler, self._describe_copy_columns, sql, prepared_parameters
+            )
+            self._check_pending_exception(exc_handler)
+            columns = columns or []
+            self._cache_copy_columns(sql, columns)
+        decoder = create_pgcopy_decoder(columns, batch_size)
+        if decoder is None:
+            return None
+        return aiter_copy_batches(
+            PsycopgAsyncCopySource(self, build_copy_to_stdout_sql(sql), prepared_parameters), decoder
+        )
+
+    async def _describe_copy_columns(self, sql: str, parameters: Any) -> "list[tuple[str, int]]":
+        async with self.with_cursor(self.connection) as cursor:
+            await execute_with_optional_parameters_async(cursor, build_copy_describe_sql(sql), parameters)
+            return [(column.name, column.type_code) for column in cursor.description or ()]
+
+    async def _copy_arrow_binary(self, table: str, arrow_table: "ArrowTable") -> bool:
+        """Write Arrow data through binary COPY without building Python rows.
+
+        Returns False when ``enable_copy_arrow_import`` is off or a column needs the
+        row path (unsupported target type or Arrow type).
+        """
+        if not self.driver_features.get("enable_copy_arrow_import", True):
+            return False
+        if arrow_table.num_rows == 0:
+            return True
+        columns = arrow_table.column_names
+        exc_handler = self.handle_database_exceptions()
+        async with exc_handler, self.with_cursor(self.connection) as cursor:
+            await cursor.execute(build_copy_target_describe_command(table, columns))
+            target_columns = [(column.name, column.type_code) for column in cursor.description or ()]
+        self._check_pending_exception(exc_handler)
+        encoder = create_pgcopy_encoder(arrow_table.schema, target_columns)
+        if encoder is None:
+            return False
+        exc_handler = self.handle_database_exceptions()
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(exc_handler)
+            cursor = await stack.enter_async_context(self.with_cursor(self.connection))
+            copy_ctx = await stack.enter_async_context(
+                cursor.copy(build_copy_from_command(table, columns, binary=True))
+            )
+            for chunk in iter_pgcopy_chunks(arrow_table, encoder):
+                await copy_ctx.write(chunk)
+        self._check_pending_exception(exc_handler)
+        return True
+
+    async def _copy_arrow_rows(self, table: str, arrow_table: "ArrowTable") -> None:
+        """Write Arrow data through text COPY one Python row at a time."""
+        columns, records = self._arrow_table_to_rows(arrow_table)
+        prepared_records = cast(
+            "list[Any]",
+            self.prepare_driver_parameters(records, self.statement_config, is_many=True)
+            if records and self._arrow_rows_need_preparation(arrow_table)
+            else records,
+        )
+        if records:
+            copy_sql = build_copy_from_command(table, columns)
+            exc_handler = self.handle_database_exceptions()
+            async with AsyncExitStack() as stack:
+                await stack.enter_async_context(exc_handler)
+                cursor = await stack.enter_async_context(self.with_cursor(self.connection))
+                copy_ctx = await stack.enter_async_context(cursor.copy(copy_sql))
+                for record in prepared_records:
+                    await copy_ctx.write_row(record)
+            if exc_handler.pending_exception is not None:
+                raise exc_handler.pending_exception from None
+
     def handle_database_exceptions(self) -> "PsycopgAsyncExceptionHandler":
         """Handle database-specific exceptions and wrap them appropriately."""
         return PsycopgAsyncExceptionHandler()
@@ -1039,10 +1219,15 @@ class PsycopgAsyncDriver(PsycopgPipelineMixin, AsyncDriverAdapterBase):
         """Execute a query and stream Arrow data to storage asynchronously."""
 
         self._require_capability("arrow_export_enabled")
-        arrow_result = await self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        async_pipeline = self._storage_pipeline()
-        telemetry_payload = await self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=async_pipeline
+        telemetry_payload = await self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -1067,24 +1252,8 @@ class PsycopgAsyncDriver(PsycopgPipelineMixin, AsyncDriverAdapterBase):
                 await cursor.execute(truncate_sql)
             if exc_handler.pending_exception is not None:
                 raise exc_handler.pending_exception from None
-        columns, records = self._arrow_table_to_rows(arrow_table)
-        prepared_records = cast(
-            "list[Any]",
-            self.prepare_driver_parameters(records, self.statement_config, is_many=True)
-            if records and self._arrow_rows_need_preparation(arrow_table)
-            else records,
-        )
-        if records:
-            copy_sql = build_copy_from_command(table, columns)
-            exc_handler = self.handle_database_exceptions()
-            async with AsyncExitStack() as stack:
-                await stack.enter_async_context(exc_handler)
-                cursor = await stack.enter_async_context(self.with_cursor(self.connection))
-                copy_ctx = await stack.enter_async_context(cursor.copy(copy_sql))
-                for record in prepared_records:
-                    await copy_ctx.write_row(record)
-            if exc_handler.pending_exception is not None:
-                raise exc_handler.pending_exception from None
+        if not await self._copy_arrow_binary(table, arrow_table):
+            await self._copy_arrow_rows(table, arrow_table)
         telemetry_payload = self._ingest_telemetry(arrow_table)
         telemetry_payload["destination"] = table
         self._attach_partition_telemetry(telemetry_payload, partitioner)
@@ -1098,10 +1267,24 @@ class PsycopgAsyncDriver(PsycopgPipelineMixin, AsyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts asynchronously."""
 
-        arrow_table, inbound = await self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return await self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = await self._read_storage_arrow(
+            source, file_format=file_format, columns=columns, filter=filter
+        )
         return await self.load_from_arrow(
             table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound
         )
@@ -92,6 +92,7 @@ class PymssqlConfig(SyncDatabaseConfig[PymssqlConnection, PymssqlConnectionPool,
     connection_type: "ClassVar[type[PymssqlConnection]]" = cast("type[PymssqlConnection]", PymssqlConnection)
     migration_tracker_type: "ClassVar[type[PymssqlSyncMigrationTracker]]" = PymssqlSyncMigrationTracker
     supports_transactional_ddl: "ClassVar[bool]" = True
+    pool_connections_per_thread: "ClassVar[bool]" = True
     supports_native_arrow_export: "ClassVar[bool]" = False
     supports_native_arrow_import: "ClassVar[bool]" = False
     supports_native_parquet_export: "ClassVar[bool]" = False
@@ -148,6 +149,7 @@ class PymssqlConfig(SyncDatabaseConfig[PymssqlConnection, PymssqlConnectionPool,
             recycle_seconds=pool_recycle,
             health_check_interval=health_check,
             on_connection_create=self._user_connection_hook,
+            metrics=self.get_observability_runtime().pool_metrics,
         )
 
     def _close_pool(self) -> None:
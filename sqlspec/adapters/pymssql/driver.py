@@ -88,6 +88,9 @@ class PymssqlStreamSource:
             raise
         self._cursor_manager = cursor_manager
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     def fetch_chunk(self) -> "list[dict[str, Any]]":
         cursor_manager = self._cursor_manager
         if cursor_manager is None or cursor_manager.cursor is None:
@@ -229,6 +229,7 @@ class PyMysqlConfig(SyncDatabaseConfig[PyMysqlConnection, PyMysqlConnectionPool,
     driver_type: "ClassVar[type[PyMysqlDriver]]" = PyMysqlDriver
     connection_type: "ClassVar[type[PyMysqlConnection]]" = cast("type[PyMysqlConnection]", PyMysqlConnection)
     supports_transactional_ddl: "ClassVar[bool]" = False
+    pool_connections_per_thread: "ClassVar[bool]" = True
     supports_native_arrow_export: "ClassVar[bool]" = True
     supports_native_arrow_import: "ClassVar[bool]" = True
     supports_native_parquet_export: "ClassVar[bool]" = True
@@ -335,6 +336,7 @@ class PyMysqlConfig(SyncDatabaseConfig[PyMysqlConnection, PyMysqlConnectionPool,
             health_check_interval=health_check,
             on_connection_create=self._user_connection_hook,
             connection_factory=connection_factory,
+            metrics=self.get_observability_runtime().pool_metrics,
         )
 
     def _close_pool(self) -> None:
@@ -25,13 +25,15 @@ from sqlspec.adapters.pymysql.core import (
     normalize_execute_many_parameters,
     normalize_execute_parameters,
     normalize_lastrowid,
+    resolve_column_types,
     resolve_many_rowcount,
     resolve_row_plan,
     resolve_rowcount,
 )
 from sqlspec.adapters.pymysql.data_dictionary import PyMysqlDataDictionary
 from sqlspec.core import ArrowResult, get_cache_config, register_driver_profile
-from sqlspec.driver import BaseSyncExceptionHandler, SyncDriverAdapterBase, SyncRowStream
+from sqlspec.driver import BaseSyncExceptionHandler, SyncDriverAdapterBase, SyncRowStream, SyncStatementTimeout
+from sqlspec.driver._timeout import add_max_execution_time_hint
 from sqlspec.exceptions import SQLSpecError
 from sqlspec.utils.logging import get_logger
 from sqlspec.utils.serializers import from_json
@@ -45,47 +47,19 @@ if TYPE_CHECKING:
     from sqlspec.driver import ExecutionResult
     from sqlspec.storage import StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
 
-__all__ = ("PyMysqlCursor", "PyMysqlDriver", "PyMysqlExceptionHandler", "PyMysqlSessionContext")
+__all__ = (
+    "PyMysqlCursor",
+    "PyMysqlDriver",
+    "PyMysqlExceptionHandler",
+    "PyMysqlSessionContext",
+    "PyMysqlStatementTimeout",
+)
 
 logger = get_logger("sqlspec.adapters.pymysql")
 
 json_type_value = PyMysqlFieldType.JSON if supports_json_type(PyMysqlFieldType) else None
 PYMYSQL_JSON_TYPE_CODES: Final[set[int]] = {json_type_value} if json_type_value is not None else set()
 
-_MYSQL_TYPE_CODE_TOKENS: Final[dict[int, str]] = {
-    0: "decimal",
-    1: "int32",
-    2: "int32",
-    3: "int64",
-    4: "float32",
-    5: "float64",
-    7: "timestamp",
-    8: "int64",
-    10: "date",
-    11: "time",
-    12: "timestamp",
-    246: "decimal",
-    252: "binary",
-    253: "string",
-    254: "string",
-}
-
-
-def _resolve_column_types(description: Any) -> "dict[str, str] | None":
-    """Map MySQL cursor column FIELD_TYPE codes to neutral Arrow type tokens.
-
-    Returns ``None`` when the cursor has no description or reports no
-    recognizable type codes.
-    """
-    if not description:
-        return None
-    column_types: dict[str, str] = {}
-    for col in description:
-        token = _MYSQL_TYPE_CODE_TOKENS.get(col[1])
-        if token is not None:
-            column_types[col[0]] = token
-    return column_types or None
-
 
 class PyMysqlExceptionHandler(BaseSyncExceptionHandler):
     """Context manager for handling PyMySQL exceptions."""
@@ -104,6 +78,16 @@ class PyMysqlExceptionHandler(BaseSyncExceptionHandler):
         return False
 
 
+class PyMysqlStatementTimeout(SyncStatementTimeout):
+    """Statement timeout enforced by the server through a ``MAX_EXECUTION_TIME`` optimizer hint.
+
+    The driver adds the hint to ``SELECT`` statements, the only kind MySQL
+    limits, so the session is never modified.
+    """
+
+    __slots__ = ()
+
+
 class PyMysqlDriver(SyncDriverAdapterBase):
     """MySQL/MariaDB database driver using PyMySQL."""
 
@@ -126,6 +110,7 @@ class PyMysqlDriver(SyncDriverAdapterBase):
 
     def dispatch_execute(self, cursor: Any, statement: "SQL") -> "ExecutionResult":
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        sql = add_max_execution_time_hint(sql, statement.statement_config.statement_timeout)
         cursor.execute(sql, normalize_execute_parameters(prepared_parameters))
 
         if statement.returns_rows():
@@ -134,7 +119,7 @@ class PyMysqlDriver(SyncDriverAdapterBase):
             row_plan = resolve_row_plan(description, PYMYSQL_JSON_TYPE_CODES)
             deserializer = cast("Callable[[Any], Any]", self.driver_features.get("json_deserializer", from_json))
             rows, column_names, row_format = collect_rows(fetched_data, row_plan, deserializer, logger=logger)
-            column_types = _resolve_column_types(description)
+            column_types = resolve_column_types(description)
 
             return self.create_execution_result(
                 cursor,
@@ -205,11 +190,15 @@ class PyMysqlDriver(SyncDriverAdapterBase):
         if not statement.returns_rows():
             return None
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
+        sql = add_max_execution_time_hint(sql, statement.statement_config.statement_timeout)
         return SyncRowStream(PymysqlStreamSource(self, sql, prepared_parameters, chunk_size, PYMYSQL_JSON_TYPE_CODES))
 
     def handle_database_exceptions(self) -> "PyMysqlExceptionHandler":
         return PyMysqlExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "PyMysqlStatementTimeout":
+        return PyMysqlStatementTimeout(connection, timeout)
+
     def select_to_storage(
         self,
         statement: "SQL | str",
@@ -223,10 +212,15 @@ class PyMysqlDriver(SyncDriverAdapterBase):
         **kwargs: Any,
     ) -> "StorageBridgeJob":
         self._require_capability("arrow_export_enabled")
-        arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        pipeline = self._storage_pipeline()
-        telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=pipeline
+        telemetry_payload = self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -294,8 +288,20 @@ class PyMysqlDriver(SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     @property
@@ -14,6 +14,8 @@ from sqlspec.utils.uuids import uuid4
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
 
+    from sqlspec.observability import PoolMetrics
+
 __all__ = ("PyMysqlConnectionPool",)
 
 
@@ -29,6 +31,7 @@ class PyMysqlConnectionPool:
         "_connection_factory",
         "_connection_parameters",
         "_health_check_interval",
+        "_metrics",
         "_on_connection_create",
         "_pool_id",
         "_recycle_seconds",
@@ -42,6 +45,7 @@ class PyMysqlConnectionPool:
         health_check_interval: float = 30.0,
         on_connection_create: "Callable[[PyMysqlConnection], None] | None" = None,
         connection_factory: "Callable[[], PyMysqlConnection] | None" = None,
+        metrics: "PoolMetrics | None" = None,
     ) -> None:
         """Initialize the thread-local connection manager.
 
@@ -51,9 +55,11 @@ class PyMysqlConnectionPool:
             health_check_interval: Seconds of idle time before running health check
             on_connection_create: Callback executed when connection is created
             connection_factory: Optional factory for custom connection creation
+            metrics: Pool metrics that record connection creation latency and age
         """
         self._connection_parameters = connection_parameters
         self._connection_factory = connection_factory
+        self._metrics = metrics
         self._thread_local = threading.local()
         self._recycle_seconds = recycle_seconds
         self._health_check_interval = health_check_interval
@@ -84,10 +90,24 @@ class PyMysqlConnectionPool:
             return False
         return True
 
+    def _create_measured_connection(self) -> PyMysqlConnection:
+        """Create a connection, recording its creation latency in the pool metrics."""
+        if self._metrics is None:
+            return self._create_connection()
+        started = time.perf_counter()
+        connection = self._create_connection()
+        self._metrics.observe_connection_created(time.perf_counter() - started)
+        return connection
+
+    def _record_connection_closed(self) -> None:
+        """Record the lifetime of the current thread's connection before it is closed."""
+        if self._metrics is not None and "created_at" in self._thread_local.__dict__:
+            self._metrics.observe_connection_closed(time.time() - self._thread_local.created_at)
+
     def _get_thread_connection(self) -> PyMysqlConnection:
         thread_state = self._thread_local.__dict__
         if "connection" not in thread_state:
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
             self._thread_local.last_used = time.time()
             return cast("PyMysqlConnection", self._thread_local.connection)
@@ -103,9 +123,10 @@ class PyMysqlConnectionPool:
                 recycle_seconds=self._recycle_seconds,
                 reason="exceeded_recycle_time",
             )
+            self._record_connection_closed()
             with contextlib.suppress(Exception):
                 self._thread_local.connection.close()
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
             self._thread_local.last_used = time.time()
             return cast("PyMysqlConnection", self._thread_local.connection)
@@ -122,9 +143,10 @@ class PyMysqlConnectionPool:
                 idle_seconds=round(idle_time, 1),
                 reason="failed_health_check",
             )
+            self._record_connection_closed()
             with contextlib.suppress(Exception):
                 self._thread_local.connection.close()
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
 
         self._thread_local.last_used = time.time()
@@ -133,6 +155,7 @@ class PyMysqlConnectionPool:
     def _close_thread_connection(self) -> None:
         thread_state = self._thread_local.__dict__
         if "connection" in thread_state:
+            self._record_connection_closed()
             with contextlib.suppress(Exception):
                 self._thread_local.connection.close()
             del self._thread_local.connection
@@ -451,7 +451,7 @@ class SpannerSyncConfig(SyncDatabaseConfig["SpannerConnection", "AbstractSession
         handler = _SpannerSessionConnectionHandler(self, connection_ctx)
 
         return SpannerSessionContext(
-            acquire_connection=handler.acquire_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
             release_connection=handler.release_connection,
             statement_config=statement_config or self.statement_config or default_statement_config,
             driver_features=self._session_driver_features(
@@ -49,6 +49,7 @@ if TYPE_CHECKING:
     from sqlspec.builder import QueryBuilder
     from sqlspec.core import ArrowResult, SQLResult, Statement, StatementFilter
     from sqlspec.core.statement import SQL
+    from sqlspec.driver import AdaptiveChunkSizing
     from sqlspec.storage import StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
     from sqlspec.typing import SchemaT, StatementParameters
 
@@ -327,6 +328,8 @@ class SpannerSyncDriver(SyncDriverAdapterBase):
         statement_config: "StatementConfig | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "SyncRowStream[SchemaT]": ...
 
@@ -340,6 +343,8 @@ class SpannerSyncDriver(SyncDriverAdapterBase):
         statement_config: "StatementConfig | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "SyncRowStream[dict[str, Any]]": ...
 
@@ -352,6 +357,8 @@ class SpannerSyncDriver(SyncDriverAdapterBase):
         statement_config: "StatementConfig | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "SyncRowStream[SchemaT] | SyncRowStream[dict[str, Any]]":
         """Execute a query and stream rows with optional Spanner per-call options."""
@@ -364,6 +371,8 @@ class SpannerSyncDriver(SyncDriverAdapterBase):
                 statement_config=statement_config,
                 chunk_size=chunk_size,
                 native_only=native_only,
+                prefetch=prefetch,
+                adaptive_chunks=adaptive_chunks,
                 **kwargs,
             )
         previous_options = self._pending_execute_options
@@ -376,6 +385,8 @@ class SpannerSyncDriver(SyncDriverAdapterBase):
                 statement_config=statement_config,
                 chunk_size=chunk_size,
                 native_only=native_only,
+                prefetch=prefetch,
+                adaptive_chunks=adaptive_chunks,
                 **kwargs,
             )
         finally:
@@ -403,10 +414,15 @@ class SpannerSyncDriver(SyncDriverAdapterBase):
     ) -> "StorageBridgeJob":
         """Execute query and stream Arrow results to storage."""
         self._require_capability("arrow_export_enabled")
-        arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        sync_pipeline = self._storage_pipeline()
-        telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline
+        telemetry_payload = self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -460,9 +476,21 @@ class SpannerSyncDriver(SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load artifacts from storage into Spanner table."""
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     # ─────────────────────────────────────────────────────────────────────────────
@@ -700,12 +728,23 @@ class _SpannerSelectStreamSource:
             self._row_iterator = iter(result_set)
         self._driver._check_pending_exception(handler)
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     def fetch_chunk(self) -> "list[dict[str, Any]]":
+        rows, column_names = self._fetch_converted_rows()
+        return rows_to_dicts(rows, column_names) if rows else []
+
+    def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        rows, column_names = self._fetch_converted_rows()
+        return rows, column_names, None
+
+    def _fetch_converted_rows(self) -> "tuple[list[Any], list[str]]":
         result_set = self._result_set
         row_iterator = self._row_iterator
         column_names = self._column_names
         if result_set is None or row_iterator is None:
-            return []
+            return [], column_names or []
 
         handler = self._driver.handle_database_exceptions()
         rows: list[Any] = []
@@ -713,7 +752,7 @@ class _SpannerSelectStreamSource:
             rows = list(islice(row_iterator, self._chunk_size))
         self._driver._check_pending_exception(handler)
         if not rows:
-            return []
+            return [], column_names or []
 
         if column_names is None:
             try:
@@ -734,7 +773,7 @@ class _SpannerSelectStreamSource:
             rows, (), column_names=column_names, column_plan=self._column_plan
         )
         self._column_names = resolved_column_names
-        return rows_to_dicts(converted_rows, resolved_column_names)
+        return converted_rows, resolved_column_names
 
     def close(self, error: bool = False) -> None:
         result_set = self._result_set
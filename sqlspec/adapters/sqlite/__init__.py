@@ -11,12 +11,18 @@ from sqlspec.adapters.sqlite.config import (
 )
 from sqlspec.adapters.sqlite.core import default_statement_config
 from sqlspec.adapters.sqlite.driver import SqliteDriver, SqliteExceptionHandler
-from sqlspec.adapters.sqlite.pool import SqliteConnectionPool
+from sqlspec.adapters.sqlite.pool import (
+    SqliteConnectionPool,
+    SqliteConnectTimeoutError,
+    SqlitePoolClosedError,
+    SqliteSingleWriterPool,
+)
 
 __all__ = (
     "SqliteAggregateConfig",
     "SqliteCollationConfig",
     "SqliteConfig",
+    "SqliteConnectTimeoutError",
     "SqliteConnection",
     "SqliteConnectionParams",
     "SqliteConnectionPool",
@@ -25,5 +31,7 @@ __all__ = (
     "SqliteDriverFeatures",
     "SqliteExceptionHandler",
     "SqliteFunctionConfig",
+    "SqlitePoolClosedError",
+    "SqliteSingleWriterPool",
     "default_statement_config",
 )
@@ -118,6 +118,9 @@ class SqliteSessionContext:
     def __exit__(
         self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
     ) -> "bool | None":
+        if self._driver is not None:
+            self._driver.release_writer(commit=exc_type is None)
+            self._driver = None
         if self._connection is not None:
             self._release_connection(self._connection)
             self._connection = None
@@ -15,7 +15,7 @@ from sqlspec.adapters.sqlite._typing import (
 )
 from sqlspec.adapters.sqlite.core import apply_driver_features, build_connection_config, default_statement_config
 from sqlspec.adapters.sqlite.driver import SqliteDriver, SqliteExceptionHandler
-from sqlspec.adapters.sqlite.pool import SqliteConnectionPool
+from sqlspec.adapters.sqlite.pool import SqliteConnectionPool, SqliteSingleWriterPool
 from sqlspec.adapters.sqlite.type_converter import register_type_handlers
 from sqlspec.config import ExtensionConfigs, SyncDatabaseConfig
 from sqlspec.driver._sync import SyncPoolConnectionContext, SyncPoolSessionFactory
@@ -54,6 +54,9 @@ class SqliteConnectionParams(TypedDict):
     uri: NotRequired[bool]
     autocommit: NotRequired[bool]
     pool_recycle_seconds: NotRequired[int]
+    pool_mode: NotRequired[Literal["thread_local", "single_writer"]]
+    pool_size: NotRequired[int]
+    pool_timeout: NotRequired[float]
     health_check_interval: NotRequired[float]
     enable_optimizations: NotRequired[bool]
     enable_foreign_keys: NotRequired[bool]
@@ -149,6 +152,7 @@ class SqliteDriverFeatures(TypedDict):
 _PRAGMA_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _PRAGMA_VALUE_PATTERN = re.compile(r"^[A-Za-z0-9_.\-]+$")
 _ROW_FACTORY_LITERALS = frozenset({"dict", "row", "tuple"})
+_POOL_MODES = frozenset({"single_writer", "thread_local"})
 _RUNTIME_FEATURE_KEYS = (
     "authorizer_callback",
     "custom_aggregates",
@@ -186,6 +190,7 @@ class SqliteConfig(SyncDatabaseConfig[SqliteConnection, SqliteConnectionPool, Sq
     driver_type: "ClassVar[type[SqliteDriver]]" = SqliteDriver
     connection_type: "ClassVar[type[SqliteConnection]]" = SqliteConnection
     supports_transactional_ddl: "ClassVar[bool]" = True
+    pool_connections_per_thread: "ClassVar[bool]" = True
     supports_native_arrow_export: "ClassVar[bool]" = True
     supports_native_arrow_import: "ClassVar[bool]" = True
     supports_native_parquet_export: "ClassVar[bool]" = True
@@ -235,6 +240,7 @@ class SqliteConfig(SyncDatabaseConfig[SqliteConnection, SqliteConnectionPool, Sq
                     database_path,
                 )
                 config_dict["uri"] = True
+        _validate_pool_mode(config_dict)
 
         statement_config = statement_config or default_statement_config
         statement_config, driver_features = apply_driver_features(statement_config, driver_features)
@@ -290,6 +296,7 @@ class SqliteConfig(SyncDatabaseConfig[SqliteConnection, SqliteConnectionPool, Sq
             "SqliteExceptionHandler": SqliteExceptionHandler,
             "SqliteFunctionConfig": SqliteFunctionConfig,
             "SqliteSessionContext": SqliteSessionContext,
+            "SqliteSingleWriterPool": SqliteSingleWriterPool,
         })
         return namespace
 
@@ -314,18 +321,47 @@ class SqliteConfig(SyncDatabaseConfig[SqliteConnection, SqliteConnectionPool, Sq
         if enable_foreign_keys is not None:
             pool_kwargs["enable_foreign_keys"] = enable_foreign_keys
 
-        pool = SqliteConnectionPool(
-            connection_parameters=config_dict,
-            on_connection_create=self._user_connection_hook,
-            runtime_setup=self._runtime_setup,
-            **pool_kwargs,
-        )
+        pool: SqliteConnectionPool
+        if self.connection_config.get("pool_mode") == "single_writer":
+            pool_kwargs.pop("recycle_seconds", None)
+            pool_kwargs.pop("health_check_interval", None)
+            pool = SqliteSingleWriterPool(
+                connection_parameters=config_dict,
+                pool_size=self.connection_config.get("pool_size") or 5,
+                timeout=self.connection_config.get("pool_timeout") or 30.0,
+                on_connection_create=self._user_connection_hook,
+                runtime_setup=self._runtime_setup,
+                metrics=self.get_observability_runtime().pool_metrics,
+                **pool_kwargs,
+            )
+        else:
+            pool = SqliteConnectionPool(
+                connection_parameters=config_dict,
+                on_connection_create=self._user_connection_hook,
+                runtime_setup=self._runtime_setup,
+                metrics=self.get_observability_runtime().pool_metrics,
+                **pool_kwargs,
+            )
 
         if self.driver_features.get("enable_custom_adapters", False):
             self._register_type_adapters()
 
         return pool
 
+    def _prepare_driver(self, driver: SqliteDriver) -> SqliteDriver:
+        """Attach the writer connection of a single-writer pool to the driver."""
+        driver = super()._prepare_driver(driver)
+        pool = self.connection_instance
+        if isinstance(pool, SqliteSingleWriterPool):
+            driver.attach_writer_pool(pool)
+        return driver
+
+    def _warm_target(self, count: int) -> int:
+        pool = self.connection_instance
+        if isinstance(pool, SqliteSingleWriterPool):
+            return max(0, min(count, pool.max_size))
+        return super()._warm_target(count)
+
     def _register_type_adapters(self) -> None:
         """Register custom type adapters and converters for SQLite.
 
@@ -343,6 +379,20 @@ class SqliteConfig(SyncDatabaseConfig[SqliteConnection, SqliteConnectionPool, Sq
             self.connection_instance.close()
 
 
+def _validate_pool_mode(config_dict: "dict[str, Any]") -> None:
+    pool_mode = config_dict.get("pool_mode")
+    if pool_mode is None:
+        return
+    if pool_mode not in _POOL_MODES:
+        msg = f"connection_config['pool_mode'] must be 'thread_local' or 'single_writer'; got {pool_mode!r}"
+        raise ImproperConfigurationError(msg)
+    if pool_mode == "single_writer" and "mode=memory" in str(config_dict["database"]):
+        msg = (
+            "connection_config['pool_mode'] = 'single_writer' needs a database file; in-memory databases cannot use WAL"
+        )
+        raise ImproperConfigurationError(msg)
+
+
 def _extension_pragma_statements(config: Any, extension_name: str) -> "tuple[str, ...]":
     extension_config = cast("dict[str, Any]", config.extension_config)
     settings = cast("dict[str, Any]", extension_config.get(extension_name, {}))
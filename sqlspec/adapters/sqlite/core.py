@@ -239,6 +239,9 @@ class SqliteStreamSource:
             cursor.execute(self._sql, normalize_execute_parameters(self._parameters))
         self._driver._check_pending_exception(handler)
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+
     def fetch_chunk(self) -> "list[dict[str, Any]]":
         handler = self._driver.handle_database_exceptions()
         rows: list[Any] = []
@@ -247,9 +250,23 @@ class SqliteStreamSource:
         self._driver._check_pending_exception(handler)
         if not rows:
             return []
-        if self._column_names is None:
-            self._column_names = [description[0] for description in self._cursor.description]
-        return rows_to_dicts(rows, self._column_names)
+        return rows_to_dicts(rows, self._resolve_column_names())
+
+    def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        handler = self._driver.handle_database_exceptions()
+        rows: list[Any] = []
+        with handler:
+            rows = self._cursor.fetchmany(self._chunk_size)
+        self._driver._check_pending_exception(handler)
+        return rows, self._resolve_column_names(), None
+
+    def _resolve_column_names(self) -> "list[str]":
+        column_names = self._column_names
+        if column_names is None:
+            description = self._cursor.description if self._cursor is not None else None
+            column_names = [column[0] for column in description or ()]
+            self._column_names = column_names
+        return column_names
 
     def close(self, error: bool = False) -> None:
         cursor = self._cursor
@@ -286,6 +303,8 @@ def build_connection_config(connection_config: "Mapping[str, Any]") -> "dict[str
         "health_check_interval",
         "pool_min_size",
         "pool_max_size",
+        "pool_mode",
+        "pool_size",
         "pool_timeout",
         "pool_recycle_seconds",
         "extra",
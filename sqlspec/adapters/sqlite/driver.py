@@ -1,6 +1,7 @@
 """SQLite driver implementation."""
 
 import sqlite3
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, cast
 
 from sqlspec.adapters.sqlite._typing import SqliteCursor, SqliteSessionContext
@@ -24,6 +25,7 @@ from sqlspec.driver import (
     BaseSyncExceptionHandler,
     SyncDriverAdapterBase,
     SyncRowStream,
+    SyncStatementTimeout,
     parameter_value_needs_processing,
     type_coercion_fallbacks,
 )
@@ -31,9 +33,10 @@ from sqlspec.exceptions import SQLSpecError
 from sqlspec.utils.type_guards import resolve_row_format
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Generator, Sequence
 
     from sqlspec.adapters.sqlite._typing import SqliteConnection
+    from sqlspec.adapters.sqlite.pool import SqliteSingleWriterPool
     from sqlspec.builder import QueryBuilder
     from sqlspec.core import SQL, SQLResult, Statement, StatementConfig, StatementFilter
     from sqlspec.core.compiler import OperationType
@@ -42,7 +45,10 @@ if TYPE_CHECKING:
     from sqlspec.storage import StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
     from sqlspec.typing import StatementParameters
 
-__all__ = ("SqliteCursor", "SqliteDriver", "SqliteExceptionHandler", "SqliteSessionContext")
+__all__ = ("SqliteCursor", "SqliteDriver", "SqliteExceptionHandler", "SqliteSessionContext", "SqliteStatementTimeout")
+
+_PROGRESS_HANDLER_INSTRUCTIONS = 1000
+"""SQLite VM instructions between statement timeout deadline checks."""
 
 
 class SqliteExceptionHandler(BaseSyncExceptionHandler):
@@ -67,6 +73,28 @@ class SqliteExceptionHandler(BaseSyncExceptionHandler):
         return False
 
 
+class SqliteStatementTimeout(SyncStatementTimeout):
+    """Statement timeout enforced through a SQLite progress handler.
+
+    The handler runs on the executing thread and aborts the statement with
+    ``SQLITE_INTERRUPT`` once the deadline passes.
+    """
+
+    __slots__ = ()
+
+    def arm(self) -> None:
+        self.connection.set_progress_handler(self._check_deadline, _PROGRESS_HANDLER_INSTRUCTIONS)
+
+    def disarm(self) -> None:
+        self.connection.set_progress_handler(None, 0)
+
+    def _check_deadline(self) -> int:
+        if self.expired:
+            self.timed_out = True
+            return 1
+        return 0
+
+
 class SqliteDriver(SyncDriverAdapterBase):
     """SQLite driver implementation.
 
@@ -74,7 +102,7 @@ class SqliteDriver(SyncDriverAdapterBase):
     for SQLite databases using the standard sqlite3 module.
     """
 
-    __slots__ = ("_data_dictionary", "_rowid_target_cache")
+    __slots__ = ("_data_dictionary", "_reader_connection", "_rowid_target_cache", "_writer_pool")
     dialect = "sqlite"
 
     def __init__(
@@ -98,6 +126,8 @@ class SqliteDriver(SyncDriverAdapterBase):
         super().__init__(connection=connection, statement_config=statement_config, driver_features=driver_features)
         self._data_dictionary: SqliteDataDictionary | None = None
         self._rowid_target_cache: dict[tuple[str | None, str], bool] = {}
+        self._writer_pool: SqliteSingleWriterPool | None = None
+        self._reader_connection: SqliteConnection | None = None
 
     # ─────────────────────────────────────────────────────────────────────────────
     # CORE DISPATCH METHODS
@@ -113,6 +143,9 @@ class SqliteDriver(SyncDriverAdapterBase):
         Returns:
             ExecutionResult with statement execution details
         """
+        if self._routes_to_writer(statement.operation_type):
+            with self._writer_cursor(statement) as writer_cursor:
+                return self.dispatch_execute(writer_cursor, statement)
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         self._invalidate_rowid_target_cache(statement.operation_type)
         cursor.execute(sql, normalize_execute_parameters(prepared_parameters))
@@ -162,6 +195,9 @@ class SqliteDriver(SyncDriverAdapterBase):
         Returns:
             ExecutionResult with batch execution details
         """
+        if self._routes_to_writer(statement.operation_type):
+            with self._writer_cursor(statement) as writer_cursor:
+                return self.dispatch_execute_many(writer_cursor, statement)
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         self._invalidate_rowid_target_cache(statement.operation_type)
         cursor.executemany(sql, normalize_execute_many_parameters(prepared_parameters))
@@ -178,6 +214,9 @@ class SqliteDriver(SyncDriverAdapterBase):
         Returns:
             ExecutionResult with script execution details
         """
+        if self._routes_to_writer("SCRIPT"):
+            with self._writer_cursor(statement) as writer_cursor:
+                return self.dispatch_execute_script(writer_cursor, statement)
         self._rowid_target_cache.clear()
         sql, prepared_parameters = self._compiled_sql(statement, self.statement_config)
         statements = self.split_script_statements(sql, statement.statement_config, strip_trailing_semicolon=True)
@@ -212,6 +251,10 @@ class SqliteDriver(SyncDriverAdapterBase):
             and self.observability.is_idle
             and self._can_use_execute_many_thin_path(statement, parameters, config)
         ):
+            operation = self._resolve_dml_operation_type(statement)
+            if self._routes_to_writer(operation):
+                with self._writer_connection():
+                    return self.execute_many(statement, parameters)
             try:
                 cursor = self.connection.executemany(statement, parameters)
             except sqlite3.Error as exc:
@@ -219,7 +262,6 @@ class SqliteDriver(SyncDriverAdapterBase):
 
             rowcount = cursor.rowcount
             affected_rows = rowcount if isinstance(rowcount, int) and rowcount > 0 else 0
-            operation = self._resolve_dml_operation_type(statement)
             self._invalidate_rowid_target_cache(operation)
             return DMLResult(operation, affected_rows)
         return super().execute_many(statement, parameters, *filters, statement_config=statement_config, **kwargs)
@@ -231,9 +273,14 @@ class SqliteDriver(SyncDriverAdapterBase):
     def begin(self) -> None:
         """Begin a database transaction.
 
+        With a single-writer pool the writer connection is taken first and
+        held until ``commit()`` or ``rollback()``.
+
         Raises:
             SQLSpecError: If transaction cannot be started
         """
+        if self._routes_to_writer("COMMAND"):
+            self._acquire_writer()
         try:
             if not self.connection.in_transaction:
                 self.connection.execute("BEGIN")
@@ -252,6 +299,7 @@ class SqliteDriver(SyncDriverAdapterBase):
         except sqlite3.Error as e:
             msg = f"Failed to commit transaction: {e}"
             raise SQLSpecError(msg) from e
+        self._release_writer_if_idle()
 
     def rollback(self) -> None:
         """Rollback the current transaction.
@@ -264,6 +312,7 @@ class SqliteDriver(SyncDriverAdapterBase):
         except sqlite3.Error as e:
             msg = f"Failed to rollback transaction: {e}"
             raise SQLSpecError(msg) from e
+        self._release_writer_if_idle()
 
     def with_cursor(self, connection: "SqliteConnection") -> "SqliteCursor":
         """Create context manager for SQLite cursor.
@@ -291,6 +340,80 @@ class SqliteDriver(SyncDriverAdapterBase):
         """
         return SqliteExceptionHandler()
 
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> "SqliteStatementTimeout":
+        return SqliteStatementTimeout(connection, timeout)
+
+    # ─────────────────────────────────────────────────────────────────────────────
+    # SINGLE-WRITER ROUTING
+    # ─────────────────────────────────────────────────────────────────────────────
+
+    def attach_writer_pool(self, pool: "SqliteSingleWriterPool") -> None:
+        """Route writes through the single writer connection of ``pool``.
+
+        Every statement except SELECT, ``begin()`` and Arrow loads take the writer
+        and keep it until the transaction they open ends, so reads inside that
+        transaction see its writes. All other reads stay on the session's reader.
+
+        Args:
+            pool: Single-writer pool the session's reader came from
+        """
+        self._writer_pool = pool
+
+    def release_writer(self, *, commit: bool = True) -> None:
+        """Return a held writer connection to the pool and switch back to the reader.
+
+        Args:
+            commit: Commit an open transaction, or roll it back when False
+        """
+        reader = self._reader_connection
+        pool = self._writer_pool
+        if reader is None or pool is None:
+            return
+        writer = self.connection
+        self.connection = reader
+        self._reader_connection = None
+        pool.release_writer(writer, commit=commit)
+
+    def _routes_to_writer(self, operation_type: "OperationType") -> bool:
+        return self._writer_pool is not None and self._reader_connection is None and operation_type != "SELECT"
+
+    def _acquire_writer(self) -> None:
+        pool = cast("SqliteSingleWriterPool", self._writer_pool)
+        writer = pool.acquire_writer()
+        self._reader_connection = self.connection
+        self.connection = writer
+
+    def _release_writer_if_idle(self) -> None:
+        if self._reader_connection is not None and not self.connection.in_transaction:
+            self.release_writer()
+
+    @contextmanager
+    def _writer_connection(self) -> "Generator[None, None, None]":
+        """Hold the writer while the block runs, keeping it if a transaction stays open.
+
+        Yields:
+            None once ``self.connection`` is the writer.
+        """
+        self._acquire_writer()
+        try:
+            yield
+        finally:
+            self._release_writer_if_idle()
+
+    @contextmanager
+    def _writer_cursor(self, statement: "SQL") -> "Generator[Any, None, None]":
+        """Open a writer cursor guarded by the statement timeout.
+
+        Yields:
+            Cursor on the writer connection.
+        """
+        with (
+            self._writer_connection(),
+            self._statement_timeout_scope(self.connection, statement),
+            self.with_cursor(self.connection) as cursor,
+        ):
+            yield cursor
+
     # ─────────────────────────────────────────────────────────────────────────────
     # STORAGE API
     # ─────────────────────────────────────────────────────────────────────────────
@@ -310,10 +433,15 @@ class SqliteDriver(SyncDriverAdapterBase):
         """Execute a query and write Arrow-compatible output to storage (sync)."""
 
         self._require_capability("arrow_export_enabled")
-        arrow_result = self.select_to_arrow(statement, *parameters, statement_config=statement_config, **kwargs)
-        sync_pipeline = self._storage_pipeline()
-        telemetry_payload = self._write_storage_result(
-            arrow_result, destination, format_hint=format_hint, pipeline=sync_pipeline
+        telemetry_payload = self._write_storage_stream(
+            statement,
+            parameters,
+            destination,
+            statement_config=statement_config,
+            format_hint=format_hint,
+            pipeline=self._storage_pipeline(),
+            partitioner=partitioner,
+            kwargs=kwargs,
         )
         self._attach_partition_telemetry(telemetry_payload, partitioner)
         return self._storage_job(telemetry_payload, telemetry)
@@ -330,6 +458,11 @@ class SqliteDriver(SyncDriverAdapterBase):
         """Load Arrow data into SQLite using batched inserts."""
 
         self._require_capability("arrow_import_enabled")
+        if self._routes_to_writer("COPY_FROM"):
+            with self._writer_connection():
+                return self.load_from_arrow(
+                    table, source, partitioner=partitioner, overwrite=overwrite, telemetry=telemetry
+                )
         arrow_table = self._coerce_arrow_table(source)
         columns, records = self._arrow_table_to_rows(arrow_table)
         prepared_records = (
@@ -369,10 +502,22 @@ class SqliteDriver(SyncDriverAdapterBase):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load staged artifacts from storage into SQLite."""
 
-        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format)
+        if self._is_multi_storage_source(source):
+            return self._load_storage_sources(
+                table,
+                source,
+                file_format=file_format,
+                partitioner=partitioner,
+                overwrite=overwrite,
+                columns=columns,
+                filter=filter,
+            )
+        arrow_table, inbound = self._read_storage_arrow(source, file_format=file_format, columns=columns, filter=filter)
         return self.load_from_arrow(table, arrow_table, partitioner=partitioner, overwrite=overwrite, telemetry=inbound)
 
     # ─────────────────────────────────────────────────────────────────────────────
@@ -410,6 +555,9 @@ class SqliteDriver(SyncDriverAdapterBase):
         This bypasses cursor context-manager overhead for repeated cached
         statements while preserving driver exception mapping behavior.
         """
+        if self._routes_to_writer(cached.operation_type):
+            with self._writer_connection():
+                return self._execute_cache_hit(sql, params, cached)
         direct_statement: SQL | None = None
         returns_rows = cached.operation_profile.returns_rows
         self._invalidate_rowid_target_cache(cached.operation_type)
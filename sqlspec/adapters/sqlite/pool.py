@@ -2,6 +2,7 @@
 
 import contextlib
 import logging
+import queue
 import sqlite3
 import threading
 import time
@@ -9,13 +10,16 @@ from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Final, cast
 
 from sqlspec.adapters.sqlite._typing import SqliteConnection
+from sqlspec.exceptions import SQLSpecError
 from sqlspec.utils.logging import POOL_LOGGER_NAME, get_logger, log_with_context
 from sqlspec.utils.uuids import uuid4
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
 
-__all__ = ("SqliteConnectionPool",)
+    from sqlspec.observability import PoolMetrics
+
+__all__ = ("SqliteConnectTimeoutError", "SqliteConnectionPool", "SqlitePoolClosedError", "SqliteSingleWriterPool")
 
 logger = get_logger(POOL_LOGGER_NAME)
 _ADAPTER_NAME = "sqlite"
@@ -93,6 +97,14 @@ def _apply_runtime_setup(connection: SqliteConnection, runtime_setup: "dict[str,
         connection.text_factory = runtime_setup["text_factory"]
 
 
+class SqlitePoolClosedError(SQLSpecError):
+    """Pool has been closed and cannot accept new operations."""
+
+
+class SqliteConnectTimeoutError(SQLSpecError):
+    """No connection became available within the pool timeout."""
+
+
 class SqliteConnectionPool:
     """Thread-local connection manager for SQLite.
 
@@ -106,6 +118,7 @@ class SqliteConnectionPool:
         "_enable_foreign_keys",
         "_enable_optimizations",
         "_health_check_interval",
+        "_metrics",
         "_on_connection_create",
         "_pool_id",
         "_recycle_seconds",
@@ -122,6 +135,7 @@ class SqliteConnectionPool:
         health_check_interval: float = 30.0,
         on_connection_create: "Callable[[SqliteConnection], None] | None" = None,
         runtime_setup: "dict[str, Any] | None" = None,
+        metrics: "PoolMetrics | None" = None,
     ) -> None:
         """Initialize the thread-local connection manager.
 
@@ -133,6 +147,7 @@ class SqliteConnectionPool:
             health_check_interval: Seconds of idle time before running health check
             on_connection_create: Callback executed when connection is created
             runtime_setup: Runtime feature configuration applied after internal PRAGMAs
+            metrics: Pool metrics that record connection creation latency and age
         """
         if "check_same_thread" not in connection_parameters:
             connection_parameters = {**connection_parameters, "check_same_thread": False}
@@ -144,6 +159,7 @@ class SqliteConnectionPool:
         self._health_check_interval = health_check_interval
         self._on_connection_create = on_connection_create
         self._runtime_setup = runtime_setup
+        self._metrics = metrics
         self._pool_id = str(uuid4())[:8]
 
     @property
@@ -204,11 +220,25 @@ class SqliteConnectionPool:
             return False
         return True
 
+    def _create_measured_connection(self) -> SqliteConnection:
+        """Create a connection, recording its creation latency in the pool metrics."""
+        if self._metrics is None:
+            return self._create_connection()
+        started = time.perf_counter()
+        connection = self._create_connection()
+        self._metrics.observe_connection_created(time.perf_counter() - started)
+        return connection
+
+    def _record_connection_closed(self) -> None:
+        """Record the lifetime of the current thread's connection before it is closed."""
+        if self._metrics is not None and "created_at" in self._thread_local.__dict__:
+            self._metrics.observe_connection_closed(time.time() - self._thread_local.created_at)
+
     def _get_thread_connection(self) -> SqliteConnection:
         """Get or create a connection for the current thread."""
         thread_state = self._thread_local.__dict__
         if "connection" not in thread_state:
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
             self._thread_local.last_used = time.time()
             return cast("SqliteConnection", self._thread_local.connection)
@@ -224,9 +254,10 @@ class SqliteConnectionPool:
                 recycle_seconds=self._recycle_seconds,
                 reason="exceeded_recycle_time",
             )
+            self._record_connection_closed()
             with contextlib.suppress(Exception):
                 self._thread_local.connection.close()
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
             self._thread_local.last_used = time.time()
             return cast("SqliteConnection", self._thread_local.connection)
@@ -243,9 +274,10 @@ class SqliteConnectionPool:
                 idle_seconds=round(idle_time, 1),
                 reason="failed_health_check",
             )
+            self._record_connection_closed()
             with contextlib.suppress(Exception):
                 self._thread_local.connection.close()
-            self._thread_local.connection = self._create_connection()
+            self._thread_local.connection = self._create_measured_connection()
             self._thread_local.created_at = time.time()
 
         self._thread_local.last_used = time.time()
@@ -255,6 +287,7 @@ class SqliteConnectionPool:
         """Close the connection for the current thread."""
         thread_state = self._thread_local.__dict__
         if "connection" in thread_state:
+            self._record_connection_closed()
             with contextlib.suppress(Exception):
                 self._thread_local.connection.close()
             del self._thread_local.connection
@@ -314,3 +347,253 @@ class SqliteConnectionPool:
     def checked_out(self) -> int:
         """Get number of checked out connections (always 0)."""
         return 0
+
+
+class SqliteSingleWriterPool(SqliteConnectionPool):
+    """WAL connection pool with one writer connection and ``pool_size`` read-only connections.
+
+    All writes go through the single writer connection. Callers wait for it in
+    an in-process FIFO queue instead of contending for the database write lock,
+    so writes never spin in ``busy_timeout`` retries. Reads are spread across
+    read-only connections that WAL lets run alongside the writer.
+    """
+
+    __slots__ = (
+        "_closed",
+        "_idle_readers",
+        "_pool_lock",
+        "_pool_size",
+        "_readers",
+        "_timeout",
+        "_writer",
+        "_writer_queue",
+    )
+
+    def __init__(
+        self,
+        connection_parameters: "dict[str, Any]",
+        pool_size: int = 5,
+        timeout: float = 30.0,
+        enable_optimizations: bool = SQLITE_DEFAULT_ENABLE_OPTIMIZATIONS,
+        enable_foreign_keys: bool = SQLITE_DEFAULT_ENABLE_FOREIGN_KEYS,
+        on_connection_create: "Callable[[SqliteConnection], None] | None" = None,
+        runtime_setup: "dict[str, Any] | None" = None,
+        metrics: "PoolMetrics | None" = None,
+    ) -> None:
+        """Initialize the single-writer pool.
+
+        Args:
+            connection_parameters: SQLite connection parameters
+            pool_size: Number of read-only connections
+            timeout: Seconds to wait for a reader or for the writer
+            enable_optimizations: Whether to apply performance PRAGMAs
+            enable_foreign_keys: Whether to enable foreign-key enforcement
+            on_connection_create: Callback executed when connection is created
+            runtime_setup: Runtime feature configuration applied after internal PRAGMAs
+            metrics: Pool metrics that record connection creation latency
+
+        Raises:
+            ValueError: If ``pool_size`` or ``timeout`` is not positive, or the database is in memory.
+        """
+        super().__init__(
+            connection_parameters,
+            enable_optimizations=enable_optimizations,
+            enable_foreign_keys=enable_foreign_keys,
+            on_connection_create=on_connection_create,
+            runtime_setup=runtime_setup,
+            metrics=metrics,
+        )
+        if pool_size < 1:
+            msg = "pool_size must be at least 1"
+            raise ValueError(msg)
+        if timeout <= 0:
+            msg = "timeout must be positive"
+            raise ValueError(msg)
+        if self._database_name == ":memory:":
+            msg = "single-writer pools need a database file; in-memory databases cannot use WAL"
+            raise ValueError(msg)
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._pool_lock = threading.Lock()
+        self._readers: list[SqliteConnection] = []
+        self._idle_readers: queue.LifoQueue[SqliteConnection] = queue.LifoQueue()
+        self._writer: SqliteConnection | None = None
+        self._writer_queue: queue.Queue[SqliteConnection] = queue.Queue(maxsize=1)
+        self._closed = False
+
+    def _create_wal_connection(self, *, read_only: bool) -> SqliteConnection:
+        """Create a connection in WAL mode, made read-only for readers."""
+        connection = self._create_measured_connection()
+        try:
+            row = connection.execute("PRAGMA journal_mode = WAL").fetchone()
+            journal_mode = str(row[0]).lower() if row is not None else None
+            if read_only:
+                connection.execute("PRAGMA query_only = ON")
+        except BaseException:
+            with contextlib.suppress(Exception):
+                connection.close()
+            raise
+        if journal_mode != "wal":
+            connection.close()
+            msg = f"SQLite database {self._database_name} could not switch to WAL journal mode"
+            raise SQLSpecError(msg)
+        return connection
+
+    def _check_open(self) -> None:
+        if self._closed:
+            msg = "Cannot acquire a connection from a closed pool"
+            raise SqlitePoolClosedError(msg)
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum number of read-only connections."""
+        return self._pool_size
+
+    @property
+    def writer_in_use(self) -> bool:
+        """Return True while a caller holds the writer connection."""
+        return self._writer is not None and self._writer_queue.empty()
+
+    def acquire(self) -> SqliteConnection:
+        """Acquire a read-only connection.
+
+        Returns:
+            SqliteConnection: An idle or newly opened reader
+
+        Raises:
+            SqliteConnectTimeoutError: If no reader becomes available within the timeout
+        """
+        self._check_open()
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            self._check_open()
+            if len(self._readers) < self._pool_size:
+                connection = self._create_wal_connection(read_only=True)
+                self._readers.append(connection)
+                return connection
+        try:
+            return self._idle_readers.get(timeout=self._timeout)
+        except queue.Empty:
+            msg = f"No SQLite read connection became available within {self._timeout}s"
+            raise SqliteConnectTimeoutError(msg) from None
+
+    def release(self, connection: SqliteConnection) -> None:
+        """Return a reader to the pool.
+
+        Args:
+            connection: Reader obtained from ``acquire``
+        """
+        with contextlib.suppress(Exception):
+            if connection.in_transaction:
+                connection.rollback()
+        if self._closed:
+            with contextlib.suppress(Exception):
+                connection.close()
+            return
+        self._idle_readers.put(connection)
+
+    def acquire_writer(self) -> SqliteConnection:
+        """Wait in line for the writer connection.
+
+        Returns:
+            SqliteConnection: The writer, held exclusively until ``release_writer``
+
+        Raises:
+            SqliteConnectTimeoutError: If the writer is not released within the timeout
+        """
+        self._check_open()
+        with self._pool_lock:
+            self._check_open()
+            if self._writer is None:
+                self._writer = self._create_wal_connection(read_only=False)
+                return self._writer
+        try:
+            return self._writer_queue.get(timeout=self._timeout)
+        except queue.Empty:
+            msg = f"SQLite writer connection was not released within {self._timeout}s"
+            raise SqliteConnectTimeoutError(msg) from None
+
+    def release_writer(self, connection: SqliteConnection, *, commit: bool = True) -> None:
+        """Finish the writer's open transaction and hand it to the next caller in line.
+
+        Args:
+            connection: Writer obtained from ``acquire_writer``
+            commit: Commit an open transaction, or roll it back when False
+        """
+        if connection.in_transaction:
+            try:
+                if commit:
+                    connection.commit()
+                else:
+                    connection.rollback()
+            except Exception:
+                with contextlib.suppress(Exception):
+                    connection.rollback()
+                log_with_context(
+                    logger,
+                    logging.WARNING,
+                    "pool.writer.release.error",
+                    adapter=_ADAPTER_NAME,
+                    pool_id=self._pool_id,
+                    database=self._database_name,
+                )
+        if self._closed:
+            with contextlib.suppress(Exception):
+                connection.close()
+            return
+        self._writer_queue.put_nowait(connection)
+
+    @contextmanager
+    def get_connection(self) -> "Generator[SqliteConnection, None, None]":
+        """Get a read-only connection.
+
+        Yields:
+            SqliteConnection: A reader, returned to the pool on exit.
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def get_writer(self) -> "Generator[SqliteConnection, None, None]":
+        """Get the writer connection, committing on success and rolling back on error.
+
+        Yields:
+            SqliteConnection: The writer connection.
+        """
+        connection = self.acquire_writer()
+        try:
+            yield connection
+        except BaseException:
+            self.release_writer(connection, commit=False)
+            raise
+        self.release_writer(connection)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out connections close when released."""
+        with self._pool_lock:
+            self._closed = True
+            self._readers.clear()
+            self._writer = None
+        connections: list[SqliteConnection] = []
+        with contextlib.suppress(queue.Empty):
+            while True:
+                connections.append(self._idle_readers.get_nowait())
+        with contextlib.suppress(queue.Empty):
+            connections.append(self._writer_queue.get_nowait())
+        for connection in connections:
+            with contextlib.suppress(Exception):
+                connection.close()
+
+    def size(self) -> int:
+        """Get the number of open read-only connections."""
+        return len(self._readers)
+
+    def checked_out(self) -> int:
+        """Get the number of read-only connections in use."""
+        return max(0, len(self._readers) - self._idle_readers.qsize())
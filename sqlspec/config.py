@@ -9,12 +9,16 @@ modules only after proving the boundary with installed-wheel smoke coverage.
 """
 
 import asyncio
+import logging
+import sys
 import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from difflib import get_close_matches
-from inspect import Signature, signature
+from inspect import Signature, isawaitable, signature
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, TypeAlias, TypeVar, cast
 
 from typing_extensions import NotRequired, TypedDict
@@ -27,13 +31,17 @@ from sqlspec.core.config_runtime import (
     create_sync_pool,
     seed_runtime_driver_features,
 )
+from sqlspec.core.load_shedding import AdmissionControl
+from sqlspec.core.pool_sizing import PoolAutoscaler
+from sqlspec.core.retry import RetryBudget
 from sqlspec.exceptions import ImproperConfigurationError, MissingDependencyError
 from sqlspec.extensions.events import EventRuntimeHints
 from sqlspec.loader import SQLFileLoader
 from sqlspec.migrations import AsyncMigrationTracker, SyncMigrationTracker, create_migration_commands
 from sqlspec.observability import ObservabilityConfig, ObservabilityRuntime
+from sqlspec.observability._pool import is_pool_timeout
 from sqlspec.typing import ConnectionT, PoolT
-from sqlspec.utils.logging import get_logger
+from sqlspec.utils.logging import POOL_LOGGER_NAME, get_logger, log_with_context
 from sqlspec.utils.module_loader import ensure_pyarrow
 
 if TYPE_CHECKING:
@@ -41,8 +49,11 @@ if TYPE_CHECKING:
     from contextlib import AbstractAsyncContextManager, AbstractContextManager
 
     from sqlspec.core import StatementConfig
+    from sqlspec.core.load_shedding import AdmissionLimiter, CircuitBreaker
+    from sqlspec.core.pool_sizing import PoolSizeDecision, PoolSizingPolicy
     from sqlspec.driver import AsyncDriverAdapterBase, SyncDriverAdapterBase
     from sqlspec.migrations.commands import AsyncMigrationCommands, SyncMigrationCommands
+    from sqlspec.observability import PoolGauges, PoolMetrics
     from sqlspec.storage import StorageCapabilities
 
 
@@ -88,6 +99,7 @@ ConfigT = TypeVar(
 DriverT = TypeVar("DriverT", bound="SyncDriverAdapterBase | AsyncDriverAdapterBase")
 
 logger = get_logger("sqlspec.config")
+pool_logger = get_logger(POOL_LOGGER_NAME)
 
 DRIVER_FEATURE_LIFECYCLE_HOOKS: dict[str, str | None] = {
     "on_connection_create": "connection",
@@ -882,6 +894,9 @@ class PrometheusConfig(TypedDict):
     duration_buckets: NotRequired[tuple[float, ...]]
     """Histogram buckets for query duration (seconds)."""
 
+    pool_metrics: NotRequired[bool]
+    """Export connection pool wait, occupancy and lifetime metrics. Default: True."""
+
 
 ExtensionConfigs: TypeAlias = dict[
     str,
@@ -909,18 +924,28 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
     """
 
     __slots__ = (
+        "__weakref__",
+        "_acquire_lock",
+        "_admission_control",
         "_migration_commands",
         "_migration_config",
         "_migration_loader",
         "_observability_runtime",
+        "_pending_acquires",
+        "_pool_autoscaler",
+        "_retry_budget",
         "_storage_capabilities",
+        "admission_limiter",
         "bind_key",
+        "circuit_breaker",
         "connection_config",
         "connection_instance",
         "driver_features",
         "extension_config",
         "observability_config",
+        "pool_sizing",
         "statement_config",
+        "warm_on_startup",
     )
 
     _migration_loader: "SQLFileLoader"
@@ -935,6 +960,8 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
     _default_statement_config: "ClassVar[StatementConfig]"
     is_async: "ClassVar[bool]" = False
     supports_connection_pooling: "ClassVar[bool]" = False
+    supports_pool_resizing: "ClassVar[bool]" = False
+    pool_connections_per_thread: "ClassVar[bool]" = False
     supports_transactional_ddl: "ClassVar[bool]" = False
     supports_native_arrow_import: "ClassVar[bool]" = False
     supports_native_arrow_export: "ClassVar[bool]" = False
@@ -956,6 +983,13 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
     _storage_capabilities: "StorageCapabilities | None"
     observability_config: "ObservabilityConfig | None"
     _observability_runtime: "ObservabilityRuntime | None"
+    circuit_breaker: "CircuitBreaker | None"
+    admission_limiter: "AdmissionLimiter | None"
+    _admission_control: "AdmissionControl | None"
+    pool_sizing: "PoolSizingPolicy | None"
+    _pool_autoscaler: "PoolAutoscaler | None"
+    _retry_budget: "RetryBudget"
+    warm_on_startup: int
 
     def __hash__(self) -> int:
         return id(self)
@@ -974,6 +1008,14 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
         ])
         return f"{type(self).__name__}({parts})"
 
+    @property
+    def retry_budget(self) -> "RetryBudget":
+        """Return the retry budget shared by every session of this config.
+
+        Retry policies without a budget of their own draw from it.
+        """
+        return self._retry_budget
+
     @property
     def migration_config(self) -> "dict[str, Any] | MigrationConfig":
         """Return the current migration configuration."""
@@ -1022,8 +1064,84 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
         """Attach merged observability runtime composed from registry and adapter overrides."""
         merged = ObservabilityConfig.merge(registry_config, self.observability_config)
         self._observability_runtime = ObservabilityRuntime(
-            merged, bind_key=self.bind_key, config_name=type(self).__name__
+            merged, bind_key=self.bind_key, config_name=type(self).__name__, owner=self
         )
+        if self._observability_runtime.pool_metrics is not None:
+            self._observability_runtime.pool_metrics.set_gauge_source(self.pool_gauges)
+        if self._admission_control is not None:
+            self._observability_runtime.add_outcome_listener(self._admission_control.observe)
+
+    def pool_gauges(self) -> "PoolGauges | None":
+        """Return live occupancy of the connection pool for pool metrics.
+
+        Adapters override this using their native pool statistics. The default
+        reports nothing, leaving only the acquire and connection counters.
+
+        Returns:
+            Pool size, checked-out and idle counts, or None when the pool is not
+            created yet or exposes no statistics.
+        """
+        return None
+
+    def pool_spare_capacity(self) -> int:
+        """Return how many connections the pool can hand out without queuing.
+
+        The default derives the count from ``pool_gauges()``: idle connections
+        plus the room left to grow. Acquires already in flight are not subtracted.
+
+        Returns:
+            Idle plus growable connection slots, ``sys.maxsize`` for unbounded pools,
+            or 0 when the pool exposes no statistics.
+        """
+        gauges = self.pool_gauges()
+        if gauges is None:
+            return 0
+        max_size = gauges["max_size"]
+        if max_size is None:
+            return sys.maxsize
+        return gauges["idle"] + max(0, max_size - gauges["size"])
+
+    def _begin_acquire(self, *, require_capacity: bool = False) -> bool:
+        """Register a pool acquire in flight.
+
+        The capacity check and the registration happen under one lock, so
+        concurrent callers cannot both claim the last spare connection.
+
+        Args:
+            require_capacity: Only register when a spare connection is left after
+                the acquires already in flight.
+
+        Returns:
+            False when ``require_capacity`` is set and the pool has no unclaimed spare connection.
+        """
+        with self._acquire_lock:
+            if require_capacity and self.pool_spare_capacity() <= self._pending_acquires:
+                return False
+            self._pending_acquires += 1
+            return True
+
+    def _acquire_would_wait(self, *, registered: bool = False) -> bool:
+        """Return True when a new acquire would queue for a pooled connection.
+
+        An acquire waits when the acquires already in flight claim every spare
+        connection. Pools that are not created yet and thread-local pools without
+        statistics never wait; other pools without statistics are assumed to wait.
+
+        Args:
+            registered: The caller is already counted by ``_begin_acquire``.
+        """
+        if not self.supports_connection_pooling or self.connection_instance is None:
+            return False
+        if self.pool_connections_per_thread and self.pool_gauges() is None:
+            return False
+        with self._acquire_lock:
+            in_flight = self._pending_acquires - 1 if registered else self._pending_acquires
+            return self.pool_spare_capacity() <= in_flight
+
+    def _end_acquire(self) -> None:
+        """Unregister an acquire registered by ``_begin_acquire`` once the pool has answered."""
+        with self._acquire_lock:
+            self._pending_acquires = max(0, self._pending_acquires - 1)
 
     def get_observability_runtime(self) -> "ObservabilityRuntime":
         """Return the attached runtime, creating a disabled instance when missing."""
@@ -1399,6 +1517,7 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
                 registry=prom_config.get("registry"),
                 label_names=label_names,
                 duration_buckets=duration_buckets,
+                pool_metrics=prom_config.get("pool_metrics", True),
             )
 
         if updated is not self.observability_config:
@@ -1444,11 +1563,285 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
         return _DriverFeatureHookWrapper(callback, context_key, expects_argument)
 
     def _prepare_driver(self, driver: DriverT) -> DriverT:
-        """Attach observability runtime to driver instances before returning them."""
+        """Attach observability runtime, retry budget and admission control to drivers before returning them."""
 
         driver.attach_observability(self.get_observability_runtime())
+        driver.attach_retry_budget(self._retry_budget)
+        if self._admission_control is not None:
+            driver.attach_admission_control(self._admission_control)
         return driver
 
+    def _guard_acquire(self, acquire: "Callable[[], Any]") -> "Callable[[], Any]":
+        """Wrap a session ``acquire_connection`` callable with the circuit breaker, waiter limit,
+        pool metrics, pool autoscaler and in-flight acquire tracking.
+
+        Returns ``acquire`` unchanged when none of them apply.
+        """
+        acquire = self._track_acquire(self._measure_acquire(self._autoscale_acquire(acquire)))
+        control = self._admission_control
+        if control is None:
+            return acquire
+        runtime = self.get_observability_runtime()
+        if self.is_async:
+
+            async def guarded_async_acquire() -> Any:
+                waited = control.enter_acquire(runtime, waiting=self._acquire_would_wait())
+                try:
+                    connection = await acquire()
+                except Exception as exc:
+                    control.exit_acquire(runtime, exc, waited=waited)
+                    raise
+                control.exit_acquire(runtime, None, waited=waited)
+                return connection
+
+            return guarded_async_acquire
+
+        def guarded_acquire() -> Any:
+            waited = control.enter_acquire(runtime, waiting=self._acquire_would_wait())
+            try:
+                connection = acquire()
+            except Exception as exc:
+                control.exit_acquire(runtime, exc, waited=waited)
+                raise
+            control.exit_acquire(runtime, None, waited=waited)
+            return connection
+
+        return guarded_acquire
+
+    def _track_acquire(self, acquire: "Callable[[], Any]") -> "Callable[[], Any]":
+        """Wrap an acquire callable so it counts as in flight until the pool answers.
+
+        Returns ``acquire`` unchanged for configs without a connection pool.
+        """
+        if not self.supports_connection_pooling:
+            return acquire
+        if self.is_async:
+
+            async def tracked_async_acquire() -> Any:
+                self._begin_acquire()
+                try:
+                    return await acquire()
+                finally:
+                    self._end_acquire()
+
+            return tracked_async_acquire
+
+        def tracked_acquire() -> Any:
+            self._begin_acquire()
+            try:
+                return acquire()
+            finally:
+                self._end_acquire()
+
+        return tracked_acquire
+
+    def _measure_acquire(self, acquire: "Callable[[], Any]") -> "Callable[[], Any]":
+        """Wrap an acquire callable so its wait time and timeouts feed the pool metrics.
+
+        Returns ``acquire`` unchanged when pool metrics are disabled.
+        """
+        metrics = self.get_observability_runtime().pool_metrics
+        if metrics is None:
+            return acquire
+        if self.is_async:
+
+            async def measured_async_acquire() -> Any:
+                started = perf_counter()
+                try:
+                    connection = await acquire()
+                except Exception as exc:
+                    if is_pool_timeout(exc):
+                        metrics.observe_acquire_timeout(perf_counter() - started)
+                    raise
+                metrics.observe_acquire(perf_counter() - started)
+                return connection
+
+            return measured_async_acquire
+
+        def measured_acquire() -> Any:
+            started = perf_counter()
+            try:
+                connection = acquire()
+            except Exception as exc:
+                if is_pool_timeout(exc):
+                    metrics.observe_acquire_timeout(perf_counter() - started)
+                raise
+            metrics.observe_acquire(perf_counter() - started)
+            return connection
+
+        return measured_acquire
+
+    def _guard_release(self, release: "Callable[..., Any]") -> "Callable[..., Any]":
+        """Wrap a session ``release_connection`` callable so the pool autoscaler sees the release.
+
+        Returns ``release`` unchanged when no ``pool_sizing`` policy is configured.
+        """
+        autoscaler = self._pool_autoscaler
+        if autoscaler is None:
+            return release
+        if self.is_async:
+
+            async def autoscaled_async_release(connection: Any, **kwargs: Any) -> None:
+                try:
+                    await release(connection, **kwargs)
+                finally:
+                    autoscaler.exit()
+
+            return autoscaled_async_release
+
+        def autoscaled_release(connection: Any, **kwargs: Any) -> None:
+            try:
+                release(connection, **kwargs)
+            finally:
+                autoscaler.exit()
+
+        return autoscaled_release
+
+    def _autoscale_acquire(self, acquire: "Callable[[], Any]") -> "Callable[[], Any]":
+        """Wrap an acquire callable so the pool autoscaler sees demand and can resize the pool.
+
+        Returns ``acquire`` unchanged when no ``pool_sizing`` policy is configured.
+        """
+        autoscaler = self._pool_autoscaler
+        if autoscaler is None:
+            return acquire
+        if self.is_async:
+
+            async def autoscaled_async_acquire() -> Any:
+                autoscaler.enter()
+                started = perf_counter()
+                try:
+                    await self._autoscale_evaluate_async(autoscaler)
+                    connection = await acquire()
+                except BaseException:
+                    autoscaler.abandon()
+                    raise
+                autoscaler.acquired(perf_counter() - started)
+                return connection
+
+            return autoscaled_async_acquire
+
+        def autoscaled_acquire() -> Any:
+            autoscaler.enter()
+            started = perf_counter()
+            try:
+                self._autoscale_evaluate(autoscaler)
+                connection = acquire()
+            except BaseException:
+                autoscaler.abandon()
+                raise
+            autoscaler.acquired(perf_counter() - started)
+            return connection
+
+        return autoscaled_acquire
+
+    def _autoscale_evaluate(self, autoscaler: "PoolAutoscaler") -> None:
+        """Evaluate the autoscaler and apply its decision to a sync pool."""
+        decision = autoscaler.evaluate()
+        if decision is None:
+            return
+        try:
+            self._resize_pool(decision.size)
+        except Exception as exc:
+            self._pool_resize_failed(autoscaler, decision, exc)
+            return
+        self._pool_resized(decision)
+
+    async def _autoscale_evaluate_async(self, autoscaler: "PoolAutoscaler") -> None:
+        """Evaluate the autoscaler and apply its decision to an async pool."""
+        decision = autoscaler.evaluate()
+        if decision is None:
+            return
+        try:
+            result = self._resize_pool(decision.size)
+            if isawaitable(result):
+                await result
+        except Exception as exc:
+            self._pool_resize_failed(autoscaler, decision, exc)
+            return
+        self._pool_resized(decision)
+
+    def _resize_pool(self, size: int) -> "Awaitable[None] | None":
+        """Resize the live pool to ``size`` connections for adaptive pool sizing.
+
+        Adapters that set ``supports_pool_resizing`` override this. Implementations
+        do nothing before the pool exists; pool creation reads the current size
+        from the autoscaler instead.
+
+        Args:
+            size: New pool capacity chosen by the autoscaler.
+        """
+        raise NotImplementedError
+
+    def _pool_resized(self, decision: "PoolSizeDecision") -> None:
+        runtime = self.get_observability_runtime()
+        runtime.increment_metric("pool.autoscale.resizes")
+        runtime.record_metric("pool.autoscale.size", float(decision.size))
+        log_with_context(
+            pool_logger,
+            logging.INFO,
+            "pool.autoscale.resize",
+            config=type(self).__name__,
+            bind_key=self.bind_key,
+            previous_size=decision.previous_size,
+            size=decision.size,
+            concurrency=round(decision.concurrency, 3),
+            arrival_rate=round(decision.arrival_rate, 3),
+            mean_latency_ms=round(decision.mean_latency * 1000, 3),
+            mean_wait_ms=round(decision.mean_wait * 1000, 3),
+        )
+
+    def _pool_resize_failed(self, autoscaler: "PoolAutoscaler", decision: "PoolSizeDecision", error: Exception) -> None:
+        autoscaler.restore_size(decision.previous_size)
+        log_with_context(
+            pool_logger,
+            logging.WARNING,
+            "pool.autoscale.resize.error",
+            config=type(self).__name__,
+            bind_key=self.bind_key,
+            previous_size=decision.previous_size,
+            size=decision.size,
+            error=str(error),
+        )
+
+    def _warm_target(self, count: int) -> int:
+        """Clamp a warm-up request to what the pool can hold without queuing.
+
+        Pools that keep one connection per thread can only open the calling
+        thread's connection ahead of time.
+        """
+        if count <= 0:
+            return 0
+        if self.pool_connections_per_thread:
+            return 1
+        if self._pool_autoscaler is not None:
+            count = min(count, self._pool_autoscaler.size)
+        gauges = self.pool_gauges()
+        if gauges is not None and gauges["max_size"] is not None:
+            count = min(count, gauges["max_size"])
+        return count
+
+    def _warm_connection_failed(self, error: BaseException) -> None:
+        log_with_context(
+            pool_logger,
+            logging.WARNING,
+            "pool.warmup.connection.error",
+            config=type(self).__name__,
+            bind_key=self.bind_key,
+            error=str(error),
+        )
+
+    def _pool_warmed(self, requested: int, opened: int) -> None:
+        log_with_context(
+            pool_logger,
+            logging.DEBUG,
+            "pool.warmup.complete",
+            config=type(self).__name__,
+            bind_key=self.bind_key,
+            requested=requested,
+            opened=opened,
+        )
+
     @staticmethod
     def _dependency_available(checker: "Callable[[], None]") -> bool:
         try:
@@ -1510,6 +1903,10 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
         extension_config: "ExtensionConfigs | None",
         observability_config: "ObservabilityConfig | None",
         default_dialect: str,
+        circuit_breaker: "CircuitBreaker | None" = None,
+        admission_limiter: "AdmissionLimiter | None" = None,
+        pool_sizing: "PoolSizingPolicy | None" = None,
+        warm_on_startup: int = 0,
     ) -> None:
         """Populate the configuration state shared by every base config class.
 
@@ -1519,6 +1916,25 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
         capabilities, and attaches lifecycle and observability extensions.
         """
         self.bind_key = bind_key
+        self.circuit_breaker = circuit_breaker
+        self.admission_limiter = admission_limiter
+        self._admission_control = (
+            AdmissionControl(circuit_breaker, admission_limiter)
+            if circuit_breaker is not None or admission_limiter is not None
+            else None
+        )
+        self._retry_budget = RetryBudget()
+        self._acquire_lock = threading.Lock()
+        self._pending_acquires = 0
+        if pool_sizing is not None and not self.supports_pool_resizing:
+            msg = f"{type(self).__name__} does not support adaptive pool sizing"
+            raise ImproperConfigurationError(msg)
+        self.pool_sizing = pool_sizing
+        self._pool_autoscaler = PoolAutoscaler(pool_sizing) if pool_sizing is not None else None
+        if warm_on_startup < 0:
+            msg = "warm_on_startup must not be negative"
+            raise ImproperConfigurationError(msg)
+        self.warm_on_startup = warm_on_startup
         self.connection_instance = connection_instance
         self.connection_config = connection_config or {}
         self.extension_config = extension_config or {}
@@ -1531,9 +1947,27 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
         self._attach_lifecycle_hooks()
         self._configure_observability_extensions()
 
-    def _provide_connection_impl(self, *args: Any, **kwargs: Any) -> Any:
-        """Build the connection context manager shared by pooled configs."""
-        return self._connection_context_class(self)
+    def _provide_connection_impl(self, *args: Any, reserved: bool = False, **kwargs: Any) -> Any:
+        """Build the connection context manager shared by pooled configs.
+
+        Args:
+            *args: Ignored positional arguments.
+            reserved: The caller already registered the acquire with ``_begin_acquire``.
+            **kwargs: Ignored keyword arguments.
+
+        Returns:
+            The adapter connection context, wrapped for the pool autoscaler, pool
+            metrics, admission control and acquire tracking when those apply.
+        """
+        context = self._connection_context_class(self)
+        if self._pool_autoscaler is not None:
+            context = _AutoscaledConnectionContext(context, self, self._pool_autoscaler)
+        metrics = self.get_observability_runtime().pool_metrics
+        if metrics is not None:
+            context = _MeasuredConnectionContext(context, metrics)
+        if reserved or self._admission_control is not None:
+            context = _GuardedConnectionContext(context, self, reserved=reserved)
+        return context
 
     def _provide_session_impl(
         self, *args: Any, statement_config: "StatementConfig | None" = None, **kwargs: Any
@@ -1541,8 +1975,8 @@ class DatabaseConfigProtocol(ABC, Generic[ConnectionT, PoolT, DriverT]):
         """Build the session context manager shared by pooled configs."""
         handler = self._session_factory_class(self)
         return self._session_context_class(
-            acquire_connection=handler.acquire_connection,
-            release_connection=handler.release_connection,
+            acquire_connection=self._guard_acquire(handler.acquire_connection),
+            release_connection=self._guard_release(handler.release_connection),
             statement_config=statement_config or self.statement_config or self._default_statement_config,
             driver_features=self.driver_features,
             prepare_driver=self._prepare_driver,
@@ -1698,6 +2132,8 @@ class NoPoolSyncConfig(_SyncMigrationMixin, DatabaseConfigProtocol[ConnectionT,
         bind_key: "str | None" = None,
         extension_config: "ExtensionConfigs | None" = None,
         observability_config: "ObservabilityConfig | None" = None,
+        circuit_breaker: "CircuitBreaker | None" = None,
+        admission_limiter: "AdmissionLimiter | None" = None,
     ) -> None:
         self._init_config_state(
             connection_config=connection_config,
@@ -1709,6 +2145,8 @@ class NoPoolSyncConfig(_SyncMigrationMixin, DatabaseConfigProtocol[ConnectionT,
             extension_config=extension_config,
             observability_config=observability_config,
             default_dialect="sqlite",
+            circuit_breaker=circuit_breaker,
+            admission_limiter=admission_limiter,
         )
 
     def create_connection(self) -> ConnectionT:
@@ -1754,6 +2192,8 @@ class NoPoolAsyncConfig(_AsyncMigrationMixin, DatabaseConfigProtocol[ConnectionT
         bind_key: "str | None" = None,
         extension_config: "ExtensionConfigs | None" = None,
         observability_config: "ObservabilityConfig | None" = None,
+        circuit_breaker: "CircuitBreaker | None" = None,
+        admission_limiter: "AdmissionLimiter | None" = None,
     ) -> None:
         self._init_config_state(
             connection_config=connection_config,
@@ -1765,6 +2205,8 @@ class NoPoolAsyncConfig(_AsyncMigrationMixin, DatabaseConfigProtocol[ConnectionT
             extension_config=extension_config,
             observability_config=observability_config,
             default_dialect="sqlite",
+            circuit_breaker=circuit_breaker,
+            admission_limiter=admission_limiter,
         )
 
     async def create_connection(self) -> ConnectionT:
@@ -1810,6 +2252,10 @@ class SyncDatabaseConfig(_SyncMigrationMixin, DatabaseConfigProtocol[ConnectionT
         bind_key: "str | None" = None,
         extension_config: "ExtensionConfigs | None" = None,
         observability_config: "ObservabilityConfig | None" = None,
+        circuit_breaker: "CircuitBreaker | None" = None,
+        admission_limiter: "AdmissionLimiter | None" = None,
+        pool_sizing: "PoolSizingPolicy | None" = None,
+        warm_on_startup: int = 0,
         **kwargs: Any,
     ) -> None:
         self._reject_unexpected_kwargs(kwargs)
@@ -1823,6 +2269,10 @@ class SyncDatabaseConfig(_SyncMigrationMixin, DatabaseConfigProtocol[ConnectionT
             extension_config=extension_config,
             observability_config=observability_config,
             default_dialect="postgres",
+            circuit_breaker=circuit_breaker,
+            admission_limiter=admission_limiter,
+            pool_sizing=pool_sizing,
+            warm_on_startup=warm_on_startup,
         )
         self._pool_lock = threading.Lock()
 
@@ -1844,8 +2294,50 @@ class SyncDatabaseConfig(_SyncMigrationMixin, DatabaseConfigProtocol[ConnectionT
             self.get_observability_runtime().emit_pool_create_sync,
         )
         self.connection_instance = created_pool
+        if self.warm_on_startup:
+            self._open_warm_connections(self._warm_target(self.warm_on_startup))
         return cast("PoolT", created_pool)
 
+    def warm_pool(self, count: "int | None" = None) -> int:
+        """Open pooled connections ahead of traffic, creating the pool if needed.
+
+        ``create_pool()`` already does this for ``warm_on_startup`` connections,
+        so framework startup hooks warm the pool without calling this method.
+
+        Args:
+            count: Connections to open. Defaults to ``warm_on_startup``.
+
+        Returns:
+            Number of connections opened and returned to the pool.
+        """
+        self.create_pool()
+        return self._open_warm_connections(self._warm_target(self.warm_on_startup if count is None else count))
+
+    def _open_warm_connections(self, count: int) -> int:
+        """Check out ``count`` connections at once from worker threads, then release them.
+
+        Holding every connection until all are open forces the pool to create
+        distinct connections instead of handing the same idle one back.
+        """
+        if count <= 0:
+            return 0
+        contexts = [self._connection_context_class(self) for _ in range(count)]
+        if count == 1:
+            errors = [_enter_warm_context(contexts[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=count, thread_name_prefix="sqlspec-warmup") as executor:
+                errors = list(executor.map(_enter_warm_context, contexts))
+        entered: list[Any] = []
+        for context, error in zip(contexts, errors, strict=True):
+            if error is None:
+                entered.append(context)
+            else:
+                self._warm_connection_failed(error)
+        for context in entered:
+            context.__exit__(None, None, None)
+        self._pool_warmed(count, len(entered))
+        return len(entered)
+
     def close_pool(self) -> None:
         """Close the connection pool."""
         pool = self.connection_instance
@@ -1904,6 +2396,10 @@ class AsyncDatabaseConfig(_AsyncMigrationMixin, DatabaseConfigProtocol[Connectio
         bind_key: "str | None" = None,
         extension_config: "ExtensionConfigs | None" = None,
         observability_config: "ObservabilityConfig | None" = None,
+        circuit_breaker: "CircuitBreaker | None" = None,
+        admission_limiter: "AdmissionLimiter | None" = None,
+        pool_sizing: "PoolSizingPolicy | None" = None,
+        warm_on_startup: int = 0,
         **kwargs: Any,
     ) -> None:
         self._reject_unexpected_kwargs(kwargs)
@@ -1917,6 +2413,10 @@ class AsyncDatabaseConfig(_AsyncMigrationMixin, DatabaseConfigProtocol[Connectio
             extension_config=extension_config,
             observability_config=observability_config,
             default_dialect="postgres",
+            circuit_breaker=circuit_breaker,
+            admission_limiter=admission_limiter,
+            pool_sizing=pool_sizing,
+            warm_on_startup=warm_on_startup,
         )
         self._pool_lock = asyncio.Lock()
 
@@ -1938,8 +2438,51 @@ class AsyncDatabaseConfig(_AsyncMigrationMixin, DatabaseConfigProtocol[Connectio
             self.get_observability_runtime().emit_pool_create_async,
         )
         self.connection_instance = created_pool
+        if self.warm_on_startup:
+            await self._open_warm_connections(self._warm_target(self.warm_on_startup))
         return cast("PoolT", created_pool)
 
+    async def warm_pool(self, count: "int | None" = None) -> int:
+        """Open pooled connections ahead of traffic, creating the pool if needed.
+
+        ``create_pool()`` already does this for ``warm_on_startup`` connections,
+        so framework startup hooks warm the pool without calling this method.
+
+        Args:
+            count: Connections to open. Defaults to ``warm_on_startup``.
+
+        Returns:
+            Number of connections opened and returned to the pool.
+        """
+        await self.create_pool()
+        return await self._open_warm_connections(self._warm_target(self.warm_on_startup if count is None else count))
+
+    async def _open_warm_connections(self, count: int) -> int:
+        """Check out ``count`` connections concurrently, then release them.
+
+        Holding every connection until all are open forces the pool to create
+        distinct connections, so their handshakes overlap instead of queuing.
+        """
+        if count <= 0:
+            return 0
+        contexts = [self._connection_context_class(self) for _ in range(count)]
+        results = await asyncio.gather(*(context.__aenter__() for context in contexts), return_exceptions=True)
+        entered: list[Any] = []
+        interrupted: BaseException | None = None
+        for context, result in zip(contexts, results, strict=True):
+            if not isinstance(result, BaseException):
+                entered.append(context)
+            elif isinstance(result, Exception):
+                self._warm_connection_failed(result)
+            elif interrupted is None:
+                interrupted = result
+        for context in entered:
+            await context.__aexit__(None, None, None)
+        if interrupted is not None:
+            raise interrupted
+        self._pool_warmed(count, len(entered))
+        return len(entered)
+
     async def close_pool(self) -> None:
         """Close the connection pool."""
         pool = self.connection_instance
@@ -1970,6 +2513,37 @@ class AsyncDatabaseConfig(_AsyncMigrationMixin, DatabaseConfigProtocol[Connectio
             self._provide_session_impl(*args, statement_config=statement_config, **kwargs),
         )
 
+    def pool_has_spare_capacity(self) -> bool:
+        """Return whether the pool can hand out another connection without queuing.
+
+        Acquires already in flight count against ``pool_spare_capacity()``.
+
+        Returns:
+            True when an idle connection exists or the pool can still grow.
+        """
+        with self._acquire_lock:
+            return self.pool_spare_capacity() > self._pending_acquires
+
+    def provide_auxiliary_connection(self) -> "AbstractAsyncContextManager[ConnectionT] | None":
+        """Provide a second pooled connection when the pool is not under pressure.
+
+        The spare connection is claimed atomically before the context is returned,
+        and the acquire itself goes through admission control like any session.
+
+        Returns:
+            A connection context manager, or None when the pool is not created
+            yet or has no spare capacity.
+        """
+        if self.connection_instance is None or not self._begin_acquire(require_capacity=True):
+            return None
+        return cast("AbstractAsyncContextManager[ConnectionT]", self._provide_connection_impl(reserved=True))
+
+    def _prepare_driver(self, driver: DriverT) -> DriverT:
+        """Attach observability and the auxiliary connection provider to drivers."""
+        driver = super()._prepare_driver(driver)
+        driver.attach_connection_provider(self.provide_auxiliary_connection)
+        return driver
+
     @abstractmethod
     async def _create_pool(self) -> PoolT:
         """Actual async pool creation implementation."""
@@ -1981,6 +2555,14 @@ class AsyncDatabaseConfig(_AsyncMigrationMixin, DatabaseConfigProtocol[Connectio
         raise NotImplementedError
 
 
+def _enter_warm_context(context: Any) -> "Exception | None":
+    try:
+        context.__enter__()
+    except Exception as exc:
+        return exc
+    return None
+
+
 class _DriverFeatureHookWrapper:
     __slots__ = ("_callback", "_context_key", "_expects_argument")
 
@@ -1997,3 +2579,161 @@ class _DriverFeatureHookWrapper:
             self._callback(context)
             return
         self._callback(context.get(self._context_key))
+
+
+class _MeasuredConnectionContext:
+    """Connection context wrapper that records acquire wait time in the pool metrics."""
+
+    __slots__ = ("_context", "_metrics")
+
+    def __init__(self, context: Any, metrics: "PoolMetrics") -> None:
+        self._context = context
+        self._metrics = metrics
+
+    def __enter__(self) -> Any:
+        started = perf_counter()
+        try:
+            connection = self._context.__enter__()
+        except Exception as exc:
+            if is_pool_timeout(exc):
+                self._metrics.observe_acquire_timeout(perf_counter() - started)
+            raise
+        self._metrics.observe_acquire(perf_counter() - started)
+        return connection
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> "bool | None":
+        return cast("bool | None", self._context.__exit__(exc_type, exc_val, exc_tb))
+
+    async def __aenter__(self) -> Any:
+        started = perf_counter()
+        try:
+            connection = await self._context.__aenter__()
+        except Exception as exc:
+            if is_pool_timeout(exc):
+                self._metrics.observe_acquire_timeout(perf_counter() - started)
+            raise
+        self._metrics.observe_acquire(perf_counter() - started)
+        return connection
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> "bool | None":
+        return cast("bool | None", await self._context.__aexit__(exc_type, exc_val, exc_tb))
+
+
+class _GuardedConnectionContext:
+    """Connection context wrapper that applies admission control and acquire tracking.
+
+    Contexts created with ``reserved=True`` were registered by
+    ``_begin_acquire`` already; the registration is released once the pool answers.
+    """
+
+    __slots__ = ("_config", "_context", "_reserved")
+
+    def __init__(self, context: Any, config: "DatabaseConfigProtocol[Any, Any, Any]", *, reserved: bool) -> None:
+        self._context = context
+        self._config = config
+        self._reserved = reserved
+
+    def __enter__(self) -> Any:
+        config = self._config
+        control = config._admission_control  # pyright: ignore[reportPrivateUsage]
+        runtime = config.get_observability_runtime()
+        if not self._reserved:
+            config._begin_acquire()  # pyright: ignore[reportPrivateUsage]
+        try:
+            waited = False
+            if control is not None:
+                would_wait = config._acquire_would_wait(registered=True)  # pyright: ignore[reportPrivateUsage]
+                waited = control.enter_acquire(runtime, waiting=would_wait)
+            try:
+                connection = self._context.__enter__()
+            except Exception as exc:
+                if control is not None:
+                    control.exit_acquire(runtime, exc, waited=waited)
+                raise
+            if control is not None:
+                control.exit_acquire(runtime, None, waited=waited)
+        finally:
+            self._reserved = False
+            config._end_acquire()  # pyright: ignore[reportPrivateUsage]
+        return connection
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> "bool | None":
+        return cast("bool | None", self._context.__exit__(exc_type, exc_val, exc_tb))
+
+    async def __aenter__(self) -> Any:
+        config = self._config
+        control = config._admission_control  # pyright: ignore[reportPrivateUsage]
+        runtime = config.get_observability_runtime()
+        if not self._reserved:
+            config._begin_acquire()  # pyright: ignore[reportPrivateUsage]
+        try:
+            waited = False
+            if control is not None:
+                would_wait = config._acquire_would_wait(registered=True)  # pyright: ignore[reportPrivateUsage]
+                waited = control.enter_acquire(runtime, waiting=would_wait)
+            try:
+                connection = await self._context.__aenter__()
+            except Exception as exc:
+                if control is not None:
+                    control.exit_acquire(runtime, exc, waited=waited)
+                raise
+            if control is not None:
+                control.exit_acquire(runtime, None, waited=waited)
+        finally:
+            self._reserved = False
+            config._end_acquire()  # pyright: ignore[reportPrivateUsage]
+        return connection
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> "bool | None":
+        return cast("bool | None", await self._context.__aexit__(exc_type, exc_val, exc_tb))
+
+
+class _AutoscaledConnectionContext:
+    """Connection context wrapper that reports acquire and release to the pool autoscaler."""
+
+    __slots__ = ("_autoscaler", "_config", "_context")
+
+    def __init__(
+        self, context: Any, config: "DatabaseConfigProtocol[Any, Any, Any]", autoscaler: "PoolAutoscaler"
+    ) -> None:
+        self._context = context
+        self._config = config
+        self._autoscaler = autoscaler
+
+    def __enter__(self) -> Any:
+        autoscaler = self._autoscaler
+        autoscaler.enter()
+        started = perf_counter()
+        try:
+            self._config._autoscale_evaluate(autoscaler)  # pyright: ignore[reportPrivateUsage]
+            connection = self._context.__enter__()
+        except BaseException:
+            autoscaler.abandon()
+            raise
+        autoscaler.acquired(perf_counter() - started)
+        return connection
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> "bool | None":
+        try:
+            return cast("bool | None", self._context.__exit__(exc_type, exc_val, exc_tb))
+        finally:
+            self._autoscaler.exit()
+
+    async def __aenter__(self) -> Any:
+        autoscaler = self._autoscaler
+        autoscaler.enter()
+        started = perf_counter()
+        try:
+            await self._config._autoscale_evaluate_async(autoscaler)  # pyright: ignore[reportPrivateUsage]
+            connection = await self._context.__aenter__()
+        except BaseException:
+            autoscaler.abandon()
+            raise
+        autoscaler.acquired(perf_counter() - started)
+        return connection
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> "bool | None":
+        try:
+            return cast("bool | None", await self._context.__aexit__(exc_type, exc_val, exc_tb))
+        finally:
+            self._autoscaler.exit()
@@ -146,6 +146,7 @@ from sqlspec.core.hashing import (
     hash_parameters,
     hash_sql_statement,
 )
+from sqlspec.core.load_shedding import AdmissionLimiter, CircuitBreaker
 from sqlspec.core.metrics import StackExecutionMetrics
 from sqlspec.core.parameters import (
     DRIVER_PARAMETER_PROFILES,
@@ -180,6 +181,7 @@ from sqlspec.core.parameters import (
     validate_parameter_alignment,
     wrap_with_type,
 )
+from sqlspec.core.pool_sizing import PoolSizingPolicy
 from sqlspec.core.query_modifiers import (
     ConditionFactory,
     apply_limit,
@@ -219,6 +221,7 @@ from sqlspec.core.result import (
     create_arrow_result,
     create_sql_result,
 )
+from sqlspec.core.retry import RetryBudget, RetryPolicy
 from sqlspec.core.splitter import split_sql_script
 from sqlspec.core.stack import StackOperation, StatementStack
 from sqlspec.core.statement import (
@@ -247,6 +250,7 @@ __all__ = (
     "EXECUTE_MANY_MIN_ROWS",
     "PARAMETER_REGEX",
     "SQL",
+    "AdmissionLimiter",
     "AnyCollectionFilter",
     "ArrowResult",
     "BaseInputConverter",
@@ -257,6 +261,7 @@ __all__ = (
     "CacheStats",
     "CachedStatement",
     "ChoicesFilter",
+    "CircuitBreaker",
     "CompiledSQL",
     "ConditionFactory",
     "CorrelationExtractor",
@@ -288,7 +293,10 @@ __all__ = (
     "ParameterStyle",
     "ParameterStyleConfig",
     "ParameterValidator",
+    "PoolSizingPolicy",
     "ProcessedState",
+    "RetryBudget",
+    "RetryPolicy",
     "SQLProcessor",
     "SQLResult",
     "SearchFilter",
@@ -0,0 +1,474 @@
+"""Circuit breaking and admission control for database configurations.
+
+A ``CircuitBreaker`` watches statement outcomes (errors and latency) over a
+sliding window and opens when the database looks unhealthy. While open, new
+sessions and statements fail fast with ``CircuitOpenError`` instead of piling
+up on pool acquisition. After ``open_duration`` the breaker half-opens and
+lets a limited number of probe statements through; successful probes close it
+again, a failed probe re-opens it.
+
+An ``AdmissionLimiter`` bounds the number of statements in flight and the
+number of callers waiting for a pooled connection. Excess load is rejected
+immediately with ``AdmissionRejectedError`` rather than queued.
+
+Both are attached to a database config (``circuit_breaker=`` /
+``admission_limiter=``) and shared by every session the config provides.
+Statement and pool-acquire outcomes reach the breaker through the config's
+``ObservabilityRuntime`` (``record_outcome``), so the breaker sees the same
+error and latency stream as the rest of the observability stack. Rejections
+and state changes are published as observability metrics (``circuit.*`` and
+``admission.*``).
+"""
+
+import threading
+from collections import deque
+from time import monotonic
+from typing import TYPE_CHECKING, Final
+
+from mypy_extensions import mypyc_attr
+
+from sqlspec.exceptions import (
+    AdmissionRejectedError,
+    CircuitOpenError,
+    DatabaseConnectionError,
+    LoadSheddingError,
+    OperationalError,
+    OperationCancelledError,
+    PermissionDeniedError,
+    QueryTimeoutError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlspec.observability import ObservabilityRuntime
+
+__all__ = (
+    "CIRCUIT_CLOSED",
+    "CIRCUIT_HALF_OPEN",
+    "CIRCUIT_OPEN",
+    "DEFAULT_CIRCUIT_FAILURE_ERRORS",
+    "DEFAULT_CIRCUIT_IGNORED_ERRORS",
+    "AdmissionControl",
+    "AdmissionLimiter",
+    "CircuitBreaker",
+)
+
+CIRCUIT_CLOSED: Final = "closed"
+CIRCUIT_OPEN: Final = "open"
+CIRCUIT_HALF_OPEN: Final = "half_open"
+
+DEFAULT_CIRCUIT_FAILURE_ERRORS: Final[tuple[type[Exception], ...]] = (DatabaseConnectionError, OperationalError)
+"""Mapped exception types that count as database health failures."""
+
+DEFAULT_CIRCUIT_IGNORED_ERRORS: Final[tuple[type[Exception], ...]] = (
+    PermissionDeniedError,
+    QueryTimeoutError,
+    OperationCancelledError,
+    LoadSheddingError,
+)
+"""Exception types never counted as failures.
+
+Statement timeouts and cancellations reflect the caller's deadline rather than
+database health, and load-shedding rejections never reached the database.
+"""
+
+OUTCOME_STATEMENT: Final = "statement"
+OUTCOME_ACQUIRE: Final = "acquire"
+_FAILED: Final = 1
+_SLOW: Final = 2
+_STATE_GAUGE: Final = {CIRCUIT_CLOSED: 0.0, CIRCUIT_HALF_OPEN: 1.0, CIRCUIT_OPEN: 2.0}
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class CircuitBreaker:
+    """Error-rate and latency circuit breaker over a count-based sliding window.
+
+    Args:
+        failure_rate_threshold: Failure ratio (0-1] that opens the circuit.
+        slow_call_duration: Statements slower than this many seconds count as slow.
+            ``None`` disables latency tracking.
+        slow_call_rate_threshold: Slow-call ratio (0-1] that opens the circuit.
+        window_size: Number of most recent statements evaluated.
+        minimum_calls: Statements required in the window before the rates are evaluated.
+        open_duration: Seconds to stay open before half-opening.
+        half_open_max_calls: Probe statements admitted while half-open; this many
+            consecutive successes close the circuit.
+        failure_on: Exception types counted as failures.
+        ignore_on: Exception types never counted, even when they subclass ``failure_on``.
+    """
+
+    __slots__ = (
+        "_failures",
+        "_lock",
+        "_opened_at",
+        "_probe_successes",
+        "_probes_issued",
+        "_slow",
+        "_state",
+        "_window",
+        "failure_on",
+        "failure_rate_threshold",
+        "half_open_max_calls",
+        "ignore_on",
+        "minimum_calls",
+        "open_duration",
+        "slow_call_duration",
+        "slow_call_rate_threshold",
+        "window_size",
+    )
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: "float | None" = None,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 100,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_on: "Iterable[type[Exception]]" = DEFAULT_CIRCUIT_FAILURE_ERRORS,
+        ignore_on: "Iterable[type[Exception]]" = DEFAULT_CIRCUIT_IGNORED_ERRORS,
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            msg = "CircuitBreaker rate thresholds must be within (0, 1]"
+            raise ValueError(msg)
+        if window_size < 1 or minimum_calls < 1 or half_open_max_calls < 1:
+            msg = "CircuitBreaker window_size, minimum_calls and half_open_max_calls must be at least 1"
+            raise ValueError(msg)
+        if open_duration < 0 or (slow_call_duration is not None and slow_call_duration < 0):
+            msg = "CircuitBreaker durations must be non-negative"
+            raise ValueError(msg)
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = min(minimum_calls, window_size)
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_on = tuple(failure_on)
+        self.ignore_on = tuple(ignore_on)
+        self._lock = threading.Lock()
+        self._window: deque[int] = deque()
+        self._failures = 0
+        self._slow = 0
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = 0.0
+        self._probes_issued = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> str:
+        """Return ``"closed"``, ``"open"`` or ``"half_open"``."""
+        with self._lock:
+            return self._current_state(monotonic())
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds left before an open circuit half-opens."""
+        with self._lock:
+            if self._current_state(monotonic()) != CIRCUIT_OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.open_duration - monotonic())
+
+    def is_failure(self, error: BaseException) -> bool:
+        """Return True when ``error`` indicates an unhealthy database."""
+        return isinstance(error, self.failure_on) and not isinstance(error, self.ignore_on)
+
+    def check(self) -> None:
+        """Raise ``CircuitOpenError`` while the circuit is open, without taking a probe slot."""
+        with self._lock:
+            if self._current_state(monotonic()) == CIRCUIT_OPEN:
+                raise self._open_error()
+
+    def before_call(self) -> None:
+        """Admit one statement or raise ``CircuitOpenError``.
+
+        Half-open circuits admit at most ``half_open_max_calls`` probes.
+        """
+        with self._lock:
+            state = self._current_state(monotonic())
+            if state == CIRCUIT_CLOSED:
+                return
+            if state == CIRCUIT_HALF_OPEN and self._probes_issued < self.half_open_max_calls:
+                self._probes_issued += 1
+                return
+            raise self._open_error()
+
+    def release_call(self) -> None:
+        """Return a probe slot taken by ``before_call`` for a statement that never ran."""
+        with self._lock:
+            if self._state == CIRCUIT_HALF_OPEN and self._probes_issued > 0:
+                self._probes_issued -= 1
+
+    def record(self, error: "BaseException | None", duration: "float | None" = None) -> None:
+        """Record the outcome of an admitted statement."""
+        failed = error is not None and self.is_failure(error)
+        if error is not None and not failed:
+            # Caller errors (constraint violations, syntax errors) say nothing about database health.
+            self.release_call()
+            return
+        slow_limit = self.slow_call_duration
+        slow = slow_limit is not None and duration is not None and duration >= slow_limit
+        with self._lock:
+            state = self._current_state(monotonic())
+            if state == CIRCUIT_HALF_OPEN:
+                if failed or slow:
+                    self._trip()
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._close()
+                return
+            if state == CIRCUIT_OPEN:
+                return
+            self._append((_FAILED if failed else 0) | (_SLOW if slow else 0))
+
+    def record_failure(self) -> None:
+        """Record a failure observed outside statement execution, such as a failed pool acquire."""
+        with self._lock:
+            state = self._current_state(monotonic())
+            if state == CIRCUIT_HALF_OPEN:
+                self._trip()
+            elif state == CIRCUIT_CLOSED:
+                self._append(_FAILED)
+
+    def reset(self) -> None:
+        """Close the circuit and clear the sliding window."""
+        with self._lock:
+            self._close()
+
+    def _current_state(self, now: float) -> str:
+        if self._state == CIRCUIT_OPEN and now - self._opened_at >= self.open_duration:
+            self._state = CIRCUIT_HALF_OPEN
+            self._probes_issued = 0
+            self._probe_successes = 0
+        return self._state
+
+    def _append(self, outcome: int) -> None:
+        window = self._window
+        if len(window) >= self.window_size:
+            evicted = window.popleft()
+            self._failures -= evicted & _FAILED
+            self._slow -= (evicted & _SLOW) >> 1
+        window.append(outcome)
+        self._failures += outcome & _FAILED
+        self._slow += (outcome & _SLOW) >> 1
+        calls = len(window)
+        if calls < self.minimum_calls:
+            return
+        if self._failures / calls >= self.failure_rate_threshold or self._slow / calls >= self.slow_call_rate_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = CIRCUIT_OPEN
+        self._opened_at = monotonic()
+        self._clear_window()
+
+    def _close(self) -> None:
+        self._state = CIRCUIT_CLOSED
+        self._clear_window()
+
+    def _clear_window(self) -> None:
+        self._window.clear()
+        self._failures = 0
+        self._slow = 0
+        self._probes_issued = 0
+        self._probe_successes = 0
+
+    def _open_error(self) -> CircuitOpenError:
+        retry_after = max(0.0, self._opened_at + self.open_duration - monotonic())
+        return CircuitOpenError(f"Circuit breaker is open; retry in {retry_after:.2f}s", retry_after=retry_after)
+
+    def __repr__(self) -> str:
+        return (
+            f"CircuitBreaker(state={self.state!r}, failure_rate_threshold={self.failure_rate_threshold!r}, "
+            f"window_size={self.window_size!r}, open_duration={self.open_duration!r})"
+        )
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class AdmissionLimiter:
+    """Reject load beyond fixed in-flight and waiter limits.
+
+    Args:
+        max_in_flight: Maximum statements executing at once. ``None`` disables the limit.
+        max_waiters: Maximum callers waiting for a pooled connection. Only callers that
+            find no idle or growable connection count as waiting. ``None`` disables the limit.
+    """
+
+    __slots__ = ("_in_flight", "_lock", "_waiters", "max_in_flight", "max_waiters")
+
+    def __init__(self, *, max_in_flight: "int | None" = None, max_waiters: "int | None" = None) -> None:
+        if (max_in_flight is not None and max_in_flight < 1) or (max_waiters is not None and max_waiters < 0):
+            msg = "AdmissionLimiter max_in_flight must be at least 1 and max_waiters non-negative"
+            raise ValueError(msg)
+        self.max_in_flight = max_in_flight
+        self.max_waiters = max_waiters
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of admitted statements still running."""
+        return self._in_flight
+
+    @property
+    def waiters(self) -> int:
+        """Return the number of callers waiting for a connection."""
+        return self._waiters
+
+    def enter_statement(self) -> None:
+        """Admit one statement or raise ``AdmissionRejectedError``."""
+        with self._lock:
+            limit = self.max_in_flight
+            if limit is not None and self._in_flight >= limit:
+                msg = f"Admission rejected: {self._in_flight} statements in flight (limit {limit})"
+                raise AdmissionRejectedError(msg, limit="max_in_flight")
+            self._in_flight += 1
+
+    def exit_statement(self) -> None:
+        """Release a slot taken by ``enter_statement``."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def enter_wait(self) -> None:
+        """Register a caller waiting for a connection or raise ``AdmissionRejectedError``."""
+        with self._lock:
+            limit = self.max_waiters
+            if limit is not None and self._waiters >= limit:
+                msg = f"Admission rejected: {self._waiters} callers waiting for a connection (limit {limit})"
+                raise AdmissionRejectedError(msg, limit="max_waiters")
+            self._waiters += 1
+
+    def exit_wait(self) -> None:
+        """Release a slot taken by ``enter_wait``."""
+        with self._lock:
+            self._waiters = max(0, self._waiters - 1)
+
+    def __repr__(self) -> str:
+        return f"AdmissionLimiter(max_in_flight={self.max_in_flight!r}, max_waiters={self.max_waiters!r})"
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class AdmissionControl:
+    """Combine an optional breaker and limiter for one database config.
+
+    Configs build one instance, attach it to every driver they provide and
+    subscribe ``observe`` to their observability runtime. Drivers call
+    ``admit``/``complete`` around each statement; session factories call
+    ``enter_acquire``/``exit_acquire`` around pool acquisition. Outcomes are
+    published to the runtime, which feeds them back to the breaker.
+    """
+
+    __slots__ = ("circuit_breaker", "limiter")
+
+    def __init__(
+        self, circuit_breaker: "CircuitBreaker | None" = None, limiter: "AdmissionLimiter | None" = None
+    ) -> None:
+        self.circuit_breaker = circuit_breaker
+        self.limiter = limiter
+
+    def admit(self, runtime: "ObservabilityRuntime") -> None:
+        """Admit one statement, raising ``CircuitOpenError`` or ``AdmissionRejectedError``."""
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                runtime.increment_metric("circuit.rejected")
+                raise
+        limiter = self.limiter
+        if limiter is not None:
+            try:
+                limiter.enter_statement()
+            except AdmissionRejectedError:
+                if breaker is not None:
+                    breaker.release_call()
+                runtime.increment_metric("admission.rejected")
+                raise
+
+    def complete(self, runtime: "ObservabilityRuntime", error: "BaseException | None", duration: float) -> None:
+        """Release the statement slot and publish the outcome to the runtime."""
+        limiter = self.limiter
+        if limiter is not None:
+            limiter.exit_statement()
+        runtime.record_outcome(OUTCOME_STATEMENT, error, duration)
+
+    def abandon(self) -> None:
+        """Release the statement slot of a cancelled or interrupted statement without recording an outcome."""
+        limiter = self.limiter
+        if limiter is not None:
+            limiter.exit_statement()
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.release_call()
+
+    def enter_acquire(self, runtime: "ObservabilityRuntime", *, waiting: bool = True) -> bool:
+        """Guard pool acquisition, failing fast while the circuit is open or waiters are saturated.
+
+        Args:
+            runtime: Runtime receiving rejection metrics.
+            waiting: The caller will queue for a connection; only waiting callers
+                take a ``max_waiters`` slot.
+
+        Returns:
+            True when a waiter slot was taken and must be released by ``exit_acquire``.
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            try:
+                breaker.check()
+            except CircuitOpenError:
+                runtime.increment_metric("circuit.rejected")
+                raise
+        limiter = self.limiter
+        if limiter is None or not waiting:
+            return False
+        try:
+            limiter.enter_wait()
+        except AdmissionRejectedError:
+            runtime.increment_metric("admission.rejected")
+            raise
+        return True
+
+    def exit_acquire(
+        self, runtime: "ObservabilityRuntime", error: "BaseException | None", *, waited: bool = True
+    ) -> None:
+        """Release the waiter slot and publish a failed acquire to the runtime."""
+        limiter = self.limiter
+        if limiter is not None and waited:
+            limiter.exit_wait()
+        if error is not None:
+            runtime.record_outcome(OUTCOME_ACQUIRE, error, None)
+
+    def observe(
+        self, runtime: "ObservabilityRuntime", kind: str, error: "BaseException | None", duration: "float | None"
+    ) -> None:
+        """Feed an outcome recorded on the runtime to the breaker.
+
+        Statement outcomes enter the sliding window; a failed pool acquire counts
+        as a failure unless the breaker ignores its error type.
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return
+        previous = breaker.state
+        if kind == OUTCOME_STATEMENT:
+            breaker.record(error, duration)
+        elif error is not None and not isinstance(error, breaker.ignore_on):
+            breaker.record_failure()
+        else:
+            return
+        self._publish_state(runtime, breaker, previous)
+
+    @staticmethod
+    def _publish_state(runtime: "ObservabilityRuntime", breaker: CircuitBreaker, previous: str) -> None:
+        state = breaker.state
+        if state == previous:
+            return
+        if state == CIRCUIT_OPEN:
+            runtime.increment_metric("circuit.opened")
+        runtime.record_metric("circuit.state", _STATE_GAUGE[state])
@@ -0,0 +1,288 @@
+"""Adaptive connection pool sizing.
+
+A ``PoolAutoscaler`` follows the concurrency a pool actually needs instead of a
+hand-picked ``max_size``. Every caller is counted from the moment it asks for a
+connection until it releases it, so the time-weighted number of callers in the
+system is Little's law ``L = λ·W``: arrival rate times the mean of acquire wait
+plus connection hold time (query latency). Each evaluation sizes the pool so
+that ``L`` sits at ``target_utilization`` of its capacity.
+
+Growth is applied at the next evaluation. Shrinking needs hysteresis: the
+utilization must stay below ``scale_down_utilization`` for ``scale_down_delay``
+seconds first, so short lulls do not churn connections.
+
+Evaluation is lazy: it runs on the acquire path at most once per
+``evaluation_interval`` and needs no background task. The config that owns the
+autoscaler applies the resulting ``PoolSizeDecision`` to its pool and logs it.
+"""
+
+import asyncio
+import math
+import threading
+from collections import deque
+from time import monotonic
+from typing import TYPE_CHECKING, NamedTuple
+
+from mypy_extensions import mypyc_attr
+
+if TYPE_CHECKING:
+    from asyncio import Future
+
+__all__ = ("AsyncCapacityGate", "PoolAutoscaler", "PoolSizeDecision", "PoolSizingPolicy")
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class PoolSizingPolicy:
+    """Bounds and thresholds for adaptive pool sizing.
+
+    Args:
+        min_size: Smallest pool size the autoscaler may choose.
+        max_size: Largest pool size the autoscaler may choose.
+        initial_size: Pool size before the first evaluation. Defaults to ``min_size``.
+        target_utilization: Fraction (0, 1] of the pool the observed concurrency
+            should occupy. Sizes are chosen as ``ceil(L / target_utilization)``.
+        scale_down_utilization: Utilization below which the pool may shrink. Must be
+            lower than ``target_utilization``; the gap is the hysteresis band.
+        evaluation_interval: Minimum seconds between evaluations.
+        scale_down_delay: Seconds utilization must stay low before shrinking.
+    """
+
+    __slots__ = (
+        "evaluation_interval",
+        "initial_size",
+        "max_size",
+        "min_size",
+        "scale_down_delay",
+        "scale_down_utilization",
+        "target_utilization",
+    )
+
+    def __init__(
+        self,
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        initial_size: "int | None" = None,
+        target_utilization: float = 0.7,
+        scale_down_utilization: float = 0.4,
+        evaluation_interval: float = 5.0,
+        scale_down_delay: float = 60.0,
+    ) -> None:
+        if min_size < 1 or max_size < min_size:
+            msg = "PoolSizingPolicy requires 1 <= min_size <= max_size"
+            raise ValueError(msg)
+        if initial_size is not None and not min_size <= initial_size <= max_size:
+            msg = "PoolSizingPolicy initial_size must be within [min_size, max_size]"
+            raise ValueError(msg)
+        if not 0 < scale_down_utilization < target_utilization <= 1:
+            msg = "PoolSizingPolicy requires 0 < scale_down_utilization < target_utilization <= 1"
+            raise ValueError(msg)
+        if evaluation_interval <= 0 or scale_down_delay < 0:
+            msg = "PoolSizingPolicy evaluation_interval must be positive and scale_down_delay non-negative"
+            raise ValueError(msg)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.initial_size = min_size if initial_size is None else initial_size
+        self.target_utilization = target_utilization
+        self.scale_down_utilization = scale_down_utilization
+        self.evaluation_interval = evaluation_interval
+        self.scale_down_delay = scale_down_delay
+
+    def __repr__(self) -> str:
+        return (
+            f"PoolSizingPolicy(min_size={self.min_size!r}, max_size={self.max_size!r}, "
+            f"target_utilization={self.target_utilization!r}, "
+            f"scale_down_utilization={self.scale_down_utilization!r})"
+        )
+
+
+class PoolSizeDecision(NamedTuple):
+    """A resize chosen by ``PoolAutoscaler.evaluate``."""
+
+    previous_size: int
+    size: int
+    concurrency: float
+    """Time-weighted callers waiting for or holding a connection (Little's ``L``)."""
+    arrival_rate: float
+    """Acquires per second over the evaluation window (Little's ``λ``)."""
+    mean_latency: float
+    """Mean seconds from acquire to release, wait included (Little's ``W``)."""
+    mean_wait: float
+    """Mean seconds spent waiting for a connection."""
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class PoolAutoscaler:
+    """Track pool demand and choose pool sizes according to a ``PoolSizingPolicy``.
+
+    Callers report ``enter`` when they start acquiring, ``acquired`` once they
+    hold a connection (or ``abandon`` when acquisition fails) and ``exit`` on
+    release. ``evaluate`` turns the window since the previous evaluation into a
+    ``PoolSizeDecision`` when the size should change.
+    """
+
+    __slots__ = (
+        "_acquires",
+        "_area",
+        "_below_since",
+        "_in_system",
+        "_last_event",
+        "_lock",
+        "_size",
+        "_wait_total",
+        "_window_start",
+        "policy",
+    )
+
+    def __init__(self, policy: PoolSizingPolicy) -> None:
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._size = policy.initial_size
+        now = monotonic()
+        self._window_start = now
+        self._last_event = now
+        self._area = 0.0
+        self._in_system = 0
+        self._acquires = 0
+        self._wait_total = 0.0
+        self._below_since: float | None = None
+
+    @property
+    def size(self) -> int:
+        """Return the pool size currently chosen."""
+        return self._size
+
+    @property
+    def in_system(self) -> int:
+        """Return the number of callers waiting for or holding a connection."""
+        return self._in_system
+
+    def enter(self) -> None:
+        """Record a caller that starts waiting for a connection."""
+        with self._lock:
+            self._advance(monotonic())
+            self._in_system += 1
+
+    def acquired(self, wait_s: float) -> None:
+        """Record that a caller obtained a connection after ``wait_s`` seconds."""
+        with self._lock:
+            self._acquires += 1
+            self._wait_total += wait_s
+
+    def abandon(self) -> None:
+        """Record a caller that gave up before obtaining a connection."""
+        self.exit()
+
+    def exit(self) -> None:
+        """Record a caller releasing its connection."""
+        with self._lock:
+            self._advance(monotonic())
+            self._in_system = max(0, self._in_system - 1)
+
+    def restore_size(self, size: int) -> None:
+        """Reset the chosen size, for example after the pool rejected a resize."""
+        with self._lock:
+            self._size = size
+
+    def evaluate(self, now: "float | None" = None) -> "PoolSizeDecision | None":
+        """Close the current window and return a decision when the pool should be resized.
+
+        Returns:
+            The decision, or None when the interval has not elapsed or the size stays.
+        """
+        if now is None:
+            now = monotonic()
+        policy = self.policy
+        with self._lock:
+            elapsed = now - self._window_start
+            if elapsed < policy.evaluation_interval:
+                return None
+            self._advance(now)
+            concurrency = self._area / elapsed
+            acquires = self._acquires
+            arrival_rate = acquires / elapsed
+            mean_latency = concurrency / arrival_rate if arrival_rate else 0.0
+            mean_wait = self._wait_total / acquires if acquires else 0.0
+            self._window_start = now
+            self._area = 0.0
+            self._acquires = 0
+            self._wait_total = 0.0
+
+            size = self._size
+            desired = min(policy.max_size, max(policy.min_size, math.ceil(concurrency / policy.target_utilization)))
+            if desired > size:
+                self._below_since = None
+            elif desired < size and concurrency < size * policy.scale_down_utilization:
+                if self._below_since is None:
+                    self._below_since = now
+                if now - self._below_since < policy.scale_down_delay:
+                    return None
+                self._below_since = None
+            else:
+                self._below_since = None
+                return None
+            self._size = desired
+        return PoolSizeDecision(size, desired, concurrency, arrival_rate, mean_latency, mean_wait)
+
+    def _advance(self, now: float) -> None:
+        self._area += self._in_system * (now - self._last_event)
+        self._last_event = now
+
+    def __repr__(self) -> str:
+        return f"PoolAutoscaler(size={self._size!r}, policy={self.policy!r})"
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class AsyncCapacityGate:
+    """Resizable FIFO limit on connections handed out by a pool that cannot resize itself.
+
+    Used with native pools that are created at ``PoolSizingPolicy.max_size``;
+    the gate admits only ``limit`` concurrent holders and wakes waiters when the
+    limit grows. Must be used from a single event loop.
+    """
+
+    __slots__ = ("_in_use", "_waiters", "limit")
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._in_use = 0
+        self._waiters: deque[Future[None]] = deque()
+
+    @property
+    def in_use(self) -> int:
+        """Return the number of admitted holders."""
+        return self._in_use
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free and take it."""
+        if self._in_use < self.limit and not self._waiters:
+            self._in_use += 1
+            return
+        future: Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self.release()
+            elif future in self._waiters:
+                self._waiters.remove(future)
+            raise
+
+    def release(self) -> None:
+        """Return a slot taken by ``acquire``."""
+        self._in_use = max(0, self._in_use - 1)
+        self._wake()
+
+    def resize(self, limit: int) -> None:
+        """Change the number of slots, waking waiters when it grows."""
+        self.limit = limit
+        self._wake()
+
+    def _wake(self) -> None:
+        waiters = self._waiters
+        while waiters and self._in_use < self.limit:
+            future = waiters.popleft()
+            if not future.done():
+                self._in_use += 1
+                future.set_result(None)
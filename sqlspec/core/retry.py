@@ -0,0 +1,249 @@
+"""Retry policies for transient database errors.
+
+A ``RetryPolicy`` classifies errors raised by the adapter exception handlers
+(``handle_database_exceptions``) as retryable, computes exponential backoff with
+full jitter, and draws retries from a ``RetryBudget`` so a struggling database
+does not receive a retry storm. Unless a policy is given its own budget, retries
+draw from the budget of the database config running the statement, so one
+config's retries never drain another's.
+
+Policies apply to ``execute`` (statement level, outside explicit transactions)
+and to ``run_transaction_with_retry`` (whole transaction blocks).
+"""
+
+import secrets
+import threading
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from mypy_extensions import mypyc_attr
+
+from sqlspec.exceptions import DeadlockError, PermissionDeniedError, SerializationConflictError
+from sqlspec.typing import Empty, EmptyEnum
+from sqlspec.utils.type_guards import has_sqlstate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = (
+    "DEFAULT_NON_RETRYABLE_ERRORS",
+    "DEFAULT_RETRYABLE_ERRORS",
+    "DEFAULT_RETRYABLE_SQLSTATES",
+    "RetryBudget",
+    "RetryPolicy",
+)
+
+DEFAULT_RETRYABLE_ERRORS: Final[tuple[type[Exception], ...]] = (SerializationConflictError, DeadlockError)
+"""Mapped exception types retried by default.
+
+Connection errors are not included: the retry reuses the session's connection and
+the failed statement may already have been applied.
+"""
+
+DEFAULT_NON_RETRYABLE_ERRORS: Final[tuple[type[Exception], ...]] = (PermissionDeniedError,)
+"""Mapped exception types never retried, even when they subclass a retryable type."""
+
+DEFAULT_RETRYABLE_SQLSTATES: Final[frozenset[str]] = frozenset({"40001", "40P01"})
+"""Raw SQLSTATE codes retried when an error escapes the adapter exception mapping."""
+
+_JITTER_SCALE: Final = 1_000_000
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class RetryBudget:
+    """Token bucket limiting retries relative to first attempts.
+
+    Every retried operation deposits ``ratio`` tokens and every retry withdraws
+    one, so steady-state retries stay below ``ratio`` of the request volume.
+    ``max_tokens`` caps the burst allowance and is also the starting balance.
+    """
+
+    __slots__ = ("_lock", "_tokens", "max_tokens", "ratio")
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        if ratio < 0 or max_tokens < 0:
+            msg = "RetryBudget ratio and max_tokens must be non-negative"
+            raise ValueError(msg)
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Return the current token balance."""
+        return self._tokens
+
+    def record_request(self) -> None:
+        """Deposit tokens for a first attempt."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Withdraw one token for a retry, returning False when the budget is spent."""
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def reset(self) -> None:
+        """Restore the full token balance."""
+        with self._lock:
+            self._tokens = self.max_tokens
+
+    def __reduce__(self) -> "tuple[type[RetryBudget], tuple[float, float]]":
+        return (RetryBudget, (self.ratio, self.max_tokens))
+
+    def __repr__(self) -> str:
+        return f"RetryBudget(ratio={self.ratio!r}, max_tokens={self.max_tokens!r}, tokens={self._tokens!r})"
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class RetryPolicy:
+    """Declarative retry policy for transient database errors.
+
+    Args:
+        max_attempts: Total attempts including the first one.
+        base_delay: Backoff ceiling in seconds for the first retry; doubles per retry.
+        max_delay: Upper bound for the backoff ceiling in seconds.
+        jitter: Draw the delay uniformly from ``[0, ceiling]`` (full jitter).
+        retry_on: Mapped exception types that are retried.
+        never_retry_on: Exception types that are never retried.
+        retry_sqlstates: SQLSTATE codes retried on unmapped driver errors.
+        budget: Retry budget to draw from. Defaults to the budget of the database
+            config running the statement; ``None`` disables budgeting.
+        log_retries: Emit a ``driver.retry`` debug log event for every retry.
+    """
+
+    __slots__ = (
+        "base_delay",
+        "budget",
+        "jitter",
+        "log_retries",
+        "max_attempts",
+        "max_delay",
+        "never_retry_on",
+        "retry_on",
+        "retry_sqlstates",
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        *,
+        base_delay: float = 0.05,
+        max_delay: float = 2.0,
+        jitter: bool = True,
+        retry_on: "Iterable[type[Exception]]" = DEFAULT_RETRYABLE_ERRORS,
+        never_retry_on: "Iterable[type[Exception]]" = DEFAULT_NON_RETRYABLE_ERRORS,
+        retry_sqlstates: "Iterable[str]" = DEFAULT_RETRYABLE_SQLSTATES,
+        budget: "RetryBudget | EmptyEnum | None" = Empty,
+        log_retries: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            msg = "RetryPolicy max_attempts must be at least 1"
+            raise ValueError(msg)
+        if base_delay < 0 or max_delay < 0:
+            msg = "RetryPolicy delays must be non-negative"
+            raise ValueError(msg)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+        self.never_retry_on = tuple(never_retry_on)
+        self.retry_sqlstates = frozenset(retry_sqlstates)
+        self.budget = budget
+        self.log_retries = log_retries
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Return True when ``error`` (or the driver error it wraps) is transient."""
+        if isinstance(error, self.never_retry_on):
+            return False
+        if isinstance(error, self.retry_on):
+            return True
+        if not self.retry_sqlstates:
+            return False
+        candidate: BaseException | None = error
+        while candidate is not None:
+            if has_sqlstate(candidate) and str(candidate.sqlstate) in self.retry_sqlstates:
+                return True
+            candidate = candidate.__cause__
+        return False
+
+    def backoff(self, retry: int) -> float:
+        """Return the delay in seconds before retry number ``retry`` (0-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2**retry))
+        if not self.jitter or ceiling <= 0:
+            return ceiling
+        return ceiling * secrets.randbelow(_JITTER_SCALE + 1) / _JITTER_SCALE
+
+    def resolve_budget(self, default: "RetryBudget | None" = None) -> "RetryBudget | None":
+        """Return the budget to draw from, using ``default`` when the policy has none of its own."""
+        budget = self.budget
+        if budget is Empty:
+            return default
+        return cast("RetryBudget | None", budget)
+
+    def record_request(self, default: "RetryBudget | None" = None) -> None:
+        """Credit the budget for a new operation."""
+        budget = self.resolve_budget(default)
+        if budget is not None:
+            budget.record_request()
+
+    def acquire_retry(self, default: "RetryBudget | None" = None) -> bool:
+        """Return True when the budget allows another retry."""
+        budget = self.resolve_budget(default)
+        return budget is None or budget.try_acquire()
+
+    def __reduce__(self) -> "tuple[Any, tuple[dict[str, Any]]]":
+        return (
+            _restore_retry_policy,
+            (
+                {
+                    "max_attempts": self.max_attempts,
+                    "base_delay": self.base_delay,
+                    "max_delay": self.max_delay,
+                    "jitter": self.jitter,
+                    "retry_on": self.retry_on,
+                    "never_retry_on": self.never_retry_on,
+                    "retry_sqlstates": self.retry_sqlstates,
+                    "budget": self.budget,
+                    "log_retries": self.log_retries,
+                },
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts!r}, base_delay={self.base_delay!r}, "
+            f"max_delay={self.max_delay!r}, jitter={self.jitter!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RetryPolicy):
+            return NotImplemented
+        return (
+            self.max_attempts == other.max_attempts
+            and self.base_delay == other.base_delay
+            and self.max_delay == other.max_delay
+            and self.jitter == other.jitter
+            and self.retry_on == other.retry_on
+            and self.never_retry_on == other.never_retry_on
+            and self.retry_sqlstates == other.retry_sqlstates
+            and self.log_retries == other.log_retries
+            and _budget_settings(self.budget) == _budget_settings(other.budget)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.max_attempts, self.base_delay, self.max_delay, self.jitter, self.retry_on))
+
+
+def _budget_settings(budget: "RetryBudget | EmptyEnum | None") -> "tuple[float, float] | EmptyEnum | None":
+    if isinstance(budget, RetryBudget):
+        return (budget.ratio, budget.max_tokens)
+    return budget
+
+
+def _restore_retry_policy(kwargs: "dict[str, Any]") -> RetryPolicy:
+    return RetryPolicy(**kwargs)
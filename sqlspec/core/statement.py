@@ -63,6 +63,7 @@ if TYPE_CHECKING:
 
     from sqlspec.builder import QueryBuilder
     from sqlspec.core.filters import StatementFilter
+    from sqlspec.core.retry import RetryPolicy
 
 
 __all__ = (
@@ -122,6 +123,8 @@ SQL_CONFIG_SLOTS: Final = (
     "sqlcommenter_enable_context",
     "sqlcommenter_enable_traceparent",
     "statement_transformers",
+    "statement_timeout",
+    "retry_policy",
     "parameter_config",
     "parameter_converter",
     "parameter_validator",
@@ -1640,6 +1643,8 @@ class StatementConfig:
         sqlcommenter_attributes: "dict[str, str | None] | None" = None,
         sqlcommenter_enable_traceparent: bool = False,
         sqlcommenter_enable_context: bool = False,
+        statement_timeout: "float | None" = None,
+        retry_policy: "RetryPolicy | None" = None,
     ) -> None:
         """Initialize StatementConfig.
 
@@ -1664,6 +1669,8 @@ class StatementConfig:
             sqlcommenter_attributes: Static key-value pairs for SQLCommenter comments
             sqlcommenter_enable_traceparent: Auto-populate W3C traceparent from OpenTelemetry
             sqlcommenter_enable_context: Read request-scoped attrs from SQLCommenterContext
+            statement_timeout: Default per-statement execution timeout in seconds
+            retry_policy: Default retry policy for transient errors raised by ``execute``
         """
         self.enable_parsing = enable_parsing
         self.enable_validation = enable_validation
@@ -1697,6 +1704,8 @@ class StatementConfig:
         self.sqlcommenter_enable_traceparent = sqlcommenter_enable_traceparent
         self.sqlcommenter_enable_context = sqlcommenter_enable_context
         self.output_transformer = output_transformer
+        self.statement_timeout = statement_timeout
+        self.retry_policy = retry_policy
 
         self._user_statement_transformers = tuple(statement_transformers) if statement_transformers else ()
         all_transformers: list[Callable[..., Any]] = list(self._user_statement_transformers)
@@ -1759,6 +1768,8 @@ class StatementConfig:
             "sqlcommenter_attributes": self.sqlcommenter_attributes,
             "sqlcommenter_enable_traceparent": self.sqlcommenter_enable_traceparent,
             "sqlcommenter_enable_context": self.sqlcommenter_enable_context,
+            "statement_timeout": self.statement_timeout,
+            "retry_policy": self.retry_policy,
         }
         current_kwargs.update(kwargs)
         return type(self)(**current_kwargs)
@@ -1808,6 +1819,8 @@ class StatementConfig:
                 self.sqlcommenter_attributes,
                 self.sqlcommenter_enable_traceparent,
                 self.sqlcommenter_enable_context,
+                self.statement_timeout,
+                self.retry_policy,
             ),
         )
 
@@ -1830,6 +1843,8 @@ class StatementConfig:
             f"execution_args={self.execution_args!r}",
             f"output_transformer={self.output_transformer!r}",
             f"statement_transformers={self.statement_transformers!r}",
+            f"statement_timeout={self.statement_timeout!r}",
+            f"retry_policy={self.retry_policy!r}",
         ]
         return f"{self.__class__.__name__}({', '.join(field_strs)})"
 
@@ -1855,6 +1870,8 @@ class StatementConfig:
             and self.execution_args == other.execution_args
             and self.output_transformer == other.output_transformer
             and self.statement_transformers == other.statement_transformers
+            and self.statement_timeout == other.statement_timeout
+            and self.retry_policy == other.retry_policy
         )
 
     def _compare_parameter_configs(self, config1: Any, config2: Any) -> bool:
@@ -20,20 +20,32 @@ from sqlspec.driver._common import (
 )
 from sqlspec.driver._exception_handler import BaseAsyncExceptionHandler, BaseSyncExceptionHandler
 from sqlspec.driver._sql_helpers import convert_to_dialect
-from sqlspec.driver._stream import AsyncRowStream, SyncRowStream, rows_to_dicts
+from sqlspec.driver._stream import (
+    AdaptiveChunkSizing,
+    AsyncArrowBatchStream,
+    AsyncRowStream,
+    RowStreamTelemetry,
+    SyncArrowBatchStream,
+    SyncRowStream,
+    rows_to_dicts,
+)
 from sqlspec.driver._sync import (
     SyncDataDictionaryBase,
     SyncDriverAdapterBase,
     SyncPoolConnectionContext,
     SyncPoolSessionFactory,
 )
+from sqlspec.driver._timeout import AsyncStatementTimeout, SyncStatementTimeout
 
 __all__ = (
+    "AdaptiveChunkSizing",
+    "AsyncArrowBatchStream",
     "AsyncDataDictionaryBase",
     "AsyncDriverAdapterBase",
     "AsyncPoolConnectionContext",
     "AsyncPoolSessionFactory",
     "AsyncRowStream",
+    "AsyncStatementTimeout",
     "BaseAsyncExceptionHandler",
     "BaseSyncExceptionHandler",
     "CommonDriverAttributesMixin",
@@ -41,12 +53,15 @@ __all__ = (
     "DataDictionaryMixin",
     "DriverAdapterProtocol",
     "ExecutionResult",
+    "RowStreamTelemetry",
     "StackExecutionObserver",
+    "SyncArrowBatchStream",
     "SyncDataDictionaryBase",
     "SyncDriverAdapterBase",
     "SyncPoolConnectionContext",
     "SyncPoolSessionFactory",
     "SyncRowStream",
+    "SyncStatementTimeout",
     "convert_to_dialect",
     "describe_stack_statement",
     "hash_stack_operations",
@@ -1,5 +1,8 @@
 """Asynchronous driver protocol implementation."""
 
+import asyncio
+import contextlib
+import functools
 import logging
 from abc import abstractmethod
 from inspect import isawaitable
@@ -8,8 +11,9 @@ from typing import TYPE_CHECKING, Any, ClassVar, Final, TypeVar, cast, final, ov
 
 from mypy_extensions import mypyc_attr
 
-from sqlspec.core import SQL, StackResult, create_arrow_result
+from sqlspec.core import SQL, StackResult, build_arrow_result_from_table, create_arrow_result
 from sqlspec.core.result import DMLResult
+from sqlspec.core.retry import RetryPolicy
 from sqlspec.core.stack import StackOperation, StatementStack
 from sqlspec.driver._common import (
     AsyncExceptionHandler,
@@ -27,17 +31,40 @@ from sqlspec.driver._exception_handler import _run_with_async_exception_handler
 from sqlspec.driver._query_cache import CachedQuery
 from sqlspec.driver._sql_helpers import DEFAULT_PRETTY
 from sqlspec.driver._sql_helpers import convert_to_dialect as _convert_to_dialect_impl
-from sqlspec.driver._storage_helpers import stringify_storage_target
-from sqlspec.driver._stream import AsyncRowStream, _LazyEagerAsyncRowSource
-from sqlspec.exceptions import ImproperConfigurationError, StackExecutionError
+from sqlspec.driver._storage_helpers import DEFAULT_STORAGE_BATCH_SIZE, stringify_storage_target
+from sqlspec.driver._stream import AsyncArrowBatchStream, AsyncRowStream, AsyncTimeoutIterator, _LazyEagerAsyncRowSource
+from sqlspec.driver._timeout import AsyncStatementTimeout
+from sqlspec.exceptions import (
+    ImproperConfigurationError,
+    StackExecutionError,
+    StatementTimeoutError,
+    TransactionRetryError,
+)
 from sqlspec.observability import _runtime as observability_runtime
-from sqlspec.storage import AsyncStoragePipeline, StorageBridgeJob, StorageDestination, StorageFormat, StorageTelemetry
-from sqlspec.utils.arrow_helpers import convert_dict_to_arrow_with_schema
+from sqlspec.storage import (
+    AsyncMultiSourceReader,
+    AsyncPartitionedWriter,
+    AsyncStoragePipeline,
+    AsyncStorageWriter,
+    StorageBridgeJob,
+    StorageDestination,
+    StorageFormat,
+    StorageTelemetry,
+    parse_multi_source_options,
+    parse_partitioner,
+)
+from sqlspec.utils.arrow_helpers import (
+    aiter_arrow_batches,
+    aiter_row_chunk_batches,
+    arrow_table_from_row_batches,
+    convert_dict_to_arrow_with_schema,
+    rows_to_arrow_batch,
+)
 from sqlspec.utils.logging import get_logger, log_with_context
 from sqlspec.utils.schema import ValueT, to_value_type
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Mapping, Sequence
+    from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Mapping, Sequence
 
     from sqlglot.dialects.dialect import DialectType
 
@@ -56,7 +83,8 @@ if TYPE_CHECKING:
         TableMetadata,
         VersionInfo,
     )
-    from sqlspec.typing import ArrowReturnFormat, ArrowTable, SchemaT, StatementParameters
+    from sqlspec.driver._stream import AdaptiveChunkSizing
+    from sqlspec.typing import ArrowRecordBatch, ArrowReturnFormat, ArrowTable, SchemaT, StatementParameters
 
 
 __all__ = ("AsyncDataDictionaryBase", "AsyncDriverAdapterBase", "AsyncPoolConnectionContext", "AsyncPoolSessionFactory")
@@ -65,6 +93,7 @@ __all__ = ("AsyncDataDictionaryBase", "AsyncDriverAdapterBase", "AsyncPoolConnec
 _LOGGER_NAME: Final[str] = "sqlspec.driver"
 logger = get_logger(_LOGGER_NAME)
 _AsyncResultT = TypeVar("_AsyncResultT")
+_T = TypeVar("_T")
 
 
 @mypyc_attr(allow_interpreted_subclasses=True)
@@ -227,6 +256,9 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
     async def dispatch_statement_execution(self, statement: "SQL", connection: "Any") -> "SQLResult":
         """Central execution dispatcher using the Template Method Pattern.
 
+        Statements pass the config's circuit breaker and admission limiter first
+        when the owning config defines them.
+
         Args:
             statement: The SQL statement to execute
             connection: The database connection to use
@@ -234,6 +266,29 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         Returns:
             The result of the SQL execution
         """
+        control = self._admission_control
+        if control is None:
+            return await self._dispatch_statement(statement, connection)
+        runtime = self.observability
+        try:
+            control.admit(runtime)
+        except Exception:
+            self._release_pooled_statement(statement)
+            raise
+        started = perf_counter()
+        try:
+            result = await self._dispatch_statement(statement, connection)
+        except Exception as exc:
+            control.complete(runtime, exc, perf_counter() - started)
+            raise
+        except BaseException:
+            control.abandon()
+            raise
+        control.complete(runtime, None, perf_counter() - started)
+        return result
+
+    @final
+    async def _dispatch_statement(self, statement: "SQL", connection: "Any") -> "SQLResult":
         try:
             runtime = self._observability
             compiled_sql, execution_parameters = statement.compile()
@@ -510,6 +565,50 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
     async def rollback(self) -> None:
         """Rollback the current transaction on the current connection."""
 
+    async def run_transaction_with_retry(
+        self, operation: "Callable[[], Awaitable[_T]]", *, retry_policy: "RetryPolicy | None" = None
+    ) -> _T:
+        """Run ``operation`` inside a transaction, retrying the whole block on transient errors.
+
+        The transaction is rolled back before each retry. When the connection is
+        already inside a transaction the operation runs once on it.
+
+        Args:
+            operation: Zero-argument callable executing the transaction body.
+            retry_policy: Policy to apply. Defaults to ``StatementConfig.retry_policy``
+                and then to ``RetryPolicy()``.
+
+        Returns:
+            The value returned by ``operation``.
+
+        Raises:
+            TransactionRetryError: A retryable error persisted after the policy's attempts
+                or retry budget were exhausted; the last error is chained as the cause.
+        """
+        if self._connection_in_transaction():
+            return await operation()
+        policy = retry_policy or self.statement_config.retry_policy or RetryPolicy()
+        policy.record_request(self._retry_budget)
+        retry = 0
+        while True:
+            try:
+                await self.begin()
+                result = await operation()
+                await self.commit()
+            except Exception as exc:
+                with contextlib.suppress(Exception):
+                    await self.rollback()
+                delay = self._next_retry_delay(policy, exc, retry)
+                if delay is None:
+                    if not policy.is_retryable(exc):
+                        raise
+                    msg = f"Transaction retry limit exceeded after {retry + 1} attempt(s)"
+                    raise TransactionRetryError(msg) from exc
+            else:
+                return result
+            await asyncio.sleep(delay)
+            retry += 1
+
     async def create_savepoint(self, name: str) -> None:
         """Create a savepoint within the current transaction."""
         await self.execute_script(f"SAVEPOINT {validate_savepoint_name(name)}")
@@ -550,9 +649,43 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
+        retry_policy: "RetryPolicy | None" = None,
         **kwargs: Any,
     ) -> "SQLResult":
-        """Execute a statement with parameter handling."""
+        """Execute a statement with parameter handling.
+
+        ``timeout`` overrides ``StatementConfig.statement_timeout`` for this call and
+        raises ``StatementTimeoutError`` when exceeded. ``retry_policy`` overrides
+        ``StatementConfig.retry_policy``; statements are only retried outside an
+        explicit transaction. The ``select*`` helpers forward both through their
+        keyword arguments.
+        """
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
+        if retry_policy is None:
+            retry_policy = (statement_config or self.statement_config).retry_policy
+        if retry_policy is None or self._connection_in_transaction():
+            return await self._execute_once(statement, parameters, statement_config, kwargs)
+        retry_policy.record_request(self._retry_budget)
+        retry = 0
+        while True:
+            try:
+                return await self._execute_once(statement, parameters, statement_config, kwargs)
+            except Exception as exc:
+                delay = self._next_retry_delay(retry_policy, exc, retry)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def _execute_once(
+        self,
+        statement: "SQL | Statement | QueryBuilder",
+        parameters: "tuple[StatementParameters | StatementFilter, ...]",
+        statement_config: "StatementConfig | None",
+        kwargs: "dict[str, Any]",
+    ) -> "SQLResult":
         exc_handler = self.handle_database_exceptions()
         result = await self._run_with_exception_handler(
             exc_handler, self._execute, statement, parameters, statement_config, kwargs
@@ -1134,7 +1267,9 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT]",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         count_with_window: bool = False,
+        concurrent_count: "bool | None" = None,
         **kwargs: Any,
     ) -> "tuple[list[SchemaT], int]": ...
 
@@ -1146,7 +1281,9 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: None = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         count_with_window: bool = False,
+        concurrent_count: "bool | None" = None,
         **kwargs: Any,
     ) -> "tuple[list[dict[str, Any]], int]": ...
 
@@ -1157,7 +1294,9 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT] | None" = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         count_with_window: bool = False,
+        concurrent_count: "bool | None" = None,
         **kwargs: Any,
     ) -> "tuple[list[SchemaT] | list[dict[str, Any]], int]":
         """Execute a select statement and return both the data and total count.
@@ -1170,9 +1309,15 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             *parameters: Parameters for the SQL statement
             schema_type: Optional schema type for data transformation
             statement_config: Optional SQL configuration
+            timeout: Statement timeout in seconds for both queries (overrides ``statement_config``)
             count_with_window: If True, use a single query with COUNT(*) OVER() window
                 function instead of two separate queries. This can be more efficient
                 for some databases but adds a column to each row. Default False.
+            concurrent_count: If True, run the count query on a second pooled
+                connection concurrently with the data query. Falls back to
+                sequential execution inside an explicit transaction or when the
+                pool has no spare connection. Defaults to the
+                ``enable_concurrent_count`` driver feature (False).
             **kwargs: Additional keyword arguments
 
         Returns:
@@ -1180,6 +1325,8 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             - List of data rows (transformed by schema_type if provided)
             - Total count of rows matching the query (ignoring LIMIT/OFFSET)
         """
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
         sql_statement = self.prepare_statement(
             statement, parameters, statement_config=statement_config or self.statement_config, kwargs=kwargs
         )
@@ -1194,8 +1341,17 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
                 return (cast("list[SchemaT]", self.to_schema(data, schema_type=schema_type)), total)
             return (data, total)
 
-        count_result = await self.dispatch_statement_execution(self._count_query(sql_statement), self.connection)
-        select_result = await self.dispatch_statement_execution(sql_statement, self.connection)
+        count_statement = self._count_query(sql_statement)
+        if concurrent_count is None:
+            concurrent_count = bool(self.driver_features.get("enable_concurrent_count", False))
+        auxiliary_connection = self._auxiliary_connection_context() if concurrent_count else None
+        if auxiliary_connection is not None:
+            select_result, count_result = await self._execute_with_concurrent_count(
+                sql_statement, count_statement, auxiliary_connection
+            )
+        else:
+            count_result = await self.dispatch_statement_execution(count_statement, self.connection)
+            select_result = await self.dispatch_statement_execution(sql_statement, self.connection)
 
         return (select_result.get_data(schema_type=schema_type), count_result.scalar())
 
@@ -1207,7 +1363,9 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT]",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         count_with_window: bool = False,
+        concurrent_count: "bool | None" = None,
         **kwargs: Any,
     ) -> "tuple[list[SchemaT], int]": ...
 
@@ -1219,7 +1377,9 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: None = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         count_with_window: bool = False,
+        concurrent_count: "bool | None" = None,
         **kwargs: Any,
     ) -> "tuple[list[dict[str, Any]], int]": ...
 
@@ -1230,7 +1390,9 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT] | None" = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         count_with_window: bool = False,
+        concurrent_count: "bool | None" = None,
         **kwargs: Any,
     ) -> "tuple[list[SchemaT] | list[dict[str, Any]], int]":
         """Execute a select statement and return both the data and total count.
@@ -1249,7 +1411,9 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             *parameters,
             schema_type=schema_type,
             statement_config=statement_config,
+            timeout=timeout,
             count_with_window=count_with_window,
+            concurrent_count=concurrent_count,
             **kwargs,
         )
 
@@ -1263,6 +1427,7 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         return_format: "ArrowReturnFormat" = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -1271,7 +1436,13 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
     ) -> "ArrowResult":
         """Execute query and return results as Apache Arrow format (async).
 
-        This base implementation uses the conversion path: execute() → dict → Arrow.
+        Adapters that can export a SELECT as Arrow batches (``dispatch_arrow_export``,
+        e.g. PostgreSQL binary COPY) use that path, which also satisfies
+        ``native_only``. When the adapter's row stream can hand out positional row
+        chunks, each ``fetchmany`` chunk is columnarized straight into a RecordBatch
+        without building dict rows. Otherwise the conversion path is used:
+        execute() → dict → Arrow. Async drivers fetch every batch before returning,
+        so ``return_format="reader"`` reads from batches that are already built.
         Adapters with native Arrow support (ADBC, DuckDB, BigQuery) override this
         method to use zero-copy native paths for 5-10x performance improvement.
 
@@ -1279,10 +1450,12 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             statement: SQL query string, Statement, or QueryBuilder
             *parameters: Query parameters (same format as execute()/select())
             statement_config: Optional statement configuration override
+            timeout: Statement timeout in seconds (overrides ``statement_config``)
             return_format: "table" for pyarrow.Table (default), "batch" for single RecordBatch,
                 "batches" for iterator of RecordBatches, "reader" for RecordBatchReader
             native_only: If True, raise error if native Arrow unavailable (default: False)
-            batch_size: Rows per batch for "batch"/"batches" format (default: None = all rows)
+            batch_size: Rows per batch for "batch"/"batches" format (default: None = all rows).
+                Also the fetch chunk size on the row-chunk path.
             arrow_schema: Optional pyarrow.Schema for type casting
             **kwargs: Additional keyword arguments
 
@@ -1292,15 +1465,61 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         Raises:
             ImproperConfigurationError: If native_only=True and adapter doesn't support native Arrow
         """
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
+        sql_statement = self.prepare_statement(
+            statement, parameters, statement_config=statement_config or self.statement_config, kwargs=kwargs
+        )
+        is_select = sql_statement.returns_rows() and sql_statement.operation_type == "SELECT"
+        export = (
+            await self._open_arrow_export(sql_statement, batch_size or DEFAULT_STORAGE_BATCH_SIZE)
+            if is_select
+            else None
+        )
+        if export is not None:
+            try:
+                exported = [batch async for batch in export]
+            finally:
+                await export.aclose()
+            table = arrow_table_from_row_batches(
+                exported, exported[0].schema.names, combine_chunks=batch_size is None and return_format != "table"
+            )
+            return build_arrow_result_from_table(
+                sql_statement, table, return_format=return_format, batch_size=batch_size, arrow_schema=arrow_schema
+            )
         if native_only:
             msg = (
-                f"Adapter '{self.__class__.__name__}' does not support native Arrow results. "
+                f"Adapter '{self.__class__.__name__}' does not support native Arrow results for this statement. "
                 f"Use native_only=False to allow conversion path, or switch to an adapter "
                 f"with native Arrow support (ADBC, DuckDB, BigQuery)."
             )
             raise ImproperConfigurationError(msg)
 
-        result = await self.execute(statement, *parameters, statement_config=statement_config, **kwargs)
+        if is_select:
+            stream = self._open_select_stream(sql_statement, batch_size or DEFAULT_STORAGE_BATCH_SIZE)
+            if stream is not None and stream.supports_row_chunks():
+                batches: list[Any] = []
+                column_names: list[str] = []
+                column_types: dict[str, str] | None = None
+                try:
+                    while True:
+                        rows, column_names, column_types = await stream.next_row_chunk()
+                        if not rows:
+                            break
+                        batches.append(rows_to_arrow_batch(rows, column_names))
+                    table = arrow_table_from_row_batches(
+                        batches,
+                        column_names,
+                        column_types,
+                        combine_chunks=batch_size is None and return_format != "table",
+                    )
+                finally:
+                    await stream.aclose()
+                return build_arrow_result_from_table(
+                    sql_statement, table, return_format=return_format, batch_size=batch_size, arrow_schema=arrow_schema
+                )
+
+        result = await self.execute(sql_statement)
 
         arrow_data = convert_dict_to_arrow_with_schema(
             result.get_data(),
@@ -1324,6 +1543,7 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         /,
         *parameters: "StatementParameters | StatementFilter",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         return_format: "ArrowReturnFormat" = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -1342,6 +1562,7 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             statement,
             *parameters,
             statement_config=statement_config,
+            timeout=timeout,
             return_format=return_format,
             native_only=native_only,
             batch_size=batch_size,
@@ -1349,6 +1570,102 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             **kwargs,
         )
 
+    def select_stream_arrow(
+        self,
+        statement: "Statement | QueryBuilder",
+        /,
+        *parameters: "StatementParameters | StatementFilter",
+        statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
+        batch_size: int = DEFAULT_STORAGE_BATCH_SIZE,
+        arrow_schema: Any = None,
+        native_only: bool = False,
+        **kwargs: Any,
+    ) -> "AsyncArrowBatchStream":
+        """Execute a query and stream the result as Arrow RecordBatches.
+
+        The query runs on the first read. Batches come from the adapter's Arrow
+        export (``dispatch_arrow_export``) or from its row stream, one batch per
+        ``batch_size`` rows, so no dict is built per row and only one batch is held
+        at a time. Adapters without either fall back to
+        ``select_to_arrow(return_format="batches")``, which builds every batch
+        before the first is returned. ``native_only=True`` raises on that fallback
+        unless the adapter has native Arrow results.
+
+        Args:
+            statement: SQL query string, Statement, or QueryBuilder
+            *parameters: Query parameters (same format as execute()/select())
+            statement_config: Optional statement configuration override
+            timeout: Statement timeout in seconds, covering the reads until the stream ends or closes
+            batch_size: Rows fetched per batch (default 10,000)
+            arrow_schema: Optional pyarrow.Schema the batches are built or cast to
+            native_only: Require a streaming or native Arrow path (default: False)
+            **kwargs: Additional keyword arguments
+
+        Returns:
+            Context-managed async iterator of RecordBatches.
+
+        Raises:
+            ValueError: If batch_size is less than 1.
+        """
+        if batch_size < 1:
+            msg = "batch_size must be greater than or equal to 1"
+            raise ValueError(msg)
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
+        sql_statement = self.prepare_statement(
+            statement, parameters, statement_config=statement_config or self.statement_config, kwargs=kwargs
+        )
+        return AsyncArrowBatchStream(
+            functools.partial(self._open_arrow_stream, sql_statement, batch_size, arrow_schema, native_only)
+        )
+
+    def fetch_stream_arrow(
+        self,
+        statement: "Statement | QueryBuilder",
+        /,
+        *parameters: "StatementParameters | StatementFilter",
+        statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
+        batch_size: int = DEFAULT_STORAGE_BATCH_SIZE,
+        arrow_schema: Any = None,
+        native_only: bool = False,
+        **kwargs: Any,
+    ) -> "AsyncArrowBatchStream":
+        """Execute a query and stream the result as Arrow RecordBatches.
+
+        This is an alias for :meth:`select_stream_arrow` provided for users familiar
+        with asyncpg's fetch() naming convention.
+
+        See Also:
+            select_stream_arrow(): Primary method with identical behavior and full documentation
+        """
+        return self.select_stream_arrow(
+            statement,
+            *parameters,
+            statement_config=statement_config,
+            timeout=timeout,
+            batch_size=batch_size,
+            arrow_schema=arrow_schema,
+            native_only=native_only,
+            **kwargs,
+        )
+
+    async def _open_arrow_stream(
+        self, statement: "SQL", batch_size: int, arrow_schema: Any, native_only: bool
+    ) -> "AsyncIterator[ArrowRecordBatch]":
+        batches = await self.dispatch_arrow_stream(statement, batch_size, arrow_schema)
+        if batches is not None:
+            return batches
+        result = await self.select_to_arrow(
+            statement,
+            return_format="batches",
+            native_only=native_only,
+            batch_size=batch_size,
+            arrow_schema=arrow_schema,
+        )
+        return aiter_arrow_batches(result.data)
+
     # ─────────────────────────────────────────────────────────────────────────────
     # ROW STREAMING API
     # ─────────────────────────────────────────────────────────────────────────────
@@ -1361,8 +1678,11 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT]",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[SchemaT]": ...
 
@@ -1374,8 +1694,11 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: None = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[dict[str, Any]]": ...
 
@@ -1386,20 +1709,48 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT] | None" = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[SchemaT] | AsyncRowStream[dict[str, Any]]":
-        """Execute a query and stream rows in chunks."""
+        """Execute a query and stream rows in chunks.
+
+        ``prefetch`` greater than 0 keeps up to that many chunks fetching ahead of
+        the consumer in a background task, so database round-trips overlap with row
+        processing. It applies to native streams only, and the session must not be
+        used for other statements while a prefetching stream is open.
+
+        ``adaptive_chunks`` (``True`` or an :class:`AdaptiveChunkSizing`) starts at
+        ``chunk_size`` and resizes each later fetch from the measured width and
+        fetch time of the previous chunk. ``stream.telemetry()`` reports the sizes
+        used. It applies to native streams whose source supports resizing.
+
+        ``timeout`` overrides ``StatementConfig.statement_timeout``. On native
+        streams the deadline covers every fetch until the stream ends or closes,
+        and ``StatementTimeoutError`` is raised once it passes.
+        """
         if chunk_size < 1:
             msg = "chunk_size must be greater than or equal to 1"
             raise ValueError(msg)
+        if prefetch < 0:
+            msg = "prefetch must be greater than or equal to 0"
+            raise ValueError(msg)
+        if timeout is not None:
+            statement_config = (statement_config or self.statement_config).replace(statement_timeout=timeout)
         sql_statement = self.prepare_statement(
             statement, parameters, statement_config=statement_config or self.statement_config, kwargs=kwargs
         )
-        stream = self.dispatch_select_stream(sql_statement, chunk_size)
+        stream = self._open_select_stream(sql_statement, chunk_size)
         if stream is not None:
-            return stream._with_schema_type(schema_type)
+            return (
+                stream
+                ._with_adaptive_chunks(adaptive_chunks, chunk_size)
+                ._with_prefetch(prefetch)
+                ._with_schema_type(schema_type)
+            )
         if native_only:
             msg = (
                 f"Adapter '{type(self).__name__}' does not support native row streaming. "
@@ -1417,8 +1768,11 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT]",
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[SchemaT]": ...
 
@@ -1430,8 +1784,11 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: None = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[dict[str, Any]]": ...
 
@@ -1442,8 +1799,11 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         *parameters: "StatementParameters | StatementFilter",
         schema_type: "type[SchemaT] | None" = None,
         statement_config: "StatementConfig | None" = None,
+        timeout: "float | None" = None,
         chunk_size: int = 1000,
         native_only: bool = False,
+        prefetch: int = 0,
+        adaptive_chunks: "bool | AdaptiveChunkSizing" = False,
         **kwargs: Any,
     ) -> "AsyncRowStream[SchemaT] | AsyncRowStream[dict[str, Any]]":
         """Execute a query and stream rows in chunks.
@@ -1459,8 +1819,11 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             *parameters,
             schema_type=schema_type,
             statement_config=statement_config,
+            timeout=timeout,
             chunk_size=chunk_size,
             native_only=native_only,
+            prefetch=prefetch,
+            adaptive_chunks=adaptive_chunks,
             **kwargs,
         )
 
@@ -1469,6 +1832,58 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         _ = (statement, chunk_size)
         return None
 
+    async def dispatch_arrow_export(
+        self, statement: "SQL", batch_size: int
+    ) -> "AsyncGenerator[ArrowRecordBatch, None] | None":
+        """Adapter hook exporting a SELECT as Arrow batches, or None when unsupported.
+
+        The generator yields at least one batch (an empty one for an empty
+        result) so consumers always see the schema, and releases its cursor when
+        exhausted or closed.
+        """
+        _ = (statement, batch_size)
+        return None
+
+    async def dispatch_arrow_stream(
+        self, statement: "SQL", batch_size: int, arrow_schema: Any = None
+    ) -> "AsyncIterator[ArrowRecordBatch] | None":
+        """Adapter hook streaming a SELECT as RecordBatches, or None when unsupported.
+
+        Uses ``dispatch_arrow_export`` when available, otherwise the row stream's
+        positional row chunks. The returned iterator closes its cursor when
+        exhausted or closed.
+        """
+        if not (statement.returns_rows() and statement.operation_type == "SELECT"):
+            return None
+        export = await self._open_arrow_export(statement, batch_size)
+        if export is not None:
+            return aiter_arrow_batches(export, arrow_schema)
+        stream = self._open_select_stream(statement, batch_size)
+        if stream is None:
+            return None
+        if not stream.supports_row_chunks():
+            await stream.aclose()
+            return None
+        return aiter_row_chunk_batches(stream, arrow_schema)
+
+    def _open_select_stream(self, statement: "SQL", chunk_size: int) -> "AsyncRowStream[dict[str, Any]] | None":
+        """Open the adapter's row stream, holding ``statement_timeout`` from the first fetch until it closes."""
+        stream = self.dispatch_select_stream(statement, chunk_size)
+        timeout = statement.statement_config.statement_timeout
+        if stream is None or timeout is None:
+            return stream
+        return stream._with_timeout(self._create_statement_timeout(self.connection, timeout))
+
+    async def _open_arrow_export(
+        self, statement: "SQL", batch_size: int
+    ) -> "AsyncGenerator[ArrowRecordBatch, None] | AsyncTimeoutIterator[ArrowRecordBatch] | None":
+        """Open the adapter's Arrow export, holding ``statement_timeout`` until it is exhausted or closed."""
+        export = await self.dispatch_arrow_export(statement, batch_size)
+        timeout = statement.statement_config.statement_timeout
+        if export is None or timeout is None:
+            return export
+        return AsyncTimeoutIterator(export, self._create_statement_timeout(self.connection, timeout))
+
     # ─────────────────────────────────────────────────────────────────────────────
     # STACK EXECUTION
     # ─────────────────────────────────────────────────────────────────────────────
@@ -1604,6 +2019,8 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         file_format: "StorageFormat",
         partitioner: "dict[str, object] | None" = None,
         overwrite: bool = False,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "StorageBridgeJob":
         """Load artifacts from storage into the target table.
 
@@ -1613,6 +2030,8 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             file_format: File format of source.
             partitioner: Optional partitioner configuration.
             overwrite: Whether to overwrite existing data.
+            columns: Columns to read from the source; the rest are never fetched.
+            filter: Row filter (``pyarrow.compute.Expression`` or DNF tuples) pushed into the read.
 
         Returns:
             StorageBridgeJob with execution telemetry.
@@ -1716,8 +2135,91 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         msg = "Adapters must override _connection_in_transaction()"
         raise NotImplementedError(msg)
 
+    def _auxiliary_connection_context(self) -> Any:
+        """Return a context for a second pooled connection, or None to stay sequential.
+
+        Work moved to another connection cannot see uncommitted changes, so an
+        explicit transaction on the session connection always keeps execution
+        on that connection.
+        """
+        provider = self._connection_provider
+        if provider is None or self._connection_in_transaction():
+            return None
+        return provider()
+
+    async def _execute_with_concurrent_count(
+        self, statement: "SQL", count_statement: "SQL", auxiliary_connection: Any
+    ) -> "tuple[SQLResult, SQLResult]":
+        """Run the data query on the session connection and the count query on an auxiliary one."""
+        async with auxiliary_connection as count_connection:
+            outcomes = await asyncio.gather(
+                self.dispatch_statement_execution(statement, self.connection),
+                self.dispatch_statement_execution(count_statement, count_connection),
+                return_exceptions=True,
+            )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return cast("SQLResult", outcomes[0]), cast("SQLResult", outcomes[1])
+
     async def _dispatch_statement_with_cursor(
         self, connection: Any, statement: "SQL", *, has_execution_parameters: bool
+    ) -> "SQLResult":
+        """Execute a statement, enforcing ``StatementConfig.statement_timeout`` when set."""
+        timeout = statement.statement_config.statement_timeout
+        if timeout is None:
+            return await self._dispatch_statement_on_cursor(
+                connection, statement, has_execution_parameters=has_execution_parameters
+            )
+        timeout_scope = self._create_statement_timeout(connection, timeout)
+        try:
+            async with timeout_scope:
+                return await timeout_scope.run(
+                    self._dispatch_statement_on_cursor(
+                        connection, statement, has_execution_parameters=has_execution_parameters
+                    )
+                )
+        except StatementTimeoutError:
+            raise
+        except Exception as exc:
+            if timeout_scope.expired:
+                raise timeout_scope.timeout_error() from exc
+            raise
+
+    async def _call_with_statement_timeout(self, timeout: float, operation: "Callable[[], Awaitable[Any]]") -> Any:
+        """Await ``operation`` inside a statement timeout scope on the session connection.
+
+        Native Arrow overrides use this for ``timeout=``. Errors raised after the
+        deadline become ``StatementTimeoutError``.
+        """
+        timeout_scope = self._create_statement_timeout(self.connection, timeout)
+        try:
+            async with timeout_scope:
+                return await timeout_scope.run(operation())
+        except StatementTimeoutError:
+            raise
+        except Exception as exc:
+            if timeout_scope.expired:
+                raise timeout_scope.timeout_error() from exc
+            raise
+
+    def _create_statement_timeout(self, connection: Any, timeout: float) -> AsyncStatementTimeout:
+        """Create the adapter-specific timeout scope.
+
+        The base scope cancels the awaiting task once the deadline passes. Adapters
+        that enforce timeouts on the connection itself override this hook.
+
+        Args:
+            connection: Connection executing the statement.
+            timeout: Timeout in seconds.
+
+        Returns:
+            Timeout scope for the statement.
+        """
+        return AsyncStatementTimeout(connection, timeout)
+
+    async def _dispatch_statement_on_cursor(
+        self, connection: Any, statement: "SQL", *, has_execution_parameters: bool
     ) -> "SQLResult":
         """Execute a statement while owning only the cursor context."""
         cursor_manager = self.with_cursor(connection)
@@ -1889,6 +2391,7 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         format_hint: "StorageFormat | None" = None,
         storage_options: "dict[str, Any] | None" = None,
         pipeline: "AsyncStoragePipeline | None" = None,
+        partitioner: "dict[str, object] | None" = None,
     ) -> "StorageTelemetry":
         """Write Arrow result to storage with telemetry.
 
@@ -1898,31 +2401,250 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             format_hint: Optional format hint.
             storage_options: Optional storage options.
             pipeline: Optional storage pipeline.
+            partitioner: Optional ``columns``/``rows`` partitioner fanning rows out to part files.
+
+        Returns:
+            StorageTelemetry with write metrics.
+        """
+        partition_spec = parse_partitioner(partitioner)
+        runtime = self.observability
+        span = runtime.start_storage_span(
+            "write", destination=stringify_storage_target(destination), format_label=format_hint
+        )
+        try:
+            if partition_spec is None:
+                telemetry = await result.write_to_storage_async(
+                    destination, format_hint=format_hint, storage_options=storage_options, pipeline=pipeline
+                )
+            else:
+                writer = AsyncPartitionedWriter(
+                    pipeline or self._storage_pipeline(),
+                    destination,
+                    partition_spec,
+                    format_hint=format_hint,
+                    storage_options=storage_options,
+                    progress=runtime.record_storage_progress,
+                )
+                try:
+                    for batch in self._coerce_arrow_table(result).to_batches():
+                        await writer.write_batch(batch)
+                except Exception:
+                    await writer.abort()
+                    raise
+                telemetry = await writer.close()
+        except Exception as exc:
+            runtime.end_storage_span(span, error=exc)
+            raise
+        telemetry = runtime.annotate_storage_telemetry(telemetry)
+        runtime.end_storage_span(span, telemetry=telemetry)
+        return telemetry
+
+    async def _write_storage_stream(
+        self,
+        statement: "Statement | QueryBuilder | SQL | str",
+        parameters: "tuple[StatementParameters | StatementFilter, ...]",
+        destination: "StorageDestination",
+        *,
+        statement_config: "StatementConfig | None" = None,
+        format_hint: "StorageFormat | None" = None,
+        pipeline: "AsyncStoragePipeline | None" = None,
+        partitioner: "dict[str, object] | None" = None,
+        kwargs: "dict[str, Any] | None" = None,
+    ) -> "StorageTelemetry":
+        """Stream query results into storage one batch at a time.
+
+        Async counterpart of the sync driver's ``_write_storage_stream``: rows
+        come from the adapter's Arrow export or native row stream in
+        ``batch_size`` chunks and each chunk is encoded and uploaded before the
+        next is fetched.
+
+        Args:
+            statement: SQL statement to execute.
+            parameters: Positional parameters and filters for the statement.
+            destination: Storage destination.
+            statement_config: Optional statement configuration override.
+            format_hint: Optional output format (defaults to Parquet).
+            pipeline: Optional storage pipeline.
+            partitioner: Optional ``columns``/``rows`` partitioner fanning rows out to part files.
+            kwargs: Extra statement keyword arguments plus ``batch_size``/``arrow_schema``/``compression``.
 
         Returns:
             StorageTelemetry with write metrics.
         """
+        statement_kwargs = dict(kwargs) if kwargs else {}
+        batch_size = int(statement_kwargs.pop("batch_size", None) or DEFAULT_STORAGE_BATCH_SIZE)
+        arrow_schema = statement_kwargs.pop("arrow_schema", None)
+        compression = statement_kwargs.pop("compression", None)
+        statement_kwargs.pop("return_format", None)
+        statement_kwargs.pop("native_only", None)
+        if batch_size < 1:
+            msg = "batch_size must be greater than or equal to 1"
+            raise ValueError(msg)
+        sql_statement = self.prepare_statement(
+            statement, parameters, statement_config=statement_config or self.statement_config, kwargs=statement_kwargs
+        )
+        active_pipeline = pipeline or self._storage_pipeline()
         runtime = self.observability
         span = runtime.start_storage_span(
             "write", destination=stringify_storage_target(destination), format_label=format_hint
         )
+        partition_spec = parse_partitioner(partitioner)
+        writer: AsyncStorageWriter | AsyncPartitionedWriter | None = None
         try:
-            telemetry = await result.write_to_storage_async(
-                destination, format_hint=format_hint, storage_options=storage_options, pipeline=pipeline
+            if partition_spec is None:
+                writer = await active_pipeline.open_writer(
+                    destination,
+                    format_hint=format_hint,
+                    compression=compression,
+                    schema=arrow_schema,
+                    progress=runtime.record_storage_progress,
+                )
+            else:
+                writer = AsyncPartitionedWriter(
+                    active_pipeline,
+                    destination,
+                    partition_spec,
+                    format_hint=format_hint,
+                    compression=compression,
+                    schema=arrow_schema,
+                    progress=runtime.record_storage_progress,
+                )
+            export = (
+                await self._open_arrow_export(sql_statement, batch_size)
+                if sql_statement.returns_rows() and sql_statement.operation_type == "SELECT"
+                else None
             )
+            stream = self._open_select_stream(sql_statement, batch_size) if export is None else None
+            if export is not None:
+                try:
+                    async for batch in export:
+                        if batch.num_rows:
+                            await writer.write_batch(batch)
+                finally:
+                    await export.aclose()
+            elif stream is None:
+                arrow_result = await self.select_to_arrow(
+                    sql_statement, return_format="batches", batch_size=batch_size, arrow_schema=arrow_schema
+                )
+                for batch in arrow_result.data:
+                    await writer.write_batch(batch)
+            else:
+                async with stream:
+                    chunk = await stream.next_chunk()
+                    while chunk:
+                        await writer.write_rows(chunk)
+                        chunk = await stream.next_chunk()
+            telemetry = await writer.close()
         except Exception as exc:
+            if writer is not None:
+                await writer.abort()
             runtime.end_storage_span(span, error=exc)
             raise
         telemetry = runtime.annotate_storage_telemetry(telemetry)
         runtime.end_storage_span(span, telemetry=telemetry)
         return telemetry
 
+    async def _load_storage_sources(
+        self,
+        table: str,
+        source: "StorageDestination",
+        *,
+        file_format: "StorageFormat",
+        partitioner: "dict[str, object] | None" = None,
+        overwrite: bool = False,
+        storage_options: "dict[str, Any] | None" = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> "StorageBridgeJob":
+        """Load every object matched by a glob or prefix source into ``table``.
+
+        Files are read concurrently and merged into one batch stream (see
+        ``parse_multi_source_options`` for the ``partitioner`` keys that tune
+        concurrency, read-ahead, and ordering). Every ``rows_per_load`` rows are
+        handed to the adapter's ``load_from_arrow``, so each chunk goes through
+        the native bulk-load path. The whole load runs in one transaction (the
+        caller's, when one is already open), so ``overwrite`` clears the table
+        once and a failure part-way leaves the table as it was.
+
+        Args:
+            table: Target table name.
+            source: Glob (``s3://bucket/events/*.parquet``) or prefix (``/data/events/``).
+            file_format: File format of every matched object.
+            partitioner: Optional multi-file load settings.
+            overwrite: Whether to replace existing table data.
+            storage_options: Optional storage options.
+            columns: Columns to read from every object.
+            filter: Row filter pushed into every object's reader.
+
+        Returns:
+            StorageBridgeJob with load telemetry and the aggregated read telemetry as its source.
+        """
+        options = parse_multi_source_options(partitioner)
+        runtime = self.observability
+        source_label = stringify_storage_target(source) or ""
+        span = runtime.start_storage_span("read", destination=source_label, format_label=file_format)
+        pipeline = self._storage_pipeline()
+        loaded_rows = 0
+        loaded_bytes = 0
+        chunks = 0
+        started_transaction = False
+        try:
+            sources = await pipeline.expand_sources(source, storage_options=storage_options)
+            reader = AsyncMultiSourceReader(
+                pipeline,
+                source_label,
+                sources,
+                file_format,
+                options,
+                storage_options=storage_options,
+                on_file=runtime.record_storage_file_read,
+                columns=columns,
+                filter=filter,
+            )
+            if not self._connection_in_transaction():
+                await self.begin()
+                started_transaction = True
+            async with reader:
+                while True:
+                    chunk = await reader.read_next_table(options.rows_per_load)
+                    if chunk is None:
+                        break
+                    job = await self.load_from_arrow(table, chunk, overwrite=overwrite and chunks == 0)
+                    loaded_rows += int(job.telemetry.get("rows_processed", 0))
+                    loaded_bytes += int(job.telemetry.get("bytes_processed", 0))
+                    chunks += 1
+            if started_transaction:
+                await self.commit()
+                started_transaction = False
+            inbound = reader.telemetry()
+        except Exception as exc:
+            if started_transaction:
+                try:
+                    await self.rollback()
+                except Exception as rollback_error:
+                    logger.debug("Rollback after storage load failure failed: %s", rollback_error)
+            runtime.end_storage_span(span, error=exc)
+            raise
+        inbound = runtime.annotate_storage_telemetry(inbound)
+        runtime.end_storage_span(span, telemetry=inbound)
+        telemetry_payload: StorageTelemetry = {
+            "destination": table,
+            "rows_processed": loaded_rows,
+            "bytes_processed": loaded_bytes,
+            "format": "arrow",
+            "extra": {"chunks": chunks},
+        }
+        self._attach_partition_telemetry(telemetry_payload, partitioner)
+        return self._storage_job(telemetry_payload, inbound)
+
     async def _read_storage_arrow(
         self,
         source: "StorageDestination",
         *,
         file_format: "StorageFormat",
         storage_options: "dict[str, Any] | None" = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "tuple[ArrowTable, StorageTelemetry]":
         """Read Arrow table from storage with telemetry.
 
@@ -1930,6 +2652,8 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
             source: Storage source path.
             file_format: File format to read.
             storage_options: Optional storage options.
+            columns: Columns to read (projection pushdown).
+            filter: Row filter expression or DNF tuples (predicate pushdown).
 
         Returns:
             Tuple of (ArrowTable, StorageTelemetry).
@@ -1941,7 +2665,7 @@ class AsyncDriverAdapterBase(CommonDriverAttributesMixin):
         pipeline = self._storage_pipeline()
         try:
             table, telemetry = await pipeline.read_arrow_async(
-                source, file_format=file_format, storage_options=storage_options
+                source, file_format=file_format, storage_options=storage_options, columns=columns, filter=filter
             )
         except Exception as exc:
             runtime.end_storage_span(span, error=exc)
@@ -51,6 +51,7 @@ from sqlspec.driver._storage_helpers import (
     build_ingest_telemetry,
     coerce_arrow_table,
     create_storage_job,
+    is_multi_storage_source,
     records_to_arrow_table,
 )
 from sqlspec.exceptions import (
@@ -82,14 +83,17 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from sqlspec.core import ArrowResult, FilterTypeT, StatementFilter
+    from sqlspec.core.load_shedding import AdmissionControl
     from sqlspec.core.parameters._types import ConvertedParameters
     from sqlspec.core.result._base import RowFormat
+    from sqlspec.core.retry import RetryBudget, RetryPolicy
     from sqlspec.core.stack import StatementStack
     from sqlspec.data_dictionary._types import DialectConfig
     from sqlspec.storage import (
         AsyncStoragePipeline,
         StorageBridgeJob,
         StorageCapabilities,
+        StorageDestination,
         StorageTelemetry,
         SyncStoragePipeline,
     )
@@ -144,8 +148,7 @@ class SyncExceptionHandler(Protocol):
     handlers store mapped exceptions in pending_exception for the caller to raise.
     """
 
-    @property
-    def pending_exception(self) -> Exception | None: ...
+    pending_exception: Exception | None
 
     def __enter__(self) -> Self: ...
 
@@ -598,8 +601,11 @@ class CommonDriverAttributesMixin:
     """Common attributes and methods for driver adapters."""
 
     __slots__ = (
+        "_admission_control",
+        "_connection_provider",
         "_observability",
         "_processed_state_pool",
+        "_retry_budget",
         "_statement_cache",
         "_statement_pool",
         "_stmt_cache",
@@ -634,6 +640,9 @@ class CommonDriverAttributesMixin:
         self.statement_config = statement_config
         self.driver_features = driver_features or {}
         self._observability = observability
+        self._connection_provider: Callable[[], Any] | None = None
+        self._admission_control: AdmissionControl | None = None
+        self._retry_budget: RetryBudget | None = None
         self._statement_cache: OrderedDict[str, SQL] = OrderedDict()
         self._stmt_cache_max_size = self._statement_cache_size()
         self._stmt_cache = QueryCache(self._stmt_cache_max_size)
@@ -653,6 +662,30 @@ class CommonDriverAttributesMixin:
         self._observability = runtime
         self._refresh_statement_cache_state()
 
+    def attach_connection_provider(self, provider: "Callable[[], Any] | None") -> None:
+        """Attach a factory for auxiliary pooled connections.
+
+        The provider returns a connection context manager, or ``None`` when the
+        owning pool cannot spare another connection without queuing.
+        """
+        self._connection_provider = provider
+
+    def attach_retry_budget(self, budget: "RetryBudget | None") -> None:
+        """Attach the owning config's retry budget.
+
+        Retry policies without a budget of their own draw from it.
+        """
+        self._retry_budget = budget
+
+    def attach_admission_control(self, control: "AdmissionControl | None") -> None:
+        """Attach the owning config's circuit breaker and admission limiter.
+
+        Every statement dispatched through ``dispatch_statement_execution`` is
+        admitted first and its outcome is fed back to the breaker.
+        """
+        self._admission_control = control
+        self._refresh_statement_cache_state()
+
     @property
     def observability(self) -> "ObservabilityRuntime":
         """Return the observability runtime, creating a disabled instance when absent."""
@@ -890,8 +923,11 @@ class CommonDriverAttributesMixin:
         if statement_config is None:
             statement_config = self.statement_config
 
-        # FAST PATH: String statement with simple parameters
-        if isinstance(statement, str):
+        # FAST PATH: String statement with simple parameters. The cache only holds
+        # statements built with the driver's own config, so per-call overrides
+        # (such as ``timeout=``) always build a fresh statement.
+        use_cache = statement_config is self.statement_config
+        if use_cache and isinstance(statement, str):
             cached_sql = self._statement_cache.get(statement)
             if cached_sql is not None and not kwargs:
                 self._statement_cache.move_to_end(statement)
@@ -912,7 +948,13 @@ class CommonDriverAttributesMixin:
         else:
             sql_statement = self._prepare_from_string(statement, data_parameters, statement_config, kwargs)
             # Cache the newly created SQL object for future use
-            if not filters and not kwargs and isinstance(statement, str) and self._stmt_cache_max_size > 0:
+            if (
+                use_cache
+                and not filters
+                and not kwargs
+                and isinstance(statement, str)
+                and self._stmt_cache_max_size > 0
+            ):
                 if len(self._statement_cache) >= self._stmt_cache_max_size:
                     self._statement_cache.popitem(last=False)
                 self._statement_cache[statement] = sql_statement
@@ -1027,9 +1069,43 @@ class CommonDriverAttributesMixin:
 
     def _refresh_statement_cache_state(self) -> None:
         self._stmt_cache_enabled = bool(
-            self._stmt_cache_max_size > 0 and not self.statement_config._has_transformers and self.observability.is_idle
+            self._stmt_cache_max_size > 0
+            and not self.statement_config._has_transformers
+            and self.statement_config.statement_timeout is None
+            and self._admission_control is None
+            and self.observability.is_idle
         )
 
+    def _next_retry_delay(self, policy: "RetryPolicy", error: Exception, retry: int) -> "float | None":
+        """Return the backoff before the next attempt, or None when ``error`` must propagate.
+
+        Records ``retry.attempts``, ``retry.exhausted`` and ``retry.budget_exhausted``
+        counters on the observability runtime.
+        """
+        if not policy.is_retryable(error):
+            return None
+        if retry + 1 >= policy.max_attempts:
+            self.observability.increment_metric("retry.exhausted")
+            return None
+        if not policy.acquire_retry(self._retry_budget):
+            self.observability.increment_metric("retry.budget_exhausted")
+            return None
+        delay = policy.backoff(retry)
+        self.observability.increment_metric("retry.attempts")
+        if not policy.log_retries:
+            return delay
+        log_with_context(
+            logger,
+            logging.DEBUG,
+            "driver.retry",
+            driver=type(self).__name__,
+            attempt=retry + 2,
+            max_attempts=policy.max_attempts,
+            delay_s=delay,
+            error_type=type(error).__name__,
+        )
+        return delay
+
     def _require_capability(self, capability_flag: str) -> None:
         """Check that a storage capability is enabled.
 
@@ -1939,6 +2015,11 @@ class CommonDriverAttributesMixin:
         """Normalize dict or positional records into a PyArrow table for ingest."""
         return records_to_arrow_table(records, columns)
 
+    @staticmethod
+    def _is_multi_storage_source(source: "StorageDestination") -> bool:
+        """Return whether a storage source is a glob or prefix naming many objects."""
+        return is_multi_storage_source(source)
+
     def _attach_partition_telemetry(
         self, telemetry: "StorageTelemetry", partitioner: "dict[str, object] | None"
     ) -> None:
@@ -7,7 +7,7 @@ cross-trait attribute access that causes mypyc segmentation faults.
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, cast
 
-from sqlspec.storage import StorageBridgeJob, StorageTelemetry, create_storage_bridge_job
+from sqlspec.storage import StorageBridgeJob, StorageTelemetry, create_storage_bridge_job, is_multi_source
 from sqlspec.utils.arrow_helpers import arrow_table_needs_parameter_preparation as _arrow_rows_need_preparation
 from sqlspec.utils.arrow_helpers import arrow_table_to_rows as _arrow_table_to_rows_impl
 from sqlspec.utils.arrow_helpers import build_ingest_telemetry as _ingest_telemetry_impl
@@ -24,12 +24,14 @@ if TYPE_CHECKING:
 
 __all__ = (
     "CAPABILITY_HINTS",
+    "DEFAULT_STORAGE_BATCH_SIZE",
     "arrow_table_needs_parameter_preparation",
     "arrow_table_to_rows",
     "attach_partition_telemetry",
     "build_ingest_telemetry",
     "coerce_arrow_table",
     "create_storage_job",
+    "is_multi_storage_source",
     "records_to_arrow_table",
     "stringify_storage_target",
 )
@@ -42,6 +44,9 @@ CAPABILITY_HINTS: Final[dict[str, str]] = {
     "parquet_import_enabled": "native Parquet import",
 }
 
+DEFAULT_STORAGE_BATCH_SIZE: Final[int] = 10_000
+"""Rows fetched, encoded, and uploaded per step when streaming query results to storage."""
+
 
 def stringify_storage_target(target: "StorageDestination | None") -> str | None:
     """Convert storage target to string representation.
@@ -59,6 +64,11 @@ def stringify_storage_target(target: "StorageDestination | None") -> str | None:
     return str(target)
 
 
+def is_multi_storage_source(source: "StorageDestination") -> bool:
+    """Return whether a storage source is a glob or prefix that expands to many objects."""
+    return is_multi_source(source)
+
+
 def coerce_arrow_table(source: "ArrowResult | Any") -> "ArrowTable":
     """Coerce various sources to a PyArrow Table.
 
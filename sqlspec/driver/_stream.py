@@ -7,29 +7,85 @@ interpreted adapter sources can feed compiled stream classes):
   list[dict[str, Any]]`` returns the next chunk (empty list signals exhaustion),
   ``close() -> None`` is idempotent and safe at any state including pre-start.
 - async source: same names, all coroutines.
+
+Sources may also implement ``fetch_rows() -> tuple[list[Any], list[str],
+dict[str, str] | None]``, returning the next chunk as positional cursor rows
+together with the column names and the neutral Arrow type tokens derived from
+the cursor description (``None`` when the cursor reports no usable types). An
+empty row list signals exhaustion; column names should still be reported so
+empty results keep their shape. ``select_to_arrow`` uses this to columnarize
+rows without building a dict per row.
+
+``select_stream_arrow`` returns :class:`SyncArrowBatchStream` or
+:class:`AsyncArrowBatchStream`, which wrap a RecordBatch iterator (usually a
+generator owning a cursor) opened on the first read.
+
+``prefetch=N`` wraps the source in :class:`SyncPrefetchRowSource` or
+:class:`AsyncPrefetchRowSource`, which fetch up to ``N`` chunks ahead of the
+consumer on a worker thread or background task.
+
+Row streams also compose lazily: ``map_chunks``, ``filter``, ``to_schema``,
+``batched``, ``take`` and ``tee`` return new streams whose sources pull chunks
+from the parent with ``next_chunk()``, so a pipeline holds about one chunk per
+stage. ``write_to_storage`` and ``execute_many_into`` drain a stream chunk by
+chunk.
+
+``adaptive_chunks=`` wraps the source in :class:`SyncAdaptiveRowSource` or
+:class:`AsyncAdaptiveRowSource`, which resize each fetch towards a byte budget
+and a round-trip latency. Sources opt in by implementing ``set_chunk_size(size:
+int) -> None``; the size applies from the next fetch on.
+
+A statement timeout wraps the source in :class:`SyncTimeoutRowSource` or
+:class:`AsyncTimeoutRowSource`, which keep one timeout scope open from
+``start()`` to ``close()``. Arrow exports use :class:`SyncTimeoutIterator` and
+:class:`AsyncTimeoutIterator` the same way.
 """
 
+import asyncio
 import builtins
 import contextlib
 import inspect
-from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, cast, overload
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypedDict, TypeVar, cast, overload
 
 from typing_extensions import Self
 
+from sqlspec.exceptions import StatementTimeoutError
+from sqlspec.storage import AsyncStoragePipeline, SyncStoragePipeline
 from sqlspec.utils.schema import to_schema
+from sqlspec.utils.serializers import serialize_collection
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
     from types import TracebackType
 
-    from sqlspec.core import SQL
+    from sqlspec.builder import QueryBuilder
+    from sqlspec.core import SQL, Statement, StatementConfig
+    from sqlspec.driver._timeout import AsyncStatementTimeout, SyncStatementTimeout
+    from sqlspec.storage import StorageDestination, StorageFormat, StorageTelemetry
 
 __all__ = (
+    "AdaptiveChunkSizing",
+    "AsyncAdaptiveRowSource",
+    "AsyncArrowBatchStream",
+    "AsyncPrefetchRowSource",
     "AsyncRowSource",
     "AsyncRowStream",
+    "AsyncTimeoutIterator",
+    "AsyncTimeoutRowSource",
     "EagerAsyncRowSource",
     "EagerSyncRowSource",
+    "RowStreamTelemetry",
+    "SyncAdaptiveRowSource",
+    "SyncArrowBatchStream",
+    "SyncPrefetchRowSource",
     "SyncRowSource",
     "SyncRowStream",
+    "SyncTimeoutIterator",
+    "SyncTimeoutRowSource",
+    "estimate_row_bytes",
     "rows_to_dicts",
 )
 
@@ -37,6 +93,8 @@ _StopAsyncBase = getattr(builtins, "Stop" + "Async" + "Iteration")
 _StopAsync = type("_StopAsync", (_StopAsyncBase,), {})
 RowT = TypeVar("RowT")
 SchemaRowT = TypeVar("SchemaRowT")
+OutRowT = TypeVar("OutRowT")
+ItemT = TypeVar("ItemT")
 
 
 class SyncRowSource(Protocol):
@@ -81,6 +139,166 @@ async def _close_async_source(source: AsyncRowSource, error: bool) -> None:
     await cast("Any", close)(error=error)
 
 
+class RowStreamTelemetry(TypedDict):
+    """Fetch statistics reported by ``SyncRowStream.telemetry()`` and ``AsyncRowStream.telemetry()``."""
+
+    adaptive: bool
+    chunks: int
+    rows: int
+    estimated_bytes: int
+    fetch_seconds: float
+    chunk_sizes: "list[int]"
+    next_chunk_size: int
+
+
+class AdaptiveChunkSizing:
+    """Targets for adaptive ``select_stream`` fetch sizes.
+
+    After each full chunk the next fetch size is set so that a chunk holds about
+    ``target_bytes`` of row data and takes about ``target_latency`` seconds to
+    fetch, whichever is smaller. Sizes grow by at most ``max_growth`` per chunk,
+    shrink at once, and stay within ``min_chunk_size`` and ``max_chunk_size``.
+    The first fetch uses the caller's ``chunk_size`` as given; the bounds apply
+    from the first resize on.
+    """
+
+    __slots__ = ("max_chunk_size", "max_growth", "min_chunk_size", "target_bytes", "target_latency")
+
+    def __init__(
+        self,
+        target_bytes: int = 4 * 1024 * 1024,
+        target_latency: float = 0.2,
+        min_chunk_size: int = 16,
+        max_chunk_size: int = 100_000,
+        max_growth: float = 2.0,
+    ) -> None:
+        if target_bytes < 1:
+            msg = "target_bytes must be greater than or equal to 1"
+            raise ValueError(msg)
+        if target_latency <= 0:
+            msg = "target_latency must be greater than 0"
+            raise ValueError(msg)
+        if min_chunk_size < 1 or max_chunk_size < min_chunk_size:
+            msg = "chunk size bounds must satisfy 1 <= min_chunk_size <= max_chunk_size"
+            raise ValueError(msg)
+        if max_growth <= 1:
+            msg = "max_growth must be greater than 1"
+            raise ValueError(msg)
+        self.target_bytes = target_bytes
+        self.target_latency = target_latency
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.max_growth = max_growth
+
+    def clamp(self, chunk_size: int) -> int:
+        """Return ``chunk_size`` limited to the configured bounds."""
+        return max(self.min_chunk_size, min(self.max_chunk_size, chunk_size))
+
+    def next_chunk_size(self, chunk_size: int, row_count: int, row_bytes: float, elapsed: float) -> int:
+        """Return the fetch size to use after a full chunk of ``row_count`` rows."""
+        desired = float(self.max_chunk_size)
+        if row_bytes > 0:
+            desired = min(desired, self.target_bytes / row_bytes)
+        if elapsed > 0:
+            desired = min(desired, row_count * self.target_latency / elapsed)
+        desired = min(desired, chunk_size * self.max_growth)
+        return self.clamp(int(desired))
+
+
+def _resolve_adaptive_chunks(adaptive_chunks: "bool | AdaptiveChunkSizing | None") -> "AdaptiveChunkSizing | None":
+    if isinstance(adaptive_chunks, AdaptiveChunkSizing):
+        return adaptive_chunks
+    if adaptive_chunks:
+        return AdaptiveChunkSizing()
+    return None
+
+
+def _estimate_value_bytes(value: Any) -> int:
+    if value is None:
+        return 1
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, (bool, int, float)):
+        return 8
+    if isinstance(value, dict):
+        return sum(_estimate_value_bytes(key) + _estimate_value_bytes(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_value_bytes(item) for item in value)
+    return 16
+
+
+def estimate_row_bytes(rows: "list[Any]", sample_size: int = 8) -> float:
+    """Return the average payload size of ``rows`` in bytes, measured on an even sample.
+
+    Strings and binary values count their length, numbers count 8 bytes, and
+    nested JSON containers count their contents. Dict rows are measured by
+    value and positional rows by item.
+    """
+    if not rows:
+        return 0.0
+    step = max(1, len(rows) // sample_size)
+    sample = rows[::step][:sample_size]
+    total = 0
+    for row in sample:
+        values = row.values() if isinstance(row, dict) else row
+        total += sum(_estimate_value_bytes(value) for value in values)
+    return total / len(sample)
+
+
+class _ChunkSizer:
+    """Fetch-size state and statistics shared by the adaptive source wrappers."""
+
+    __slots__ = ("chunk_size", "chunk_sizes", "chunks", "estimated_bytes", "fetch_seconds", "policy", "rows")
+
+    def __init__(self, policy: AdaptiveChunkSizing, chunk_size: int) -> None:
+        self.policy = policy
+        self.chunk_size = chunk_size
+        self.chunk_sizes: list[int] = []
+        self.chunks = 0
+        self.rows = 0
+        self.estimated_bytes = 0
+        self.fetch_seconds = 0.0
+
+    def observe(self, chunk: "list[Any]", elapsed: float) -> None:
+        requested = self.chunk_size
+        self.chunk_sizes.append(requested)
+        self.fetch_seconds += elapsed
+        row_count = len(chunk)
+        if not row_count:
+            return
+        row_bytes = estimate_row_bytes(chunk)
+        self.chunks += 1
+        self.rows += row_count
+        self.estimated_bytes += int(row_bytes * row_count)
+        if row_count >= requested:
+            self.chunk_size = self.policy.next_chunk_size(requested, row_count, row_bytes, elapsed)
+
+    def telemetry(self) -> RowStreamTelemetry:
+        return {
+            "adaptive": True,
+            "chunks": self.chunks,
+            "rows": self.rows,
+            "estimated_bytes": self.estimated_bytes,
+            "fetch_seconds": self.fetch_seconds,
+            "chunk_sizes": list(self.chunk_sizes),
+            "next_chunk_size": self.chunk_size,
+        }
+
+
+def _empty_telemetry() -> RowStreamTelemetry:
+    return {
+        "adaptive": False,
+        "chunks": 0,
+        "rows": 0,
+        "estimated_bytes": 0,
+        "fetch_seconds": 0.0,
+        "chunk_sizes": [],
+        "next_chunk_size": 0,
+    }
+
+
 def rows_to_dicts(rows: "list[Any]", column_names: "list[str]") -> "list[dict[str, Any]]":
     """Zip positional rows with column names into dict rows."""
     if not column_names:
@@ -88,10 +306,23 @@ def rows_to_dicts(rows: "list[Any]", column_names: "list[str]") -> "list[dict[st
     return [dict(zip(column_names, row, strict=False)) for row in rows]
 
 
+def _sink_rows(rows: "list[Any]") -> "list[Any]":
+    """Return dict, tuple and list rows as-is and serialize schema rows to dicts."""
+    if not rows or isinstance(rows[0], (dict, tuple, list)):
+        return rows
+    return serialize_collection(rows)
+
+
+def _check_positive(name: str, value: int) -> None:
+    if value < 1:
+        msg = f"{name} must be greater than or equal to 1"
+        raise ValueError(msg)
+
+
 class SyncRowStream(Generic[RowT]):
     """Bounded-memory iterator backed by a chunk source."""
 
-    __slots__ = ("_buffer", "_buffer_index", "_closed", "_schema_type", "_source", "_started")
+    __slots__ = ("_buffer", "_buffer_index", "_closed", "_schema_type", "_sizer", "_source", "_started")
 
     def __init__(self, source: SyncRowSource, schema_type: "type[RowT] | None" = None) -> None:
         self._source = source
@@ -100,6 +331,7 @@ class SyncRowStream(Generic[RowT]):
         self._buffer_index = 0
         self._closed = False
         self._started = False
+        self._sizer: _ChunkSizer | None = None
 
     @overload
     def _with_schema_type(self, schema_type: "type[SchemaRowT]") -> "SyncRowStream[SchemaRowT]": ...
@@ -115,6 +347,121 @@ class SyncRowStream(Generic[RowT]):
             return cast("SyncRowStream[dict[str, Any]]", self)
         return cast("SyncRowStream[SchemaRowT]", self)
 
+    def _with_prefetch(self, prefetch: int) -> Self:
+        if prefetch > 0 and not self._started:
+            self._source = SyncPrefetchRowSource(self._source, prefetch)
+        return self
+
+    def _with_adaptive_chunks(self, adaptive_chunks: "bool | AdaptiveChunkSizing | None", chunk_size: int) -> Self:
+        policy = _resolve_adaptive_chunks(adaptive_chunks)
+        if policy is not None and not self._started and self._sizer is None:
+            sizer = _ChunkSizer(policy, chunk_size)
+            self._source = SyncAdaptiveRowSource(self._source, sizer)
+            self._sizer = sizer
+        return self
+
+    def _with_timeout(self, scope: "SyncStatementTimeout | None") -> Self:
+        if scope is not None and not self._started:
+            self._source = SyncTimeoutRowSource.wrap(self._source, scope)
+        return self
+
+    def telemetry(self) -> RowStreamTelemetry:
+        """Return fetch statistics for adaptive streams; other streams report zeros."""
+        sizer = self._sizer
+        if sizer is None:
+            return _empty_telemetry()
+        return sizer.telemetry()
+
+    def map_chunks(self, func: "Callable[[list[RowT]], list[OutRowT]]") -> "SyncRowStream[OutRowT]":
+        """Return a lazy stream applying ``func`` to each chunk; empty results are skipped."""
+        return SyncRowStream(_SyncChunkOperatorSource(self, func))
+
+    def filter(self, predicate: "Callable[[RowT], bool]") -> "SyncRowStream[RowT]":
+        """Return a lazy stream of the rows for which ``predicate`` is true."""
+        return SyncRowStream(_SyncChunkOperatorSource(self, lambda chunk: [row for row in chunk if predicate(row)]))
+
+    def to_schema(self, schema_type: "type[SchemaRowT]") -> "SyncRowStream[SchemaRowT]":
+        """Return a lazy stream converting each chunk to ``schema_type``."""
+        return SyncRowStream(_SyncChunkOperatorSource(self, None), schema_type=schema_type)
+
+    def batched(self, size: int) -> "SyncRowStream[list[RowT]]":
+        """Return a lazy stream of row lists holding ``size`` rows each; the last may be shorter."""
+        _check_positive("size", size)
+        return SyncRowStream(_SyncBatchedSource(self, size))
+
+    def take(self, limit: int) -> "SyncRowStream[RowT]":
+        """Return a lazy stream of at most ``limit`` rows; this stream is closed once the limit is reached."""
+        if limit < 0:
+            msg = "limit must be greater than or equal to 0"
+            raise ValueError(msg)
+        return SyncRowStream(_SyncTakeSource(self, limit))
+
+    def tee(self, count: int = 2) -> "tuple[SyncRowStream[RowT], ...]":
+        """Split this stream into ``count`` independent streams over the same rows.
+
+        Chunks are kept until every branch has read them, so memory grows with the
+        distance between the fastest and the slowest branch. This stream is closed
+        once every branch is closed and must not be read directly afterwards.
+        """
+        _check_positive("count", count)
+        buffer = _SyncTeeBuffer(self, count)
+        return tuple(SyncRowStream(_SyncTeeSource(buffer, index)) for index in range(count))
+
+    def write_to_storage(
+        self,
+        destination: "StorageDestination",
+        *,
+        format_hint: "StorageFormat | None" = None,
+        storage_options: "dict[str, Any] | None" = None,
+        compression: "str | None" = None,
+        arrow_schema: Any = None,
+        pipeline: "SyncStoragePipeline | None" = None,
+    ) -> "StorageTelemetry":
+        """Write every remaining chunk to storage and close the stream.
+
+        Each chunk is encoded as it arrives (a Parquet row group, an Arrow IPC
+        batch or a CSV/JSON block). Schema rows are serialized to dicts first.
+        """
+        writer = (pipeline or SyncStoragePipeline()).open_writer(
+            destination,
+            format_hint=format_hint,
+            storage_options=storage_options,
+            compression=compression,
+            schema=arrow_schema,
+        )
+        try:
+            with self:
+                chunk = self.next_chunk()
+                while chunk:
+                    writer.write_rows(_sink_rows(chunk))
+                    chunk = self.next_chunk()
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.close()
+
+    def execute_many_into(
+        self,
+        driver: Any,
+        statement: "SQL | Statement | QueryBuilder",
+        *,
+        statement_config: "StatementConfig | None" = None,
+    ) -> int:
+        """Run ``driver.execute_many(statement, chunk)`` for every remaining chunk and close the stream.
+
+        Dict rows bind named parameters and tuple rows bind positional ones. Use a
+        different session than the one the stream reads from unless the adapter
+        allows statements while a cursor is open. Returns the number of rows sent.
+        """
+        total = 0
+        with self:
+            chunk = self.next_chunk()
+            while chunk:
+                driver.execute_many(statement, _sink_rows(chunk), statement_config=statement_config)
+                total += len(chunk)
+                chunk = self.next_chunk()
+        return total
+
     def __enter__(self) -> Self:
         return self
 
@@ -127,30 +474,72 @@ class SyncRowStream(Generic[RowT]):
         return self
 
     def __next__(self) -> RowT:
-        if self._closed:
-            raise StopIteration
-        if not self._started:
-            self._started = True
-            try:
-                self._source.start()
-            except BaseException:
-                self._close(error=True)
-                raise
         if self._buffer_index >= len(self._buffer):
-            try:
-                chunk = self._source.fetch_chunk()
-            except BaseException:
-                self._close(error=True)
-                raise
+            chunk = self._fetch_next_chunk()
             if not chunk:
-                self.close()
                 raise StopIteration
-            self._buffer = self._coerce_chunk(chunk)
+            self._buffer = chunk
             self._buffer_index = 0
         row = self._buffer[self._buffer_index]
         self._buffer_index += 1
         return row
 
+    def next_chunk(self) -> "list[RowT]":
+        """Return the remaining buffered rows or the next source chunk; empty once exhausted."""
+        if self._buffer_index < len(self._buffer):
+            chunk = self._buffer[self._buffer_index :]
+        else:
+            chunk = self._fetch_next_chunk()
+        self._buffer = []
+        self._buffer_index = 0
+        return chunk
+
+    def supports_row_chunks(self) -> bool:
+        """Return True when the source can hand out positional row chunks."""
+        return callable(getattr(self._source, "fetch_rows", None))
+
+    def next_row_chunk(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        """Return the next chunk of positional rows with its column names and type tokens.
+
+        Only valid when :meth:`supports_row_chunks` is True. The rows are empty once
+        the stream is exhausted, at which point the stream closes itself.
+        """
+        if self._closed:
+            return [], [], None
+        self._start_source()
+        try:
+            rows, column_names, column_types = cast("Any", self._source).fetch_rows()
+        except BaseException:
+            self._close(error=True)
+            raise
+        if not rows:
+            self.close()
+        return rows, column_names, column_types
+
+    def _start_source(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        try:
+            self._source.start()
+        except BaseException:
+            self._close(error=True)
+            raise
+
+    def _fetch_next_chunk(self) -> "list[RowT]":
+        if self._closed:
+            return []
+        self._start_source()
+        try:
+            chunk = self._source.fetch_chunk()
+        except BaseException:
+            self._close(error=True)
+            raise
+        if not chunk:
+            self.close()
+            return []
+        return self._coerce_chunk(chunk)
+
     def _coerce_chunk(self, chunk: "list[dict[str, Any]]") -> "list[RowT]":
         schema_type = self._schema_type
         if schema_type is None:
@@ -173,7 +562,7 @@ class SyncRowStream(Generic[RowT]):
 class AsyncRowStream(Generic[RowT]):
     """Async bounded-memory iterator backed by an async chunk source."""
 
-    __slots__ = ("_buffer", "_buffer_index", "_closed", "_schema_type", "_source", "_started")
+    __slots__ = ("_buffer", "_buffer_index", "_closed", "_schema_type", "_sizer", "_source", "_started")
 
     def __init__(self, source: AsyncRowSource, schema_type: "type[RowT] | None" = None) -> None:
         self._source = source
@@ -182,6 +571,7 @@ class AsyncRowStream(Generic[RowT]):
         self._buffer_index = 0
         self._closed = False
         self._started = False
+        self._sizer: _ChunkSizer | None = None
 
     @overload
     def _with_schema_type(self, schema_type: "type[SchemaRowT]") -> "AsyncRowStream[SchemaRowT]": ...
@@ -197,6 +587,114 @@ class AsyncRowStream(Generic[RowT]):
             return cast("AsyncRowStream[dict[str, Any]]", self)
         return cast("AsyncRowStream[SchemaRowT]", self)
 
+    def _with_prefetch(self, prefetch: int) -> Self:
+        if prefetch > 0 and not self._started:
+            self._source = AsyncPrefetchRowSource(self._source, prefetch)
+        return self
+
+    def _with_adaptive_chunks(self, adaptive_chunks: "bool | AdaptiveChunkSizing | None", chunk_size: int) -> Self:
+        policy = _resolve_adaptive_chunks(adaptive_chunks)
+        if policy is not None and not self._started and self._sizer is None:
+            sizer = _ChunkSizer(policy, chunk_size)
+            self._source = AsyncAdaptiveRowSource(self._source, sizer)
+            self._sizer = sizer
+        return self
+
+    def _with_timeout(self, scope: "AsyncStatementTimeout | None") -> Self:
+        if scope is not None and not self._started:
+            self._source = AsyncTimeoutRowSource.wrap(self._source, scope)
+        return self
+
+    def telemetry(self) -> RowStreamTelemetry:
+        """Return fetch statistics for adaptive streams; other streams report zeros."""
+        sizer = self._sizer
+        if sizer is None:
+            return _empty_telemetry()
+        return sizer.telemetry()
+
+    def map_chunks(self, func: "Callable[[list[RowT]], list[OutRowT]]") -> "AsyncRowStream[OutRowT]":
+        """Return a lazy stream applying ``func`` to each chunk; empty results are skipped."""
+        return AsyncRowStream(_AsyncChunkOperatorSource(self, func))
+
+    def filter(self, predicate: "Callable[[RowT], bool]") -> "AsyncRowStream[RowT]":
+        """Return a lazy stream of the rows for which ``predicate`` is true."""
+        return AsyncRowStream(_AsyncChunkOperatorSource(self, lambda chunk: [row for row in chunk if predicate(row)]))
+
+    def to_schema(self, schema_type: "type[SchemaRowT]") -> "AsyncRowStream[SchemaRowT]":
+        """Return a lazy stream converting each chunk to ``schema_type``."""
+        return AsyncRowStream(_AsyncChunkOperatorSource(self, None), schema_type=schema_type)
+
+    def batched(self, size: int) -> "AsyncRowStream[list[RowT]]":
+        """Return a lazy stream of row lists holding ``size`` rows each; the last may be shorter."""
+        _check_positive("size", size)
+        return AsyncRowStream(_AsyncBatchedSource(self, size))
+
+    def take(self, limit: int) -> "AsyncRowStream[RowT]":
+        """Return a lazy stream of at most ``limit`` rows; this stream is closed once the limit is reached."""
+        if limit < 0:
+            msg = "limit must be greater than or equal to 0"
+            raise ValueError(msg)
+        return AsyncRowStream(_AsyncTakeSource(self, limit))
+
+    def tee(self, count: int = 2) -> "tuple[AsyncRowStream[RowT], ...]":
+        """Split this stream into ``count`` independent streams over the same rows.
+
+        Branches may be read from concurrent tasks. Chunks are kept until every
+        branch has read them, and this stream is closed once every branch is closed.
+        """
+        _check_positive("count", count)
+        buffer = _AsyncTeeBuffer(self, count)
+        return tuple(AsyncRowStream(_AsyncTeeSource(buffer, index)) for index in range(count))
+
+    async def write_to_storage(
+        self,
+        destination: "StorageDestination",
+        *,
+        format_hint: "StorageFormat | None" = None,
+        storage_options: "dict[str, Any] | None" = None,
+        compression: "str | None" = None,
+        arrow_schema: Any = None,
+        pipeline: "AsyncStoragePipeline | None" = None,
+    ) -> "StorageTelemetry":
+        """Write every remaining chunk to storage and close the stream."""
+        writer = await (pipeline or AsyncStoragePipeline()).open_writer(
+            destination,
+            format_hint=format_hint,
+            storage_options=storage_options,
+            compression=compression,
+            schema=arrow_schema,
+        )
+        try:
+            async with self:
+                chunk = await self.next_chunk()
+                while chunk:
+                    await writer.write_rows(_sink_rows(chunk))
+                    chunk = await self.next_chunk()
+        except BaseException:
+            await writer.abort()
+            raise
+        return await writer.close()
+
+    async def execute_many_into(
+        self,
+        driver: Any,
+        statement: "SQL | Statement | QueryBuilder",
+        *,
+        statement_config: "StatementConfig | None" = None,
+    ) -> int:
+        """Run ``await driver.execute_many(statement, chunk)`` for every remaining chunk and close the stream.
+
+        Returns the number of rows sent.
+        """
+        total = 0
+        async with self:
+            chunk = await self.next_chunk()
+            while chunk:
+                await driver.execute_many(statement, _sink_rows(chunk), statement_config=statement_config)
+                total += len(chunk)
+                chunk = await self.next_chunk()
+        return total
+
     def __aiter__(self) -> "AsyncRowStream[RowT]":
         return self
 
@@ -209,30 +707,72 @@ class AsyncRowStream(Generic[RowT]):
         await self._aclose(error=exc_type is not None)
 
     async def __anext__(self) -> RowT:
-        if self._closed:
-            raise _StopAsync
-        if not self._started:
-            self._started = True
-            try:
-                await self._source.start()
-            except BaseException:
-                await self._aclose(error=True)
-                raise
         if self._buffer_index >= len(self._buffer):
-            try:
-                chunk = await self._source.fetch_chunk()
-            except BaseException:
-                await self._aclose(error=True)
-                raise
+            chunk = await self._fetch_next_chunk()
             if not chunk:
-                await self.aclose()
                 raise _StopAsync
-            self._buffer = self._coerce_chunk(chunk)
+            self._buffer = chunk
             self._buffer_index = 0
         row = self._buffer[self._buffer_index]
         self._buffer_index += 1
         return row
 
+    async def next_chunk(self) -> "list[RowT]":
+        """Return the remaining buffered rows or the next source chunk; empty once exhausted."""
+        if self._buffer_index < len(self._buffer):
+            chunk = self._buffer[self._buffer_index :]
+        else:
+            chunk = await self._fetch_next_chunk()
+        self._buffer = []
+        self._buffer_index = 0
+        return chunk
+
+    def supports_row_chunks(self) -> bool:
+        """Return True when the source can hand out positional row chunks."""
+        return callable(getattr(self._source, "fetch_rows", None))
+
+    async def next_row_chunk(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        """Return the next chunk of positional rows with its column names and type tokens.
+
+        Only valid when :meth:`supports_row_chunks` is True. The rows are empty once
+        the stream is exhausted, at which point the stream closes itself.
+        """
+        if self._closed:
+            return [], [], None
+        await self._start_source()
+        try:
+            rows, column_names, column_types = await cast("Any", self._source).fetch_rows()
+        except BaseException:
+            await self._aclose(error=True)
+            raise
+        if not rows:
+            await self.aclose()
+        return rows, column_names, column_types
+
+    async def _start_source(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        try:
+            await self._source.start()
+        except BaseException:
+            await self._aclose(error=True)
+            raise
+
+    async def _fetch_next_chunk(self) -> "list[RowT]":
+        if self._closed:
+            return []
+        await self._start_source()
+        try:
+            chunk = await self._source.fetch_chunk()
+        except BaseException:
+            await self._aclose(error=True)
+            raise
+        if not chunk:
+            await self.aclose()
+            return []
+        return self._coerce_chunk(chunk)
+
     def _coerce_chunk(self, chunk: "list[dict[str, Any]]") -> "list[RowT]":
         schema_type = self._schema_type
         if schema_type is None:
@@ -252,6 +792,556 @@ class AsyncRowStream(Generic[RowT]):
             await _close_async_source(self._source, error)
 
 
+class SyncArrowBatchStream:
+    """Bounded-memory iterator of Arrow RecordBatches opened on the first read.
+
+    ``opener`` returns the batch iterator. Closing the stream, exhausting it, or
+    an error while reading closes that iterator. Zero-row batches are skipped;
+    :attr:`schema` is the schema of the first batch produced, empty or not.
+    """
+
+    __slots__ = ("_batches", "_closed", "_opener", "_schema")
+
+    def __init__(self, opener: "Callable[[], Iterator[Any]]") -> None:
+        self._opener = opener
+        self._batches: Iterator[Any] | None = None
+        self._closed = False
+        self._schema: Any = None
+
+    @property
+    def schema(self) -> Any:
+        """Schema of the first batch read, or None before any batch arrived."""
+        return self._schema
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> None:
+        self.close()
+
+    def __iter__(self) -> "SyncArrowBatchStream":
+        return self
+
+    def __next__(self) -> Any:
+        if self._closed:
+            raise StopIteration
+        batches = self._batches
+        if batches is None:
+            try:
+                batches = self._opener()
+            except BaseException:
+                self._closed = True
+                raise
+            self._batches = batches
+        while True:
+            try:
+                batch = next(batches)
+            except StopIteration:
+                self.close()
+                raise
+            except BaseException:
+                self.close()
+                raise
+            if self._schema is None:
+                self._schema = batch.schema
+            if batch.num_rows:
+                return batch
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        batches = self._batches
+        self._batches = None
+        close = getattr(batches, "close", None)
+        if close is not None:
+            with contextlib.suppress(Exception):
+                close()
+
+
+class AsyncArrowBatchStream:
+    """Async bounded-memory iterator of Arrow RecordBatches opened on the first read.
+
+    ``opener`` is awaited for the async batch iterator; otherwise this mirrors
+    :class:`SyncArrowBatchStream`.
+    """
+
+    __slots__ = ("_batches", "_closed", "_opener", "_schema")
+
+    def __init__(self, opener: "Callable[[], Awaitable[AsyncIterator[Any]]]") -> None:
+        self._opener = opener
+        self._batches: AsyncIterator[Any] | None = None
+        self._closed = False
+        self._schema: Any = None
+
+    @property
+    def schema(self) -> Any:
+        """Schema of the first batch read, or None before any batch arrived."""
+        return self._schema
+
+    def __aiter__(self) -> "AsyncArrowBatchStream":
+        return self
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> None:
+        await self.aclose()
+
+    async def __anext__(self) -> Any:
+        if self._closed:
+            raise _StopAsync
+        batches = self._batches
+        if batches is None:
+            try:
+                batches = await self._opener()
+            except BaseException:
+                self._closed = True
+                raise
+            self._batches = batches
+        while True:
+            try:
+                batch = await batches.__anext__()
+            except _StopAsyncBase:
+                await self.aclose()
+                raise _StopAsync from None
+            except BaseException:
+                await self.aclose()
+                raise
+            if self._schema is None:
+                self._schema = batch.schema
+            if batch.num_rows:
+                return batch
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        batches = self._batches
+        self._batches = None
+        aclose = getattr(batches, "aclose", None)
+        if aclose is not None:
+            with contextlib.suppress(Exception):
+                await aclose()
+
+
+class SyncAdaptiveRowSource:
+    """Sync source wrapper that resizes each fetch from the measured size and time of the last chunk.
+
+    The wrapped source is resized through its optional ``set_chunk_size`` hook.
+    Sources without the hook keep their fixed size, and only the statistics are
+    recorded.
+    """
+
+    __slots__ = ("_resize", "_sizer", "_source")
+
+    def __init__(self, source: Any, sizer: _ChunkSizer) -> None:
+        self._source = source
+        self._sizer = sizer
+        self._resize: Any = getattr(source, "set_chunk_size", None)
+
+    def start(self) -> None:
+        if self._resize is not None:
+            self._resize(self._sizer.chunk_size)
+        self._source.start()
+
+    def fetch_chunk(self) -> "list[dict[str, Any]]":
+        sizer = self._sizer
+        requested = sizer.chunk_size
+        started = time.perf_counter()
+        chunk: list[dict[str, Any]] = self._source.fetch_chunk()
+        sizer.observe(chunk, time.perf_counter() - started)
+        if self._resize is not None and sizer.chunk_size != requested:
+            self._resize(sizer.chunk_size)
+        return chunk
+
+    def close(self, error: bool = False) -> None:
+        _close_sync_source(self._source, error)
+
+
+class AsyncAdaptiveRowSource:
+    """Async source wrapper that resizes each fetch from the measured size and time of the last chunk."""
+
+    __slots__ = ("_resize", "_sizer", "_source")
+
+    def __init__(self, source: Any, sizer: _ChunkSizer) -> None:
+        self._source = source
+        self._sizer = sizer
+        self._resize: Any = getattr(source, "set_chunk_size", None)
+
+    async def start(self) -> None:
+        if self._resize is not None:
+            self._resize(self._sizer.chunk_size)
+        await self._source.start()
+
+    async def fetch_chunk(self) -> "list[dict[str, Any]]":
+        sizer = self._sizer
+        requested = sizer.chunk_size
+        started = time.perf_counter()
+        chunk: list[dict[str, Any]] = await self._source.fetch_chunk()
+        sizer.observe(chunk, time.perf_counter() - started)
+        if self._resize is not None and sizer.chunk_size != requested:
+            self._resize(sizer.chunk_size)
+        return chunk
+
+    async def close(self, error: bool = False) -> None:
+        await _close_async_source(self._source, error)
+
+
+class SyncTimeoutRowSource:
+    """Sync source wrapper that keeps one statement timeout scope open from ``start`` to ``close``.
+
+    Errors raised once the deadline has passed become ``StatementTimeoutError``.
+    Use :meth:`wrap`, which keeps ``fetch_rows`` available when the wrapped
+    source has it.
+    """
+
+    __slots__ = ("_entered", "_scope", "_source")
+
+    def __init__(self, source: Any, scope: "SyncStatementTimeout") -> None:
+        self._source = source
+        self._scope = scope
+        self._entered = False
+
+    @staticmethod
+    def wrap(source: Any, scope: "SyncStatementTimeout") -> "SyncTimeoutRowSource":
+        if callable(getattr(source, "fetch_rows", None)):
+            return _SyncTimeoutRowChunkSource(source, scope)
+        return SyncTimeoutRowSource(source, scope)
+
+    def start(self) -> None:
+        self._scope.__enter__()
+        self._entered = True
+        self._call(self._source.start)
+
+    def set_chunk_size(self, chunk_size: int) -> None:
+        resize = getattr(self._source, "set_chunk_size", None)
+        if resize is not None:
+            resize(chunk_size)
+
+    def fetch_chunk(self) -> "list[dict[str, Any]]":
+        return cast("list[dict[str, Any]]", self._call(self._source.fetch_chunk))
+
+    def close(self, error: bool = False) -> None:
+        try:
+            _close_sync_source(self._source, error)
+        finally:
+            if self._entered:
+                self._entered = False
+                self._scope.__exit__(None, None, None)
+
+    def _call(self, func: "Callable[[], Any]") -> Any:
+        try:
+            return func()
+        except Exception as exc:
+            scope = self._scope
+            if scope.expired and not isinstance(exc, StatementTimeoutError):
+                raise scope.timeout_error() from exc
+            raise
+
+
+class _SyncTimeoutRowChunkSource(SyncTimeoutRowSource):
+    __slots__ = ()
+
+    def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        return cast("tuple[list[Any], list[str], dict[str, str] | None]", self._call(self._source.fetch_rows))
+
+
+class AsyncTimeoutRowSource:
+    """Async source wrapper that keeps one statement timeout scope open from ``start`` to ``close``.
+
+    Every call is awaited through ``scope.run`` with the time left before the deadline.
+    """
+
+    __slots__ = ("_entered", "_scope", "_source")
+
+    def __init__(self, source: Any, scope: "AsyncStatementTimeout") -> None:
+        self._source = source
+        self._scope = scope
+        self._entered = False
+
+    @staticmethod
+    def wrap(source: Any, scope: "AsyncStatementTimeout") -> "AsyncTimeoutRowSource":
+        if callable(getattr(source, "fetch_rows", None)):
+            return _AsyncTimeoutRowChunkSource(source, scope)
+        return AsyncTimeoutRowSource(source, scope)
+
+    async def start(self) -> None:
+        await self._scope.__aenter__()
+        self._entered = True
+        await self._call(self._source.start)
+
+    def set_chunk_size(self, chunk_size: int) -> None:
+        resize = getattr(self._source, "set_chunk_size", None)
+        if resize is not None:
+            resize(chunk_size)
+
+    async def fetch_chunk(self) -> "list[dict[str, Any]]":
+        return cast("list[dict[str, Any]]", await self._call(self._source.fetch_chunk))
+
+    async def close(self, error: bool = False) -> None:
+        try:
+            await _close_async_source(self._source, error)
+        finally:
+            if self._entered:
+                self._entered = False
+                await self._scope.__aexit__(None, None, None)
+
+    async def _call(self, func: "Callable[[], Awaitable[Any]]") -> Any:
+        scope = self._scope
+        try:
+            return await scope.run(func())
+        except Exception as exc:
+            if scope.expired and not isinstance(exc, StatementTimeoutError):
+                raise scope.timeout_error() from exc
+            raise
+
+
+class _AsyncTimeoutRowChunkSource(AsyncTimeoutRowSource):
+    __slots__ = ()
+
+    async def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        return cast("tuple[list[Any], list[str], dict[str, str] | None]", await self._call(self._source.fetch_rows))
+
+
+class SyncTimeoutIterator(Generic[ItemT]):
+    """Iterator reading a lazy statement result (such as an Arrow export) inside one timeout scope.
+
+    The scope is entered on the first read, or by the caller before the
+    statement runs (``entered=True``), and exited once the iterator is exhausted
+    or closed. Callers that stop early must call ``close``.
+    """
+
+    __slots__ = ("_closed", "_entered", "_iterator", "_scope")
+
+    def __init__(self, iterator: "Iterator[ItemT]", scope: "SyncStatementTimeout", *, entered: bool = False) -> None:
+        self._iterator = iterator
+        self._scope = scope
+        self._entered = entered
+        self._closed = False
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> ItemT:
+        if self._closed:
+            raise StopIteration
+        scope = self._scope
+        if not self._entered:
+            self._entered = True
+            scope.__enter__()
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            self.close()
+            raise
+        except Exception as exc:
+            self.close()
+            if scope.expired and not isinstance(exc, StatementTimeoutError):
+                raise scope.timeout_error() from exc
+            raise
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        close = getattr(self._iterator, "close", None)
+        try:
+            if close is not None:
+                close()
+        finally:
+            if self._entered:
+                self._scope.__exit__(None, None, None)
+
+
+class AsyncTimeoutIterator(Generic[ItemT]):
+    """Async iterator reading a lazy statement result inside one timeout scope.
+
+    Each read is awaited through ``scope.run`` with the time left before the
+    deadline. Callers that stop early must call ``aclose``.
+    """
+
+    __slots__ = ("_closed", "_entered", "_iterator", "_scope")
+
+    def __init__(self, iterator: "AsyncIterator[ItemT]", scope: "AsyncStatementTimeout") -> None:
+        self._iterator = iterator
+        self._scope = scope
+        self._entered = False
+        self._closed = False
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> ItemT:
+        if self._closed:
+            raise _StopAsync
+        scope = self._scope
+        if not self._entered:
+            self._entered = True
+            await scope.__aenter__()
+        try:
+            return cast("ItemT", await scope.run(self._iterator.__anext__()))
+        except _StopAsyncBase:
+            await self.aclose()
+            raise _StopAsync from None
+        except Exception as exc:
+            await self.aclose()
+            if scope.expired and not isinstance(exc, StatementTimeoutError):
+                raise scope.timeout_error() from exc
+            raise
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        aclose = getattr(self._iterator, "aclose", None)
+        try:
+            if aclose is not None:
+                await aclose()
+        finally:
+            if self._entered:
+                await self._scope.__aexit__(None, None, None)
+
+
+class SyncPrefetchRowSource:
+    """Sync source wrapper that fetches up to ``prefetch`` chunks ahead on a worker thread.
+
+    The wrapped source is started on the caller's thread and then read only by
+    the worker, so the connection must not be used for anything else while the
+    stream is open. Chunks that are queued or being fetched never exceed
+    ``prefetch``. A fetch error is raised on the consumer's next read.
+    """
+
+    __slots__ = ("_condition", "_finished", "_pending", "_prefetch", "_source", "_stopping", "_thread")
+
+    def __init__(self, source: Any, prefetch: int) -> None:
+        self._source = source
+        self._prefetch = prefetch
+        self._condition = threading.Condition()
+        self._pending: deque[tuple[list[dict[str, Any]], BaseException | None]] = deque()
+        self._finished = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._source.start()
+        thread = threading.Thread(target=self._run, name="sqlspec-stream-prefetch", daemon=True)
+        self._thread = thread
+        thread.start()
+
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                while len(self._pending) >= self._prefetch and not self._stopping:
+                    condition.wait()
+                if self._stopping:
+                    self._finished = True
+                    return
+            chunk: list[dict[str, Any]] = []
+            error: BaseException | None = None
+            try:
+                chunk = self._source.fetch_chunk()
+            except BaseException as exc:
+                error = exc
+            with condition:
+                self._pending.append((chunk, error))
+                if error is not None or not chunk:
+                    self._finished = True
+                condition.notify_all()
+            if error is not None or not chunk:
+                return
+
+    def fetch_chunk(self) -> "list[dict[str, Any]]":
+        condition = self._condition
+        with condition:
+            while not self._pending:
+                if self._thread is None or self._finished:
+                    return []
+                condition.wait()
+            chunk, error = self._pending.popleft()
+            condition.notify_all()
+        if error is not None:
+            raise error
+        return chunk
+
+    def close(self, error: bool = False) -> None:
+        with self._condition:
+            self._stopping = True
+            self._pending.clear()
+            self._condition.notify_all()
+        thread = self._thread
+        self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        _close_sync_source(self._source, error)
+
+
+class AsyncPrefetchRowSource:
+    """Async source wrapper that fetches up to ``prefetch`` chunks ahead in a background task.
+
+    Only the task reads from the wrapped source once it has started. Closing
+    cancels the task and waits for it before the wrapped source is closed. A
+    fetch cut short this way closes the source with ``error=True`` so stream
+    transactions roll back. A fetch error is raised on the consumer's next read.
+    """
+
+    __slots__ = ("_credits", "_fetching", "_pending", "_source", "_task")
+
+    def __init__(self, source: Any, prefetch: int) -> None:
+        self._source = source
+        self._credits = asyncio.Semaphore(prefetch)
+        self._pending: asyncio.Queue[tuple[list[dict[str, Any]], BaseException | None]] = asyncio.Queue()
+        self._fetching = False
+        self._task: asyncio.Future[None] | None = None
+
+    async def start(self) -> None:
+        await self._source.start()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._credits.acquire()
+            self._fetching = True
+            try:
+                chunk = await self._source.fetch_chunk()
+            except asyncio.CancelledError:
+                raise
+            except BaseException as exc:
+                self._pending.put_nowait(([], exc))
+                return
+            finally:
+                self._fetching = False
+            self._pending.put_nowait((chunk, None))
+            if not chunk:
+                return
+
+    async def fetch_chunk(self) -> "list[dict[str, Any]]":
+        task = self._task
+        if task is None or (task.done() and self._pending.empty()):
+            return []
+        chunk, error = await self._pending.get()
+        self._credits.release()
+        if error is not None:
+            raise error
+        return chunk
+
+    async def close(self, error: bool = False) -> None:
+        task = self._task
+        self._task = None
+        interrupted = False
+        if task is not None and not task.done():
+            interrupted = self._fetching
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        await _close_async_source(self._source, error or interrupted)
+
+
 class EagerSyncRowSource:
     """Chunk source over pre-materialized rows (eager fallback; not bounded-memory)."""
 
@@ -319,3 +1409,300 @@ class _LazyEagerAsyncRowSource:
 
     async def close(self, error: bool = False) -> None:
         self._rows = []
+
+
+class _SyncChunkOperatorSource:
+    """Source reading chunks from a parent stream and applying an optional chunk transform."""
+
+    __slots__ = ("_parent", "_transform")
+
+    def __init__(self, parent: "SyncRowStream[Any]", transform: "Callable[[list[Any]], list[Any]] | None") -> None:
+        self._parent = parent
+        self._transform = transform
+
+    def start(self) -> None:
+        return None
+
+    def fetch_chunk(self) -> "list[Any]":
+        transform = self._transform
+        while True:
+            chunk = self._parent.next_chunk()
+            if not chunk or transform is None:
+                return chunk
+            result = transform(chunk)
+            if result:
+                return result
+
+    def close(self, error: bool = False) -> None:
+        self._parent._close(error=error)
+
+
+class _AsyncChunkOperatorSource:
+    """Async source reading chunks from a parent stream and applying an optional chunk transform."""
+
+    __slots__ = ("_parent", "_transform")
+
+    def __init__(self, parent: "AsyncRowStream[Any]", transform: "Callable[[list[Any]], list[Any]] | None") -> None:
+        self._parent = parent
+        self._transform = transform
+
+    async def start(self) -> None:
+        return None
+
+    async def fetch_chunk(self) -> "list[Any]":
+        transform = self._transform
+        while True:
+            chunk = await self._parent.next_chunk()
+            if not chunk or transform is None:
+                return chunk
+            result = transform(chunk)
+            if result:
+                return result
+
+    async def close(self, error: bool = False) -> None:
+        await self._parent._aclose(error=error)
+
+
+class _SyncBatchedSource:
+    """Source regrouping parent chunks into lists of exactly ``size`` rows (the last may be shorter)."""
+
+    __slots__ = ("_parent", "_pending", "_size")
+
+    def __init__(self, parent: "SyncRowStream[Any]", size: int) -> None:
+        self._parent = parent
+        self._size = size
+        self._pending: list[Any] = []
+
+    def start(self) -> None:
+        return None
+
+    def fetch_chunk(self) -> "list[Any]":
+        size = self._size
+        pending = self._pending
+        while len(pending) < size:
+            chunk = self._parent.next_chunk()
+            if not chunk:
+                self._pending = []
+                return [pending] if pending else []
+            pending.extend(chunk)
+        full = len(pending) - len(pending) % size
+        self._pending = pending[full:]
+        return [pending[offset : offset + size] for offset in range(0, full, size)]
+
+    def close(self, error: bool = False) -> None:
+        self._pending = []
+        self._parent._close(error=error)
+
+
+class _AsyncBatchedSource:
+    """Async source regrouping parent chunks into lists of exactly ``size`` rows (the last may be shorter)."""
+
+    __slots__ = ("_parent", "_pending", "_size")
+
+    def __init__(self, parent: "AsyncRowStream[Any]", size: int) -> None:
+        self._parent = parent
+        self._size = size
+        self._pending: list[Any] = []
+
+    async def start(self) -> None:
+        return None
+
+    async def fetch_chunk(self) -> "list[Any]":
+        size = self._size
+        pending = self._pending
+        while len(pending) < size:
+            chunk = await self._parent.next_chunk()
+            if not chunk:
+                self._pending = []
+                return [pending] if pending else []
+            pending.extend(chunk)
+        full = len(pending) - len(pending) % size
+        self._pending = pending[full:]
+        return [pending[offset : offset + size] for offset in range(0, full, size)]
+
+    async def close(self, error: bool = False) -> None:
+        self._pending = []
+        await self._parent._aclose(error=error)
+
+
+class _SyncTakeSource:
+    """Source yielding at most ``limit`` rows, closing the parent as soon as the limit is reached."""
+
+    __slots__ = ("_parent", "_remaining")
+
+    def __init__(self, parent: "SyncRowStream[Any]", limit: int) -> None:
+        self._parent = parent
+        self._remaining = limit
+
+    def start(self) -> None:
+        return None
+
+    def fetch_chunk(self) -> "list[Any]":
+        remaining = self._remaining
+        if remaining <= 0:
+            self._parent.close()
+            return []
+        chunk = self._parent.next_chunk()
+        if len(chunk) >= remaining:
+            chunk = chunk[:remaining]
+            self._parent.close()
+        self._remaining = remaining - len(chunk)
+        return chunk
+
+    def close(self, error: bool = False) -> None:
+        self._parent._close(error=error)
+
+
+class _AsyncTakeSource:
+    """Async source yielding at most ``limit`` rows, closing the parent as soon as the limit is reached."""
+
+    __slots__ = ("_parent", "_remaining")
+
+    def __init__(self, parent: "AsyncRowStream[Any]", limit: int) -> None:
+        self._parent = parent
+        self._remaining = limit
+
+    async def start(self) -> None:
+        return None
+
+    async def fetch_chunk(self) -> "list[Any]":
+        remaining = self._remaining
+        if remaining <= 0:
+            await self._parent.aclose()
+            return []
+        chunk = await self._parent.next_chunk()
+        if len(chunk) >= remaining:
+            chunk = chunk[:remaining]
+            await self._parent.aclose()
+        self._remaining = remaining - len(chunk)
+        return chunk
+
+    async def close(self, error: bool = False) -> None:
+        await self._parent._aclose(error=error)
+
+
+class _SyncTeeBuffer:
+    """Chunks shared by ``tee`` branches, dropped once every open branch has read them."""
+
+    __slots__ = ("_chunks", "_offset", "_parent", "_positions")
+
+    def __init__(self, parent: "SyncRowStream[Any]", count: int) -> None:
+        self._parent = parent
+        self._chunks: deque[list[Any]] = deque()
+        self._offset = 0
+        self._positions: dict[int, int] = dict.fromkeys(range(count), 0)
+
+    def chunk_for(self, branch: int) -> "list[Any]":
+        position = self._positions.get(branch)
+        if position is None:
+            return []
+        index = position - self._offset
+        if index < len(self._chunks):
+            chunk = self._chunks[index]
+        else:
+            chunk = self._parent.next_chunk()
+            if not chunk:
+                return []
+            self._chunks.append(chunk)
+        self._positions[branch] = position + 1
+        self._trim()
+        return chunk
+
+    def release(self, branch: int, error: bool) -> None:
+        if self._positions.pop(branch, None) is None:
+            return
+        if self._positions:
+            self._trim()
+            return
+        self._chunks.clear()
+        self._parent._close(error=error)
+
+    def _trim(self) -> None:
+        lowest = min(self._positions.values())
+        while self._chunks and self._offset < lowest:
+            self._chunks.popleft()
+            self._offset += 1
+
+
+class _SyncTeeSource:
+    """Source reading one ``tee`` branch from a shared :class:`_SyncTeeBuffer`."""
+
+    __slots__ = ("_branch", "_buffer")
+
+    def __init__(self, buffer: _SyncTeeBuffer, branch: int) -> None:
+        self._buffer = buffer
+        self._branch = branch
+
+    def start(self) -> None:
+        return None
+
+    def fetch_chunk(self) -> "list[Any]":
+        return self._buffer.chunk_for(self._branch)
+
+    def close(self, error: bool = False) -> None:
+        self._buffer.release(self._branch, error)
+
+
+class _AsyncTeeBuffer:
+    """Async chunks shared by ``tee`` branches; a lock keeps concurrent branches to one parent fetch."""
+
+    __slots__ = ("_chunks", "_lock", "_offset", "_parent", "_positions")
+
+    def __init__(self, parent: "AsyncRowStream[Any]", count: int) -> None:
+        self._parent = parent
+        self._chunks: deque[list[Any]] = deque()
+        self._offset = 0
+        self._positions: dict[int, int] = dict.fromkeys(range(count), 0)
+        self._lock = asyncio.Lock()
+
+    async def chunk_for(self, branch: int) -> "list[Any]":
+        async with self._lock:
+            position = self._positions.get(branch)
+            if position is None:
+                return []
+            index = position - self._offset
+            if index < len(self._chunks):
+                chunk = self._chunks[index]
+            else:
+                chunk = await self._parent.next_chunk()
+                if not chunk:
+                    return []
+                self._chunks.append(chunk)
+            self._positions[branch] = position + 1
+            self._trim()
+            return chunk
+
+    async def release(self, branch: int, error: bool) -> None:
+        async with self._lock:
+            if self._positions.pop(branch, None) is None:
+                return
+            if self._positions:
+                self._trim()
+                return
+            self._chunks.clear()
+        await self._parent._aclose(error=error)
+
+    def _trim(self) -> None:
+        lowest = min(self._positions.values())
+        while self._chunks and self._offset < lowest:
+            self._chunks.popleft()
+            self._offset += 1
+
+
+class _AsyncTeeSource:
+    """Async source reading one ``tee`` branch from a shared :class:`_AsyncTeeBuffer`."""
+
+    __slots__ = ("_branch", "_buffer")
+
+    def __init__(self, buffer: _AsyncTeeBuffer, branch: int) -> None:
+        self._buffer = buffer
+        self._branch = branch
+
+    async def start(self) -> None:
+        return None
+
+    async def fetch_chunk(self) -> "list[Any]":
+        return await self._buffer.chunk_for(self._branch)
+
+    async def close(self, error: bool = False) -> None:
+        await self._buffer.release(self._branch, error)
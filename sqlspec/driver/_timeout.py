@@ -0,0 +1,262 @@
+"""Statement timeout scopes shared by driver adapters.
+
+A timeout scope wraps a single statement execution when
+``StatementConfig.statement_timeout`` (or ``execute(..., timeout=...)``) is set.
+
+Sync scopes
+-----------
+``SyncStatementTimeout`` records a deadline on entry and calls ``arm()``; on
+exit it calls ``disarm()`` so the connection goes back to its caller in a clean
+state. Adapters without a server-side timeout call ``start_watchdog()`` from
+``arm()``; the watchdog calls ``interrupt()`` from a helper thread when the
+deadline passes (for example ``sqlite3.Connection.interrupt``
+or ``psycopg.Connection.cancel_safe``).
+
+Async scopes
+------------
+``AsyncStatementTimeout.run`` defaults to ``asyncio.wait_for``. Drivers such as
+asyncpg and psycopg translate task cancellation into a server-side cancel
+request, so the generic path doubles as native cancellation. Adapters that
+enforce the deadline on the connection itself override ``run`` to await the
+statement directly and use ``arm``/``disarm`` instead.
+
+Failures in ``arm`` are logged and the statement still runs, so a server that
+rejects the timeout setting degrades to classification-only behaviour.
+
+Streams and exports
+^^^^^^^^^^^^^^^^^^^
+Row streams and Arrow exports keep their statement open while the caller reads.
+The timeout wrappers in ``sqlspec.driver._stream`` hold one scope from the first
+read until the stream is exhausted or closed, so the deadline covers the whole
+read rather than each fetch. Async reads await ``run`` with the time left.
+
+Error surfacing
+^^^^^^^^^^^^^^^
+Scopes never raise from ``__exit__``/``__aexit__`` (see the deferred exception
+pattern in ``sqlspec.driver._exception_handler``). The dispatchers call
+``resolve_statement_timeout`` after the handler exits, which replaces the
+mapped database error with ``StatementTimeoutError`` once the deadline passed.
+"""
+
+import asyncio
+import re
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from mypy_extensions import mypyc_attr
+from typing_extensions import Self
+
+from sqlspec.exceptions import StatementTimeoutError
+from sqlspec.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from types import TracebackType
+
+    from sqlspec.driver._common import SyncExceptionHandler
+
+__all__ = (
+    "DISABLED_STATEMENT_TIMEOUT",
+    "AsyncStatementTimeout",
+    "SyncStatementTimeout",
+    "add_max_execution_time_hint",
+    "resolve_statement_timeout",
+)
+
+logger = get_logger("sqlspec.driver.timeout")
+
+_ResultT = TypeVar("_ResultT")
+
+_LEADING_SELECT = re.compile(
+    r"^(\s*(?:(?:--[^\n]*\n|/\*(?!\+).*?\*/)\s*)*SELECT\b)(\s*/\*\+)?", re.IGNORECASE | re.DOTALL
+)
+
+
+def _timeout_message(timeout: float) -> str:
+    return f"Statement exceeded timeout of {timeout:g}s"
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class SyncStatementTimeout:
+    """Timeout scope for synchronous statement execution.
+
+    The base scope only classifies failures that happen after the deadline;
+    adapters override ``arm``/``disarm``/``interrupt`` to enforce it.
+    """
+
+    __slots__ = ("_deadline", "_timer", "connection", "timed_out", "timeout")
+
+    def __init__(self, connection: Any = None, timeout: "float | None" = None) -> None:
+        self.connection = connection
+        self.timeout = timeout
+        self.timed_out = False
+        self._deadline: float | None = None
+        self._timer: threading.Timer | None = None
+
+    def __enter__(self) -> Self:
+        timeout = self.timeout
+        if timeout is None:
+            return self
+        self._deadline = monotonic() + timeout
+        try:
+            self.arm()
+        except Exception:
+            logger.debug("Failed to apply statement timeout on %s", type(self.connection).__name__, exc_info=True)
+        return self
+
+    def __exit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> bool:
+        if self.timeout is None:
+            return False
+        timer = self._timer
+        if timer is not None:
+            timer.cancel()
+            self._timer = None
+        try:
+            self.disarm()
+        except Exception:
+            logger.debug("Failed to reset statement timeout on %s", type(self.connection).__name__, exc_info=True)
+        return False
+
+    @property
+    def expired(self) -> bool:
+        """Return True when the statement ran into its deadline."""
+        if self.timed_out:
+            return True
+        deadline = self._deadline
+        return deadline is not None and monotonic() >= deadline
+
+    @property
+    def timeout_milliseconds(self) -> int:
+        """Return the timeout in whole milliseconds (at least 1)."""
+        return max(1, int((self.timeout or 0.0) * 1000))
+
+    def arm(self) -> None:
+        """Apply the timeout to the connection before the statement runs."""
+
+    def disarm(self) -> None:
+        """Restore the connection after the statement finished."""
+
+    def interrupt(self) -> None:
+        """Abort the running statement. Called from the watchdog thread."""
+
+    def start_watchdog(self) -> None:
+        """Start a timer that calls ``interrupt()`` once the deadline passes."""
+        timer = threading.Timer(self.timeout or 0.0, self._expire)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def timeout_error(self) -> StatementTimeoutError:
+        timeout = self.timeout or 0.0
+        return StatementTimeoutError(_timeout_message(timeout), timeout=timeout)
+
+    def _expire(self) -> None:
+        self.timed_out = True
+        try:
+            self.interrupt()
+        except Exception:
+            logger.debug("Failed to interrupt statement on %s", type(self.connection).__name__, exc_info=True)
+
+
+DISABLED_STATEMENT_TIMEOUT = SyncStatementTimeout()
+"""Shared no-op scope used when no statement timeout is configured."""
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class AsyncStatementTimeout:
+    """Timeout scope for asynchronous statement execution."""
+
+    __slots__ = ("_deadline", "connection", "timed_out", "timeout")
+
+    def __init__(self, connection: Any, timeout: float) -> None:
+        self.connection = connection
+        self.timeout = timeout
+        self.timed_out = False
+        self._deadline: float | None = None
+
+    async def __aenter__(self) -> Self:
+        self._deadline = monotonic() + self.timeout
+        try:
+            await self.arm()
+        except Exception:
+            logger.debug("Failed to apply statement timeout on %s", type(self.connection).__name__, exc_info=True)
+        return self
+
+    async def __aexit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> bool:
+        try:
+            await self.disarm()
+        except Exception:
+            logger.debug("Failed to reset statement timeout on %s", type(self.connection).__name__, exc_info=True)
+        return False
+
+    @property
+    def expired(self) -> bool:
+        """Return True when the statement ran into its deadline."""
+        if self.timed_out:
+            return True
+        deadline = self._deadline
+        return deadline is not None and monotonic() >= deadline
+
+    @property
+    def timeout_milliseconds(self) -> int:
+        """Return the timeout in whole milliseconds (at least 1)."""
+        return max(1, int(self.timeout * 1000))
+
+    async def arm(self) -> None:
+        """Apply the timeout to the connection before the statement runs."""
+
+    async def disarm(self) -> None:
+        """Restore the connection after the statement finished."""
+
+    @property
+    def remaining(self) -> float:
+        """Return the seconds left before the deadline (the full timeout before entry)."""
+        deadline = self._deadline
+        if deadline is None:
+            return self.timeout
+        return max(0.0, deadline - monotonic())
+
+    async def run(self, awaitable: "Awaitable[_ResultT]") -> "_ResultT":
+        """Await the statement, cancelling it once the deadline passes."""
+        try:
+            return await asyncio.wait_for(awaitable, self.remaining)
+        except asyncio.TimeoutError:
+            self.timed_out = True
+            raise self.timeout_error() from None
+
+    def timeout_error(self) -> StatementTimeoutError:
+        return StatementTimeoutError(_timeout_message(self.timeout), timeout=self.timeout)
+
+
+def resolve_statement_timeout(scope: SyncStatementTimeout, exc_handler: "SyncExceptionHandler") -> None:
+    """Replace a pending database error with ``StatementTimeoutError`` after a timeout."""
+    pending_exception = exc_handler.pending_exception
+    if pending_exception is None or isinstance(pending_exception, StatementTimeoutError) or not scope.expired:
+        return
+    timeout_error = scope.timeout_error()
+    timeout_error.__cause__ = pending_exception
+    exc_handler.pending_exception = timeout_error
+
+
+def add_max_execution_time_hint(sql: str, timeout: "float | None") -> str:
+    """Add a MySQL ``MAX_EXECUTION_TIME`` optimizer hint for ``timeout`` seconds to a ``SELECT``.
+
+    The hint goes right after the leading ``SELECT`` keyword, merged into an
+    existing ``/*+ ... */`` hint comment. Other statements, and calls without a
+    timeout, return ``sql`` unchanged because MySQL only honours the limit for
+    read-only ``SELECT``.
+    """
+    if timeout is None:
+        return sql
+    match = _LEADING_SELECT.match(sql)
+    if match is None:
+        return sql
+    hint = f"MAX_EXECUTION_TIME({max(1, int(timeout * 1000))})"
+    if match.group(2) is not None:
+        return f"{sql[: match.end(2)]} {hint}{sql[match.end(2) :]}"
+    return f"{sql[: match.end(1)]} /*+ {hint} */{sql[match.end(1) :]}"
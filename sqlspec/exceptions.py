@@ -4,7 +4,9 @@ from typing import Any, Final
 
 __all__ = (
     "SQLSTATE_EXCEPTION_MAP",
+    "AdmissionRejectedError",
     "CheckViolationError",
+    "CircuitOpenError",
     "ConfigResolverError",
     "ConnectionTimeoutError",
     "DataError",
@@ -16,6 +18,7 @@ __all__ = (
     "ForeignKeyViolationError",
     "ImproperConfigurationError",
     "IntegrityError",
+    "LoadSheddingError",
     "MigrationError",
     "MissingDependencyError",
     "MultipleResultsFoundError",
@@ -37,6 +40,7 @@ __all__ = (
     "SerializationConflictError",
     "SquashValidationError",
     "StackExecutionError",
+    "StatementTimeoutError",
     "StorageCapabilityError",
     "StorageOperationFailedError",
     "TransactionError",
@@ -271,10 +275,48 @@ class QueryTimeoutError(OperationalError):
     """
 
 
+class StatementTimeoutError(QueryTimeoutError):
+    """Statement exceeded the timeout requested through ``timeout=`` or ``StatementConfig``.
+
+    The adapter interrupts the statement with its native mechanism and leaves the
+    connection usable, so it can be returned to the pool.
+    """
+
+    def __init__(self, message: str, *, timeout: float) -> None:
+        super().__init__(message)
+        self.timeout = timeout
+
+
 class OperationCancelledError(OperationalError):
     """Database operation was explicitly cancelled by a caller or operator."""
 
 
+class LoadSheddingError(OperationalError):
+    """Work was rejected before reaching the database to protect it from overload."""
+
+
+class CircuitOpenError(LoadSheddingError):
+    """The configuration's circuit breaker is open and fails requests fast.
+
+    ``retry_after`` is the number of seconds until the breaker admits probe requests.
+    """
+
+    def __init__(self, message: str, *, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionRejectedError(LoadSheddingError):
+    """The admission limiter rejected a statement or connection request.
+
+    ``limit`` names the exhausted limit (``"max_in_flight"`` or ``"max_waiters"``).
+    """
+
+    def __init__(self, message: str, *, limit: str) -> None:
+        super().__init__(message)
+        self.limit = limit
+
+
 class StorageOperationFailedError(SQLSpecError):
     """Raised when a storage backend operation fails."""
 
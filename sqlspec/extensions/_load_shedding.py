@@ -0,0 +1,20 @@
+"""HTTP mapping of load-shedding rejections shared by the web framework integrations."""
+
+import math
+from typing import Final
+
+from sqlspec.exceptions import CircuitOpenError, LoadSheddingError
+
+__all__ = ("LOAD_SHEDDING_STATUS_CODE", "load_shedding_headers")
+
+LOAD_SHEDDING_STATUS_CODE: Final = 503
+
+
+def load_shedding_headers(exc: LoadSheddingError) -> "dict[str, str]":
+    """Return the response headers for a shed request.
+
+    Open circuits advertise when probes are admitted again through ``Retry-After``.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return {"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
+    return {}
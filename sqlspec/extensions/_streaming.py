@@ -0,0 +1,319 @@
+"""Row stream encoders shared by the framework streaming responses.
+
+The framework helpers (``StreamingQueryResponse`` for Litestar, Starlette,
+FastAPI and Flask, ``stream_query_response`` for Sanic) turn a
+:class:`~sqlspec.driver.SyncRowStream` or :class:`~sqlspec.driver.AsyncRowStream`
+into NDJSON, CSV or Arrow IPC stream bytes one fetched chunk at a time.
+
+When a ``session`` context manager is given, the body enters it on the first
+read, builds the stream from the session with the ``stream`` callable, and
+leaves it once the body finishes or is closed, so the pooled connection is
+held only while rows are being sent.
+"""
+
+import csv
+import io
+from typing import TYPE_CHECKING, Any, Final, Literal, TypeAlias, cast
+
+from sqlspec.driver import AsyncRowStream, SyncRowStream
+from sqlspec.exceptions import ImproperConfigurationError
+from sqlspec.storage._arrow_payload import ArrowBatchEncoder
+from sqlspec.utils.arrow_helpers import arrow_type_from_token, rows_to_arrow_batch
+from sqlspec.utils.serializers import serialize_collection, to_json
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+    from contextlib import AbstractAsyncContextManager, AbstractContextManager
+
+__all__ = (
+    "STREAMING_MEDIA_TYPES",
+    "RowChunkEncoder",
+    "StreamingFormat",
+    "StreamingSource",
+    "aiter_encoded_rows",
+    "is_async_streaming_source",
+    "iter_encoded_rows",
+    "streaming_headers",
+)
+
+StreamingFormat = Literal["ndjson", "csv", "arrow"]
+StreamingSource: TypeAlias = "SyncRowStream[Any] | AsyncRowStream[Any] | Callable[[Any], Any]"
+
+STREAMING_MEDIA_TYPES: Final[dict[str, str]] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+_FILE_EXTENSIONS: Final[dict[str, str]] = {"ndjson": ".ndjson", "csv": ".csv", "arrow": ".arrows"}
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return to_json(value)
+    return value
+
+
+def _arrow_schema_from_column_types(column_names: "list[str]", column_types: "Mapping[str, str] | None") -> Any:
+    import pyarrow as pa
+
+    types = column_types or {}
+    missing = [name for name in column_names if name not in types]
+    if missing:
+        msg = (
+            f"Arrow streaming needs a type for every column, but the stream reports none for {', '.join(missing)}. "
+            "Pass arrow_schema= to fix the schema."
+        )
+        raise ImproperConfigurationError(msg)
+    return pa.schema([(name, arrow_type_from_token(types[name])) for name in column_names])
+
+
+class RowChunkEncoder:
+    """Encode row chunks as NDJSON lines, CSV records or Arrow IPC stream batches.
+
+    Schema model rows are dumped with the cached serializer for their type, so
+    the per-type dump function is resolved once per chunk rather than per row.
+    CSV is written with the :mod:`csv` module, so a column's values need not
+    share a type; the header comes from the first row's keys. Arrow fixes its
+    schema before the first byte: ``arrow_schema`` when given, otherwise the
+    column types the stream reports (see :meth:`encode_row_chunk`). A column
+    without a reported type raises instead of being inferred from the first
+    chunk. :meth:`finish` writes the Arrow end-of-stream marker.
+    """
+
+    __slots__ = ("_arrow_encoder", "_csv_columns", "_format")
+
+    def __init__(self, format_choice: StreamingFormat, *, arrow_schema: Any = None) -> None:
+        if format_choice not in STREAMING_MEDIA_TYPES:
+            msg = f"format must be one of 'ndjson', 'csv' or 'arrow', got {format_choice!r}"
+            raise ValueError(msg)
+        self._format = format_choice
+        self._csv_columns: list[str] | None = None
+        self._arrow_encoder: ArrowBatchEncoder | None = None
+        if format_choice == "arrow" and arrow_schema is not None:
+            self._arrow_encoder = ArrowBatchEncoder("arrow-stream", schema=arrow_schema)
+
+    @property
+    def media_type(self) -> str:
+        return STREAMING_MEDIA_TYPES[self._format]
+
+    @property
+    def needs_column_types(self) -> bool:
+        """Return True when Arrow output still needs the stream's column types for its schema."""
+        return self._format == "arrow" and self._arrow_encoder is None
+
+    def encode(self, rows: "list[Any]") -> bytes:
+        """Return the bytes for one chunk of rows; empty for an empty chunk.
+
+        Raises:
+            ImproperConfigurationError: Arrow output has no schema yet.
+        """
+        if not rows:
+            return b""
+        serialized = serialize_collection(rows)
+        if self._format == "arrow":
+            return self._require_arrow_encoder().encode_rows(serialized)
+        if self._format == "csv":
+            return self._encode_csv(serialized)
+        buffer = bytearray()
+        for row in serialized:
+            buffer.extend(to_json(row, as_bytes=True))
+            buffer.extend(b"\n")
+        return bytes(buffer)
+
+    def encode_row_chunk(
+        self, rows: "list[Any]", column_names: "list[str]", column_types: "Mapping[str, str] | None" = None
+    ) -> bytes:
+        """Return the Arrow bytes for one chunk of positional rows.
+
+        The first call fixes the schema from ``column_types`` unless
+        ``arrow_schema`` was given, so it must carry the reported types even
+        when ``rows`` is empty.
+
+        Raises:
+            ImproperConfigurationError: A column has no reported type.
+        """
+        encoder = self._arrow_encoder
+        if encoder is None:
+            schema = _arrow_schema_from_column_types(column_names, column_types)
+            encoder = self._arrow_encoder = ArrowBatchEncoder("arrow-stream", schema=schema)
+        if not rows:
+            return b""
+        return encoder.encode(rows_to_arrow_batch(rows, column_names, encoder.schema))
+
+    def finish(self) -> bytes:
+        """Return trailing bytes (the Arrow end-of-stream marker)."""
+        if self._format != "arrow":
+            return b""
+        return self._require_arrow_encoder().finish()
+
+    def _require_arrow_encoder(self) -> ArrowBatchEncoder:
+        encoder = self._arrow_encoder
+        if encoder is None:
+            msg = "Arrow streaming needs arrow_schema= or a stream that reports its column types"
+            raise ImproperConfigurationError(msg)
+        return encoder
+
+    def _encode_csv(self, rows: "list[dict[str, Any]]") -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        columns = self._csv_columns
+        if columns is None:
+            columns = self._csv_columns = list(rows[0])
+            writer.writerow(columns)
+        writer.writerows([_csv_value(row.get(name)) for name in columns] for row in rows)
+        return buffer.getvalue().encode()
+
+
+def streaming_headers(
+    format_choice: StreamingFormat, filename: "str | None" = None, headers: "Mapping[str, str] | None" = None
+) -> "dict[str, str]":
+    """Return response headers with ``Content-Disposition`` set when ``filename`` is given."""
+    merged = dict(headers) if headers else {}
+    if filename:
+        if "." not in filename:
+            filename += _FILE_EXTENSIONS[format_choice]
+        merged.setdefault("Content-Disposition", f'attachment; filename="{filename}"')
+    return merged
+
+
+def _has_async_context(session: Any) -> bool:
+    return callable(getattr(session, "__aenter__", None))
+
+
+def is_async_streaming_source(stream: "StreamingSource", session: Any = None) -> bool:
+    """Return True when the body must be produced by :func:`aiter_encoded_rows`."""
+    if session is not None:
+        return _has_async_context(session)
+    return isinstance(stream, AsyncRowStream)
+
+
+def _check_source(stream: "StreamingSource", session: Any) -> None:
+    is_stream = isinstance(stream, (SyncRowStream, AsyncRowStream))
+    if session is not None and is_stream:
+        msg = "Pass a callable that builds the stream from the session when session= is given"
+        raise ImproperConfigurationError(msg)
+    if session is None and not is_stream:
+        msg = "A stream callable needs session= to provide the driver it is called with"
+        raise ImproperConfigurationError(msg)
+
+
+def _check_arrow_source(encoder: RowChunkEncoder, row_stream: Any) -> None:
+    if encoder.needs_column_types and not row_stream.supports_row_chunks():
+        msg = "Arrow streaming needs arrow_schema= for a stream that does not report its column types"
+        raise ImproperConfigurationError(msg)
+
+
+def iter_encoded_rows(
+    stream: "StreamingSource",
+    format_choice: StreamingFormat = "ndjson",
+    *,
+    session: "AbstractContextManager[Any] | None" = None,
+    arrow_schema: Any = None,
+) -> "Iterator[bytes]":
+    """Yield encoded chunks from a sync row stream, closing the stream and session at the end.
+
+    Raises:
+        ImproperConfigurationError: ``stream`` and ``session`` do not fit together.
+    """
+    _check_source(stream, session)
+    encoder = RowChunkEncoder(format_choice, arrow_schema=arrow_schema)
+    if session is None:
+        _check_arrow_source(encoder, stream)
+    return _iter_encoded_rows(stream, encoder, session)
+
+
+def _iter_encoded_rows(stream: Any, encoder: RowChunkEncoder, session: Any) -> "Iterator[bytes]":
+    row_stream: SyncRowStream[Any] | None = None
+    entered = False
+    try:
+        if session is not None:
+            driver = session.__enter__()
+            entered = True
+            row_stream = cast("SyncRowStream[Any]", stream(driver))
+        else:
+            row_stream = cast("SyncRowStream[Any]", stream)
+        if encoder.needs_column_types:
+            _check_arrow_source(encoder, row_stream)
+            rows, column_names, column_types = row_stream.next_row_chunk()
+            payload = encoder.encode_row_chunk(rows, column_names, column_types)
+            while rows:
+                if payload:
+                    yield payload
+                rows, column_names, _ = row_stream.next_row_chunk()
+                payload = encoder.encode_row_chunk(rows, column_names)
+        else:
+            chunk = row_stream.next_chunk()
+            while chunk:
+                payload = encoder.encode(chunk)
+                if payload:
+                    yield payload
+                chunk = row_stream.next_chunk()
+        trailer = encoder.finish()
+        if trailer:
+            yield trailer
+    finally:
+        try:
+            if row_stream is not None:
+                row_stream.close()
+        finally:
+            if entered:
+                session.__exit__(None, None, None)
+
+
+def aiter_encoded_rows(
+    stream: "StreamingSource",
+    format_choice: StreamingFormat = "ndjson",
+    *,
+    session: "AbstractAsyncContextManager[Any] | None" = None,
+    arrow_schema: Any = None,
+) -> "AsyncIterator[bytes]":
+    """Async :func:`iter_encoded_rows`; ``aclose()`` on the result releases the stream and session.
+
+    Raises:
+        ImproperConfigurationError: ``stream`` and ``session`` do not fit together.
+    """
+    _check_source(stream, session)
+    encoder = RowChunkEncoder(format_choice, arrow_schema=arrow_schema)
+    if session is None:
+        _check_arrow_source(encoder, stream)
+    return _aiter_encoded_rows(stream, encoder, session)
+
+
+async def _aiter_encoded_rows(stream: Any, encoder: RowChunkEncoder, session: Any) -> "AsyncIterator[bytes]":
+    row_stream: AsyncRowStream[Any] | None = None
+    entered = False
+    try:
+        if session is not None:
+            driver = await session.__aenter__()
+            entered = True
+            row_stream = cast("AsyncRowStream[Any]", stream(driver))
+        else:
+            row_stream = cast("AsyncRowStream[Any]", stream)
+        if encoder.needs_column_types:
+            _check_arrow_source(encoder, row_stream)
+            rows, column_names, column_types = await row_stream.next_row_chunk()
+            payload = encoder.encode_row_chunk(rows, column_names, column_types)
+            while rows:
+                if payload:
+                    yield payload
+                rows, column_names, _ = await row_stream.next_row_chunk()
+                payload = encoder.encode_row_chunk(rows, column_names)
+        else:
+            chunk = await row_stream.next_chunk()
+            while chunk:
+                payload = encoder.encode(chunk)
+                if payload:
+                    yield payload
+                chunk = await row_stream.next_chunk()
+        trailer = encoder.finish()
+        if trailer:
+            yield trailer
+    finally:
+        try:
+            if row_stream is not None:
+                await row_stream.aclose()
+        finally:
+            if entered:
+                await session.__aexit__(None, None, None)
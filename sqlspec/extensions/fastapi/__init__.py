@@ -7,9 +7,11 @@ Depends() system, including filter dependency builders.
 from sqlspec.extensions.fastapi.extension import SQLSpecPlugin
 from sqlspec.extensions.fastapi.providers import DependencyDefaults, FieldNameType, FilterConfig, provide_filters
 from sqlspec.extensions.starlette.middleware import SQLSpecAutocommitMiddleware, SQLSpecManualMiddleware
-from sqlspec.service import SQLSpecAsyncService, SQLSpecSyncService
+from sqlspec.extensions.starlette.responses import StreamingQueryResponse
+from sqlspec.service import BatchLoader, SQLSpecAsyncService, SQLSpecSyncService
 
 __all__ = (
+    "BatchLoader",
     "DependencyDefaults",
     "FieldNameType",
     "FilterConfig",
@@ -18,5 +20,6 @@ __all__ = (
     "SQLSpecManualMiddleware",
     "SQLSpecPlugin",
     "SQLSpecSyncService",
+    "StreamingQueryResponse",
     "provide_filters",
 )
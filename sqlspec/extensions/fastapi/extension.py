@@ -1,9 +1,10 @@
-from typing import TYPE_CHECKING, Any, overload
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 from fastapi import Request
 
 from sqlspec.extensions.fastapi.providers import DEPENDENCY_DEFAULTS
 from sqlspec.extensions.fastapi.providers import provide_filters as _provide_filters
+from sqlspec.extensions.starlette._utils import get_state_value, set_state_value
 from sqlspec.extensions.starlette.extension import SQLSpecPlugin as _StarlettePlugin
 
 if TYPE_CHECKING:
@@ -26,6 +27,8 @@ else:
 
 __all__ = ("SQLSpecPlugin",)
 
+ServiceT = TypeVar("ServiceT")
+
 
 class SQLSpecPlugin(_StarlettePlugin):
     """SQLSpec integration for FastAPI applications.
@@ -143,6 +146,36 @@ class SQLSpecPlugin(_StarlettePlugin):
 
         return dependency
 
+    def provide_service(
+        self, service_type: "type[ServiceT]", key: "str | None" = None
+    ) -> "Callable[[Request], ServiceT]":
+        """Create dependency factory for service injection.
+
+        Builds ``service_type`` around the request session and caches it on the
+        request, so every dependency in one request shares the service and the
+        :class:`~sqlspec.service.BatchLoader` instances it creates, while each
+        request starts with an empty loader cache.
+
+        Args:
+            service_type: Service class taking the driver session as its only argument.
+            key: Optional session key for multi-database configurations.
+
+        Returns:
+            Dependency callable that returns the request's service instance.
+        """
+        service_state_key = (
+            f"{key or self._config_states[0].session_key}_service_{service_type.__module__}.{service_type.__qualname__}"
+        )
+
+        def dependency(request: Request) -> Any:
+            service = get_state_value(request.state, service_state_key, None)
+            if service is None:
+                service = service_type(self.get_session(request, key))  # type: ignore[call-arg]
+                set_state_value(request.state, service_state_key, service)
+            return service
+
+        return dependency
+
     @overload
     def provide_connection(self, key: None = None) -> "Callable[[Request], Any]": ...
 
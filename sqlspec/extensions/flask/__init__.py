@@ -6,6 +6,7 @@ and async adapter support via portal pattern.
 
 from sqlspec.extensions.flask._state import FlaskConfigState
 from sqlspec.extensions.flask.extension import SQLSpecPlugin
+from sqlspec.extensions.flask.responses import StreamingQueryResponse
 from sqlspec.service import SQLSpecAsyncService, SQLSpecSyncService
 
-__all__ = ("FlaskConfigState", "SQLSpecAsyncService", "SQLSpecPlugin", "SQLSpecSyncService")
+__all__ = ("FlaskConfigState", "SQLSpecAsyncService", "SQLSpecPlugin", "SQLSpecSyncService", "StreamingQueryResponse")
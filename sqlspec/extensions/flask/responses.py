@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING, Any
+
+from flask import Response
+
+from sqlspec.exceptions import ImproperConfigurationError
+from sqlspec.extensions._streaming import (
+    STREAMING_MEDIA_TYPES,
+    is_async_streaming_source,
+    iter_encoded_rows,
+    streaming_headers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from sqlspec.extensions._streaming import StreamingFormat, StreamingSource
+
+__all__ = ("StreamingQueryResponse",)
+
+
+class StreamingQueryResponse(Response):
+    """Stream a sync row stream to the client as NDJSON, CSV or Arrow IPC.
+
+    Rows are encoded one fetched chunk at a time. Flask tears down the request
+    session before the body is sent, so pass a callable that builds the stream
+    from a driver together with ``session=config.provide_session()``; the
+    session is opened on the first chunk and closed when the WSGI server closes
+    the response, including after a client disconnect.
+
+    Example:
+        ```python
+        @app.get("/events.csv")
+        def export() -> StreamingQueryResponse:
+            return StreamingQueryResponse(
+                lambda db: db.select_stream("SELECT * FROM events"),
+                session=config.provide_session(),
+                format_hint="csv",
+            )
+        ```
+    """
+
+    def __init__(
+        self,
+        stream: "StreamingSource",
+        *,
+        format_hint: "StreamingFormat" = "ndjson",
+        session: Any = None,
+        arrow_schema: Any = None,
+        filename: "str | None" = None,
+        status: "int | None" = None,
+        headers: "Mapping[str, str] | None" = None,
+    ) -> None:
+        if is_async_streaming_source(stream, session):
+            msg = "StreamingQueryResponse for Flask needs a sync row stream or sync session"
+            raise ImproperConfigurationError(msg)
+        body = iter_encoded_rows(stream, format_hint, session=session, arrow_schema=arrow_schema)
+        super().__init__(
+            body,
+            status=status,
+            headers=streaming_headers(format_hint, filename, headers),
+            content_type=STREAMING_MEDIA_TYPES[format_hint],
+            direct_passthrough=True,
+        )
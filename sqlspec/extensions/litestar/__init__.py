@@ -10,8 +10,9 @@ from sqlspec.extensions.litestar.plugin import (
     CommitMode,
     SQLSpecPlugin,
 )
+from sqlspec.extensions.litestar.responses import StreamingQueryResponse
 from sqlspec.extensions.litestar.store import BaseSQLSpecStore
-from sqlspec.service import SQLSpecAsyncService, SQLSpecSyncService
+from sqlspec.service import BatchLoader, SQLSpecAsyncService, SQLSpecSyncService
 
 __all__ = (
     "DEFAULT_COMMIT_MODE",
@@ -19,12 +20,14 @@ __all__ = (
     "DEFAULT_POOL_KEY",
     "DEFAULT_SESSION_KEY",
     "BaseSQLSpecStore",
+    "BatchLoader",
     "CommitMode",
     "LitestarConfig",
     "SQLSpecAsyncService",
     "SQLSpecChannelsBackend",
     "SQLSpecPlugin",
     "SQLSpecSyncService",
+    "StreamingQueryResponse",
     "database_group",
     "get_sqlspec_scope_state",
     "set_sqlspec_scope_state",
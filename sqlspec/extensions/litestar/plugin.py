@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, TypeAlias, cast, overload
 
 from litestar.di import Provide
-from litestar.exceptions import NotFoundException
+from litestar.exceptions import NotFoundException, ServiceUnavailableException
 from litestar.middleware import DefineMiddleware
 from litestar.plugins import CLIPlugin, InitPluginProtocol, OpenAPISchemaPlugin
 
@@ -22,7 +22,8 @@ from sqlspec.config import (
 )
 from sqlspec.core import CorrelationExtractor, OffsetPagination
 from sqlspec.core.sqlcommenter import SQLCommenterContext
-from sqlspec.exceptions import ImproperConfigurationError, NotFoundError
+from sqlspec.exceptions import ImproperConfigurationError, LoadSheddingError, NotFoundError
+from sqlspec.extensions._load_shedding import load_shedding_headers
 from sqlspec.extensions.litestar._utils import (
     delete_sqlspec_scope_state,
     get_sqlspec_scope_state,
@@ -114,6 +115,16 @@ def not_found_error_handler(_request: "Request[Any, Any, Any]", exc: NotFoundErr
     raise NotFoundException(detail=detail) from exc
 
 
+def load_shedding_error_handler(_request: "Request[Any, Any, Any]", exc: LoadSheddingError) -> NoReturn:
+    """Translate :class:`sqlspec.exceptions.LoadSheddingError` into Litestar's HTTP 503.
+
+    Raised when a config's circuit breaker is open or its admission limiter rejects
+    the request. Open circuits set ``Retry-After`` to the seconds left before probes.
+    """
+    detail = str(exc) or "Service Unavailable"
+    raise ServiceUnavailableException(detail=detail, headers=load_shedding_headers(exc)) from exc
+
+
 class CorrelationMiddleware:
     __slots__ = ("_app", "_extractor", "_headers")
 
@@ -383,6 +394,7 @@ class SQLSpecPlugin(InitPluginProtocol, CLIPlugin):
         if app_config.exception_handlers is None:
             app_config.exception_handlers = {}
         app_config.exception_handlers.setdefault(NotFoundError, not_found_error_handler)
+        app_config.exception_handlers.setdefault(LoadSheddingError, load_shedding_error_handler)
 
         # Inject sqlspec's DEFAULT_TYPE_ENCODERS into Litestar's response serializer
         # (user-supplied encoders win on conflict). Litestar's per-handler
@@ -53,6 +53,7 @@ __all__ = (
     "StringOrNone",
     "UuidOrNone",
     "create_filter_dependencies",
+    "create_service_provider",
     "dep_cache",
     "normalize_choice_field_types",
 )
@@ -68,6 +69,7 @@ SortField = str | set[str] | list[str]
 HashableValue = str | int | float | bool | None
 HashableType = HashableValue | tuple[Any, ...] | tuple[tuple[str, Any], ...] | tuple[HashableValue, ...]
 _ProviderT = TypeVar("_ProviderT")
+_ServiceT = TypeVar("_ServiceT")
 
 
 class DependencyDefaults:
@@ -204,6 +206,36 @@ def create_filter_dependencies(
     return deps
 
 
+def create_service_provider(service_type: "type[_ServiceT]", session_key: str = "db_session") -> Provide:
+    """Create a dependency provider that builds ``service_type`` around the request session.
+
+    Litestar resolves the provider once per request, so the service and the
+    :class:`~sqlspec.service.BatchLoader` instances it creates are request scoped
+    and start each request with an empty cache.
+
+    Args:
+        service_type: Service class taking the driver session as its only argument.
+        session_key: Dependency key of the session to wrap (the config's ``session_key``).
+
+    Returns:
+        A dependency provider for the service.
+    """
+
+    def provide_service(*args: Any, **kwargs: Any) -> "_ServiceT":
+        return service_type(args[0] if args else kwargs[session_key])  # type: ignore[call-arg]
+
+    session_annotation = NamedDependency[SkipValidation[Any]]
+    signature = inspect.Signature(
+        parameters=[
+            inspect.Parameter(session_key, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=session_annotation)
+        ],
+        return_annotation=service_type,
+    )
+    return _create_provide(
+        _set_provider_metadata(provide_service, signature, {session_key: session_annotation, "return": service_type})
+    )
+
+
 def _create_statement_filters(
     config: FilterConfig, dep_defaults: DependencyDefaults = DEPENDENCY_DEFAULTS
 ) -> dict[str, Provide]:
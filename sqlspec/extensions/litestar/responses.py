@@ -0,0 +1,84 @@
+from typing import TYPE_CHECKING, Any
+
+from litestar.background_tasks import BackgroundTask, BackgroundTasks
+from litestar.concurrency import sync_to_thread
+from litestar.response import Stream
+
+from sqlspec.extensions._streaming import (
+    STREAMING_MEDIA_TYPES,
+    aiter_encoded_rows,
+    is_async_streaming_source,
+    iter_encoded_rows,
+    streaming_headers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from sqlspec.extensions._streaming import StreamingFormat, StreamingSource
+
+__all__ = ("StreamingQueryResponse",)
+
+
+class StreamingQueryResponse(Stream):
+    """Stream a row stream to the client as NDJSON, CSV or Arrow IPC.
+
+    Rows are encoded one fetched chunk at a time. Pass either an open
+    ``SyncRowStream``/``AsyncRowStream``, or a callable that builds one from a
+    driver together with ``session=config.provide_session()`` so the connection
+    is acquired when streaming starts and released when it ends. The stream and
+    session are also released when the client disconnects.
+
+    Example:
+        ```python
+        @get("/events.ndjson")
+        async def export() -> StreamingQueryResponse:
+            return StreamingQueryResponse(
+                lambda db: db.select_stream("SELECT * FROM events"),
+                session=config.provide_session(),
+            )
+        ```
+    """
+
+    __slots__ = ("_query_body",)
+
+    def __init__(
+        self,
+        stream: "StreamingSource",
+        *,
+        format_hint: "StreamingFormat" = "ndjson",
+        session: Any = None,
+        arrow_schema: Any = None,
+        filename: "str | None" = None,
+        status_code: "int | None" = None,
+        headers: "Mapping[str, str] | None" = None,
+        background: "BackgroundTask | BackgroundTasks | None" = None,
+    ) -> None:
+        body: Any
+        if is_async_streaming_source(stream, session):
+            body = aiter_encoded_rows(stream, format_hint, session=session, arrow_schema=arrow_schema)
+        else:
+            body = iter_encoded_rows(stream, format_hint, session=session, arrow_schema=arrow_schema)
+        self._query_body = body
+        release = BackgroundTask(self._release_body)
+        if background is None:
+            tasks: BackgroundTask | BackgroundTasks = release
+        elif isinstance(background, BackgroundTasks):
+            tasks = BackgroundTasks([release, *background.tasks], run_in_task_group=background.run_in_task_group)
+        else:
+            tasks = BackgroundTasks([release, background])
+        super().__init__(
+            body,
+            background=tasks,
+            headers=streaming_headers(format_hint, filename, headers),
+            media_type=STREAMING_MEDIA_TYPES[format_hint],
+            status_code=status_code,
+        )
+
+    async def _release_body(self) -> None:
+        """Close the body once the response is sent or the client has disconnected."""
+        body = self._query_body
+        if hasattr(body, "aclose"):
+            await body.aclose()
+        else:
+            await sync_to_thread(body.close)
@@ -1,5 +1,6 @@
 """Prometheus metrics helpers that integrate with statement observers."""
 
 from sqlspec.extensions.prometheus._observer import PrometheusStatementObserver, enable_metrics
+from sqlspec.extensions.prometheus._pool import PrometheusPoolCollector
 
-__all__ = ("PrometheusStatementObserver", "enable_metrics")
+__all__ = ("PrometheusPoolCollector", "PrometheusStatementObserver", "enable_metrics")
@@ -3,6 +3,7 @@
 from collections.abc import Iterable
 from typing import Any
 
+from sqlspec.extensions.prometheus._pool import register_pool_collector
 from sqlspec.observability import ObservabilityConfig, StatementEvent, StatementObserver, resolve_db_system
 from sqlspec.typing import Counter, Histogram
 from sqlspec.utils.module_loader import ensure_prometheus
@@ -94,8 +95,14 @@ def enable_metrics(
     registry: Any | None = None,
     label_names: Iterable[str] = ("db_system", "operation"),
     duration_buckets: tuple[float, ...] | None = None,
+    pool_metrics: bool = True,
 ) -> ObservabilityConfig:
-    """Attach a Prometheus-backed statement observer to the provided config."""
+    """Attach a Prometheus-backed statement observer to the provided config.
+
+    With ``pool_metrics`` enabled the config also records connection pool
+    metrics, exported by a collector registered once per registry under the
+    ``<namespace>_pool_*`` names.
+    """
 
     ensure_prometheus()
 
@@ -111,4 +118,7 @@ def enable_metrics(
     existing: list[StatementObserver] = list(config.statement_observers or ())
     existing.append(observer)
     config.statement_observers = tuple(existing)
+    if pool_metrics:
+        config.pool_metrics = True
+        register_pool_collector(namespace=namespace, registry=registry)
     return config
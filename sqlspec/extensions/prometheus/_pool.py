@@ -0,0 +1,125 @@
+"""Prometheus collector for connection pool metrics."""
+
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from sqlspec.observability import get_pool_metrics, resolve_db_system
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlspec.observability import PoolHistogramSnapshot
+
+__all__ = ("PrometheusPoolCollector", "register_pool_collector")
+
+_POOL_LABEL_NAMES = ("db_system", "config", "bind_key")
+_REGISTERED: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+class PrometheusPoolCollector:
+    """Expose every published ``PoolMetrics`` instance at scrape time.
+
+    Pools only update in-process counters and histograms; this collector turns
+    them into Prometheus families when the registry is scraped, labelled by
+    ``db_system``, ``config`` and ``bind_key``.
+    """
+
+    __slots__ = ("_namespace", "_subsystem")
+
+    def __init__(self, *, namespace: str = "sqlspec", subsystem: str = "pool") -> None:
+        self._namespace = namespace
+        self._subsystem = subsystem
+
+    def _name(self, name: str) -> str:
+        return "_".join(part for part in (self._namespace, self._subsystem, name) if part)
+
+    def describe(self) -> "list[Any]":
+        """Return no descriptions so registration does not depend on which pools exist yet."""
+        return []
+
+    def collect(self) -> "Iterator[Any]":
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+
+        acquires = CounterMetricFamily(
+            self._name("acquires"), "Connections handed out by the pool", labels=_POOL_LABEL_NAMES
+        )
+        timeouts = CounterMetricFamily(
+            self._name("acquire_timeouts"), "Acquires that timed out waiting for a connection", labels=_POOL_LABEL_NAMES
+        )
+        created = CounterMetricFamily(
+            self._name("connections_created"), "Physical connections opened", labels=_POOL_LABEL_NAMES
+        )
+        closed = CounterMetricFamily(
+            self._name("connections_closed"), "Physical connections closed", labels=_POOL_LABEL_NAMES
+        )
+        acquire_wait = HistogramMetricFamily(
+            self._name("acquire_wait_seconds"), "Time spent waiting for a pooled connection", labels=_POOL_LABEL_NAMES
+        )
+        connection_create = HistogramMetricFamily(
+            self._name("connection_create_seconds"),
+            "Time spent opening a physical connection",
+            labels=_POOL_LABEL_NAMES,
+        )
+        connection_age = HistogramMetricFamily(
+            self._name("connection_age_seconds"), "Lifetime of closed physical connections", labels=_POOL_LABEL_NAMES
+        )
+        size = GaugeMetricFamily(self._name("size"), "Open connections in the pool", labels=_POOL_LABEL_NAMES)
+        checked_out = GaugeMetricFamily(
+            self._name("checked_out"), "Connections currently in use", labels=_POOL_LABEL_NAMES
+        )
+        idle = GaugeMetricFamily(self._name("idle"), "Idle connections ready to hand out", labels=_POOL_LABEL_NAMES)
+        max_size = GaugeMetricFamily(self._name("max_size"), "Configured pool capacity", labels=_POOL_LABEL_NAMES)
+
+        for metrics in get_pool_metrics():
+            snapshot = metrics.snapshot()
+            labels = [resolve_db_system(snapshot["config"]), snapshot["config"], snapshot["bind_key"] or "default"]
+            acquires.add_metric(labels, snapshot["acquires"])
+            timeouts.add_metric(labels, snapshot["acquire_timeouts"])
+            created.add_metric(labels, snapshot["connections_created"])
+            closed.add_metric(labels, snapshot["connections_closed"])
+            _add_histogram(acquire_wait, labels, snapshot["acquire_wait"])
+            _add_histogram(connection_create, labels, snapshot["connection_create"])
+            _add_histogram(connection_age, labels, snapshot["connection_age"])
+            gauges = snapshot["gauges"]
+            if gauges is not None:
+                size.add_metric(labels, gauges["size"])
+                checked_out.add_metric(labels, gauges["checked_out"])
+                idle.add_metric(labels, gauges["idle"])
+                if gauges["max_size"] is not None:
+                    max_size.add_metric(labels, gauges["max_size"])
+
+        yield from (
+            acquires,
+            timeouts,
+            created,
+            closed,
+            acquire_wait,
+            connection_create,
+            connection_age,
+            size,
+            checked_out,
+            idle,
+            max_size,
+        )
+
+
+def _add_histogram(family: Any, labels: "list[str]", histogram: "PoolHistogramSnapshot") -> None:
+    buckets = [("+Inf" if bound == float("inf") else repr(bound), count) for bound, count in histogram["buckets"]]
+    family.add_metric(labels, buckets, histogram["sum"])
+
+
+def register_pool_collector(*, namespace: str = "sqlspec", registry: Any | None = None) -> None:
+    """Register the pool collector with a registry once.
+
+    Args:
+        namespace: Prometheus metric namespace.
+        registry: Target registry. Defaults to the global ``REGISTRY``.
+    """
+    if registry is None:
+        from prometheus_client import REGISTRY
+
+        registry = REGISTRY
+    if registry in _REGISTERED:
+        return
+    registry.register(PrometheusPoolCollector(namespace=namespace))
+    _REGISTERED.add(registry)
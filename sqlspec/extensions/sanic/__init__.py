@@ -7,6 +7,7 @@ connection lifecycle and request-scoped sessions.
 from sqlspec.extensions.sanic._state import SanicConfigState
 from sqlspec.extensions.sanic._utils import get_connection_from_request, get_or_create_session
 from sqlspec.extensions.sanic.extension import SQLSpecPlugin
+from sqlspec.extensions.sanic.responses import stream_query_response
 from sqlspec.service import SQLSpecAsyncService, SQLSpecSyncService
 
 __all__ = (
@@ -16,4 +17,5 @@ __all__ = (
     "SanicConfigState",
     "get_connection_from_request",
     "get_or_create_session",
+    "stream_query_response",
 )
@@ -0,0 +1,86 @@
+from typing import TYPE_CHECKING, Any
+
+from sqlspec.extensions._streaming import (
+    STREAMING_MEDIA_TYPES,
+    aiter_encoded_rows,
+    is_async_streaming_source,
+    iter_encoded_rows,
+    streaming_headers,
+)
+from sqlspec.utils.sync_tools import async_
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from sanic import Request
+    from sanic.response import HTTPResponse
+
+    from sqlspec.extensions._streaming import StreamingFormat, StreamingSource
+
+__all__ = ("stream_query_response",)
+
+_DONE = object()
+
+
+async def stream_query_response(
+    request: "Request",
+    stream: "StreamingSource",
+    *,
+    format_hint: "StreamingFormat" = "ndjson",
+    session: Any = None,
+    arrow_schema: Any = None,
+    filename: "str | None" = None,
+    status: int = 200,
+    headers: "Mapping[str, str] | None" = None,
+) -> "HTTPResponse":
+    """Stream a row stream to the client as NDJSON, CSV or Arrow IPC.
+
+    Rows are encoded and sent one fetched chunk at a time. Pass either an open
+    ``SyncRowStream``/``AsyncRowStream``, or a callable that builds one from a
+    driver together with ``session=config.provide_session()`` so the connection
+    is acquired when streaming starts and released when it ends. The stream and
+    session are also released when sending fails because the client went away.
+    Sync streams are read on a worker thread.
+
+    Example:
+        ```python
+        @app.get("/events.ndjson")
+        async def export(request: Request) -> HTTPResponse:
+            return await stream_query_response(
+                request,
+                lambda db: db.select_stream("SELECT * FROM events"),
+                session=config.provide_session(),
+            )
+        ```
+
+    Returns:
+        The sent response.
+    """
+    response_headers = streaming_headers(format_hint, filename, headers)
+    if is_async_streaming_source(stream, session):
+        body = aiter_encoded_rows(stream, format_hint, session=session, arrow_schema=arrow_schema)
+        try:
+            response = await request.respond(
+                status=status, headers=response_headers, content_type=STREAMING_MEDIA_TYPES[format_hint]
+            )
+            async for payload in body:
+                await response.send(payload)
+            await response.eof()
+        finally:
+            await body.aclose()
+        return response
+
+    sync_body = iter_encoded_rows(stream, format_hint, session=session, arrow_schema=arrow_schema)
+    next_payload = async_(next)
+    try:
+        response = await request.respond(
+            status=status, headers=response_headers, content_type=STREAMING_MEDIA_TYPES[format_hint]
+        )
+        payload = await next_payload(sync_body, _DONE)
+        while payload is not _DONE:
+            await response.send(payload)
+            payload = await next_payload(sync_body, _DONE)
+        await response.eof()
+    finally:
+        await async_(sync_body.close)()
+    return response
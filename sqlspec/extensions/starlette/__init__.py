@@ -8,6 +8,7 @@ from sqlspec.extensions.starlette._state import SQLSpecConfigState
 from sqlspec.extensions.starlette._utils import get_connection_from_request, get_or_create_session
 from sqlspec.extensions.starlette.extension import SQLSpecPlugin
 from sqlspec.extensions.starlette.middleware import SQLSpecAutocommitMiddleware, SQLSpecManualMiddleware
+from sqlspec.extensions.starlette.responses import StreamingQueryResponse
 from sqlspec.service import SQLSpecAsyncService, SQLSpecSyncService
 
 __all__ = (
@@ -17,6 +18,7 @@ __all__ = (
     "SQLSpecManualMiddleware",
     "SQLSpecPlugin",
     "SQLSpecSyncService",
+    "StreamingQueryResponse",
     "get_connection_from_request",
     "get_or_create_session",
 )
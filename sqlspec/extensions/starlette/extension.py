@@ -3,7 +3,7 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 from sqlspec.base import SQLSpec
-from sqlspec.exceptions import ImproperConfigurationError
+from sqlspec.exceptions import ImproperConfigurationError, LoadSheddingError
 from sqlspec.extensions.starlette._state import SQLSpecConfigState
 from sqlspec.extensions.starlette._utils import get_or_create_session, get_state_value
 from sqlspec.extensions.starlette.middleware import (
@@ -12,6 +12,7 @@ from sqlspec.extensions.starlette.middleware import (
     SQLSpecAutocommitMiddleware,
     SQLSpecManualMiddleware,
 )
+from sqlspec.extensions.starlette.responses import load_shedding_exception_handler
 from sqlspec.utils.logging import get_logger, log_with_context
 from sqlspec.utils.sync_tools import ensure_async_
 
@@ -128,7 +129,8 @@ class SQLSpecPlugin:
     def init_app(self, app: "Starlette") -> None:
         """Initialize Starlette application with SQLSpec.
 
-        Validates configuration, wraps lifespan, and adds middleware.
+        Validates configuration, wraps lifespan, adds middleware, and maps
+        ``LoadSheddingError`` to HTTP 503 unless the app already handles it.
 
         Args:
             app: Starlette application instance.
@@ -148,6 +150,9 @@ class SQLSpecPlugin:
             if not config_state.disable_di:
                 self._add_middleware(app, config_state)
 
+        if LoadSheddingError not in app.exception_handlers:
+            app.add_exception_handler(LoadSheddingError, load_shedding_exception_handler)
+
         # Add correlation middleware if any config enables it (only add once)
         self._add_correlation_middleware(app)
         self._add_sqlcommenter_middleware(app)
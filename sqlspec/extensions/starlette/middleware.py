@@ -5,7 +5,9 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from sqlspec.core import CorrelationExtractor
 from sqlspec.core.sqlcommenter import SQLCommenterContext
+from sqlspec.exceptions import LoadSheddingError
 from sqlspec.extensions.starlette._utils import get_state_value, pop_state_value, set_state_value
+from sqlspec.extensions.starlette.responses import load_shedding_response
 from sqlspec.utils.correlation import CorrelationContext
 from sqlspec.utils.sync_tools import ensure_async_, with_ensure_async_
 from sqlspec.utils.type_guards import has_name
@@ -46,10 +48,13 @@ class SQLSpecManualMiddleware(BaseHTTPMiddleware):
             call_next: Next middleware or route handler.
 
         Returns:
-            HTTP response.
+            HTTP response, or 503 when the config sheds the connection request.
         """
-        async with self._connection_cm(request):
-            return await call_next(request)
+        try:
+            async with self._connection_cm(request):
+                return await call_next(request)
+        except LoadSheddingError as exc:
+            return load_shedding_response(exc)
 
     @asynccontextmanager
     async def _connection_cm(self, request: "Request") -> "AsyncIterator[Any]":
@@ -99,21 +104,24 @@ class SQLSpecAutocommitMiddleware(BaseHTTPMiddleware):
             call_next: Next middleware or route handler.
 
         Returns:
-            HTTP response.
+            HTTP response, or 503 when the config sheds the connection request.
         """
-        async with self._connection_cm(request) as connection:
-            try:
-                response = await call_next(request)
+        try:
+            async with self._connection_cm(request) as connection:
+                try:
+                    response = await call_next(request)
 
-                if self._should_commit(response.status_code):
-                    await ensure_async_(connection.commit)()
-                else:
+                    if self._should_commit(response.status_code):
+                        await ensure_async_(connection.commit)()
+                    else:
+                        await ensure_async_(connection.rollback)()
+                except Exception:
                     await ensure_async_(connection.rollback)()
-            except Exception:
-                await ensure_async_(connection.rollback)()
-                raise
-            else:
-                return response
+                    raise
+                else:
+                    return response
+        except LoadSheddingError as exc:
+            return load_shedding_response(exc)
 
     @asynccontextmanager
     async def _connection_cm(self, request: "Request") -> "AsyncIterator[Any]":
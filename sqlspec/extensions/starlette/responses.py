@@ -0,0 +1,102 @@
+from typing import TYPE_CHECKING, Any, cast
+
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, StreamingResponse
+
+from sqlspec.extensions._load_shedding import LOAD_SHEDDING_STATUS_CODE, load_shedding_headers
+from sqlspec.extensions._streaming import (
+    STREAMING_MEDIA_TYPES,
+    aiter_encoded_rows,
+    is_async_streaming_source,
+    iter_encoded_rows,
+    streaming_headers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from starlette.background import BackgroundTask
+    from starlette.requests import Request
+    from starlette.types import Receive, Scope, Send
+
+    from sqlspec.exceptions import LoadSheddingError
+    from sqlspec.extensions._streaming import StreamingFormat, StreamingSource
+
+__all__ = ("StreamingQueryResponse", "load_shedding_exception_handler", "load_shedding_response")
+
+
+class StreamingQueryResponse(StreamingResponse):
+    """Stream a row stream to the client as NDJSON, CSV or Arrow IPC.
+
+    Rows are encoded one fetched chunk at a time. Pass either an open
+    ``SyncRowStream``/``AsyncRowStream``, or a callable that builds one from a
+    driver together with ``session=config.provide_session()`` so the connection
+    is acquired when streaming starts and released when it ends. The stream and
+    session are also released when the client disconnects.
+
+    Example:
+        ```python
+        async def export(
+            request: Request,
+        ) -> StreamingQueryResponse:
+            return StreamingQueryResponse(
+                lambda db: db.select_stream("SELECT * FROM events"),
+                session=config.provide_session(),
+                format_hint="csv",
+                filename="events",
+            )
+        ```
+    """
+
+    def __init__(
+        self,
+        stream: "StreamingSource",
+        *,
+        format_hint: "StreamingFormat" = "ndjson",
+        session: Any = None,
+        arrow_schema: Any = None,
+        filename: "str | None" = None,
+        status_code: int = 200,
+        headers: "Mapping[str, str] | None" = None,
+        background: "BackgroundTask | None" = None,
+    ) -> None:
+        body: Any
+        if is_async_streaming_source(stream, session):
+            body = aiter_encoded_rows(stream, format_hint, session=session, arrow_schema=arrow_schema)
+        else:
+            body = iter_encoded_rows(stream, format_hint, session=session, arrow_schema=arrow_schema)
+        self._query_body = body
+        super().__init__(
+            body,
+            status_code=status_code,
+            headers=streaming_headers(format_hint, filename, headers),
+            media_type=STREAMING_MEDIA_TYPES[format_hint],
+            background=background,
+        )
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            body = self._query_body
+            if hasattr(body, "aclose"):
+                await body.aclose()
+            else:
+                await run_in_threadpool(body.close)
+
+
+def load_shedding_response(exc: "LoadSheddingError") -> JSONResponse:
+    """Render a load-shedding rejection as HTTP 503.
+
+    Open circuits set ``Retry-After`` to the seconds left before probes are admitted.
+    """
+    return JSONResponse(
+        {"detail": str(exc) or "Service Unavailable"},
+        status_code=LOAD_SHEDDING_STATUS_CODE,
+        headers=load_shedding_headers(exc),
+    )
+
+
+async def load_shedding_exception_handler(_request: "Request", exc: Exception) -> JSONResponse:
+    """Starlette exception handler translating ``LoadSheddingError`` into HTTP 503."""
+    return load_shedding_response(cast("LoadSheddingError", exc))
@@ -21,6 +21,14 @@ from sqlspec.observability._observer import (
     default_statement_observer,
     format_statement_event,
 )
+from sqlspec.observability._pool import (
+    PoolGauges,
+    PoolHistogramSnapshot,
+    PoolMetrics,
+    PoolMetricsSnapshot,
+    get_pool_metrics,
+    pool_metrics_for,
+)
 from sqlspec.observability._runtime import ObservabilityRuntime
 from sqlspec.observability._sampling import SamplingConfig
 from sqlspec.observability._spans import SpanManager
@@ -40,6 +48,10 @@ __all__ = (
     "OTelJSONFormatter",
     "ObservabilityConfig",
     "ObservabilityRuntime",
+    "PoolGauges",
+    "PoolHistogramSnapshot",
+    "PoolMetrics",
+    "PoolMetricsSnapshot",
     "RedactionConfig",
     "SamplingConfig",
     "SpanManager",
@@ -52,6 +64,8 @@ __all__ = (
     "create_statement_observer",
     "default_statement_observer",
     "format_statement_event",
+    "get_pool_metrics",
     "get_trace_context",
+    "pool_metrics_for",
     "resolve_db_system",
 )
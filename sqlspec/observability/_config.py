@@ -178,6 +178,7 @@ class ObservabilityConfig:
         "cloud_formatter",
         "lifecycle",
         "logging",
+        "pool_metrics",
         "print_sql",
         "redaction",
         "sampling",
@@ -196,6 +197,7 @@ class ObservabilityConfig:
         logging: "LoggingConfig | None" = None,
         sampling: "SamplingConfig | None" = None,
         cloud_formatter: "CloudLogFormatter | None" = None,
+        pool_metrics: bool | None = None,
     ) -> None:
         self.lifecycle = lifecycle
         self.print_sql = print_sql
@@ -205,6 +207,7 @@ class ObservabilityConfig:
         self.logging = logging
         self.sampling = sampling
         self.cloud_formatter = cloud_formatter
+        self.pool_metrics = pool_metrics
 
     def __hash__(self) -> int:  # pragma: no cover
         msg = "ObservabilityConfig objects are mutable and unhashable"
@@ -228,6 +231,7 @@ class ObservabilityConfig:
             logging=logging_copy,
             sampling=sampling_copy,
             cloud_formatter=self.cloud_formatter,
+            pool_metrics=self.pool_metrics,
         )
 
     @classmethod
@@ -262,6 +266,7 @@ class ObservabilityConfig:
         logging = _merge_logging(base.logging, override.logging)
         sampling = _merge_sampling(base.sampling, override.sampling)
         cloud_formatter = override.cloud_formatter if override.cloud_formatter is not None else base.cloud_formatter
+        pool_metrics = override.pool_metrics if override.pool_metrics is not None else base.pool_metrics
 
         return ObservabilityConfig(
             lifecycle=lifecycle,
@@ -272,12 +277,14 @@ class ObservabilityConfig:
             logging=logging,
             sampling=sampling,
             cloud_formatter=cloud_formatter,
+            pool_metrics=pool_metrics,
         )
 
     def __repr__(self) -> str:
         return (
             f"ObservabilityConfig(lifecycle={self.lifecycle!r}, print_sql={self.print_sql!r}, statement_observers={self.statement_observers!r}, telemetry={self.telemetry!r}, "
-            f"redaction={self.redaction!r}, logging={self.logging!r}, sampling={self.sampling!r}, cloud_formatter={self.cloud_formatter!r})"
+            f"redaction={self.redaction!r}, logging={self.logging!r}, sampling={self.sampling!r}, cloud_formatter={self.cloud_formatter!r}, "
+            f"pool_metrics={self.pool_metrics!r})"
         )
 
     def __eq__(self, other: object) -> bool:
@@ -292,6 +299,7 @@ class ObservabilityConfig:
             and self.logging == other.logging
             and self.sampling == other.sampling
             and self.cloud_formatter == other.cloud_formatter
+            and self.pool_metrics == other.pool_metrics
         )
 
 
@@ -0,0 +1,332 @@
+"""Connection pool metrics shared by every pooled configuration."""
+
+import threading
+import weakref
+from bisect import bisect_left
+from types import MethodType
+from typing import TYPE_CHECKING, Any, Final
+
+from typing_extensions import TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+__all__ = (
+    "DEFAULT_ACQUIRE_WAIT_BUCKETS",
+    "DEFAULT_CONNECTION_AGE_BUCKETS",
+    "DEFAULT_CONNECTION_CREATE_BUCKETS",
+    "PoolGauges",
+    "PoolHistogram",
+    "PoolHistogramSnapshot",
+    "PoolMetrics",
+    "PoolMetricsSnapshot",
+    "get_pool_metrics",
+    "is_pool_timeout",
+    "pool_metrics_for",
+    "reset_pool_metrics",
+)
+
+
+DEFAULT_ACQUIRE_WAIT_BUCKETS: Final[tuple[float, ...]] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_CONNECTION_CREATE_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_CONNECTION_AGE_BUCKETS: Final[tuple[float, ...]] = (
+    1.0,
+    10.0,
+    60.0,
+    300.0,
+    900.0,
+    1800.0,
+    3600.0,
+    14400.0,
+    86400.0,
+)
+
+
+class PoolGauges(TypedDict):
+    """Point-in-time pool occupancy read from the pool implementation."""
+
+    size: int
+    checked_out: int
+    idle: int
+    max_size: "int | None"
+
+
+class PoolHistogramSnapshot(TypedDict):
+    """Cumulative histogram counts keyed by upper bucket bound."""
+
+    buckets: "list[tuple[float, int]]"
+    count: int
+    sum: float
+
+
+class PoolMetricsSnapshot(TypedDict):
+    """Pool metrics for one configuration."""
+
+    config: str
+    bind_key: "str | None"
+    acquires: int
+    acquire_timeouts: int
+    connections_created: int
+    connections_closed: int
+    acquire_wait: PoolHistogramSnapshot
+    connection_create: PoolHistogramSnapshot
+    connection_age: PoolHistogramSnapshot
+    gauges: "PoolGauges | None"
+
+
+class PoolHistogram:
+    """Fixed-bucket histogram with Prometheus ``le`` semantics."""
+
+    __slots__ = ("bounds", "count", "counts", "total")
+
+    def __init__(self, bounds: "tuple[float, ...]") -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> PoolHistogramSnapshot:
+        """Return cumulative bucket counts, ending with the ``+Inf`` bucket."""
+        cumulative: list[tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip((*self.bounds, float("inf")), self.counts, strict=True):
+            running += bucket_count
+            cumulative.append((bound, running))
+        return {"buckets": cumulative, "count": self.count, "sum": self.total}
+
+
+class PoolMetrics:
+    """Acquire-wait, connection churn and occupancy metrics for one pool.
+
+    Histograms and counters are updated by the config acquire path and by the
+    sqlspec-managed pools. Occupancy gauges are pulled from the pool through
+    the gauge source only when a snapshot is taken, so the acquire path pays
+    for one lock and one bucket lookup.
+    """
+
+    __slots__ = (
+        "_gauge_source",
+        "_lock",
+        "acquire_timeouts",
+        "acquire_wait",
+        "acquires",
+        "bind_key",
+        "config_name",
+        "connection_age",
+        "connection_create",
+        "connections_closed",
+        "connections_created",
+    )
+
+    def __init__(
+        self,
+        config_name: str,
+        *,
+        bind_key: "str | None" = None,
+        acquire_wait_buckets: "tuple[float, ...]" = DEFAULT_ACQUIRE_WAIT_BUCKETS,
+        connection_create_buckets: "tuple[float, ...]" = DEFAULT_CONNECTION_CREATE_BUCKETS,
+        connection_age_buckets: "tuple[float, ...]" = DEFAULT_CONNECTION_AGE_BUCKETS,
+    ) -> None:
+        self.config_name = config_name
+        self.bind_key = bind_key
+        self.acquire_wait = PoolHistogram(acquire_wait_buckets)
+        self.connection_create = PoolHistogram(connection_create_buckets)
+        self.connection_age = PoolHistogram(connection_age_buckets)
+        self.acquires = 0
+        self.acquire_timeouts = 0
+        self.connections_created = 0
+        self.connections_closed = 0
+        self._gauge_source: Callable[[], PoolGauges | None] | None = None
+        self._lock = threading.Lock()
+
+    def observe_acquire(self, wait_s: float) -> None:
+        """Record a successful acquire and the time spent waiting for it."""
+        with self._lock:
+            self.acquires += 1
+            self.acquire_wait.observe(wait_s)
+
+    def observe_acquire_timeout(self, wait_s: float) -> None:
+        """Record an acquire that gave up waiting for a connection."""
+        with self._lock:
+            self.acquire_timeouts += 1
+            self.acquire_wait.observe(wait_s)
+
+    def observe_connection_created(self, latency_s: float) -> None:
+        """Record a new physical connection and how long it took to open."""
+        with self._lock:
+            self.connections_created += 1
+            self.connection_create.observe(latency_s)
+
+    def observe_connection_closed(self, age_s: float) -> None:
+        """Record a physical connection leaving the pool and its lifetime."""
+        with self._lock:
+            self.connections_closed += 1
+            self.connection_age.observe(age_s)
+
+    def set_gauge_source(self, source: "Callable[[], PoolGauges | None] | None") -> None:
+        """Register the callable that reports live pool occupancy.
+
+        Bound methods are held weakly so published metrics never keep their config alive.
+        """
+        self._gauge_source = _weak_gauge_source(source) if isinstance(source, MethodType) else source
+
+    def gauges(self) -> "PoolGauges | None":
+        """Return live pool occupancy, or None when the pool is not available."""
+        source = self._gauge_source
+        if source is None:
+            return None
+        try:
+            return source()
+        except Exception:
+            return None
+
+    def snapshot(self) -> PoolMetricsSnapshot:
+        """Return a consistent copy of all counters, histograms and gauges."""
+        gauges = self.gauges()
+        with self._lock:
+            return {
+                "config": self.config_name,
+                "bind_key": self.bind_key,
+                "acquires": self.acquires,
+                "acquire_timeouts": self.acquire_timeouts,
+                "connections_created": self.connections_created,
+                "connections_closed": self.connections_closed,
+                "acquire_wait": self.acquire_wait.snapshot(),
+                "connection_create": self.connection_create.snapshot(),
+                "connection_age": self.connection_age.snapshot(),
+                "gauges": gauges,
+            }
+
+    def flat_snapshot(self) -> "dict[str, float]":
+        """Return the metrics as flat ``pool.*`` keys for diagnostics payloads."""
+        snapshot = self.snapshot()
+        acquire_wait = snapshot["acquire_wait"]
+        connection_create = snapshot["connection_create"]
+        connection_age = snapshot["connection_age"]
+        metrics: dict[str, float] = {
+            "pool.acquires": float(snapshot["acquires"]),
+            "pool.acquire_timeouts": float(snapshot["acquire_timeouts"]),
+            "pool.acquire_wait_seconds.sum": acquire_wait["sum"],
+            "pool.connections_created": float(snapshot["connections_created"]),
+            "pool.connections_closed": float(snapshot["connections_closed"]),
+            "pool.connection_create_seconds.sum": connection_create["sum"],
+            "pool.connection_age_seconds.sum": connection_age["sum"],
+        }
+        gauges = snapshot["gauges"]
+        if gauges is not None:
+            metrics["pool.size"] = float(gauges["size"])
+            metrics["pool.checked_out"] = float(gauges["checked_out"])
+            metrics["pool.idle"] = float(gauges["idle"])
+            max_size = gauges["max_size"]
+            if max_size:
+                metrics["pool.max_size"] = float(max_size)
+                metrics["pool.utilization"] = gauges["checked_out"] / max_size
+        return metrics
+
+
+def _weak_gauge_source(source: Any) -> "Callable[[], PoolGauges | None]":
+    method_ref = weakref.WeakMethod(source)
+
+    def read() -> "PoolGauges | None":
+        method = method_ref()
+        return None if method is None else method()
+
+    return read
+
+
+_POOL_METRICS: "dict[object, PoolMetrics]" = {}
+_POOL_METRICS_LOCK = threading.Lock()
+
+
+def _forget_pool_metrics(key: object) -> None:
+    with _POOL_METRICS_LOCK:
+        _POOL_METRICS.pop(key, None)
+
+
+def _unique_config_label(config_name: str, bind_key: "str | None") -> str:
+    """Return ``config_name``, numbered when another published pool already uses it with ``bind_key``."""
+    taken = {metrics.config_name for metrics in _POOL_METRICS.values() if metrics.bind_key == bind_key}
+    label = config_name
+    number = 1
+    while label in taken:
+        number += 1
+        label = f"{config_name}#{number}"
+    return label
+
+
+def pool_metrics_for(config_name: str, bind_key: "str | None" = None, *, owner: Any = None) -> PoolMetrics:
+    """Return the published pool metrics for a configuration, creating them on first use.
+
+    With ``owner`` (the database config instance) the metrics belong to that
+    instance: runtimes rebuilt for it (for example when ``SQLSpec.add_config``
+    merges registry observability settings) keep feeding the same counters,
+    another config of the same class and bind key gets its own, and they are
+    dropped once the owner is garbage collected. Without ``owner`` they are
+    shared per name and bind key. When the name and bind key are already
+    published, the ``config`` label is numbered (``SqliteConfig#2``) so
+    exporters such as the Prometheus collector never repeat a label set.
+    """
+    key: object = (config_name, bind_key) if owner is None else id(owner)
+    with _POOL_METRICS_LOCK:
+        metrics = _POOL_METRICS.get(key)
+        if metrics is None:
+            metrics = PoolMetrics(_unique_config_label(config_name, bind_key), bind_key=bind_key)
+            _POOL_METRICS[key] = metrics
+            if owner is not None:
+                weakref.finalize(owner, _forget_pool_metrics, key)
+        return metrics
+
+
+def get_pool_metrics() -> "tuple[PoolMetrics, ...]":
+    """Return every published pool metrics instance."""
+    with _POOL_METRICS_LOCK:
+        return tuple(_POOL_METRICS.values())
+
+
+def reset_pool_metrics() -> None:
+    """Forget all published pool metrics."""
+    with _POOL_METRICS_LOCK:
+        _POOL_METRICS.clear()
+
+
+def is_pool_timeout(error: BaseException) -> bool:
+    """Return True when an acquire failure means the pool ran out of time waiting for a connection.
+
+    Pools raise different types (``asyncio.TimeoutError``, ``psycopg_pool.PoolTimeout``,
+    ``AiosqliteConnectTimeoutError``), so the class name is checked as well.
+    """
+    return isinstance(error, TimeoutError) or "Timeout" in type(error).__name__
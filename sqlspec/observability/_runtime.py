@@ -7,12 +7,13 @@ from sqlspec.observability._common import compute_sql_hash, get_trace_context, r
 from sqlspec.observability._config import LoggingConfig, ObservabilityConfig, StatementObserver
 from sqlspec.observability._dispatcher import LifecycleDispatcher, LifecycleHook
 from sqlspec.observability._observer import create_event, create_statement_observer
+from sqlspec.observability._pool import PoolMetrics, pool_metrics_for
 from sqlspec.observability._spans import SpanManager
 from sqlspec.utils.correlation import CorrelationContext
 from sqlspec.utils.type_guards import has_span_attribute
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from sqlspec.storage import StorageTelemetry
 
@@ -28,12 +29,14 @@ class ObservabilityRuntime:
     __slots__ = (
         "_is_idle_cached",
         "_metrics",
+        "_outcome_listeners",
         "_redaction",
         "_statement_observers",
         "bind_key",
         "config",
         "config_name",
         "lifecycle",
+        "pool_metrics",
         "span_manager",
     )
 
@@ -41,7 +44,12 @@ class ObservabilityRuntime:
     span_manager: "Any"
 
     def __init__(
-        self, config: ObservabilityConfig | None = None, *, bind_key: str | None = None, config_name: str | None = None
+        self,
+        config: ObservabilityConfig | None = None,
+        *,
+        bind_key: str | None = None,
+        config_name: str | None = None,
+        owner: Any = None,
     ) -> None:
         config = config.copy() if config else ObservabilityConfig()
         if config.logging is None:
@@ -60,6 +68,12 @@ class ObservabilityRuntime:
         self._statement_observers = tuple(observers)
         self._redaction = config.redaction.copy() if config.redaction else None
         self._metrics: dict[str, float] = {}
+        self._outcome_listeners: tuple[
+            Callable[[ObservabilityRuntime, str, BaseException | None, float | None], None], ...
+        ] = ()
+        self.pool_metrics: PoolMetrics | None = (
+            pool_metrics_for(self.config_name, bind_key, owner=owner) if config.pool_metrics else None
+        )
         # Pre-compute the non-span idle state (lifecycle and observers are immutable)
         # span_manager can be replaced for testing so we check it separately
         self._is_idle_cached = not self.lifecycle.is_enabled and not self._statement_observers
@@ -112,12 +126,16 @@ class ObservabilityRuntime:
         return self.lifecycle.snapshot(prefix=self.diagnostics_key)
 
     def metrics_snapshot(self) -> dict[str, float]:
-        """Return accumulated custom metrics with diagnostics prefix."""
+        """Return accumulated custom metrics and pool metrics with diagnostics prefix."""
 
-        if not self._metrics:
+        pool_metrics = self.pool_metrics
+        if not self._metrics and pool_metrics is None:
             return {}
         prefix = self.diagnostics_key
-        return {f"{prefix}.{name}": value for name, value in self._metrics.items()}
+        snapshot = {f"{prefix}.{name}": value for name, value in self._metrics.items()}
+        if pool_metrics is not None:
+            snapshot.update({f"{prefix}.{name}": value for name, value in pool_metrics.flat_snapshot().items()})
+        return snapshot
 
     def increment_metric(self, name: str, amount: float = 1.0) -> None:
         """Increment a custom metric counter."""
@@ -129,6 +147,23 @@ class ObservabilityRuntime:
 
         self._metrics[name] = value
 
+    def add_outcome_listener(
+        self, listener: "Callable[[ObservabilityRuntime, str, BaseException | None, float | None], None]"
+    ) -> None:
+        """Subscribe ``listener`` to outcomes passed to ``record_outcome``."""
+
+        self._outcome_listeners = (*self._outcome_listeners, listener)
+
+    def record_outcome(self, kind: str, error: "BaseException | None", duration_s: "float | None") -> None:
+        """Publish the outcome of a statement (``"statement"``) or pool acquire (``"acquire"``).
+
+        Listeners such as the config's circuit breaker receive the runtime, the
+        outcome kind, the error (``None`` on success) and the duration when known.
+        """
+
+        for listener in self._outcome_listeners:
+            listener(self, kind, error, duration_s)
+
     def start_migration_span(
         self, event: str, *, version: "str | None" = None, metadata: "dict[str, Any] | None" = None
     ) -> Any:
@@ -491,6 +526,20 @@ class ObservabilityRuntime:
             self._attach_storage_telemetry(span, telemetry)
         self.span_manager.end_span(span, error=error)
 
+    def record_storage_progress(self, rows: int, bytes_written: int) -> None:
+        """Count rows and bytes as a streaming storage write makes progress."""
+
+        self.increment_metric("storage.write.rows", float(rows))
+        self.increment_metric("storage.write.bytes", float(bytes_written))
+
+    def record_storage_file_read(self, telemetry: "StorageTelemetry") -> None:
+        """Count one object read by a multi-file storage load and annotate its telemetry."""
+
+        self.increment_metric("storage.read.files")
+        self.increment_metric("storage.read.rows", float(telemetry.get("rows_processed", 0)))
+        self.increment_metric("storage.read.bytes", float(telemetry.get("bytes_processed", 0)))
+        self.annotate_storage_telemetry(telemetry)
+
     def annotate_storage_telemetry(self, telemetry: "StorageTelemetry") -> "StorageTelemetry":
         """Add bind key / config / correlation metadata to telemetry payloads."""
 
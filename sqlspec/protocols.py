@@ -39,6 +39,7 @@ __all__ = (
     "AsyncReadBytesProtocol",
     "AsyncReadableProtocol",
     "AsyncWriteBytesProtocol",
+    "AsyncWriteStreamProtocol",
     "CursorMetadataProtocol",
     "DictProtocol",
     "HasAddListenerProtocol",
@@ -74,10 +75,12 @@ __all__ = (
     "HasValueProtocol",
     "HasWhereProtocol",
     "MappingLikeProtocol",
+    "MemoryMapProtocol",
     "NotificationProtocol",
     "ObjectStoreProtocol",
     "PipelineCapableProtocol",
     "QueryResultProtocol",
+    "ReadStreamProtocol",
     "ReadableProtocol",
     "SQLBuilderProtocol",
     "SpanAttributeProtocol",
@@ -90,6 +93,7 @@ __all__ = (
     "SupportsJsonTypeProtocol",
     "SyncDataDictionaryProtocol",
     "WithMethodProtocol",
+    "WriteStreamProtocol",
 )
 
 
@@ -347,6 +351,37 @@ class AsyncDeleteProtocol(Protocol):
     async def delete_async(self, path: "str | Path", **kwargs: Any) -> None: ...
 
 
+@runtime_checkable
+class ReadStreamProtocol(Protocol):
+    """Protocol for backends that open seekable streaming object readers."""
+
+    def open_read_stream_sync(self, path: "str | Path", **kwargs: Any) -> Any: ...
+
+
+@runtime_checkable
+class MemoryMapProtocol(Protocol):
+    """Protocol for backends that can memory-map objects stored on the local filesystem."""
+
+    @property
+    def supports_memory_map(self) -> bool: ...
+
+    def open_memory_map_sync(self, path: "str | Path", **kwargs: Any) -> Any: ...
+
+
+@runtime_checkable
+class WriteStreamProtocol(Protocol):
+    """Protocol for backends that open streaming object writers."""
+
+    def open_write_stream_sync(self, path: "str | Path", **kwargs: Any) -> Any: ...
+
+
+@runtime_checkable
+class AsyncWriteStreamProtocol(Protocol):
+    """Protocol for backends that open async streaming object writers."""
+
+    async def open_write_stream_async(self, path: "str | Path", **kwargs: Any) -> Any: ...
+
+
 @runtime_checkable
 class StatementProtocol(Protocol):
     """Protocol for statement attribute access."""
@@ -548,7 +583,12 @@ class ObjectStoreProtocol(Protocol):
         raise NotImplementedError(msg)
 
     def stream_arrow_sync(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        **kwargs: Any,
     ) -> "Iterator[ArrowRecordBatch]":
         """Stream Arrow record batches from matching objects synchronously."""
         msg = "Arrow streaming not implemented"
@@ -559,6 +599,16 @@ class ObjectStoreProtocol(Protocol):
         msg = "Stream reading not implemented"
         raise NotImplementedError(msg)
 
+    def open_read_stream_sync(self, path: "str | Path", **kwargs: Any) -> Any:
+        """Open a seekable binary reader (``read``/``seek``/``tell``/``close``) over an object."""
+        msg = "Stream reading not implemented"
+        raise NotImplementedError(msg)
+
+    def open_write_stream_sync(self, path: "str | Path", **kwargs: Any) -> Any:
+        """Open a binary writer (``write``/``close``) that streams into an object synchronously."""
+        msg = "Stream writing not implemented"
+        raise NotImplementedError(msg)
+
     async def read_bytes_async(self, path: "str | Path", **kwargs: Any) -> bytes:
         """Async read bytes from an object."""
         msg = "Async operations not implemented"
@@ -586,6 +636,11 @@ class ObjectStoreProtocol(Protocol):
         msg = "Async stream reading not implemented"
         raise NotImplementedError(msg)
 
+    async def open_write_stream_async(self, path: "str | Path", **kwargs: Any) -> Any:
+        """Open an async binary writer (awaitable ``write``/``close``) that streams into an object."""
+        msg = "Async stream writing not implemented"
+        raise NotImplementedError(msg)
+
     async def exists_async(self, path: "str | Path", **kwargs: Any) -> bool:
         """Async check if an object exists."""
         msg = "Async operations not implemented"
@@ -628,7 +683,12 @@ class ObjectStoreProtocol(Protocol):
 
     # NOTE: Returns AsyncIterator directly; this is intentionally not async def.
     def stream_arrow_async(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        **kwargs: Any,
     ) -> "AsyncIterator[ArrowRecordBatch]":
         """Stream Arrow record batches from matching objects."""
         msg = "Async arrow streaming not implemented"
@@ -836,6 +896,7 @@ class SupportsArrowResults(Protocol):
         /,
         *parameters: Any,
         statement_config: Any | None = None,
+        timeout: float | None = None,
         return_format: str = "table",
         native_only: bool = False,
         batch_size: int | None = None,
@@ -848,6 +909,7 @@ class SupportsArrowResults(Protocol):
             statement: SQL statement to execute.
             *parameters: Query parameters and filters.
             statement_config: Optional statement configuration override.
+            timeout: Optional statement timeout in seconds.
             return_format: Output format - "table", "reader", or "batches".
             native_only: If True, raise error when native Arrow path unavailable.
             batch_size: Chunk size for streaming modes.
@@ -1,18 +1,20 @@
 """Service base classes for SQLSpec application services."""
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Generic, Literal, cast, overload
 
 from mypy_extensions import mypyc_attr
 from typing_extensions import TypeVar
 
 from sqlspec.core import OffsetPagination
-from sqlspec.core.filters import LimitOffsetFilter
+from sqlspec.core.filters import InAnyFilter, InCollectionFilter, LimitOffsetFilter
 from sqlspec.driver._async import AsyncDriverAdapterBase
 from sqlspec.driver._sync import SyncDriverAdapterBase
 from sqlspec.exceptions import NotFoundError
 from sqlspec.typing import SchemaT
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
     from types import TracebackType
 
     from sqlspec.builder import QueryBuilder
@@ -21,11 +23,188 @@ if TYPE_CHECKING:
     from sqlspec.typing import StatementParameters
 
 
-__all__ = ("SQLSpecAsyncService", "SQLSpecSyncService")
+__all__ = ("BatchLoader", "SQLSpecAsyncService", "SQLSpecSyncService")
 
 AsyncDriverT = TypeVar("AsyncDriverT", bound=AsyncDriverAdapterBase, default=AsyncDriverAdapterBase)
 SyncDriverT = TypeVar("SyncDriverT", bound=SyncDriverAdapterBase, default=SyncDriverAdapterBase)
 
+DEFAULT_BATCH_SIZE = 500
+
+
+def _loader_cache_part(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return value
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class BatchLoader:
+    """Coalesce per-key lookups issued in the same event-loop tick into one query.
+
+    Keys requested through :meth:`load` are collected until the current tick ends
+    (or ``window`` seconds pass) and resolved with a single ``select`` that
+    appends ``filter_type(key_column, keys)`` to ``statement``. Rows are fanned
+    back out by ``result_key`` and cached for the lifetime of the loader, so a
+    loader created per request gives request-scoped caching.
+
+    Batches run one at a time because they share the session connection. Loaders
+    that share a session must also share ``lock`` so their queries never overlap;
+    :meth:`SQLSpecAsyncService.batch_loader` hands every loader the service's lock.
+
+    Args:
+        session: Async driver session used to run the batched query.
+        statement: Base SQL statement or QueryBuilder without the key predicate.
+        *parameters: Additional statement parameters or filters.
+        key_column: Column matched against the requested keys.
+        result_key: Row key holding the lookup key. Defaults to the unqualified ``key_column``.
+        schema_type: Optional schema type applied to each row.
+        many: Resolve each key to a list of rows instead of a single row or ``None``.
+        max_batch_size: Maximum keys per query; larger batches are split.
+        window: Seconds to wait for more keys before dispatching. ``0`` dispatches
+            at the end of the current event-loop tick.
+        filter_type: Collection filter used for the rewrite, such as
+            :class:`~sqlspec.core.filters.AnyCollectionFilter` on PostgreSQL.
+        lock: Lock serializing queries on ``session``. Defaults to a lock owned by this loader.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_handle",
+        "_lock",
+        "_pending",
+        "_tasks",
+        "filter_type",
+        "key_column",
+        "many",
+        "max_batch_size",
+        "parameters",
+        "result_key",
+        "schema_type",
+        "session",
+        "statement",
+        "window",
+    )
+
+    def __init__(
+        self,
+        session: "AsyncDriverAdapterBase",
+        statement: "Statement | QueryBuilder",
+        /,
+        *parameters: "StatementParameters | StatementFilter",
+        key_column: str,
+        result_key: "str | None" = None,
+        schema_type: "type[Any] | None" = None,
+        many: bool = False,
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+        window: float = 0.0,
+        filter_type: "type[InAnyFilter[Any]]" = InCollectionFilter,
+        lock: "asyncio.Lock | None" = None,
+    ) -> None:
+        if max_batch_size < 1:
+            msg = "BatchLoader max_batch_size must be at least 1"
+            raise ValueError(msg)
+        self.session = session
+        self.statement = statement
+        self.parameters = parameters
+        self.key_column = key_column
+        self.result_key = result_key or key_column.rsplit(".", 1)[-1]
+        self.schema_type = schema_type
+        self.many = many
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.filter_type = filter_type
+        self._cache: dict[Any, asyncio.Future[Any]] = {}
+        self._pending: list[tuple[Any, asyncio.Future[Any]]] = []
+        self._handle: asyncio.Handle | None = None
+        self._lock = lock if lock is not None else asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: Any) -> Any:
+        """Return the row (or rows when ``many``) for ``key``, batching concurrent calls."""
+        future = self._cache.get(key)
+        if future is None:
+            future = self._enqueue(key)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: "Iterable[Any]") -> "list[Any]":
+        """Return results for ``keys`` in order, resolved with as few queries as possible."""
+        futures = [self._cache.get(key) or self._enqueue(key) for key in keys]
+        return [await asyncio.shield(future) for future in futures]
+
+    def prime(self, key: Any, value: Any) -> None:
+        """Seed the cache for ``key`` unless it is already cached."""
+        if key in self._cache:
+            return
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._cache[key] = future
+
+    def clear(self, key: "Hashable | None" = None) -> None:
+        """Drop ``key`` (or every key) from the cache so the next load queries again."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _enqueue(self, key: Any) -> "asyncio.Future[Any]":
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._cache[key] = future
+        self._pending.append((key, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._handle is None:
+            if self.window > 0:
+                self._handle = loop.call_later(self.window, self._dispatch)
+            else:
+                self._handle = loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        handle = self._handle
+        if handle is not None:
+            handle.cancel()
+            self._handle = None
+        batch = self._pending
+        if not batch:
+            return
+        self._pending = []
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: "list[tuple[Any, asyncio.Future[Any]]]") -> None:
+        keys = [key for key, _ in batch]
+        try:
+            async with self._lock:
+                rows = await self.session.select(
+                    self.statement, *self.parameters, self.filter_type(self.key_column, keys)
+                )
+        except Exception as exc:
+            for key, future in batch:
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        grouped: dict[Any, list[Any]] = {}
+        result_key = self.result_key
+        for row in rows:
+            grouped.setdefault(row[result_key], []).append(row)
+        schema_type = self.schema_type
+        for key, future in batch:
+            if future.done():
+                continue
+            matches = grouped.get(key, [])
+            if schema_type is not None:
+                matches = self.session.to_schema(matches, schema_type=schema_type)
+            if self.many:
+                future.set_result(matches)
+            else:
+                future.set_result(matches[0] if matches else None)
+
 
 @mypyc_attr(allow_interpreted_subclasses=True)
 class SQLSpecAsyncService(Generic[AsyncDriverT]):
@@ -37,10 +216,12 @@ class SQLSpecAsyncService(Generic[AsyncDriverT]):
         session: The driver session instance.
     """
 
-    __slots__ = ("_session",)
+    __slots__ = ("_batch_loader_lock", "_batch_loaders", "_session")
 
     def __init__(self, session: AsyncDriverT) -> None:
         self._session = session
+        self._batch_loaders: dict[tuple[Any, ...], BatchLoader] = {}
+        self._batch_loader_lock = asyncio.Lock()
 
     @property
     def session(self) -> AsyncDriverT:
@@ -202,6 +383,74 @@ class SQLSpecAsyncService(Generic[AsyncDriverT]):
         """
         return await self._session.select_one_or_none(statement, *parameters, **kwargs) is not None
 
+    def batch_loader(
+        self,
+        statement: "Statement | QueryBuilder",
+        /,
+        *parameters: "StatementParameters | StatementFilter",
+        key_column: str,
+        result_key: "str | None" = None,
+        schema_type: "type[Any] | None" = None,
+        many: bool = False,
+        max_batch_size: int = DEFAULT_BATCH_SIZE,
+        window: float = 0.0,
+        filter_type: "type[InAnyFilter[Any]]" = InCollectionFilter,
+    ) -> BatchLoader:
+        """Return the service's :class:`BatchLoader` for a keyed lookup, creating it on first use.
+
+        Loaders are cached for the lifetime of the service, so a service created
+        per request gives request-scoped caching. The cache is cleared on
+        ``commit`` and ``rollback``. Every loader shares the service's lock, so
+        batches from different loaders take turns on the session connection.
+
+        Args:
+            statement: Base SQL statement or QueryBuilder without the key predicate.
+            *parameters: Additional statement parameters or filters.
+            key_column: Column matched against the requested keys.
+            result_key: Row key holding the lookup key.
+            schema_type: Optional schema type applied to each row.
+            many: Resolve each key to a list of rows.
+            max_batch_size: Maximum keys per query.
+            window: Seconds to wait for more keys before dispatching.
+            filter_type: Collection filter used for the rewrite.
+
+        Returns:
+            The batch loader bound to this service's session.
+        """
+        cache_key = (
+            _loader_cache_part(statement),
+            tuple(_loader_cache_part(parameter) for parameter in parameters),
+            key_column,
+            result_key,
+            schema_type,
+            many,
+            max_batch_size,
+            window,
+            filter_type,
+        )
+        loader = self._batch_loaders.get(cache_key)
+        if loader is None:
+            loader = BatchLoader(
+                self._session,
+                statement,
+                *parameters,
+                key_column=key_column,
+                result_key=result_key,
+                schema_type=schema_type,
+                many=many,
+                max_batch_size=max_batch_size,
+                window=window,
+                filter_type=filter_type,
+                lock=self._batch_loader_lock,
+            )
+            self._batch_loaders[cache_key] = loader
+        return loader
+
+    def clear_batch_loaders(self) -> None:
+        """Clear the cache of every batch loader created by this service."""
+        for loader in self._batch_loaders.values():
+            loader.clear()
+
     async def begin(self) -> None:
         """Begin a database transaction on the underlying session."""
         await self._session.begin()
@@ -209,10 +458,12 @@ class SQLSpecAsyncService(Generic[AsyncDriverT]):
     async def commit(self) -> None:
         """Commit the current database transaction."""
         await self._session.commit()
+        self.clear_batch_loaders()
 
     async def rollback(self) -> None:
         """Roll back the current database transaction."""
         await self._session.rollback()
+        self.clear_batch_loaders()
 
     def begin_transaction(self) -> "_AsyncBeginTransactionContext[AsyncDriverT]":
         """Context manager that commits on success and rolls back on error.
@@ -8,9 +8,18 @@ Provides a storage system with:
     - Capability-based backend selection
 """
 
-from sqlspec.storage._paths import resolve_storage_path
+from sqlspec.storage._paths import is_multi_source, resolve_storage_path
+from sqlspec.storage.multi_source import (
+    AsyncMultiSourceReader,
+    MultiSourceOptions,
+    SyncMultiSourceReader,
+    parse_multi_source_options,
+)
+from sqlspec.storage.partitioning import AsyncPartitionedWriter, PartitionSpec, SyncPartitionedWriter, parse_partitioner
 from sqlspec.storage.pipeline import (
     AsyncStoragePipeline,
+    AsyncStorageReader,
+    AsyncStorageWriter,
     PartitionStrategyConfig,
     StagedArtifact,
     StorageBridgeJob,
@@ -20,6 +29,8 @@ from sqlspec.storage.pipeline import (
     StorageLoadRequest,
     StorageTelemetry,
     SyncStoragePipeline,
+    SyncStorageReader,
+    SyncStorageWriter,
     create_storage_bridge_job,
     get_storage_bridge_diagnostics,
     get_storage_bridge_metrics,
@@ -28,7 +39,13 @@ from sqlspec.storage.pipeline import (
 from sqlspec.storage.registry import StorageRegistry, storage_registry
 
 __all__ = (
+    "AsyncMultiSourceReader",
+    "AsyncPartitionedWriter",
     "AsyncStoragePipeline",
+    "AsyncStorageReader",
+    "AsyncStorageWriter",
+    "MultiSourceOptions",
+    "PartitionSpec",
     "PartitionStrategyConfig",
     "StagedArtifact",
     "StorageBridgeJob",
@@ -38,10 +55,17 @@ __all__ = (
     "StorageLoadRequest",
     "StorageRegistry",
     "StorageTelemetry",
+    "SyncMultiSourceReader",
+    "SyncPartitionedWriter",
     "SyncStoragePipeline",
+    "SyncStorageReader",
+    "SyncStorageWriter",
     "create_storage_bridge_job",
     "get_storage_bridge_diagnostics",
     "get_storage_bridge_metrics",
+    "is_multi_source",
+    "parse_multi_source_options",
+    "parse_partitioner",
     "reset_storage_bridge_metrics",
     "resolve_storage_path",
     "storage_registry",
@@ -1,19 +1,57 @@
 """Interpreted PyArrow payload helpers for storage pipelines."""
 
+import io
+import itertools
 from typing import TYPE_CHECKING, Any, Literal, cast
 
-from sqlspec.storage._utils import import_pyarrow, import_pyarrow_csv, import_pyarrow_json, import_pyarrow_parquet
+from sqlspec.storage._utils import (
+    import_pyarrow,
+    import_pyarrow_compute,
+    import_pyarrow_csv,
+    import_pyarrow_dataset,
+    import_pyarrow_json,
+    import_pyarrow_parquet,
+)
+from sqlspec.utils.arrow_helpers import ArrowSchemaSettler, convert_dict_to_arrow_with_schema
 from sqlspec.utils.serializers import from_json
 
 if TYPE_CHECKING:
-    from sqlspec.typing import ArrowTable
+    from collections.abc import Iterator, Sequence
 
-__all__ = ("decode_arrow_payload", "encode_arrow_payload")
+    from sqlspec.typing import ArrowRecordBatch, ArrowTable
 
+__all__ = (
+    "IPC_FORMATS",
+    "MEMORY_MAP_FORMATS",
+    "ArrowBatchDecoder",
+    "ArrowBatchEncoder",
+    "decode_arrow_payload",
+    "drop_arrow_columns",
+    "encode_arrow_payload",
+    "ipc_write_options",
+    "iter_arrow_file_batches",
+    "iter_fragment_batches",
+    "normalize_arrow_filter",
+    "open_mapped_batch_reader",
+    "open_memory_map",
+    "parquet_read_options",
+    "parquet_row_group_fragments",
+    "project_arrow_schema",
+    "rows_to_record_batch",
+    "split_batch_by_columns",
+)
 
-StorageFormat = Literal["jsonl", "json", "parquet", "arrow-ipc", "csv"]
+
+StorageFormat = Literal["jsonl", "json", "parquet", "arrow-ipc", "arrow-stream", "csv"]
 
 _PYARROW_JSON_BLOCK_SIZE = 1 << 20
+_DEFAULT_DECODE_BATCH_SIZE = 65_536
+_PUSHDOWN_FORMATS = frozenset({"parquet", "arrow-ipc"})
+_BLOCK_FORMATS = frozenset({"csv", "jsonl"})
+IPC_FORMATS = frozenset({"arrow-ipc", "arrow-stream"})
+MEMORY_MAP_FORMATS = frozenset({"parquet", "arrow-ipc", "arrow-stream"})
+_IPC_COMPRESSION_CODECS = frozenset({"lz4", "zstd"})
+_IPC_FILE_MAGIC = b"ARROW1"
 
 
 def encode_arrow_payload(
@@ -27,8 +65,8 @@ def encode_arrow_payload(
 
     pa = import_pyarrow()
     sink = pa.BufferOutputStream()
-    if format_choice == "arrow-ipc":
-        writer = pa.ipc.new_file(sink, table.schema)
+    if format_choice in IPC_FORMATS:
+        writer = _new_ipc_writer(sink, table.schema, format_choice, compression)
         writer.write_table(table)
         writer.close()
     elif format_choice == "csv":
@@ -45,6 +83,176 @@ def encode_arrow_payload(
     return result_bytes
 
 
+def ipc_write_options(compression: "str | None") -> Any:
+    """Build ``pyarrow.ipc.IpcWriteOptions`` for optional LZ4/ZSTD buffer compression.
+
+    Raises:
+        ValueError: If ``compression`` is not ``"lz4"`` or ``"zstd"``.
+    """
+    pa = import_pyarrow()
+    if compression is None:
+        return pa.ipc.IpcWriteOptions()
+    codec = compression.lower()
+    if codec not in _IPC_COMPRESSION_CODECS:
+        msg = f"Arrow IPC compression must be 'lz4' or 'zstd'; received {compression!r}"
+        raise ValueError(msg)
+    return pa.ipc.IpcWriteOptions(compression=codec)
+
+
+def _new_ipc_writer(sink: Any, schema: Any, format_choice: StorageFormat, compression: "str | None") -> Any:
+    pa = import_pyarrow()
+    options = ipc_write_options(compression)
+    if format_choice == "arrow-stream":
+        return pa.ipc.new_stream(sink, schema, options=options)
+    return pa.ipc.new_file(sink, schema, options=options)
+
+
+def _has_ipc_file_magic(source: Any) -> bool:
+    """Return whether a seekable source starts with the Arrow IPC file magic."""
+    start = source.tell()
+    magic = bytes(source.read(len(_IPC_FILE_MAGIC)))
+    source.seek(start)
+    return magic == _IPC_FILE_MAGIC
+
+
+def _open_ipc_reader(source: Any, format_choice: StorageFormat) -> Any:
+    """Open an IPC reader, accepting stream-format payloads stored as ``arrow-ipc``."""
+    pa = import_pyarrow()
+    if format_choice == "arrow-ipc" and _has_ipc_file_magic(source):
+        return pa.ipc.open_file(source)
+    return pa.ipc.open_stream(source)
+
+
+def _ipc_reader_batches(ipc_reader: Any) -> "Iterator[ArrowRecordBatch]":
+    """Yield batches from an IPC file (random access) or stream reader.
+
+    Yields:
+        Record batches in file order.
+    """
+    if hasattr(ipc_reader, "num_record_batches"):
+        for index in range(ipc_reader.num_record_batches):
+            yield ipc_reader.get_batch(index)
+    else:
+        yield from ipc_reader
+
+
+def _slice_batches(batches: "Iterator[ArrowRecordBatch]", batch_size: int) -> "Iterator[ArrowRecordBatch]":
+    """Split oversized batches into zero-copy slices of at most ``batch_size`` rows.
+
+    Yields:
+        Record batches no longer than ``batch_size``.
+    """
+    for batch in batches:
+        if batch.num_rows <= batch_size:
+            yield batch
+            continue
+        for offset in range(0, batch.num_rows, batch_size):
+            yield batch.slice(offset, batch_size)
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only sink whose accumulated bytes are handed off after every batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._buffer.extend(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        payload = bytes(self._buffer)
+        self._buffer.clear()
+        return payload
+
+
+class ArrowBatchEncoder:
+    """Incrementally encode record batches into Parquet, Arrow IPC (file or stream), or CSV.
+
+    Every ``encode`` call returns the bytes produced so far, so callers can
+    forward them to a storage stream while only a bounded number of batches is
+    held in memory. The output schema is fixed by ``schema`` or, when omitted,
+    settled from the incoming batches by :class:`ArrowSchemaSettler`: batches
+    are held back (``encode`` returns ``b""``) while a column has only seen
+    ``NULL`` values, and later batches are cast to the settled schema.
+    ``compression`` is the Parquet codec, or ``"lz4"``/``"zstd"`` buffer
+    compression for Arrow IPC.
+    """
+
+    __slots__ = ("_compression", "_format", "_settler", "_sink", "_write_options", "_writer")
+
+    def __init__(
+        self,
+        format_choice: StorageFormat,
+        *,
+        schema: Any = None,
+        compression: str | None = None,
+        write_options: "dict[str, Any] | None" = None,
+    ) -> None:
+        self._format = format_choice
+        self._settler = ArrowSchemaSettler(schema)
+        self._compression = compression
+        self._write_options = write_options
+        self._sink = _DrainableSink()
+        self._writer: Any = None
+
+    @property
+    def schema(self) -> Any:
+        """Return the output schema once known."""
+        return self._settler.schema
+
+    def _open(self, schema: Any) -> None:
+        if self._format in IPC_FORMATS:
+            self._writer = _new_ipc_writer(self._sink, schema, self._format, self._compression)
+        elif self._format == "csv":
+            pa_csv = import_pyarrow_csv()
+            csv_opts = pa_csv.WriteOptions(**self._write_options) if self._write_options else None
+            self._writer = pa_csv.CSVWriter(self._sink, schema, write_options=csv_opts)
+        else:
+            pq = import_pyarrow_parquet()
+            self._writer = pq.ParquetWriter(self._sink, schema, compression=self._compression)
+
+    def _write(self, batch: "ArrowRecordBatch") -> bytes:
+        if self._writer is None:
+            self._open(batch.schema)
+        self._writer.write_batch(batch)
+        return self._sink.drain()
+
+    def encode(self, batch: "ArrowRecordBatch") -> bytes:
+        """Encode one record batch and return the bytes it released."""
+        return b"".join(self._write(ready) for ready in self._settler.push(batch))
+
+    def encode_rows(self, rows: "list[dict[str, Any]]") -> bytes:
+        """Convert one chunk of dict rows to Arrow and encode it."""
+        if not rows:
+            return b""
+        schema = self._settler.schema
+        if schema is None:
+            table = import_pyarrow().Table.from_pylist(rows)
+        else:
+            table = cast("ArrowTable", convert_dict_to_arrow_with_schema(rows, arrow_schema=schema))
+        return b"".join(self.encode(batch) for batch in table.to_batches())
+
+    def finish(self) -> bytes:
+        """Flush held-back batches and footers and return the trailing bytes.
+
+        An encoder that never saw a batch still emits a valid empty file using
+        the configured schema (or an empty schema).
+        """
+        tail = b"".join(self._write(ready) for ready in self._settler.flush())
+        if self._writer is None:
+            schema = self._settler.schema
+            if schema is None:
+                schema = import_pyarrow().schema([])
+            self._open(schema)
+        self._writer.close()
+        return tail + self._sink.drain()
+
+
 def decode_arrow_payload(payload: bytes, format_choice: StorageFormat) -> "ArrowTable":
     """Decode bytes into an Arrow table using optional PyArrow dependencies."""
 
@@ -52,8 +260,8 @@ def decode_arrow_payload(payload: bytes, format_choice: StorageFormat) -> "Arrow
     if format_choice == "parquet":
         pq = import_pyarrow_parquet()
         return cast("ArrowTable", pq.read_table(pa.BufferReader(payload)))
-    if format_choice == "arrow-ipc":
-        reader = pa.ipc.open_file(pa.BufferReader(payload))
+    if format_choice in IPC_FORMATS:
+        reader = _open_ipc_reader(pa.BufferReader(payload), format_choice)
         return cast("ArrowTable", reader.read_all())
     if format_choice == "csv":
         pa_csv = import_pyarrow_csv()
@@ -70,3 +278,465 @@ def decode_arrow_payload(payload: bytes, format_choice: StorageFormat) -> "Arrow
         return cast("ArrowTable", pa_json.read_json(pa.BufferReader(payload), read_options=read_options))
     msg = f"Unsupported storage format for Arrow decoding: {format_choice}"
     raise ValueError(msg)
+
+
+def normalize_arrow_filter(filter: Any) -> Any:
+    """Return a row filter as a PyArrow dataset expression.
+
+    Accepts ``None``, a ``pyarrow.compute.Expression``, or the DNF tuples taken by
+    ``pyarrow.parquet.read_table(filters=...)`` -- a single ``(column, op, value)``
+    tuple, a list of them (AND), or a list of such lists (OR of ANDs).
+
+    Raises:
+        TypeError: If ``filter`` is neither an expression nor DNF tuples.
+    """
+    if filter is None:
+        return None
+    ds = import_pyarrow_dataset()
+    if isinstance(filter, ds.Expression):
+        return filter
+    if isinstance(filter, tuple) and filter and isinstance(filter[0], str):
+        return import_pyarrow_parquet().filters_to_expression([filter])
+    if isinstance(filter, (list, tuple)) and filter:
+        return import_pyarrow_parquet().filters_to_expression(list(filter))
+    msg = f"filter must be a pyarrow.compute.Expression or DNF filter tuples; received {type(filter).__name__}"
+    raise TypeError(msg)
+
+
+def project_arrow_schema(schema: Any, columns: "Sequence[str] | None") -> Any:
+    """Return ``schema`` narrowed to ``columns`` in the requested order.
+
+    Raises:
+        ValueError: If a requested column is not present in ``schema``.
+    """
+    if columns is None:
+        return schema
+    missing = [name for name in columns if name not in schema.names]
+    if missing:
+        msg = f"Columns not found in storage object: {', '.join(missing)}"
+        raise ValueError(msg)
+    pa = import_pyarrow()
+    return pa.schema([schema.field(name) for name in columns])
+
+
+def parquet_read_options(
+    columns: "Sequence[str] | None", filter: Any, options: "dict[str, Any] | None" = None
+) -> "dict[str, Any]":
+    """Merge projection and row-filter pushdown into ``pyarrow.parquet.read_table`` options."""
+    merged = dict(options or {})
+    if columns is not None:
+        merged["columns"] = list(columns)
+    if filter is not None:
+        merged["filters"] = normalize_arrow_filter(filter)
+    return merged
+
+
+def parquet_row_group_fragments(source: Any, filter: Any = None) -> "tuple[Any, list[Any]]":
+    """Open a Parquet object as one dataset fragment per row group.
+
+    Row groups whose column statistics cannot satisfy ``filter`` are dropped
+    here, so their pages are never fetched. ``source`` is a local path (read
+    through a memory map) or a seekable file handle.
+
+    Returns:
+        The file's Arrow schema and the surviving row-group fragments.
+    """
+    ds = import_pyarrow_dataset()
+    parquet_format = ds.ParquetFileFormat()
+    if isinstance(source, str):
+        filesystem = import_pyarrow().fs.LocalFileSystem(use_mmap=True)
+        fragment = parquet_format.make_fragment(source, filesystem=filesystem)
+    else:
+        fragment = parquet_format.make_fragment(source)
+    return fragment.physical_schema, cast("list[Any]", fragment.split_by_row_group(normalize_arrow_filter(filter)))
+
+
+def iter_fragment_batches(
+    fragments: "list[Any]", *, batch_size: int, columns: "Sequence[str] | None" = None, filter: Any = None
+) -> "Iterator[ArrowRecordBatch]":
+    """Scan fragments one at a time with projection and filter pushdown.
+
+    Yields:
+        Record batches of at most ``batch_size`` rows.
+    """
+    expression = normalize_arrow_filter(filter)
+    projection = None if columns is None else list(columns)
+    for fragment in fragments:
+        yield from fragment.to_batches(filter=expression, columns=projection, batch_size=batch_size)
+
+
+def open_memory_map(path: str) -> Any:
+    """Memory-map a local file read-only.
+
+    Arrow IPC batches read from the map reference its pages instead of heap
+    copies, and the mapping stays alive for as long as any such batch does.
+    """
+    return import_pyarrow().memory_map(path, "r")
+
+
+def open_mapped_batch_reader(
+    path: str,
+    format_choice: StorageFormat,
+    *,
+    batch_size: "int | None" = None,
+    columns: "Sequence[str] | None" = None,
+    filter: Any = None,
+) -> Any:
+    """Open a ``pyarrow.RecordBatchReader`` over a memory-mapped local file.
+
+    Arrow IPC batches (Feather v2 or stream format) are zero-copy views of the
+    mapped file; Parquet pages are decoded from the map without an intermediate
+    read buffer.
+
+    Raises:
+        ValueError: If ``format_choice`` cannot be read from a memory map.
+    """
+    if format_choice not in MEMORY_MAP_FORMATS:
+        msg = f"Memory-mapped reads support parquet, arrow-ipc, and arrow-stream, not {format_choice}"
+        raise ValueError(msg)
+    decoder = ArrowBatchDecoder(
+        open_memory_map(path), format_choice, batch_size=batch_size, columns=columns, filter=filter
+    )
+    return import_pyarrow().RecordBatchReader.from_batches(decoder.schema, _drain_decoder(decoder))
+
+
+def iter_arrow_file_batches(
+    handle: Any,
+    format_choice: StorageFormat,
+    *,
+    batch_size: int,
+    columns: "Sequence[str] | None" = None,
+    filter: Any = None,
+) -> "Iterator[ArrowRecordBatch]":
+    """Decode one storage object from ``handle`` batch by batch, closing it afterwards.
+
+    Yields:
+        Record batches of at most ``batch_size`` rows.
+    """
+    yield from _drain_decoder(
+        ArrowBatchDecoder(handle, format_choice, batch_size=batch_size, columns=columns, filter=filter)
+    )
+
+
+def _drain_decoder(decoder: "ArrowBatchDecoder") -> "Iterator[ArrowRecordBatch]":
+    """Yield every batch from ``decoder`` and close it afterwards.
+
+    Yields:
+        Decoded record batches.
+    """
+    try:
+        while (batch := decoder.read_next_batch()) is not None:
+            yield batch
+    finally:
+        decoder.close()
+
+
+class _CountingReader(io.RawIOBase):
+    """Seekable raw reader over a backend file handle that counts bytes read.
+
+    Backend handles (local files, fsspec files, obstore ``ReadableFile``) expose
+    ``read``/``seek``/``tell`` but not always the full ``io`` interface PyArrow
+    expects, so they are normalized here.
+    """
+
+    def __init__(self, handle: Any) -> None:
+        super().__init__()
+        self._handle = handle
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._handle.read(len(buffer))
+        size = len(data)
+        memoryview(buffer)[:size] = data
+        self.bytes_read += size
+        return size
+
+    def read(self, size: "int | None" = -1) -> bytes:
+        data = bytes(self._handle.read() if size is None or size < 0 else self._handle.read(size))
+        self.bytes_read += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return int(self._handle.seek(offset, whence))
+
+    def tell(self) -> int:
+        return int(self._handle.tell())
+
+    def close(self) -> None:
+        if not self.closed:
+            self._handle.close()
+        super().close()
+
+
+class ArrowBatchDecoder:
+    """Decode a storage object into record batches straight from a file handle.
+
+    Parquet is read one row group at a time, Arrow IPC (file or stream format)
+    one batch at a time, and CSV / JSON Lines block by block, so only the
+    current batch is resident. JSON arrays cannot be split and are decoded in
+    one pass. CSV and JSON Lines open their block reader lazily: PyArrow infers
+    their column types from the first block, so ``read_all`` on an untouched
+    decoder decodes the whole object in one pass instead, which infers types
+    from every row.
+
+    ``columns`` and ``filter`` are pushed into PyArrow's dataset scanner for
+    Parquet and Arrow IPC: only the projected (and filtered-on) column chunks
+    are read, and Parquet row groups whose statistics rule out ``filter`` are
+    skipped without being fetched from the backend. CSV and JSON have no
+    column layout to skip, so they are filtered and projected per batch.
+
+    A ``pyarrow.NativeFile`` handle (such as a memory map) is read directly.
+    Batches decoded from a memory-mapped IPC file are views of the map, and
+    ``bytes_read`` then counts the Arrow buffer bytes handed out.
+    """
+
+    __slots__ = ("_batches", "_deferred", "_mapped_bytes", "_native", "_reader", "_schema")
+
+    def __init__(
+        self,
+        handle: Any,
+        format_choice: StorageFormat,
+        *,
+        batch_size: "int | None" = None,
+        columns: "Sequence[str] | None" = None,
+        filter: Any = None,
+    ) -> None:
+        self._native = isinstance(handle, import_pyarrow().NativeFile)
+        self._reader: Any = handle if self._native else _CountingReader(handle)
+        self._mapped_bytes = 0
+        self._schema: Any = None
+        self._batches: Any = iter(())
+        self._deferred: tuple[StorageFormat, int, Sequence[str] | None, Any] | None = None
+        try:
+            self._open(format_choice, batch_size or _DEFAULT_DECODE_BATCH_SIZE, columns, normalize_arrow_filter(filter))
+        except Exception:
+            self._reader.close()
+            raise
+
+    @property
+    def schema(self) -> Any:
+        """Return the Arrow schema of the decoded (projected) batches."""
+        if self._deferred is not None:
+            self._open_blocks()
+        return self._schema
+
+    @property
+    def bytes_read(self) -> int:
+        """Return the number of bytes pulled from the backend handle."""
+        if self._native:
+            return self._mapped_bytes
+        return int(self._reader.bytes_read)
+
+    def _open(
+        self, format_choice: StorageFormat, batch_size: int, columns: "Sequence[str] | None", expression: Any
+    ) -> None:
+        pushdown = columns is not None or expression is not None
+        if (
+            pushdown
+            and format_choice in _PUSHDOWN_FORMATS
+            and (format_choice == "parquet" or _has_ipc_file_magic(self._reader))
+        ):
+            self._open_fragments(format_choice, batch_size, columns, expression)
+            return
+        if format_choice in _BLOCK_FORMATS:
+            self._deferred = (format_choice, batch_size, columns, expression)
+            return
+        self._open_stream(format_choice, batch_size)
+        self._apply_pushdown(columns, expression)
+
+    def _apply_pushdown(self, columns: "Sequence[str] | None", expression: Any) -> None:
+        if (columns is not None or expression is not None) and self._schema.names:
+            self._schema = project_arrow_schema(self._schema, columns)
+            self._batches = _filter_batches(self._batches, columns, expression)
+
+    def _open_stream(self, format_choice: StorageFormat, batch_size: int) -> None:
+        pa = import_pyarrow()
+        reader = self._reader
+        if format_choice == "parquet":
+            pq = import_pyarrow_parquet()
+            parquet_file = pq.ParquetFile(reader)
+            self._schema = parquet_file.schema_arrow
+            self._batches = parquet_file.iter_batches(batch_size=batch_size)
+        elif format_choice in IPC_FORMATS:
+            ipc_reader = _open_ipc_reader(reader, format_choice)
+            self._schema = ipc_reader.schema
+            self._batches = _slice_batches(_ipc_reader_batches(ipc_reader), batch_size)
+        elif format_choice == "csv":
+            csv_reader = import_pyarrow_csv().open_csv(reader)
+            self._schema = csv_reader.schema
+            self._batches = iter(csv_reader)
+        elif format_choice == "jsonl":
+            if reader.seek(0, io.SEEK_END) == 0:
+                self._schema = pa.schema([])
+                return
+            reader.seek(0)
+            pa_json = import_pyarrow_json()
+            read_options = pa_json.ReadOptions(block_size=_PYARROW_JSON_BLOCK_SIZE)
+            json_reader = pa_json.open_json(reader, read_options=read_options)
+            self._schema = json_reader.schema
+            self._batches = iter(json_reader)
+        elif format_choice == "json":
+            table = decode_arrow_payload(reader.read(), "json")
+            self._schema = table.schema
+            self._batches = iter(table.to_batches(max_chunksize=batch_size))
+        else:
+            msg = f"Unsupported storage format for Arrow decoding: {format_choice}"
+            raise ValueError(msg)
+
+    def _open_blocks(self) -> None:
+        """Open the block-by-block CSV / JSON Lines reader deferred by ``_open``."""
+        deferred = self._deferred
+        if deferred is None:
+            return
+        self._deferred = None
+        format_choice, batch_size, columns, expression = deferred
+        self._open_stream(format_choice, batch_size)
+        self._apply_pushdown(columns, expression)
+
+    def _decode_whole(self) -> "ArrowTable":
+        """Decode a deferred CSV / JSON Lines object in one pass, as ``decode_arrow_payload`` does."""
+        deferred = self._deferred
+        self._deferred = None
+        format_choice, _, columns, expression = cast("tuple[StorageFormat, int, Sequence[str] | None, Any]", deferred)
+        table = decode_arrow_payload(bytes(self._reader.read()), format_choice)
+        if (columns is not None or expression is not None) and table.schema.names:
+            project_arrow_schema(table.schema, columns)
+            if expression is not None:
+                table = table.filter(expression)
+            if columns is not None:
+                table = table.select(list(columns))
+        self._schema = table.schema
+        return table
+
+    def _open_fragments(
+        self, format_choice: StorageFormat, batch_size: int, columns: "Sequence[str] | None", expression: Any
+    ) -> None:
+        reader = self._reader
+        if format_choice == "parquet":
+            physical_schema, fragments = parquet_row_group_fragments(reader, expression)
+        else:
+            fragments = [import_pyarrow_dataset().IpcFileFormat().make_fragment(reader)]
+            physical_schema = fragments[0].physical_schema
+        self._schema = project_arrow_schema(physical_schema, columns)
+        self._batches = iter_fragment_batches(fragments, batch_size=batch_size, columns=columns, filter=expression)
+
+    def read_next_batch(self) -> "ArrowRecordBatch | None":
+        """Return the next decoded batch, or None once the object is exhausted."""
+        if self._deferred is not None:
+            self._open_blocks()
+        batch = next(self._batches, None)
+        if batch is not None and self._native:
+            self._mapped_bytes += int(batch.nbytes)
+        return cast("ArrowRecordBatch | None", batch)
+
+    def read_all(self) -> "ArrowTable":
+        """Decode the remaining batches into a table."""
+        pa = import_pyarrow()
+        if self._deferred is not None:
+            table = self._decode_whole()
+        else:
+            table = pa.Table.from_batches(list(self._batches), schema=self._schema)
+        if self._native:
+            self._mapped_bytes += int(table.nbytes)
+        return cast("ArrowTable", table)
+
+    def close(self) -> None:
+        """Release the underlying backend handle."""
+        self._reader.close()
+
+
+def _filter_batches(
+    batches: "Iterator[ArrowRecordBatch]", columns: "Sequence[str] | None", expression: Any
+) -> "Iterator[ArrowRecordBatch]":
+    """Apply a filter and projection to batches decoded from a row-oriented format.
+
+    Yields:
+        Filtered, projected record batches.
+    """
+    projection = None if columns is None else list(columns)
+    for batch in batches:
+        filtered = batch if expression is None else batch.filter(expression)
+        yield filtered if projection is None else filtered.select(projection)
+
+
+def rows_to_record_batch(rows: "list[dict[str, Any]]", schema: Any = None) -> "ArrowRecordBatch":
+    """Convert dictionary rows to a single record batch, honoring ``schema`` when given.
+
+    Without ``schema``, columns that are ``NULL`` in every row keep the Arrow
+    ``null`` type so an :class:`ArrowSchemaSettler` can type them later.
+    """
+    if schema is None:
+        table = import_pyarrow().Table.from_pylist(rows)
+    else:
+        table = cast("ArrowTable", convert_dict_to_arrow_with_schema(rows, arrow_schema=schema))
+    return cast("ArrowRecordBatch", table.combine_chunks().to_batches()[0])
+
+
+def drop_arrow_columns(schema: Any, columns: "tuple[str, ...]") -> Any:
+    """Return ``schema`` without ``columns``."""
+    pa = import_pyarrow()
+    return pa.schema([field for field in schema if field.name not in columns])
+
+
+def split_batch_by_columns(
+    batch: "ArrowRecordBatch", columns: "tuple[str, ...]"
+) -> "list[tuple[tuple[Any, ...], ArrowRecordBatch]]":
+    """Group a record batch by the values of ``columns``.
+
+    Returns one ``(key, batch)`` pair per distinct key, in first-seen order.
+    The key columns are dropped from the returned batches, matching Hive-style
+    layouts where the values live in the directory names. Grouping runs in
+    ``pyarrow.compute``: each key column is dictionary-encoded, the codes are
+    combined and re-encoded in first-seen order, and one stable sort plus one
+    ``take`` lays the groups out as zero-copy slices.
+    """
+    pa = import_pyarrow()
+    pc = import_pyarrow_compute()
+    missing = [name for name in columns if name not in batch.schema.names]
+    if missing:
+        msg = f"Partition columns not found in result: {', '.join(missing)}"
+        raise ValueError(msg)
+    keep = [name for name in batch.schema.names if name not in columns]
+    payload = batch.select(keep)
+    if int(batch.num_rows) == 0:
+        return []
+    codes: Any = None
+    for name in columns:
+        column_codes, cardinality = _dictionary_codes(batch.column(name))
+        codes = column_codes if codes is None else pc.add(pc.multiply(codes, cardinality), column_codes)
+    group_codes = pc.dictionary_encode(codes).indices
+    counts = pc.value_counts(group_codes).field("counts").to_pylist()
+    if len(counts) == 1:
+        return [(tuple(batch.column(name)[0].as_py() for name in columns), payload)]
+    order = pc.sort_indices(group_codes)
+    offsets = [0, *itertools.accumulate(counts)]
+    first_rows = order.take(pa.array(offsets[:-1], type=pa.int64()))
+    keys = list(zip(*(batch.column(name).take(first_rows).to_pylist() for name in columns), strict=True))
+    grouped = payload.take(order)
+    return [(key, grouped.slice(offset, count)) for key, offset, count in zip(keys, offsets, counts, strict=False)]
+
+
+def _dictionary_codes(column: Any) -> "tuple[Any, int]":
+    """Return first-seen dictionary codes (``int64``, NULL encoded as a value) and their cardinality."""
+    pa = import_pyarrow()
+    pc = import_pyarrow_compute()
+    if pa.types.is_null(column.type):
+        return pc.fill_null(pa.nulls(len(column), pa.int64()), 0), 1
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    encoded = pc.dictionary_encode(column, null_encoding="encode")
+    return encoded.indices.cast(pa.int64()), len(encoded.dictionary)
+
+
+def batches_to_table(batches: "list[ArrowRecordBatch]") -> "ArrowTable":
+    """Combine record batches into one table, casting later batches to the first schema."""
+    pa = import_pyarrow()
+    schema = batches[0].schema
+    aligned = [batch if batch.schema.equals(schema) else batch.cast(schema) for batch in batches]
+    return cast("ArrowTable", pa.Table.from_batches(aligned, schema=schema))
@@ -1,4 +1,4 @@
-"""Shared helpers for bounded Parquet batch streaming."""
+"""Shared helpers for bounded Parquet and Arrow IPC batch streaming."""
 
 from pathlib import PurePath
 from typing import TYPE_CHECKING, Any
@@ -10,15 +10,19 @@ if TYPE_CHECKING:
 
     from sqlspec.typing import ArrowRecordBatch
 
-__all__ = ("iter_parquet_row_groups", "validate_parquet_stream_options")
+__all__ = ("iter_parquet_row_groups", "validate_arrow_stream_options")
 
-_NON_PARQUET_SUFFIXES = frozenset({".arrow", ".csv", ".feather", ".ipc", ".json", ".jsonl", ".ndjson"})
+_STREAM_FORMATS = frozenset({"parquet", "arrow-ipc", "arrow-stream"})
+
+_NON_PARQUET_SUFFIXES = frozenset({".arrow", ".arrows", ".csv", ".feather", ".ipc", ".json", ".jsonl", ".ndjson"})
+
+_NON_IPC_SUFFIXES = frozenset({".csv", ".json", ".jsonl", ".ndjson", ".parquet", ".pq"})
 
 _STREAM_REMEDIATION = "Read this format with the Arrow read APIs instead of batch streaming."
 
 
-def validate_parquet_stream_options(pattern: str, file_format: str, batch_size: int) -> None:
-    """Validate a Parquet streaming request before storage is accessed.
+def validate_arrow_stream_options(pattern: str, file_format: str, batch_size: int) -> None:
+    """Validate a Parquet or Arrow IPC streaming request before storage is accessed.
 
     Args:
         pattern: Glob pattern selecting objects to stream.
@@ -26,19 +30,23 @@ def validate_parquet_stream_options(pattern: str, file_format: str, batch_size:
         batch_size: Maximum number of rows in each yielded record batch.
 
     Raises:
-        StorageCapabilityError: If a non-Parquet format is requested.
+        StorageCapabilityError: If the format cannot be streamed, or the pattern selects another format.
         ValueError: If ``batch_size`` is not greater than zero.
     """
-    if file_format != "parquet":
-        msg = f"Arrow batch streaming supports only Parquet files; received file_format={file_format!r}"
+    if file_format not in _STREAM_FORMATS:
+        msg = f"Arrow batch streaming supports only Parquet and Arrow IPC files; received file_format={file_format!r}"
         raise StorageCapabilityError(msg, capability="arrow_batch_streaming", remediation=_STREAM_REMEDIATION)
     if batch_size <= 0:
         msg = f"batch_size must be greater than zero; received {batch_size}"
         raise ValueError(msg)
 
     suffix = PurePath(pattern).suffix.lower()
-    if suffix in _NON_PARQUET_SUFFIXES:
-        msg = f"Arrow batch streaming supports only Parquet files; pattern {pattern!r} selects {suffix} files"
+    rejected = _NON_PARQUET_SUFFIXES if file_format == "parquet" else _NON_IPC_SUFFIXES
+    if suffix in rejected:
+        msg = (
+            f"Arrow batch streaming supports only Parquet and Arrow IPC files matching file_format={file_format!r}; "
+            f"pattern {pattern!r} selects {suffix} files"
+        )
         raise StorageCapabilityError(msg, capability="arrow_batch_streaming", remediation=_STREAM_REMEDIATION)
 
 
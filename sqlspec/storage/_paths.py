@@ -1,19 +1,25 @@
 """Pure storage path helpers safe for mypyc compilation."""
 
+import re
 from pathlib import Path
 from typing import Final
 
 __all__ = (
     "FILE_PROTOCOL",
     "FILE_SCHEME_PREFIX",
+    "compile_source_pattern",
     "is_file_destination",
+    "is_multi_source",
     "resolve_storage_path",
+    "split_multi_source",
     "strip_windows_drive_prefix",
 )
 
 
 FILE_PROTOCOL: Final[str] = "file"
 FILE_SCHEME_PREFIX: Final[str] = "file://"
+_GLOB_CHARACTERS: Final[str] = "*?["
+_QUERY_SCHEMES: Final[frozenset[str]] = frozenset({"http", "https"})
 
 
 def strip_windows_drive_prefix(path: str) -> str:
@@ -85,3 +91,98 @@ def resolve_storage_path(
     clean_base = base_path.rstrip("/")
     clean_path = path_str.lstrip("/")
     return f"{clean_base}/{clean_path}"
+
+
+def _glob_span(source: str) -> "tuple[int, int]":
+    """Return the ``[start, end)`` span of ``source`` that may hold glob characters.
+
+    Only the path component is globbed. A URI's scheme and authority are
+    skipped (``[`` opens an IPv6 host there), and for HTTP(S) URLs the query
+    string and fragment are excluded, so presigned URLs stay single objects.
+    """
+    end = len(source)
+    scheme_end = source.find("://")
+    if scheme_end < 0:
+        return 0, end
+    authority_start = scheme_end + 3
+    if source[:scheme_end].lower() in _QUERY_SCHEMES:
+        for marker in "?#":
+            index = source.find(marker, authority_start)
+            if 0 <= index < end:
+                end = index
+    path_start = source.find("/", authority_start, end)
+    return (end, end) if path_start < 0 else (path_start, end)
+
+
+def is_multi_source(source: "str | Path") -> bool:
+    """Return True when a storage source names many objects.
+
+    Sources whose path component contains glob characters (``*``, ``?``,
+    ``[``) or ends with a separator (a prefix) expand to every matching object.
+    """
+    source_str = source.as_posix() if isinstance(source, Path) else str(source)
+    start, end = _glob_span(source_str)
+    path = source_str[start:end]
+    if path.endswith("/"):
+        return True
+    return any(character in path for character in _GLOB_CHARACTERS)
+
+
+def split_multi_source(source: "str | Path") -> "tuple[str, str]":
+    """Split a glob or prefix source into its literal prefix and the pattern below it.
+
+    ``s3://bucket/events/*/part-*.parquet`` becomes ``("s3://bucket/events/", "*/part-*.parquet")``;
+    a bare prefix such as ``/data/events/`` returns an empty pattern.
+    """
+    source_str = source.as_posix() if isinstance(source, Path) else str(source)
+    start, end = _glob_span(source_str)
+    first_glob = min(
+        (index for index in (source_str.find(character, start, end) for character in _GLOB_CHARACTERS) if index >= 0),
+        default=-1,
+    )
+    if first_glob < 0:
+        return source_str, ""
+    split_at = source_str.rfind("/", 0, first_glob) + 1
+    return source_str[:split_at], source_str[split_at:]
+
+
+def compile_source_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob pattern relative to a source prefix.
+
+    ``*`` and ``?`` never cross ``/``; ``**`` matches any number of directories.
+    An empty pattern matches every object under the prefix.
+    """
+    if not pattern:
+        return re.compile(r".+")
+    parts: list[str] = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        character = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if character == "*":
+            parts.append("[^/]*")
+        elif character == "?":
+            parts.append("[^/]")
+        elif character == "[":
+            closing = pattern.find("]", index + 1)
+            if closing < 0:
+                parts.append(re.escape(character))
+            else:
+                body = pattern[index + 1 : closing]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                index = closing + 1
+                continue
+        else:
+            parts.append(re.escape(character))
+        index += 1
+    return re.compile("".join(parts))
@@ -9,7 +9,9 @@ from sqlspec.utils.module_loader import ensure_pyarrow
 __all__ = (
     "_log_storage_event",
     "import_pyarrow",
+    "import_pyarrow_compute",
     "import_pyarrow_csv",
+    "import_pyarrow_dataset",
     "import_pyarrow_json",
     "import_pyarrow_parquet",
 )
@@ -43,6 +45,19 @@ def import_pyarrow_parquet() -> "Any":
     return pq
 
 
+def import_pyarrow_compute() -> "Any":
+    """Import PyArrow compute module with optional dependency guard.
+
+    Returns:
+        PyArrow compute module.
+    """
+
+    ensure_pyarrow()
+    import pyarrow.compute as pc
+
+    return pc
+
+
 def import_pyarrow_csv() -> "Any":
     """Import PyArrow CSV module with optional dependency guard.
 
@@ -56,6 +71,19 @@ def import_pyarrow_csv() -> "Any":
     return pa_csv
 
 
+def import_pyarrow_dataset() -> "Any":
+    """Import PyArrow dataset module with optional dependency guard.
+
+    Returns:
+        PyArrow dataset module.
+    """
+
+    ensure_pyarrow()
+    import pyarrow.dataset as ds
+
+    return ds
+
+
 def import_pyarrow_json() -> "Any":
     """Import PyArrow JSON module with optional dependency guard.
 
@@ -17,7 +17,13 @@ if TYPE_CHECKING:
 
     from sqlspec.typing import ArrowRecordBatch, ArrowTable
 
-__all__ = ("AsyncArrowBatchIterator", "AsyncObStoreStreamIterator", "AsyncThreadedBytesIterator", "ObjectStoreBase")
+__all__ = (
+    "AsyncArrowBatchIterator",
+    "AsyncObStoreStreamIterator",
+    "AsyncThreadedBytesIterator",
+    "AsyncThreadedBytesWriter",
+    "ObjectStoreBase",
+)
 
 
 _StopAsyncBase = getattr(builtins, "Stop" + "Async" + "Iteration")
@@ -158,6 +164,30 @@ class AsyncThreadedBytesIterator:
         return asyncio.get_running_loop().run_in_executor(None, self._sync_read)
 
 
+class AsyncThreadedBytesWriter:
+    """Async writer that forwards chunks to a synchronous file-like object in a thread pool."""
+
+    __slots__ = ("_closed", "_file_obj")
+
+    def __init__(self, file_obj: Any) -> None:
+        self._file_obj = file_obj
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def write(self, data: bytes) -> int:
+        written = await asyncio.get_running_loop().run_in_executor(None, self._file_obj.write, data)
+        return len(data) if written is None else int(written)
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.get_running_loop().run_in_executor(None, self._file_obj.close)
+
+
 @mypyc_attr(allow_interpreted_subclasses=True)
 class ObjectStoreBase:
     """Base class for storage backends.
@@ -255,7 +285,12 @@ class ObjectStoreBase:
 
     @abstractmethod
     def stream_arrow_sync(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        **kwargs: Any,
     ) -> "Iterator[ArrowRecordBatch]":
         """Stream Arrow record batches from storage synchronously."""
         raise NotImplementedError
@@ -330,7 +365,12 @@ class ObjectStoreBase:
     # NOTE: Returns AsyncIterator directly; keep in sync with ObjectStoreProtocol.
     @abstractmethod
     def stream_arrow_async(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        **kwargs: Any,
     ) -> "AsyncIterator[ArrowRecordBatch]":
         """Stream Arrow record batches from storage asynchronously."""
         raise NotImplementedError
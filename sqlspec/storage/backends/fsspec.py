@@ -8,10 +8,18 @@ from urllib.parse import urlparse
 
 from mypy_extensions import mypyc_attr
 
-from sqlspec.storage._arrow_stream import iter_parquet_row_groups, validate_parquet_stream_options
+from sqlspec.exceptions import StorageCapabilityError
+from sqlspec.storage._arrow_payload import (
+    iter_arrow_file_batches,
+    iter_fragment_batches,
+    open_memory_map,
+    parquet_read_options,
+    parquet_row_group_fragments,
+)
+from sqlspec.storage._arrow_stream import iter_parquet_row_groups, validate_arrow_stream_options
 from sqlspec.storage._paths import resolve_storage_path
 from sqlspec.storage._utils import _log_storage_event, import_pyarrow_parquet
-from sqlspec.storage.backends.base import AsyncArrowBatchIterator, AsyncThreadedBytesIterator
+from sqlspec.storage.backends.base import AsyncArrowBatchIterator, AsyncThreadedBytesIterator, AsyncThreadedBytesWriter
 from sqlspec.storage.errors import execute_sync_storage_operation
 from sqlspec.utils.module_loader import ensure_fsspec
 from sqlspec.utils.sync_tools import async_
@@ -173,6 +181,51 @@ class FSSpecBackend:
             path=resolved_path,
         )
 
+    def open_read_stream_sync(self, path: str | Path, **kwargs: Any) -> Any:
+        """Open a seekable binary reader; remote filesystems fetch byte ranges on demand."""
+        resolved_path = self._resolve_path(path)
+        return execute_sync_storage_operation(
+            partial(self.fs.open, resolved_path, mode="rb", **kwargs),
+            backend=self.backend_type,
+            operation="open_read",
+            path=resolved_path,
+        )
+
+    @property
+    def supports_memory_map(self) -> bool:
+        """Whether objects can be memory-mapped, which requires the ``file`` protocol."""
+        return self.protocol == "file"
+
+    def open_memory_map_sync(self, path: str | Path, **kwargs: Any) -> Any:
+        """Memory-map a local file read-only as a ``pyarrow.MemoryMappedFile``.
+
+        Raises:
+            StorageCapabilityError: If the filesystem is not local.
+        """
+        if self.protocol != "file":
+            msg = f"Memory-mapped reads require the local filesystem, not {self.protocol!r}"
+            raise StorageCapabilityError(msg, capability="memory_map")
+        local_path = self.resolve_uri(path)
+        return execute_sync_storage_operation(
+            partial(open_memory_map, local_path), backend=self.backend_type, operation="open_read", path=local_path
+        )
+
+    def open_write_stream_sync(self, path: str | Path, **kwargs: Any) -> Any:
+        """Open a binary writer on the filesystem; remote filesystems upload in blocks as data arrives."""
+        resolved_path = self._resolve_path(path)
+
+        if self.protocol == "file":
+            parent_dir = str(Path(resolved_path).parent)
+            if parent_dir and not self.fs.exists(parent_dir):
+                self.fs.makedirs(parent_dir, exist_ok=True)
+
+        return execute_sync_storage_operation(
+            partial(self.fs.open, resolved_path, mode="wb", **kwargs),
+            backend=self.backend_type,
+            operation="open_write",
+            path=resolved_path,
+        )
+
     def read_text_sync(self, path: str | Path, encoding: str = "utf-8", **kwargs: Any) -> str:
         """Read text from an object synchronously."""
         data = self.read_bytes_sync(path, **kwargs)
@@ -251,15 +304,22 @@ class FSSpecBackend:
             destination_path=dest_path,
         )
 
-    def read_arrow_sync(self, path: str | Path, **kwargs: Any) -> "ArrowTable":
-        """Read an Arrow table from storage synchronously."""
+    def read_arrow_sync(
+        self, path: str | Path, *, columns: "list[str] | None" = None, filter: Any = None, **kwargs: Any
+    ) -> "ArrowTable":
+        """Read an Arrow table from storage synchronously.
+
+        ``columns`` and ``filter`` are pushed into the Parquet reader, so only the
+        needed column chunks of matching row groups are fetched.
+        """
         pq = import_pyarrow_parquet()
 
         resolved_path = self._resolve_path(path)
+        read_options = parquet_read_options(columns, filter)
         result = cast(
             "ArrowTable",
             execute_sync_storage_operation(
-                partial(self._read_parquet_table, resolved_path, pq, kwargs),
+                partial(self._read_parquet_table, resolved_path, pq, kwargs, read_options),
                 backend=self.backend_type,
                 operation="read_arrow",
                 path=resolved_path,
@@ -294,9 +354,11 @@ class FSSpecBackend:
             path=resolved_path,
         )
 
-    def _read_parquet_table(self, resolved_path: str, pq: Any, options: "dict[str, Any]") -> Any:
+    def _read_parquet_table(
+        self, resolved_path: str, pq: Any, options: "dict[str, Any]", read_options: "dict[str, Any]"
+    ) -> Any:
         with self.fs.open(resolved_path, mode="rb", **options) as file_obj:
-            return pq.read_table(file_obj)
+            return pq.read_table(file_obj, **read_options)
 
     def list_objects_sync(self, prefix: str = "", recursive: bool = True, **kwargs: Any) -> "list[str]":
         """List objects with optional prefix synchronously."""
@@ -413,20 +475,30 @@ class FSSpecBackend:
                 yield cast("bytes", chunk)
 
     def stream_arrow_sync(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+        **kwargs: Any,
     ) -> Iterator["ArrowRecordBatch"]:
         """Stream Arrow record batches from storage synchronously.
 
         Args:
             pattern: The glob pattern to match.
-            file_format: Storage format. Only Parquet supports bounded batch streaming.
+            file_format: ``"parquet"`` or an Arrow IPC format (``"arrow-ipc"``, ``"arrow-stream"``).
             batch_size: Maximum number of rows in each yielded record batch.
+            columns: Columns to read; other column chunks are never fetched.
+            filter: Row filter (``pyarrow.compute.Expression`` or DNF tuples). Row
+                groups whose statistics exclude it are skipped.
             **kwargs: Additional arguments passed to PyArrow batch iteration.
 
         Yields:
             Arrow record batches from matching files.
         """
-        validate_parquet_stream_options(pattern, file_format, batch_size)
+        validate_arrow_stream_options(pattern, file_format, batch_size)
         pq = import_pyarrow_parquet()
         for obj_path in self.glob_sync(pattern):
             file_handle = execute_sync_storage_operation(
@@ -436,13 +508,27 @@ class FSSpecBackend:
                 path=str(obj_path),
             )
             with file_handle as stream:
+                if file_format != "parquet":
+                    yield from iter_arrow_file_batches(
+                        stream, file_format, batch_size=batch_size, columns=columns, filter=filter
+                    )
+                    continue
+                if filter is not None:
+                    _schema, fragments = execute_sync_storage_operation(
+                        partial(parquet_row_group_fragments, stream, filter),
+                        backend=self.backend_type,
+                        operation="stream_arrow",
+                        path=str(obj_path),
+                    )
+                    yield from iter_fragment_batches(fragments, batch_size=batch_size, columns=columns, filter=filter)
+                    continue
                 parquet_file = execute_sync_storage_operation(
                     partial(pq.ParquetFile, stream),
                     backend=self.backend_type,
                     operation="stream_arrow",
                     path=str(obj_path),
                 )
-                yield from iter_parquet_row_groups(parquet_file, batch_size=batch_size, **kwargs)
+                yield from iter_parquet_row_groups(parquet_file, batch_size=batch_size, columns=columns, **kwargs)
 
     async def read_bytes_async(self, path: "str | Path", **kwargs: Any) -> bytes:
         """Read bytes from storage asynchronously."""
@@ -452,6 +538,11 @@ class FSSpecBackend:
         """Write bytes to storage asynchronously."""
         return await async_(self.write_bytes_sync)(path, data, **kwargs)
 
+    async def open_write_stream_async(self, path: "str | Path", **kwargs: Any) -> AsyncThreadedBytesWriter:
+        """Open a binary writer with blocking filesystem I/O offloaded to a thread pool."""
+        file_obj = await async_(self.open_write_stream_sync)(path, **kwargs)
+        return AsyncThreadedBytesWriter(file_obj)
+
     async def stream_read_async(
         self, path: "str | Path", chunk_size: "int | None" = None, **kwargs: Any
     ) -> AsyncIterator[bytes]:
@@ -478,13 +569,18 @@ class FSSpecBackend:
         return AsyncThreadedBytesIterator(file_obj, chunk_size)
 
     def stream_arrow_async(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        **kwargs: Any,
     ) -> AsyncIterator["ArrowRecordBatch"]:
         """Stream Arrow record batches from storage asynchronously.
 
         Args:
             pattern: The glob pattern to match.
-            file_format: Storage format. Only Parquet supports bounded batch streaming.
+            file_format: ``"parquet"`` or an Arrow IPC format (``"arrow-ipc"``, ``"arrow-stream"``).
             batch_size: Maximum number of rows in each yielded record batch.
             **kwargs: Additional arguments passed to PyArrow batch iteration.
 
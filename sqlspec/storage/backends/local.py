@@ -14,25 +14,38 @@ from urllib.parse import unquote, urlparse
 from mypy_extensions import mypyc_attr
 
 from sqlspec.exceptions import FileNotFoundInStorageError
-from sqlspec.storage._arrow_stream import iter_parquet_row_groups, validate_parquet_stream_options
+from sqlspec.storage._arrow_payload import (
+    MEMORY_MAP_FORMATS,
+    iter_arrow_file_batches,
+    iter_fragment_batches,
+    open_mapped_batch_reader,
+    open_memory_map,
+    parquet_read_options,
+    parquet_row_group_fragments,
+)
+from sqlspec.storage._arrow_stream import iter_parquet_row_groups, validate_arrow_stream_options
 from sqlspec.storage._paths import strip_windows_drive_prefix
 from sqlspec.storage._utils import import_pyarrow_parquet
-from sqlspec.storage.backends.base import AsyncArrowBatchIterator, AsyncThreadedBytesIterator
+from sqlspec.storage.backends.base import AsyncArrowBatchIterator, AsyncThreadedBytesIterator, AsyncThreadedBytesWriter
 from sqlspec.storage.errors import execute_sync_storage_operation
 from sqlspec.utils.sync_tools import async_
 
 if TYPE_CHECKING:
+    from sqlspec.storage._arrow_payload import StorageFormat
     from sqlspec.typing import ArrowRecordBatch, ArrowTable
 
 __all__ = ("LocalStore",)
 
+_IPC_SUFFIXES = frozenset({".arrow", ".ipc", ".feather"})
+
 
 @mypyc_attr(allow_interpreted_subclasses=True)
 class LocalStore:
     """Simple local file system storage backend.
 
     Provides file system operations without requiring fsspec or obstore.
-    Supports file:// URIs and regular file paths.
+    Supports file:// URIs and regular file paths. Arrow IPC/Feather and Parquet
+    files are read through memory maps rather than copied into the heap.
 
     All synchronous methods use the *_sync suffix for consistency with async methods.
     """
@@ -120,6 +133,84 @@ class LocalStore:
             path=str(resolved),
         )
 
+    def open_read_stream_sync(self, path: "str | Path", **kwargs: Any) -> Any:
+        """Open a seekable binary file handle for incremental reads."""
+        resolved = self._resolve_path(path)
+        return execute_sync_storage_operation(
+            partial(_open_file_for_read, resolved), backend=self.backend_type, operation="open_read", path=str(resolved)
+        )
+
+    @property
+    def supports_memory_map(self) -> bool:
+        """Whether objects can be memory-mapped. Always True for local storage."""
+        return True
+
+    def open_memory_map_sync(self, path: "str | Path", **kwargs: Any) -> Any:
+        """Memory-map a file read-only as a ``pyarrow.MemoryMappedFile``."""
+        resolved = self._resolve_path(path)
+        return execute_sync_storage_operation(
+            partial(open_memory_map, str(resolved)),
+            backend=self.backend_type,
+            operation="open_read",
+            path=str(resolved),
+        )
+
+    def open_arrow_reader_sync(
+        self,
+        path: "str | Path",
+        *,
+        file_format: "StorageFormat | None" = None,
+        batch_size: "int | None" = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> Any:
+        """Open a ``pyarrow.RecordBatchReader`` over a memory-mapped Arrow IPC or Parquet file.
+
+        Arrow IPC batches are zero-copy views of the mapped file, so reading a
+        large staging file does not grow the Python heap.
+
+        Args:
+            path: File to read.
+            file_format: ``"arrow-ipc"`` or ``"parquet"``; inferred from the suffix when omitted.
+            batch_size: Maximum rows per Parquet batch.
+            columns: Columns to read.
+            filter: Row filter as a ``pyarrow.compute.Expression`` or DNF tuples.
+
+        Returns:
+            A record batch reader that releases the map once exhausted.
+
+        Raises:
+            ValueError: If ``file_format`` is not ``"arrow-ipc"`` or ``"parquet"``.
+        """
+        resolved = self._resolve_path(path)
+        format_choice = file_format or _mapped_format(resolved)
+        if format_choice not in MEMORY_MAP_FORMATS:
+            msg = f"Memory-mapped reads support parquet and arrow-ipc, not {format_choice}"
+            raise ValueError(msg)
+        return execute_sync_storage_operation(
+            partial(
+                open_mapped_batch_reader,
+                str(resolved),
+                format_choice,
+                batch_size=batch_size,
+                columns=columns,
+                filter=filter,
+            ),
+            backend=self.backend_type,
+            operation="open_read",
+            path=str(resolved),
+        )
+
+    def open_write_stream_sync(self, path: "str | Path", **kwargs: Any) -> Any:
+        """Open a binary file handle for incremental writes, creating parent directories."""
+        resolved = self._resolve_path(path)
+        return execute_sync_storage_operation(
+            partial(_open_file_for_write, resolved),
+            backend=self.backend_type,
+            operation="open_write",
+            path=str(resolved),
+        )
+
     def read_text_sync(self, path: "str | Path", encoding: str = "utf-8", **kwargs: Any) -> str:
         """Read text from file synchronously."""
         data = self.read_bytes_sync(path, **kwargs)
@@ -270,14 +361,27 @@ class LocalStore:
         """Check if path points to a directory synchronously."""
         return self._resolve_path(path).is_dir()
 
-    def read_arrow_sync(self, path: "str | Path", **kwargs: Any) -> "ArrowTable":
-        """Read Arrow table from file synchronously."""
-        pq = import_pyarrow_parquet()
+    def read_arrow_sync(
+        self, path: "str | Path", *, columns: "list[str] | None" = None, filter: Any = None, **kwargs: Any
+    ) -> "ArrowTable":
+        """Read Arrow table from file synchronously.
+
+        Files are memory-mapped. ``.arrow``/``.ipc``/``.feather`` files are read as
+        Arrow IPC and the table's buffers point into the map; anything else is
+        read as Parquet. ``columns`` and ``filter`` are pushed into the reader;
+        Parquet row groups whose statistics exclude ``filter`` are skipped.
+        """
         resolved = self._resolve_path(path)
+        if resolved.suffix.lower() in _IPC_SUFFIXES:
+            reader = self.open_arrow_reader_sync(resolved, file_format="arrow-ipc", columns=columns, filter=filter)
+            return cast("ArrowTable", reader.read_all())
+        pq = import_pyarrow_parquet()
+        options = parquet_read_options(columns, filter, kwargs)
+        options.setdefault("memory_map", True)
         return cast(
             "ArrowTable",
             execute_sync_storage_operation(
-                partial(pq.read_table, str(resolved), **kwargs),
+                partial(pq.read_table, str(resolved), **options),
                 backend=self.backend_type,
                 operation="read_arrow",
                 path=str(resolved),
@@ -297,26 +401,57 @@ class LocalStore:
         )
 
     def stream_arrow_sync(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+        **kwargs: Any,
     ) -> Iterator["ArrowRecordBatch"]:
         """Stream Arrow record batches from files matching pattern synchronously.
 
+        Only ``columns`` are decoded; with ``filter``, row groups whose statistics
+        exclude it are skipped and the remaining rows are filtered. Arrow IPC
+        files are memory-mapped and yield zero-copy batches.
+
         Yields:
             Arrow record batches from matching files.
         """
-        validate_parquet_stream_options(pattern, file_format, batch_size)
+        validate_arrow_stream_options(pattern, file_format, batch_size)
         pq = import_pyarrow_parquet()
         files = self.glob_sync(pattern)
         for file_path in files:
             resolved = self._resolve_path(file_path)
             resolved_str = str(resolved)
+            if file_format != "parquet":
+                mapped = execute_sync_storage_operation(
+                    partial(open_memory_map, resolved_str),
+                    backend=self.backend_type,
+                    operation="stream_arrow",
+                    path=resolved_str,
+                )
+                yield from iter_arrow_file_batches(
+                    mapped, file_format, batch_size=batch_size, columns=columns, filter=filter
+                )
+                continue
+            if filter is not None:
+                _schema, fragments = execute_sync_storage_operation(
+                    partial(parquet_row_group_fragments, resolved_str, filter),
+                    backend=self.backend_type,
+                    operation="stream_arrow",
+                    path=resolved_str,
+                )
+                yield from iter_fragment_batches(fragments, batch_size=batch_size, columns=columns, filter=filter)
+                continue
             parquet_file = execute_sync_storage_operation(
-                partial(pq.ParquetFile, resolved_str),
+                partial(pq.ParquetFile, resolved_str, memory_map=True),
                 backend=self.backend_type,
                 operation="stream_arrow",
                 path=resolved_str,
             )
-            yield from iter_parquet_row_groups(parquet_file, batch_size=batch_size, **kwargs)
+            yield from iter_parquet_row_groups(parquet_file, batch_size=batch_size, columns=columns, **kwargs)
 
     @property
     def supports_signing(self) -> bool:
@@ -356,6 +491,11 @@ class LocalStore:
         """Write bytes to file asynchronously."""
         await async_(self.write_bytes_sync)(path, data, **kwargs)
 
+    async def open_write_stream_async(self, path: "str | Path", **kwargs: Any) -> AsyncThreadedBytesWriter:
+        """Open a file for incremental writes with blocking I/O offloaded to a thread pool."""
+        file_obj = await async_(self.open_write_stream_sync)(path, **kwargs)
+        return AsyncThreadedBytesWriter(file_obj)
+
     async def read_text_async(self, path: "str | Path", encoding: str = "utf-8", **kwargs: Any) -> str:
         """Read text from file asynchronously."""
         return await async_(self.read_text_sync)(path, encoding, **kwargs)
@@ -425,13 +565,18 @@ class LocalStore:
         await async_(self.write_arrow_sync)(path, table, **kwargs)
 
     def stream_arrow_async(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        **kwargs: Any,
     ) -> AsyncIterator["ArrowRecordBatch"]:
         """Stream Arrow record batches asynchronously.
 
         Args:
             pattern: Glob pattern to match files.
-            file_format: Storage format. Only Parquet supports bounded batch streaming.
+            file_format: ``"parquet"`` or an Arrow IPC format (``"arrow-ipc"``, ``"arrow-stream"``).
             batch_size: Maximum number of rows in each yielded record batch.
             **kwargs: Additional arguments passed to stream_arrow_sync().
 
@@ -455,6 +600,11 @@ class LocalStore:
         return await async_(self.sign_sync)(paths, expires_in, for_upload)  # type: ignore[arg-type]
 
 
+def _mapped_format(resolved: "Path") -> "StorageFormat":
+    """Infer the memory-mappable format of a local file from its suffix."""
+    return "arrow-ipc" if resolved.suffix.lower() in _IPC_SUFFIXES else "parquet"
+
+
 def _write_local_bytes(resolved: "Path", data: bytes) -> None:
     """Write bytes to a local file, ensuring parent directories exist."""
     resolved.parent.mkdir(parents=True, exist_ok=True)
@@ -486,3 +636,9 @@ def _write_local_arrow(resolved: "Path", table: "ArrowTable", pq: Any, options:
 def _open_file_for_read(path: Path) -> Any:
     """Open a file for binary reading."""
     return path.open("rb")
+
+
+def _open_file_for_write(path: Path) -> Any:
+    """Open a file for binary writing, ensuring parent directories exist."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.open("wb")
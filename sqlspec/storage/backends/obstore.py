@@ -17,8 +17,15 @@ from urllib.parse import urlparse
 from mypy_extensions import mypyc_attr
 from typing_extensions import Self
 
-from sqlspec.exceptions import StorageOperationFailedError
-from sqlspec.storage._arrow_stream import iter_parquet_row_groups, validate_parquet_stream_options
+from sqlspec.exceptions import StorageCapabilityError, StorageOperationFailedError
+from sqlspec.storage._arrow_payload import (
+    iter_arrow_file_batches,
+    iter_fragment_batches,
+    open_memory_map,
+    parquet_read_options,
+    parquet_row_group_fragments,
+)
+from sqlspec.storage._arrow_stream import iter_parquet_row_groups, validate_arrow_stream_options
 from sqlspec.storage._paths import is_file_destination, resolve_storage_path
 from sqlspec.storage._utils import _log_storage_event, import_pyarrow, import_pyarrow_parquet
 from sqlspec.storage.backends.base import AsyncArrowBatchIterator, AsyncObStoreStreamIterator
@@ -285,6 +292,49 @@ class ObStoreBackend:
         resolved_path = self._resolve_path(path)
         self._write_bytes_resolved_sync(resolved_path, data)
 
+    def open_read_stream_sync(self, path: "str | Path", **kwargs: Any) -> Any:  # pyright: ignore[reportUnusedParameter]
+        """Open a seekable obstore reader that fetches byte ranges on demand."""
+        import obstore as obs
+
+        resolved_path = self._resolve_path(path)
+        return execute_sync_storage_operation(
+            partial(obs.open_reader, self.store, resolved_path),
+            backend=self.backend_type,
+            operation="open_read",
+            path=resolved_path,
+        )
+
+    @property
+    def supports_memory_map(self) -> bool:
+        """Whether objects can be memory-mapped, which requires a ``file://`` store."""
+        return self._is_local_store
+
+    def open_memory_map_sync(self, path: "str | Path", **kwargs: Any) -> Any:  # pyright: ignore[reportUnusedParameter]
+        """Memory-map a ``file://`` object read-only as a ``pyarrow.MemoryMappedFile``.
+
+        Raises:
+            StorageCapabilityError: If the store is not on the local filesystem.
+        """
+        if not self._is_local_store:
+            msg = f"Memory-mapped reads require a local file store, not {self.protocol!r}"
+            raise StorageCapabilityError(msg, capability="memory_map")
+        local_path = self.resolve_uri(path)
+        return execute_sync_storage_operation(
+            partial(open_memory_map, local_path), backend=self.backend_type, operation="open_read", path=local_path
+        )
+
+    def open_write_stream_sync(self, path: "str | Path", **kwargs: Any) -> Any:  # pyright: ignore[reportUnusedParameter]
+        """Open an obstore writer that uploads buffered chunks as a multipart upload."""
+        import obstore as obs
+
+        resolved_path = self._resolve_path(path)
+        return execute_sync_storage_operation(
+            partial(obs.open_writer, self.store, resolved_path),
+            backend=self.backend_type,
+            operation="open_write",
+            path=resolved_path,
+        )
+
     def read_text_sync(self, path: "str | Path", encoding: str = "utf-8", **kwargs: Any) -> str:
         """Read text using obstore synchronously."""
         return self.read_bytes_sync(path, **kwargs).decode(encoding)
@@ -481,20 +531,40 @@ class ObStoreBackend:
         except Exception:
             return False
 
-    def read_arrow_sync(self, path: "str | Path", **kwargs: Any) -> "ArrowTable":
-        """Read Arrow table using obstore synchronously."""
+    def read_arrow_sync(
+        self, path: "str | Path", *, columns: "list[str] | None" = None, filter: Any = None, **kwargs: Any
+    ) -> "ArrowTable":
+        """Read Arrow table using obstore synchronously.
+
+        With ``columns`` or ``filter`` the object is read through obstore's
+        seekable reader, so only the footer and the needed column chunks of
+        matching row groups cross the network.
+        """
         pq = import_pyarrow_parquet()
         resolved_path = self._resolve_path(path)
-        data = self._read_bytes_resolved_sync(resolved_path)
-        result = cast(
-            "ArrowTable",
-            execute_sync_storage_operation(
-                partial(pq.read_table, io.BytesIO(data), **kwargs),
-                backend=self.backend_type,
-                operation="read_arrow",
-                path=resolved_path,
-            ),
-        )
+        if columns is None and filter is None:
+            data = self._read_bytes_resolved_sync(resolved_path)
+            result = cast(
+                "ArrowTable",
+                execute_sync_storage_operation(
+                    partial(pq.read_table, io.BytesIO(data), **kwargs),
+                    backend=self.backend_type,
+                    operation="read_arrow",
+                    path=resolved_path,
+                ),
+            )
+        else:
+            result = cast(
+                "ArrowTable",
+                execute_sync_storage_operation(
+                    partial(
+                        self._read_parquet_ranges, resolved_path, pq, parquet_read_options(columns, filter, kwargs)
+                    ),
+                    backend=self.backend_type,
+                    operation="read_arrow",
+                    path=resolved_path,
+                ),
+            )
         _log_storage_event(
             "storage.read",
             backend_type=self.backend_type,
@@ -505,6 +575,12 @@ class ObStoreBackend:
         )
         return result
 
+    def _read_parquet_ranges(self, resolved_path: str, pq: Any, options: "dict[str, Any]") -> Any:
+        from obstore import open_reader
+
+        with _ObStoreFileProxy(open_reader(self.store, resolved_path)) as stream:
+            return pq.read_table(stream, **options)
+
     def write_arrow_sync(self, path: "str | Path", table: "ArrowTable", **kwargs: Any) -> None:
         """Write Arrow table using obstore synchronously."""
         pa = import_pyarrow()
@@ -567,18 +643,27 @@ class ObStoreBackend:
             yield bytes(chunk)
 
     def stream_arrow_sync(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+        **kwargs: Any,
     ) -> "Iterator[ArrowRecordBatch]":
         """Stream Arrow record batches using obstore's native streaming synchronously.
 
         For each matching file, PyArrow reads through obstore's seekable reader.
+        Only ``columns`` are fetched, and row groups whose statistics exclude
+        ``filter`` are skipped. Arrow IPC objects are decoded batch by batch.
 
         Yields:
             Arrow record batches in file and row-group order.
         """
         from obstore import open_reader
 
-        validate_parquet_stream_options(pattern, file_format, batch_size)
+        validate_arrow_stream_options(pattern, file_format, batch_size)
         pq = import_pyarrow_parquet()
         for obj_path in self.glob_sync(pattern):
             reader = execute_sync_storage_operation(
@@ -588,10 +673,24 @@ class ObStoreBackend:
                 path=obj_path,
             )
             with _ObStoreFileProxy(reader) as stream:
+                if file_format != "parquet":
+                    yield from iter_arrow_file_batches(
+                        stream, file_format, batch_size=batch_size, columns=columns, filter=filter
+                    )
+                    continue
+                if filter is not None:
+                    _schema, fragments = execute_sync_storage_operation(
+                        partial(parquet_row_group_fragments, stream, filter),
+                        backend=self.backend_type,
+                        operation="stream_arrow",
+                        path=obj_path,
+                    )
+                    yield from iter_fragment_batches(fragments, batch_size=batch_size, columns=columns, filter=filter)
+                    continue
                 parquet_file = execute_sync_storage_operation(
                     partial(pq.ParquetFile, stream), backend=self.backend_type, operation="stream_arrow", path=obj_path
                 )
-                yield from iter_parquet_row_groups(parquet_file, batch_size=batch_size, **kwargs)
+                yield from iter_parquet_row_groups(parquet_file, batch_size=batch_size, columns=columns, **kwargs)
 
     @property
     def supports_signing(self) -> bool:
@@ -699,6 +798,13 @@ class ObStoreBackend:
         resolved_path = self._resolve_path(path)
         await self._write_bytes_resolved_async(resolved_path, data)
 
+    async def open_write_stream_async(self, path: "str | Path", **kwargs: Any) -> Any:  # pyright: ignore[reportUnusedParameter]
+        """Open an async obstore writer that uploads buffered chunks as a multipart upload."""
+        import obstore as obs
+
+        resolved_path = self._resolve_path(path)
+        return obs.open_writer_async(self.store, resolved_path)
+
     async def stream_read_async(
         self, path: "str | Path", chunk_size: "int | None" = None, **kwargs: Any
     ) -> AsyncIterator[bytes]:
@@ -869,11 +975,16 @@ class ObStoreBackend:
         else:
             return result
 
-    async def read_arrow_async(self, path: "str | Path", **kwargs: Any) -> "ArrowTable":
+    async def read_arrow_async(
+        self, path: "str | Path", *, columns: "list[str] | None" = None, filter: Any = None, **kwargs: Any
+    ) -> "ArrowTable":
         """Read Arrow table from storage asynchronously.
 
         Uses async_() with storage limiter to offload blocking PyArrow I/O to thread pool.
+        Projection and filter pushdown use ranged reads (see ``read_arrow_sync``).
         """
+        if columns is not None or filter is not None:
+            return await async_(self.read_arrow_sync)(path, columns=columns, filter=filter, **kwargs)
         pq = import_pyarrow_parquet()
         resolved_path = self._resolve_path(path)
         data = await self._read_bytes_resolved_async(resolved_path)
@@ -918,13 +1029,18 @@ class ObStoreBackend:
         )
 
     def stream_arrow_async(
-        self, pattern: str, *, file_format: Literal["parquet"] = "parquet", batch_size: int = 65_536, **kwargs: Any
+        self,
+        pattern: str,
+        *,
+        file_format: Literal["parquet", "arrow-ipc", "arrow-stream"] = "parquet",
+        batch_size: int = 65_536,
+        **kwargs: Any,
     ) -> AsyncIterator["ArrowRecordBatch"]:
         """Stream Arrow record batches from storage asynchronously.
 
         Args:
             pattern: Glob pattern to match files.
-            file_format: Storage format. Only Parquet supports bounded batch streaming.
+            file_format: ``"parquet"`` or an Arrow IPC format (``"arrow-ipc"``, ``"arrow-stream"``).
             batch_size: Maximum number of rows in each yielded record batch.
             **kwargs: Additional arguments passed to stream_arrow_sync().
 
@@ -0,0 +1,485 @@
+"""Concurrent readers for glob and prefix storage sources.
+
+``SyncMultiSourceReader`` and ``AsyncMultiSourceReader`` read many objects at
+once (a thread pool for sync callers, asyncio tasks for async callers) and merge
+their record batches into one stream:
+
+- ``ordered=True`` yields every batch of the first file before the second, so
+  the output matches a sequential read of the sorted source list.
+- ``ordered=False`` yields batches as soon as any file produces them.
+
+Read-ahead is bounded: at most ``read_ahead`` decoded batches wait per file when
+ordered (``read_ahead`` in total when unordered), and at most
+``max_concurrency`` files are open at a time. ``columns`` and ``filter`` are
+pushed into every file's reader. Telemetry for each completed file is recorded
+in the storage bridge diagnostics.
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Final
+
+from mypy_extensions import mypyc_attr
+from typing_extensions import Self
+
+from sqlspec.storage._arrow_payload import batches_to_table
+from sqlspec.storage.pipeline import record_storage_file_read
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from types import TracebackType
+
+    from sqlspec.storage.pipeline import AsyncStoragePipeline, StorageFormat, StorageTelemetry, SyncStoragePipeline
+    from sqlspec.typing import ArrowRecordBatch, ArrowTable
+
+__all__ = ("AsyncMultiSourceReader", "MultiSourceOptions", "SyncMultiSourceReader", "parse_multi_source_options")
+
+_DEFAULT_MAX_CONCURRENCY: Final = 4
+_DEFAULT_READ_AHEAD: Final = 4
+_DEFAULT_ROWS_PER_LOAD: Final = 100_000
+_PUT_TIMEOUT_S: Final = 0.1
+_BATCH: Final = 0
+_DONE: Final = 1
+_ERROR: Final = 2
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class MultiSourceOptions:
+    """Validated settings for multi-file storage loads."""
+
+    __slots__ = ("batch_size", "max_concurrency", "ordered", "read_ahead", "rows_per_load")
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        read_ahead: int = _DEFAULT_READ_AHEAD,
+        ordered: bool = True,
+        batch_size: "int | None" = None,
+        rows_per_load: int = _DEFAULT_ROWS_PER_LOAD,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.read_ahead = read_ahead
+        self.ordered = ordered
+        self.batch_size = batch_size
+        self.rows_per_load = rows_per_load
+
+    def __repr__(self) -> str:
+        return (
+            f"MultiSourceOptions(max_concurrency={self.max_concurrency!r}, read_ahead={self.read_ahead!r}, "
+            f"ordered={self.ordered!r}, batch_size={self.batch_size!r}, rows_per_load={self.rows_per_load!r})"
+        )
+
+
+def _positive_int(options: "Mapping[str, object]", key: str, default: int) -> int:
+    value = options.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        msg = f"partitioner {key!r} must be a positive integer"
+        raise ValueError(msg)
+    return value
+
+
+def parse_multi_source_options(partitioner: "Mapping[str, object] | None") -> MultiSourceOptions:
+    """Read multi-file load settings from a ``load_from_storage`` partitioner mapping.
+
+    Recognised keys are ``max_concurrency``, ``read_ahead``, ``ordered``,
+    ``batch_size`` (rows per decoded batch), and ``rows_per_load`` (rows handed
+    to each native bulk-load call). Other keys are ignored.
+
+    Raises:
+        TypeError: If ``ordered`` is not a boolean.
+        ValueError: If a numeric key is not a positive integer.
+    """
+    if not partitioner:
+        return MultiSourceOptions()
+    ordered = partitioner.get("ordered", True)
+    if not isinstance(ordered, bool):
+        msg = "partitioner 'ordered' must be a boolean"
+        raise TypeError(msg)
+    batch_size = _positive_int(partitioner, "batch_size", 1) if "batch_size" in partitioner else None
+    return MultiSourceOptions(
+        max_concurrency=_positive_int(partitioner, "max_concurrency", _DEFAULT_MAX_CONCURRENCY),
+        read_ahead=_positive_int(partitioner, "read_ahead", _DEFAULT_READ_AHEAD),
+        ordered=ordered,
+        batch_size=batch_size,
+        rows_per_load=_positive_int(partitioner, "rows_per_load", _DEFAULT_ROWS_PER_LOAD),
+    )
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class _MultiSourceReaderBase:
+    """Source bookkeeping and telemetry shared by the multi-file readers."""
+
+    __slots__ = (
+        "_backend_name",
+        "_bytes_read",
+        "_closed",
+        "_columns",
+        "_file_format",
+        "_files_read",
+        "_filter",
+        "_on_file",
+        "_options",
+        "_rows_read",
+        "_source",
+        "_sources",
+        "_started_at",
+        "_storage_options",
+    )
+
+    def __init__(
+        self,
+        source: str,
+        sources: "list[str]",
+        file_format: "StorageFormat",
+        options: MultiSourceOptions,
+        *,
+        storage_options: "dict[str, Any] | None" = None,
+        on_file: "Callable[[StorageTelemetry], None] | None" = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> None:
+        self._source = source
+        self._sources = sources
+        self._file_format: StorageFormat = file_format
+        self._options = options
+        self._storage_options = storage_options
+        self._on_file = on_file
+        self._columns = columns
+        self._filter = filter
+        self._backend_name = ""
+        self._bytes_read = 0
+        self._rows_read = 0
+        self._files_read = 0
+        self._closed = False
+        self._started_at = perf_counter()
+
+    @property
+    def sources(self) -> "list[str]":
+        """Return the object URIs being read."""
+        return list(self._sources)
+
+    @property
+    def rows_read(self) -> int:
+        """Return the number of rows yielded so far."""
+        return self._rows_read
+
+    def telemetry(self) -> "StorageTelemetry":
+        """Return aggregate read telemetry across the completed files."""
+        return {
+            "destination": self._source,
+            "bytes_processed": self._bytes_read,
+            "rows_processed": self._rows_read,
+            "duration_s": perf_counter() - self._started_at,
+            "format": self._file_format,
+            "backend": self._backend_name,
+            "extra": {"files": self._files_read, "ordered": self._options.ordered},
+        }
+
+    def _batch_seen(self, batch: "ArrowRecordBatch") -> "ArrowRecordBatch":
+        self._rows_read += int(batch.num_rows)
+        return batch
+
+    def _file_done(self, telemetry: "StorageTelemetry") -> None:
+        self._files_read += 1
+        self._bytes_read += int(telemetry.get("bytes_processed", 0))
+        self._backend_name = str(telemetry.get("backend", self._backend_name))
+        if self._on_file is not None:
+            self._on_file(telemetry)
+        record_storage_file_read(telemetry)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class SyncMultiSourceReader(_MultiSourceReaderBase):
+    """Read many storage objects on a bounded thread pool and yield their batches."""
+
+    __slots__ = ("_executor", "_futures", "_head", "_pending", "_pipeline", "_queues", "_shared", "_stop", "_submitted")
+
+    def __init__(
+        self,
+        pipeline: "SyncStoragePipeline",
+        source: str,
+        sources: "list[str]",
+        file_format: "StorageFormat",
+        options: "MultiSourceOptions | None" = None,
+        *,
+        storage_options: "dict[str, Any] | None" = None,
+        on_file: "Callable[[StorageTelemetry], None] | None" = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> None:
+        resolved = options or MultiSourceOptions()
+        super().__init__(
+            source,
+            sources,
+            file_format,
+            resolved,
+            storage_options=storage_options,
+            on_file=on_file,
+            columns=columns,
+            filter=filter,
+        )
+        self._pipeline = pipeline
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(resolved.max_concurrency, len(sources))), thread_name_prefix="sqlspec-read"
+        )
+        self._stop = threading.Event()
+        self._futures: list[Future[None]] = []
+        self._queues: dict[int, queue.Queue[tuple[int, int, Any]]] = {}
+        self._shared: queue.Queue[tuple[int, int, Any]] = queue.Queue(maxsize=resolved.read_ahead)
+        self._head = 0
+        self._submitted = 0
+        self._pending = len(sources)
+        if not resolved.ordered:
+            for index in range(len(sources)):
+                self._submit(index, self._shared)
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> "ArrowRecordBatch":
+        batch = self.read_next_batch()
+        if batch is None:
+            raise StopIteration
+        return batch
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> None:
+        self.close()
+
+    def read_next_batch(self) -> "ArrowRecordBatch | None":
+        """Return the next batch from any file, or None once every file is exhausted."""
+        while not self._closed:
+            if self._options.ordered:
+                if self._head >= len(self._sources):
+                    break
+                self._fill_window()
+                kind, index, payload = self._queues[self._head].get()
+            else:
+                if self._pending == 0:
+                    break
+                kind, index, payload = self._shared.get()
+            if kind == _BATCH:
+                return self._batch_seen(payload)
+            if kind == _ERROR:
+                self.close()
+                raise payload
+            self._file_done(payload)
+            self._pending -= 1
+            if self._options.ordered:
+                del self._queues[index]
+                self._head += 1
+        self.close()
+        return None
+
+    def read_next_table(self, max_rows: int) -> "ArrowTable | None":
+        """Collect batches until at least ``max_rows`` rows are buffered; None once exhausted."""
+        batches: list[ArrowRecordBatch] = []
+        rows = 0
+        while rows < max_rows:
+            batch = self.read_next_batch()
+            if batch is None:
+                break
+            batches.append(batch)
+            rows += int(batch.num_rows)
+        return batches_to_table(batches) if batches else None
+
+    def close(self) -> None:
+        """Stop outstanding reads and release their handles."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _fill_window(self) -> None:
+        limit = min(len(self._sources), self._head + self._options.max_concurrency)
+        while self._submitted < limit:
+            target: queue.Queue[tuple[int, int, Any]] = queue.Queue(maxsize=self._options.read_ahead)
+            self._queues[self._submitted] = target
+            self._submit(self._submitted, target)
+
+    def _submit(self, index: int, target: "queue.Queue[tuple[int, int, Any]]") -> None:
+        self._futures.append(self._executor.submit(self._read_file, index, target))
+        self._submitted = index + 1
+
+    def _put(self, target: "queue.Queue[tuple[int, int, Any]]", item: "tuple[int, int, Any]") -> bool:
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=_PUT_TIMEOUT_S)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _read_file(self, index: int, target: "queue.Queue[tuple[int, int, Any]]") -> None:
+        if self._stop.is_set():
+            return
+        try:
+            with self._pipeline.open_reader(
+                self._sources[index],
+                file_format=self._file_format,
+                storage_options=self._storage_options,
+                batch_size=self._options.batch_size,
+                columns=self._columns,
+                filter=self._filter,
+            ) as reader:
+                for batch in reader:
+                    if not self._put(target, (_BATCH, index, batch)):
+                        return
+                telemetry = reader.telemetry()
+        except Exception as error:
+            self._put(target, (_ERROR, index, error))
+            return
+        telemetry["destination"] = self._sources[index]
+        self._put(target, (_DONE, index, telemetry))
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class AsyncMultiSourceReader(_MultiSourceReaderBase):
+    """Read many storage objects with bounded concurrent tasks and yield their batches."""
+
+    __slots__ = ("_head", "_pending", "_pipeline", "_queues", "_shared", "_slots", "_started", "_submitted", "_tasks")
+
+    def __init__(
+        self,
+        pipeline: "AsyncStoragePipeline",
+        source: str,
+        sources: "list[str]",
+        file_format: "StorageFormat",
+        options: "MultiSourceOptions | None" = None,
+        *,
+        storage_options: "dict[str, Any] | None" = None,
+        on_file: "Callable[[StorageTelemetry], None] | None" = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> None:
+        resolved = options or MultiSourceOptions()
+        super().__init__(
+            source,
+            sources,
+            file_format,
+            resolved,
+            storage_options=storage_options,
+            on_file=on_file,
+            columns=columns,
+            filter=filter,
+        )
+        self._pipeline = pipeline
+        self._tasks: list[asyncio.Task[None]] = []
+        self._queues: dict[int, asyncio.Queue[tuple[int, int, Any]]] = {}
+        self._shared: asyncio.Queue[tuple[int, int, Any]] = asyncio.Queue(maxsize=resolved.read_ahead)
+        self._slots = asyncio.Semaphore(resolved.max_concurrency)
+        self._head = 0
+        self._submitted = 0
+        self._pending = len(sources)
+        self._started = False
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> "ArrowRecordBatch":
+        batch = await self.read_next_batch()
+        if batch is None:
+            raise StopAsyncIteration
+        return batch
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> None:
+        await self.close()
+
+    async def read_next_batch(self) -> "ArrowRecordBatch | None":
+        """Return the next batch from any file, or None once every file is exhausted."""
+        if not self._started:
+            self._started = True
+            if not self._options.ordered:
+                for index in range(len(self._sources)):
+                    self._submit(index, self._shared)
+        while not self._closed:
+            if self._options.ordered:
+                if self._head >= len(self._sources):
+                    break
+                self._fill_window()
+                kind, index, payload = await self._queues[self._head].get()
+            else:
+                if self._pending == 0:
+                    break
+                kind, index, payload = await self._shared.get()
+            if kind == _BATCH:
+                return self._batch_seen(payload)
+            if kind == _ERROR:
+                await self.close()
+                raise payload
+            self._file_done(payload)
+            self._pending -= 1
+            if self._options.ordered:
+                del self._queues[index]
+                self._head += 1
+        await self.close()
+        return None
+
+    async def read_next_table(self, max_rows: int) -> "ArrowTable | None":
+        """Collect batches until at least ``max_rows`` rows are buffered; None once exhausted."""
+        batches: list[ArrowRecordBatch] = []
+        rows = 0
+        while rows < max_rows:
+            batch = await self.read_next_batch()
+            if batch is None:
+                break
+            batches.append(batch)
+            rows += int(batch.num_rows)
+        return batches_to_table(batches) if batches else None
+
+    async def close(self) -> None:
+        """Cancel outstanding reads and release their handles."""
+        if self._closed:
+            return
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _fill_window(self) -> None:
+        limit = min(len(self._sources), self._head + self._options.max_concurrency)
+        while self._submitted < limit:
+            target: asyncio.Queue[tuple[int, int, Any]] = asyncio.Queue(maxsize=self._options.read_ahead)
+            self._queues[self._submitted] = target
+            self._submit(self._submitted, target)
+
+    def _submit(self, index: int, target: "asyncio.Queue[tuple[int, int, Any]]") -> None:
+        self._tasks.append(asyncio.ensure_future(self._read_file(index, target)))
+        self._submitted = index + 1
+
+    async def _read_file(self, index: int, target: "asyncio.Queue[tuple[int, int, Any]]") -> None:
+        async with self._slots:
+            try:
+                reader = await self._pipeline.open_reader(
+                    self._sources[index],
+                    file_format=self._file_format,
+                    storage_options=self._storage_options,
+                    batch_size=self._options.batch_size,
+                    columns=self._columns,
+                    filter=self._filter,
+                )
+                async with reader:
+                    async for batch in reader:
+                        await target.put((_BATCH, index, batch))
+                    telemetry = reader.telemetry()
+            except Exception as error:
+                await target.put((_ERROR, index, error))
+                return
+        telemetry["destination"] = self._sources[index]
+        await target.put((_DONE, index, telemetry))
@@ -0,0 +1,555 @@
+"""Partitioned fan-out writers for storage exports.
+
+``SyncPartitionedWriter`` and ``AsyncPartitionedWriter`` accept the same
+``write_batch``/``write_rows``/``close``/``abort`` calls as the single-object
+storage writers, but spread the stream over many objects:
+
+- ``{"kind": "columns", "columns": [...]}`` writes Hive-style layouts
+  (``region=eu/day=2026-01-01/part-0001.parquet``) with the partition columns
+  carried in the directory names.
+- ``{"kind": "rows", "rows_per_chunk": N}`` writes ``part-0001.parquet``,
+  ``part-0002.parquet``, ... with at most ``N`` rows each.
+
+Completed part files are uploaded concurrently (``max_concurrency``), and a
+JSON manifest listing every file is written to ``manifest_path`` on close.
+"""
+
+import asyncio
+import contextlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Final
+from urllib.parse import quote
+
+from mypy_extensions import mypyc_attr
+
+from sqlspec.storage._arrow_payload import drop_arrow_columns, rows_to_record_batch, split_batch_by_columns
+from sqlspec.utils.arrow_helpers import ArrowSchemaSettler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from sqlspec.storage.pipeline import (
+        AsyncStoragePipeline,
+        StorageDestination,
+        StorageFormat,
+        StorageTelemetry,
+        SyncStoragePipeline,
+    )
+    from sqlspec.typing import ArrowRecordBatch
+
+__all__ = (
+    "HIVE_DEFAULT_PARTITION",
+    "AsyncPartitionedWriter",
+    "PartitionSpec",
+    "SyncPartitionedWriter",
+    "parse_partitioner",
+)
+
+HIVE_DEFAULT_PARTITION: Final = "__HIVE_DEFAULT_PARTITION__"
+"""Directory value used for NULL partition keys (Hive convention)."""
+
+_PARTITION_KINDS: Final = frozenset({"columns", "rows"})
+_DEFAULT_ROWS_PER_CHUNK: Final = 500_000
+_DEFAULT_MAX_BUFFERED_ROWS: Final = 1_000_000
+_DEFAULT_MAX_CONCURRENCY: Final = 4
+_FORMAT_EXTENSIONS: Final[dict[str, str]] = {
+    "parquet": "parquet",
+    "arrow-ipc": "arrow",
+    "arrow-stream": "arrows",
+    "csv": "csv",
+    "jsonl": "jsonl",
+    "json": "json",
+}
+
+
+@mypyc_attr(allow_interpreted_subclasses=False)
+class PartitionSpec:
+    """Validated partitioner settings."""
+
+    __slots__ = ("columns", "kind", "manifest_path", "max_buffered_rows", "max_concurrency", "rows_per_chunk")
+
+    def __init__(
+        self,
+        kind: str,
+        *,
+        columns: "tuple[str, ...]" = (),
+        rows_per_chunk: int = _DEFAULT_ROWS_PER_CHUNK,
+        max_buffered_rows: int = _DEFAULT_MAX_BUFFERED_ROWS,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        manifest_path: "str | None" = None,
+    ) -> None:
+        self.kind = kind
+        self.columns = columns
+        self.rows_per_chunk = rows_per_chunk
+        self.max_buffered_rows = max(max_buffered_rows, rows_per_chunk)
+        self.max_concurrency = max_concurrency
+        self.manifest_path = manifest_path
+
+    def __repr__(self) -> str:
+        return (
+            f"PartitionSpec(kind={self.kind!r}, columns={self.columns!r}, rows_per_chunk={self.rows_per_chunk!r}, "
+            f"max_concurrency={self.max_concurrency!r}, manifest_path={self.manifest_path!r})"
+        )
+
+
+def _positive_int(partitioner: "Mapping[str, object]", key: str, default: int) -> int:
+    value = partitioner.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        msg = f"partitioner {key!r} must be a positive integer"
+        raise ValueError(msg)
+    return value
+
+
+def parse_partitioner(partitioner: "Mapping[str, object] | None") -> "PartitionSpec | None":
+    """Return a ``PartitionSpec`` for fan-out partitioners, or None.
+
+    Partitioners of other kinds (for example ``"fixed"``) are descriptive only
+    and keep being recorded in telemetry without changing the output layout.
+
+    Raises:
+        ValueError: If a ``columns``/``rows`` partitioner is malformed.
+    """
+    if not partitioner:
+        return None
+    kind = partitioner.get("kind")
+    if kind not in _PARTITION_KINDS:
+        return None
+    columns: tuple[str, ...] = ()
+    if kind == "columns":
+        raw_columns = partitioner.get("columns")
+        if isinstance(raw_columns, str) or not isinstance(raw_columns, (list, tuple)) or not raw_columns:
+            msg = "partitioner kind 'columns' requires a non-empty 'columns' list"
+            raise ValueError(msg)
+        columns = tuple(str(column) for column in raw_columns)
+    elif "rows_per_chunk" not in partitioner:
+        msg = "partitioner kind 'rows' requires 'rows_per_chunk'"
+        raise ValueError(msg)
+    manifest_path = partitioner.get("manifest_path")
+    if manifest_path is not None and not isinstance(manifest_path, str):
+        msg = "partitioner 'manifest_path' must be a string"
+        raise ValueError(msg)
+    return PartitionSpec(
+        str(kind),
+        columns=columns,
+        rows_per_chunk=_positive_int(partitioner, "rows_per_chunk", _DEFAULT_ROWS_PER_CHUNK),
+        max_buffered_rows=_positive_int(partitioner, "max_buffered_rows", _DEFAULT_MAX_BUFFERED_ROWS),
+        max_concurrency=_positive_int(partitioner, "max_concurrency", _DEFAULT_MAX_CONCURRENCY),
+        manifest_path=manifest_path,
+    )
+
+
+def _hive_segment(column: str, value: Any) -> str:
+    text = HIVE_DEFAULT_PARTITION if value is None else str(value)
+    return f"{quote(column, safe='')}={quote(text, safe='')}"
+
+
+def _join_destination(base: str, relative: str) -> str:
+    return f"{base}/{relative}" if base else relative
+
+
+def _manifest_destination(base: str, manifest_path: str) -> str:
+    if "://" in manifest_path or manifest_path.startswith("/"):
+        return manifest_path
+    return _join_destination(base, manifest_path)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class _PartitionedWriterBase:
+    """Buffering, naming, and accounting shared by the partitioned writers."""
+
+    __slots__ = (
+        "_backend_name",
+        "_base",
+        "_buffer_rows",
+        "_buffered_rows",
+        "_buffers",
+        "_compression",
+        "_entries",
+        "_extension",
+        "_file_schema",
+        "_format",
+        "_part_numbers",
+        "_progress",
+        "_schema",
+        "_settler",
+        "_spec",
+        "_started_at",
+        "_storage_options",
+    )
+
+    def __init__(
+        self,
+        destination: "StorageDestination",
+        spec: PartitionSpec,
+        *,
+        format_hint: "StorageFormat | None" = None,
+        storage_options: "dict[str, Any] | None" = None,
+        compression: "str | None" = None,
+        schema: Any = None,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> None:
+        base = destination if isinstance(destination, str) else destination.as_posix()
+        self._base = base.rstrip("/")
+        self._spec = spec
+        self._format: StorageFormat = format_hint or "parquet"
+        self._extension = _FORMAT_EXTENSIONS.get(self._format, self._format)
+        self._storage_options = storage_options
+        self._compression = compression
+        self._progress = progress
+        self._schema: Any = None
+        self._file_schema: Any = None
+        self._settler: Any = ArrowSchemaSettler(schema)
+        if schema is not None:
+            self._pin_schema(schema)
+        self._buffers: dict[tuple[Any, ...], list[Any]] = {}
+        self._buffer_rows: dict[tuple[Any, ...], int] = {}
+        self._buffered_rows = 0
+        self._part_numbers: dict[tuple[Any, ...], int] = {}
+        self._entries: list[dict[str, Any]] = []
+        self._backend_name = ""
+        self._started_at = perf_counter()
+
+    @property
+    def files(self) -> "list[dict[str, Any]]":
+        """Return manifest entries for the part files completed so far."""
+        return list(self._entries)
+
+    def _pin_schema(self, schema: Any) -> None:
+        self._schema = schema
+        columns = self._spec.columns
+        self._file_schema = drop_arrow_columns(schema, columns) if columns else schema
+
+    def _partition(self, batch: "ArrowRecordBatch") -> "list[tuple[tuple[Any, ...], ArrowRecordBatch]]":
+        """Split the batches released by the schema settler into their partitions."""
+        parts: list[tuple[tuple[Any, ...], ArrowRecordBatch]] = []
+        for ready in self._settler.push(batch):
+            parts.extend(self._split(ready))
+        return parts
+
+    def _partition_pending(self) -> "list[tuple[tuple[Any, ...], ArrowRecordBatch]]":
+        """Settle the schema from batches still held back and split them into their partitions."""
+        parts: list[tuple[tuple[Any, ...], ArrowRecordBatch]] = []
+        for ready in self._settler.flush():
+            parts.extend(self._split(ready))
+        return parts
+
+    def _split(self, batch: "ArrowRecordBatch") -> "list[tuple[tuple[Any, ...], ArrowRecordBatch]]":
+        if self._schema is None:
+            self._pin_schema(self._settler.schema)
+        if int(batch.num_rows) == 0:
+            return []
+        columns = self._spec.columns
+        if not columns:
+            return [((), batch)]
+        return split_batch_by_columns(batch, columns)
+
+    def _rows_batch(self, rows: "list[dict[str, Any]]") -> "ArrowRecordBatch":
+        return rows_to_record_batch(rows, self._settler.schema)
+
+    def _buffer(self, key: "tuple[Any, ...]", batch: "ArrowRecordBatch") -> "list[tuple[tuple[Any, ...], list[Any]]]":
+        """Buffer ``batch`` under ``key`` and return the part files that are now full."""
+        ready: list[tuple[tuple[Any, ...], list[Any]]] = []
+        rows_per_chunk = self._spec.rows_per_chunk
+        remaining = batch
+        while int(remaining.num_rows) > 0:
+            buffered = self._buffer_rows.get(key, 0)
+            take = min(rows_per_chunk - buffered, int(remaining.num_rows))
+            self._buffers.setdefault(key, []).append(remaining.slice(0, take))
+            self._buffer_rows[key] = buffered + take
+            self._buffered_rows += take
+            remaining = remaining.slice(take)
+            if buffered + take >= rows_per_chunk:
+                ready.append(self._take(key))
+        buffer_rows = self._buffer_rows
+        while self._buffered_rows > self._spec.max_buffered_rows and buffer_rows:
+            ready.append(self._take(max(buffer_rows, key=buffer_rows.__getitem__)))
+        return ready
+
+    def _take(self, key: "tuple[Any, ...]") -> "tuple[tuple[Any, ...], list[Any]]":
+        self._buffered_rows -= self._buffer_rows.pop(key)
+        return key, self._buffers.pop(key)
+
+    def _drain_buffers(self) -> "list[tuple[tuple[Any, ...], list[Any]]]":
+        return [self._take(key) for key in list(self._buffers)]
+
+    def _next_path(self, key: "tuple[Any, ...]") -> "tuple[str, dict[str, Any]]":
+        number = self._part_numbers.get(key, 0) + 1
+        self._part_numbers[key] = number
+        columns = self._spec.columns
+        partition = dict(zip(columns, key, strict=True))
+        segments = [_hive_segment(column, value) for column, value in partition.items()]
+        segments.append(f"part-{number:04d}.{self._extension}")
+        return _join_destination(self._base, "/".join(segments)), partition
+
+    def _entry(self, path: str, partition: "dict[str, Any]", telemetry: "StorageTelemetry") -> "dict[str, Any]":
+        self._backend_name = str(telemetry.get("backend", self._backend_name))
+        return {
+            "path": path,
+            "partition": {column: None if value is None else str(value) for column, value in partition.items()},
+            "rows": int(telemetry.get("rows_processed", 0)),
+            "bytes": int(telemetry.get("bytes_processed", 0)),
+        }
+
+    def _manifest_target(self) -> "str | None":
+        manifest_path = self._spec.manifest_path
+        return None if manifest_path is None else _manifest_destination(self._base, manifest_path)
+
+    def _telemetry(self, manifest: "str | None") -> "StorageTelemetry":
+        entries = self._entries
+        extra: dict[str, object] = {"files": [entry["path"] for entry in entries]}
+        if manifest is not None:
+            extra["manifest_path"] = manifest
+        return {
+            "destination": self._base,
+            "bytes_processed": sum(int(entry["bytes"]) for entry in entries),
+            "rows_processed": sum(int(entry["rows"]) for entry in entries),
+            "partitions_created": len(entries),
+            "duration_s": perf_counter() - self._started_at,
+            "format": self._format,
+            "backend": self._backend_name,
+            "extra": extra,
+        }
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class SyncPartitionedWriter(_PartitionedWriterBase):
+    """Fan a batch stream out to partitioned objects using a bounded thread pool."""
+
+    __slots__ = ("_closed", "_executor", "_futures", "_lock", "_pipeline", "_slots")
+
+    def __init__(
+        self,
+        pipeline: "SyncStoragePipeline",
+        destination: "StorageDestination",
+        spec: PartitionSpec,
+        *,
+        format_hint: "StorageFormat | None" = None,
+        storage_options: "dict[str, Any] | None" = None,
+        compression: "str | None" = None,
+        schema: Any = None,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> None:
+        super().__init__(
+            destination,
+            spec,
+            format_hint=format_hint,
+            storage_options=storage_options,
+            compression=compression,
+            schema=schema,
+            progress=progress,
+        )
+        self._pipeline = pipeline
+        self._executor = ThreadPoolExecutor(max_workers=spec.max_concurrency, thread_name_prefix="sqlspec-partition")
+        self._slots = threading.BoundedSemaphore(spec.max_concurrency)
+        self._lock = threading.Lock()
+        self._futures: list[Future[dict[str, Any]]] = []
+        self._closed = False
+
+    def write_batch(self, batch: "ArrowRecordBatch") -> None:
+        """Route one record batch to its partitions."""
+        for key, part in self._partition(batch):
+            for ready_key, batches in self._buffer(key, part):
+                self._submit(ready_key, batches)
+
+    def write_rows(self, rows: "list[dict[str, Any]]") -> None:
+        """Route one chunk of dictionary rows to its partitions."""
+        if rows:
+            self.write_batch(self._rows_batch(rows))
+
+    def close(self) -> "StorageTelemetry":
+        """Flush open partitions, wait for uploads, write the manifest, and return telemetry."""
+        try:
+            for key, part in self._partition_pending():
+                for ready_key, batches in self._buffer(key, part):
+                    self._submit(ready_key, batches)
+            for key, batches in self._drain_buffers():
+                self._submit(key, batches)
+            self._entries = [future.result() for future in self._futures]
+            self._executor.shutdown(wait=True)
+            manifest = self._manifest_target()
+            if manifest is not None:
+                self._pipeline.write_rows(
+                    self._entries,
+                    manifest,
+                    format_hint="jsonl" if manifest.endswith(".jsonl") else "json",
+                    storage_options=self._storage_options,
+                )
+        except Exception:
+            self.abort()
+            raise
+        self._closed = True
+        return self._telemetry(manifest)
+
+    def abort(self) -> None:
+        """Cancel pending uploads and delete completed part files best-effort."""
+        if self._closed:
+            return
+        self._closed = True
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        for future in self._futures:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            with contextlib.suppress(Exception):
+                self._pipeline.delete(future.result()["path"], storage_options=self._storage_options)
+
+    def _submit(self, key: "tuple[Any, ...]", batches: "list[Any]") -> None:
+        self._raise_failed()
+        path, partition = self._next_path(key)
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._write_part, path, partition, batches)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._release_slot)
+        self._futures.append(future)
+
+    def _release_slot(self, _future: "Future[dict[str, Any]]") -> None:
+        self._slots.release()
+
+    def _raise_failed(self) -> None:
+        for future in self._futures:
+            if future.done() and not future.cancelled():
+                error = future.exception()
+                if error is not None:
+                    raise error
+
+    def _write_part(self, path: str, partition: "dict[str, Any]", batches: "list[Any]") -> "dict[str, Any]":
+        writer = self._pipeline.open_writer(
+            path,
+            format_hint=self._format,
+            storage_options=self._storage_options,
+            compression=self._compression,
+            schema=self._file_schema,
+            progress=self._progress,
+        )
+        try:
+            for batch in batches:
+                writer.write_batch(batch)
+        except Exception:
+            writer.abort()
+            raise
+        telemetry = writer.close()
+        with self._lock:
+            return self._entry(path, partition, telemetry)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class AsyncPartitionedWriter(_PartitionedWriterBase):
+    """Fan a batch stream out to partitioned objects using bounded concurrent tasks."""
+
+    __slots__ = ("_closed", "_pipeline", "_slots", "_tasks")
+
+    def __init__(
+        self,
+        pipeline: "AsyncStoragePipeline",
+        destination: "StorageDestination",
+        spec: PartitionSpec,
+        *,
+        format_hint: "StorageFormat | None" = None,
+        storage_options: "dict[str, Any] | None" = None,
+        compression: "str | None" = None,
+        schema: Any = None,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> None:
+        super().__init__(
+            destination,
+            spec,
+            format_hint=format_hint,
+            storage_options=storage_options,
+            compression=compression,
+            schema=schema,
+            progress=progress,
+        )
+        self._pipeline = pipeline
+        self._slots = asyncio.Semaphore(spec.max_concurrency)
+        self._tasks: list[asyncio.Task[dict[str, Any]]] = []
+        self._closed = False
+
+    async def write_batch(self, batch: "ArrowRecordBatch") -> None:
+        """Route one record batch to its partitions."""
+        for key, part in self._partition(batch):
+            for ready_key, batches in self._buffer(key, part):
+                await self._submit(ready_key, batches)
+
+    async def write_rows(self, rows: "list[dict[str, Any]]") -> None:
+        """Route one chunk of dictionary rows to its partitions."""
+        if rows:
+            await self.write_batch(self._rows_batch(rows))
+
+    async def close(self) -> "StorageTelemetry":
+        """Flush open partitions, wait for uploads, write the manifest, and return telemetry."""
+        try:
+            for key, part in self._partition_pending():
+                for ready_key, batches in self._buffer(key, part):
+                    await self._submit(ready_key, batches)
+            for key, batches in self._drain_buffers():
+                await self._submit(key, batches)
+            self._entries = list(await asyncio.gather(*self._tasks))
+            manifest = self._manifest_target()
+            if manifest is not None:
+                await self._pipeline.write_rows(
+                    self._entries,
+                    manifest,
+                    format_hint="jsonl" if manifest.endswith(".jsonl") else "json",
+                    storage_options=self._storage_options,
+                )
+        except Exception:
+            await self.abort()
+            raise
+        self._closed = True
+        return self._telemetry(manifest)
+
+    async def abort(self) -> None:
+        """Cancel pending uploads and delete completed part files best-effort."""
+        if self._closed:
+            return
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for task in self._tasks:
+            if task.cancelled() or task.exception() is not None:
+                continue
+            with contextlib.suppress(Exception):
+                await self._pipeline.delete(task.result()["path"], storage_options=self._storage_options)
+
+    async def _submit(self, key: "tuple[Any, ...]", batches: "list[Any]") -> None:
+        self._raise_failed()
+        path, partition = self._next_path(key)
+        await self._slots.acquire()
+        task = asyncio.ensure_future(self._write_part(path, partition, batches))
+        task.add_done_callback(self._release_slot)
+        self._tasks.append(task)
+
+    def _release_slot(self, _task: "asyncio.Task[dict[str, Any]]") -> None:
+        self._slots.release()
+
+    def _raise_failed(self) -> None:
+        for task in self._tasks:
+            if task.done() and not task.cancelled():
+                error = task.exception()
+                if error is not None:
+                    raise error
+
+    async def _write_part(self, path: str, partition: "dict[str, Any]", batches: "list[Any]") -> "dict[str, Any]":
+        writer = await self._pipeline.open_writer(
+            path,
+            format_hint=self._format,
+            storage_options=self._storage_options,
+            compression=self._compression,
+            schema=self._file_schema,
+            progress=self._progress,
+        )
+        try:
+            for batch in batches:
+                await writer.write_batch(batch)
+        except Exception:
+            await writer.abort()
+            raise
+        telemetry = await writer.close()
+        return self._entry(path, partition, telemetry)
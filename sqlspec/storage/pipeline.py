@@ -1,5 +1,7 @@
 """Storage pipeline scaffolding for driver-aware storage bridge."""
 
+import contextlib
+import io
 from collections import deque
 from functools import partial
 from pathlib import Path
@@ -7,26 +9,45 @@ from time import perf_counter, time
 from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias, cast
 
 from mypy_extensions import mypyc_attr
-from typing_extensions import NotRequired, TypedDict
+from typing_extensions import NotRequired, Self, TypedDict
 
 from sqlspec.exceptions import ImproperConfigurationError, StorageCapabilityError
-from sqlspec.storage._arrow_payload import StorageFormat, decode_arrow_payload, encode_arrow_payload
+from sqlspec.storage._arrow_payload import (
+    MEMORY_MAP_FORMATS,
+    ArrowBatchDecoder,
+    ArrowBatchEncoder,
+    StorageFormat,
+    decode_arrow_payload,
+    encode_arrow_payload,
+)
+from sqlspec.storage._paths import compile_source_pattern, is_multi_source, split_multi_source
 from sqlspec.storage.errors import execute_async_storage_operation, execute_sync_storage_operation
 from sqlspec.storage.registry import StorageRegistry, storage_registry
 from sqlspec.utils.serializers import get_serializer_metrics, serialize_collection, to_json
 from sqlspec.utils.sync_tools import async_
-from sqlspec.utils.type_guards import supports_async_delete, supports_async_read_bytes, supports_async_write_bytes
+from sqlspec.utils.type_guards import (
+    supports_async_delete,
+    supports_async_read_bytes,
+    supports_async_write_bytes,
+    supports_async_write_stream,
+    supports_memory_mapped_reads,
+    supports_read_stream,
+    supports_write_stream,
+)
 from sqlspec.utils.uuids import uuid4
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator
+    from collections.abc import AsyncIterator, Callable, Iterator
+    from types import TracebackType
 
     from sqlspec.protocols import ObjectStoreProtocol
-    from sqlspec.typing import ArrowTable
+    from sqlspec.typing import ArrowRecordBatch, ArrowTable
 
 
 __all__ = (
     "AsyncStoragePipeline",
+    "AsyncStorageReader",
+    "AsyncStorageWriter",
     "PartitionStrategyConfig",
     "StagedArtifact",
     "StorageBridgeJob",
@@ -37,11 +58,14 @@ __all__ = (
     "StorageLoadRequest",
     "StorageTelemetry",
     "SyncStoragePipeline",
+    "SyncStorageReader",
+    "SyncStorageWriter",
     "create_storage_bridge_job",
     "get_recent_storage_events",
     "get_storage_bridge_diagnostics",
     "get_storage_bridge_metrics",
     "record_storage_diagnostic_event",
+    "record_storage_file_read",
     "reset_storage_bridge_events",
     "reset_storage_bridge_metrics",
 )
@@ -64,11 +88,18 @@ class StorageCapabilities(TypedDict):
 
 
 class PartitionStrategyConfig(TypedDict, total=False):
-    """Configuration for partition fan-out strategies."""
+    """Configuration for partition fan-out strategies.
+
+    ``kind="columns"`` writes Hive-style ``col=value/part-0001.<ext>`` layouts;
+    ``kind="rows"`` writes fixed-size ``part-0001.<ext>`` chunks.
+    """
 
     kind: str
     partitions: int
+    columns: "list[str]"
     rows_per_chunk: int
+    max_buffered_rows: int
+    max_concurrency: int
     manifest_path: str
 
 
@@ -118,34 +149,48 @@ class StorageBridgeJob(NamedTuple):
 
 
 class _StorageBridgeMetrics:
-    __slots__ = ("bytes_written", "partitions_created")
+    __slots__ = ("bytes_written", "files_read", "partitions_created", "rows_written")
 
     def __init__(self) -> None:
         self.bytes_written = 0
+        self.files_read = 0
         self.partitions_created = 0
+        self.rows_written = 0
 
     def record_bytes(self, count: int) -> None:
         self.bytes_written += max(count, 0)
 
+    def record_rows(self, count: int) -> None:
+        self.rows_written += max(count, 0)
+
     def record_partitions(self, count: int) -> None:
         self.partitions_created += max(count, 0)
 
+    def record_files_read(self, count: int) -> None:
+        self.files_read += max(count, 0)
+
     def snapshot(self) -> "dict[str, int]":
         return {
             "storage_bridge.bytes_written": self.bytes_written,
+            "storage_bridge.files_read": self.files_read,
             "storage_bridge.partitions_created": self.partitions_created,
+            "storage_bridge.rows_written": self.rows_written,
         }
 
     def reset(self) -> None:
         self.bytes_written = 0
+        self.files_read = 0
         self.partitions_created = 0
+        self.rows_written = 0
 
 
 _METRICS = _StorageBridgeMetrics()
 _RECENT_STORAGE_EVENTS: "deque[StorageTelemetry]" = deque(maxlen=25)
 _EMPTY_STORAGE_OPTIONS: dict[str, Any] = {}
-_ARROW_WRITE_FORMATS = frozenset({"parquet", "arrow-ipc", "csv"})
+_ARROW_WRITE_FORMATS = frozenset({"parquet", "arrow-ipc", "arrow-stream", "csv"})
 _ROW_WRITE_FORMATS = frozenset({"json", "jsonl"})
+_STREAM_WRITE_FORMATS = _ARROW_WRITE_FORMATS | _ROW_WRITE_FORMATS
+_STREAM_CHUNK_ROWS = 65_536
 
 
 def _storage_options(default_options: "dict[str, Any]", storage_options: "dict[str, Any] | None") -> "dict[str, Any]":
@@ -187,6 +232,13 @@ def record_storage_diagnostic_event(telemetry: StorageTelemetry) -> None:
     _RECENT_STORAGE_EVENTS.append(cast("StorageTelemetry", dict(telemetry)))
 
 
+def record_storage_file_read(telemetry: StorageTelemetry) -> None:
+    """Count one object read by a multi-file load and record its telemetry for diagnostics."""
+
+    _METRICS.record_files_read(1)
+    record_storage_diagnostic_event(telemetry)
+
+
 def get_recent_storage_events() -> "list[StorageTelemetry]":
     """Return recent storage telemetry events (most recent first)."""
 
@@ -259,6 +311,22 @@ def _validate_row_write_format(format_choice: StorageFormat) -> None:
         )
 
 
+def _validate_stream_write_format(format_choice: StorageFormat) -> None:
+    """Reject streaming writes for unknown formats.
+
+    Args:
+        format_choice: Requested storage format.
+
+    Raises:
+        StorageCapabilityError: If the format cannot be written incrementally.
+    """
+    if format_choice not in _STREAM_WRITE_FORMATS:
+        msg = f"Streaming storage writes do not support format {format_choice!r}"
+        raise StorageCapabilityError(
+            msg, capability="stream_write", remediation="Use parquet, arrow-ipc, arrow-stream, csv, json, or jsonl."
+        )
+
+
 def _encode_arrow_payload(
     table: "ArrowTable",
     format_choice: StorageFormat,
@@ -332,12 +400,698 @@ def _storage_backend(
     return backend, normalized_path, backend.backend_type
 
 
+def _source_prefix(source: StorageDestination) -> "tuple[str, str]":
+    prefix, pattern = split_multi_source(source)
+    return prefix or "./", pattern
+
+
+def _listing_prefix(prefix: str, path: str) -> str:
+    """Return the part of a multi-source prefix that lies below its backend's root.
+
+    The registry roots URI and local-path backends at the prefix itself, so they
+    list from their root. Alias backends are rooted at the alias, so the path
+    below it is passed on and only that subtree is listed.
+    """
+    return path if prefix.startswith("alias://") else ""
+
+
+def _match_source_keys(
+    prefix: str, listed_prefix: str, backend: "ObjectStoreProtocol", keys: "list[str]", pattern: str
+) -> "list[str]":
+    """Map listed object keys below ``prefix`` to full source URIs matching ``pattern``.
+
+    Keys outside ``listed_prefix`` (backends may return siblings that only
+    share a name prefix) are dropped.
+    """
+    matcher = compile_source_pattern(pattern)
+    base_path = str(getattr(backend, "base_path", "") or "").strip("/")
+    sources: list[str] = []
+    for key in keys:
+        relative = key.lstrip("/")
+        if base_path and relative.startswith(f"{base_path}/"):
+            relative = relative[len(base_path) + 1 :]
+        if listed_prefix:
+            if not relative.startswith(listed_prefix):
+                continue
+            relative = relative[len(listed_prefix) :]
+        if matcher.fullmatch(relative):
+            sources.append(f"{prefix}{relative}")
+    return sorted(sources)
+
+
 def _backend_cache_key(destination: StorageDestination, backend_options: "dict[str, Any] | None") -> "str | None":
     if backend_options:
         return None
     return destination.as_posix() if isinstance(destination, Path) else str(destination)
 
 
+class _RowPayloadEncoder:
+    """Incremental JSON / JSON Lines encoder for dictionary rows."""
+
+    __slots__ = ("_format", "_started")
+
+    def __init__(self, format_choice: StorageFormat) -> None:
+        self._format = format_choice
+        self._started = False
+
+    def encode(self, rows: "list[Any]") -> bytes:
+        if not rows:
+            return b""
+        serialized = serialize_collection(rows)
+        if self._format != "json":
+            return _encode_row_payload(serialized, "jsonl")
+        buffer = bytearray(b"," if self._started else b"[")
+        self._started = True
+        for index, row in enumerate(serialized):
+            if index:
+                buffer.extend(b",")
+            buffer.extend(to_json(row, as_bytes=True))
+        return bytes(buffer)
+
+    def finish(self) -> bytes:
+        if self._format != "json":
+            return b""
+        return b"]" if self._started else b"[]"
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class _StorageWriterBase:
+    """Shared encoding and accounting state for incremental storage writers."""
+
+    __slots__ = (
+        "_arrow_encoder",
+        "_backend",
+        "_backend_name",
+        "_buffer",
+        "_bytes_written",
+        "_closed",
+        "_format",
+        "_path",
+        "_progress",
+        "_row_encoder",
+        "_rows_written",
+        "_started_at",
+    )
+
+    def __init__(
+        self,
+        backend: "ObjectStoreProtocol",
+        path: str,
+        backend_name: str,
+        format_choice: StorageFormat,
+        *,
+        schema: Any = None,
+        compression: str | None = None,
+        write_options: "dict[str, Any] | None" = None,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> None:
+        self._backend = backend
+        self._path = path
+        self._backend_name = backend_name
+        self._format = format_choice
+        self._progress = progress
+        self._row_encoder: _RowPayloadEncoder | None = None
+        self._arrow_encoder: Any = None
+        if format_choice in _ROW_WRITE_FORMATS:
+            self._row_encoder = _RowPayloadEncoder(format_choice)
+        else:
+            self._arrow_encoder = ArrowBatchEncoder(
+                format_choice, schema=schema, compression=compression, write_options=write_options
+            )
+        self._buffer: bytearray | None = None
+        self._rows_written = 0
+        self._bytes_written = 0
+        self._closed = False
+        self._started_at = perf_counter()
+
+    @property
+    def path(self) -> str:
+        """Return the backend-relative object path."""
+        return self._path
+
+    @property
+    def rows_written(self) -> int:
+        """Return the number of rows encoded so far."""
+        return self._rows_written
+
+    @property
+    def bytes_written(self) -> int:
+        """Return the number of encoded bytes handed to the backend so far."""
+        return self._bytes_written
+
+    def _encode_batch(self, batch: "ArrowRecordBatch") -> bytes:
+        row_encoder = self._row_encoder
+        if row_encoder is not None:
+            return row_encoder.encode(batch.to_pylist())
+        return cast("bytes", self._arrow_encoder.encode(batch))
+
+    def _encode_rows(self, rows: "list[dict[str, Any]]") -> bytes:
+        row_encoder = self._row_encoder
+        if row_encoder is not None:
+            return row_encoder.encode(rows)
+        return cast("bytes", self._arrow_encoder.encode_rows(rows))
+
+    def _encode_finish(self) -> bytes:
+        row_encoder = self._row_encoder
+        if row_encoder is not None:
+            return row_encoder.finish()
+        return cast("bytes", self._arrow_encoder.finish())
+
+    def _record(self, rows: int, byte_count: int) -> None:
+        self._rows_written += rows
+        self._bytes_written += byte_count
+        _METRICS.record_rows(rows)
+        _METRICS.record_bytes(byte_count)
+        progress = self._progress
+        if progress is not None:
+            progress(rows, byte_count)
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            msg = f"Storage writer for {self._path!r} is already closed"
+            raise StorageCapabilityError(msg, capability="stream_write")
+
+    def _telemetry(self) -> StorageTelemetry:
+        return {
+            "destination": self._path,
+            "bytes_processed": self._bytes_written,
+            "rows_processed": self._rows_written,
+            "duration_s": perf_counter() - self._started_at,
+            "format": self._format,
+            "backend": self._backend_name,
+        }
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class SyncStorageWriter(_StorageWriterBase):
+    """Incremental writer that encodes batches straight into a storage object.
+
+    Backends exposing ``open_write_stream_sync`` receive every encoded batch as it
+    is produced (file handles, fsspec block uploads, obstore multipart uploads),
+    so memory stays bounded by one batch. Other backends buffer the encoded
+    payload and receive a single ``write_bytes_sync`` call on ``close``.
+    """
+
+    __slots__ = ("_handle",)
+
+    def __init__(
+        self,
+        backend: "ObjectStoreProtocol",
+        path: str,
+        backend_name: str,
+        format_choice: StorageFormat,
+        *,
+        schema: Any = None,
+        compression: str | None = None,
+        write_options: "dict[str, Any] | None" = None,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> None:
+        super().__init__(
+            backend,
+            path,
+            backend_name,
+            format_choice,
+            schema=schema,
+            compression=compression,
+            write_options=write_options,
+            progress=progress,
+        )
+        self._handle: Any = None
+        if supports_write_stream(backend):
+            self._handle = backend.open_write_stream_sync(path)
+        else:
+            self._buffer = bytearray()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> None:
+        if exc_type is not None:
+            self.abort()
+        elif not self._closed:
+            self.close()
+
+    def write_batch(self, batch: "ArrowRecordBatch") -> None:
+        """Encode one Arrow record batch and forward it to storage."""
+        self._ensure_open()
+        payload = self._encode_batch(batch)
+        self._emit(payload)
+        self._record(int(batch.num_rows), len(payload))
+
+    def write_rows(self, rows: "list[dict[str, Any]]") -> None:
+        """Encode one chunk of dictionary rows and forward it to storage."""
+        self._ensure_open()
+        payload = self._encode_rows(rows)
+        self._emit(payload)
+        self._record(len(rows), len(payload))
+
+    def close(self) -> StorageTelemetry:
+        """Flush trailing bytes, finalize the object, and return write telemetry."""
+        self._ensure_open()
+        tail = self._encode_finish()
+        self._emit(tail)
+        self._record(0, len(tail))
+        self._closed = True
+        handle = self._handle
+        if handle is not None:
+            execute_sync_storage_operation(
+                handle.close, backend=self._backend_name, operation="write_stream", path=self._path
+            )
+        else:
+            buffer = self._buffer
+            _write_backend_sync(self._backend, self._path, bytes(buffer or b""), backend_name=self._backend_name)
+        return self._telemetry()
+
+    def abort(self) -> None:
+        """Discard the partially written object best-effort."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer = None
+        handle = self._handle
+        if handle is None:
+            return
+        with contextlib.suppress(Exception):
+            handle.close()
+        with contextlib.suppress(Exception):
+            self._backend.delete_sync(self._path)
+
+    def _emit(self, payload: bytes) -> None:
+        if not payload:
+            return
+        handle = self._handle
+        if handle is None:
+            buffer = self._buffer
+            if buffer is not None:
+                buffer.extend(payload)
+            return
+        execute_sync_storage_operation(
+            partial(handle.write, payload), backend=self._backend_name, operation="write_stream", path=self._path
+        )
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class AsyncStorageWriter(_StorageWriterBase):
+    """Async incremental writer; encoding runs in a worker thread between awaited writes.
+
+    Create instances through ``AsyncStoragePipeline.open_writer``.
+    """
+
+    __slots__ = ("_handle",)
+
+    def __init__(
+        self,
+        backend: "ObjectStoreProtocol",
+        path: str,
+        backend_name: str,
+        format_choice: StorageFormat,
+        *,
+        schema: Any = None,
+        compression: str | None = None,
+        write_options: "dict[str, Any] | None" = None,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> None:
+        super().__init__(
+            backend,
+            path,
+            backend_name,
+            format_choice,
+            schema=schema,
+            compression=compression,
+            write_options=write_options,
+            progress=progress,
+        )
+        self._handle: Any = None
+
+    async def _open(self) -> None:
+        backend = self._backend
+        if supports_async_write_stream(backend):
+            self._handle = await execute_async_storage_operation(
+                partial(backend.open_write_stream_async, self._path),
+                backend=self._backend_name,
+                operation="open_write",
+                path=self._path,
+            )
+        else:
+            self._buffer = bytearray()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> None:
+        if exc_type is not None:
+            await self.abort()
+        elif not self._closed:
+            await self.close()
+
+    async def write_batch(self, batch: "ArrowRecordBatch") -> None:
+        """Encode one Arrow record batch and forward it to storage."""
+        self._ensure_open()
+        payload = await async_(self._encode_batch)(batch)
+        await self._emit(payload)
+        self._record(int(batch.num_rows), len(payload))
+
+    async def write_rows(self, rows: "list[dict[str, Any]]") -> None:
+        """Encode one chunk of dictionary rows and forward it to storage."""
+        self._ensure_open()
+        payload = await async_(self._encode_rows)(rows)
+        await self._emit(payload)
+        self._record(len(rows), len(payload))
+
+    async def close(self) -> StorageTelemetry:
+        """Flush trailing bytes, finalize the object, and return write telemetry."""
+        self._ensure_open()
+        tail = await async_(self._encode_finish)()
+        await self._emit(tail)
+        self._record(0, len(tail))
+        self._closed = True
+        handle = self._handle
+        if handle is not None:
+            await execute_async_storage_operation(
+                handle.close, backend=self._backend_name, operation="write_stream", path=self._path
+            )
+            return self._telemetry()
+        payload = bytes(self._buffer or b"")
+        backend = self._backend
+        if supports_async_write_bytes(backend):
+            await execute_async_storage_operation(
+                partial(backend.write_bytes_async, self._path, payload),
+                backend=self._backend_name,
+                operation="write_bytes",
+                path=self._path,
+            )
+        else:
+            await async_(_write_backend_sync)(
+                backend=backend, path=self._path, payload=payload, backend_name=self._backend_name
+            )
+        return self._telemetry()
+
+    async def abort(self) -> None:
+        """Discard the partially written object best-effort."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer = None
+        handle = self._handle
+        if handle is None:
+            return
+        with contextlib.suppress(Exception):
+            await handle.close()
+        backend = self._backend
+        with contextlib.suppress(Exception):
+            if supports_async_delete(backend):
+                await backend.delete_async(self._path)
+            else:
+                await async_(_delete_backend_sync)(backend=backend, path=self._path, backend_name=self._backend_name)
+
+    async def _emit(self, payload: bytes) -> None:
+        if not payload:
+            return
+        handle = self._handle
+        if handle is None:
+            buffer = self._buffer
+            if buffer is not None:
+                buffer.extend(payload)
+            return
+        await execute_async_storage_operation(
+            partial(handle.write, payload), backend=self._backend_name, operation="write_stream", path=self._path
+        )
+
+
+def _drain_table_sync(writer: SyncStorageWriter, table: "ArrowTable") -> StorageTelemetry:
+    try:
+        for batch in table.to_batches(max_chunksize=_STREAM_CHUNK_ROWS):
+            writer.write_batch(batch)
+    except Exception:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+def _drain_rows_sync(writer: SyncStorageWriter, rows: "list[dict[str, Any]]") -> StorageTelemetry:
+    try:
+        for start in range(0, len(rows), _STREAM_CHUNK_ROWS):
+            writer.write_rows(rows[start : start + _STREAM_CHUNK_ROWS])
+    except Exception:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+async def _drain_table_async(writer: AsyncStorageWriter, table: "ArrowTable") -> StorageTelemetry:
+    try:
+        for batch in table.to_batches(max_chunksize=_STREAM_CHUNK_ROWS):
+            await writer.write_batch(batch)
+    except Exception:
+        await writer.abort()
+        raise
+    return await writer.close()
+
+
+async def _drain_rows_async(writer: AsyncStorageWriter, rows: "list[dict[str, Any]]") -> StorageTelemetry:
+    try:
+        for start in range(0, len(rows), _STREAM_CHUNK_ROWS):
+            await writer.write_rows(rows[start : start + _STREAM_CHUNK_ROWS])
+    except Exception:
+        await writer.abort()
+        raise
+    return await writer.close()
+
+
+def _open_decoder_sync(
+    backend: "ObjectStoreProtocol",
+    path: str,
+    backend_name: str,
+    file_format: StorageFormat,
+    batch_size: int | None,
+    columns: "list[str] | None" = None,
+    filter: Any = None,
+) -> ArrowBatchDecoder:
+    if file_format in MEMORY_MAP_FORMATS and supports_memory_mapped_reads(backend):
+        handle = execute_sync_storage_operation(
+            partial(backend.open_memory_map_sync, path), backend=backend_name, operation="open_read", path=path
+        )
+    elif supports_read_stream(backend):
+        handle = execute_sync_storage_operation(
+            partial(backend.open_read_stream_sync, path), backend=backend_name, operation="open_read", path=path
+        )
+    else:
+        handle = io.BytesIO(_read_backend_sync(backend, path, backend_name=backend_name))
+    return ArrowBatchDecoder(handle, file_format, batch_size=batch_size, columns=columns, filter=filter)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class _StorageReaderBase:
+    """Shared decoding and accounting state for incremental storage readers."""
+
+    __slots__ = (
+        "_backend",
+        "_backend_name",
+        "_batch_size",
+        "_closed",
+        "_columns",
+        "_decoder",
+        "_filter",
+        "_format",
+        "_path",
+        "_rows_read",
+        "_started_at",
+    )
+
+    def __init__(
+        self,
+        backend: "ObjectStoreProtocol",
+        path: str,
+        backend_name: str,
+        file_format: StorageFormat,
+        *,
+        batch_size: int | None = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> None:
+        self._backend = backend
+        self._path = path
+        self._backend_name = backend_name
+        self._format = file_format
+        self._batch_size = batch_size
+        self._columns = columns
+        self._filter = filter
+        self._decoder: ArrowBatchDecoder | None = None
+        self._rows_read = 0
+        self._closed = False
+        self._started_at = perf_counter()
+
+    @property
+    def path(self) -> str:
+        """Return the backend-relative object path."""
+        return self._path
+
+    @property
+    def schema(self) -> Any:
+        """Return the Arrow schema of the object, once opened."""
+        decoder = self._decoder
+        return None if decoder is None else decoder.schema
+
+    @property
+    def rows_read(self) -> int:
+        """Return the number of rows decoded so far."""
+        return self._rows_read
+
+    def telemetry(self) -> StorageTelemetry:
+        """Return read telemetry for the rows decoded so far."""
+        decoder = self._decoder
+        bytes_read = 0 if decoder is None else decoder.bytes_read
+        return {
+            "destination": self._path,
+            "bytes_processed": bytes_read,
+            "rows_processed": self._rows_read,
+            "duration_s": perf_counter() - self._started_at,
+            "format": self._format,
+            "backend": self._backend_name,
+        }
+
+    def _open_decoder(self) -> ArrowBatchDecoder:
+        return _open_decoder_sync(
+            self._backend, self._path, self._backend_name, self._format, self._batch_size, self._columns, self._filter
+        )
+
+    def _next_batch(self) -> "ArrowRecordBatch | None":
+        decoder = self._decoder
+        if decoder is None or self._closed:
+            return None
+        batch = decoder.read_next_batch()
+        if batch is not None:
+            self._rows_read += int(batch.num_rows)
+        return batch
+
+    def _read_remaining(self) -> "ArrowTable":
+        decoder = self._decoder
+        if decoder is None or self._closed:
+            msg = f"Storage reader for {self._path!r} is not open"
+            raise StorageCapabilityError(msg, capability="stream_read")
+        table = decoder.read_all()
+        self._rows_read += int(table.num_rows)
+        return table
+
+    def _release(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        decoder = self._decoder
+        if decoder is not None:
+            decoder.close()
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class SyncStorageReader(_StorageReaderBase):
+    """Incremental reader that decodes record batches straight from a storage object.
+
+    Backends exposing ``open_read_stream_sync`` are read through a seekable
+    handle, so Parquet row groups and IPC batches are fetched on demand. Other
+    backends download the object once and decode it from memory. Parquet and
+    Arrow IPC objects on the local filesystem are memory-mapped instead, so
+    IPC batches are zero-copy views of the file. ``columns``
+    and ``filter`` are pushed into the decoder (see ``ArrowBatchDecoder``).
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        backend: "ObjectStoreProtocol",
+        path: str,
+        backend_name: str,
+        file_format: StorageFormat,
+        *,
+        batch_size: int | None = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> None:
+        super().__init__(
+            backend, path, backend_name, file_format, batch_size=batch_size, columns=columns, filter=filter
+        )
+        self._decoder = self._open_decoder()
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> "ArrowRecordBatch":
+        batch = self._next_batch()
+        if batch is None:
+            self._release()
+            raise StopIteration
+        return batch
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> None:
+        self.close()
+
+    def read_next_batch(self) -> "ArrowRecordBatch | None":
+        """Return the next decoded batch, or None once the object is exhausted."""
+        return self._next_batch()
+
+    def read_all(self) -> "ArrowTable":
+        """Decode the remaining batches into a table."""
+        return self._read_remaining()
+
+    def close(self) -> None:
+        """Release the backend handle."""
+        self._release()
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class AsyncStorageReader(_StorageReaderBase):
+    """Async incremental reader; handle I/O and decoding run in a worker thread."""
+
+    __slots__ = ()
+
+    async def _open(self) -> None:
+        if self._decoder is None:
+            self._decoder = await async_(self._open_decoder)()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> "ArrowRecordBatch":
+        await self._open()
+        batch = await async_(self._next_batch)()
+        if batch is None:
+            await self.close()
+            raise StopAsyncIteration
+        return batch
+
+    async def __aenter__(self) -> Self:
+        await self._open()
+        return self
+
+    async def __aexit__(
+        self, exc_type: "type[BaseException] | None", exc_val: "BaseException | None", exc_tb: "TracebackType | None"
+    ) -> None:
+        await self.close()
+
+    async def read_next_batch(self) -> "ArrowRecordBatch | None":
+        """Return the next decoded batch, or None once the object is exhausted."""
+        await self._open()
+        return await async_(self._next_batch)()
+
+    async def read_all(self) -> "ArrowTable":
+        """Decode the remaining batches into a table."""
+        await self._open()
+        return await async_(self._read_remaining)()
+
+    async def close(self) -> None:
+        """Release the backend handle."""
+        await async_(self._release)()
+
+
 @mypyc_attr(allow_interpreted_subclasses=True)
 class _StoragePipelineBase:
     """Shared registry and backend-resolution state for storage pipelines."""
@@ -389,12 +1143,14 @@ class SyncStoragePipeline(_StoragePipelineBase):
 
         format_choice = format_hint or "jsonl"
         _validate_row_write_format(format_choice)
+        resolved_options = _storage_options(self._storage_options, storage_options)
+        backend, path, backend_name = self._backend(destination, resolved_options)
+        if supports_write_stream(backend):
+            writer = SyncStorageWriter(backend, path, backend_name, format_choice)
+            return _drain_rows_sync(writer, rows)
         serialized = serialize_collection(rows)
         payload = _encode_row_payload(serialized, format_choice)
-        resolved_options = _storage_options(self._storage_options, storage_options)
-        return self._write_bytes(
-            payload, destination, rows=len(serialized), format_label=format_choice, storage_options=resolved_options
-        )
+        return self._write_bytes(payload, backend, path, backend_name, rows=len(serialized), format_label=format_choice)
 
     def write_arrow(
         self,
@@ -413,19 +1169,96 @@ class SyncStoragePipeline(_StoragePipelineBase):
         format_write_options = _csv_write_options(
             format_choice, resolved_options, self._storage_options, self._csv_write_options
         )
+        backend, path, backend_name = self._backend(destination, resolved_options)
+        if supports_write_stream(backend):
+            writer = SyncStorageWriter(
+                backend,
+                path,
+                backend_name,
+                format_choice,
+                schema=table.schema,
+                compression=compression,
+                write_options=format_write_options,
+            )
+            return _drain_table_sync(writer, table)
         payload = _encode_arrow_payload(
             table, format_choice, compression=compression, write_options=format_write_options
         )
         return self._write_bytes(
-            payload, destination, rows=int(table.num_rows), format_label=format_choice, storage_options=resolved_options
+            payload, backend, path, backend_name, rows=int(table.num_rows), format_label=format_choice
+        )
+
+    def open_writer(
+        self,
+        destination: StorageDestination,
+        *,
+        format_hint: StorageFormat | None = None,
+        storage_options: "dict[str, Any] | None" = None,
+        compression: str | None = None,
+        schema: Any = None,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> SyncStorageWriter:
+        """Open an incremental writer that encodes batches directly into storage.
+
+        Args:
+            destination: Storage destination path or alias URI.
+            format_hint: Output format; defaults to Parquet.
+            storage_options: Backend options (and CSV ``write_options``).
+            compression: Parquet compression codec, or ``"lz4"``/``"zstd"`` for Arrow IPC.
+            schema: Optional Arrow schema fixing the output columns.
+            progress: Callback receiving ``(rows, bytes)`` after each write.
+
+        Returns:
+            SyncStorageWriter bound to the resolved backend object.
+        """
+        format_choice = format_hint or "parquet"
+        _validate_stream_write_format(format_choice)
+        resolved_options = _storage_options(self._storage_options, storage_options)
+        format_write_options = _csv_write_options(
+            format_choice, resolved_options, self._storage_options, self._csv_write_options
+        )
+        backend, path, backend_name = self._backend(destination, resolved_options)
+        return SyncStorageWriter(
+            backend,
+            path,
+            backend_name,
+            format_choice,
+            schema=schema,
+            compression=compression,
+            write_options=format_write_options,
+            progress=progress,
         )
 
     def read_arrow(
-        self, source: StorageDestination, *, file_format: StorageFormat, storage_options: "dict[str, Any] | None" = None
+        self,
+        source: StorageDestination,
+        *,
+        file_format: StorageFormat,
+        storage_options: "dict[str, Any] | None" = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "tuple[ArrowTable, StorageTelemetry]":
-        """Read an artifact from storage and decode it into an Arrow table."""
+        """Read an artifact from storage and decode it into an Arrow table.
+
+        Args:
+            source: Storage path or alias URI.
+            file_format: Format of the stored object.
+            storage_options: Backend options.
+            columns: Columns to read; others are never decoded (or fetched, for Parquet and Arrow IPC).
+            filter: Row filter as a ``pyarrow.compute.Expression`` or DNF tuples
+                (``[("day", ">=", start)]``). Parquet row groups whose statistics
+                exclude it are skipped.
+
+        Returns:
+            The decoded table and read telemetry.
+        """
 
         backend, path, backend_name = self._backend(source, storage_options)
+        if supports_read_stream(backend) or columns is not None or filter is not None:
+            reader = SyncStorageReader(backend, path, backend_name, file_format, columns=columns, filter=filter)
+            with reader:
+                streamed_table = reader.read_all()
+            return streamed_table, reader.telemetry()
         payload = _read_backend_sync(backend, path, backend_name=backend_name)
         table = _decode_arrow_payload(payload, file_format)
         rows_processed = int(table.num_rows)
@@ -438,6 +1271,54 @@ class SyncStoragePipeline(_StoragePipelineBase):
         }
         return table, telemetry
 
+    def open_reader(
+        self,
+        source: StorageDestination,
+        *,
+        file_format: StorageFormat,
+        storage_options: "dict[str, Any] | None" = None,
+        batch_size: int | None = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> SyncStorageReader:
+        """Open an incremental reader that decodes record batches straight from storage.
+
+        Args:
+            source: Storage path or alias URI.
+            file_format: Format of the stored object.
+            storage_options: Backend options.
+            batch_size: Maximum rows per decoded batch where the format allows it.
+            columns: Columns to read (projection pushdown).
+            filter: Row filter expression or DNF tuples (predicate pushdown).
+
+        Returns:
+            SyncStorageReader iterating ``RecordBatch`` objects.
+        """
+        backend, path, backend_name = self._backend(source, storage_options)
+        return SyncStorageReader(
+            backend, path, backend_name, file_format, batch_size=batch_size, columns=columns, filter=filter
+        )
+
+    def expand_sources(
+        self, source: StorageDestination, *, storage_options: "dict[str, Any] | None" = None
+    ) -> "list[str]":
+        """Expand a glob or prefix source into the sorted object URIs it matches.
+
+        Args:
+            source: Single object path, glob (``s3://bucket/events/*.parquet``), or prefix ending in ``/``.
+            storage_options: Backend options.
+
+        Returns:
+            Matching source URIs; a single-object source is returned as-is.
+        """
+        if not is_multi_source(source):
+            return [source.as_posix() if isinstance(source, Path) else str(source)]
+        prefix, pattern = _source_prefix(source)
+        backend, path, _backend_name = self._backend(prefix, storage_options)
+        listing_prefix = _listing_prefix(prefix, path)
+        keys = backend.list_objects_sync(prefix=listing_prefix, recursive=True)
+        return _match_source_keys(prefix, listing_prefix, backend, keys, pattern)
+
     def stream_read(
         self,
         source: StorageDestination,
@@ -470,6 +1351,11 @@ class SyncStoragePipeline(_StoragePipelineBase):
             _METRICS.record_partitions(len(artifacts))
         return artifacts
 
+    def delete(self, destination: StorageDestination, *, storage_options: "dict[str, Any] | None" = None) -> None:
+        """Delete a stored object."""
+        backend, path, backend_name = self._backend(destination, storage_options)
+        _delete_backend_sync(backend, path, backend_name=backend_name)
+
     def cleanup_staging_artifacts(self, artifacts: "list[StagedArtifact]", *, ignore_errors: bool = True) -> None:
         """Delete staged artifacts best-effort."""
 
@@ -484,13 +1370,13 @@ class SyncStoragePipeline(_StoragePipelineBase):
     def _write_bytes(
         self,
         payload: bytes,
-        destination: StorageDestination,
+        backend: "ObjectStoreProtocol",
+        path: str,
+        backend_name: str,
         *,
         rows: int,
         format_label: str,
-        storage_options: "dict[str, Any]",
     ) -> StorageTelemetry:
-        backend, path, backend_name = self._backend(destination, storage_options)
         start = perf_counter()
         _write_backend_sync(backend, path, payload, backend_name=backend_name)
         elapsed = perf_counter() - start
@@ -523,11 +1409,16 @@ class AsyncStoragePipeline(_StoragePipelineBase):
     ) -> StorageTelemetry:
         format_choice = format_hint or "jsonl"
         _validate_row_write_format(format_choice)
+        resolved_options = _storage_options(self._storage_options, storage_options)
+        backend, path, backend_name = self._backend(destination, resolved_options)
+        if supports_async_write_stream(backend):
+            writer = AsyncStorageWriter(backend, path, backend_name, format_choice)
+            await writer._open()  # pyright: ignore[reportPrivateUsage]
+            return await _drain_rows_async(writer, rows)
         serialized = serialize_collection(rows)
         payload = await async_(_encode_row_payload)(serialized, format_choice)
-        resolved_options = _storage_options(self._storage_options, storage_options)
         return await self._write_bytes_async(
-            payload, destination, rows=len(serialized), format_label=format_choice, storage_options=resolved_options
+            payload, backend, path, backend_name, rows=len(serialized), format_label=format_choice
         )
 
     async def write_arrow(
@@ -545,12 +1436,66 @@ class AsyncStoragePipeline(_StoragePipelineBase):
         format_write_options = _csv_write_options(
             format_choice, resolved_options, self._storage_options, self._csv_write_options
         )
+        backend, path, backend_name = self._backend(destination, resolved_options)
+        if supports_async_write_stream(backend):
+            writer = AsyncStorageWriter(
+                backend,
+                path,
+                backend_name,
+                format_choice,
+                schema=table.schema,
+                compression=compression,
+                write_options=format_write_options,
+            )
+            await writer._open()  # pyright: ignore[reportPrivateUsage]
+            return await _drain_table_async(writer, table)
         payload = await async_(_encode_arrow_payload)(
             table, format_choice, compression=compression, write_options=format_write_options
         )
         return await self._write_bytes_async(
-            payload, destination, rows=int(table.num_rows), format_label=format_choice, storage_options=resolved_options
+            payload, backend, path, backend_name, rows=int(table.num_rows), format_label=format_choice
+        )
+
+    async def open_writer(
+        self,
+        destination: StorageDestination,
+        *,
+        format_hint: StorageFormat | None = None,
+        storage_options: "dict[str, Any] | None" = None,
+        compression: str | None = None,
+        schema: Any = None,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> AsyncStorageWriter:
+        """Open an incremental writer that encodes batches directly into storage."""
+        format_choice = format_hint or "parquet"
+        _validate_stream_write_format(format_choice)
+        resolved_options = _storage_options(self._storage_options, storage_options)
+        format_write_options = _csv_write_options(
+            format_choice, resolved_options, self._storage_options, self._csv_write_options
         )
+        backend, path, backend_name = self._backend(destination, resolved_options)
+        writer = AsyncStorageWriter(
+            backend,
+            path,
+            backend_name,
+            format_choice,
+            schema=schema,
+            compression=compression,
+            write_options=format_write_options,
+            progress=progress,
+        )
+        await writer._open()  # pyright: ignore[reportPrivateUsage]
+        return writer
+
+    async def delete(self, destination: StorageDestination, *, storage_options: "dict[str, Any] | None" = None) -> None:
+        """Delete a stored object."""
+        backend, path, backend_name = self._backend(destination, storage_options)
+        if supports_async_delete(backend):
+            await execute_async_storage_operation(
+                partial(backend.delete_async, path), backend=backend_name, operation="delete", path=path
+            )
+            return
+        await async_(_delete_backend_sync)(backend=backend, path=path, backend_name=backend_name)
 
     async def cleanup_staging_artifacts(self, artifacts: "list[StagedArtifact]", *, ignore_errors: bool = True) -> None:
         for artifact in artifacts:
@@ -574,13 +1519,13 @@ class AsyncStoragePipeline(_StoragePipelineBase):
     async def _write_bytes_async(
         self,
         payload: bytes,
-        destination: StorageDestination,
+        backend: "ObjectStoreProtocol",
+        path: str,
+        backend_name: str,
         *,
         rows: int,
         format_label: str,
-        storage_options: "dict[str, Any]",
     ) -> StorageTelemetry:
-        backend, path, backend_name = self._backend(destination, storage_options)
         start = perf_counter()
         if supports_async_write_bytes(backend):
             await execute_async_storage_operation(
@@ -606,9 +1551,21 @@ class AsyncStoragePipeline(_StoragePipelineBase):
         return telemetry
 
     async def read_arrow_async(
-        self, source: StorageDestination, *, file_format: StorageFormat, storage_options: "dict[str, Any] | None" = None
+        self,
+        source: StorageDestination,
+        *,
+        file_format: StorageFormat,
+        storage_options: "dict[str, Any] | None" = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
     ) -> "tuple[ArrowTable, StorageTelemetry]":
+        """Read an artifact from storage and decode it into an Arrow table (see ``SyncStoragePipeline.read_arrow``)."""
         backend, path, backend_name = self._backend(source, storage_options)
+        if supports_read_stream(backend) or columns is not None or filter is not None:
+            reader = AsyncStorageReader(backend, path, backend_name, file_format, columns=columns, filter=filter)
+            async with reader:
+                streamed_table = await reader.read_all()
+            return streamed_table, reader.telemetry()
         if supports_async_read_bytes(backend):
             payload = await execute_async_storage_operation(
                 partial(backend.read_bytes_async, path), backend=backend_name, operation="read_bytes", path=path
@@ -627,6 +1584,36 @@ class AsyncStoragePipeline(_StoragePipelineBase):
         }
         return table, telemetry
 
+    async def open_reader(
+        self,
+        source: StorageDestination,
+        *,
+        file_format: StorageFormat,
+        storage_options: "dict[str, Any] | None" = None,
+        batch_size: int | None = None,
+        columns: "list[str] | None" = None,
+        filter: Any = None,
+    ) -> AsyncStorageReader:
+        """Open an incremental reader that decodes record batches straight from storage."""
+        backend, path, backend_name = self._backend(source, storage_options)
+        reader = AsyncStorageReader(
+            backend, path, backend_name, file_format, batch_size=batch_size, columns=columns, filter=filter
+        )
+        await reader._open()  # pyright: ignore[reportPrivateUsage]
+        return reader
+
+    async def expand_sources(
+        self, source: StorageDestination, *, storage_options: "dict[str, Any] | None" = None
+    ) -> "list[str]":
+        """Expand a glob or prefix source into the sorted object URIs it matches."""
+        if not is_multi_source(source):
+            return [source.as_posix() if isinstance(source, Path) else str(source)]
+        prefix, pattern = _source_prefix(source)
+        backend, path, _backend_name = self._backend(prefix, storage_options)
+        listing_prefix = _listing_prefix(prefix, path)
+        keys = await backend.list_objects_async(prefix=listing_prefix, recursive=True)
+        return _match_source_keys(prefix, listing_prefix, backend, keys, pattern)
+
     async def stream_read_async(
         self,
         source: StorageDestination,
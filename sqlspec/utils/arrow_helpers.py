@@ -8,7 +8,8 @@ when compiled drivers touch Arrow objects.
 """
 
 import contextlib
-from collections.abc import Callable, Iterable, Mapping
+import itertools
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping, Sequence
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
@@ -22,10 +23,19 @@ if TYPE_CHECKING:
     from sqlspec.core.result import ArrowResult
     from sqlspec.typing import ArrowRecordBatch, ArrowRecordBatchReader, ArrowTable, PandasDataFrame, PolarsDataFrame
 
+RowChunk = tuple["list[Any]", "list[str]", "Mapping[str, str] | None"]
+
 __all__ = (
+    "ArrowSchemaSettler",
+    "RowChunk",
+    "aiter_arrow_batches",
+    "aiter_row_chunk_batches",
+    "arrow_reader_from_batches",
+    "arrow_reader_from_row_chunks",
     "arrow_reader_to_return_format",
     "arrow_reader_with_deferred_close",
     "arrow_table_column_names",
+    "arrow_table_from_row_batches",
     "arrow_table_needs_parameter_preparation",
     "arrow_table_num_columns",
     "arrow_table_num_rows",
@@ -36,15 +46,20 @@ __all__ = (
     "arrow_table_to_rows",
     "arrow_type_from_token",
     "build_ingest_telemetry",
+    "cast_arrow_batch",
     "cast_arrow_table_schema",
     "coerce_arrow_table",
     "convert_dict_to_arrow",
     "convert_dict_to_arrow_with_schema",
     "ensure_arrow_table",
+    "iter_arrow_batches",
+    "iter_row_chunk_batches",
     "records_to_arrow_table",
+    "rows_to_arrow_batch",
 )
 _ARROW_TABLE_COERCER: "TypeDispatcher[Any] | None" = None
 _ARROW_SCHEMA_DECISION_CACHE_SIZE = 512
+_SCHEMA_HOLDBACK_ROWS = 65_536
 
 
 @overload
@@ -234,6 +249,299 @@ def convert_dict_to_arrow_with_schema(
     return batches[0] if batches else pa.RecordBatch.from_pydict({})
 
 
+def _null_column_type(name: str, column_types: "Mapping[str, str] | None") -> Any:
+    import pyarrow as pa
+
+    if column_types and name in column_types:
+        return arrow_type_from_token(column_types[name])
+    return pa.string()
+
+
+def _column_to_arrow(values: "Sequence[Any]", data_type: Any) -> Any:
+    """Build one Arrow column of a fixed type, casting when the values infer as something else."""
+    import pyarrow as pa
+
+    try:
+        return pa.array(values, type=data_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+        return pa.array(values).cast(data_type)
+
+
+def rows_to_arrow_batch(
+    rows: "Sequence[Sequence[Any]]", column_names: "list[str]", arrow_schema: Any = None
+) -> "ArrowRecordBatch":
+    """Columnarize positional cursor rows into a RecordBatch without building dict rows.
+
+    Column types are inferred from the values unless ``arrow_schema`` fixes them.
+    Columns that are ``NULL`` in every row keep the Arrow ``null`` type so
+    chunks can be promoted together later.
+    """
+    ensure_pyarrow()
+    import pyarrow as pa
+
+    columns = list(zip(*rows, strict=False)) if rows else []
+    if len(columns) < len(column_names):
+        columns.extend(() for _ in range(len(column_names) - len(columns)))
+    if arrow_schema is None:
+        arrays = [pa.array(values) for values in columns[: len(column_names)]]
+        return pa.RecordBatch.from_arrays(arrays, names=column_names)
+    if list(arrow_schema.names) != list(column_names):
+        msg = f"arrow_schema field names {arrow_schema.names} do not match result columns {column_names}"
+        raise ValueError(msg)
+    arrays = [_column_to_arrow(values, field.type) for values, field in zip(columns, arrow_schema, strict=False)]
+    return pa.RecordBatch.from_arrays(arrays, schema=arrow_schema)
+
+
+def arrow_table_from_row_batches(
+    batches: "list[ArrowRecordBatch]",
+    column_names: "list[str]",
+    column_types: "Mapping[str, str] | None" = None,
+    *,
+    combine_chunks: bool = False,
+) -> "ArrowTable":
+    """Concatenate per-chunk batches from :func:`rows_to_arrow_batch` into one table.
+
+    Chunk schemas are promoted permissively (``int64`` and ``double`` become
+    ``double``, ``null`` takes the other chunk's type), matching inference over
+    the whole result. Columns still ``null`` afterwards are typed from
+    ``column_types`` or fall back to ``string``.
+    """
+    ensure_pyarrow()
+    import pyarrow as pa
+
+    if not batches:
+        return pa.schema([(name, _null_column_type(name, column_types)) for name in column_names]).empty_table()
+    tables = [pa.Table.from_batches([batch]) for batch in batches]
+    table = tables[0] if len(tables) == 1 else pa.concat_tables(tables, promote_options="permissive")
+    table = _resolve_null_columns(table, column_types)
+    return table.combine_chunks() if combine_chunks else table
+
+
+class ArrowSchemaSettler:
+    """Hold back value-inferred batches until every column has a concrete type.
+
+    A batch inferred from one chunk of values types a column that is ``NULL``
+    throughout that chunk as Arrow ``null``. Streaming writers and readers must
+    commit to one schema before their first batch goes out, so batches are kept
+    back, their schemas promoted permissively, until every column is typed or
+    ``max_pending_rows`` rows are waiting. Columns still ``null`` then take
+    ``column_types`` or fall back to ``string``. An explicit ``schema`` settles
+    immediately; every batch after settling is cast to the settled schema.
+    """
+
+    __slots__ = ("_column_types", "_max_pending_rows", "_merged", "_pending", "_pending_rows", "_schema")
+
+    def __init__(
+        self,
+        schema: Any = None,
+        column_types: "Mapping[str, str] | None" = None,
+        *,
+        max_pending_rows: int = _SCHEMA_HOLDBACK_ROWS,
+    ) -> None:
+        self._schema = schema
+        self._column_types = column_types
+        self._max_pending_rows = max_pending_rows
+        self._merged: Any = None
+        self._pending: list[ArrowRecordBatch] = []
+        self._pending_rows = 0
+
+    @property
+    def schema(self) -> Any:
+        """Return the settled schema, or ``None`` while batches are held back."""
+        return self._schema
+
+    def push(self, batch: "ArrowRecordBatch") -> "list[ArrowRecordBatch]":
+        """Accept one batch and return the batches that are ready to emit, in order."""
+        if self._schema is not None:
+            return [cast_arrow_batch(batch, self._schema)]
+        import pyarrow as pa
+
+        merged = self._merged
+        self._merged = (
+            batch.schema if merged is None else pa.unify_schemas([merged, batch.schema], promote_options="permissive")
+        )
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        if self._pending_rows < self._max_pending_rows and any(pa.types.is_null(field.type) for field in self._merged):
+            return []
+        return self._settle()
+
+    def flush(self) -> "list[ArrowRecordBatch]":
+        """Settle the schema from whatever is held back and return those batches."""
+        if self._schema is not None or self._merged is None:
+            return []
+        return self._settle()
+
+    def _settle(self) -> "list[ArrowRecordBatch]":
+        import pyarrow as pa
+
+        hints = self._column_types or {}
+        self._schema = pa.schema([
+            field.with_type(_null_column_type(field.name, hints)) if pa.types.is_null(field.type) else field
+            for field in self._merged
+        ])
+        pending = self._pending
+        self._pending = []
+        self._pending_rows = 0
+        return [cast_arrow_batch(batch, self._schema) for batch in pending]
+
+
+def _check_arrow_schema(arrow_schema: Any) -> None:
+    import pyarrow as pa
+
+    if arrow_schema is not None and not isinstance(arrow_schema, pa.Schema):
+        msg = f"arrow_schema must be a pyarrow.Schema, got {type(arrow_schema).__name__}"
+        raise TypeError(msg)
+
+
+def _empty_row_chunk_batch(
+    column_names: "list[str]", column_types: "Mapping[str, str] | None", arrow_schema: Any
+) -> "ArrowRecordBatch":
+    """Build the empty batch carrying the schema of a result with no rows."""
+    import pyarrow as pa
+
+    schema = arrow_schema or pa.schema([(name, _null_column_type(name, column_types)) for name in column_names])
+    return pa.RecordBatch.from_pylist([], schema=schema)
+
+
+def _settled_row_chunk_batches(
+    rows: "list[Any]",
+    column_names: "list[str]",
+    column_types: "Mapping[str, str] | None",
+    fetch_chunk: "Callable[[], RowChunk]",
+    arrow_schema: Any,
+) -> "Iterator[ArrowRecordBatch]":
+    """Yield one batch per row chunk, starting from the already fetched ``rows``.
+
+    Chunks are columnarized by value inference and routed through an
+    :class:`ArrowSchemaSettler` until the schema settles, then built directly
+    against it.
+
+    Yields:
+        Record batches sharing the settled schema.
+    """
+    settler = ArrowSchemaSettler(arrow_schema, column_types)
+    while rows:
+        yield from settler.push(rows_to_arrow_batch(rows, column_names, settler.schema))
+        rows, column_names, _ = fetch_chunk()
+    yield from settler.flush()
+
+
+def arrow_reader_from_row_chunks(
+    fetch_chunk: "Callable[[], RowChunk]", arrow_schema: Any = None
+) -> "ArrowRecordBatchReader":
+    """Return a RecordBatchReader that pulls and columnarizes one row chunk per batch.
+
+    Chunks are fetched eagerly until the schema settles (see
+    :class:`ArrowSchemaSettler`): types are inferred from the values, a column
+    that is ``NULL`` in the first chunks waits for a later chunk to type it, and
+    columns ``NULL`` throughout take the reported column types. Later chunks
+    are built against that schema, so a column whose values change type after
+    it settled needs an explicit ``arrow_schema``. ``fetch_chunk`` returns
+    ``(rows, column_names, column_types)``; empty rows end the stream.
+    """
+    ensure_pyarrow()
+    import pyarrow as pa
+
+    _check_arrow_schema(arrow_schema)
+    rows, column_names, column_types = fetch_chunk()
+    if not rows:
+        empty = _empty_row_chunk_batch(column_names, column_types, arrow_schema)
+        return pa.RecordBatchReader.from_batches(empty.schema, [])
+    batches = _settled_row_chunk_batches(rows, column_names, column_types, fetch_chunk, arrow_schema)
+    first = next(batches)
+    return pa.RecordBatchReader.from_batches(first.schema, itertools.chain((first,), batches))
+
+
+def iter_row_chunk_batches(stream: Any, arrow_schema: Any = None) -> "Iterator[ArrowRecordBatch]":
+    """Yield one RecordBatch per positional row chunk of a sync row stream.
+
+    Schema handling matches :func:`arrow_reader_from_row_chunks`, and an empty
+    result yields a single empty batch carrying the schema. The stream is closed
+    when the generator finishes or is closed.
+    """
+    ensure_pyarrow()
+    _check_arrow_schema(arrow_schema)
+    try:
+        rows, column_names, column_types = stream.next_row_chunk()
+        if not rows:
+            yield _empty_row_chunk_batch(column_names, column_types, arrow_schema)
+            return
+        yield from _settled_row_chunk_batches(rows, column_names, column_types, stream.next_row_chunk, arrow_schema)
+    finally:
+        stream.close()
+
+
+async def aiter_row_chunk_batches(stream: Any, arrow_schema: Any = None) -> "AsyncIterator[ArrowRecordBatch]":
+    """Async counterpart of :func:`iter_row_chunk_batches` over an async row stream.
+
+    Yields:
+        One RecordBatch per row chunk.
+    """
+    ensure_pyarrow()
+    _check_arrow_schema(arrow_schema)
+    try:
+        rows, column_names, column_types = await stream.next_row_chunk()
+        if not rows:
+            yield _empty_row_chunk_batch(column_names, column_types, arrow_schema)
+            return
+        settler = ArrowSchemaSettler(arrow_schema, column_types)
+        while rows:
+            for batch in settler.push(rows_to_arrow_batch(rows, column_names, settler.schema)):
+                yield batch
+            rows, column_names, _ = await stream.next_row_chunk()
+        for batch in settler.flush():
+            yield batch
+    finally:
+        await stream.aclose()
+
+
+def cast_arrow_batch(batch: "ArrowRecordBatch", arrow_schema: Any) -> "ArrowRecordBatch":
+    """Cast a RecordBatch to ``arrow_schema``; returns it unchanged when no schema is given."""
+    if arrow_schema is None or batch.schema.equals(arrow_schema):
+        return batch
+    ensure_pyarrow()
+    import pyarrow as pa
+
+    _check_arrow_schema(arrow_schema)
+    table = pa.Table.from_batches([batch]).cast(arrow_schema)
+    return pa.RecordBatch.from_arrays([column.combine_chunks() for column in table.columns], schema=table.schema)
+
+
+def iter_arrow_batches(batches: "Iterable[ArrowRecordBatch]", arrow_schema: Any = None) -> "Iterator[ArrowRecordBatch]":
+    """Yield batches from a reader or batch iterator cast to ``arrow_schema``.
+
+    The source's ``close()`` (RecordBatchReader, generator) is called when the
+    generator finishes or is closed.
+    """
+    try:
+        for batch in batches:
+            yield cast_arrow_batch(batch, arrow_schema)
+    finally:
+        close = getattr(batches, "close", None)
+        if callable(close):
+            close()
+
+
+async def aiter_arrow_batches(batches: Any, arrow_schema: Any = None) -> "AsyncIterator[ArrowRecordBatch]":
+    """Async counterpart of :func:`iter_arrow_batches` for async or plain batch iterables.
+
+    Yields:
+        Each batch cast to ``arrow_schema``.
+    """
+    if not hasattr(batches, "__aiter__"):
+        for batch in iter_arrow_batches(batches, arrow_schema):
+            yield batch
+        return
+    try:
+        async for batch in batches:
+            yield cast_arrow_batch(batch, arrow_schema)
+    finally:
+        aclose = getattr(batches, "aclose", None)
+        if callable(aclose):
+            await aclose()
+
+
 def records_to_arrow_table(
     records: "Iterable[Mapping[str, Any]] | Iterable[Iterable[Any]]", columns: "list[str] | None"
 ) -> "ArrowTable":
@@ -510,6 +818,19 @@ def build_ingest_telemetry(table: "ArrowTable", *, format_label: str = "arrow")
     return {"rows_processed": rows, "bytes_processed": bytes_processed, "format": format_label}
 
 
+def arrow_reader_from_batches(batches: "Iterator[ArrowRecordBatch]") -> "ArrowRecordBatchReader":
+    """Return a RecordBatchReader over a lazy batch iterator.
+
+    The first batch is pulled eagerly to fix the schema, so the iterator must
+    yield at least one (possibly empty) batch.
+    """
+    ensure_pyarrow()
+    import pyarrow as pa
+
+    first = next(batches)
+    return pa.RecordBatchReader.from_batches(first.schema, itertools.chain((first,), batches))
+
+
 class _DeferredCloseBatchIterator:
     """Iterate RecordBatches from a reader and invoke a callback on exhaustion or error."""
 
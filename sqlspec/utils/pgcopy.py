@@ -0,0 +1,716 @@
+"""PostgreSQL binary COPY (PGCOPY) codec for Arrow record batches.
+
+Decodes the output of ``COPY (...) TO STDOUT (FORMAT BINARY)`` into Arrow
+RecordBatches using the result's column type OIDs, and encodes Arrow data into
+the payload of ``COPY ... FROM STDIN (FORMAT BINARY)`` using the target
+table's column type OIDs. Neither direction builds a Python object per value:
+the decoder locates rows and gathers columns with NumPy array operations over
+the buffered bytes, so decoding needs NumPy, and the adapters fall back to
+fetching rows when it is missing. Shared by the PostgreSQL-family adapters.
+
+NOTE: This module is excluded from mypyc compilation; it assembles PyArrow
+buffers directly and hosts the generators that feed the compiled drivers.
+"""
+
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Final, Protocol, cast
+
+from sqlspec.typing import NUMPY_INSTALLED
+from sqlspec.utils.module_loader import ensure_numpy, ensure_pyarrow
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Generator, Sequence
+
+    from sqlspec.typing import ArrowRecordBatch, ArrowSchema, ArrowTable
+
+__all__ = (
+    "PGCOPY_ENCODE_BATCH_SIZE",
+    "PGCOPY_SIGNATURE",
+    "AsyncCopyChunkSource",
+    "PgCopyBinaryDecoder",
+    "PgCopyBinaryEncoder",
+    "SyncCopyChunkSource",
+    "aiter_copy_batches",
+    "aiter_pgcopy_chunks",
+    "build_copy_describe_sql",
+    "build_copy_to_stdout_sql",
+    "create_pgcopy_decoder",
+    "create_pgcopy_encoder",
+    "iter_copy_batches",
+    "iter_pgcopy_chunks",
+    "pgcopy_arrow_schema",
+)
+
+PGCOPY_SIGNATURE: Final = b"PGCOPY\n\xff\r\n\x00"
+PGCOPY_ENCODE_BATCH_SIZE: Final = 65_536
+_PGCOPY_HEADER: Final = PGCOPY_SIGNATURE + bytes(8)
+_PGCOPY_TRAILER: Final = b"\xff\xff"
+_NULL_FIELD: Final = b"\xff\xff\xff\xff"
+_HEADER_PREFIX_SIZE: Final = len(PGCOPY_SIGNATURE) + 8
+_FLAG_WITH_OIDS: Final = 1 << 16
+_PG_EPOCH_DAYS: Final = 10_957
+_PG_EPOCH_MICROS: Final = 946_684_800_000_000
+_MAX_INT32_OFFSET: Final = 2**31 - 1
+_SWAP_BYTES: Final = sys.byteorder == "little"
+_INT16: Final = struct.Struct(">h")
+_INT32: Final = struct.Struct(">i")
+_WIDTH_TYPECODES: Final = {array(code).itemsize: code for code in ("q", "l", "i", "h")}
+_VALUE_DTYPES: Final = {"bool": "u1", "float32": ">f4", "float64": ">f8", "uuid": "V16"}
+
+# OID -> (fixed width or 0 for variable width, decoded kind)
+_PG_TYPE_LAYOUTS: Final["dict[int, tuple[int, str]]"] = {
+    16: (1, "bool"),
+    17: (0, "binary"),
+    19: (0, "text"),
+    20: (8, "int64"),
+    21: (2, "int16"),
+    23: (4, "int32"),
+    25: (0, "text"),
+    700: (4, "float32"),
+    701: (8, "float64"),
+    1042: (0, "text"),
+    1043: (0, "text"),
+    1082: (4, "date"),
+    1083: (8, "time"),
+    1114: (8, "timestamp"),
+    1184: (8, "timestamptz"),
+    2950: (16, "uuid"),
+}
+
+
+class SyncCopyChunkSource(Protocol):
+    """Pull-style source of raw COPY OUT bytes; an empty chunk ends the stream."""
+
+    def read(self) -> "bytes | bytearray | memoryview": ...
+
+    def close(self, error: bool = False) -> None: ...
+
+
+class AsyncCopyChunkSource(Protocol):
+    """Async pull-style source of raw COPY OUT bytes; an empty chunk ends the stream."""
+
+    def read(self) -> "Awaitable[bytes | bytearray | memoryview]": ...
+
+    def close(self, error: bool = False) -> "Awaitable[None]": ...
+
+
+def build_copy_to_stdout_sql(sql: str) -> str:
+    """Wrap a SELECT in ``COPY (...) TO STDOUT (FORMAT BINARY)``."""
+    return f"COPY ({sql.strip().rstrip(';')}) TO STDOUT (FORMAT BINARY)"
+
+
+def build_copy_describe_sql(sql: str) -> str:
+    """Wrap a SELECT so that running it only returns the result's column description."""
+    return f"SELECT * FROM ({sql.strip().rstrip(';')}) AS sqlspec_copy_describe LIMIT 0"
+
+
+def _storage_type(kind: str, width: int) -> Any:
+    import pyarrow as pa
+
+    if kind in {"text", "binary"}:
+        return pa.string() if kind == "text" else pa.binary()
+    if kind == "bool":
+        return pa.uint8()
+    if kind == "uuid":
+        return pa.binary(width)
+    if kind in {"float32", "float64"}:
+        return pa.float32() if kind == "float32" else pa.float64()
+    return {2: pa.int16(), 4: pa.int32(), 8: pa.int64()}[width]
+
+
+def _arrow_type(kind: str, width: int) -> Any:
+    import pyarrow as pa
+
+    if kind == "bool":
+        return pa.bool_()
+    if kind == "date":
+        return pa.date32()
+    if kind == "time":
+        return pa.time64("us")
+    if kind == "timestamp":
+        return pa.timestamp("us")
+    if kind == "timestamptz":
+        return pa.timestamp("us", tz="UTC")
+    if kind == "uuid":
+        uuid_type = getattr(pa, "uuid", None)
+        return uuid_type() if uuid_type is not None else pa.binary(width)
+    return _storage_type(kind, width)
+
+
+def pgcopy_arrow_schema(columns: "Sequence[tuple[str, int]]") -> "ArrowSchema | None":
+    """Return the Arrow schema for ``(name, type_oid)`` columns, or None if any type is undecodable."""
+    ensure_pyarrow()
+    import pyarrow as pa
+
+    fields = []
+    for name, oid in columns:
+        layout = _PG_TYPE_LAYOUTS.get(oid)
+        if layout is None:
+            return None
+        fields.append(pa.field(name, _arrow_type(layout[1], layout[0])))
+    return pa.schema(fields)
+
+
+def create_pgcopy_decoder(columns: "Sequence[tuple[str, int]]", batch_size: int) -> "PgCopyBinaryDecoder | None":
+    """Return a decoder for ``(name, type_oid)`` columns.
+
+    Returns None when a column type is not supported or NumPy is not installed.
+    """
+    if not NUMPY_INSTALLED or not columns or any(oid not in _PG_TYPE_LAYOUTS for _, oid in columns):
+        return None
+    return PgCopyBinaryDecoder(columns, batch_size=batch_size)
+
+
+class _ColumnLayout:
+    __slots__ = ("arrow_type", "kind", "storage_type", "value_dtype", "width")
+
+    def __init__(self, kind: str, width: int) -> None:
+        self.kind = kind
+        self.width = width
+        self.storage_type = _storage_type(kind, width)
+        self.arrow_type = _arrow_type(kind, width)
+        self.value_dtype = _VALUE_DTYPES.get(kind, f">i{width}") if width else ""
+
+
+def _strided(data: bytes, dtype: str) -> Any:
+    """View ``data`` as one ``dtype`` value starting at every byte offset."""
+    import numpy as np
+
+    item = np.dtype(dtype)
+    return np.ndarray((max(len(data) - item.itemsize + 1, 0),), dtype=item, buffer=data, strides=(1,))
+
+
+def _locate_rows(data: bytes, layouts: "list[_ColumnLayout]") -> "tuple[Any, int]":
+    """Return the start offsets of the complete rows at the head of ``data`` and the offset after them.
+
+    Every offset holding the column count is a candidate row start, and all
+    candidates are parsed at once, one column at a time, dropping those whose
+    field lengths do not fit the column types or run past the data. Rows chain
+    from offset 0, so candidates that only sit inside a value are skipped by
+    following the chain whenever the survivors are not already consecutive.
+    """
+    import numpy as np
+
+    size = len(data)
+    if size < 2 + 4 * len(layouts):
+        return np.zeros(0, dtype=np.int64), 0
+    lengths_at = _strided(data, ">i4")
+    candidates = np.flatnonzero(_strided(data, ">u2") == len(layouts))
+    positions = candidates + 2
+    valid = np.ones(len(candidates), dtype=bool)
+    for layout in layouts:
+        inside = positions + 4 <= size
+        valid &= inside
+        lengths = lengths_at[np.where(inside, positions, 0)].astype(np.int64)
+        valid &= (lengths == -1) | ((lengths == layout.width) if layout.width else (lengths >= 0))
+        positions = positions + 4 + np.maximum(lengths, 0)
+    valid &= positions <= size
+    starts = candidates[valid]
+    ends = positions[valid]
+    if not len(starts) or starts[0] != 0:
+        return starts[:0], 0
+    if not np.array_equal(ends[:-1], starts[1:]):
+        following = np.searchsorted(starts, ends)
+        following[following == len(starts)] = 0
+        links = np.where(starts[following] == ends, following, -1).tolist()
+        chain = [0]
+        while links[chain[-1]] > 0:
+            chain.append(links[chain[-1]])
+        starts = starts[chain]
+        ends = ends[chain]
+    return starts, int(ends[-1])
+
+
+class PgCopyBinaryDecoder:
+    """Incremental decoder from PGCOPY binary bytes to Arrow RecordBatches.
+
+    Bytes are appended with :meth:`feed`, which returns every batch of
+    ``batch_size`` rows that is complete so far; :meth:`finish` flushes the
+    tail. Supported types are bool, bytea, text-like, integer, float, date,
+    time, timestamp, timestamptz and uuid. Rows are located and columns are
+    gathered with NumPy array operations over the buffered bytes; the buffer is
+    rescanned once it has doubled since the last scan that found no full batch.
+    """
+
+    __slots__ = (
+        "_batch_size",
+        "_buffer",
+        "_emitted",
+        "_finished",
+        "_header_done",
+        "_layouts",
+        "_scan_size",
+        "_schema",
+        "rows_decoded",
+    )
+
+    def __init__(self, columns: "Sequence[tuple[str, int]]", *, batch_size: int = 10_000) -> None:
+        ensure_pyarrow()
+        ensure_numpy()
+        import pyarrow as pa
+
+        if batch_size <= 0:
+            msg = "batch_size must be a positive integer"
+            raise ValueError(msg)
+        layouts = []
+        for name, oid in columns:
+            layout = _PG_TYPE_LAYOUTS.get(oid)
+            if layout is None:
+                msg = f"Column '{name}' has type OID {oid}, which the binary COPY decoder does not support"
+                raise ValueError(msg)
+            layouts.append(_ColumnLayout(layout[1], layout[0]))
+        self._layouts = layouts
+        self._schema = pa.schema([
+            pa.field(name, layout.arrow_type) for (name, _), layout in zip(columns, layouts, strict=True)
+        ])
+        self._batch_size = batch_size
+        self._buffer = bytearray()
+        self._header_done = False
+        self._finished = False
+        self._emitted = False
+        self._scan_size = 0
+        self.rows_decoded = 0
+
+    @property
+    def schema(self) -> "ArrowSchema":
+        """Arrow schema of the decoded batches."""
+        return self._schema
+
+    def feed(self, data: "bytes | bytearray | memoryview") -> "list[ArrowRecordBatch]":
+        """Append COPY bytes and return the batches completed by them."""
+        if self._finished:
+            if data:
+                msg = "PGCOPY stream has data after the file trailer"
+                raise ValueError(msg)
+            return []
+        buffer = self._buffer
+        buffer += data
+        if len(buffer) < self._scan_size:
+            return []
+        return self._drain(final=False)
+
+    def finish(self) -> "list[ArrowRecordBatch]":
+        """Flush the remaining rows once the COPY stream has ended.
+
+        An empty result still yields one empty batch so consumers see the schema.
+        """
+        batches = self._drain(final=True)
+        if not self._finished or self._buffer:
+            msg = "PGCOPY stream ended before the file trailer"
+            raise ValueError(msg)
+        if not self._emitted:
+            import pyarrow as pa
+
+            batches.append(pa.RecordBatch.from_pylist([], schema=self._schema))
+            self._emitted = True
+        return batches
+
+    def _drain(self, final: bool) -> "list[ArrowRecordBatch]":
+        batches: list[ArrowRecordBatch] = []
+        if self._finished or (not self._header_done and not self._read_header()):
+            return batches
+        buffer = self._buffer
+        data = bytes(buffer)
+        starts, end = _locate_rows(data, self._layouts)
+        self._finished = data[end : end + 2] == _PGCOPY_TRAILER
+        if not self._finished:
+            self._check_row(data, end)
+        rows = len(starts)
+        usable = rows if self._finished else rows - rows % self._batch_size
+        batches.extend(
+            self._decode(data, starts[offset : offset + self._batch_size])
+            for offset in range(0, usable, self._batch_size)
+        )
+        if self._finished:
+            del buffer[: end + 2]
+        else:
+            del buffer[: end if usable == rows else int(starts[usable])]
+        self._scan_size = 2 * len(buffer)
+        return batches
+
+    def _read_header(self) -> bool:
+        buffer = self._buffer
+        if len(buffer) < _HEADER_PREFIX_SIZE:
+            return False
+        if buffer[: len(PGCOPY_SIGNATURE)] != PGCOPY_SIGNATURE:
+            msg = "Data is not a PostgreSQL binary COPY stream"
+            raise ValueError(msg)
+        (flags,) = _INT32.unpack_from(buffer, len(PGCOPY_SIGNATURE))
+        if flags & _FLAG_WITH_OIDS:
+            msg = "Binary COPY streams that include row OIDs are not supported"
+            raise ValueError(msg)
+        (extension_length,) = _INT32.unpack_from(buffer, len(PGCOPY_SIGNATURE) + 4)
+        header_size = _HEADER_PREFIX_SIZE + extension_length
+        if len(buffer) < header_size:
+            return False
+        del buffer[:header_size]
+        self._header_done = True
+        return True
+
+    def _check_row(self, data: bytes, position: int) -> None:
+        """Raise if the row at ``position`` is malformed; return quietly while it is only incomplete."""
+        size = len(data)
+        if position + 2 > size:
+            return
+        (field_count,) = _INT16.unpack_from(data, position)
+        if field_count != len(self._layouts):
+            msg = f"PGCOPY row has {field_count} fields, expected {len(self._layouts)}"
+            raise ValueError(msg)
+        cursor = position + 2
+        for name, layout in zip(self._schema.names, self._layouts, strict=True):
+            if cursor + 4 > size:
+                return
+            (length,) = _INT32.unpack_from(data, cursor)
+            if length < -1 or (layout.width and length not in {-1, layout.width}):
+                msg = f"PGCOPY field for column '{name}' has invalid length {length}"
+                raise ValueError(msg)
+            cursor += 4 + max(length, 0)
+
+    def _decode(self, data: bytes, starts: Any) -> "ArrowRecordBatch":
+        import numpy as np
+        import pyarrow as pa
+
+        rows = len(starts)
+        lengths_at = _strided(data, ">i4")
+        bytes_at = np.frombuffer(data, dtype=np.uint8)
+        positions = starts + 2
+        arrays = []
+        for layout in self._layouts:
+            lengths = lengths_at[positions].astype(np.int64)
+            fields = positions + 4
+            valid = lengths >= 0
+            null_count = rows - int(np.count_nonzero(valid))
+            validity = pa.py_buffer(np.packbits(valid, bitorder="little")) if null_count else None
+            sizes = np.maximum(lengths, 0)
+            if layout.width:
+                values = _strided(data, layout.value_dtype)[np.where(valid, fields, 0) if null_count else fields]
+                if values.dtype.byteorder == ">":
+                    values = values.astype(values.dtype.newbyteorder("="))
+                storage = pa.Array.from_buffers(layout.storage_type, rows, [validity, pa.py_buffer(values)], null_count)
+            else:
+                offsets = np.zeros(rows + 1, dtype=np.int64)
+                np.cumsum(sizes, out=offsets[1:])
+                total = int(offsets[-1])
+                values = bytes_at[np.repeat(fields - offsets[:-1], sizes) + np.arange(total)]
+                data_type = layout.storage_type
+                if total > _MAX_INT32_OFFSET:
+                    data_type = pa.large_string() if layout.kind == "text" else pa.large_binary()
+                else:
+                    offsets = offsets.astype(np.int32)
+                storage = pa.Array.from_buffers(
+                    data_type, rows, [validity, pa.py_buffer(offsets), pa.py_buffer(values)], null_count
+                )
+            arrays.append(_finalize(layout, storage))
+            positions = fields + sizes
+        self.rows_decoded += rows
+        self._emitted = True
+        return pa.RecordBatch.from_arrays(arrays, schema=self._schema)
+
+
+def _finalize(layout: _ColumnLayout, storage: Any) -> Any:
+    """Turn the raw storage array into the column's Arrow type."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    kind = layout.kind
+    if kind == "bool":
+        return storage.cast(pa.bool_())
+    if kind == "date":
+        return pc.add(storage, pa.scalar(_PG_EPOCH_DAYS, pa.int32())).view(pa.date32())
+    if kind in {"timestamp", "timestamptz"}:
+        return pc.add(storage, pa.scalar(_PG_EPOCH_MICROS, pa.int64())).view(layout.arrow_type)
+    if kind == "time":
+        return storage.view(pa.time64("us"))
+    if kind == "uuid" and layout.arrow_type != layout.storage_type:
+        return pa.ExtensionArray.from_storage(layout.arrow_type, storage)
+    return storage
+
+
+def _is_uuid_type(data_type: Any) -> bool:
+    return getattr(data_type, "extension_name", None) == "arrow.uuid"
+
+
+def _can_encode(data_type: Any, kind: str, width: int) -> bool:
+    """Return True when Arrow ``data_type`` can be written as the target column ``kind``."""
+    import pyarrow as pa
+
+    types = pa.types
+    if types.is_null(data_type):
+        return True
+    if types.is_dictionary(data_type):
+        return _can_encode(data_type.value_type, kind, width)
+    if kind in {"int16", "int32", "int64"}:
+        return bool(types.is_integer(data_type))
+    if kind in {"float32", "float64"}:
+        return bool(types.is_integer(data_type) or types.is_floating(data_type))
+    if kind == "bool":
+        return bool(types.is_boolean(data_type))
+    if kind == "text":
+        return bool(types.is_string(data_type) or types.is_large_string(data_type) or str(data_type) == "string_view")
+    if kind == "binary":
+        return bool(
+            types.is_binary(data_type)
+            or types.is_large_binary(data_type)
+            or types.is_fixed_size_binary(data_type)
+            or str(data_type) == "binary_view"
+        )
+    if kind == "date":
+        return bool(types.is_date(data_type))
+    if kind == "time":
+        return bool(types.is_time(data_type))
+    if kind in {"timestamp", "timestamptz"}:
+        return bool(types.is_timestamp(data_type))
+    if kind == "uuid":
+        return _is_uuid_type(data_type) or (types.is_fixed_size_binary(data_type) and data_type.byte_width == width)
+    return False
+
+
+def create_pgcopy_encoder(
+    schema: "ArrowSchema", target_columns: "Sequence[tuple[str, int]]"
+) -> "PgCopyBinaryEncoder | None":
+    """Return an encoder for ``schema`` into a table with ``(name, type_oid)`` columns.
+
+    Returns None when an Arrow column is missing from the target, the target
+    column type is not supported, or the Arrow type cannot be written as it.
+    """
+    target_types = dict(target_columns)
+    oids = []
+    for field in schema:
+        oid = target_types.get(field.name)
+        layout = _PG_TYPE_LAYOUTS.get(oid) if oid is not None else None
+        if layout is None or not _can_encode(field.type, layout[1], layout[0]):
+            return None
+        oids.append(cast("int", oid))
+    if not oids:
+        return None
+    return PgCopyBinaryEncoder(schema, oids)
+
+
+class PgCopyBinaryEncoder:
+    """Encoder from Arrow RecordBatches to PGCOPY binary tuples.
+
+    Each column is cast to the big-endian wire layout of its target type in
+    bulk. Runs of NULL-free fixed-width columns are written into one strided
+    buffer per batch; variable-width and nullable columns are length-prefixed
+    with ``binary_join_element_wise`` and joined with the fixed runs, so no
+    Python object is created per value. The first chunk of a COPY stream must
+    start with :attr:`header` and the last one must be :attr:`trailer`.
+    """
+
+    __slots__ = ("_layouts", "_names")
+
+    header: Final = _PGCOPY_HEADER
+    trailer: Final = _PGCOPY_TRAILER
+
+    def __init__(self, schema: "ArrowSchema", type_oids: "Sequence[int]") -> None:
+        ensure_pyarrow()
+        if len(schema) != len(type_oids):
+            msg = "type_oids must name one target type per Arrow column"
+            raise ValueError(msg)
+        layouts = []
+        for field, oid in zip(schema, type_oids, strict=True):
+            layout = _PG_TYPE_LAYOUTS.get(oid)
+            if layout is None or not _can_encode(field.type, layout[1], layout[0]):
+                msg = f"Column '{field.name}' of type {field.type} cannot be encoded for type OID {oid}"
+                raise ValueError(msg)
+            layouts.append(_ColumnLayout(layout[1], layout[0]))
+        self._layouts = layouts
+        self._names = list(schema.names)
+
+    @property
+    def column_names(self) -> "list[str]":
+        """Column names in COPY order."""
+        return self._names
+
+    def encode(self, batch: "ArrowRecordBatch") -> bytes:
+        """Return the PGCOPY tuples for every row of ``batch``."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        rows = batch.num_rows
+        if rows == 0:
+            return b""
+        segments: list[Any] = []
+        template = bytearray(_INT16.pack(len(self._layouts)))
+        overlays: list[tuple[int, int, bytes]] = []
+        for layout, column in zip(self._layouts, batch.columns, strict=True):
+            if pa.types.is_null(column.type):
+                segments.extend(_close_fixed_run(template, overlays, rows))
+                template, overlays = bytearray(), []
+                segments.append(pa.nulls(rows, pa.large_binary()).fill_null(pa.scalar(_NULL_FIELD, pa.large_binary())))
+                continue
+            storage = _encode_storage(layout, column)
+            width = layout.width
+            if width and storage.null_count == 0:
+                template += _INT32.pack(width)
+                overlays.append((len(template), width, _big_endian_values(storage, layout)))
+                template += bytes(width)
+                continue
+            segments.extend(_close_fixed_run(template, overlays, rows))
+            template, overlays = bytearray(), []
+            if width:
+                fields = _fixed_run_array(
+                    bytearray(_INT32.pack(width) + bytes(width)),
+                    [(4, width, _big_endian_values(storage, layout))],
+                    rows,
+                )
+                segments.append(pc.if_else(pc.is_valid(storage), fields, pa.scalar(_NULL_FIELD, pa.large_binary())))
+            else:
+                prefixes = pa.Array.from_buffers(
+                    pa.binary(4), rows, [None, pa.py_buffer(_big_endian_lengths(storage))]
+                ).cast(pa.large_binary())
+                joined = pc.binary_join_element_wise(prefixes, storage, pa.scalar(b"", pa.large_binary()))
+                segments.append(joined.fill_null(pa.scalar(_NULL_FIELD, pa.large_binary())))
+        if not segments:
+            return bytes(_fill_fixed_run(template, overlays, rows))
+        segments.extend(_close_fixed_run(template, overlays, rows))
+        joined_rows = pc.binary_join_element_wise(*segments, pa.scalar(b"", pa.large_binary()))
+        offsets = memoryview(joined_rows.buffers()[1]).cast("q")
+        start = offsets[joined_rows.offset]
+        end = offsets[joined_rows.offset + rows]
+        return joined_rows.buffers()[2][start:end].to_pybytes()
+
+
+def _encode_storage(layout: _ColumnLayout, column: Any) -> Any:
+    """Cast ``column`` to the storage array whose values are the column's wire payload."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_dictionary(column.type):
+        column = column.dictionary_decode()
+    kind = layout.kind
+    if kind == "text":
+        return column.cast(pa.large_string()).cast(pa.large_binary())
+    if kind == "binary":
+        return column.cast(pa.large_binary())
+    if kind == "uuid":
+        return column.storage if _is_uuid_type(column.type) else column
+    if kind == "bool":
+        return column.cast(pa.uint8())
+    if kind in {"float32", "float64"}:
+        return column.cast(layout.storage_type, safe=False)
+    if kind == "date":
+        days = column.cast(pa.date32()).view(pa.int32())
+        return pc.subtract(days, pa.scalar(_PG_EPOCH_DAYS, pa.int32()))
+    if kind == "time":
+        return column.cast(pa.time64("us"), safe=False).view(pa.int64())
+    if kind in {"timestamp", "timestamptz"}:
+        micros = column.cast(pa.timestamp("us", tz=column.type.tz), safe=False).view(pa.int64())
+        return pc.subtract(micros, pa.scalar(_PG_EPOCH_MICROS, pa.int64()))
+    return column.cast(layout.storage_type)
+
+
+def _big_endian_values(storage: Any, layout: _ColumnLayout) -> bytes:
+    width = layout.width
+    start = storage.offset * width
+    data = memoryview(storage.buffers()[1])[start : start + len(storage) * width]
+    if width == 1 or not _SWAP_BYTES or layout.kind == "uuid":
+        return bytes(data)
+    values = array(_WIDTH_TYPECODES[width])
+    values.frombytes(data)
+    values.byteswap()
+    return values.tobytes()
+
+
+def _big_endian_lengths(storage: Any) -> bytes:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    lengths = pc.binary_length(storage).cast(pa.int32()).fill_null(0)
+    values = array(_WIDTH_TYPECODES[4])
+    values.frombytes(memoryview(lengths.buffers()[1])[lengths.offset * 4 : (lengths.offset + len(lengths)) * 4])
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _fill_fixed_run(template: bytearray, overlays: "list[tuple[int, int, bytes]]", rows: int) -> bytearray:
+    """Repeat the constant ``template`` row and write each column's bytes into it with strided copies."""
+    row_size = len(template)
+    out = template * rows
+    for offset, width, data in overlays:
+        for index in range(width):
+            out[offset + index :: row_size] = data[index::width]
+    return out
+
+
+def _fixed_run_array(template: bytearray, overlays: "list[tuple[int, int, bytes]]", rows: int) -> Any:
+    import pyarrow as pa
+
+    data = _fill_fixed_run(template, overlays, rows)
+    return pa.Array.from_buffers(pa.binary(len(template)), rows, [None, pa.py_buffer(data)]).cast(pa.large_binary())
+
+
+def _close_fixed_run(template: bytearray, overlays: "list[tuple[int, int, bytes]]", rows: int) -> "list[Any]":
+    import pyarrow as pa
+
+    if not template:
+        return []
+    if not overlays:
+        return [pa.scalar(bytes(template), pa.large_binary())]
+    return [_fixed_run_array(template, overlays, rows)]
+
+
+def iter_pgcopy_chunks(
+    table: "ArrowTable", encoder: PgCopyBinaryEncoder, *, batch_size: int = PGCOPY_ENCODE_BATCH_SIZE
+) -> "Generator[bytes, None, None]":
+    """Yield the complete PGCOPY stream for ``table``: header, one chunk per batch, trailer."""
+    yield encoder.header
+    for batch in table.to_batches(max_chunksize=batch_size):
+        chunk = encoder.encode(batch)
+        if chunk:
+            yield chunk
+    yield encoder.trailer
+
+
+async def aiter_pgcopy_chunks(
+    table: "ArrowTable", encoder: PgCopyBinaryEncoder, *, batch_size: int = PGCOPY_ENCODE_BATCH_SIZE
+) -> "AsyncGenerator[bytes, None]":
+    """Async twin of :func:`iter_pgcopy_chunks` for drivers that take an async iterable COPY source.
+
+    Yields:
+        PGCOPY byte chunks in stream order.
+    """
+    for chunk in iter_pgcopy_chunks(table, encoder, batch_size=batch_size):
+        yield chunk
+
+
+def iter_copy_batches(
+    source: "SyncCopyChunkSource", decoder: PgCopyBinaryDecoder
+) -> "Generator[ArrowRecordBatch, None, None]":
+    """Yield decoded batches while pulling COPY bytes from ``source``; the source is always closed."""
+    failed = True
+    try:
+        while True:
+            data = source.read()
+            if not data:
+                yield from decoder.finish()
+                break
+            yield from decoder.feed(data)
+        failed = False
+    finally:
+        source.close(error=failed)
+
+
+async def aiter_copy_batches(
+    source: "AsyncCopyChunkSource", decoder: PgCopyBinaryDecoder
+) -> "AsyncGenerator[ArrowRecordBatch, None]":
+    """Async twin of :func:`iter_copy_batches`.
+
+    Yields:
+        Decoded RecordBatches; at least one, even for an empty result.
+    """
+    failed = True
+    try:
+        while True:
+            data = await source.read()
+            batches = decoder.feed(data) if data else decoder.finish()
+            for batch in batches:
+                yield batch
+            if not data:
+                break
+        failed = False
+    finally:
+        await source.close(error=failed)
@@ -52,6 +52,7 @@ if TYPE_CHECKING:
         AsyncReadableProtocol,
         AsyncReadBytesProtocol,
         AsyncWriteBytesProtocol,
+        AsyncWriteStreamProtocol,
         CursorMetadataProtocol,
         HasAddListenerProtocol,
         HasAsDictProtocol,
@@ -76,15 +77,18 @@ if TYPE_CHECKING:
         HasTypecodeSizedProtocol,
         HasWhereProtocol,
         MappingLikeProtocol,
+        MemoryMapProtocol,
         NotificationProtocol,
         PipelineCapableProtocol,
         QueryResultProtocol,
         ReadableProtocol,
+        ReadStreamProtocol,
         SpanAttributeProtocol,
         SupportsArrayProtocol,
         SupportsCloseProtocol,
         SupportsDtypeStrProtocol,
         SupportsJsonTypeProtocol,
+        WriteStreamProtocol,
     )
     from sqlspec.typing import SupportedSchemaModel
 
@@ -184,9 +188,13 @@ __all__ = (
     "supports_async_delete",
     "supports_async_read_bytes",
     "supports_async_write_bytes",
+    "supports_async_write_stream",
     "supports_close",
     "supports_json_type",
+    "supports_memory_mapped_reads",
+    "supports_read_stream",
     "supports_where",
+    "supports_write_stream",
 )
 
 
@@ -382,6 +390,38 @@ def supports_async_write_bytes(obj: Any) -> "TypeGuard[AsyncWriteBytesProtocol]"
         return False
 
 
+def supports_async_write_stream(obj: Any) -> "TypeGuard[AsyncWriteStreamProtocol]":
+    """Check if backend supports async streaming writers."""
+    try:
+        return callable(obj.open_write_stream_async)
+    except AttributeError:
+        return False
+
+
+def supports_read_stream(obj: Any) -> "TypeGuard[ReadStreamProtocol]":
+    """Check if backend supports seekable streaming readers."""
+    try:
+        return callable(obj.open_read_stream_sync)
+    except AttributeError:
+        return False
+
+
+def supports_memory_mapped_reads(obj: Any) -> "TypeGuard[MemoryMapProtocol]":
+    """Check if backend can memory-map the objects it stores."""
+    try:
+        return bool(obj.supports_memory_map) and callable(obj.open_memory_map_sync)
+    except AttributeError:
+        return False
+
+
+def supports_write_stream(obj: Any) -> "TypeGuard[WriteStreamProtocol]":
+    """Check if backend supports synchronous streaming writers."""
+    try:
+        return callable(obj.open_write_stream_sync)
+    except AttributeError:
+        return False
+
+
 def supports_json_type(obj: Any) -> "TypeGuard[SupportsJsonTypeProtocol]":
     """Check if an object exposes JSON type support."""
     return hasattr(obj, "JSON")
@@ -265,6 +265,7 @@ SYNC_DRIVER_CASES = (
         marks=(POSTGRES_XDIST_MARK,),
         table=POSTGRES_CONTRACT_TABLE,
         supports_arrow=True,
+        supports_native_arrow=True,
         supports_explain=True,
         supports_execute_many=True,
         supports_savepoints=True,
@@ -688,6 +689,7 @@ ASYNC_DRIVER_CASES = (
         marks=(POSTGRES_XDIST_MARK, pytest.mark.anyio),
         table=POSTGRES_CONTRACT_TABLE,
         supports_arrow=True,
+        supports_native_arrow=True,
         supports_native_row_streaming=True,
         supports_explain=True,
         supports_execute_many=True,
@@ -770,6 +772,7 @@ ASYNC_DRIVER_CASES = (
         marks=(POSTGRES_XDIST_MARK, pytest.mark.anyio),
         table=POSTGRES_CONTRACT_TABLE,
         supports_arrow=True,
+        supports_native_arrow=True,
         supports_explain=True,
         supports_execute_many=True,
         supports_savepoints=True,
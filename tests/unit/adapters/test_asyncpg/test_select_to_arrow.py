@@ -0,0 +1,136 @@
+"""AsyncPG columnar ``select_to_arrow`` tests."""
+
+import struct
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pyarrow as pa
+import pytest
+
+from sqlspec.adapters.asyncpg import AsyncpgDriver
+from sqlspec.exceptions import ImproperConfigurationError
+from sqlspec.utils.pgcopy import PGCOPY_SIGNATURE
+
+_TYPE_OIDS = {"int4": 23, "text": 25, "timestamptz": 1184, "numeric": 1700}
+_ROW_PATH = {"enable_copy_arrow_export": False}
+
+
+def _attribute(name: str, type_name: str) -> Any:
+    return SimpleNamespace(name=name, type=SimpleNamespace(name=type_name, oid=_TYPE_OIDS[type_name]))
+
+
+def _copy_payload(rows: "list[tuple[int, str]]") -> bytes:
+    out = bytearray(PGCOPY_SIGNATURE + struct.pack(">ii", 0, 0))
+    for number, label in rows:
+        encoded = label.encode()
+        out += struct.pack(">hii", 2, 4, number) + struct.pack(">i", len(encoded)) + encoded
+    return bytes(out + struct.pack(">h", -1))
+
+
+def _connection(chunks: "list[list[tuple[Any, ...]]]", attributes: "tuple[Any, ...] | None" = None) -> MagicMock:
+    cursor = MagicMock()
+    cursor.fetch = AsyncMock(side_effect=[*chunks, []])
+    prepared = MagicMock()
+    prepared.get_attributes.return_value = attributes or (
+        _attribute("id", "int4"),
+        _attribute("closed_at", "timestamptz"),
+    )
+    prepared.cursor = AsyncMock(return_value=cursor)
+    transaction = MagicMock()
+    transaction.start = AsyncMock()
+    transaction.commit = AsyncMock()
+    transaction.rollback = AsyncMock()
+    connection = MagicMock()
+    connection.prepare = AsyncMock(return_value=prepared)
+    connection.transaction.return_value = transaction
+    return connection
+
+
+@pytest.mark.anyio
+async def test_select_to_arrow_columnarizes_cursor_chunks() -> None:
+    connection = _connection([[(1, None), (2, None)], [(3, None)]])
+    driver = AsyncpgDriver(connection, driver_features=_ROW_PATH)
+
+    result = await driver.select_to_arrow("SELECT id, closed_at FROM events WHERE id > $1", 0, batch_size=2)
+    table = result.get_data()
+
+    assert table.column("id").to_pylist() == [1, 2, 3]
+    assert table.schema.field("closed_at").type == pa.timestamp("us", tz="UTC")
+    connection.prepare.assert_awaited_once()
+    connection.transaction.return_value.commit.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_select_to_arrow_reuses_cached_prepared_statement() -> None:
+    connection = _connection([[(1, None)], [], [(2, None)]])
+    driver = AsyncpgDriver(connection, driver_features=_ROW_PATH)
+
+    first = (await driver.select_to_arrow("SELECT id, closed_at FROM events")).get_data()
+    second = (await driver.select_to_arrow("SELECT id, closed_at FROM events")).get_data()
+
+    assert first.column("id").to_pylist() == [1]
+    assert second.column("id").to_pylist() == [2]
+    connection.prepare.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_select_to_arrow_empty_result_uses_prepared_attributes() -> None:
+    driver = AsyncpgDriver(_connection([]), driver_features=_ROW_PATH)
+
+    table = (await driver.select_to_arrow("SELECT id, closed_at FROM events")).get_data()
+
+    assert table.num_rows == 0
+    assert table.schema == pa.schema([("id", pa.int32()), ("closed_at", pa.timestamp("us", tz="UTC"))])
+
+
+@pytest.mark.anyio
+async def test_select_to_arrow_native_only_decodes_binary_copy() -> None:
+    payload = _copy_payload([(index, f"label-{index}") for index in range(5)])
+    connection = _connection([], (_attribute("id", "int4"), _attribute("label", "text")))
+
+    async def copy_from_query(query: str, *args: Any, output: Any, format: str) -> None:
+        for offset in range(0, len(payload), 11):
+            await output(payload[offset : offset + 11])
+
+    connection.copy_from_query = AsyncMock(side_effect=copy_from_query)
+    driver = AsyncpgDriver(connection)
+
+    result = await driver.select_to_arrow("SELECT id, label FROM events WHERE id >= $1", 0, native_only=True)
+    table = result.get_data()
+
+    assert table.column("label").to_pylist() == [f"label-{index}" for index in range(5)]
+    assert table.schema.field("id").type == pa.int32()
+    assert result.rows_affected == 5
+    assert connection.copy_from_query.await_args.args == ("SELECT id, label FROM events WHERE id >= $1", 0)
+    assert connection.copy_from_query.await_args.kwargs["format"] == "binary"
+    connection.transaction.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_select_to_arrow_unsupported_copy_type_uses_row_path() -> None:
+    connection = _connection([[(1, "9.50")]], (_attribute("id", "int4"), _attribute("amount", "numeric")))
+    connection.copy_from_query = AsyncMock()
+    driver = AsyncpgDriver(connection)
+
+    table = (await driver.select_to_arrow("SELECT id, amount FROM invoices")).get_data()
+
+    assert table.column("id").to_pylist() == [1]
+    connection.copy_from_query.assert_not_called()
+    with pytest.raises(ImproperConfigurationError, match="native Arrow"):
+        await driver.select_to_arrow("SELECT id, amount FROM invoices", native_only=True)
+    connection.prepare.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_select_to_arrow_copy_export_can_be_disabled() -> None:
+    connection = _connection([[(1, None)]])
+    connection.copy_from_query = AsyncMock()
+    driver = AsyncpgDriver(connection, driver_features=_ROW_PATH)
+
+    with pytest.raises(ImproperConfigurationError, match="native Arrow"):
+        await driver.select_to_arrow("SELECT id, closed_at FROM events", native_only=True)
+    table = (await driver.select_to_arrow("SELECT id, closed_at FROM events")).get_data()
+
+    assert table.column("id").to_pylist() == [1]
+    connection.copy_from_query.assert_not_called()
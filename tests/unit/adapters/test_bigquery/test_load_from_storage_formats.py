@@ -69,12 +69,30 @@ def test_load_from_storage_routes_each_format(file_format: str, expected: str) -
     assert job_config.source_format == expected
 
 
-def test_load_from_storage_rejects_arrow_ipc() -> None:
+@pytest.mark.parametrize("file_format", ["arrow-ipc", "arrow-stream"])
+def test_load_from_storage_reads_arrow_ipc_through_arrow_path(
+    monkeypatch: pytest.MonkeyPatch, file_format: str
+) -> None:
     connection = _RecordingConnection()
     driver = BigQueryDriver(cast("Any", connection))
-
-    with pytest.raises(StorageCapabilityError):
-        driver.load_from_storage("dataset.table", "gs://bucket/object.arrow", file_format=cast("Any", "arrow-ipc"))
+    calls: list[tuple[str, Any]] = []
+    monkeypatch.setattr(
+        BigQueryDriver,
+        "_read_storage_arrow",
+        lambda self, source, **kwargs: (
+            calls.append(("read", kwargs["file_format"])) or "table",
+            {"rows_processed": 0},
+        ),
+    )
+    monkeypatch.setattr(
+        BigQueryDriver, "load_from_arrow", lambda self, table, data, **kwargs: calls.append(("load", data)) or "job"
+    )
+
+    job = driver.load_from_storage("dataset.table", "gs://bucket/object.arrow", file_format=cast("Any", file_format))
+
+    assert job == "job"
+    assert calls == [("read", file_format), ("load", "table")]
+    assert connection.load_uri_calls == []
 
 
 def test_build_load_job_config_csv_source_format() -> None:
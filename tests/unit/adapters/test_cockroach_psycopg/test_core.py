@@ -2,7 +2,7 @@
 """Unit tests for CockroachDB psycopg retry helpers."""
 
 from sqlspec.adapters.cockroach_psycopg import CockroachPsycopgRetryConfig
-from sqlspec.adapters.cockroach_psycopg.core import calculate_backoff_seconds, is_retryable_error
+from sqlspec.exceptions import DeadlockError, SerializationConflictError
 
 
 def test_cockroach_psycopg_retry_config_default_values() -> None:
@@ -64,78 +64,13 @@ def test_cockroach_psycopg_retry_config_slots_class_is_mutable() -> None:
     assert CockroachPsycopgRetryConfig.__slots__ == ("base_delay_ms", "enable_logging", "max_delay_ms", "max_retries")
 
 
-def test_is_retryable_error_sqlstate_40001_is_retryable() -> None:
-    """SQLSTATE 40001 (serialization failure) should be retryable."""
-
-    class MockErrorWith40001(BaseException):
-        sqlstate = "40001"
-
-    assert is_retryable_error(MockErrorWith40001()) is True
-
-
-def test_is_retryable_error_other_sqlstate_not_retryable() -> None:
-    """Other SQLSTATEs should not be retryable."""
-
-    class MockErrorWithOtherState(BaseException):
-        sqlstate = "23505"
-
-    assert is_retryable_error(MockErrorWithOtherState()) is False
-
-
-def test_is_retryable_error_error_without_sqlstate_not_retryable() -> None:
-    """Errors without sqlstate attribute should not be retryable."""
-    assert is_retryable_error(ValueError("test")) is False
-    assert is_retryable_error(RuntimeError("test")) is False
-
-
-def test_is_retryable_error_none_sqlstate_not_retryable() -> None:
-    """Errors with None sqlstate should not be retryable."""
-
-    class MockErrorWithNone(BaseException):
-        sqlstate: str | None = None
-
-    assert is_retryable_error(MockErrorWithNone()) is False
-
-
-def test_calculate_backoff_seconds_first_attempt_base_delay() -> None:
-    """First attempt (0) should use base delay with jitter."""
-    config = CockroachPsycopgRetryConfig(base_delay_ms=100.0, max_delay_ms=5000.0)
-    delay = calculate_backoff_seconds(0, config)
-    assert 0.0 <= delay <= 0.2
-
-
-def test_calculate_backoff_seconds_exponential_growth() -> None:
-    """Delays should grow exponentially with attempt number."""
-    config = CockroachPsycopgRetryConfig(base_delay_ms=100.0, max_delay_ms=10000.0)
-    delays = []
-    for _ in range(10):
-        delay_0 = calculate_backoff_seconds(0, config)
-        delay_1 = calculate_backoff_seconds(1, config)
-        delay_2 = calculate_backoff_seconds(2, config)
-        delays.append((delay_0, delay_1, delay_2))
-    avg_delay_0 = sum(d[0] for d in delays) / len(delays)
-    avg_delay_1 = sum(d[1] for d in delays) / len(delays)
-    avg_delay_2 = sum(d[2] for d in delays) / len(delays)
-    assert avg_delay_1 > avg_delay_0
-    assert avg_delay_2 > avg_delay_1
-
-
-def test_calculate_backoff_seconds_respects_max_delay() -> None:
-    """Delay should not exceed max_delay_ms."""
-    config = CockroachPsycopgRetryConfig(base_delay_ms=100.0, max_delay_ms=500.0)
-    delay = calculate_backoff_seconds(10, config)
-    assert delay <= 0.5
-
-
-def test_calculate_backoff_seconds_returns_seconds() -> None:
-    """Delay should be returned in seconds, not milliseconds."""
-    config = CockroachPsycopgRetryConfig(base_delay_ms=1000.0, max_delay_ms=5000.0)
-    delay = calculate_backoff_seconds(0, config)
-    assert delay <= 2.0
-
-
-def test_calculate_backoff_seconds_jitter_variation() -> None:
-    """Multiple calls should produce different delays due to jitter."""
-    config = CockroachPsycopgRetryConfig(base_delay_ms=100.0, max_delay_ms=5000.0)
-    delays = [calculate_backoff_seconds(1, config) for _ in range(20)]
-    assert len(set(delays)) > 1
+def test_cockroach_psycopg_retry_config_to_retry_policy() -> None:
+    """Retry config should map onto a serialization-conflict retry policy."""
+    config = CockroachPsycopgRetryConfig(max_retries=2, base_delay_ms=10.0, max_delay_ms=40.0, enable_logging=False)
+    policy = config.to_retry_policy()
+    assert policy.max_attempts == 3
+    assert policy.base_delay == 0.01
+    assert policy.max_delay == 0.04
+    assert policy.log_retries is False
+    assert policy.is_retryable(SerializationConflictError("restart transaction"))
+    assert not policy.is_retryable(DeadlockError("deadlock"))
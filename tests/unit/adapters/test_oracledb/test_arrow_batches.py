@@ -122,3 +122,33 @@ async def test_async_select_to_arrow_table_forwards_fetch_lobs_to_fetch_df_all()
     assert connection.fetch_all_calls[0]["arraysize"] == 2
     assert connection.fetch_all_calls[0]["fetch_decimals"] is True
     assert connection.fetch_all_calls[0]["fetch_lobs"] is False
+
+
+def test_sync_select_stream_arrow_pulls_fetch_df_batches_lazily() -> None:
+    connection = _OracleBatchConnection()
+    driver = OracleSyncDriver(
+        cast("OracleSyncConnection", connection), driver_features={"enable_lowercase_column_names": True}
+    )
+
+    with driver.select_stream_arrow("SELECT id, value FROM example", batch_size=2) as stream:
+        assert connection.fetch_batch_calls == []
+        batches = list(stream)
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert stream.schema.names == ["id", "value"]
+    assert connection.fetch_batch_calls[0]["size"] == 2
+
+
+@pytest.mark.anyio
+async def test_async_select_stream_arrow_pulls_fetch_df_batches_lazily() -> None:
+    connection = _OracleAsyncBatchConnection()
+    driver = OracleAsyncDriver(
+        cast("OracleAsyncConnection", connection), driver_features={"enable_lowercase_column_names": True}
+    )
+
+    async with driver.select_stream_arrow("SELECT id, value FROM example", batch_size=2) as stream:
+        assert connection.fetch_batch_calls == []
+        batches = [batch async for batch in stream]
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert pa.Table.from_batches(batches).to_pydict() == {"id": [1, 2, 3], "value": [10, 20, 30]}
@@ -0,0 +1,43 @@
+"""Psycopg binary COPY ``select_to_arrow`` export tests."""
+
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+
+from sqlspec.adapters.psycopg.driver import PsycopgSyncDriver
+from sqlspec.exceptions import ImproperConfigurationError
+
+_NUMERIC_OID = 1700
+_INT4_OID = 23
+
+
+def _connection(description: "list[tuple[str, int]]") -> MagicMock:
+    cursor = MagicMock()
+    cursor.description = [SimpleNamespace(name=name, type_code=oid) for name, oid in description]
+    connection = MagicMock()
+    connection.cursor.return_value = cursor
+    return connection
+
+
+def test_copy_export_can_be_disabled() -> None:
+    connection = _connection([("id", _INT4_OID)])
+    driver = PsycopgSyncDriver(cast("Any", connection), driver_features={"enable_copy_arrow_export": False})
+
+    with pytest.raises(ImproperConfigurationError, match="native Arrow"):
+        driver.select_to_arrow("SELECT id FROM invoices", native_only=True)
+
+    connection.cursor.assert_not_called()
+
+
+def test_copy_export_describes_each_statement_once() -> None:
+    connection = _connection([("id", _INT4_OID), ("amount", _NUMERIC_OID)])
+    driver = PsycopgSyncDriver(cast("Any", connection))
+
+    for _ in range(2):
+        with pytest.raises(ImproperConfigurationError, match="native Arrow"):
+            driver.select_to_arrow("SELECT id, amount FROM invoices", native_only=True)
+
+    executed = [call.args[0] for call in connection.cursor.return_value.execute.call_args_list]
+    assert executed == ["SELECT * FROM (SELECT id, amount FROM invoices) AS sqlspec_copy_describe LIMIT 0"]
@@ -40,7 +40,12 @@ def test_pool_no_duplicate_typedef_sqlite_connection_pool_still_importable() ->
 def test_pool_no_duplicate_typedef_pool_module_all_unchanged() -> None:
     import sqlspec.adapters.sqlite.pool as pool_mod
 
-    assert pool_mod.__all__ == ("SqliteConnectionPool",)
+    assert pool_mod.__all__ == (
+        "SqliteConnectTimeoutError",
+        "SqliteConnectionPool",
+        "SqlitePoolClosedError",
+        "SqliteSingleWriterPool",
+    )
 
 
 def test_pool_no_duplicate_typedef_canonical_typedef_still_importable_from_config() -> None:
@@ -0,0 +1,128 @@
+"""Tests for circuit breakers and admission limiters attached to database configs."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.core import AdmissionLimiter, CircuitBreaker
+from sqlspec.exceptions import AdmissionRejectedError, CircuitOpenError, DatabaseConnectionError, StatementTimeoutError
+
+
+def _open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_duration=60.0)
+    breaker.record(DatabaseConnectionError("down"), None)
+    return breaker
+
+
+def test_config_without_guards_leaves_sessions_untouched() -> None:
+    config = SqliteConfig()
+
+    with config.provide_session() as session:
+        assert session._admission_control is None  # pyright: ignore[reportPrivateUsage]
+        assert session.select_value("SELECT 1") == 1
+
+
+def test_open_circuit_fails_session_acquire_fast() -> None:
+    config = SqliteConfig(circuit_breaker=_open_breaker())
+
+    with pytest.raises(CircuitOpenError), config.provide_session():
+        pass
+
+    assert config.get_observability_runtime().metrics_snapshot()["SqliteConfig.circuit.rejected"] == 1.0
+
+
+def test_statement_failures_open_the_circuit() -> None:
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2, open_duration=60.0)
+    config = SqliteConfig(circuit_breaker=breaker)
+
+    with config.provide_session() as session:
+        assert session.select_value("SELECT 1") == 1
+        breaker.record(DatabaseConnectionError("down"), None)
+        with pytest.raises(CircuitOpenError):
+            session.select_value("SELECT 1")
+
+
+def test_thread_local_pool_acquires_never_count_as_waiters() -> None:
+    limiter = AdmissionLimiter(max_waiters=0)
+    config = SqliteConfig(admission_limiter=limiter)
+
+    for _ in range(2):
+        with config.provide_session() as session:
+            assert session.select_value("SELECT 1") == 1
+
+    assert limiter.waiters == 0
+    config.close_pool()
+
+
+@pytest.mark.anyio
+async def test_admission_limiter_rejects_only_callers_that_wait(tmp_path: Path) -> None:
+    limiter = AdmissionLimiter(max_waiters=0)
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "app.db"), "pool_size": 1}, admission_limiter=limiter
+    )
+
+    try:
+        async with config.provide_session() as session:
+            assert await session.select_value("SELECT 1") == 1
+        async with config.provide_session() as session:
+            assert await session.select_value("SELECT 1") == 1
+            waiting_context: Any = config.provide_session()
+            with pytest.raises(AdmissionRejectedError):
+                await waiting_context.__aenter__()
+    finally:
+        await config.close_pool()
+
+    assert limiter.waiters == 0
+    assert config.get_observability_runtime().metrics_snapshot()["AiosqliteConfig.admission.rejected"] == 1.0
+
+
+def test_statement_timeouts_recorded_on_the_runtime_do_not_open_the_circuit() -> None:
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2, open_duration=60.0)
+    config = SqliteConfig(circuit_breaker=breaker)
+    runtime = config.get_observability_runtime()
+
+    for _ in range(4):
+        runtime.record_outcome("statement", StatementTimeoutError("deadline", timeout=1.0), 5.0)
+    assert breaker.state == "closed"
+
+    runtime.record_outcome("statement", DatabaseConnectionError("down"), 0.01)
+    runtime.record_outcome("statement", DatabaseConnectionError("down"), 0.01)
+    assert breaker.state == "open"
+
+
+def test_admission_limiter_releases_statement_slots() -> None:
+    limiter = AdmissionLimiter(max_in_flight=1)
+    config = SqliteConfig(admission_limiter=limiter)
+
+    with config.provide_session() as session:
+        for _ in range(3):
+            assert session.select_value("SELECT 1") == 1
+        with pytest.raises(Exception):
+            session.execute("SELECT * FROM missing_table")
+
+    assert limiter.in_flight == 0
+    assert limiter.waiters == 0
+
+
+@pytest.mark.anyio
+async def test_async_config_guards_sessions_and_statements() -> None:
+    limiter = AdmissionLimiter(max_in_flight=1, max_waiters=1)
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_duration=60.0)
+    config = AiosqliteConfig(circuit_breaker=breaker, admission_limiter=limiter)
+
+    try:
+        async with config.provide_session() as session:
+            assert await session.select_value("SELECT 1") == 1
+            assert limiter.in_flight == 0
+            breaker.record(DatabaseConnectionError("down"), None)
+            with pytest.raises(CircuitOpenError):
+                await session.select_value("SELECT 1")
+
+        session_context: Any = config.provide_session()
+        with pytest.raises(CircuitOpenError):
+            await session_context.__aenter__()
+    finally:
+        await config.close_pool()
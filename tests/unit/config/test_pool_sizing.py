@@ -0,0 +1,87 @@
+"""Tests for adaptive pool sizing attached to database configs."""
+
+import asyncio
+import logging
+from pathlib import Path
+
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.aiosqlite.pool import AiosqliteConnectionPool
+from sqlspec.adapters.asyncpg import AsyncpgConfig
+from sqlspec.adapters.psycopg import PsycopgSyncConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.core import PoolSizingPolicy
+from sqlspec.exceptions import ImproperConfigurationError
+
+
+def test_pool_sizing_requires_resizable_pool() -> None:
+    with pytest.raises(ImproperConfigurationError, match="adaptive pool sizing"):
+        SqliteConfig(pool_sizing=PoolSizingPolicy())
+
+
+async def test_aiosqlite_grows_pool_when_callers_queue(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    policy = PoolSizingPolicy(min_size=1, max_size=4, evaluation_interval=0.05)
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "autoscale.db"), "connect_timeout": 1.0}, pool_sizing=policy
+    )
+
+    with caplog.at_level(logging.INFO, logger="sqlspec.pool"):
+        async with config.provide_session() as first:
+            await first.execute("SELECT 1")
+            pool = config.connection_instance
+            assert pool is not None
+            assert pool.max_size == 1
+            await asyncio.sleep(0.06)
+            async with config.provide_session() as second:
+                await second.execute("SELECT 1")
+                assert pool.max_size == 2
+                assert pool.size() == 2
+
+    assert any(record.getMessage() == "pool.autoscale.resize" for record in caplog.records)
+    snapshot = config.get_observability_runtime().metrics_snapshot()
+    assert snapshot["AiosqliteConfig.pool.autoscale.size"] == 2.0
+    assert config._pool_autoscaler is not None  # pyright: ignore[reportPrivateUsage]
+    assert config._pool_autoscaler.in_system == 0  # pyright: ignore[reportPrivateUsage]
+    await config.close_pool()
+
+
+async def test_aiosqlite_pool_resize_closes_idle_connections(tmp_path: Path) -> None:
+    pool = AiosqliteConnectionPool({"database": str(tmp_path / "resize.db")}, pool_size=3)
+    connections = [await pool.acquire() for _ in range(3)]
+    await pool.release(connections[0])
+
+    await pool.resize(1)
+    assert pool.size() == 2
+
+    await pool.release(connections[1])
+    assert pool.size() == 1
+    await pool.release(connections[2])
+    assert pool.size() == 1
+    assert pool.max_size == 1
+    await pool.close()
+
+
+def test_psycopg_pool_starts_at_autoscaled_size_and_resizes() -> None:
+    config = PsycopgSyncConfig(
+        connection_config={"conninfo": "postgresql://localhost/app", "open": False, "min_size": 1},
+        pool_sizing=PoolSizingPolicy(min_size=1, max_size=8, initial_size=2),
+    )
+    pool = config._create_pool()  # pyright: ignore[reportPrivateUsage]
+    assert (pool.min_size, pool.max_size) == (1, 2)
+
+    config.connection_instance = pool
+    config._resize_pool(6)  # pyright: ignore[reportPrivateUsage]
+
+    assert (pool.min_size, pool.max_size) == (1, 6)
+
+
+def test_asyncpg_resizes_capacity_gate() -> None:
+    config = AsyncpgConfig(pool_sizing=PoolSizingPolicy(min_size=2, max_size=6))
+    gate = config._pool_gate  # pyright: ignore[reportPrivateUsage]
+    assert gate is not None
+    assert gate.limit == 2
+
+    config._resize_pool(5)  # pyright: ignore[reportPrivateUsage]
+
+    assert gate.limit == 5
@@ -0,0 +1,177 @@
+"""Tests for pool pre-warming and connection max-lifetime replacement."""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.aiosqlite.pool import AiosqliteConnectionPool
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.config import AsyncDatabaseConfig
+from sqlspec.core import PoolSizingPolicy
+from sqlspec.exceptions import ImproperConfigurationError
+
+
+def test_warm_on_startup_rejects_negative_count() -> None:
+    with pytest.raises(ImproperConfigurationError, match="warm_on_startup"):
+        SqliteConfig(warm_on_startup=-1)
+
+
+async def test_aiosqlite_create_pool_opens_warm_connections(tmp_path: Path) -> None:
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "warm.db"), "pool_size": 4}, warm_on_startup=3
+    )
+
+    pool = await config.create_pool()
+
+    assert pool.size() == 3
+    assert pool.checked_out() == 0
+    await config.close_pool()
+
+
+async def test_aiosqlite_warm_pool_is_capped_by_pool_size_and_autoscaler(tmp_path: Path) -> None:
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "warm.db")},
+        pool_sizing=PoolSizingPolicy(min_size=1, max_size=8, initial_size=2),
+    )
+
+    assert await config.warm_pool(6) == 2
+    assert config.connection_instance is not None
+    assert config.connection_instance.size() == 2
+    await config.close_pool()
+
+
+def test_sqlite_warm_pool_opens_the_calling_threads_connection(tmp_path: Path) -> None:
+    config = SqliteConfig(connection_config={"database": str(tmp_path / "warm.db")}, warm_on_startup=4)
+
+    pool = config.create_pool()
+
+    assert pool.size() == 1
+    assert config.warm_pool() == 1
+    config.close_pool()
+
+
+class _FakeAsyncPool:
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.checked_out = 0
+        self.peak = 0
+
+
+class _FakeConnectionContext:
+    def __init__(self, config: "_GenericWarmConfig") -> None:
+        self._pool: _FakeAsyncPool = config.connection_instance  # type: ignore[assignment]
+
+    async def __aenter__(self) -> object:
+        pool = self._pool
+        if pool.checked_out >= pool.max_size:
+            msg = "pool exhausted"
+            raise RuntimeError(msg)
+        pool.checked_out += 1
+        await asyncio.sleep(0)
+        pool.peak = max(pool.peak, pool.checked_out)
+        return object()
+
+    async def __aexit__(self, *args: Any) -> None:
+        self._pool.checked_out -= 1
+
+
+class _GenericWarmConfig(AiosqliteConfig):
+    _connection_context_class = _FakeConnectionContext
+    _open_warm_connections = AsyncDatabaseConfig._open_warm_connections  # type: ignore[assignment]
+
+
+async def test_async_warm_holds_connections_concurrently_and_logs_failures(caplog: pytest.LogCaptureFixture) -> None:
+    config = _GenericWarmConfig(connection_config={"database": ":memory:"})
+    pool = _FakeAsyncPool(max_size=2)
+    config.connection_instance = pool  # type: ignore[assignment]
+
+    with caplog.at_level(logging.WARNING, logger="sqlspec.pool"):
+        opened = await config._open_warm_connections(3)  # pyright: ignore[reportPrivateUsage]
+
+    assert opened == 2
+    assert pool.peak == 2
+    assert pool.checked_out == 0
+    assert any(record.getMessage() == "pool.warmup.connection.error" for record in caplog.records)
+
+
+async def test_aiosqlite_connections_get_jittered_expiry(tmp_path: Path) -> None:
+    pool = AiosqliteConnectionPool(
+        {"database": str(tmp_path / "lifetime.db")}, pool_size=8, max_lifetime=100.0, max_lifetime_jitter=0.5
+    )
+    await pool.warm(8)
+
+    connections = [await pool.acquire() for _ in range(8)]
+    lifetimes = {round(c.expires_at - c.created_at, 6) for c in connections if c.expires_at is not None}
+
+    assert len(lifetimes) > 1
+    assert all(50.0 <= lifetime <= 100.0 for lifetime in lifetimes)
+    for connection in connections:
+        await pool.release(connection)
+    await pool.close()
+
+
+async def test_aiosqlite_replaces_expired_idle_connections_before_closing_them(tmp_path: Path) -> None:
+    pool = AiosqliteConnectionPool({"database": str(tmp_path / "lifetime.db")}, pool_size=2, max_lifetime=3600.0)
+    await pool.warm(2)
+    original = [await pool.acquire() for _ in range(2)]
+    for connection in original:
+        await pool.release(connection)
+        connection.expires_at = 0.0
+
+    assert pool.size() == 2
+    assert await pool.replace_expired_connections() == 2
+
+    assert pool.size() == 2
+    assert all(connection.is_closed for connection in original)
+    fresh = [await pool.acquire() for _ in range(2)]
+    assert {c.id for c in fresh}.isdisjoint({c.id for c in original})
+    for connection in fresh:
+        await pool.release(connection)
+    await pool.close()
+
+
+async def test_aiosqlite_expired_connection_is_replaced_in_background_on_release(tmp_path: Path) -> None:
+    pool = AiosqliteConnectionPool({"database": str(tmp_path / "lifetime.db")}, pool_size=2, max_lifetime=3600.0)
+    connection = await pool.acquire()
+    connection.expires_at = 0.0
+
+    await pool.release(connection)
+    assert connection.is_closed
+    for _ in range(100):
+        if pool.size() == 1 and pool.checked_out() == 0:
+            break
+        await asyncio.sleep(0.01)
+
+    assert pool.size() == 1
+    assert pool.checked_out() == 0
+    await pool.close()
+
+
+async def test_aiosqlite_lifetime_task_swaps_connections(tmp_path: Path) -> None:
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "lifetime.db"), "max_lifetime": 0.2, "max_lifetime_jitter": 0.0},
+        warm_on_startup=1,
+    )
+    pool = await config.create_pool()
+    first = await pool.acquire()
+    first_id = first.id
+    await pool.release(first)
+
+    await asyncio.sleep(0.35)
+
+    assert pool.size() == 1
+    second = await pool.acquire()
+    assert second.id != first_id
+    await pool.release(second)
+    await config.close_pool()
+
+
+def test_aiosqlite_pool_rejects_invalid_lifetime() -> None:
+    with pytest.raises(ValueError, match="max_lifetime"):
+        AiosqliteConnectionPool({"database": ":memory:"}, max_lifetime=0)
+    with pytest.raises(ValueError, match="max_lifetime_jitter"):
+        AiosqliteConnectionPool({"database": ":memory:"}, max_lifetime_jitter=1.0)
@@ -0,0 +1,173 @@
+"""Tests for the single-writer WAL pool mode of the SQLite and aiosqlite adapters."""
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.aiosqlite.pool import AiosqliteConnectionPool, AiosqliteConnectTimeoutError
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.adapters.sqlite.pool import SqliteConnectTimeoutError, SqliteSingleWriterPool
+from sqlspec.exceptions import ImproperConfigurationError, SQLSpecError
+
+
+def _sqlite_config(path: Path, **connection_config: object) -> SqliteConfig:
+    return SqliteConfig(connection_config={"database": str(path), "pool_mode": "single_writer", **connection_config})
+
+
+def test_sqlite_single_writer_rejects_memory_database_and_unknown_mode(tmp_path: Path) -> None:
+    with pytest.raises(ImproperConfigurationError, match="database file"):
+        SqliteConfig(connection_config={"pool_mode": "single_writer"})
+    with pytest.raises(ImproperConfigurationError, match="pool_mode"):
+        SqliteConfig(connection_config={"database": str(tmp_path / "app.db"), "pool_mode": "writer"})
+    with pytest.raises(ImproperConfigurationError, match="database file"):
+        AiosqliteConfig(connection_config={"pool_mode": "single_writer"})
+
+
+def test_sqlite_single_writer_routes_writes_to_writer_and_keeps_readers_read_only(tmp_path: Path) -> None:
+    config = _sqlite_config(tmp_path / "app.db", pool_size=2)
+
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        session.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+        reader = session._reader_connection  # pyright: ignore[reportPrivateUsage]
+        assert reader is not None
+        assert session.connection is not reader
+    with config.provide_session() as session:
+        assert session.select_value("SELECT COUNT(*) FROM items") == 1
+        assert session.select_value("PRAGMA journal_mode") == "wal"
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            session.connection.execute("INSERT INTO items (name) VALUES ('b')")
+
+    pool = config.connection_instance
+    assert isinstance(pool, SqliteSingleWriterPool)
+    assert not pool.writer_in_use
+    assert pool.checked_out() == 0
+    config.close_pool()
+
+
+def test_sqlite_single_writer_holds_writer_for_explicit_transaction(tmp_path: Path) -> None:
+    config = _sqlite_config(tmp_path / "app.db")
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    pool = config.provide_pool()
+    assert isinstance(pool, SqliteSingleWriterPool)
+
+    with config.provide_session() as writer_session, config.provide_session() as reader_session:
+        writer_session.begin()
+        writer_session.execute("INSERT INTO items (id) VALUES (1)")
+        assert pool.writer_in_use
+        assert writer_session.select_value("SELECT COUNT(*) FROM items") == 1
+        assert reader_session.select_value("SELECT COUNT(*) FROM items") == 0
+        writer_session.commit()
+        assert not pool.writer_in_use
+        assert reader_session.select_value("SELECT COUNT(*) FROM items") == 1
+    config.close_pool()
+
+
+def test_sqlite_session_error_rolls_back_held_writer(tmp_path: Path) -> None:
+    config = _sqlite_config(tmp_path / "app.db")
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+    with pytest.raises(RuntimeError), config.provide_session() as session:
+        session.execute("INSERT INTO items (id) VALUES (1)")
+        raise RuntimeError("boom")
+
+    with config.provide_session() as session:
+        assert session.select_value("SELECT COUNT(*) FROM items") == 0
+    config.close_pool()
+
+
+def test_sqlite_single_writer_serializes_concurrent_writers(tmp_path: Path) -> None:
+    config = _sqlite_config(tmp_path / "app.db", pool_size=4)
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE items (worker INTEGER, n INTEGER)")
+    errors: list[BaseException] = []
+
+    def write(worker: int) -> None:
+        try:
+            for n in range(25):
+                with config.provide_session() as session:
+                    session.execute("INSERT INTO items (worker, n) VALUES (?, ?)", (worker, n))
+                    session.select_value("SELECT COUNT(*) FROM items")
+        except BaseException as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with config.provide_session() as session:
+        assert session.select_value("SELECT COUNT(*) FROM items") == 150
+    config.close_pool()
+
+
+def test_sqlite_writer_waiters_time_out(tmp_path: Path) -> None:
+    pool = SqliteSingleWriterPool({"database": str(tmp_path / "app.db")}, pool_size=1, timeout=0.05)
+    writer = pool.acquire_writer()
+
+    with pytest.raises(SqliteConnectTimeoutError):
+        pool.acquire_writer()
+
+    pool.release_writer(writer)
+    assert pool.acquire_writer() is writer
+    pool.release_writer(writer)
+    pool.close()
+
+
+async def test_aiosqlite_single_writer_routes_writes_and_serializes_tasks(tmp_path: Path) -> None:
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "app.db"), "pool_mode": "single_writer", "pool_size": 3}
+    )
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE items (worker INTEGER, n INTEGER)")
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            await session.connection.execute("INSERT INTO items (worker, n) VALUES (0, 0)")
+
+    async def write(worker: int) -> None:
+        for n in range(20):
+            async with config.provide_session() as session:
+                await session.begin()
+                await session.execute("INSERT INTO items (worker, n) VALUES (?, ?)", (worker, n))
+                await session.commit()
+
+    await asyncio.gather(*(write(worker) for worker in range(5)))
+
+    async with config.provide_session() as session:
+        assert await session.select_value("SELECT COUNT(*) FROM items") == 100
+        assert await session.select_value("PRAGMA journal_mode") == "wal"
+    pool = config.connection_instance
+    assert pool is not None
+    assert pool.size() <= 3
+    assert pool.checked_out() == 0
+    await config.close_pool()
+
+
+async def test_aiosqlite_writer_is_handed_out_in_order_and_times_out(tmp_path: Path) -> None:
+    pool = AiosqliteConnectionPool({"database": str(tmp_path / "app.db")}, single_writer=True, connect_timeout=0.05)
+    writer = await pool.acquire_writer()
+
+    with pytest.raises(AiosqliteConnectTimeoutError):
+        await pool.acquire_writer()
+
+    await pool.release_writer(writer)
+    assert (await pool.acquire_writer()) is writer
+    await pool.release_writer(writer)
+    assert pool.size() == 0
+    await pool.close()
+    assert writer.is_closed
+
+
+async def test_aiosqlite_acquire_writer_requires_single_writer_pool(tmp_path: Path) -> None:
+    pool = AiosqliteConnectionPool({"database": str(tmp_path / "app.db")})
+
+    with pytest.raises(SQLSpecError, match="single_writer"):
+        await pool.acquire_writer()
+    await pool.close()
@@ -0,0 +1,206 @@
+"""Tests for the circuit breaker and admission limiter."""
+
+import time
+
+import pytest
+
+from sqlspec.core import AdmissionLimiter, CircuitBreaker
+from sqlspec.core.load_shedding import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, AdmissionControl
+from sqlspec.exceptions import (
+    AdmissionRejectedError,
+    CircuitOpenError,
+    DatabaseConnectionError,
+    LoadSheddingError,
+    OperationalError,
+    OperationCancelledError,
+    PermissionDeniedError,
+    StatementTimeoutError,
+    UniqueViolationError,
+)
+from sqlspec.observability import ObservabilityRuntime
+
+
+def _breaker(**kwargs: object) -> CircuitBreaker:
+    options: dict[str, object] = {"window_size": 4, "minimum_calls": 4, "open_duration": 60.0}
+    options.update(kwargs)
+    return CircuitBreaker(**options)  # type: ignore[arg-type]
+
+
+def test_breaker_opens_when_failure_rate_crosses_threshold() -> None:
+    breaker = _breaker()
+
+    breaker.record(None, 0.01)
+    breaker.record(DatabaseConnectionError("down"), 0.01)
+    breaker.record(None, 0.01)
+    assert breaker.state == CIRCUIT_CLOSED
+
+    breaker.record(OperationalError("disk full"), 0.01)
+
+    assert breaker.state == CIRCUIT_OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert 0.0 < exc_info.value.retry_after <= 60.0
+    assert isinstance(exc_info.value, LoadSheddingError)
+
+
+def test_breaker_ignores_caller_errors() -> None:
+    breaker = _breaker()
+
+    for _ in range(8):
+        breaker.record(UniqueViolationError("duplicate"), 0.01)
+        breaker.record(PermissionDeniedError("denied"), 0.01)
+
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_breaker_ignores_timeouts_cancellations_and_rejections() -> None:
+    breaker = _breaker()
+
+    for _ in range(8):
+        breaker.record(StatementTimeoutError("deadline", timeout=1.0), 5.0)
+        breaker.record(OperationCancelledError("cancelled"), 0.01)
+        breaker.record(AdmissionRejectedError("full", limit="max_in_flight"), None)
+
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_breaker_opens_on_slow_calls() -> None:
+    breaker = _breaker(slow_call_duration=0.5, slow_call_rate_threshold=0.75)
+
+    breaker.record(None, 0.1)
+    for _ in range(3):
+        breaker.record(None, 1.0)
+
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_breaker_window_evicts_old_outcomes() -> None:
+    breaker = _breaker(failure_rate_threshold=0.75)
+
+    breaker.record(DatabaseConnectionError("down"), None)
+    breaker.record(DatabaseConnectionError("down"), None)
+    for _ in range(4):
+        breaker.record(None, None)
+    breaker.record(DatabaseConnectionError("down"), None)
+
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_breaker_half_opens_and_closes_after_successful_probe() -> None:
+    breaker = _breaker(open_duration=0.02)
+    for _ in range(4):
+        breaker.record(DatabaseConnectionError("down"), None)
+    assert breaker.state == CIRCUIT_OPEN
+
+    time.sleep(0.03)
+    assert breaker.state == CIRCUIT_HALF_OPEN
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record(None, 0.01)
+
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_breaker_failed_probe_reopens() -> None:
+    breaker = _breaker(open_duration=0.02)
+    for _ in range(4):
+        breaker.record(DatabaseConnectionError("down"), None)
+    time.sleep(0.03)
+
+    breaker.before_call()
+    breaker.record(DatabaseConnectionError("still down"), None)
+
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_breaker_rejects_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="thresholds"):
+        CircuitBreaker(failure_rate_threshold=0.0)
+    with pytest.raises(ValueError, match="window_size"):
+        CircuitBreaker(window_size=0)
+
+
+def test_limiter_rejects_statements_beyond_in_flight_limit() -> None:
+    limiter = AdmissionLimiter(max_in_flight=2)
+
+    limiter.enter_statement()
+    limiter.enter_statement()
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        limiter.enter_statement()
+    assert exc_info.value.limit == "max_in_flight"
+
+    limiter.exit_statement()
+    limiter.enter_statement()
+    assert limiter.in_flight == 2
+
+
+def test_limiter_rejects_waiters_beyond_limit() -> None:
+    limiter = AdmissionLimiter(max_waiters=1)
+
+    limiter.enter_wait()
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        limiter.enter_wait()
+    assert exc_info.value.limit == "max_waiters"
+
+    limiter.exit_wait()
+    assert limiter.waiters == 0
+
+
+def test_admission_control_publishes_metrics() -> None:
+    runtime = ObservabilityRuntime(config_name="TestConfig")
+    breaker = _breaker(window_size=1, minimum_calls=1)
+    control = AdmissionControl(breaker, AdmissionLimiter(max_in_flight=1))
+    runtime.add_outcome_listener(control.observe)
+
+    control.admit(runtime)
+    with pytest.raises(AdmissionRejectedError):
+        control.admit(runtime)
+    control.complete(runtime, DatabaseConnectionError("down"), 0.01)
+    with pytest.raises(CircuitOpenError):
+        control.admit(runtime)
+
+    metrics = runtime.metrics_snapshot()
+    assert metrics["TestConfig.admission.rejected"] == 1.0
+    assert metrics["TestConfig.circuit.rejected"] == 1.0
+    assert metrics["TestConfig.circuit.opened"] == 1.0
+    assert metrics["TestConfig.circuit.state"] == 2.0
+    assert control.limiter is not None and control.limiter.in_flight == 0
+
+
+def test_admission_control_feeds_breaker_from_runtime_outcomes() -> None:
+    runtime = ObservabilityRuntime(config_name="TestConfig")
+    breaker = _breaker(window_size=2, minimum_calls=2)
+    control = AdmissionControl(breaker)
+
+    control.complete(runtime, DatabaseConnectionError("down"), 0.01)
+    control.complete(runtime, DatabaseConnectionError("down"), 0.01)
+    assert breaker.state == CIRCUIT_CLOSED
+
+    runtime.add_outcome_listener(control.observe)
+    runtime.record_outcome("acquire", StatementTimeoutError("deadline", timeout=1.0), None)
+    assert breaker.state == CIRCUIT_CLOSED
+    runtime.record_outcome("acquire", DatabaseConnectionError("pool timeout"), None)
+    control.complete(runtime, DatabaseConnectionError("down"), 0.01)
+
+    assert breaker.state == CIRCUIT_OPEN
+    assert runtime.metrics_snapshot()["TestConfig.circuit.opened"] == 1.0
+
+
+def test_admission_control_only_counts_waiting_acquires() -> None:
+    runtime = ObservabilityRuntime(config_name="TestConfig")
+    limiter = AdmissionLimiter(max_waiters=1)
+    control = AdmissionControl(limiter=limiter)
+
+    assert control.enter_acquire(runtime, waiting=False) is False
+    assert control.enter_acquire(runtime, waiting=False) is False
+    assert limiter.waiters == 0
+
+    assert control.enter_acquire(runtime) is True
+    with pytest.raises(AdmissionRejectedError):
+        control.enter_acquire(runtime)
+    control.exit_acquire(runtime, None, waited=True)
+    control.exit_acquire(runtime, None, waited=False)
+
+    assert limiter.waiters == 0
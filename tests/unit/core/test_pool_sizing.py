@@ -0,0 +1,136 @@
+"""Tests for adaptive pool sizing policies, the autoscaler and the capacity gate."""
+
+import asyncio
+
+import pytest
+
+from sqlspec.core import pool_sizing
+from sqlspec.core.pool_sizing import AsyncCapacityGate, PoolAutoscaler, PoolSizingPolicy
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(pool_sizing, "monotonic", fake)
+    return fake
+
+
+def _hold(autoscaler: PoolAutoscaler, callers: int) -> None:
+    for _ in range(callers):
+        autoscaler.enter()
+        autoscaler.acquired(0.0)
+
+
+def test_policy_rejects_invalid_bounds() -> None:
+    with pytest.raises(ValueError):
+        PoolSizingPolicy(min_size=5, max_size=2)
+    with pytest.raises(ValueError):
+        PoolSizingPolicy(min_size=1, max_size=4, initial_size=8)
+    with pytest.raises(ValueError):
+        PoolSizingPolicy(target_utilization=0.5, scale_down_utilization=0.6)
+    assert PoolSizingPolicy(min_size=2, max_size=4).initial_size == 2
+
+
+def test_autoscaler_grows_to_littles_law_concurrency(clock: _Clock) -> None:
+    autoscaler = PoolAutoscaler(PoolSizingPolicy(min_size=1, max_size=10, evaluation_interval=1.0))
+    _hold(autoscaler, 4)
+    clock.now += 1.0
+
+    decision = autoscaler.evaluate()
+
+    assert decision is not None
+    assert decision.previous_size == 1
+    assert decision.concurrency == pytest.approx(4.0)
+    assert decision.size == 6  # ceil(4 / 0.7)
+    assert decision.arrival_rate == pytest.approx(4.0)
+    assert decision.mean_latency == pytest.approx(1.0)
+    assert autoscaler.size == 6
+
+
+def test_autoscaler_respects_max_size_and_interval(clock: _Clock) -> None:
+    autoscaler = PoolAutoscaler(PoolSizingPolicy(min_size=1, max_size=3, evaluation_interval=1.0))
+    _hold(autoscaler, 10)
+    clock.now += 0.5
+    assert autoscaler.evaluate() is None
+
+    clock.now += 0.5
+    decision = autoscaler.evaluate()
+
+    assert decision is not None
+    assert decision.size == 3
+
+
+def test_autoscaler_shrinks_only_after_sustained_low_utilization(clock: _Clock) -> None:
+    policy = PoolSizingPolicy(min_size=1, max_size=10, initial_size=8, evaluation_interval=1.0, scale_down_delay=2.0)
+    autoscaler = PoolAutoscaler(policy)
+    _hold(autoscaler, 1)
+
+    clock.now += 1.0
+    assert autoscaler.evaluate() is None
+    clock.now += 1.0
+    assert autoscaler.evaluate() is None
+    clock.now += 1.0
+    decision = autoscaler.evaluate()
+
+    assert decision is not None
+    assert (decision.previous_size, decision.size) == (8, 2)
+
+
+def test_autoscaler_holds_size_inside_hysteresis_band(clock: _Clock) -> None:
+    policy = PoolSizingPolicy(min_size=1, max_size=10, initial_size=5, evaluation_interval=1.0, scale_down_delay=0.0)
+    autoscaler = PoolAutoscaler(policy)
+    _hold(autoscaler, 3)  # utilization 0.6: below target, above scale-down threshold
+
+    clock.now += 1.0
+
+    assert autoscaler.evaluate() is None
+    assert autoscaler.size == 5
+
+
+def test_abandoned_and_released_callers_leave_the_system(clock: _Clock) -> None:
+    autoscaler = PoolAutoscaler(PoolSizingPolicy(evaluation_interval=1.0))
+    autoscaler.enter()
+    autoscaler.abandon()
+    _hold(autoscaler, 1)
+    autoscaler.exit()
+
+    assert autoscaler.in_system == 0
+
+
+async def test_capacity_gate_wakes_waiters_when_resized() -> None:
+    gate = AsyncCapacityGate(1)
+    await gate.acquire()
+    waiter = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    gate.resize(2)
+    await asyncio.wait_for(waiter, timeout=1.0)
+
+    assert gate.in_use == 2
+    gate.release()
+    gate.release()
+    assert gate.in_use == 0
+
+
+async def test_capacity_gate_cancelled_waiter_does_not_leak_slot() -> None:
+    gate = AsyncCapacityGate(1)
+    await gate.acquire()
+    waiter = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    gate.release()
+
+    assert gate.in_use == 0
+    await asyncio.wait_for(gate.acquire(), timeout=1.0)
@@ -0,0 +1,114 @@
+"""Tests for retry policies and retry budgets."""
+
+import pickle
+
+import pytest
+
+from sqlspec.core import RetryBudget, RetryPolicy, StatementConfig
+from sqlspec.exceptions import (
+    DatabaseConnectionError,
+    DeadlockError,
+    PermissionDeniedError,
+    SerializationConflictError,
+    UniqueViolationError,
+)
+from sqlspec.typing import Empty
+
+
+class _RawDriverError(Exception):
+    def __init__(self, sqlstate: str) -> None:
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+def test_default_policy_classifies_mapped_errors() -> None:
+    policy = RetryPolicy()
+
+    assert policy.is_retryable(SerializationConflictError("conflict"))
+    assert policy.is_retryable(DeadlockError("deadlock"))
+    assert not policy.is_retryable(DatabaseConnectionError("dropped"))
+    assert not policy.is_retryable(PermissionDeniedError("denied"))
+    assert not policy.is_retryable(UniqueViolationError("duplicate"))
+
+
+def test_policy_classifies_raw_sqlstate_and_wrapped_cause() -> None:
+    policy = RetryPolicy()
+    wrapped = UniqueViolationError("wrapped")
+    wrapped.__cause__ = _RawDriverError("40P01")
+
+    assert policy.is_retryable(_RawDriverError("40001"))
+    assert policy.is_retryable(wrapped)
+    assert not policy.is_retryable(_RawDriverError("23505"))
+    assert not RetryPolicy(retry_sqlstates=()).is_retryable(_RawDriverError("40001"))
+
+
+def test_backoff_is_capped_and_jittered() -> None:
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+    exact = RetryPolicy(base_delay=0.1, max_delay=0.3, jitter=False)
+
+    assert [exact.backoff(retry) for retry in range(4)] == [0.1, 0.2, 0.3, 0.3]
+    for retry in range(6):
+        assert 0.0 <= policy.backoff(retry) <= exact.backoff(retry)
+
+
+def test_policy_rejects_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="max_attempts"):
+        RetryPolicy(0)
+    with pytest.raises(ValueError, match="delays"):
+        RetryPolicy(base_delay=-1.0)
+
+
+def test_retry_budget_limits_retries_relative_to_requests() -> None:
+    budget = RetryBudget(ratio=0.5, max_tokens=2.0)
+
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+    budget.record_request()
+    assert not budget.try_acquire()
+    budget.record_request()
+    assert budget.try_acquire()
+
+    budget.reset()
+    assert budget.tokens == 2.0
+
+
+def test_policy_without_budget_always_allows_retry() -> None:
+    policy = RetryPolicy(budget=None)
+
+    assert all(policy.acquire_retry() for _ in range(100))
+
+
+def test_policy_draws_from_supplied_budget_unless_it_owns_one() -> None:
+    config_budget = RetryBudget(ratio=0.0, max_tokens=1.0)
+    shared = RetryPolicy()
+    owned = RetryPolicy(budget=RetryBudget(ratio=0.0, max_tokens=0.0))
+
+    assert shared.acquire_retry(config_budget)
+    assert not shared.acquire_retry(config_budget)
+    assert shared.acquire_retry()
+    assert not owned.acquire_retry(RetryBudget())
+    assert config_budget.tokens == 0.0
+
+
+def test_retry_policy_pickles_with_statement_config() -> None:
+    policy = RetryPolicy(5, base_delay=0.01)
+    config = StatementConfig(retry_policy=policy)
+
+    restored = pickle.loads(pickle.dumps(config))
+
+    assert restored.retry_policy == policy
+    assert restored.retry_policy.budget is Empty
+    assert config.replace(enable_caching=False).retry_policy is policy
+
+
+def test_retry_policy_pickles_explicit_budget_settings() -> None:
+    policy = RetryPolicy(budget=RetryBudget(ratio=0.5, max_tokens=4.0), log_retries=False)
+
+    restored = pickle.loads(pickle.dumps(policy))
+
+    assert restored == policy
+    assert isinstance(restored.budget, RetryBudget)
+    assert restored.budget.tokens == 4.0
+    assert restored.log_retries is False
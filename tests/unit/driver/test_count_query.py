@@ -2,7 +2,8 @@
 
 import sqlite3
 from collections import UserDict
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
 from types import SimpleNamespace
 from typing import Any
 
@@ -1101,3 +1102,152 @@ def test_with_total_count_with_union_all_custom_alias(mock_driver: "MockSyncDriv
 
     count_str = str(modified_sql)
     assert "row_total" in count_str.lower()
+
+
+# =============================================================================
+# Concurrent count query on an auxiliary pooled connection
+# =============================================================================
+
+
+async def _seed_concurrent_count_items(driver: "Any") -> None:
+    await driver.execute_script("""
+        CREATE TABLE concurrent_count_items (id INTEGER PRIMARY KEY, name TEXT);
+        INSERT INTO concurrent_count_items (id, name) VALUES (1, 'a');
+        INSERT INTO concurrent_count_items (id, name) VALUES (2, 'b');
+        INSERT INTO concurrent_count_items (id, name) VALUES (3, 'c');
+    """)
+    await driver.commit()
+
+
+@pytest.mark.anyio
+async def test_async_select_with_total_concurrent_count_uses_auxiliary_connection(tmp_path: "Any") -> None:
+    """Concurrent count mode should run the count query on a second pooled connection."""
+
+    from sqlspec.adapters.aiosqlite import AiosqliteConfig
+
+    config = AiosqliteConfig(connection_config={"database": str(tmp_path / "concurrent.db"), "pool_size": 3})
+    try:
+        async with config.provide_session() as driver:
+            await _seed_concurrent_count_items(driver)
+            auxiliary_connections: list[Any] = []
+
+            @asynccontextmanager
+            async def _tracking_provider() -> "AsyncIterator[Any]":
+                async with config.provide_connection() as connection:
+                    auxiliary_connections.append(connection)
+                    yield connection
+
+            driver.attach_connection_provider(_tracking_provider)
+            rows, total = await driver.select_with_total(
+                "SELECT id, name FROM concurrent_count_items ORDER BY id LIMIT 2", concurrent_count=True
+            )
+            session_connection = driver.connection
+
+        assert total == 3
+        assert [row["id"] for row in rows] == [1, 2]
+        assert len(auxiliary_connections) == 1
+        assert auxiliary_connections[0] is not session_connection
+    finally:
+        await config.close_pool()
+
+
+@pytest.mark.anyio
+async def test_async_select_with_total_concurrent_count_falls_back_when_pool_saturated(tmp_path: "Any") -> None:
+    """Concurrent count mode should stay on the session connection when the pool is exhausted."""
+
+    from sqlspec.adapters.aiosqlite import AiosqliteConfig
+
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "saturated.db"), "pool_size": 1},
+        driver_features={"enable_concurrent_count": True},
+    )
+    try:
+        async with config.provide_session() as driver:
+            await _seed_concurrent_count_items(driver)
+            assert config.pool_has_spare_capacity() is False
+            assert config.provide_auxiliary_connection() is None
+
+            rows, total = await driver.select_with_total("SELECT id FROM concurrent_count_items ORDER BY id LIMIT 1")
+
+        assert total == 3
+        assert rows == [{"id": 1}]
+    finally:
+        await config.close_pool()
+
+
+@pytest.mark.anyio
+async def test_async_select_with_total_concurrent_count_stays_sequential_in_transaction(tmp_path: "Any") -> None:
+    """Concurrent count mode must not leave an explicit transaction's connection."""
+
+    from sqlspec.adapters.aiosqlite import AiosqliteConfig
+
+    config = AiosqliteConfig(connection_config={"database": str(tmp_path / "transaction.db"), "pool_size": 3})
+    try:
+        async with config.provide_session() as driver:
+            await _seed_concurrent_count_items(driver)
+            await driver.begin()
+            await driver.execute("INSERT INTO concurrent_count_items (id, name) VALUES (4, 'd')")
+
+            rows, total = await driver.select_with_total(
+                "SELECT id FROM concurrent_count_items ORDER BY id", concurrent_count=True
+            )
+            await driver.rollback()
+
+        assert total == 4
+        assert len(rows) == 4
+    finally:
+        await config.close_pool()
+
+
+@pytest.mark.anyio
+async def test_async_auxiliary_connection_claims_spare_capacity_atomically(tmp_path: "Any") -> None:
+    """Auxiliary connections must reserve their slot so concurrent callers cannot overshoot the pool."""
+
+    from sqlspec.adapters.aiosqlite import AiosqliteConfig
+
+    config = AiosqliteConfig(connection_config={"database": str(tmp_path / "reserve.db"), "pool_size": 2})
+    try:
+        async with config.provide_session():
+            first = config.provide_auxiliary_connection()
+            second = config.provide_auxiliary_connection()
+
+            assert first is not None
+            assert second is None
+            assert config.pool_has_spare_capacity() is False
+            async with first as connection:
+                assert connection is not None
+            assert config.provide_auxiliary_connection() is not None
+            assert config._pending_acquires == 1
+    finally:
+        await config.close_pool()
+
+
+@pytest.mark.anyio
+async def test_async_auxiliary_connection_goes_through_admission_control(tmp_path: "Any") -> None:
+    """Auxiliary acquires must be rejected like any other acquire while the circuit is open."""
+
+    from sqlspec import CircuitBreaker
+    from sqlspec.adapters.aiosqlite import AiosqliteConfig
+    from sqlspec.exceptions import CircuitOpenError
+
+    breaker = CircuitBreaker(open_duration=60.0)
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "admission.db"), "pool_size": 3}, circuit_breaker=breaker
+    )
+    try:
+        async with config.provide_session():
+            auxiliary = config.provide_auxiliary_connection()
+            assert auxiliary is not None
+            breaker.record_failure()
+            for _ in range(breaker.minimum_calls):
+                breaker.record_failure()
+
+            with pytest.raises(CircuitOpenError):
+                async with auxiliary:
+                    pass
+            assert config._pending_acquires == 0
+            with pytest.raises(CircuitOpenError):
+                async with config.provide_connection():
+                    pass
+    finally:
+        await config.close_pool()
@@ -18,6 +18,7 @@ _ALIAS_PAIRS = (
     ("fetch_value_or_none", "select_value_or_none"),
     ("fetch_to_arrow", "select_to_arrow"),
     ("fetch_stream", "select_stream"),
+    ("fetch_stream_arrow", "select_stream_arrow"),
     ("fetch_with_total", "select_with_total"),
 )
 
@@ -75,6 +76,7 @@ _DELEGATION_CASES = (
         },
         {
             "statement_config": None,
+            "timeout": None,
             "return_format": "table",
             "native_only": False,
             "batch_size": None,
@@ -86,8 +88,23 @@ _DELEGATION_CASES = (
         "fetch_stream",
         "select_stream",
         ("SELECT * FROM users",),
-        {"schema_type": None, "statement_config": None, "chunk_size": 25, "native_only": False},
-        {"schema_type": None, "statement_config": None, "chunk_size": 25, "native_only": False},
+        {
+            "schema_type": None,
+            "statement_config": None,
+            "chunk_size": 25,
+            "native_only": False,
+            "prefetch": 2,
+            "adaptive_chunks": True,
+        },
+        {
+            "schema_type": None,
+            "statement_config": None,
+            "timeout": None,
+            "chunk_size": 25,
+            "native_only": False,
+            "prefetch": 2,
+            "adaptive_chunks": True,
+        },
         object(),
     ),
     (
@@ -95,7 +112,25 @@ _DELEGATION_CASES = (
         "select_with_total",
         ("SELECT * FROM users LIMIT 2",),
         {"schema_type": None, "statement_config": None},
-        {"schema_type": None, "statement_config": None, "count_with_window": False},
+        {"schema_type": None, "statement_config": None, "timeout": None, "count_with_window": False},
+        ([{"id": 1}, {"id": 2}], 100),
+    ),
+)
+
+_ASYNC_DELEGATION_CASES = (
+    *(case for case in _DELEGATION_CASES if case[0] not in {"fetch_stream", "fetch_with_total"}),
+    (
+        "fetch_with_total",
+        "select_with_total",
+        ("SELECT * FROM users LIMIT 2",),
+        {"schema_type": None, "statement_config": None},
+        {
+            "schema_type": None,
+            "statement_config": None,
+            "timeout": None,
+            "count_with_window": False,
+            "concurrent_count": None,
+        },
         ([{"id": 1}, {"id": 2}], 100),
     ),
 )
@@ -135,8 +170,7 @@ def test_sync_fetch_alias_delegates(
 
 @requires_interpreted
 @pytest.mark.parametrize(
-    ("alias_name", "target_name", "args", "call_kwargs", "expected_kwargs", "expected"),
-    tuple(case for case in _DELEGATION_CASES if case[0] != "fetch_stream"),
+    ("alias_name", "target_name", "args", "call_kwargs", "expected_kwargs", "expected"), _ASYNC_DELEGATION_CASES
 )
 async def test_async_fetch_alias_delegates(
     alias_name: str,
@@ -163,11 +197,25 @@ def test_async_fetch_stream_delegates_without_awaiting() -> None:
     driver.select_stream = Mock(return_value=stream)
 
     result = AsyncDriverAdapterBase.fetch_stream(
-        driver, "SELECT * FROM users", schema_type=None, statement_config=None, chunk_size=25, native_only=False
+        driver,
+        "SELECT * FROM users",
+        schema_type=None,
+        statement_config=None,
+        chunk_size=25,
+        native_only=False,
+        prefetch=2,
+        adaptive_chunks=True,
     )
 
     driver.select_stream.assert_called_once_with(
-        "SELECT * FROM users", schema_type=None, statement_config=None, chunk_size=25, native_only=False
+        "SELECT * FROM users",
+        schema_type=None,
+        statement_config=None,
+        timeout=None,
+        chunk_size=25,
+        native_only=False,
+        prefetch=2,
+        adaptive_chunks=True,
     )
     assert result is stream
 
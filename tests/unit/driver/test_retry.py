@@ -0,0 +1,208 @@
+"""Tests for statement and transaction retries in the driver bases."""
+
+import logging
+from typing import Any
+
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteDriver
+from sqlspec.adapters.sqlite import SqliteConfig, SqliteDriver
+from sqlspec.core import RetryBudget, RetryPolicy
+from sqlspec.exceptions import SerializationConflictError, TransactionRetryError, UniqueViolationError
+
+# pyright: reportPrivateUsage=false
+
+
+class _FlakySqliteDriver(SqliteDriver):
+    """SQLite driver failing the first ``failures`` executions with a serialization conflict."""
+
+    failures = 0
+    calls = 0
+
+    def dispatch_execute(self, cursor: Any, statement: Any) -> Any:
+        self.calls += 1
+        if self.calls <= self.failures:
+            msg = "could not serialize access"
+            raise SerializationConflictError(msg)
+        return super().dispatch_execute(cursor, statement)
+
+
+class _FlakyAiosqliteDriver(AiosqliteDriver):
+    failures = 0
+    calls = 0
+
+    async def dispatch_execute(self, cursor: Any, statement: Any) -> Any:
+        self.calls += 1
+        if self.calls <= self.failures:
+            msg = "could not serialize access"
+            raise SerializationConflictError(msg)
+        return await super().dispatch_execute(cursor, statement)
+
+
+def _fast_policy(max_attempts: int = 3, budget: "RetryBudget | None" = None) -> RetryPolicy:
+    return RetryPolicy(max_attempts, base_delay=0.0, max_delay=0.0, budget=budget)
+
+
+@pytest.fixture
+def flaky_sqlite_driver(sqlite_sync_driver: Any) -> "_FlakySqliteDriver":
+    return _FlakySqliteDriver(sqlite_sync_driver.connection)
+
+
+def test_execute_retries_transient_errors(flaky_sqlite_driver: "_FlakySqliteDriver") -> None:
+    flaky_sqlite_driver.failures = 2
+
+    result = flaky_sqlite_driver.execute("SELECT count(*) AS total FROM users", retry_policy=_fast_policy())
+
+    assert result.scalar() == 2
+    assert flaky_sqlite_driver.calls == 3
+    assert (
+        flaky_sqlite_driver.observability.metrics_snapshot()[
+            f"{flaky_sqlite_driver.observability.diagnostics_key}.retry.attempts"
+        ]
+        == 2.0
+    )
+
+
+def test_execute_reraises_after_max_attempts(flaky_sqlite_driver: "_FlakySqliteDriver") -> None:
+    flaky_sqlite_driver.failures = 5
+
+    with pytest.raises(SerializationConflictError):
+        flaky_sqlite_driver.execute("SELECT 1", retry_policy=_fast_policy(2))
+
+    assert flaky_sqlite_driver.calls == 2
+
+
+def test_execute_uses_statement_config_policy(flaky_sqlite_driver: "_FlakySqliteDriver") -> None:
+    flaky_sqlite_driver.failures = 1
+    config = flaky_sqlite_driver.statement_config.replace(retry_policy=_fast_policy())
+
+    assert flaky_sqlite_driver.select_value("SELECT 7", statement_config=config) == 7
+    assert flaky_sqlite_driver.calls == 2
+
+
+def test_execute_stops_when_budget_is_spent(flaky_sqlite_driver: "_FlakySqliteDriver") -> None:
+    flaky_sqlite_driver.failures = 5
+    budget = RetryBudget(ratio=0.0, max_tokens=1.0)
+
+    with pytest.raises(SerializationConflictError):
+        flaky_sqlite_driver.execute("SELECT 1", retry_policy=_fast_policy(5, budget=budget))
+
+    assert flaky_sqlite_driver.calls == 2
+    assert budget.tokens == 0.0
+
+
+def test_execute_does_not_retry_inside_transaction(flaky_sqlite_driver: "_FlakySqliteDriver") -> None:
+    flaky_sqlite_driver.begin()
+    flaky_sqlite_driver.failures = 1
+
+    with pytest.raises(SerializationConflictError):
+        flaky_sqlite_driver.execute("SELECT 1", retry_policy=_fast_policy())
+
+    assert flaky_sqlite_driver.calls == 1
+    flaky_sqlite_driver.rollback()
+
+
+def test_run_transaction_with_retry_reruns_whole_block(sqlite_sync_driver: Any) -> None:
+    attempts: list[int] = []
+
+    def operation() -> int:
+        sqlite_sync_driver.execute("INSERT INTO users (name) VALUES ('retry')")
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            msg = "restart transaction"
+            raise SerializationConflictError(msg)
+        return int(sqlite_sync_driver.select_value("SELECT count(*) FROM users WHERE name = 'retry'"))
+
+    assert sqlite_sync_driver.run_transaction_with_retry(operation, retry_policy=_fast_policy()) == 1
+    assert attempts == [0, 1]
+    assert sqlite_sync_driver.select_value("SELECT count(*) FROM users WHERE name = 'retry'") == 1
+
+
+def test_run_transaction_with_retry_propagates_permanent_errors(sqlite_sync_driver: Any) -> None:
+    calls: list[int] = []
+
+    def operation() -> None:
+        calls.append(1)
+        msg = "duplicate"
+        raise UniqueViolationError(msg)
+
+    with pytest.raises(UniqueViolationError):
+        sqlite_sync_driver.run_transaction_with_retry(operation, retry_policy=_fast_policy())
+
+    assert calls == [1]
+
+
+def _always_conflicts() -> None:
+    msg = "restart transaction"
+    raise SerializationConflictError(msg)
+
+
+def test_run_transaction_with_retry_raises_retry_error_when_exhausted(sqlite_sync_driver: Any) -> None:
+    with pytest.raises(TransactionRetryError, match="2 attempt") as exc_info:
+        sqlite_sync_driver.run_transaction_with_retry(_always_conflicts, retry_policy=_fast_policy(2))
+
+    assert isinstance(exc_info.value.__cause__, SerializationConflictError)
+
+
+def test_retry_logging_follows_policy(sqlite_sync_driver: Any, caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.DEBUG, logger="sqlspec.driver"), pytest.raises(TransactionRetryError):
+        sqlite_sync_driver.run_transaction_with_retry(
+            _always_conflicts, retry_policy=RetryPolicy(2, base_delay=0.0, budget=None, log_retries=False)
+        )
+    assert not [record for record in caplog.records if "driver.retry" in record.getMessage()]
+
+    with caplog.at_level(logging.DEBUG, logger="sqlspec.driver"), pytest.raises(TransactionRetryError):
+        sqlite_sync_driver.run_transaction_with_retry(_always_conflicts, retry_policy=_fast_policy(2))
+    assert [record for record in caplog.records if "driver.retry" in record.getMessage()]
+
+
+def test_retry_budget_is_per_config() -> None:
+    policy = RetryPolicy(50, base_delay=0.0, max_delay=0.0)
+    first = SqliteConfig(connection_config={"database": ":memory:"})
+    second = SqliteConfig(connection_config={"database": ":memory:"})
+
+    with first.provide_session() as session, pytest.raises(TransactionRetryError, match="11 attempt"):
+        session.run_transaction_with_retry(_always_conflicts, retry_policy=policy)
+
+    assert first.retry_budget.tokens < 1.0
+    assert second.retry_budget.tokens == second.retry_budget.max_tokens
+    with second.provide_session() as session, pytest.raises(TransactionRetryError, match="11 attempt"):
+        session.run_transaction_with_retry(_always_conflicts, retry_policy=policy)
+    first.close_pool()
+    second.close_pool()
+
+
+@pytest.mark.anyio
+async def test_async_run_transaction_with_retry_raises_retry_error_when_exhausted(aiosqlite_async_driver: Any) -> None:
+    async def operation() -> None:
+        _always_conflicts()
+
+    with pytest.raises(TransactionRetryError):
+        await aiosqlite_async_driver.run_transaction_with_retry(operation, retry_policy=_fast_policy(3))
+
+
+@pytest.mark.anyio
+async def test_async_execute_retries_transient_errors(aiosqlite_async_driver: Any) -> None:
+    driver = _FlakyAiosqliteDriver(aiosqlite_async_driver.connection)
+    driver.failures = 1
+
+    result = await driver.execute("SELECT count(*) AS total FROM users", retry_policy=_fast_policy())
+
+    assert result.scalar() == 2
+    assert driver.calls == 2
+
+
+@pytest.mark.anyio
+async def test_async_run_transaction_with_retry_reruns_whole_block(aiosqlite_async_driver: Any) -> None:
+    attempts: list[int] = []
+
+    async def operation() -> str:
+        await aiosqlite_async_driver.execute("INSERT INTO users (name) VALUES ('async-retry')")
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            msg = "restart transaction"
+            raise SerializationConflictError(msg)
+        return "ok"
+
+    assert await aiosqlite_async_driver.run_transaction_with_retry(operation, retry_policy=_fast_policy()) == "ok"
+    assert await aiosqlite_async_driver.select_value("SELECT count(*) FROM users WHERE name = 'async-retry'") == 1
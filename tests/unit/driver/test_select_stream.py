@@ -16,6 +16,12 @@ from sqlspec.adapters.aiosqlite import AiosqliteConfig
 from sqlspec.adapters.aiosqlite.core import AiosqliteStreamSource
 from sqlspec.adapters.sqlite import SqliteConfig
 from sqlspec.adapters.sqlite.core import SqliteStreamSource
+from sqlspec.driver._stream import (
+    AsyncAdaptiveRowSource,
+    AsyncPrefetchRowSource,
+    SyncAdaptiveRowSource,
+    SyncPrefetchRowSource,
+)
 from sqlspec.exceptions import ImproperConfigurationError
 
 _SELECT = "select id, name from items order by id"
@@ -72,6 +78,52 @@ def test_sync_select_stream_uses_native_source_by_default() -> None:
     assert first["id"] == 0
 
 
+def test_sync_select_stream_prefetch_streams_all_rows() -> None:
+    spec = SQLSpec()
+    config = spec.add_config(SqliteConfig(connection_config={"database": ":memory:"}))
+    with spec.provide_session(config) as session:
+        _seed_sync(session)
+        with session.fetch_stream(_SELECT, chunk_size=4, prefetch=2, schema_type=StreamItem) as stream:
+            assert isinstance(stream._source, SyncPrefetchRowSource)  # pyright: ignore[reportPrivateUsage]
+            streamed = list(stream)
+        assert session.select_value("select count(*) from items") == 25
+    assert [row.id for row in streamed] == list(range(25))
+
+
+def test_sync_select_stream_adaptive_chunks_resize_native_source() -> None:
+    spec = SQLSpec()
+    config = spec.add_config(SqliteConfig(connection_config={"database": ":memory:"}))
+    with spec.provide_session(config) as session:
+        _seed_sync(session)
+        with session.select_stream(_SELECT, chunk_size=4, adaptive_chunks=True, prefetch=1) as stream:
+            streamed = list(stream)
+            telemetry = stream.telemetry()
+    assert [row["id"] for row in streamed] == list(range(25))
+    assert telemetry["rows"] == 25
+    assert telemetry["chunk_sizes"][:2] == [4, 16]
+
+
+def test_sync_select_stream_adaptive_chunks_wraps_under_prefetch() -> None:
+    spec = SQLSpec()
+    config = spec.add_config(SqliteConfig(connection_config={"database": ":memory:"}))
+    with spec.provide_session(config) as session:
+        _seed_sync(session)
+        stream = session.select_stream(_SELECT, adaptive_chunks=True, prefetch=1)
+        source = stream._source  # pyright: ignore[reportPrivateUsage]
+        assert isinstance(source, SyncPrefetchRowSource)
+        assert isinstance(source._source, SyncAdaptiveRowSource)  # pyright: ignore[reportPrivateUsage]
+        stream.close()
+
+
+def test_sync_select_stream_rejects_negative_prefetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    spec = SQLSpec()
+    config = spec.add_config(SqliteConfig(connection_config={"database": ":memory:"}))
+    with spec.provide_session(config) as session:
+        monkeypatch.setattr(type(session), "dispatch_select_stream", _fail_dispatch)
+        with pytest.raises(ValueError, match="prefetch must be greater than or equal to 0"):
+            session.select_stream(_SELECT, prefetch=-1)
+
+
 def test_sync_select_stream_native_only_without_native_stream_raises(monkeypatch: pytest.MonkeyPatch) -> None:
     spec = SQLSpec()
     config = spec.add_config(SqliteConfig(connection_config={"database": ":memory:"}))
@@ -152,6 +204,31 @@ async def test_async_select_stream_uses_native_source_by_default() -> None:
     assert first["id"] == 0
 
 
+async def test_async_select_stream_prefetch_streams_all_rows() -> None:
+    spec = SQLSpec()
+    config = spec.add_config(AiosqliteConfig(connection_config={"database": ":memory:"}))
+    async with spec.provide_session(config) as session:
+        await _seed_async(session)
+        async with session.select_stream(_SELECT, chunk_size=4, prefetch=2) as stream:
+            assert isinstance(stream._source, AsyncPrefetchRowSource)  # pyright: ignore[reportPrivateUsage]
+            streamed = [row async for row in stream]
+        assert await session.select_value("select count(*) from items") == 25
+    assert [row["id"] for row in streamed] == list(range(25))
+
+
+async def test_async_select_stream_adaptive_chunks_resize_native_source() -> None:
+    spec = SQLSpec()
+    config = spec.add_config(AiosqliteConfig(connection_config={"database": ":memory:"}))
+    async with spec.provide_session(config) as session:
+        await _seed_async(session)
+        async with session.select_stream(_SELECT, chunk_size=20, adaptive_chunks=True) as stream:
+            assert isinstance(stream._source, AsyncAdaptiveRowSource)  # pyright: ignore[reportPrivateUsage]
+            streamed = [row async for row in stream]
+            telemetry = stream.telemetry()
+    assert len(streamed) == 25
+    assert telemetry["chunk_sizes"][:2] == [20, 40]
+
+
 async def test_async_select_stream_native_only_without_native_stream_raises(monkeypatch: pytest.MonkeyPatch) -> None:
     spec = SQLSpec()
     config = spec.add_config(AiosqliteConfig(connection_config={"database": ":memory:"}))
@@ -0,0 +1,182 @@
+"""Tests for ``select_stream_arrow`` RecordBatch streaming on the driver bases."""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.aiosqlite.core import AiosqliteStreamSource
+from sqlspec.adapters.duckdb import DuckDBConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.adapters.sqlite.core import SqliteStreamSource
+from sqlspec.adapters.sqlite.driver import SqliteDriver
+from sqlspec.exceptions import ImproperConfigurationError
+
+
+def _no_dict_rows(self: Any) -> Any:
+    _ = self
+    msg = "select_stream_arrow should not build dict rows"
+    raise AssertionError(msg)
+
+
+def _no_native_stream(self: Any, statement: Any, chunk_size: int) -> None:
+    _ = (self, statement, chunk_size)
+
+
+def _seed(session: Any, count: int = 25) -> None:
+    session.execute("CREATE TABLE items (id INTEGER, label TEXT)")
+    session.execute_many("INSERT INTO items VALUES (?, ?)", [(index, f"label-{index}") for index in range(count)])
+
+
+async def _seed_async(session: Any, count: int = 25) -> None:
+    await session.execute("CREATE TABLE items (id INTEGER, label TEXT)")
+    await session.execute_many("INSERT INTO items VALUES (?, ?)", [(index, f"label-{index}") for index in range(count)])
+
+
+def test_sqlite_select_stream_arrow_yields_one_batch_per_chunk(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session)
+        monkeypatch.setattr(SqliteStreamSource, "fetch_chunk", _no_dict_rows)
+        with session.select_stream_arrow("SELECT * FROM items ORDER BY id", batch_size=10) as stream:
+            batches = list(stream)
+        assert session.select_value("SELECT COUNT(*) FROM items") == 25
+    config.close_pool()
+
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+    assert pa.Table.from_batches(batches).column("id").to_pylist() == list(range(25))
+    assert stream.schema.names == ["id", "label"]
+
+
+def test_sqlite_select_stream_arrow_casts_to_schema_and_reports_empty_schema() -> None:
+    schema = pa.schema([("id", pa.int32()), ("label", pa.large_string())])
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session)
+        batches = list(session.select_stream_arrow("SELECT * FROM items", batch_size=30, arrow_schema=schema))
+        empty = session.select_stream_arrow("SELECT * FROM items WHERE id < 0")
+        assert list(empty) == []
+    config.close_pool()
+
+    assert batches[0].schema == schema
+    assert empty.schema.names == ["id", "label"]
+
+
+def test_sqlite_select_stream_arrow_types_columns_null_in_first_chunk() -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE items (id INTEGER, n INTEGER)")
+        session.execute_many("INSERT INTO items VALUES (?, ?)", [(1, None), (2, None), (3, 30), (4, None)])
+        with session.select_stream_arrow("SELECT id, n FROM items ORDER BY id", batch_size=2) as stream:
+            batches = list(stream)
+    config.close_pool()
+
+    assert stream.schema.field("n").type == pa.int64()
+    assert all(batch.schema == stream.schema for batch in batches)
+    assert pa.Table.from_batches(batches).column("n").to_pylist() == [None, None, 30, None]
+
+
+def test_sqlite_select_stream_arrow_close_releases_cursor() -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session)
+        stream = session.select_stream_arrow("SELECT * FROM items", batch_size=5)
+        first = next(stream)
+        stream.close()
+        assert first.num_rows == 5
+        assert list(stream) == []
+        assert session.select_value("SELECT COUNT(*) FROM items") == 25
+    config.close_pool()
+
+
+def test_select_stream_arrow_prefers_export_hook(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[bool] = []
+
+    def _export(self: Any, statement: Any, batch_size: int) -> Iterator[Any]:
+        _ = (self, statement)
+        try:
+            yield pa.record_batch({"id": pa.array(range(batch_size), pa.int64())})
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(SqliteDriver, "dispatch_arrow_export", _export)
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session, session.select_stream_arrow("SELECT 1 AS id", batch_size=3) as stream:
+        batches = list(stream)
+    config.close_pool()
+
+    assert [batch.num_rows for batch in batches] == [3]
+    assert closed == [True]
+
+
+def test_select_stream_arrow_falls_back_to_select_to_arrow(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SqliteDriver, "dispatch_select_stream", _no_native_stream)
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session)
+        batches = list(session.fetch_stream_arrow("SELECT * FROM items", batch_size=10))
+        stream = session.select_stream_arrow("SELECT * FROM items", native_only=True)
+        with pytest.raises(ImproperConfigurationError):
+            next(stream)
+    config.close_pool()
+
+    assert sum(batch.num_rows for batch in batches) == 25
+
+
+def test_duckdb_select_stream_arrow_uses_native_reader() -> None:
+    config = DuckDBConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        stream = session.select_stream_arrow("SELECT range AS id FROM range(5000)", batch_size=2048, native_only=True)
+        total = sum(batch.num_rows for batch in stream)
+    config.close_pool()
+
+    assert total == 5000
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_select_stream_arrow_rejects_non_positive_batch_size(batch_size: int) -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session, pytest.raises(ValueError, match="batch_size"):
+        session.select_stream_arrow("SELECT 1", batch_size=batch_size)
+    config.close_pool()
+
+
+async def test_aiosqlite_select_stream_arrow_yields_one_batch_per_chunk(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    async with config.provide_session() as session:
+        await _seed_async(session)
+        monkeypatch.setattr(AiosqliteStreamSource, "fetch_chunk", _no_dict_rows)
+        async with session.select_stream_arrow("SELECT * FROM items ORDER BY id", batch_size=10) as stream:
+            batches = [batch async for batch in stream]
+        assert await session.select_value("SELECT COUNT(*) FROM items") == 25
+    await config.close_pool()
+
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+    assert pa.Table.from_batches(batches).column("label").to_pylist()[-1] == "label-24"
+
+
+async def test_aiosqlite_select_stream_arrow_types_columns_null_in_first_chunk() -> None:
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE items (id INTEGER, n INTEGER)")
+        await session.execute_many("INSERT INTO items VALUES (?, ?)", [(1, None), (2, None), (3, 30)])
+        batches = [batch async for batch in session.select_stream_arrow("SELECT id, n FROM items", batch_size=2)]
+    await config.close_pool()
+
+    assert [batch.schema.field("n").type for batch in batches] == [pa.int64(), pa.int64()]
+
+
+async def test_aiosqlite_select_stream_arrow_falls_back_to_select_to_arrow(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    async with config.provide_session() as session:
+        await _seed_async(session)
+        monkeypatch.setattr(type(session), "dispatch_select_stream", _no_native_stream)
+        batches = [batch async for batch in session.select_stream_arrow("SELECT * FROM items", batch_size=10)]
+        stream = session.select_stream_arrow("SELECT * FROM items", native_only=True)
+        with pytest.raises(ImproperConfigurationError):
+            await stream.__anext__()
+    await config.close_pool()
+
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
@@ -0,0 +1,226 @@
+"""Tests for the base ``select_to_arrow`` path that columnarizes positional row chunks."""
+
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.aiosqlite.core import AiosqliteStreamSource
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.adapters.sqlite.core import SqliteStreamSource
+from sqlspec.adapters.sqlite.driver import SqliteDriver
+from sqlspec.exceptions import ImproperConfigurationError
+
+
+def _no_dict_rows(self: Any) -> Any:
+    _ = self
+    msg = "select_to_arrow should not build dict rows"
+    raise AssertionError(msg)
+
+
+def _seed(session: Any, count: int = 50) -> None:
+    session.execute("CREATE TABLE items (id INTEGER, score REAL, label TEXT, note TEXT)")
+    session.execute_many(
+        "INSERT INTO items VALUES (?, ?, ?, ?)",
+        [(index, index / 2, f"label-{index % 3}", None) for index in range(count)],
+    )
+
+
+def test_sqlite_select_to_arrow_skips_dict_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session)
+        expected = session.select("SELECT * FROM items ORDER BY id")
+        monkeypatch.setattr(SqliteStreamSource, "fetch_chunk", _no_dict_rows)
+        table = session.select_to_arrow("SELECT * FROM items ORDER BY id", batch_size=7).get_data()
+        batches = session.select_to_arrow("SELECT id FROM items", return_format="batches", batch_size=20).get_data()
+    config.close_pool()
+
+    assert table.to_pylist() == expected
+    assert table.schema.field("note").type == pa.string()
+    assert [batch.num_rows for batch in batches] == [20, 20, 10]
+
+
+def test_sqlite_select_to_arrow_reader_fetches_on_demand(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+    original = SqliteStreamSource.fetch_rows
+
+    def counting_fetch_rows(self: Any) -> Any:
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(SqliteStreamSource, "fetch_rows", counting_fetch_rows)
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session)
+        result = session.select_to_arrow(
+            "SELECT id, label FROM items ORDER BY id", return_format="reader", batch_size=10
+        )
+        reader = result.get_data()
+        fetched_before_read = len(calls)
+        first = reader.read_next_batch()
+        rest = reader.read_all()
+    config.close_pool()
+
+    assert isinstance(reader, pa.RecordBatchReader)
+    assert result.rows_affected == -1
+    assert fetched_before_read == 1
+    assert first.num_rows == 10
+    assert rest.num_rows == 40
+    assert len(calls) == 6
+
+
+def test_sqlite_select_to_arrow_reader_honours_arrow_schema() -> None:
+    schema = pa.schema([("id", pa.int32()), ("score", pa.float32())])
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session, 5)
+        reader = session.select_to_arrow(
+            "SELECT id, score FROM items", return_format="reader", batch_size=2, arrow_schema=schema
+        ).get_data()
+        table = reader.read_all()
+    config.close_pool()
+
+    assert table.schema == schema
+    assert table.num_rows == 5
+
+
+def test_sqlite_select_to_arrow_reader_types_columns_null_in_first_chunk() -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE items (id INTEGER, n INTEGER)")
+        session.execute_many("INSERT INTO items VALUES (?, ?)", [(1, None), (2, None), (3, 30), (4, 40), (5, None)])
+        reader = session.select_to_arrow(
+            "SELECT id, n FROM items ORDER BY id", return_format="reader", batch_size=2
+        ).get_data()
+        batches = list(reader)
+    config.close_pool()
+
+    assert reader.schema.field("n").type == pa.int64()
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert pa.Table.from_batches(batches).column("n").to_pylist() == [None, None, 30, 40, None]
+
+
+def _failing_batch(rows: Any, column_names: Any) -> Any:
+    msg = "columnarize failed"
+    raise ValueError(msg)
+
+
+def test_sqlite_select_to_arrow_closes_stream_when_columnarizing_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[bool] = []
+    original = SqliteStreamSource.close
+
+    def recording_close(self: Any, error: bool = False) -> None:
+        closed.append(error)
+        original(self, error)
+
+    monkeypatch.setattr(SqliteStreamSource, "close", recording_close)
+    monkeypatch.setattr("sqlspec.driver._sync.rows_to_arrow_batch", _failing_batch)
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session, 5)
+        with pytest.raises(ValueError, match="columnarize failed"):
+            session.select_to_arrow("SELECT id FROM items")
+    config.close_pool()
+
+    assert closed == [False]
+
+
+def test_sqlite_select_to_arrow_empty_result_keeps_columns() -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session, 0)
+        table = session.select_to_arrow("SELECT id, label FROM items").get_data()
+    config.close_pool()
+
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "label"]
+
+
+def test_sqlite_select_to_arrow_falls_back_without_row_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SqliteDriver, "dispatch_select_stream", lambda self, statement, chunk_size: None)
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session, 3)
+        table = session.select_to_arrow("SELECT id FROM items ORDER BY id").get_data()
+    config.close_pool()
+
+    assert table.column("id").to_pylist() == [0, 1, 2]
+
+
+def test_sqlite_select_to_arrow_prefers_export_hook(monkeypatch: pytest.MonkeyPatch, tmp_path: Any) -> None:
+    closed: list[bool] = []
+
+    def export(self: Any, statement: Any, batch_size: int) -> Any:
+        def batches() -> Any:
+            try:
+                for start in range(0, 6, batch_size):
+                    yield pa.record_batch({"id": list(range(start, min(start + batch_size, 6)))})
+            finally:
+                closed.append(True)
+
+        return batches() if "items" in statement.sql else None
+
+    monkeypatch.setattr(SqliteDriver, "dispatch_arrow_export", export)
+    monkeypatch.setattr(SqliteStreamSource, "fetch_chunk", _no_dict_rows)
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        _seed(session, 0)
+        result = session.select_to_arrow("SELECT id FROM items", native_only=True, batch_size=4)
+        reader = session.select_to_arrow("SELECT id FROM items", return_format="reader", batch_size=4).get_data()
+        job = session.select_to_storage("SELECT id FROM items", str(tmp_path / "ids.parquet"), batch_size=4)
+        with pytest.raises(ImproperConfigurationError, match="native Arrow"):
+            session.select_to_arrow("SELECT 1 AS id", native_only=True)
+    config.close_pool()
+
+    assert result.get_data().column("id").to_pylist() == list(range(6))
+    assert result.rows_affected == 6
+    assert [batch.num_rows for batch in reader] == [4, 2]
+    assert job.telemetry["rows_processed"] == 6
+    assert closed == [True, True, True]
+
+
+@pytest.mark.anyio
+async def test_aiosqlite_select_to_arrow_skips_dict_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def no_dict_rows(self: Any) -> Any:
+        return _no_dict_rows(self)
+
+    monkeypatch.setattr(AiosqliteStreamSource, "fetch_chunk", no_dict_rows)
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE items (id INTEGER, label TEXT)")
+        await session.execute_many("INSERT INTO items VALUES (?, ?)", [(index, f"v{index}") for index in range(25)])
+        table = (await session.select_to_arrow("SELECT * FROM items ORDER BY id", batch_size=10)).get_data()
+        reader = (
+            await session.select_to_arrow("SELECT id FROM items", return_format="reader", batch_size=10)
+        ).get_data()
+    await config.close_pool()
+
+    assert table.num_rows == 25
+    assert table.column("label")[24].as_py() == "v24"
+    assert [batch.num_rows for batch in reader] == [10, 10, 5]
+
+
+@pytest.mark.anyio
+async def test_aiosqlite_select_to_arrow_closes_stream_when_columnarizing_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    closed: list[bool] = []
+    original = AiosqliteStreamSource.close
+
+    async def recording_close(self: Any, error: bool = False) -> None:
+        closed.append(error)
+        await original(self, error)
+
+    monkeypatch.setattr(AiosqliteStreamSource, "close", recording_close)
+    monkeypatch.setattr("sqlspec.driver._async.rows_to_arrow_batch", _failing_batch)
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE items (id INTEGER)")
+        await session.execute_many("INSERT INTO items VALUES (?)", [(index,) for index in range(5)])
+        with pytest.raises(ValueError, match="columnarize failed"):
+            await session.select_to_arrow("SELECT id FROM items")
+    await config.close_pool()
+
+    assert closed == [False]
@@ -0,0 +1,253 @@
+"""Tests for per-statement timeouts and cancellation."""
+
+import asyncio
+import contextlib
+import threading
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any, cast
+
+import psycopg
+import pytest
+
+from sqlspec.adapters.asyncpg.driver import AsyncpgDriver
+from sqlspec.adapters.duckdb import DuckDBConfig
+from sqlspec.adapters.psycopg.driver import PsycopgSyncDriver
+from sqlspec.core import StatementConfig
+from sqlspec.driver import AsyncStatementTimeout, SyncStatementTimeout
+from sqlspec.driver._timeout import add_max_execution_time_hint
+from sqlspec.exceptions import QueryTimeoutError, StatementTimeoutError
+
+# pyright: reportPrivateUsage=false
+
+SLOW_QUERY = """
+WITH RECURSIVE counter(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM counter WHERE n < 100000000)
+SELECT count(*) AS total FROM counter
+"""
+
+DUCKDB_SLOW_QUERY = "SELECT count(*) AS total FROM range(2000000000) a CROSS JOIN range(10) b"
+
+
+@pytest.fixture
+def duckdb_driver() -> Iterator[Any]:
+    config = DuckDBConfig()
+    with config.provide_session() as driver:
+        yield driver
+    config.close_pool()
+
+
+class _CancellableCursor:
+    """psycopg cursor stand-in whose ``execute`` blocks until the connection is cancelled."""
+
+    description = None
+    rowcount = -1
+    statusmessage = None
+
+    def __init__(self, connection: "_CancellableConnection") -> None:
+        self._connection = connection
+        self.itersize = 0
+
+    def execute(self, query: Any, params: Any = None, **kwargs: Any) -> None:
+        self._connection.statements.append(str(query))
+        if not self._connection.cancelled.wait(2.0):
+            msg = "statement was not cancelled"
+            raise AssertionError(msg)
+        raise psycopg.errors.QueryCanceled("canceling statement due to user request")
+
+    def close(self) -> None:
+        return None
+
+
+class _CancellableConnection:
+    def __init__(self) -> None:
+        self.autocommit = True
+        self.info = SimpleNamespace(transaction_status=0)
+        self.cancelled = threading.Event()
+        self.statements: list[str] = []
+
+    def cursor(self, *args: Any, **kwargs: Any) -> _CancellableCursor:
+        return _CancellableCursor(self)
+
+    def transaction(self) -> "contextlib.nullcontext[None]":
+        return contextlib.nullcontext()
+
+    def cancel_safe(self) -> None:
+        self.cancelled.set()
+
+
+def _psycopg_driver(connection: _CancellableConnection) -> PsycopgSyncDriver:
+    return PsycopgSyncDriver(cast("Any", connection), driver_features={"enable_copy_arrow_export": False})
+
+
+def test_statement_config_carries_statement_timeout() -> None:
+    config = StatementConfig(statement_timeout=1.5)
+
+    assert config.statement_timeout == 1.5
+    assert config.replace(statement_timeout=None).statement_timeout is None
+    assert config != StatementConfig()
+    assert "statement_timeout=1.5" in repr(config)
+
+
+def test_statement_timeout_error_is_query_timeout_error() -> None:
+    error = StatementTimeoutError("too slow", timeout=0.25)
+
+    assert isinstance(error, QueryTimeoutError)
+    assert error.timeout == 0.25
+
+
+def test_sqlite_execute_timeout_interrupts_statement(sqlite_sync_driver: Any) -> None:
+    with pytest.raises(StatementTimeoutError) as exc_info:
+        sqlite_sync_driver.execute(SLOW_QUERY, timeout=0.05)
+
+    assert exc_info.value.timeout == 0.05
+    assert sqlite_sync_driver.select_value("SELECT count(*) FROM users") == 2
+
+
+def test_sqlite_statement_config_timeout_applies_to_every_statement(sqlite_sync_driver: Any) -> None:
+    config = sqlite_sync_driver.statement_config.replace(statement_timeout=0.05)
+
+    with pytest.raises(StatementTimeoutError):
+        sqlite_sync_driver.select_value(SLOW_QUERY, statement_config=config)
+
+    assert sqlite_sync_driver.select_value("SELECT count(*) FROM users", statement_config=config) == 2
+
+
+def test_sqlite_timeout_removes_progress_handler(sqlite_sync_driver: Any) -> None:
+    with pytest.raises(StatementTimeoutError):
+        sqlite_sync_driver.execute(SLOW_QUERY, timeout=0.05)
+
+    # A lingering handler would interrupt any statement past the expired deadline.
+    total = sqlite_sync_driver.select_value(
+        "WITH RECURSIVE c(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM c WHERE n < 10000) SELECT count(*) FROM c"
+    )
+    assert total == 10000
+
+
+def test_sync_watchdog_calls_interrupt_after_deadline() -> None:
+    interrupted = threading.Event()
+
+    class _RecordingTimeout(SyncStatementTimeout):
+        def arm(self) -> None:
+            self.start_watchdog()
+
+        def interrupt(self) -> None:
+            interrupted.set()
+
+    scope = _RecordingTimeout(None, 0.01)
+    with scope:
+        assert interrupted.wait(1.0)
+
+    assert scope.timed_out is True
+    assert scope.expired is True
+
+
+@pytest.mark.anyio
+async def test_aiosqlite_execute_timeout_interrupts_statement(aiosqlite_async_driver: Any) -> None:
+    with pytest.raises(StatementTimeoutError):
+        await aiosqlite_async_driver.execute(SLOW_QUERY, timeout=0.05)
+
+    assert await aiosqlite_async_driver.select_value("SELECT count(*) FROM users") == 2
+
+
+@pytest.mark.anyio
+async def test_async_statement_timeout_cancels_awaitable() -> None:
+    scope = AsyncStatementTimeout(None, 0.01)
+
+    with pytest.raises(StatementTimeoutError):
+        async with scope:
+            await scope.run(asyncio.sleep(1.0))
+
+    assert scope.timed_out is True
+
+
+def test_duckdb_select_with_total_timeout(duckdb_driver: Any) -> None:
+    with pytest.raises(StatementTimeoutError):
+        duckdb_driver.select_with_total(DUCKDB_SLOW_QUERY, timeout=0.1)
+
+    assert duckdb_driver.select_with_total("SELECT * FROM range(5) t(n) LIMIT 2", timeout=5.0)[1] == 5
+
+
+def test_duckdb_select_stream_timeout(duckdb_driver: Any) -> None:
+    with pytest.raises(StatementTimeoutError), duckdb_driver.select_stream(DUCKDB_SLOW_QUERY, timeout=0.1) as stream:
+        list(stream)
+
+    assert duckdb_driver.select_value("SELECT 1") == 1
+
+
+@pytest.mark.parametrize("return_format", ["table", "reader"])
+def test_duckdb_select_to_arrow_timeout(duckdb_driver: Any, return_format: str) -> None:
+    with pytest.raises(StatementTimeoutError):
+        result = duckdb_driver.select_to_arrow(DUCKDB_SLOW_QUERY, timeout=0.1, return_format=return_format)
+        if return_format == "reader":
+            result.data.read_all()
+
+    assert duckdb_driver.select_to_arrow("SELECT 1 AS n", timeout=5.0).data.column("n").to_pylist() == [1]
+
+
+def test_timeout_override_does_not_leak_through_statement_cache(duckdb_driver: Any) -> None:
+    assert duckdb_driver.select_value("SELECT 1") == 1
+    assert (
+        duckdb_driver.prepare_statement(
+            "SELECT 1", statement_config=duckdb_driver.statement_config.replace(statement_timeout=1.0)
+        ).statement_config.statement_timeout
+        == 1.0
+    )
+    assert duckdb_driver.prepare_statement("SELECT 1").statement_config.statement_timeout is None
+
+
+def test_psycopg_select_with_total_timeout_cancels_statement() -> None:
+    connection = _CancellableConnection()
+
+    with pytest.raises(StatementTimeoutError):
+        _psycopg_driver(connection).select_with_total("SELECT * FROM items", timeout=0.05)
+
+    assert connection.cancelled.is_set()
+
+
+def test_psycopg_select_stream_timeout_cancels_statement() -> None:
+    connection = _CancellableConnection()
+    driver = _psycopg_driver(connection)
+
+    with pytest.raises(StatementTimeoutError), driver.select_stream("SELECT * FROM items", timeout=0.05) as stream:
+        list(stream)
+
+    assert connection.cancelled.is_set()
+
+
+def test_psycopg_select_to_arrow_timeout_cancels_statement() -> None:
+    connection = _CancellableConnection()
+
+    with pytest.raises(StatementTimeoutError):
+        _psycopg_driver(connection).select_to_arrow("SELECT * FROM items", timeout=0.05)
+
+    assert connection.cancelled.is_set()
+
+
+def test_max_execution_time_hint_only_touches_select() -> None:
+    assert add_max_execution_time_hint("SELECT a FROM t", 0.05) == "SELECT /*+ MAX_EXECUTION_TIME(50) */ a FROM t"
+    assert (
+        add_max_execution_time_hint("-- note\nselect /*+ BKA(t) */ a FROM t", 1.5)
+        == "-- note\nselect /*+ MAX_EXECUTION_TIME(1500) BKA(t) */ a FROM t"
+    )
+    assert add_max_execution_time_hint("UPDATE t SET a = 1", 1.0) == "UPDATE t SET a = 1"
+    assert add_max_execution_time_hint("SELECT 1", None) == "SELECT 1"
+
+
+@pytest.mark.anyio
+async def test_asyncpg_uses_native_timeout_argument() -> None:
+    class _Connection:
+        def __init__(self) -> None:
+            self.timeouts: list[float | None] = []
+
+        async def fetch(self, query: str, *args: Any, timeout: "float | None" = None) -> list[Any]:
+            self.timeouts.append(timeout)
+            raise asyncio.TimeoutError
+
+    connection = _Connection()
+    driver = AsyncpgDriver(cast("Any", connection))
+
+    with pytest.raises(StatementTimeoutError) as exc_info:
+        await driver.select("SELECT 1", timeout=0.25)
+
+    assert connection.timeouts == [0.25]
+    assert exc_info.value.timeout == 0.25
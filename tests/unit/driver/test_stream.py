@@ -1,16 +1,22 @@
 """Unit tests for row streaming primitives (sqlspec/driver/_stream.py)."""
 
+import asyncio
+import time
 from typing import Any
 
 import pytest
 
 from sqlspec.driver._stream import (
+    AdaptiveChunkSizing,
+    AsyncPrefetchRowSource,
     AsyncRowSource,
     AsyncRowStream,
     EagerAsyncRowSource,
     EagerSyncRowSource,
+    SyncPrefetchRowSource,
     SyncRowSource,
     SyncRowStream,
+    estimate_row_bytes,
     rows_to_dicts,
 )
 
@@ -358,11 +364,273 @@ async def test_eager_async_source_drives_async_stream_end_to_end() -> None:
     assert [row async for row in stream] == _rows(0, 25)
 
 
+# --------------------------------------------------------------------------- #
+# Prefetching sources
+# --------------------------------------------------------------------------- #
+
+
+def _wait_for_fetches(source: FakeSyncSource, expected: int) -> None:
+    deadline = time.monotonic() + 5
+    while source.fetch_calls < expected and time.monotonic() < deadline:
+        time.sleep(0.005)
+    time.sleep(0.05)
+
+
+def test_sync_prefetch_yields_all_rows_in_order() -> None:
+    source = FakeSyncSource([_rows(0, 10), _rows(10, 20), _rows(20, 25)])
+    stream = _sync_stream(source)._with_prefetch(2)  # pyright: ignore[reportPrivateUsage]
+
+    collected = list(stream)
+
+    assert collected == _rows(0, 25)
+    assert source.fetch_calls == 4
+    assert source.close_errors == [False]
+
+
+def test_sync_prefetch_keeps_at_most_prefetch_chunks_ahead() -> None:
+    source = FakeSyncSource([_rows(index * 2, index * 2 + 2) for index in range(20)])
+    stream = _sync_stream(source)._with_prefetch(2)  # pyright: ignore[reportPrivateUsage]
+
+    next(stream)
+    _wait_for_fetches(source, 3)
+
+    assert source.fetch_calls == 3
+    stream.close()
+    assert source.close_errors == [False]
+
+
+def test_sync_prefetch_fetch_error_raises_on_consumer_and_closes() -> None:
+    class RaisingFetch(FakeSyncSource):
+        def fetch_chunk(self) -> "list[dict[str, Any]]":
+            self.fetch_calls += 1
+            if self.fetch_calls == 2:
+                raise RuntimeError("fetch boom")
+            return _rows(0, 2)
+
+    source = RaisingFetch([])
+    stream = _sync_stream(source)._with_prefetch(3)  # pyright: ignore[reportPrivateUsage]
+
+    with pytest.raises(RuntimeError, match="fetch boom"):
+        list(stream)
+
+    assert source.close_errors == [True]
+
+
+async def test_async_prefetch_yields_all_rows_in_order() -> None:
+    source = FakeAsyncSource([_rows(0, 10), _rows(10, 20), _rows(20, 25)])
+    stream = _async_stream(source)._with_prefetch(2)  # pyright: ignore[reportPrivateUsage]
+
+    collected = [row async for row in stream]
+
+    assert collected == _rows(0, 25)
+    assert isinstance(stream._source, AsyncPrefetchRowSource)  # pyright: ignore[reportPrivateUsage]
+    assert source.fetch_calls == 4
+    assert source.close_errors == [False]
+
+
+async def test_async_prefetch_keeps_at_most_prefetch_chunks_ahead() -> None:
+    source = FakeAsyncSource([_rows(index * 2, index * 2 + 2) for index in range(20)])
+    stream = _async_stream(source)._with_prefetch(2)  # pyright: ignore[reportPrivateUsage]
+
+    await stream.__anext__()
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert source.fetch_calls == 3
+    await stream.aclose()
+    assert source.close_errors == [False]
+
+
+async def test_async_prefetch_fetch_error_raises_on_consumer_and_closes() -> None:
+    class RaisingFetch(FakeAsyncSource):
+        async def fetch_chunk(self) -> "list[dict[str, Any]]":
+            self.fetch_calls += 1
+            if self.fetch_calls == 2:
+                raise RuntimeError("fetch boom")
+            return _rows(0, 2)
+
+    source = RaisingFetch([])
+    stream = _async_stream(source)._with_prefetch(3)  # pyright: ignore[reportPrivateUsage]
+
+    with pytest.raises(RuntimeError, match="fetch boom"):
+        _ = [row async for row in stream]
+
+    assert source.close_errors == [True]
+
+
+async def test_async_prefetch_close_cancels_in_flight_fetch() -> None:
+    class BlockingFetch(FakeAsyncSource):
+        async def fetch_chunk(self) -> "list[dict[str, Any]]":
+            self.fetch_calls += 1
+            if self.fetch_calls > 1:
+                await asyncio.Event().wait()
+            return _rows(0, 2)
+
+    source = BlockingFetch([])
+    stream = _async_stream(source)._with_prefetch(1)  # pyright: ignore[reportPrivateUsage]
+
+    await stream.__anext__()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    await stream.aclose()
+
+    assert source.fetch_calls == 2
+    assert source.close_errors == [True]
+
+
+def test_prefetch_is_not_applied_after_start() -> None:
+    stream = _sync_stream(FakeSyncSource([_rows(0, 2)]))
+    next(stream)
+
+    stream._with_prefetch(2)  # pyright: ignore[reportPrivateUsage]
+
+    assert not isinstance(stream._source, SyncPrefetchRowSource)  # pyright: ignore[reportPrivateUsage]
+
+
 # --------------------------------------------------------------------------- #
 # rows_to_dicts
 # --------------------------------------------------------------------------- #
 
 
+class ResizableSyncSource(FakeSyncSource):
+    """Serves ``total`` rows of ``width``-character payloads, honouring ``set_chunk_size``."""
+
+    def __init__(self, total: int, width: int, delay: float = 0.0) -> None:
+        super().__init__([])
+        self._remaining = total
+        self._payload = "x" * width
+        self._delay = delay
+        self.chunk_size = 0
+        self.requested: list[int] = []
+
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self.chunk_size = chunk_size
+
+    def fetch_chunk(self) -> "list[dict[str, Any]]":
+        self.fetch_calls += 1
+        self.requested.append(self.chunk_size)
+        if self._delay:
+            time.sleep(self._delay)
+        count = min(self.chunk_size, self._remaining)
+        self._remaining -= count
+        return [{"payload": self._payload} for _ in range(count)]
+
+
+class ResizableAsyncSource(FakeAsyncSource):
+    """Async mirror of ResizableSyncSource."""
+
+    def __init__(self, total: int, width: int) -> None:
+        super().__init__([])
+        self._remaining = total
+        self._payload = "x" * width
+        self.chunk_size = 0
+        self.requested: list[int] = []
+
+    def set_chunk_size(self, chunk_size: int) -> None:
+        self.chunk_size = chunk_size
+
+    async def fetch_chunk(self) -> "list[dict[str, Any]]":
+        self.fetch_calls += 1
+        self.requested.append(self.chunk_size)
+        count = min(self.chunk_size, self._remaining)
+        self._remaining -= count
+        return [{"payload": self._payload} for _ in range(count)]
+
+
+def test_adaptive_chunks_shrink_wide_rows_to_byte_budget() -> None:
+    source = ResizableSyncSource(total=2000, width=10_000)
+    policy = AdaptiveChunkSizing(target_bytes=100_000, target_latency=10.0, min_chunk_size=1)
+    stream = _sync_stream(source)._with_adaptive_chunks(policy, 100)  # pyright: ignore[reportPrivateUsage]
+
+    rows = sum(1 for _ in stream)
+
+    assert rows == 2000
+    assert source.requested[:2] == [100, 10]
+    assert set(source.requested[1:-1]) == {10}
+    telemetry = stream.telemetry()
+    assert telemetry["adaptive"] is True
+    assert telemetry["rows"] == 2000
+    assert telemetry["chunk_sizes"] == source.requested
+    assert telemetry["estimated_bytes"] == 2000 * 10_000
+
+
+def test_adaptive_chunks_grow_narrow_rows_up_to_max_growth() -> None:
+    source = ResizableSyncSource(total=5000, width=4)
+    policy = AdaptiveChunkSizing(target_bytes=1_000_000, target_latency=10.0, max_chunk_size=1000)
+    stream = _sync_stream(source)._with_adaptive_chunks(policy, 100)  # pyright: ignore[reportPrivateUsage]
+
+    list(stream)
+
+    assert source.requested[:5] == [100, 200, 400, 800, 1000]
+    assert stream.telemetry()["next_chunk_size"] == 1000
+
+
+def test_adaptive_chunks_start_at_the_requested_chunk_size() -> None:
+    source = ResizableSyncSource(total=100, width=4)
+    policy = AdaptiveChunkSizing(target_bytes=1_000_000, target_latency=10.0, min_chunk_size=16)
+    stream = _sync_stream(source)._with_adaptive_chunks(policy, 5)  # pyright: ignore[reportPrivateUsage]
+
+    assert sum(1 for _ in stream) == 100
+    assert source.requested[:3] == [5, 16, 32]
+
+
+def test_adaptive_chunks_cap_fetch_latency() -> None:
+    source = ResizableSyncSource(total=400, width=4, delay=0.02)
+    policy = AdaptiveChunkSizing(target_bytes=1_000_000, target_latency=0.01, min_chunk_size=1)
+    stream = _sync_stream(source)._with_adaptive_chunks(policy, 100)  # pyright: ignore[reportPrivateUsage]
+
+    next(stream)
+    stream.close()
+
+    assert stream.telemetry()["next_chunk_size"] <= 50
+
+
+def test_adaptive_chunks_without_resize_hook_only_record_telemetry() -> None:
+    source = FakeSyncSource([_rows(0, 10), _rows(10, 20)])
+    stream = _sync_stream(source)._with_adaptive_chunks(True, 10)  # pyright: ignore[reportPrivateUsage]
+
+    assert list(stream) == _rows(0, 20)
+    assert stream.telemetry()["chunks"] == 2
+    assert source.close_errors == [False]
+
+
+def test_adaptive_chunks_disabled_reports_empty_telemetry() -> None:
+    stream = _sync_stream(FakeSyncSource([_rows(0, 3)]))._with_adaptive_chunks(False, 10)  # pyright: ignore[reportPrivateUsage]
+
+    assert list(stream) == _rows(0, 3)
+    assert stream.telemetry()["adaptive"] is False
+    assert stream.telemetry()["chunk_sizes"] == []
+
+
+async def test_async_adaptive_chunks_shrink_wide_rows_to_byte_budget() -> None:
+    source = ResizableAsyncSource(total=500, width=10_000)
+    policy = AdaptiveChunkSizing(target_bytes=100_000, target_latency=10.0, min_chunk_size=1)
+    stream = _async_stream(source)._with_adaptive_chunks(policy, 100)  # pyright: ignore[reportPrivateUsage]
+
+    rows = [row async for row in stream]
+
+    assert len(rows) == 500
+    assert source.requested[:3] == [100, 10, 10]
+    assert stream.telemetry()["rows"] == 500
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"target_bytes": 0}, {"target_latency": 0}, {"min_chunk_size": 0}, {"min_chunk_size": 10, "max_chunk_size": 5}],
+)
+def test_adaptive_chunk_sizing_rejects_invalid_targets(kwargs: "dict[str, Any]") -> None:
+    with pytest.raises(ValueError):
+        AdaptiveChunkSizing(**kwargs)
+
+
+def test_estimate_row_bytes_counts_nested_json_payloads() -> None:
+    rows = [{"id": 1, "doc": {"tags": ["ab", "cd"], "body": "x" * 100}}]
+
+    assert estimate_row_bytes(rows) == 8 + 4 + 2 + 2 + 4 + 100
+    assert estimate_row_bytes([(1, b"abcd", None)]) == 8 + 4 + 1
+    assert estimate_row_bytes([]) == 0.0
+
+
 def test_rows_to_dicts_zips_tuple_rows_with_column_names() -> None:
     result = rows_to_dicts([(1, "a"), (2, "b")], ["id", "name"])
     assert result == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
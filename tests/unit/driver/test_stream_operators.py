@@ -0,0 +1,234 @@
+"""Tests for lazy row stream operators and sinks (sqlspec/driver/_stream.py)."""
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pyarrow.parquet as pq
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.driver._stream import AsyncRowStream, SyncRowStream
+from sqlspec.storage import AsyncStoragePipeline, SyncStoragePipeline
+
+
+@dataclass
+class Item:
+    """Typed row target for ``to_schema``."""
+
+    id: int
+
+
+def _rows(start: int, stop: int) -> "list[dict[str, Any]]":
+    return [{"id": i} for i in range(start, stop)]
+
+
+class ChunkSource:
+    """Serves fixed chunks, counting fetches and recording close calls."""
+
+    def __init__(self, chunks: "list[list[dict[str, Any]]]") -> None:
+        self._chunks = [list(chunk) for chunk in chunks]
+        self.fetch_calls = 0
+        self.close_errors: list[bool] = []
+
+    def start(self) -> None:
+        return None
+
+    def fetch_chunk(self) -> "list[dict[str, Any]]":
+        self.fetch_calls += 1
+        return self._chunks.pop(0) if self._chunks else []
+
+    def close(self, error: bool = False) -> None:
+        self.close_errors.append(error)
+
+
+class AsyncChunkSource(ChunkSource):
+    """Async mirror of ChunkSource."""
+
+    async def start(self) -> None:  # type: ignore[override]
+        return None
+
+    async def fetch_chunk(self) -> "list[dict[str, Any]]":  # type: ignore[override]
+        self.fetch_calls += 1
+        await asyncio.sleep(0)
+        return self._chunks.pop(0) if self._chunks else []
+
+    async def close(self, error: bool = False) -> None:  # type: ignore[override]
+        self.close_errors.append(error)
+
+
+def _chunked(total: int, size: int) -> "list[list[dict[str, Any]]]":
+    return [_rows(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+def test_operators_are_lazy_until_first_read() -> None:
+    source = ChunkSource(_chunked(20, 5))
+    stream = SyncRowStream(source).filter(lambda row: row["id"] % 2 == 0).map_chunks(lambda chunk: chunk).take(3)
+
+    assert source.fetch_calls == 0
+    assert [row["id"] for row in stream] == [0, 2, 4]
+    assert source.fetch_calls == 1
+    assert source.close_errors == [False]
+
+
+def test_filter_skips_chunks_with_no_matches() -> None:
+    source = ChunkSource(_chunked(30, 10))
+    stream = SyncRowStream(source).filter(lambda row: row["id"] >= 25)
+
+    assert stream.next_chunk() == _rows(25, 30)
+    assert stream.next_chunk() == []
+
+
+def test_map_chunks_and_to_schema_apply_per_chunk() -> None:
+    seen: list[int] = []
+
+    def double(chunk: "list[dict[str, Any]]") -> "list[dict[str, Any]]":
+        seen.append(len(chunk))
+        return [{"id": row["id"] * 2} for row in chunk]
+
+    stream = SyncRowStream(ChunkSource(_chunked(7, 3))).map_chunks(double).to_schema(Item)
+
+    assert list(stream) == [Item(id=value * 2) for value in range(7)]
+    assert seen == [3, 3, 1]
+
+
+def test_batched_regroups_rows_across_chunks() -> None:
+    stream = SyncRowStream(ChunkSource(_chunked(23, 7))).batched(5)
+
+    batches = list(stream)
+
+    assert [len(batch) for batch in batches] == [5, 5, 5, 5, 3]
+    assert [row["id"] for batch in batches for row in batch] == list(range(23))
+
+
+def test_take_stops_early_and_closes_parent() -> None:
+    source = ChunkSource(_chunked(100, 10))
+    stream = SyncRowStream(source).take(15)
+
+    assert [row["id"] for row in stream] == list(range(15))
+    assert source.fetch_calls == 2
+    assert source.close_errors == [False]
+
+
+def test_tee_branches_see_every_row_and_share_fetches() -> None:
+    source = ChunkSource(_chunked(12, 4))
+    left, right = SyncRowStream(source).tee()
+
+    first_left = left.next_chunk()
+    assert [row["id"] for row in right] == list(range(12))
+    assert first_left + list(left) == _rows(0, 12)
+    assert source.fetch_calls == 4
+    assert source.close_errors == [False]
+
+
+def test_tee_closes_parent_only_after_every_branch_closes() -> None:
+    source = ChunkSource(_chunked(12, 4))
+    left, right = SyncRowStream(source).tee()
+
+    left.close()
+    assert source.close_errors == []
+    assert [row["id"] for row in right.take(2)] == [0, 1]
+    assert source.close_errors == [False]
+
+
+def test_operator_errors_close_parent_with_error() -> None:
+    source = ChunkSource(_chunked(10, 5))
+
+    def explode(chunk: "list[dict[str, Any]]") -> "list[dict[str, Any]]":
+        msg = "transform failed"
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="transform failed"):
+        list(SyncRowStream(source).map_chunks(explode))
+
+    assert source.close_errors == [True]
+
+
+@pytest.mark.parametrize(("operator", "argument"), [("batched", 0), ("take", -1), ("tee", 0)])
+def test_operators_reject_invalid_sizes(operator: str, argument: int) -> None:
+    stream = SyncRowStream(ChunkSource([]))
+
+    with pytest.raises(ValueError):
+        getattr(stream, operator)(argument)
+
+
+def test_write_to_storage_streams_chunks_into_parquet(tmp_path: Path) -> None:
+    destination = tmp_path / "items.parquet"
+    stream = SyncRowStream(ChunkSource(_chunked(25, 10))).to_schema(Item)
+
+    telemetry = stream.write_to_storage(str(destination), format_hint="parquet", pipeline=SyncStoragePipeline())
+
+    table = pq.read_table(destination)
+    assert table.column("id").to_pylist() == list(range(25))
+    assert pq.ParquetFile(destination).num_row_groups == 3
+    assert telemetry["rows_processed"] == 25
+
+
+def test_sqlite_pipeline_filters_and_copies_between_sessions() -> None:
+    source_config = SqliteConfig(connection_config={"database": ":memory:"})
+    target_config = SqliteConfig(connection_config={"database": ":memory:"})
+    with source_config.provide_session() as source, target_config.provide_session() as target:
+        source.execute("CREATE TABLE items (id INTEGER)")
+        source.execute_many("INSERT INTO items VALUES (?)", [(index,) for index in range(50)])
+        target.execute("CREATE TABLE evens (id INTEGER)")
+
+        copied = (
+            source
+            .select_stream("SELECT id FROM items ORDER BY id", chunk_size=8)
+            .filter(lambda row: row["id"] % 2 == 0)
+            .execute_many_into(target, "INSERT INTO evens (id) VALUES (:id)")
+        )
+
+        assert copied == 25
+        assert target.select_value("SELECT COUNT(*) FROM evens") == 25
+        assert target.select_value("SELECT MAX(id) FROM evens") == 48
+    source_config.close_pool()
+    target_config.close_pool()
+
+
+async def test_async_operators_chain_lazily() -> None:
+    source = AsyncChunkSource(_chunked(40, 6))
+    stream = AsyncRowStream(source).filter(lambda row: row["id"] % 3 == 0).batched(4).take(2)
+
+    batches = [batch async for batch in stream]
+
+    assert [[row["id"] for row in batch] for batch in batches] == [[0, 3, 6, 9], [12, 15, 18, 21]]
+    assert source.close_errors == [False]
+    assert source.fetch_calls == 4
+
+
+async def test_async_tee_branches_read_concurrently() -> None:
+    source = AsyncChunkSource(_chunked(30, 7))
+    left, right = AsyncRowStream(source).tee()
+
+    async def collect(stream: "AsyncRowStream[dict[str, Any]]") -> "list[int]":
+        return [row["id"] async for row in stream]
+
+    left_ids, right_ids = await asyncio.gather(collect(left), collect(right))
+
+    assert left_ids == right_ids == list(range(30))
+    assert source.fetch_calls == 6
+    assert source.close_errors == [False]
+
+
+async def test_async_sinks_write_storage_and_execute_many(tmp_path: Path) -> None:
+    destination = tmp_path / "items.jsonl"
+    telemetry = await AsyncRowStream(AsyncChunkSource(_chunked(9, 4))).write_to_storage(
+        str(destination), format_hint="jsonl", pipeline=AsyncStoragePipeline()
+    )
+    assert telemetry["rows_processed"] == 9
+    assert len(destination.read_text().splitlines()) == 9
+
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE items (id INTEGER)")
+        copied = await (
+            AsyncRowStream(AsyncChunkSource(_chunked(9, 4)))
+            .to_schema(Item)
+            .execute_many_into(session, "INSERT INTO items (id) VALUES (:id)")
+        )
+        assert copied == 9
+        assert await session.select_value("SELECT SUM(id) FROM items") == 36
+    await config.close_pool()
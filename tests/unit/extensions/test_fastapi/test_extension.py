@@ -1,5 +1,7 @@
 """Tests for FastAPI SQLSpec plugin."""
 
+from typing import Annotated
+
 import pytest
 
 pytest.importorskip("fastapi")
@@ -11,6 +13,7 @@ from sqlspec import SQLSpec
 from sqlspec.adapters.aiosqlite import AiosqliteConfig
 from sqlspec.extensions.fastapi import SQLSpecPlugin
 from sqlspec.extensions.starlette.extension import DEFAULT_SESSION_KEY
+from sqlspec.service import SQLSpecAsyncService
 
 
 def test_provide_session_method_exists() -> None:
@@ -149,3 +152,34 @@ def test_provide_session_works_in_route() -> None:
         response = client.get("/test")
         assert response.status_code == 200
         assert response.json() == {"value": 1}
+
+
+def test_provide_service_is_request_scoped() -> None:
+    """Test that provide_service() shares one service per request and builds a new one per request."""
+    sqlspec = SQLSpec()
+    config = AiosqliteConfig(
+        connection_config={"database": ":memory:"}, extension_config={"fastapi": {"commit_mode": "autocommit"}}
+    )
+    sqlspec.add_config(config)
+
+    app = FastAPI()
+    plugin = SQLSpecPlugin(sqlspec, app)
+    services: list[SQLSpecAsyncService] = []
+
+    @app.get("/test")
+    async def test_route(
+        service: Annotated[SQLSpecAsyncService, Depends(plugin.provide_service(SQLSpecAsyncService))],
+        same: Annotated[SQLSpecAsyncService, Depends(plugin.provide_service(SQLSpecAsyncService))],
+        db=Depends(plugin.provide_session()),
+    ):
+        services.append(service)
+        loader = service.batch_loader("SELECT 1 AS id", key_column="id")
+        return {"same": same is service, "session": service.session is db, "row": await loader.load(1)}
+
+    with TestClient(app) as client:
+        first = client.get("/test")
+        second = client.get("/test")
+
+    assert first.json() == {"same": True, "session": True, "row": {"id": 1}}
+    assert second.status_code == 200
+    assert services[0] is not services[1]
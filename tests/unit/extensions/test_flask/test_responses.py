@@ -0,0 +1,62 @@
+"""Tests for the Flask streaming query response."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+from flask import Flask
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.exceptions import ImproperConfigurationError
+from sqlspec.extensions.flask import StreamingQueryResponse
+
+
+def test_streams_sync_session_and_releases_on_close(tmp_path: Path) -> None:
+    config = SqliteConfig(connection_config={"database": str(tmp_path / "events.db")})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE events (id INTEGER, name TEXT)")
+        session.execute_many("INSERT INTO events VALUES (?, ?)", [(index, f"event-{index}") for index in range(50)])
+        session.commit()
+    events: list[str] = []
+
+    @contextmanager
+    def tracked_session() -> Iterator[Any]:
+        events.append("acquired")
+        with config.provide_session() as session:
+            yield session
+        events.append("released")
+
+    app = Flask(__name__)
+
+    @app.get("/events")
+    def export() -> StreamingQueryResponse:
+        return StreamingQueryResponse(
+            lambda db: db.select_stream("SELECT * FROM events ORDER BY id", chunk_size=10),
+            session=tracked_session(),
+            filename="events",
+        )
+
+    client = app.test_client()
+    response = client.get("/events")
+    assert response.headers["Content-Disposition"] == 'attachment; filename="events.ndjson"'
+    assert len(response.get_data().splitlines()) == 50
+    assert events == ["acquired", "released"]
+
+    events.clear()
+    partial = client.get("/events", buffered=False)
+    first_chunk = next(iter(partial.response))
+    partial.close()
+    config.close_pool()
+
+    assert len(first_chunk.splitlines()) == 10
+    assert events == ["acquired", "released"]
+
+
+def test_rejects_async_sessions() -> None:
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+
+    with pytest.raises(ImproperConfigurationError, match="sync"):
+        StreamingQueryResponse(lambda db: db.select_stream("SELECT 1"), session=config.provide_session())
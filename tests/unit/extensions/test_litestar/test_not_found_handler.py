@@ -1,4 +1,4 @@
-"""Tests for the NotFoundError -> HTTP 404 default handler in the Litestar plugin."""
+"""Tests for the default NotFoundError (404) and LoadSheddingError (503) handlers in the Litestar plugin."""
 
 from typing import Any
 
@@ -9,8 +9,8 @@ from litestar.testing import create_test_client
 
 from sqlspec.adapters.aiosqlite.config import AiosqliteConfig
 from sqlspec.base import SQLSpec
-from sqlspec.exceptions import NotFoundError
-from sqlspec.extensions.litestar.plugin import SQLSpecPlugin, not_found_error_handler
+from sqlspec.exceptions import AdmissionRejectedError, CircuitOpenError, LoadSheddingError, NotFoundError
+from sqlspec.extensions.litestar.plugin import SQLSpecPlugin, load_shedding_error_handler, not_found_error_handler
 
 
 def _build_plugin() -> SQLSpecPlugin:
@@ -58,3 +58,38 @@ def test_handler_translates_to_404_in_real_app() -> None:
         response = client.get("/missing")
         assert response.status_code == 404
         assert "nothing here" in response.text
+
+
+def test_default_handler_registered_for_load_shedding_error() -> None:
+    """Plugin should register LoadSheddingError -> load_shedding_error_handler by default."""
+    plugin = _build_plugin()
+    app_config = AppConfig()
+
+    plugin.on_app_init(app_config)
+
+    handlers = app_config.exception_handlers or {}
+    assert handlers.get(LoadSheddingError) is load_shedding_error_handler
+
+
+def test_load_shedding_translates_to_503_in_real_app() -> None:
+    """End-to-end: an open circuit yields a 503 with Retry-After, admission rejections a plain 503."""
+
+    @get("/circuit")
+    async def raise_circuit() -> None:
+        raise CircuitOpenError("Circuit breaker is open", retry_after=2.5)
+
+    @get("/admission")
+    async def raise_admission() -> None:
+        raise AdmissionRejectedError("too busy", limit="max_waiters")
+
+    plugin = _build_plugin()
+
+    with create_test_client(route_handlers=[raise_circuit, raise_admission], plugins=[plugin]) as client:
+        response = client.get("/circuit")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "3"
+        assert "Circuit breaker is open" in response.text
+
+        response = client.get("/admission")
+        assert response.status_code == 503
+        assert "retry-after" not in response.headers
@@ -6,8 +6,12 @@ import inspect
 from typing import Any, NoReturn, cast
 
 import pytest
+from litestar import get
 from litestar.config.app import AppConfig
+from litestar.di import NamedDependency, Provide
 from litestar.exceptions import ValidationException
+from litestar.params import SkipValidation
+from litestar.testing import create_test_client
 from litestar.types import HTTPScope
 
 from sqlspec.adapters.aiosqlite.config import AiosqliteConfig
@@ -29,8 +33,10 @@ from sqlspec.extensions.litestar.providers import (
     FilterConfig,
     _configured_filter_aggregator,
     _create_statement_filters,
+    create_service_provider,
     dep_cache,
 )
+from sqlspec.service import SQLSpecAsyncService
 from sqlspec.typing import LITESTAR_INSTALLED
 
 if not LITESTAR_INSTALLED:
@@ -406,3 +412,38 @@ def test_raise_missing_connection_provide_request_session_raises_when_connection
 
 def test_raise_missing_connection_raise_missing_connection_annotation_is_noreturn() -> None:
     assert SQLSpecPlugin._raise_missing_connection.__annotations__["return"] is NoReturn
+
+
+def test_service_provider_builds_one_service_per_request() -> None:
+    services: list[SQLSpecAsyncService] = []
+
+    def provide_same(users_service: NamedDependency[SQLSpecAsyncService]) -> SQLSpecAsyncService:
+        return users_service
+
+    @get(
+        "/users",
+        dependencies={
+            "users_service": create_service_provider(SQLSpecAsyncService),
+            "same_service": Provide(provide_same, sync_to_thread=False),
+        },
+    )
+    async def load_user(
+        users_service: NamedDependency[SQLSpecAsyncService],
+        same_service: NamedDependency[SQLSpecAsyncService],
+        db_session: NamedDependency[SkipValidation[Any]],
+    ) -> "dict[str, Any]":
+        services.append(users_service)
+        loader = users_service.batch_loader("SELECT 1 AS id", key_column="id")
+        return {
+            "same": same_service is users_service,
+            "session": users_service.session is db_session,
+            "row": await loader.load(1),
+        }
+
+    with create_test_client(route_handlers=[load_user], plugins=[_build_plugin()]) as client:
+        first = client.get("/users")
+        second = client.get("/users")
+
+    assert first.json() == {"same": True, "session": True, "row": {"id": 1}}
+    assert second.status_code == 200
+    assert services[0] is not services[1]
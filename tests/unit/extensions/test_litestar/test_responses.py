@@ -0,0 +1,74 @@
+"""Tests for the Litestar streaming query response."""
+
+import io
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any
+
+import pyarrow.csv as pa_csv
+from litestar import get
+from litestar.background_tasks import BackgroundTask
+from litestar.testing import create_test_client
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.extensions.litestar import StreamingQueryResponse
+
+
+def test_streams_sync_session_as_csv_and_runs_user_background(tmp_path: Path) -> None:
+    config = SqliteConfig(connection_config={"database": str(tmp_path / "events.db")})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE events (id INTEGER, name TEXT)")
+        session.execute_many("INSERT INTO events VALUES (?, ?)", [(index, f"event-{index}") for index in range(20)])
+        session.commit()
+    events: list[str] = []
+
+    @contextmanager
+    def tracked_session() -> Iterator[Any]:
+        with config.provide_session() as session:
+            yield session
+        events.append("released")
+
+    @get("/events.csv", sync_to_thread=False)
+    def export() -> StreamingQueryResponse:
+        return StreamingQueryResponse(
+            lambda db: db.select_stream("SELECT * FROM events ORDER BY id", chunk_size=6),
+            session=tracked_session(),
+            format_hint="csv",
+            background=BackgroundTask(events.append, "background"),
+        )
+
+    with create_test_client([export]) as client:
+        response = client.get("/events.csv")
+    config.close_pool()
+
+    assert response.headers["content-type"].startswith("text/csv")
+    assert pa_csv.read_csv(io.BytesIO(response.content)).column("id").to_pylist() == list(range(20))
+    assert events == ["released", "background"]
+
+
+def test_streams_async_session_as_ndjson() -> None:
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def tracked_session() -> AsyncIterator[Any]:
+        async with config.provide_session() as session:
+            await session.execute("CREATE TABLE IF NOT EXISTS events (id INTEGER)")
+            await session.execute_many("INSERT INTO events VALUES (?)", [(index,) for index in range(9)])
+            yield session
+        events.append("released")
+
+    @get("/events")
+    async def export() -> StreamingQueryResponse:
+        return StreamingQueryResponse(
+            lambda db: db.select_stream("SELECT id FROM events", chunk_size=4), session=tracked_session()
+        )
+
+    with create_test_client([export]) as client:
+        response = client.get("/events")
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.splitlines()[-1] == '{"id":8}'
+    assert events == ["released"]
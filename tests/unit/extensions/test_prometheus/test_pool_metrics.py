@@ -0,0 +1,52 @@
+"""Unit tests for the Prometheus pool metrics collector."""
+
+from collections.abc import Iterator
+
+import pytest
+from prometheus_client import CollectorRegistry, generate_latest
+
+from sqlspec.extensions import prometheus
+from sqlspec.observability import pool_metrics_for
+from sqlspec.observability._pool import reset_pool_metrics
+
+
+@pytest.fixture(autouse=True)
+def _clean_pool_metrics() -> Iterator[None]:
+    reset_pool_metrics()
+    yield
+    reset_pool_metrics()
+
+
+def test_collector_exports_pool_series_with_config_labels() -> None:
+    registry = CollectorRegistry()
+    registry.register(prometheus.PrometheusPoolCollector())
+    metrics = pool_metrics_for("AsyncpgConfig", "primary")
+    metrics.observe_acquire(0.003)
+    metrics.observe_acquire_timeout(2.0)
+    metrics.set_gauge_source(lambda: {"size": 5, "checked_out": 2, "idle": 3, "max_size": 10})
+
+    payload = generate_latest(registry).decode()
+
+    labels = 'bind_key="primary",config="AsyncpgConfig",db_system="postgresql"'
+    assert f"sqlspec_pool_acquires_total{{{labels}}} 1.0" in payload
+    assert f"sqlspec_pool_acquire_timeouts_total{{{labels}}} 1.0" in payload
+    assert f'sqlspec_pool_acquire_wait_seconds_bucket{{{labels},le="0.005"}} 1.0' in payload
+    assert f"sqlspec_pool_acquire_wait_seconds_count{{{labels}}} 2.0" in payload
+    assert f"sqlspec_pool_checked_out{{{labels}}} 2.0" in payload
+    assert f"sqlspec_pool_max_size{{{labels}}} 10.0" in payload
+
+
+def test_enable_metrics_turns_on_pool_metrics_and_registers_collector_once() -> None:
+    registry = CollectorRegistry()
+
+    config = prometheus.enable_metrics(registry=registry, subsystem="first")
+    prometheus.enable_metrics(registry=registry, subsystem="second")
+
+    assert config.pool_metrics is True
+    pool_metrics_for("SqliteConfig").observe_acquire(0.001)
+    assert generate_latest(registry).decode().count("# TYPE sqlspec_pool_acquires_total counter") == 1
+
+
+def test_enable_metrics_can_skip_pool_metrics() -> None:
+    config = prometheus.enable_metrics(registry=CollectorRegistry(), pool_metrics=False)
+    assert config.pool_metrics is None
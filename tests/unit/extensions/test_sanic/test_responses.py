@@ -0,0 +1,100 @@
+"""Tests for the Sanic streaming query response helper."""
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.extensions.sanic import stream_query_response
+
+pytestmark = pytest.mark.anyio
+
+
+class _FakeResponse:
+    """Records what a Sanic streaming response would send."""
+
+    def __init__(self, fail_after: "int | None" = None) -> None:
+        self.chunks: list[bytes] = []
+        self.ended = False
+        self._fail_after = fail_after
+
+    async def send(self, data: bytes) -> None:
+        if self._fail_after is not None and len(self.chunks) >= self._fail_after:
+            raise ConnectionResetError
+        self.chunks.append(data)
+
+    async def eof(self) -> None:
+        self.ended = True
+
+
+def _request(response: _FakeResponse, respond_kwargs: "dict[str, Any]") -> Any:
+    async def respond(**kwargs: Any) -> _FakeResponse:
+        respond_kwargs.update(kwargs)
+        return response
+
+    return SimpleNamespace(respond=respond)
+
+
+async def test_streams_async_session_and_releases_on_disconnect() -> None:
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def tracked_session() -> AsyncIterator[Any]:
+        async with config.provide_session() as session:
+            await session.execute("CREATE TABLE IF NOT EXISTS events (id INTEGER)")
+            await session.execute_many("INSERT INTO events VALUES (?)", [(index,) for index in range(40)])
+            yield session
+        events.append("released")
+
+    response = _FakeResponse(fail_after=2)
+    respond_kwargs: dict[str, Any] = {}
+    with pytest.raises(ConnectionResetError):
+        await stream_query_response(
+            _request(response, respond_kwargs),
+            lambda db: db.select_stream("SELECT id FROM events", chunk_size=10),
+            session=tracked_session(),
+        )
+    await config.close_pool()
+
+    assert respond_kwargs["content_type"] == "application/x-ndjson"
+    assert len(response.chunks) == 2
+    assert not response.ended
+    assert events == ["released"]
+
+
+async def test_streams_sync_stream_on_worker_thread(tmp_path: Path) -> None:
+    config = SqliteConfig(connection_config={"database": str(tmp_path / "events.db")})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE events (id INTEGER)")
+        session.execute_many("INSERT INTO events VALUES (?)", [(index,) for index in range(15)])
+        session.commit()
+    events: list[str] = []
+
+    @contextmanager
+    def tracked_session() -> Iterator[Any]:
+        with config.provide_session() as session:
+            yield session
+        events.append("released")
+
+    response = _FakeResponse()
+    respond_kwargs: dict[str, Any] = {}
+    result = await stream_query_response(
+        _request(response, respond_kwargs),
+        lambda db: db.select_stream("SELECT id FROM events", chunk_size=4),
+        session=tracked_session(),
+        format_hint="csv",
+        filename="events.csv",
+    )
+    config.close_pool()
+
+    assert result is response
+    assert response.ended
+    assert b"".join(response.chunks).splitlines()[0] == b"id"
+    assert respond_kwargs["headers"] == {"Content-Disposition": 'attachment; filename="events.csv"'}
+    assert events == ["released"]
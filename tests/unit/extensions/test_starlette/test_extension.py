@@ -13,7 +13,8 @@ from starlette.testclient import TestClient
 
 from sqlspec import SQLSpec
 from sqlspec.adapters.aiosqlite import AiosqliteConfig
-from sqlspec.exceptions import ImproperConfigurationError
+from sqlspec.core import CircuitBreaker
+from sqlspec.exceptions import AdmissionRejectedError, DatabaseConnectionError, ImproperConfigurationError
 from sqlspec.extensions.starlette import SQLSpecPlugin
 from sqlspec.extensions.starlette._state import SQLSpecConfigState
 from sqlspec.extensions.starlette.extension import DEFAULT_SESSION_KEY
@@ -239,3 +240,51 @@ def test_config_state_by_key_unknown_key_raises_value_error() -> None:
     plugin = SQLSpecPlugin(SQLSpec())
     with pytest.raises(ValueError, match="No configuration found with session_key: missing"):
         plugin._config_state_by_key("missing")
+
+
+def _open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_duration=30.0)
+    breaker.record(DatabaseConnectionError("down"), None)
+    return breaker
+
+
+@pytest.mark.parametrize("commit_mode", ["manual", "autocommit"])
+def test_open_circuit_during_middleware_acquire_returns_503(commit_mode: str) -> None:
+    """Connection acquisition shed by the middleware should answer 503 with Retry-After."""
+    sqlspec = SQLSpec()
+    config = AiosqliteConfig(
+        connection_config={"database": ":memory:"},
+        extension_config={"starlette": {"commit_mode": commit_mode}},
+        circuit_breaker=_open_breaker(),
+    )
+    sqlspec.add_config(config)
+
+    async def route(_request: Request) -> JSONResponse:
+        return JSONResponse({"reached": True})
+
+    app = Starlette(routes=[Route("/test", route)])
+    SQLSpecPlugin(sqlspec, app)
+    with TestClient(app) as client:
+        response = client.get("/test")
+
+    assert response.status_code == 503
+    assert "Circuit breaker is open" in response.json()["detail"]
+    assert 1 <= int(response.headers["retry-after"]) <= 30
+
+
+def test_load_shedding_raised_in_route_returns_503() -> None:
+    """LoadSheddingError raised by route code should be mapped to 503 without Retry-After."""
+    sqlspec = SQLSpec()
+    sqlspec.add_config(AiosqliteConfig(connection_config={"database": ":memory:"}))
+
+    async def route(_request: Request) -> JSONResponse:
+        raise AdmissionRejectedError("too busy", limit="max_in_flight")
+
+    app = Starlette(routes=[Route("/test", route)])
+    SQLSpecPlugin(sqlspec, app)
+    with TestClient(app) as client:
+        response = client.get("/test")
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "too busy"}
+    assert "retry-after" not in response.headers
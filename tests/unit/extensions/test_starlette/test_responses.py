@@ -0,0 +1,114 @@
+"""Tests for the Starlette/FastAPI streaming query response."""
+
+import io
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.extensions.fastapi import StreamingQueryResponse as FastAPIStreamingQueryResponse
+from sqlspec.extensions.starlette import StreamingQueryResponse
+
+
+def _seeded_sqlite(path: Path, count: int = 30) -> SqliteConfig:
+    config = SqliteConfig(connection_config={"database": str(path / "events.db")})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE events (id INTEGER, name TEXT)")
+        session.execute_many("INSERT INTO events VALUES (?, ?)", [(index, f"event-{index}") for index in range(count)])
+        session.commit()
+    return config
+
+
+def test_fastapi_reexports_starlette_response() -> None:
+    assert FastAPIStreamingQueryResponse is StreamingQueryResponse
+
+
+def test_streams_sync_session_as_ndjson_and_releases_session(tmp_path: Path) -> None:
+    config = _seeded_sqlite(tmp_path)
+    released: list[bool] = []
+
+    @contextmanager
+    def tracked_session() -> Iterator[Any]:
+        with config.provide_session() as session:
+            yield session
+        released.append(True)
+
+    async def export(request: Request) -> StreamingQueryResponse:
+        return StreamingQueryResponse(
+            lambda db: db.select_stream("SELECT * FROM events ORDER BY id", chunk_size=7), session=tracked_session()
+        )
+
+    app = Starlette(routes=[Route("/events", export)])
+    with TestClient(app) as client:
+        response = client.get("/events")
+    config.close_pool()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(response.content.splitlines()) == 30
+    assert released == [True]
+
+
+def test_streams_async_session_as_arrow_with_filename() -> None:
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+
+    async def export(request: Request) -> StreamingQueryResponse:
+        async with config.provide_session() as session:
+            await session.execute("CREATE TABLE IF NOT EXISTS events (id INTEGER)")
+            await session.execute_many("INSERT INTO events VALUES (?)", [(index,) for index in range(12)])
+            await session.commit()
+        return StreamingQueryResponse(
+            lambda db: db.select_stream("SELECT id FROM events", chunk_size=5),
+            session=config.provide_session(),
+            format_hint="arrow",
+            arrow_schema=pa.schema([("id", pa.int64())]),
+            filename="events",
+        )
+
+    app = Starlette(routes=[Route("/events", export)])
+    with TestClient(app) as client:
+        response = client.get("/events")
+
+    assert response.headers["content-disposition"] == 'attachment; filename="events.arrows"'
+    table = pa.ipc.open_stream(io.BytesIO(response.content)).read_all()
+    assert table.column("id").to_pylist() == list(range(12))
+
+
+@pytest.mark.anyio
+async def test_disconnect_releases_session(tmp_path: Path) -> None:
+    config = _seeded_sqlite(tmp_path, count=100)
+    released: list[bool] = []
+
+    @contextmanager
+    def tracked_session() -> Iterator[Any]:
+        with config.provide_session() as session:
+            yield session
+        released.append(True)
+
+    response = StreamingQueryResponse(
+        lambda db: db.select_stream("SELECT * FROM events", chunk_size=10), session=tracked_session()
+    )
+    sent: list[dict[str, Any]] = []
+
+    async def receive() -> "dict[str, Any]":
+        return {"type": "http.disconnect"}
+
+    async def send(message: "dict[str, Any]") -> None:
+        sent.append(message)
+        if message["type"] == "http.response.body":
+            raise OSError
+
+    with pytest.raises(Exception):
+        await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+    config.close_pool()
+
+    assert released == [True]
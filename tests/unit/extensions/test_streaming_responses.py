@@ -0,0 +1,187 @@
+"""Tests for the shared row stream encoders behind the framework streaming responses."""
+
+import io
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.driver import SyncRowStream
+from sqlspec.exceptions import ImproperConfigurationError
+from sqlspec.extensions._streaming import RowChunkEncoder, aiter_encoded_rows, iter_encoded_rows, streaming_headers
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+
+
+def _seeded_sqlite(count: int = 25) -> SqliteConfig:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE events (id INTEGER, name TEXT)")
+        session.execute_many("INSERT INTO events VALUES (?, ?)", [(index, f"event-{index}") for index in range(count)])
+        session.commit()
+    return config
+
+
+def test_row_chunk_encoder_formats_round_trip() -> None:
+    chunks = [[{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], [Event(3, "c")]]
+
+    ndjson = RowChunkEncoder("ndjson")
+    lines = b"".join([*(ndjson.encode(chunk) for chunk in chunks), ndjson.finish()]).splitlines()
+    assert lines == [b'{"id":1,"name":"a"}', b'{"id":2,"name":"b"}', b'{"id":3,"name":"c"}']
+
+    csv_encoder = RowChunkEncoder("csv")
+    csv_payload = b"".join([*(csv_encoder.encode(chunk) for chunk in chunks), csv_encoder.finish()])
+    assert pa_csv.read_csv(io.BytesIO(csv_payload)).column("name").to_pylist() == ["a", "b", "c"]
+
+    arrow = RowChunkEncoder("arrow", arrow_schema=pa.schema([("id", pa.int64()), ("name", pa.string())]))
+    arrow_payload = b"".join([*(arrow.encode(chunk) for chunk in chunks), arrow.finish()])
+    reader = pa.ipc.open_stream(arrow_payload)
+    assert [batch.num_rows for batch in reader] == [2, 1]
+
+
+def test_row_chunk_encoder_rejects_unknown_format_and_empty_csv_is_empty() -> None:
+    with pytest.raises(ValueError, match="format"):
+        RowChunkEncoder("xml")  # type: ignore[arg-type]
+    assert RowChunkEncoder("csv").finish() == b""
+
+
+def test_row_chunk_encoder_writes_csv_across_value_type_changes() -> None:
+    encoder = RowChunkEncoder("csv")
+    chunks = [
+        [{"id": 1, "value": None}],
+        [{"id": 2, "value": 7}],
+        [{"id": 3, "value": "a,b"}, {"id": 4, "value": True}],
+    ]
+
+    payload = b"".join([*(encoder.encode(chunk) for chunk in chunks), encoder.finish()])
+
+    assert payload == b'id,value\n1,\n2,7\n3,"a,b"\n4,true\n'
+
+
+class _TypedRowSource:
+    """Positional row source that reports column types like the PostgreSQL and MySQL streams."""
+
+    def __init__(self, chunks: "list[list[tuple[Any, ...]]]", column_types: "dict[str, str] | None") -> None:
+        self._chunks = list(chunks)
+        self._column_types = column_types
+
+    def start(self) -> None:
+        return None
+
+    def fetch_chunk(self) -> "list[dict[str, Any]]":
+        rows, names, _ = self.fetch_rows()
+        return [dict(zip(names, row)) for row in rows]
+
+    def fetch_rows(self) -> "tuple[list[Any], list[str], dict[str, str] | None]":
+        rows = self._chunks.pop(0) if self._chunks else []
+        return rows, ["id", "score"], self._column_types
+
+    def close(self) -> None:
+        return None
+
+
+def test_arrow_schema_comes_from_reported_column_types() -> None:
+    source = _TypedRowSource([[(1, None)], [(2, 2.5)], [(3, 4)]], {"id": "int32", "score": "float64"})
+
+    payload = b"".join(iter_encoded_rows(SyncRowStream(source), "arrow"))
+
+    table = pa.ipc.open_stream(payload).read_all()
+    assert table.schema == pa.schema([("id", pa.int32()), ("score", pa.float64())])
+    assert table.column("score").to_pylist() == [None, 2.5, 4.0]
+
+
+def test_arrow_without_column_types_fails_before_the_first_byte() -> None:
+    untyped = iter_encoded_rows(SyncRowStream(_TypedRowSource([[(1, 2.5)]], {"id": "int32"})), "arrow")
+    with pytest.raises(ImproperConfigurationError, match="score"):
+        next(untyped)
+
+    config = _seeded_sqlite()
+    with config.provide_session() as session:
+        with pytest.raises(ImproperConfigurationError, match="arrow_schema"):
+            iter_encoded_rows(session.select_stream("SELECT * FROM events").to_schema(Event), "arrow")
+        schema = pa.schema([("id", pa.int64()), ("name", pa.string())])
+        payload = b"".join(
+            iter_encoded_rows(session.select_stream("SELECT * FROM events"), "arrow", arrow_schema=schema)
+        )
+    config.close_pool()
+
+    assert pa.ipc.open_stream(payload).read_all().num_rows == 25
+
+
+def test_streaming_headers_adds_attachment_filename() -> None:
+    assert streaming_headers("csv", "events") == {"Content-Disposition": 'attachment; filename="events.csv"'}
+    assert streaming_headers("arrow", None, {"X-Trace": "1"}) == {"X-Trace": "1"}
+
+
+def test_iter_encoded_rows_opens_session_lazily_and_releases_on_close() -> None:
+    config = _seeded_sqlite()
+    events: list[str] = []
+
+    @contextmanager
+    def tracked_session() -> Iterator[Any]:
+        events.append("enter")
+        with config.provide_session() as session:
+            yield session
+        events.append("exit")
+
+    body = iter_encoded_rows(
+        lambda db: db.select_stream("SELECT * FROM events ORDER BY id", chunk_size=10), session=tracked_session()
+    )
+    assert events == []
+    first = next(body)
+    assert events == ["enter"]
+    assert len(first.splitlines()) == 10
+    body.close()
+    assert events == ["enter", "exit"]
+    config.close_pool()
+
+
+def test_iter_encoded_rows_requires_matching_stream_and_session() -> None:
+    config = _seeded_sqlite()
+    with config.provide_session() as session:
+        stream = session.select_stream("SELECT * FROM events")
+        with pytest.raises(ImproperConfigurationError):
+            iter_encoded_rows(stream, session=config.provide_session())
+        stream.close()
+    with pytest.raises(ImproperConfigurationError):
+        iter_encoded_rows(lambda db: db.select_stream("SELECT 1"))
+    config.close_pool()
+
+
+async def test_aiter_encoded_rows_streams_all_chunks_and_releases_session() -> None:
+    config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE events (id INTEGER, name TEXT)")
+        await session.execute_many(
+            "INSERT INTO events VALUES (?, ?)", [(index, f"event-{index}") for index in range(7)]
+        )
+        await session.commit()
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def tracked_session() -> AsyncIterator[Any]:
+        events.append("enter")
+        async with config.provide_session() as session:
+            yield session
+        events.append("exit")
+
+    body = aiter_encoded_rows(
+        lambda db: db.select_stream("SELECT * FROM events ORDER BY id", chunk_size=3).to_schema(Event),
+        "csv",
+        session=tracked_session(),
+    )
+    payload = b"".join([chunk async for chunk in body])
+    await config.close_pool()
+
+    assert events == ["enter", "exit"]
+    assert pa_csv.read_csv(io.BytesIO(payload)).num_rows == 7
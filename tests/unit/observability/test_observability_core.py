@@ -130,8 +130,10 @@ class _FakeSyncPipeline:
     def __init__(self) -> None:
         self.calls: list[tuple[Any, Any]] = []
 
-    def read_arrow(self, source: Any, *, file_format: str, storage_options: Any = None) -> tuple[str, dict[str, Any]]:
-        _ = storage_options
+    def read_arrow(
+        self, source: Any, *, file_format: str, storage_options: Any = None, columns: Any = None, filter: Any = None
+    ) -> tuple[str, dict[str, Any]]:
+        _ = storage_options, columns, filter
         self.calls.append((source, file_format))
         return (
             "table",
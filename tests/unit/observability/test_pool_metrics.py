@@ -0,0 +1,168 @@
+"""Tests for connection pool wait, occupancy and lifetime metrics."""
+
+import asyncio
+import gc
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.aiosqlite.pool import AiosqliteConnectTimeoutError
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.observability import ObservabilityConfig, ObservabilityRuntime, get_pool_metrics, pool_metrics_for
+from sqlspec.observability._pool import PoolHistogram, PoolMetrics, is_pool_timeout, reset_pool_metrics
+
+
+@pytest.fixture(autouse=True)
+def _clean_pool_metrics() -> Iterator[None]:
+    reset_pool_metrics()
+    yield
+    reset_pool_metrics()
+
+
+def test_histogram_uses_le_buckets_and_cumulative_snapshot() -> None:
+    histogram = PoolHistogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["buckets"] == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(3.65)
+
+
+def test_pool_metrics_flat_snapshot_reports_gauges_and_utilization() -> None:
+    metrics = PoolMetrics("AsyncpgConfig", bind_key="primary")
+    metrics.observe_acquire(0.002)
+    metrics.observe_acquire_timeout(5.0)
+    metrics.observe_connection_created(0.05)
+    metrics.observe_connection_closed(120.0)
+    metrics.set_gauge_source(lambda: {"size": 4, "checked_out": 3, "idle": 1, "max_size": 10})
+
+    flat = metrics.flat_snapshot()
+
+    assert flat["pool.acquires"] == 1.0
+    assert flat["pool.acquire_timeouts"] == 1.0
+    assert flat["pool.acquire_wait_seconds.sum"] == pytest.approx(5.002)
+    assert flat["pool.connections_created"] == 1.0
+    assert flat["pool.connection_age_seconds.sum"] == 120.0
+    assert flat["pool.checked_out"] == 3.0
+    assert flat["pool.utilization"] == pytest.approx(0.3)
+
+
+def test_failing_gauge_source_is_ignored() -> None:
+    metrics = PoolMetrics("SqliteConfig")
+
+    def broken() -> None:
+        raise RuntimeError("pool closed")
+
+    metrics.set_gauge_source(broken)  # type: ignore[arg-type]
+
+    assert metrics.snapshot()["gauges"] is None
+
+
+def test_pool_metrics_are_shared_per_config_and_bind_key() -> None:
+    first = pool_metrics_for("AiosqliteConfig", "reports")
+    assert pool_metrics_for("AiosqliteConfig", "reports") is first
+    assert pool_metrics_for("AiosqliteConfig", "events") is not first
+    assert len(get_pool_metrics()) == 2
+
+
+def test_is_pool_timeout_matches_driver_timeout_types() -> None:
+    assert is_pool_timeout(asyncio.TimeoutError())
+    assert is_pool_timeout(AiosqliteConnectTimeoutError("timed out"))
+    assert not is_pool_timeout(RuntimeError("boom"))
+
+
+def test_runtime_exposes_pool_metrics_only_when_enabled() -> None:
+    assert ObservabilityRuntime(ObservabilityConfig(), config_name="SqliteConfig").pool_metrics is None
+
+    runtime = ObservabilityRuntime(ObservabilityConfig(pool_metrics=True), config_name="SqliteConfig")
+    assert runtime.pool_metrics is not None
+    runtime.pool_metrics.observe_acquire(0.001)
+
+    assert runtime.metrics_snapshot()["SqliteConfig.pool.acquires"] == 1.0
+
+
+def test_merge_keeps_pool_metrics_flag() -> None:
+    merged = ObservabilityConfig.merge(ObservabilityConfig(pool_metrics=True), ObservabilityConfig(print_sql=True))
+    assert merged.pool_metrics is True
+    assert merged.copy() == merged
+
+
+def test_configs_sharing_class_and_bind_key_get_separate_pool_metrics(tmp_path: Path) -> None:
+    configs = [
+        SqliteConfig(
+            connection_config={"database": str(tmp_path / f"metrics-{index}.db")},
+            observability_config=ObservabilityConfig(pool_metrics=True),
+        )
+        for index in range(2)
+    ]
+    with configs[0].provide_session() as session:
+        session.execute("SELECT 1")
+    for config in configs:
+        config.close_pool()
+
+    first, second = (config.get_observability_runtime().pool_metrics for config in configs)
+    assert first is not None and second is not None
+    assert first is not second
+    assert configs[0].get_observability_runtime().pool_metrics is first
+    assert (first.config_name, second.config_name) == ("SqliteConfig", "SqliteConfig#2")
+    assert first.snapshot()["acquires"] == 1
+    assert second.snapshot()["acquires"] == 0
+    assert len(get_pool_metrics()) == 2
+
+    del configs, config, first, second, session
+    gc.collect()
+    assert get_pool_metrics() == ()
+
+
+def test_sqlite_records_acquires_and_connection_lifetime(tmp_path: Path) -> None:
+    config = SqliteConfig(
+        connection_config={"database": str(tmp_path / "metrics.db")},
+        observability_config=ObservabilityConfig(pool_metrics=True),
+        bind_key="sqlite-metrics",
+    )
+    with config.provide_session() as session:
+        session.execute("SELECT 1")
+    with config.provide_connection() as connection:
+        connection.execute("SELECT 1")
+    config.close_pool()
+
+    metrics = config.get_observability_runtime().pool_metrics
+    assert metrics is not None
+    snapshot = metrics.snapshot()
+    assert snapshot["acquires"] == 2
+    assert snapshot["connections_created"] == 1
+    assert snapshot["connections_closed"] == 1
+    assert snapshot["connection_age"]["count"] == 1
+
+
+async def test_aiosqlite_reports_gauges_and_acquire_timeouts(tmp_path: Path) -> None:
+    config = AiosqliteConfig(
+        connection_config={"database": str(tmp_path / "metrics.db"), "pool_size": 1, "connect_timeout": 0.05},
+        observability_config=ObservabilityConfig(pool_metrics=True),
+        bind_key="aiosqlite-metrics",
+    )
+    metrics = config.get_observability_runtime().pool_metrics
+    assert metrics is not None
+    assert metrics.gauges() is None
+
+    async with config.provide_session() as session:
+        await session.execute("SELECT 1")
+        assert metrics.gauges() == {"size": 1, "checked_out": 1, "idle": 0, "max_size": 1}
+        with pytest.raises(AiosqliteConnectTimeoutError):
+            async with config.provide_session():
+                pass
+
+    assert metrics.gauges() == {"size": 1, "checked_out": 0, "idle": 1, "max_size": 1}
+    await config.close_pool()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["acquires"] == 1
+    assert snapshot["acquire_timeouts"] == 1
+    assert snapshot["acquire_wait"]["sum"] >= 0.05
+    assert snapshot["connections_created"] == 1
+    assert snapshot["connections_closed"] == 1
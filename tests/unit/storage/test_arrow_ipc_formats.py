@@ -0,0 +1,164 @@
+"""Tests for Arrow IPC file and stream formats across the storage bridge."""
+
+from pathlib import Path
+from typing import Any, cast
+
+import pyarrow as pa
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.exceptions import StorageCapabilityError
+from sqlspec.storage import SyncStoragePipeline
+from sqlspec.storage._arrow_payload import ArrowBatchEncoder, decode_arrow_payload, encode_arrow_payload
+from sqlspec.storage.backends.local import LocalStore
+from sqlspec.typing import FSSPEC_INSTALLED, OBSTORE_INSTALLED
+
+
+def _table(count: int = 1_000) -> "pa.Table":
+    return pa.table({"id": list(range(count)), "label": [f"label-{index % 7}" for index in range(count)]})
+
+
+@pytest.mark.parametrize("format_choice", ["arrow-ipc", "arrow-stream"])
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_encoder_round_trips_ipc_with_compression(format_choice: str, compression: "str | None") -> None:
+    table = _table()
+    encoder = ArrowBatchEncoder(cast("Any", format_choice), compression=compression)
+    payload = b"".join(encoder.encode(batch) for batch in table.to_batches(max_chunksize=300)) + encoder.finish()
+
+    decoded = decode_arrow_payload(payload, cast("Any", format_choice))
+
+    assert decoded.equals(table)
+
+
+def test_ipc_compression_shrinks_payload_and_rejects_unknown_codecs() -> None:
+    table = _table(20_000)
+
+    plain = encode_arrow_payload(table, "arrow-stream", compression=None)
+    compressed = encode_arrow_payload(table, "arrow-stream", compression="zstd")
+
+    assert len(compressed) < len(plain) // 2
+    with pytest.raises(ValueError, match="lz4"):
+        encode_arrow_payload(table, "arrow-ipc", compression="snappy")
+
+
+def test_arrow_ipc_reader_accepts_stream_payloads() -> None:
+    payload = encode_arrow_payload(_table(), "arrow-stream", compression=None)
+
+    assert decode_arrow_payload(payload, "arrow-ipc").num_rows == 1_000
+
+
+def test_pipeline_writes_and_streams_arrow_stream(tmp_path: Path) -> None:
+    pipeline = SyncStoragePipeline()
+    target = str(tmp_path / "events.arrows")
+    with pipeline.open_writer(target, format_hint="arrow-stream", compression="lz4") as writer:
+        for batch in _table(3_000).to_batches(max_chunksize=1_000):
+            writer.write_batch(batch)
+
+    with pipeline.open_reader(target, file_format="arrow-stream", batch_size=400) as reader:
+        sizes = [batch.num_rows for batch in reader]
+    table, telemetry = pipeline.read_arrow(target, file_format="arrow-stream", filter=[("id", "<", 10)])
+
+    assert sum(sizes) == 3_000
+    assert max(sizes) == 400
+    assert table.column("id").to_pylist() == list(range(10))
+    assert telemetry["format"] == "arrow-stream"
+
+
+@pytest.mark.parametrize("format_choice", ["arrow-ipc", "arrow-stream"])
+def test_local_store_streams_ipc_batches(tmp_path: Path, format_choice: str) -> None:
+    pipeline = SyncStoragePipeline()
+    for index in range(2):
+        pipeline.write_arrow(_table(), str(tmp_path / f"part-{index}.arrow"), format_hint=cast("Any", format_choice))
+    store = LocalStore(str(tmp_path))
+
+    batches = list(
+        store.stream_arrow_sync(
+            "*.arrow", file_format=cast("Any", format_choice), batch_size=128, columns=["id"], filter=[("id", "<", 500)]
+        )
+    )
+
+    assert sum(batch.num_rows for batch in batches) == 1_000
+    assert max(batch.num_rows for batch in batches) <= 128
+    assert {tuple(batch.schema.names) for batch in batches} == {("id",)}
+
+
+def test_ipc_streaming_rejects_mismatched_suffix(tmp_path: Path) -> None:
+    store = LocalStore(str(tmp_path))
+
+    with pytest.raises(StorageCapabilityError, match=r"selects \.parquet files"):
+        list(store.stream_arrow_sync("*.parquet", file_format="arrow-ipc"))
+
+
+@pytest.mark.skipif(not OBSTORE_INSTALLED, reason="obstore missing")
+def test_obstore_streams_ipc_batches() -> None:
+    from sqlspec.storage.backends.obstore import ObStoreBackend
+
+    store = ObStoreBackend("memory://")
+    store.write_bytes_sync("data/events.arrows", encode_arrow_payload(_table(), "arrow-stream", compression="zstd"))
+
+    batches = list(store.stream_arrow_sync("data/*.arrows", file_format="arrow-stream", batch_size=250))
+
+    assert [batch.num_rows for batch in batches] == [250, 250, 250, 250]
+
+
+@pytest.mark.skipif(not FSSPEC_INSTALLED, reason="fsspec missing")
+def test_fsspec_streams_ipc_batches(tmp_path: Path) -> None:
+    from sqlspec.storage.backends.fsspec import FSSpecBackend
+
+    (tmp_path / "events.arrow").write_bytes(encode_arrow_payload(_table(), "arrow-ipc", compression=None))
+    store = FSSpecBackend(f"file://{tmp_path}")
+
+    batches = list(store.stream_arrow_sync("*.arrow", file_format="arrow-ipc", columns=["label"]))
+
+    assert sum(batch.num_rows for batch in batches) == 1_000
+    assert batches[0].schema.names == ["label"]
+
+
+def test_sqlite_select_to_storage_and_load_arrow_stream(tmp_path: Path) -> None:
+    destination = str(tmp_path / "export.arrows")
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE source (id INTEGER, label TEXT)")
+        session.execute_many("INSERT INTO source VALUES (?, ?)", [(index, f"v{index}") for index in range(500)])
+        export = session.select_to_storage(
+            "SELECT id, label FROM source ORDER BY id",
+            destination,
+            format_hint="arrow-stream",
+            compression="lz4",
+            batch_size=128,
+        )
+        session.execute("CREATE TABLE target (id INTEGER, label TEXT)")
+        load = session.load_from_storage("target", destination, file_format="arrow-stream")
+        count = session.select_value("SELECT COUNT(*) FROM target")
+    config.close_pool()
+
+    assert export.telemetry["rows_processed"] == 500
+    assert load.telemetry["rows_processed"] == 500
+    assert count == 500
+
+
+@pytest.mark.anyio
+async def test_aiosqlite_partitioned_ipc_export_and_async_stream(tmp_path: Path) -> None:
+    config = AiosqliteConfig(connection_config={"database": str(tmp_path / "source.db")})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE source (id INTEGER, label TEXT)")
+        await session.execute_many(
+            "INSERT INTO source VALUES (?, ?)", [(index, f"v{index % 2}") for index in range(40)]
+        )
+        job = await session.select_to_storage(
+            "SELECT id, label FROM source",
+            str(tmp_path / "out"),
+            format_hint="arrow-stream",
+            partitioner={"kind": "columns", "columns": ["label"]},
+        )
+    await config.close_pool()
+    store = LocalStore(str(tmp_path / "out"))
+
+    rows = 0
+    async for batch in store.stream_arrow_async("**/*.arrows", file_format="arrow-stream"):
+        rows += batch.num_rows
+
+    assert job.telemetry["rows_processed"] == 40
+    assert min(store.glob_sync("**/*.arrows")).startswith("label=v0")
+    assert rows == 40
@@ -3,6 +3,7 @@
 
 import sqlite3
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, cast
 
 import aiosqlite
@@ -38,6 +39,7 @@ from sqlspec.storage.pipeline import (
     _StoragePipelineBase,
 )
 from sqlspec.storage.registry import storage_registry
+from sqlspec.utils.pgcopy import PgCopyBinaryDecoder
 from sqlspec.utils.serializers import reset_serializer_cache, serialize_collection
 
 CAPABILITIES = {
@@ -72,19 +74,35 @@ def test_encode_row_payload_jsonl_returns_line_delimited_bytes() -> None:
 
 
 class DummyAsyncpgConnection:
-    def __init__(self) -> None:
-        self.calls: list[tuple[str, str | None, list[tuple[object, ...]], list[str]]] = []
+    def __init__(self, column_types: "dict[str, int] | None" = None) -> None:
+        self.calls: list[tuple[str, str | None, Any, list[str]]] = []
+        self.column_types = column_types or {}
 
     async def copy_records_to_table(
         self, table: str, *, records: list[tuple[object, ...]], columns: list[str], schema_name: str | None = None
     ) -> None:
         self.calls.append((table, schema_name, records, columns))
 
+    async def prepare(self, sql: str) -> Any:
+        _ = sql
+        attributes = [
+            SimpleNamespace(name=name, type=SimpleNamespace(oid=oid)) for name, oid in self.column_types.items()
+        ]
+        return SimpleNamespace(get_attributes=lambda: attributes)
+
+    async def copy_to_table(
+        self, table: str, *, source: Any, columns: list[str], schema_name: str | None = None, format: str
+    ) -> None:
+        assert format == "binary"
+        payload = b"".join([chunk async for chunk in source])
+        self.calls.append((table, schema_name, payload, columns))
+
 
 class DummyPsqlpyConnection:
-    def __init__(self) -> None:
+    def __init__(self, column_types: "dict[str, int] | None" = None) -> None:
         self.copy_calls: list[dict[str, Any]] = []
         self.statements: list[str] = []
+        self.column_types = column_types or {}
 
     async def binary_copy_to_table(
         self,
@@ -105,6 +123,15 @@ class DummyPsqlpyConnection:
         _ = params
         self.statements.append(sql)
 
+    async def fetch(self, sql: str, params: "list[Any] | None" = None) -> "list[dict[str, Any]]":
+        _ = sql, params
+        return [{"name": name, "type_oid": oid} for name, oid in self.column_types.items()]
+
+
+def _decode_pgcopy(payload: bytes, column_types: "dict[str, int]") -> "list[dict[str, Any]]":
+    decoder = PgCopyBinaryDecoder(list(column_types.items()))
+    return pa.Table.from_batches(decoder.feed(payload) + decoder.finish()).to_pylist()
+
 
 class DummyAsyncmyCursorImpl:
     def __init__(self, operations: "list[tuple[str, Any, Any | None]]") -> None:
@@ -273,8 +300,9 @@ async def test_asyncpg_load_from_storage(monkeypatch: pytest.MonkeyPatch) -> Non
     async def _fake_read(self, *_: object, **__: object) -> tuple[pa.Table, dict[str, object]]:
         return arrow_table, {"destination": "file://tmp/part-0.parquet", "bytes_processed": 128}
 
+    column_types = {"id": 20, "name": 25}
     driver = AsyncpgDriver(
-        connection=cast(AsyncpgConnection, DummyAsyncpgConnection()),
+        connection=cast(AsyncpgConnection, DummyAsyncpgConnection(column_types)),
         statement_config=aiosqlite_statement_config,
         driver_features={"storage_capabilities": CAPABILITIES},
     )
@@ -285,6 +313,7 @@ async def test_asyncpg_load_from_storage(monkeypatch: pytest.MonkeyPatch) -> Non
     assert driver.connection.calls[0][0] == "ingest_target"
     assert driver.connection.calls[0][1] == "public"
     assert driver.connection.calls[0][3] == ["id", "name"]
+    assert _decode_pgcopy(driver.connection.calls[0][2], column_types) == arrow_table.to_pylist()
     assert job.telemetry["rows_processed"] == arrow_table.num_rows
     assert job.telemetry["destination"] == "public.ingest_target"
 
@@ -316,7 +345,8 @@ def test_duckdb_load_from_storage(monkeypatch: pytest.MonkeyPatch) -> None:
 
 async def test_psqlpy_load_from_arrow_overwrite() -> None:
     arrow_table = pa.table({"id": [7, 8], "name": ["east", "west"]})
-    dummy_connection = DummyPsqlpyConnection()
+    column_types = {"id": 23, "name": 1043}
+    dummy_connection = DummyPsqlpyConnection(column_types)
     driver = PsqlpyDriver(
         connection=cast(PsqlpyConnection, dummy_connection),
         statement_config=asyncpg_statement_config,
@@ -328,11 +358,7 @@ async def test_psqlpy_load_from_arrow_overwrite() -> None:
     assert dummy_connection.statements == ['TRUNCATE TABLE "analytics"."ingest_target"']
     assert dummy_connection.copy_calls[0]["table"] == "ingest_target"
     assert dummy_connection.copy_calls[0]["schema"] == "analytics"
-    payload = dummy_connection.copy_calls[0]["records"]
-    if isinstance(payload, bytes):
-        assert payload == b"7\teast\n8\twest\n"
-    else:
-        assert payload == [(7, "east"), (8, "west")]
+    assert _decode_pgcopy(dummy_connection.copy_calls[0]["records"], column_types) == arrow_table.to_pylist()
     assert job.telemetry["destination"] == "analytics.ingest_target"
     assert job.telemetry["rows_processed"] == arrow_table.num_rows
 
@@ -0,0 +1,140 @@
+"""Tests for memory-mapped local Arrow IPC and Parquet reads."""
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+
+from sqlspec.adapters.duckdb import DuckDBConfig
+from sqlspec.exceptions import StorageCapabilityError
+from sqlspec.storage import SyncStoragePipeline
+from sqlspec.storage._arrow_payload import ArrowBatchDecoder, open_memory_map
+from sqlspec.storage.backends.local import LocalStore
+from sqlspec.typing import FSSPEC_INSTALLED, OBSTORE_INSTALLED
+from sqlspec.utils.type_guards import supports_memory_mapped_reads
+
+_ROWS = 200_000
+
+
+def _table(count: int = _ROWS) -> "pa.Table":
+    return pa.table({"id": pa.array(range(count), type=pa.int64()), "score": pa.array(range(count), type=pa.float64())})
+
+
+def _write_ipc(path: Path, count: int = _ROWS) -> Path:
+    with pa.ipc.new_file(str(path), pa.schema([("id", pa.int64()), ("score", pa.float64())])) as writer:
+        for batch in _table(count).to_batches(max_chunksize=50_000):
+            writer.write_batch(batch)
+    return path
+
+
+def test_local_store_reads_ipc_without_heap_copies(tmp_path: Path) -> None:
+    _write_ipc(tmp_path / "events.arrow")
+    feather.write_feather(_table(), str(tmp_path / "events.feather"), compression="uncompressed")
+    store = LocalStore(str(tmp_path))
+
+    before = pa.total_allocated_bytes()
+    table = store.read_arrow_sync("events.arrow")
+    feather_table = store.read_arrow_sync("events.feather")
+    allocated = pa.total_allocated_bytes() - before
+
+    assert table.num_rows == _ROWS
+    assert feather_table.equals(table)
+    assert allocated < table.nbytes // 10
+
+
+def test_local_store_open_arrow_reader(tmp_path: Path) -> None:
+    _write_ipc(tmp_path / "events.ipc")
+    pq.write_table(_table(), tmp_path / "events.parquet", row_group_size=20_000)
+    store = LocalStore(str(tmp_path))
+
+    ipc_reader = store.open_arrow_reader_sync("events.ipc", columns=["id"], filter=[("id", "<", 10)])
+    parquet_reader = store.open_arrow_reader_sync("events.parquet", batch_size=5_000)
+
+    assert isinstance(ipc_reader, pa.RecordBatchReader)
+    assert ipc_reader.read_all().column("id").to_pylist() == list(range(10))
+    assert max(batch.num_rows for batch in parquet_reader) == 5_000
+    with pytest.raises(ValueError, match="csv"):
+        store.open_arrow_reader_sync("events.parquet", file_format="csv")
+
+
+def test_local_store_parquet_reads_use_memory_map(tmp_path: Path) -> None:
+    pq.write_table(_table(1_000), tmp_path / "events.parquet", row_group_size=100)
+    store = LocalStore(str(tmp_path))
+
+    table = store.read_arrow_sync("events.parquet", columns=["score"], filter=[("id", ">=", 900)])
+    streamed = list(store.stream_arrow_sync("*.parquet", batch_size=250))
+
+    assert table.column_names == ["score"]
+    assert table.num_rows == 100
+    assert sum(batch.num_rows for batch in streamed) == 1_000
+
+
+def test_decoder_reads_memory_map_directly(tmp_path: Path) -> None:
+    _write_ipc(tmp_path / "events.arrow", 1_000)
+
+    decoder = ArrowBatchDecoder(open_memory_map(str(tmp_path / "events.arrow")), "arrow-ipc")
+    table = decoder.read_all()
+    decoder.close()
+
+    assert table.num_rows == 1_000
+    assert decoder.bytes_read == table.nbytes
+    assert table.column("id")[999].as_py() == 999
+
+
+def test_pipeline_memory_maps_local_ipc(tmp_path: Path) -> None:
+    source = str(_write_ipc(tmp_path / "events.arrow"))
+    pipeline = SyncStoragePipeline()
+
+    before = pa.total_allocated_bytes()
+    table, telemetry = pipeline.read_arrow(source, file_format="arrow-ipc")
+    allocated = pa.total_allocated_bytes() - before
+
+    assert telemetry["rows_processed"] == _ROWS
+    assert telemetry["bytes_processed"] == table.nbytes
+    assert allocated < table.nbytes // 10
+
+
+@pytest.mark.skipif(not OBSTORE_INSTALLED, reason="obstore missing")
+def test_obstore_memory_map_requires_local_store(tmp_path: Path) -> None:
+    from sqlspec.storage.backends.obstore import ObStoreBackend
+
+    _write_ipc(tmp_path / "events.arrow", 10)
+    local = ObStoreBackend(f"file://{tmp_path}")
+    remote = ObStoreBackend("memory://")
+
+    mapped = local.open_memory_map_sync("events.arrow")
+
+    assert supports_memory_mapped_reads(local)
+    assert pa.ipc.open_file(mapped).read_all().num_rows == 10
+    assert not supports_memory_mapped_reads(remote)
+    with pytest.raises(StorageCapabilityError):
+        remote.open_memory_map_sync("events.arrow")
+
+
+@pytest.mark.skipif(not FSSPEC_INSTALLED, reason="fsspec missing")
+def test_fsspec_memory_map_on_local_filesystem(tmp_path: Path) -> None:
+    from sqlspec.storage.backends.fsspec import FSSpecBackend
+
+    _write_ipc(tmp_path / "events.arrow", 10)
+    store = FSSpecBackend(f"file://{tmp_path}")
+
+    assert supports_memory_mapped_reads(store)
+    assert pa.ipc.open_file(store.open_memory_map_sync("events.arrow")).read_all().num_rows == 10
+
+
+def test_duckdb_load_from_storage_reads_mapped_ipc(tmp_path: Path) -> None:
+    source = str(_write_ipc(tmp_path / "events.arrow"))
+    config = DuckDBConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE events (id BIGINT, score DOUBLE)")
+        before = pa.total_allocated_bytes()
+        job = session.load_from_storage("events", source, file_format="arrow-ipc")
+        allocated = pa.total_allocated_bytes() - before
+        total = session.select_value("SELECT SUM(id) FROM events")
+    config.close_pool()
+
+    assert job.telemetry["rows_processed"] == _ROWS
+    assert total == sum(range(_ROWS))
+    assert allocated < _table().nbytes // 10
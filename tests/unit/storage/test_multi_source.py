@@ -0,0 +1,288 @@
+"""Tests for concurrent glob/prefix storage reads and multi-file loads."""
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.storage import (
+    AsyncMultiSourceReader,
+    AsyncStoragePipeline,
+    MultiSourceOptions,
+    SyncMultiSourceReader,
+    SyncStoragePipeline,
+    is_multi_source,
+    parse_multi_source_options,
+)
+from sqlspec.storage._paths import compile_source_pattern, split_multi_source
+from sqlspec.storage.pipeline import get_recent_storage_events, get_storage_bridge_metrics, reset_storage_bridge_events
+
+
+def _write_parts(root: Path, files: int, rows_per_file: int) -> None:
+    for index in range(files):
+        start = index * rows_per_file
+        ids = list(range(start, start + rows_per_file))
+        table = pa.table({"id": ids, "name": [f"n{value}" for value in ids]})
+        pq.write_table(table, root / f"part-{index:03d}.parquet", row_group_size=max(1, rows_per_file // 2))
+    (root / "notes.txt").write_text("ignored")
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("s3://bucket/events/*.parquet", True),
+        ("/data/events/", True),
+        ("/data/events/day=[0-9]/part.parquet", True),
+        ("/data/events/part.parquet", False),
+        (Path("/data/events/part.parquet"), False),
+        ("s3://bucket/events/part-?.parquet", True),
+        ("https://bucket.s3.amazonaws.com/events/part.parquet?X-Amz-Signature=abc&list=[1]", False),
+        ("http://[::1]:9000/events/part.parquet", False),
+    ],
+)
+def test_is_multi_source(source: "str | Path", expected: bool) -> None:
+    assert is_multi_source(source) is expected
+
+
+def test_split_and_match_source_patterns() -> None:
+    assert split_multi_source("s3://bucket/events/*/part-*.parquet") == ("s3://bucket/events/", "*/part-*.parquet")
+    assert split_multi_source("/data/events/") == ("/data/events/", "")
+    presigned = "https://host/events/part.parquet?X-Amz-Signature=a*b"
+    assert split_multi_source(presigned) == (presigned, "")
+
+    nested = compile_source_pattern("**/*.parquet")
+    flat = compile_source_pattern("*.parquet")
+    assert nested.fullmatch("a.parquet") and nested.fullmatch("day=1/a.parquet")
+    assert flat.fullmatch("a.parquet") and not flat.fullmatch("day=1/a.parquet")
+    assert compile_source_pattern("part-[!0].parquet").fullmatch("part-1.parquet")
+
+
+def test_expand_sources_lists_matching_objects(tmp_path: Path) -> None:
+    _write_parts(tmp_path, 3, 2)
+    (tmp_path / "nested").mkdir()
+    pq.write_table(pa.table({"id": [99]}), tmp_path / "nested" / "extra.parquet")
+    pipeline = SyncStoragePipeline()
+
+    flat = pipeline.expand_sources(f"{tmp_path}/*.parquet")
+    nested = pipeline.expand_sources(f"{tmp_path}/**/*.parquet")
+    prefix = pipeline.expand_sources(f"{tmp_path}/")
+
+    assert [Path(source).name for source in flat] == ["part-000.parquet", "part-001.parquet", "part-002.parquet"]
+    assert len(nested) == 4
+    assert len(prefix) == 5
+    assert pipeline.expand_sources(str(tmp_path / "part-000.parquet")) == [str(tmp_path / "part-000.parquet")]
+
+
+class _ListingBackend:
+    backend_type = "fake"
+    base_path = ""
+
+    def __init__(self) -> None:
+        self.prefixes: list[str] = []
+
+    def list_objects_sync(self, prefix: str = "", recursive: bool = True) -> "list[str]":
+        self.prefixes.append(prefix)
+        return ["events/a.parquet", "events/day=1/b.parquet", "events-old/c.parquet"]
+
+
+def test_expand_sources_lists_alias_prefix_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = _ListingBackend()
+    monkeypatch.setattr(
+        SyncStoragePipeline, "_backend", lambda self, destination, options: (backend, "events/", "fake")
+    )
+
+    sources = SyncStoragePipeline().expand_sources("alias://lake/events/")
+
+    assert backend.prefixes == ["events/"]
+    assert sources == ["alias://lake/events/a.parquet", "alias://lake/events/day=1/b.parquet"]
+
+
+def test_parse_multi_source_options_validates_values() -> None:
+    options = parse_multi_source_options({"kind": "fixed", "max_concurrency": 8, "ordered": False})
+
+    assert options.max_concurrency == 8
+    assert options.ordered is False
+    assert parse_multi_source_options(None).read_ahead == MultiSourceOptions().read_ahead
+    with pytest.raises(ValueError):
+        parse_multi_source_options({"read_ahead": 0})
+    with pytest.raises(TypeError):
+        parse_multi_source_options({"ordered": "yes"})
+
+
+def test_sync_reader_preserves_source_order(tmp_path: Path) -> None:
+    _write_parts(tmp_path, 6, 10)
+    pipeline = SyncStoragePipeline()
+    sources = pipeline.expand_sources(f"{tmp_path}/*.parquet")
+    options = MultiSourceOptions(max_concurrency=3, read_ahead=1)
+
+    with SyncMultiSourceReader(pipeline, str(tmp_path), sources, "parquet", options) as reader:
+        ids = [value for batch in reader for value in batch.column("id").to_pylist()]
+
+    telemetry = reader.telemetry()
+    assert ids == list(range(60))
+    assert telemetry["rows_processed"] == 60
+    assert telemetry["extra"] == {"files": 6, "ordered": True}
+
+
+def test_sync_reader_unordered_yields_every_row(tmp_path: Path) -> None:
+    _write_parts(tmp_path, 5, 8)
+    pipeline = SyncStoragePipeline()
+    sources = pipeline.expand_sources(f"{tmp_path}/*.parquet")
+    seen_files: list[str] = []
+    options = MultiSourceOptions(max_concurrency=4, read_ahead=2, ordered=False)
+
+    reader = SyncMultiSourceReader(
+        pipeline,
+        str(tmp_path),
+        sources,
+        "parquet",
+        options,
+        on_file=lambda item: seen_files.append(item["destination"]),
+    )
+    with reader:
+        ids = sorted(value for batch in reader for value in batch.column("id").to_pylist())
+
+    assert ids == list(range(40))
+    assert sorted(seen_files) == sources
+
+
+def test_sync_reader_bounds_concurrent_files(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _write_parts(tmp_path, 8, 4)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    original = SyncStoragePipeline.open_reader
+
+    class _TrackingReader:
+        def __init__(self, inner: Any) -> None:
+            self._inner = inner
+
+        def __enter__(self) -> Any:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            return self._inner.__enter__()
+
+        def __exit__(self, *exc_info: Any) -> None:
+            nonlocal active
+            with lock:
+                active -= 1
+            self._inner.__exit__(*exc_info)
+
+    monkeypatch.setattr(
+        SyncStoragePipeline,
+        "open_reader",
+        lambda self, *args, **kwargs: _TrackingReader(original(self, *args, **kwargs)),
+    )
+    pipeline = SyncStoragePipeline()
+    sources = pipeline.expand_sources(f"{tmp_path}/*.parquet")
+
+    with SyncMultiSourceReader(pipeline, str(tmp_path), sources, "parquet", MultiSourceOptions(max_concurrency=2)) as r:
+        rows = sum(batch.num_rows for batch in r)
+
+    assert rows == 32
+    assert 1 <= peak <= 2
+
+
+def test_sync_reader_surfaces_file_errors(tmp_path: Path) -> None:
+    _write_parts(tmp_path, 2, 4)
+    (tmp_path / "part-999.parquet").write_bytes(b"not parquet")
+    pipeline = SyncStoragePipeline()
+    sources = pipeline.expand_sources(f"{tmp_path}/*.parquet")
+
+    with pytest.raises(Exception), SyncMultiSourceReader(pipeline, str(tmp_path), sources, "parquet") as reader:
+        for _ in reader:
+            pass
+
+
+def test_sqlite_load_from_storage_fans_in_glob(tmp_path: Path) -> None:
+    _write_parts(tmp_path, 4, 25)
+    reset_storage_bridge_events()
+    files_before = get_storage_bridge_metrics()["storage_bridge.files_read"]
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE items (id INTEGER, name TEXT)")
+        session.execute("INSERT INTO items VALUES (-1, 'stale')")
+        job = session.load_from_storage(
+            "items",
+            f"{tmp_path}/*.parquet",
+            file_format="parquet",
+            partitioner={"max_concurrency": 2, "rows_per_load": 30},
+            overwrite=True,
+        )
+        ids = session.select_value("SELECT COUNT(*) FROM items WHERE id >= 0")
+        stale = session.select_value("SELECT COUNT(*) FROM items WHERE id < 0")
+    config.close_pool()
+
+    assert ids == 100
+    assert stale == 0
+    assert job.telemetry["rows_processed"] == 100
+    assert job.telemetry["extra"]["chunks"] == 2
+    assert job.telemetry["extra"]["source"]["extra"]["files"] == 4
+    assert get_storage_bridge_metrics()["storage_bridge.files_read"] - files_before == 4
+    file_events = [event for event in get_recent_storage_events() if str(event["destination"]).endswith(".parquet")]
+    assert len(file_events) == 4
+
+
+def test_sqlite_load_from_storage_rolls_back_every_chunk_on_failure(tmp_path: Path) -> None:
+    _write_parts(tmp_path, 2, 4)
+    (tmp_path / "part-999.parquet").write_bytes(b"not parquet")
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE items (id INTEGER, name TEXT)")
+        session.execute("INSERT INTO items VALUES (-1, 'stale')")
+        session.commit()
+        with pytest.raises(Exception):
+            session.load_from_storage(
+                "items",
+                f"{tmp_path}/*.parquet",
+                file_format="parquet",
+                partitioner={"max_concurrency": 1, "read_ahead": 1, "rows_per_load": 4},
+                overwrite=True,
+            )
+        rows = session.select("SELECT id FROM items")
+    config.close_pool()
+
+    assert rows == [{"id": -1}]
+
+
+@pytest.mark.anyio
+async def test_async_reader_preserves_source_order(tmp_path: Path) -> None:
+    _write_parts(tmp_path, 5, 6)
+    pipeline = AsyncStoragePipeline()
+    sources = await pipeline.expand_sources(f"{tmp_path}/")
+    parquet_sources = [source for source in sources if source.endswith(".parquet")]
+
+    reader = AsyncMultiSourceReader(
+        pipeline, str(tmp_path), parquet_sources, "parquet", MultiSourceOptions(max_concurrency=2, read_ahead=1)
+    )
+    ids: list[int] = []
+    async with reader:
+        async for batch in reader:
+            ids.extend(batch.column("id").to_pylist())
+
+    assert ids == list(range(30))
+
+
+@pytest.mark.anyio
+async def test_aiosqlite_load_from_storage_unordered(tmp_path: Path) -> None:
+    parts = tmp_path / "parts"
+    parts.mkdir()
+    _write_parts(parts, 3, 10)
+    config = AiosqliteConfig(connection_config={"database": str(tmp_path / "items.db")})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE items (id INTEGER, name TEXT)")
+        job = await session.load_from_storage(
+            "items", f"{parts}/part-*.parquet", file_format="parquet", partitioner={"ordered": False}
+        )
+        count = await session.select_value("SELECT COUNT(*) FROM items")
+    await config.close_pool()
+
+    assert count == 30
+    assert job.telemetry["extra"]["source"]["extra"]["ordered"] is False
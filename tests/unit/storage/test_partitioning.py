@@ -0,0 +1,205 @@
+"""Tests for partitioned storage fan-out."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.storage import (
+    AsyncPartitionedWriter,
+    AsyncStoragePipeline,
+    SyncPartitionedWriter,
+    SyncStoragePipeline,
+    parse_partitioner,
+)
+from sqlspec.storage.partitioning import HIVE_DEFAULT_PARTITION
+
+
+def _batch() -> "pa.RecordBatch":
+    return pa.RecordBatch.from_pydict({
+        "region": ["eu", "us", "eu", None, "us", "eu"],
+        "day": ["d1", "d1", "d2", "d1", "d1", "d1"],
+        "amount": [1, 2, 3, 4, 5, 6],
+    })
+
+
+def _relative_files(root: Path) -> "list[str]":
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*") if path.is_file())
+
+
+def test_parse_partitioner_accepts_fan_out_kinds_only() -> None:
+    columns = parse_partitioner({"kind": "columns", "columns": ["region"], "max_concurrency": 2})
+    rows = parse_partitioner({"kind": "rows", "rows_per_chunk": 10})
+
+    assert columns is not None and columns.columns == ("region",) and columns.max_concurrency == 2
+    assert rows is not None and rows.rows_per_chunk == 10
+    assert parse_partitioner({"kind": "fixed", "partitions": 4}) is None
+    assert parse_partitioner(None) is None
+
+
+@pytest.mark.parametrize(
+    "partitioner",
+    [
+        {"kind": "columns"},
+        {"kind": "columns", "columns": "region"},
+        {"kind": "rows"},
+        {"kind": "rows", "rows_per_chunk": 0},
+        {"kind": "rows", "rows_per_chunk": 5, "max_concurrency": -1},
+    ],
+)
+def test_parse_partitioner_rejects_malformed_config(partitioner: "dict[str, Any]") -> None:
+    with pytest.raises(ValueError):
+        parse_partitioner(partitioner)
+
+
+def test_columns_partitioner_writes_hive_layout_and_manifest(tmp_path: Path) -> None:
+    spec = parse_partitioner({"kind": "columns", "columns": ["region", "day"], "manifest_path": "_manifest.json"})
+    assert spec is not None
+    writer = SyncPartitionedWriter(SyncStoragePipeline(), str(tmp_path), spec)
+
+    writer.write_batch(_batch())
+    telemetry = writer.close()
+
+    assert _relative_files(tmp_path) == [
+        "_manifest.json",
+        f"region={HIVE_DEFAULT_PARTITION}/day=d1/part-0001.parquet",
+        "region=eu/day=d1/part-0001.parquet",
+        "region=eu/day=d2/part-0001.parquet",
+        "region=us/day=d1/part-0001.parquet",
+    ]
+    eu_d1 = pq.read_table(tmp_path / "region=eu" / "day=d1" / "part-0001.parquet")
+    assert eu_d1.column_names == ["amount"]
+    assert eu_d1.column("amount").to_pylist() == [1, 6]
+    manifest = json.loads((tmp_path / "_manifest.json").read_text())
+    assert sum(entry["rows"] for entry in manifest) == 6
+    assert {"region": "us", "day": "d1"} in [entry["partition"] for entry in manifest]
+    assert telemetry["partitions_created"] == 4
+    assert telemetry["rows_processed"] == 6
+
+
+def test_partitioned_writer_types_columns_null_in_first_chunk(tmp_path: Path) -> None:
+    spec = parse_partitioner({"kind": "columns", "columns": ["region"]})
+    assert spec is not None
+    writer = SyncPartitionedWriter(SyncStoragePipeline(), str(tmp_path), spec)
+
+    writer.write_rows([{"region": "eu", "amount": None}, {"region": "us", "amount": None}])
+    writer.write_rows([{"region": "eu", "amount": 3}])
+    writer.close()
+
+    eu = pq.read_table(tmp_path / "region=eu" / "part-0001.parquet")
+    us = pq.read_table(tmp_path / "region=us" / "part-0001.parquet")
+    assert eu.schema.field("amount").type == pa.int64()
+    assert us.schema.field("amount").type == pa.int64()
+    assert eu.column("amount").to_pylist() == [None, 3]
+
+
+def test_rows_partitioner_splits_fixed_size_chunks(tmp_path: Path) -> None:
+    spec = parse_partitioner({"kind": "rows", "rows_per_chunk": 4})
+    assert spec is not None
+    writer = SyncPartitionedWriter(SyncStoragePipeline(), tmp_path, spec, format_hint="jsonl")
+
+    writer.write_batch(_batch())
+    writer.write_rows([{"region": "eu", "day": "d3", "amount": 7}])
+    telemetry = writer.close()
+
+    assert _relative_files(tmp_path) == ["part-0001.jsonl", "part-0002.jsonl"]
+    assert len((tmp_path / "part-0001.jsonl").read_text().splitlines()) == 4
+    assert len((tmp_path / "part-0002.jsonl").read_text().splitlines()) == 3
+    assert telemetry["rows_processed"] == 7
+
+
+def test_partitioned_writer_caps_concurrent_uploads(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    original = SyncPartitionedWriter._write_part  # pyright: ignore[reportPrivateUsage]
+
+    def _tracking_write_part(self: SyncPartitionedWriter, *args: Any) -> "dict[str, Any]":
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            return original(self, *args)
+        finally:
+            with lock:
+                active -= 1
+
+    monkeypatch.setattr(SyncPartitionedWriter, "_write_part", _tracking_write_part)
+    spec = parse_partitioner({"kind": "rows", "rows_per_chunk": 1, "max_concurrency": 2})
+    assert spec is not None
+    writer = SyncPartitionedWriter(SyncStoragePipeline(), tmp_path, spec)
+
+    writer.write_batch(_batch())
+    telemetry = writer.close()
+
+    assert telemetry["partitions_created"] == 6
+    assert 1 <= peak <= 2
+
+
+def test_partitioned_writer_abort_removes_completed_parts(tmp_path: Path) -> None:
+    spec = parse_partitioner({"kind": "rows", "rows_per_chunk": 2})
+    assert spec is not None
+    writer = SyncPartitionedWriter(SyncStoragePipeline(), tmp_path, spec)
+
+    writer.write_batch(_batch())
+    writer.abort()
+
+    assert _relative_files(tmp_path) == []
+
+
+def test_sqlite_select_to_storage_partitions_by_column(tmp_path: Path) -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE sales (region TEXT, amount INTEGER)")
+        session.execute_many("INSERT INTO sales VALUES (?, ?)", [("eu", 1), ("us", 2), ("eu", 3)])
+        job = session.select_to_storage(
+            "SELECT region, amount FROM sales",
+            str(tmp_path / "sales"),
+            partitioner={"kind": "columns", "columns": ["region"], "manifest_path": "manifest.json"},
+            batch_size=2,
+        )
+    config.close_pool()
+
+    assert _relative_files(tmp_path / "sales") == [
+        "manifest.json",
+        "region=eu/part-0001.parquet",
+        "region=us/part-0001.parquet",
+    ]
+    assert job.telemetry["partitions_created"] == 2
+    assert job.telemetry["extra"]["partitioner"]["kind"] == "columns"
+
+
+@pytest.mark.anyio
+async def test_async_partitioned_writer_writes_parts(tmp_path: Path) -> None:
+    spec = parse_partitioner({"kind": "columns", "columns": ["region"], "manifest_path": "manifest.jsonl"})
+    assert spec is not None
+    writer = AsyncPartitionedWriter(AsyncStoragePipeline(), tmp_path, spec, format_hint="csv")
+
+    await writer.write_batch(_batch())
+    telemetry = await writer.close()
+
+    assert telemetry["partitions_created"] == 3
+    assert len((tmp_path / "manifest.jsonl").read_text().splitlines()) == 3
+    assert (tmp_path / "region=eu" / "part-0001.csv").exists()
+
+
+@pytest.mark.anyio
+async def test_aiosqlite_select_to_storage_partitions_rows(tmp_path: Path) -> None:
+    config = AiosqliteConfig(connection_config={"database": str(tmp_path / "sales.db")})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE sales (region TEXT, amount INTEGER)")
+        await session.execute_many("INSERT INTO sales VALUES (?, ?)", [("eu", index) for index in range(5)])
+        job = await session.select_to_storage(
+            "SELECT region, amount FROM sales", str(tmp_path / "out"), partitioner={"kind": "rows", "rows_per_chunk": 2}
+        )
+    await config.close_pool()
+
+    assert _relative_files(tmp_path / "out") == ["part-0001.parquet", "part-0002.parquet", "part-0003.parquet"]
+    assert job.telemetry["rows_processed"] == 5
@@ -0,0 +1,181 @@
+"""Tests for projection and predicate pushdown on storage reads."""
+
+import hashlib
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.storage import AsyncStoragePipeline, SyncStoragePipeline
+from sqlspec.storage._arrow_payload import normalize_arrow_filter
+from sqlspec.storage.backends.local import LocalStore
+from sqlspec.typing import FSSPEC_INSTALLED, OBSTORE_INSTALLED
+
+
+def _events(count: int = 10_000) -> "pa.Table":
+    return pa.table({
+        "id": list(range(count)),
+        "day": [index // 1_000 for index in range(count)],
+        "payload": [hashlib.sha256(str(index).encode()).hexdigest() for index in range(count)],
+    })
+
+
+def _write_events(path: Path, count: int = 10_000) -> Path:
+    pq.write_table(_events(count), path, row_group_size=1_000)
+    return path
+
+
+def test_normalize_arrow_filter_accepts_dnf_and_expressions() -> None:
+    table = _events()
+
+    single = normalize_arrow_filter(("day", "=", 1))
+    conjunction = normalize_arrow_filter([("day", ">=", 1), ("id", "<", 1_500)])
+    disjunction = normalize_arrow_filter([[("day", "=", 0)], [("day", "=", 2)]])
+    expression = pc.field("id") < 5
+
+    assert table.filter(single).num_rows == 1_000
+    assert table.filter(conjunction).num_rows == 500
+    assert table.filter(disjunction).num_rows == 2_000
+    assert normalize_arrow_filter(expression) is expression
+    assert normalize_arrow_filter(None) is None
+    with pytest.raises(TypeError):
+        normalize_arrow_filter("day = 1")
+
+
+def test_read_arrow_pushes_projection_and_row_group_filter(tmp_path: Path) -> None:
+    source = str(_write_events(tmp_path / "events.parquet"))
+    pipeline = SyncStoragePipeline()
+
+    full, full_telemetry = pipeline.read_arrow(source, file_format="parquet")
+    table, telemetry = pipeline.read_arrow(source, file_format="parquet", columns=["id"], filter=[("day", ">=", 8)])
+
+    assert full.num_rows == 10_000
+    assert table.column_names == ["id"]
+    assert table.column("id").to_pylist() == list(range(8_000, 10_000))
+    assert telemetry["rows_processed"] == 2_000
+    assert telemetry["bytes_processed"] < full_telemetry["bytes_processed"] // 5
+
+
+def test_read_arrow_skips_every_row_group_outside_filter(tmp_path: Path) -> None:
+    source = str(_write_events(tmp_path / "events.parquet"))
+
+    table, telemetry = SyncStoragePipeline().read_arrow(source, file_format="parquet", filter=pc.field("day") > 100)
+
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "day", "payload"]
+    assert telemetry["bytes_processed"] < (tmp_path / "events.parquet").stat().st_size // 5
+
+
+@pytest.mark.parametrize("format_choice", ["arrow-ipc", "csv", "jsonl", "json"])
+def test_open_reader_pushdown_for_other_formats(tmp_path: Path, format_choice: str) -> None:
+    pipeline = SyncStoragePipeline()
+    target = str(tmp_path / f"events.{format_choice}")
+    table = _events(3_000)
+    if format_choice in {"jsonl", "json"}:
+        pipeline.write_rows(table.to_pylist(), target, format_hint=format_choice)  # type: ignore[arg-type]
+    else:
+        pipeline.write_arrow(table, target, format_hint=format_choice)  # type: ignore[arg-type]
+
+    with pipeline.open_reader(
+        target, file_format=format_choice, columns=["payload", "id"], filter=("day", "=", 2), batch_size=400
+    ) as reader:  # type: ignore[arg-type]
+        batches = list(reader)
+
+    assert reader.schema.names == ["payload", "id"]
+    assert [value for batch in batches for value in batch.column("id").to_pylist()] == list(range(2_000, 3_000))
+
+
+def test_read_arrow_rejects_unknown_columns(tmp_path: Path) -> None:
+    source = str(_write_events(tmp_path / "events.parquet", 10))
+
+    with pytest.raises(ValueError, match="missing"):
+        SyncStoragePipeline().read_arrow(source, file_format="parquet", columns=["id", "missing"])
+
+
+def test_local_store_read_and_stream_pushdown(tmp_path: Path) -> None:
+    _write_events(tmp_path / "a.parquet")
+    _write_events(tmp_path / "b.parquet")
+    store = LocalStore(str(tmp_path))
+
+    table = store.read_arrow_sync("a.parquet", columns=["id"], filter=[("day", "=", 3)])
+    batches = list(store.stream_arrow_sync("*.parquet", batch_size=300, columns=["id"], filter=[("day", "=", 3)]))
+    projected = list(store.stream_arrow_sync("a.parquet", columns=["day"]))
+
+    assert table.column_names == ["id"]
+    assert table.num_rows == 1_000
+    assert sum(batch.num_rows for batch in batches) == 2_000
+    assert max(batch.num_rows for batch in batches) <= 300
+    assert {batch.schema.names[0] for batch in batches} == {"id"}
+    assert all(batch.schema.names == ["day"] for batch in projected)
+
+
+@pytest.mark.skipif(not OBSTORE_INSTALLED, reason="obstore missing")
+def test_obstore_pushdown_reads_ranges(tmp_path: Path) -> None:
+    from sqlspec.storage.backends.obstore import ObStoreBackend
+
+    _write_events(tmp_path / "events.parquet")
+    store = ObStoreBackend(f"file://{tmp_path}")
+
+    table = store.read_arrow_sync("events.parquet", columns=["payload"], filter=pc.field("id") == 5)
+    streamed = list(store.stream_arrow_sync("*.parquet", columns=["id"], filter=[("day", "<", 1)]))
+
+    assert table.column_names == ["payload"]
+    assert table.num_rows == 1
+    assert sum(batch.num_rows for batch in streamed) == 1_000
+
+
+@pytest.mark.skipif(not FSSPEC_INSTALLED, reason="fsspec missing")
+def test_fsspec_pushdown_reads_matching_rows(tmp_path: Path) -> None:
+    from sqlspec.storage.backends.fsspec import FSSpecBackend
+
+    _write_events(tmp_path / "events.parquet")
+    store = FSSpecBackend(f"file://{tmp_path}")
+
+    table = store.read_arrow_sync("events.parquet", columns=["id"], filter=[("day", "=", 9)])
+    streamed = list(store.stream_arrow_sync("*.parquet", columns=["id"], filter=[("day", "=", 9)]))
+
+    assert table.column("id").to_pylist() == list(range(9_000, 10_000))
+    assert sum(batch.num_rows for batch in streamed) == 1_000
+
+
+def test_sqlite_load_from_storage_with_pushdown(tmp_path: Path) -> None:
+    _write_events(tmp_path / "part-0.parquet")
+    _write_events(tmp_path / "part-1.parquet")
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE events (id INTEGER)")
+        single = session.load_from_storage(
+            "events", str(tmp_path / "part-0.parquet"), file_format="parquet", columns=["id"], filter=[("day", "=", 0)]
+        )
+        multi = session.load_from_storage(
+            "events", f"{tmp_path}/*.parquet", file_format="parquet", columns=["id"], filter=pc.field("id") >= 9_990
+        )
+        count = session.select_value("SELECT COUNT(*) FROM events")
+    config.close_pool()
+
+    assert single.telemetry["rows_processed"] == 1_000
+    assert multi.telemetry["rows_processed"] == 20
+    assert count == 1_020
+
+
+@pytest.mark.anyio
+async def test_async_pipeline_and_aiosqlite_pushdown(tmp_path: Path) -> None:
+    source = str(_write_events(tmp_path / "events.parquet"))
+    table, _telemetry = await AsyncStoragePipeline().read_arrow_async(
+        source, file_format="parquet", columns=["day"], filter=[("id", "<", 10)]
+    )
+    config = AiosqliteConfig(connection_config={"database": str(tmp_path / "events.db")})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE events (id INTEGER, day INTEGER)")
+        await session.load_from_storage(
+            "events", source, file_format="parquet", columns=["id", "day"], filter=[("day", "=", 4)]
+        )
+        rows = await session.select_value("SELECT COUNT(*) FROM events WHERE day = 4")
+    await config.close_pool()
+
+    assert table.column("day").to_pylist() == [0] * 10
+    assert rows == 1_000
@@ -110,4 +110,4 @@ def test_public_storage_format_matches_pipeline_reexport() -> None:
 
 
 def test_arrow_payload_storage_format_only_advertises_encodable_formats() -> None:
-    assert set(get_args(ArrowPayloadStorageFormat)) == {"jsonl", "json", "parquet", "arrow-ipc", "csv"}
+    assert set(get_args(ArrowPayloadStorageFormat)) == {"jsonl", "json", "parquet", "arrow-ipc", "arrow-stream", "csv"}
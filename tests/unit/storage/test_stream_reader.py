@@ -0,0 +1,176 @@
+# pyright: reportPrivateUsage=false
+"""Tests for incremental storage readers and per-batch pipeline encoding."""
+
+import io
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import sqlspec.storage.pipeline as pipeline_module
+from sqlspec.storage import AsyncStoragePipeline, SyncStoragePipeline
+from sqlspec.storage._arrow_payload import ArrowBatchDecoder
+from sqlspec.storage.backends.local import LocalStore
+from sqlspec.storage.pipeline import StorageDestination, SyncStorageReader
+from sqlspec.utils.type_guards import supports_read_stream
+
+
+def _table(count: int) -> "pa.Table":
+    return pa.table({"id": list(range(count)), "name": [f"n{i}" for i in range(count)]})
+
+
+class _RecordingHandle:
+    def __init__(self, sink: "list[bytes]") -> None:
+        self._sink = sink
+
+    def write(self, data: bytes) -> int:
+        self._sink.append(bytes(data))
+        return len(data)
+
+    def close(self) -> None:
+        return None
+
+
+class _StreamingBackend:
+    backend_type = "recording"
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def open_write_stream_sync(self, path: str) -> _RecordingHandle:
+        return _RecordingHandle(self.chunks)
+
+    def write_bytes_sync(self, path: str, data: bytes) -> None:
+        raise AssertionError("streaming backends must not receive whole payloads")
+
+
+@pytest.mark.parametrize("format_choice", ["parquet", "arrow-ipc", "csv", "jsonl", "json"])
+def test_pipeline_round_trips_through_streaming_handles(tmp_path: Path, format_choice: str) -> None:
+    pipeline = SyncStoragePipeline()
+    target = str(tmp_path / f"data.{format_choice}")
+    table = _table(10)
+
+    if format_choice in {"jsonl", "json"}:
+        write_telemetry = pipeline.write_rows(table.to_pylist(), target, format_hint=format_choice)  # type: ignore[arg-type]
+    else:
+        write_telemetry = pipeline.write_arrow(table, target, format_hint=format_choice)  # type: ignore[arg-type]
+    restored, read_telemetry = pipeline.read_arrow(target, file_format=format_choice)  # type: ignore[arg-type]
+
+    assert write_telemetry["rows_processed"] == 10
+    assert write_telemetry["bytes_processed"] == (tmp_path / f"data.{format_choice}").stat().st_size
+    assert restored.column("id").to_pylist() == list(range(10))
+    assert read_telemetry["rows_processed"] == 10
+    assert read_telemetry["bytes_processed"] > 0
+
+
+@pytest.mark.parametrize("format_choice", ["csv", "jsonl"])
+def test_read_arrow_infers_types_across_blocks(tmp_path: Path, format_choice: str) -> None:
+    rows = 120_000
+    target = tmp_path / f"drift.{format_choice}"
+    if format_choice == "csv":
+        target.write_text("id,code\n" + "".join(f"{i},{i}\n" for i in range(rows)) + f"{rows},x1\n")
+    else:
+        target.write_text(
+            "".join(f'{{"id":{i},"code":null}}\n' for i in range(rows)) + f'{{"id":{rows},"code":"x1"}}\n'
+        )
+    assert target.stat().st_size > 1 << 20
+
+    table, telemetry = SyncStoragePipeline().read_arrow(str(target), file_format=format_choice)  # type: ignore[arg-type]
+    projected, _ = SyncStoragePipeline().read_arrow(
+        str(target),
+        file_format=format_choice,  # type: ignore[arg-type]
+        columns=["code"],
+        filter=("id", ">=", rows),
+    )
+
+    assert table.num_rows == rows + 1
+    assert table.schema.field("code").type == pa.string()
+    assert telemetry["rows_processed"] == rows + 1
+    assert projected.to_pylist() == [{"code": "x1"}]
+
+
+def test_write_arrow_encodes_each_batch_into_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = _StreamingBackend()
+
+    def _fake_resolve(
+        self: SyncStoragePipeline, destination: "StorageDestination", backend_options: "dict[str, Any] | None"
+    ) -> "tuple[_StreamingBackend, str, str]":
+        return backend, "objects/data.parquet", backend.backend_type
+
+    monkeypatch.setattr(SyncStoragePipeline, "_backend", _fake_resolve)
+    monkeypatch.setattr(pipeline_module, "_STREAM_CHUNK_ROWS", 4)
+
+    telemetry = SyncStoragePipeline().write_arrow(_table(10), "memory://data.parquet")
+
+    payload = b"".join(backend.chunks)
+    assert len(backend.chunks) > 3
+    assert pq.ParquetFile(io.BytesIO(payload)).metadata.num_row_groups == 3
+    assert telemetry["bytes_processed"] == len(payload)
+    assert telemetry["rows_processed"] == 10
+
+
+def test_write_arrow_empty_table_keeps_schema(tmp_path: Path) -> None:
+    target = tmp_path / "empty.parquet"
+    SyncStoragePipeline().write_arrow(_table(0), str(target))
+
+    assert pq.read_table(target).schema.names == ["id", "name"]
+
+
+def test_open_reader_yields_bounded_batches(tmp_path: Path) -> None:
+    target = tmp_path / "data.parquet"
+    pq.write_table(_table(25), target, row_group_size=10)
+
+    with SyncStoragePipeline().open_reader(str(target), file_format="parquet", batch_size=10) as reader:
+        batch_sizes = [batch.num_rows for batch in reader]
+
+    assert batch_sizes == [10, 10, 5]
+    assert reader.rows_read == 25
+    assert reader.telemetry()["rows_processed"] == 25
+
+
+def test_local_store_read_stream_feeds_decoder(tmp_path: Path) -> None:
+    pq.write_table(_table(3), tmp_path / "data.parquet")
+    store = LocalStore(str(tmp_path))
+
+    assert supports_read_stream(store)
+    decoder = ArrowBatchDecoder(store.open_read_stream_sync("data.parquet"), "parquet")
+    table = decoder.read_all()
+    decoder.close()
+
+    assert table.num_rows == 3
+    assert decoder.bytes_read > 0
+
+
+def test_reader_falls_back_to_buffered_download(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    payload = io.BytesIO()
+    pq.write_table(_table(4), payload)
+
+    class _BytesBackend:
+        backend_type = "bytes"
+
+        def read_bytes_sync(self, path: str) -> bytes:
+            return payload.getvalue()
+
+    reader = SyncStorageReader(_BytesBackend(), "data.parquet", "bytes", "parquet")  # type: ignore[arg-type]
+
+    assert reader.read_all().num_rows == 4
+
+
+@pytest.mark.anyio
+async def test_async_pipeline_round_trip_uses_readers(tmp_path: Path) -> None:
+    pipeline = AsyncStoragePipeline()
+    target = str(tmp_path / "data.arrow")
+
+    await pipeline.write_arrow(_table(6), target, format_hint="arrow-ipc")
+    reader = await pipeline.open_reader(target, file_format="arrow-ipc")
+    rows = 0
+    async with reader:
+        async for batch in reader:
+            rows += batch.num_rows
+    table, telemetry = await pipeline.read_arrow_async(target, file_format="arrow-ipc")
+
+    assert rows == 6
+    assert table.num_rows == 6
+    assert telemetry["rows_processed"] == 6
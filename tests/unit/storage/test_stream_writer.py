@@ -0,0 +1,221 @@
+# pyright: reportPrivateUsage=false
+"""Tests for incremental storage writers and streaming select_to_storage."""
+
+import io
+import json
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.exceptions import SQLSpecError, StorageCapabilityError
+from sqlspec.storage import AsyncStoragePipeline, SyncStoragePipeline
+from sqlspec.storage._arrow_payload import ArrowBatchEncoder
+from sqlspec.storage.backends.local import LocalStore
+from sqlspec.utils.type_guards import supports_async_write_stream, supports_write_stream
+
+
+def _batch(start: int, count: int) -> "pa.RecordBatch":
+    ids = list(range(start, start + count))
+    return pa.RecordBatch.from_pydict({"id": ids, "name": [f"n{i}" for i in ids]})
+
+
+class _BufferOnlyBackend:
+    backend_type = "fake"
+
+    def __init__(self) -> None:
+        self.payloads: dict[str, bytes] = {}
+        self.deleted: list[str] = []
+
+    def write_bytes_sync(self, path: str, data: bytes) -> None:
+        self.payloads[path] = data
+
+    def delete_sync(self, path: str) -> None:
+        self.deleted.append(path)
+
+
+@pytest.mark.parametrize("format_choice", ["parquet", "arrow-ipc", "csv"])
+def test_arrow_batch_encoder_concatenates_to_valid_payload(format_choice: str) -> None:
+    encoder = ArrowBatchEncoder(format_choice)  # type: ignore[arg-type]
+    payload = b"".join([encoder.encode(_batch(0, 3)), encoder.encode(_batch(3, 2)), encoder.finish()])
+
+    if format_choice == "parquet":
+        table = pq.read_table(io.BytesIO(payload))
+    elif format_choice == "arrow-ipc":
+        table = pa.ipc.open_file(pa.BufferReader(payload)).read_all()
+    else:
+        table = pa_csv.read_csv(io.BytesIO(payload))
+
+    assert table.column("id").to_pylist() == [0, 1, 2, 3, 4]
+
+
+def test_arrow_batch_encoder_pins_first_schema() -> None:
+    encoder = ArrowBatchEncoder("parquet")
+    payload = b"".join([
+        encoder.encode(pa.RecordBatch.from_pydict({"id": pa.array([1], pa.int64())})),
+        encoder.encode(pa.RecordBatch.from_pydict({"id": pa.array([2], pa.int32())})),
+        encoder.finish(),
+    ])
+
+    assert pq.read_table(io.BytesIO(payload)).schema.field("id").type == pa.int64()
+
+
+@pytest.mark.parametrize("format_choice", ["parquet", "arrow-stream", "csv"])
+def test_arrow_batch_encoder_holds_back_null_first_chunk(format_choice: str) -> None:
+    encoder = ArrowBatchEncoder(format_choice)  # type: ignore[arg-type]
+    held = encoder.encode_rows([{"id": 1, "score": None}, {"id": 2, "score": None}])
+    payload = b"".join([held, encoder.encode_rows([{"id": 3, "score": 7}]), encoder.finish()])
+
+    assert held == b""
+    if format_choice == "parquet":
+        table = pq.read_table(io.BytesIO(payload))
+    elif format_choice == "arrow-stream":
+        table = pa.ipc.open_stream(pa.BufferReader(payload)).read_all()
+    else:
+        table = pa_csv.read_csv(io.BytesIO(payload))
+    assert table.schema.field("score").type == pa.int64()
+    assert table.column("score").to_pylist() == [None, None, 7]
+
+
+def test_arrow_batch_encoder_types_all_null_column_as_string_on_finish() -> None:
+    encoder = ArrowBatchEncoder("parquet")
+    payload = b"".join([encoder.encode_rows([{"id": 1, "note": None}]), encoder.finish()])
+
+    table = pq.read_table(io.BytesIO(payload))
+    assert table.schema.field("note").type == pa.string()
+    assert table.column("id").to_pylist() == [1]
+
+
+def test_local_store_exposes_write_streams(tmp_path: Path) -> None:
+    store = LocalStore(str(tmp_path))
+
+    assert supports_write_stream(store)
+    assert supports_async_write_stream(store)
+    handle = store.open_write_stream_sync("nested/out.bin")
+    handle.write(b"abc")
+    handle.close()
+
+    assert (tmp_path / "nested" / "out.bin").read_bytes() == b"abc"
+
+
+def test_sync_writer_streams_parquet_batches(tmp_path: Path) -> None:
+    progress: list[tuple[int, int]] = []
+    writer = SyncStoragePipeline().open_writer(
+        str(tmp_path / "out.parquet"), progress=lambda rows, size: progress.append((rows, size))
+    )
+    writer.write_batch(_batch(0, 4))
+    writer.write_rows([{"id": 4, "name": "n4"}])
+    telemetry = writer.close()
+
+    table = pq.read_table(tmp_path / "out.parquet")
+    assert table.num_rows == 5
+    assert telemetry["rows_processed"] == 5
+    assert telemetry["bytes_processed"] == (tmp_path / "out.parquet").stat().st_size
+    assert [rows for rows, _ in progress] == [4, 1, 0]
+
+
+@pytest.mark.parametrize(
+    ("format_hint", "expected"), [("jsonl", '{"id":1}\n{"id":2}\n'), ("json", '[{"id":1},{"id":2}]')]
+)
+def test_sync_writer_encodes_row_formats_incrementally(tmp_path: Path, format_hint: str, expected: str) -> None:
+    target = tmp_path / f"out.{format_hint}"
+    with SyncStoragePipeline().open_writer(str(target), format_hint=format_hint) as writer:  # type: ignore[arg-type]
+        writer.write_rows([{"id": 1}])
+        writer.write_rows([{"id": 2}])
+
+    assert target.read_text() == expected
+
+
+def test_sync_writer_buffers_when_backend_lacks_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = _BufferOnlyBackend()
+    monkeypatch.setattr(
+        SyncStoragePipeline, "_backend", lambda self, destination, options: (backend, "out.jsonl", "fake")
+    )
+
+    with SyncStoragePipeline().open_writer("memory://out.jsonl", format_hint="jsonl") as writer:
+        writer.write_rows([{"id": 1}])
+
+    assert backend.payloads == {"out.jsonl": b'{"id":1}\n'}
+
+
+def test_sync_writer_aborts_partial_object_on_error(tmp_path: Path) -> None:
+    target = tmp_path / "out.parquet"
+    with pytest.raises(RuntimeError), SyncStoragePipeline().open_writer(str(target)) as writer:
+        writer.write_batch(_batch(0, 2))
+        raise RuntimeError("boom")
+
+    assert not target.exists()
+
+
+def test_open_writer_rejects_unsupported_format(tmp_path: Path) -> None:
+    with pytest.raises(StorageCapabilityError):
+        SyncStoragePipeline().open_writer(str(tmp_path / "out.txt"), format_hint="text")  # type: ignore[arg-type]
+
+
+@pytest.mark.anyio
+async def test_async_writer_streams_parquet_batches(tmp_path: Path) -> None:
+    writer = await AsyncStoragePipeline().open_writer(str(tmp_path / "out.parquet"))
+    async with writer:
+        await writer.write_batch(_batch(0, 3))
+        await writer.write_batch(_batch(3, 3))
+
+    assert pq.read_table(tmp_path / "out.parquet").column("id").to_pylist() == list(range(6))
+
+
+def test_sqlite_select_to_storage_streams_in_batches(tmp_path: Path) -> None:
+    target = tmp_path / "users.parquet"
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        session.execute_many("INSERT INTO users (name) VALUES (?)", [(f"user{i}",) for i in range(27)])
+        job = session.select_to_storage("SELECT id, name FROM users ORDER BY id", str(target), batch_size=10)
+    config.close_pool()
+
+    parquet_file = pq.ParquetFile(target)
+    assert job.telemetry["rows_processed"] == 27
+    assert parquet_file.metadata.num_rows == 27
+    assert parquet_file.metadata.num_row_groups == 3
+
+
+def test_sqlite_select_to_storage_types_columns_null_in_first_batch(tmp_path: Path) -> None:
+    target = tmp_path / "scores.parquet"
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session:
+        session.execute("CREATE TABLE scores (id INTEGER PRIMARY KEY, score INTEGER)")
+        session.execute_many("INSERT INTO scores (score) VALUES (?)", [(None,), (None,), (5,), (6,)])
+        session.select_to_storage("SELECT id, score FROM scores ORDER BY id", str(target), batch_size=2)
+    config.close_pool()
+
+    table = pq.read_table(target)
+    assert table.schema.field("score").type == pa.int64()
+    assert table.column("score").to_pylist() == [None, None, 5, 6]
+
+
+def test_sqlite_select_to_storage_removes_partial_output_on_failure(tmp_path: Path) -> None:
+    target = tmp_path / "users.parquet"
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session, pytest.raises(SQLSpecError):
+        session.select_to_storage("SELECT * FROM missing_table", str(target))
+    config.close_pool()
+
+    assert not target.exists()
+
+
+@pytest.mark.anyio
+async def test_aiosqlite_select_to_storage_streams_jsonl(tmp_path: Path) -> None:
+    target = tmp_path / "users.jsonl"
+    config = AiosqliteConfig(connection_config={"database": str(tmp_path / "users.db")})
+    async with config.provide_session() as session:
+        await session.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        await session.execute("INSERT INTO users (name) VALUES ('test'), ('example')")
+        job = await session.select_to_storage(
+            "SELECT name FROM users ORDER BY id", str(target), format_hint="jsonl", batch_size=1
+        )
+    await config.close_pool()
+
+    assert job.telemetry["rows_processed"] == 2
+    assert [json.loads(line)["name"] for line in target.read_text().splitlines()] == ["test", "example"]
@@ -5,13 +5,18 @@ These tests lock in the commit-on-success / rollback-on-error behavior of
 neither context manager suppresses exceptions raised inside the ``with`` body.
 The non-suppression guarantee is what lets callers ``return`` from inside the
 block without a trailing unreachable ``raise`` to satisfy type checkers.
+
+The ``BatchLoader`` tests cover per-tick key coalescing, request-scoped caching
+and result fan-out against a real aiosqlite session.
 """
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from sqlspec.service import SQLSpecAsyncService, SQLSpecSyncService
+from sqlspec.service import BatchLoader, SQLSpecAsyncService, SQLSpecSyncService
 
 pytestmark = pytest.mark.anyio
 
@@ -64,3 +69,104 @@ def test_sync_begin_transaction_rolls_back_and_propagates() -> None:
     session.begin.assert_called_once()
     session.rollback.assert_called_once()
     session.commit.assert_not_called()
+
+
+class _CountingDriverProxy:
+    """Forward to a real driver while recording the SQL sent through ``select``."""
+
+    def __init__(self, driver: Any) -> None:
+        self._driver = driver
+        self.statements: list[Any] = []
+
+    async def select(self, statement: Any, *parameters: Any, **kwargs: Any) -> Any:
+        self.statements.append(statement)
+        return await self._driver.select(statement, *parameters, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._driver, name)
+
+
+async def test_batch_loader_coalesces_loads_in_one_tick(aiosqlite_async_driver: Any) -> None:
+    proxy = _CountingDriverProxy(aiosqlite_async_driver)
+    service: SQLSpecAsyncService = SQLSpecAsyncService(proxy)  # type: ignore[arg-type]
+    loader = service.batch_loader("SELECT id, name FROM users", key_column="id")
+
+    first, second, missing = await asyncio.gather(loader.load(1), loader.load(2), loader.load(99))
+
+    assert first == {"id": 1, "name": "test"}
+    assert second == {"id": 2, "name": "example"}
+    assert missing is None
+    assert len(proxy.statements) == 1
+
+
+async def test_batch_loader_caches_per_service_and_clears_on_commit(aiosqlite_async_driver: Any) -> None:
+    proxy = _CountingDriverProxy(aiosqlite_async_driver)
+    service: SQLSpecAsyncService = SQLSpecAsyncService(proxy)  # type: ignore[arg-type]
+    loader = service.batch_loader("SELECT id, name FROM users", key_column="id")
+
+    assert await loader.load(1) == {"id": 1, "name": "test"}
+    assert await loader.load(1) == {"id": 1, "name": "test"}
+    assert service.batch_loader("SELECT id, name FROM users", key_column="id") is loader
+    assert len(proxy.statements) == 1
+
+    await service.begin()
+    await service.commit()
+    await loader.load(1)
+
+    assert len(proxy.statements) == 2
+
+
+class _OverlapTrackingSession:
+    """Stub session that records how many ``select`` calls run at once."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def select(self, statement: Any, *parameters: Any, **kwargs: Any) -> Any:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return [{"id": key} for key in parameters[-1].values]
+
+
+async def test_service_batch_loaders_run_selects_one_at_a_time() -> None:
+    session = _OverlapTrackingSession()
+    service: SQLSpecAsyncService = SQLSpecAsyncService(session)  # type: ignore[arg-type]
+    users = service.batch_loader("SELECT id FROM users", key_column="id")
+    orders = service.batch_loader("SELECT id FROM orders", key_column="id")
+
+    user, order = await asyncio.gather(users.load(1), orders.load(2))
+
+    assert (user, order) == ({"id": 1}, {"id": 2})
+    assert session.peak == 1
+
+
+async def test_batch_loader_splits_batches_and_preserves_order(aiosqlite_async_driver: Any) -> None:
+    proxy = _CountingDriverProxy(aiosqlite_async_driver)
+    loader = BatchLoader(proxy, "SELECT id, name FROM users", key_column="users.id", max_batch_size=1)  # type: ignore[arg-type]
+
+    rows = await loader.load_many([2, 1])
+
+    assert [row["name"] for row in rows] == ["example", "test"]
+    assert len(proxy.statements) == 2
+
+
+async def test_batch_loader_many_groups_rows_per_key(aiosqlite_async_driver: Any) -> None:
+    loader = BatchLoader(aiosqlite_async_driver, "SELECT id, name FROM users", key_column="name", many=True)
+
+    matches, empty = await asyncio.gather(loader.load("test"), loader.load("nobody"))
+
+    assert matches == [{"id": 1, "name": "test"}]
+    assert empty == []
+
+
+async def test_batch_loader_propagates_errors_and_evicts_keys(aiosqlite_async_driver: Any) -> None:
+    loader = BatchLoader(aiosqlite_async_driver, "SELECT id FROM missing_table", key_column="id")
+
+    with pytest.raises(Exception, match="missing_table"):
+        await loader.load(1)
+
+    loader.statement = "SELECT id, name FROM users"
+    assert await loader.load(1) == {"id": 1, "name": "test"}
@@ -0,0 +1,208 @@
+"""Tests for streaming table-to-table transfer (sqlspec/_transfer.py)."""
+
+from typing import Any
+
+import pytest
+
+from sqlspec import TransferCheckpoint, transfer, transfer_async
+from sqlspec._transfer import build_upsert_sql
+from sqlspec.adapters.aiosqlite import AiosqliteConfig
+from sqlspec.adapters.duckdb import DuckDBConfig
+from sqlspec.adapters.sqlite import SqliteConfig
+from sqlspec.exceptions import ImproperConfigurationError
+
+QUERY = "SELECT id, label FROM items ORDER BY id"
+
+
+def _seed(session: Any, count: int = 25) -> None:
+    session.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+    session.execute_many("INSERT INTO items VALUES (?, ?)", [(index, f"label-{index}") for index in range(count)])
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_transfer_appends_batches_and_reports_throughput(prefetch: int) -> None:
+    source_config = SqliteConfig(connection_config={"database": ":memory:"})
+    target_config = SqliteConfig(connection_config={"database": ":memory:"})
+    checkpoints: list[TransferCheckpoint] = []
+    with source_config.provide_session() as source, target_config.provide_session() as target:
+        _seed(source)
+        target.execute("CREATE TABLE copy (id INTEGER PRIMARY KEY, label TEXT)")
+
+        result = transfer(
+            source, QUERY, target, "copy", batch_size=10, prefetch=prefetch, on_checkpoint=checkpoints.append
+        )
+
+        assert target.select_value("SELECT COUNT(*) FROM copy") == 25
+        assert target.select_value("SELECT label FROM copy WHERE id = 24") == "label-24"
+    source_config.close_pool()
+    target_config.close_pool()
+
+    assert (result.rows, result.batches) == (25, 3)
+    assert result.bytes > 0
+    assert result.rows_per_second > 0
+    assert [checkpoint.rows for checkpoint in checkpoints] == [10, 20, 25]
+    assert result.checkpoint == checkpoints[-1]
+
+
+def test_transfer_keeps_types_of_columns_null_in_first_batch() -> None:
+    source_config = SqliteConfig(connection_config={"database": ":memory:"})
+    target_config = SqliteConfig(connection_config={"database": ":memory:"})
+    with source_config.provide_session() as source, target_config.provide_session() as target:
+        source.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, n INTEGER)")
+        source.execute_many("INSERT INTO items VALUES (?, ?)", [(1, None), (2, None), (3, 30)])
+        target.execute("CREATE TABLE copy (id INTEGER PRIMARY KEY, n)")
+
+        result = transfer(source, "SELECT id, n FROM items ORDER BY id", target, "copy", batch_size=2)
+
+        assert result.rows == 3
+        assert target.select_value("SELECT typeof(n) FROM copy WHERE id = 3") == "integer"
+    source_config.close_pool()
+    target_config.close_pool()
+
+
+def test_transfer_replace_empties_target_even_for_empty_source() -> None:
+    source_config = SqliteConfig(connection_config={"database": ":memory:"})
+    target_config = SqliteConfig(connection_config={"database": ":memory:"})
+    with source_config.provide_session() as source, target_config.provide_session() as target:
+        _seed(source)
+        target.execute("CREATE TABLE copy (id INTEGER PRIMARY KEY, label TEXT)")
+        target.execute("INSERT INTO copy VALUES (100, 'stale')")
+
+        transfer(source, QUERY, target, "copy", batch_size=10, mode="replace")
+        assert target.select_value("SELECT COUNT(*) FROM copy") == 25
+
+        result = transfer(source, "SELECT id, label FROM items WHERE id < 0", target, "copy", mode="replace")
+        assert result.rows == 0
+        assert target.select_value("SELECT COUNT(*) FROM copy") == 0
+    source_config.close_pool()
+    target_config.close_pool()
+
+
+def test_transfer_upsert_updates_existing_keys() -> None:
+    source_config = SqliteConfig(connection_config={"database": ":memory:"})
+    target_config = DuckDBConfig(connection_config={"database": ":memory:"})
+    with source_config.provide_session() as source, target_config.provide_session() as target:
+        _seed(source, count=5)
+        target.execute("CREATE TABLE copy (id INTEGER PRIMARY KEY, label VARCHAR)")
+        target.execute("INSERT INTO copy VALUES (1, 'old'), (99, 'kept')")
+
+        result = transfer(source, QUERY, target, "copy", batch_size=2, mode="upsert", key_columns=["id"])
+
+        assert target.select_value("SELECT COUNT(*) FROM copy") == 6
+        assert target.select_value("SELECT label FROM copy WHERE id = 1") == "label-1"
+    source_config.close_pool()
+    target_config.close_pool()
+
+    assert result.rows == 5
+
+
+def test_transfer_resumes_from_checkpoint() -> None:
+    source_config = SqliteConfig(connection_config={"database": ":memory:"})
+    target_config = SqliteConfig(connection_config={"database": ":memory:"})
+    checkpoints: list[TransferCheckpoint] = []
+
+    def fail_after_first(checkpoint: TransferCheckpoint) -> None:
+        checkpoints.append(checkpoint)
+        msg = "interrupted"
+        raise RuntimeError(msg)
+
+    with source_config.provide_session() as source, target_config.provide_session() as target:
+        _seed(source)
+        target.execute("CREATE TABLE copy (id INTEGER PRIMARY KEY, label TEXT)")
+        with pytest.raises(RuntimeError, match="interrupted"):
+            transfer(source, QUERY, target, "copy", batch_size=7, on_checkpoint=fail_after_first)
+
+        result = transfer(source, QUERY, target, "copy", batch_size=10, resume_from=checkpoints[-1])
+
+        assert target.select_value("SELECT COUNT(*) FROM copy") == 25
+        assert target.select_value("SELECT MIN(id) FROM copy") == 0
+    source_config.close_pool()
+    target_config.close_pool()
+
+    assert checkpoints[-1].rows == 7
+    assert (result.rows, result.batches) == (25, 4)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"mode": "merge"}, "mode"),
+        ({"mode": "upsert"}, "key_columns"),
+        ({"batch_size": 0}, "batch_size"),
+        ({"prefetch": -1}, "prefetch"),
+    ],
+)
+def test_transfer_rejects_invalid_arguments(kwargs: "dict[str, Any]", message: str) -> None:
+    config = SqliteConfig(connection_config={"database": ":memory:"})
+    with config.provide_session() as session, pytest.raises(ValueError, match=message):
+        transfer(session, "SELECT 1 AS id", session, "copy", **kwargs)
+    config.close_pool()
+
+
+@pytest.mark.parametrize(
+    ("dialect", "expected"),
+    [
+        ("postgres", "ON CONFLICT (id) DO UPDATE SET label = EXCLUDED.label"),
+        ("mysql", "ON DUPLICATE KEY UPDATE label = VALUES(label)"),
+        ("oracle", "USING (SELECT :id AS id, :label AS label FROM dual) s ON (t.id = s.id)"),
+    ],
+)
+def test_build_upsert_sql_per_dialect(dialect: str, expected: str) -> None:
+    sql = build_upsert_sql("copy", ["id", "label"], ["id"], dialect)
+
+    assert expected in sql
+
+
+def test_build_upsert_sql_rejects_unknown_dialect_and_keys() -> None:
+    with pytest.raises(ImproperConfigurationError, match="not supported"):
+        build_upsert_sql("copy", ["id"], ["id"], "bigquery")
+    with pytest.raises(ImproperConfigurationError, match="key_columns"):
+        build_upsert_sql("copy", ["id"], ["missing"], "sqlite")
+    assert build_upsert_sql("copy", ["id"], ["id"], "sqlite").endswith("DO NOTHING")
+
+
+async def test_transfer_async_mixes_async_source_and_sync_target() -> None:
+    source_config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    target_config = SqliteConfig(connection_config={"database": ":memory:"})
+    checkpoints: list[TransferCheckpoint] = []
+
+    async def record(checkpoint: TransferCheckpoint) -> None:
+        checkpoints.append(checkpoint)
+
+    async with source_config.provide_session() as source:
+        await source.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+        await source.execute_many("INSERT INTO items VALUES (?, ?)", [(index, f"label-{index}") for index in range(25)])
+        with target_config.provide_session() as target:
+            target.execute("CREATE TABLE copy (id INTEGER PRIMARY KEY, label TEXT)")
+            target.execute("INSERT INTO copy VALUES (3, 'old')")
+
+            result = await transfer_async(
+                source, QUERY, target, "copy", batch_size=10, mode="upsert", key_columns=("id",), on_checkpoint=record
+            )
+
+            assert target.select_value("SELECT COUNT(*) FROM copy") == 25
+            assert target.select_value("SELECT label FROM copy WHERE id = 3") == "label-3"
+    await source_config.close_pool()
+    target_config.close_pool()
+
+    assert result.rows == 25
+    assert [checkpoint.batches for checkpoint in checkpoints] == [1, 2, 3]
+
+
+async def test_transfer_async_replace_between_async_sessions() -> None:
+    source_config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    target_config = AiosqliteConfig(connection_config={"database": ":memory:"})
+    async with source_config.provide_session() as source, target_config.provide_session() as target:
+        await source.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+        await source.execute_many("INSERT INTO items VALUES (?, ?)", [(index, f"label-{index}") for index in range(12)])
+        await target.execute("CREATE TABLE copy (id INTEGER PRIMARY KEY, label TEXT)")
+        await target.execute("INSERT INTO copy VALUES (100, 'stale')")
+
+        result = await transfer_async(source, QUERY, target, "copy", batch_size=5, mode="replace", prefetch=2)
+
+        assert await target.select_value("SELECT COUNT(*) FROM copy") == 12
+        assert await target.select_value("SELECT MAX(id) FROM copy") == 11
+    await source_config.close_pool()
+    await target_config.close_pool()
+
+    assert result.batches == 3
@@ -299,3 +299,68 @@ def test_arrow_reader_to_return_format_rejects_non_reader() -> None:
 
     with pytest.raises(TypeError):
         arrow_reader_to_return_format(object(), return_format="reader")
+
+
+def test_arrow_table_from_row_batches_promotes_chunk_types() -> None:
+    import pyarrow as pa
+
+    from sqlspec.utils.arrow_helpers import arrow_table_from_row_batches, rows_to_arrow_batch
+
+    names = ["id", "score", "note"]
+    batches = [rows_to_arrow_batch([(1, 1, None), (2, 2, None)], names), rows_to_arrow_batch([(3, 2.5, None)], names)]
+    table = arrow_table_from_row_batches(batches, names, {"note": "date"})
+
+    assert table.schema.field("score").type == pa.float64()
+    assert table.schema.field("note").type == pa.date32()
+    assert table.column("id").to_pylist() == [1, 2, 3]
+
+
+def test_arrow_table_from_row_batches_keeps_columns_for_empty_results() -> None:
+    import pyarrow as pa
+
+    from sqlspec.utils.arrow_helpers import arrow_table_from_row_batches
+
+    table = arrow_table_from_row_batches([], ["id", "name"], {"id": "int64"})
+
+    assert table.num_rows == 0
+    assert table.schema == pa.schema([("id", pa.int64()), ("name", pa.string())])
+
+
+def test_arrow_reader_from_row_chunks_fetches_lazily() -> None:
+    import pyarrow as pa
+
+    from sqlspec.utils.arrow_helpers import arrow_reader_from_row_chunks
+
+    chunks = [([(1, "a")], ["id", "label"], None), ([(2, None)], ["id", "label"], None), ([], ["id", "label"], None)]
+    calls: list[int] = []
+
+    def fetch_chunk() -> Any:
+        calls.append(1)
+        return chunks[len(calls) - 1]
+
+    reader = arrow_reader_from_row_chunks(fetch_chunk)
+
+    assert len(calls) == 1
+    assert reader.schema == pa.schema([("id", pa.int64()), ("label", pa.string())])
+    assert reader.read_all().column("label").to_pylist() == ["a", None]
+    assert len(calls) == 3
+
+
+def test_arrow_reader_from_row_chunks_holds_back_null_columns() -> None:
+    import pyarrow as pa
+
+    from sqlspec.utils.arrow_helpers import arrow_reader_from_row_chunks
+
+    chunks = iter([
+        ([(1, None)], ["id", "n"], None),
+        ([(2, None)], ["id", "n"], None),
+        ([(3, 3.5)], ["id", "n"], None),
+        ([], ["id", "n"], None),
+    ])
+
+    reader = arrow_reader_from_row_chunks(lambda: next(chunks))
+    batches = list(reader)
+
+    assert reader.schema == pa.schema([("id", pa.int64()), ("n", pa.float64())])
+    assert [batch.num_rows for batch in batches] == [1, 1, 1]
+    assert pa.Table.from_batches(batches).column("n").to_pylist() == [None, None, 3.5]
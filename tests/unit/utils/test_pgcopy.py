@@ -0,0 +1,299 @@
+"""Tests for the PostgreSQL binary COPY (PGCOPY) Arrow codec."""
+
+import datetime as dt
+import struct
+import uuid
+from typing import Any
+
+import pytest
+
+from sqlspec.typing import PYARROW_INSTALLED
+from sqlspec.utils.pgcopy import (
+    PGCOPY_SIGNATURE,
+    PgCopyBinaryDecoder,
+    aiter_copy_batches,
+    build_copy_describe_sql,
+    build_copy_to_stdout_sql,
+    create_pgcopy_decoder,
+    create_pgcopy_encoder,
+    iter_copy_batches,
+    iter_pgcopy_chunks,
+)
+
+pytestmark = pytest.mark.skipif(not PYARROW_INSTALLED, reason="pyarrow not installed")
+
+_EPOCH_DATE = dt.date(2000, 1, 1)
+_EPOCH_TIMESTAMP = dt.datetime(2000, 1, 1)
+
+
+def _encode_field(kind: str, value: Any) -> bytes:
+    if kind == "int4":
+        return struct.pack(">i", value)
+    if kind == "int8":
+        return struct.pack(">q", value)
+    if kind == "float8":
+        return struct.pack(">d", value)
+    if kind == "bool":
+        return bytes((int(value),))
+    if kind == "uuid":
+        return bytes(value.bytes)
+    if kind == "date":
+        return struct.pack(">i", (value - _EPOCH_DATE).days)
+    if kind == "timestamp":
+        return struct.pack(">q", (value - _EPOCH_TIMESTAMP) // dt.timedelta(microseconds=1))
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+def _payload(rows: "list[tuple[Any, ...]]", kinds: "list[str]") -> bytes:
+    out = bytearray(PGCOPY_SIGNATURE + struct.pack(">ii", 0, 0))
+    for row in rows:
+        out += struct.pack(">h", len(row))
+        for kind, value in zip(kinds, row, strict=True):
+            if value is None:
+                out += struct.pack(">i", -1)
+                continue
+            field = _encode_field(kind, value)
+            out += struct.pack(">i", len(field)) + field
+    out += struct.pack(">h", -1)
+    return bytes(out)
+
+
+def _decode(decoder: PgCopyBinaryDecoder, payload: bytes, chunk_size: int) -> "list[Any]":
+    batches = []
+    for offset in range(0, len(payload), chunk_size):
+        batches.extend(decoder.feed(payload[offset : offset + chunk_size]))
+    batches.extend(decoder.finish())
+    return batches
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1_000, 1_000_000])
+def test_fixed_width_columns_decode_across_chunk_boundaries(chunk_size: int) -> None:
+    import pyarrow as pa
+
+    token = uuid.uuid4()
+    columns = [("id", 23), ("big", 20), ("score", 701), ("ok", 16), ("uid", 2950), ("day", 1082), ("at", 1114)]
+    rows = [
+        (
+            index,
+            index * 10**10,
+            index / 4,
+            index % 2 == 1,
+            token,
+            dt.date(2024, 1, 1) + dt.timedelta(days=index),
+            dt.datetime(2024, 1, 1, 12) + dt.timedelta(seconds=index),
+        )
+        for index in range(25)
+    ]
+    decoder = PgCopyBinaryDecoder(columns, batch_size=10)
+
+    batches = _decode(
+        decoder, _payload(rows, ["int4", "int8", "float8", "bool", "uuid", "date", "timestamp"]), chunk_size
+    )
+    table = pa.Table.from_batches(batches)
+
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+    assert table.column("id").to_pylist() == list(range(25))
+    assert table.column("big").to_pylist()[3] == 3 * 10**10
+    assert table.column("score").to_pylist()[2] == 0.5
+    assert table.column("ok").to_pylist()[:3] == [False, True, False]
+    assert table.column("day").to_pylist()[2] == dt.date(2024, 1, 3)
+    assert table.column("at").to_pylist()[5] == dt.datetime(2024, 1, 1, 12, 0, 5)
+    assert table.column("uid").to_pylist()[0] == (token if hasattr(pa, "uuid") else token.bytes)
+    assert decoder.rows_decoded == 25
+
+
+def test_nulls_and_variable_width_columns() -> None:
+    import pyarrow as pa
+
+    rows = [(index if index % 3 else None, f"n{index}" if index % 4 else None, b"\x00\x01") for index in range(23)]
+    decoder = PgCopyBinaryDecoder([("id", 23), ("name", 25), ("blob", 17)], batch_size=10)
+
+    table = pa.Table.from_batches(_decode(decoder, _payload(rows, ["int4", "text", "text"]), 5))
+
+    assert table.schema == pa.schema([("id", pa.int32()), ("name", pa.string()), ("blob", pa.binary())])
+    assert table.column("id").to_pylist() == [row[0] for row in rows]
+    assert table.column("name").to_pylist() == [row[1] for row in rows]
+    assert table.column("blob").to_pylist()[0] == b"\x00\x01"
+
+
+def test_null_in_fixed_width_column() -> None:
+    import pyarrow as pa
+
+    rows = [(index, None if index == 13 else index) for index in range(25)]
+    decoder = PgCopyBinaryDecoder([("a", 23), ("b", 23)], batch_size=10)
+
+    table = pa.Table.from_batches(_decode(decoder, _payload(rows, ["int4", "int4"]), 1_000_000))
+
+    assert table.column("b").to_pylist() == [row[1] for row in rows]
+
+
+def test_empty_result_yields_schema_batch() -> None:
+    decoder = PgCopyBinaryDecoder([("id", 23), ("name", 25)])
+
+    batches = _decode(decoder, _payload([], ["int4", "text"]), 3)
+
+    assert len(batches) == 1
+    assert batches[0].num_rows == 0
+    assert batches[0].schema.names == ["id", "name"]
+
+
+def test_truncated_stream_raises() -> None:
+    payload = _payload([(1,), (2,)], ["int4"])
+    decoder = PgCopyBinaryDecoder([("id", 23)])
+    decoder.feed(payload[:-2])
+
+    with pytest.raises(ValueError, match="trailer"):
+        decoder.finish()
+
+
+@pytest.mark.parametrize("chunk_size", [5, 1_000_000])
+def test_values_that_look_like_row_headers_are_skipped(chunk_size: int) -> None:
+    import pyarrow as pa
+
+    lookalike = struct.pack(">hi", 2, 4) + struct.pack(">i", 7) + struct.pack(">i", -1)
+    rows = [(index, lookalike * (index % 3) if index % 4 else None) for index in range(25)]
+    decoder = PgCopyBinaryDecoder([("id", 23), ("payload", 17)], batch_size=10)
+
+    batches = _decode(decoder, _payload(rows, ["int4", "bytea"]), chunk_size)
+
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+    table = pa.Table.from_batches(batches)
+    assert table.column("id").to_pylist() == list(range(25))
+    assert table.column("payload").to_pylist() == [row[1] for row in rows]
+
+
+def test_malformed_rows_raise() -> None:
+    header = PGCOPY_SIGNATURE + struct.pack(">ii", 0, 0)
+
+    with pytest.raises(ValueError, match="3 fields, expected 1"):
+        PgCopyBinaryDecoder([("id", 23)]).feed(header + struct.pack(">hi", 3, -1))
+    with pytest.raises(ValueError, match="column 'id' has invalid length 8"):
+        PgCopyBinaryDecoder([("id", 23)]).feed(header + struct.pack(">hiq", 1, 8, 0))
+
+
+def test_unsupported_types_disable_decoder() -> None:
+    assert create_pgcopy_decoder([("amount", 1700)], 100) is None
+    assert create_pgcopy_decoder([], 100) is None
+    assert create_pgcopy_decoder([("id", 23)], 100) is not None
+
+
+def test_copy_sql_wrappers_strip_terminator() -> None:
+    assert build_copy_to_stdout_sql("SELECT 1;") == "COPY (SELECT 1) TO STDOUT (FORMAT BINARY)"
+    assert build_copy_describe_sql("SELECT 1 ").startswith("SELECT * FROM (SELECT 1) AS ")
+
+
+class _SyncSource:
+    def __init__(self, chunks: "list[bytes]") -> None:
+        self.chunks = [*chunks, b""]
+        self.closed_with: bool | None = None
+
+    def read(self) -> bytes:
+        return self.chunks.pop(0)
+
+    def close(self, error: bool = False) -> None:
+        self.closed_with = error
+
+
+class _AsyncSource(_SyncSource):
+    async def read(self) -> bytes:  # type: ignore[override]
+        return self.chunks.pop(0)
+
+    async def close(self, error: bool = False) -> None:  # type: ignore[override]
+        self.closed_with = error
+
+
+def test_iter_copy_batches_closes_source() -> None:
+    payload = _payload([(index,) for index in range(5)], ["int4"])
+    source = _SyncSource([payload[:9], payload[9:]])
+
+    batches = list(iter_copy_batches(source, PgCopyBinaryDecoder([("id", 23)], batch_size=2)))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert source.closed_with is False
+
+
+@pytest.mark.anyio
+async def test_aiter_copy_batches_reports_decode_errors_to_source() -> None:
+    source = _AsyncSource([b"not a copy stream"])
+
+    with pytest.raises(ValueError):
+        _ = [batch async for batch in aiter_copy_batches(source, PgCopyBinaryDecoder([("id", 23)]))]
+
+    assert source.closed_with is True
+
+
+def _round_trip(table: Any, target_columns: "list[tuple[str, int]]", batch_size: int = 3) -> Any:
+    import pyarrow as pa
+
+    encoder = create_pgcopy_encoder(table.schema, target_columns)
+    assert encoder is not None
+    payload = b"".join(iter_pgcopy_chunks(table, encoder, batch_size=batch_size))
+    decoder = PgCopyBinaryDecoder(target_columns)
+    return pa.Table.from_batches(decoder.feed(payload) + decoder.finish())
+
+
+def test_encoder_round_trips_through_decoder() -> None:
+    import pyarrow as pa
+
+    token = uuid.uuid4()
+    table = pa.table({
+        "id": pa.array(range(10), pa.int64()),
+        "small": pa.array([None if index % 4 == 0 else index for index in range(10)], pa.int8()),
+        "score": pa.array([index / 2 for index in range(10)], pa.float32()),
+        "ok": pa.array([index % 3 == 0 for index in range(10)]),
+        "name": pa.array([None if index == 5 else f"name-{index}" for index in range(10)]),
+        "region": pa.array([f"r{index % 2}" for index in range(10)]).dictionary_encode(),
+        "day": pa.array([dt.date(2024, 2, 1) + dt.timedelta(days=index) for index in range(10)]),
+        "at": pa.array(
+            [dt.datetime(2024, 2, 1) + dt.timedelta(minutes=index) for index in range(10)], pa.timestamp("ns")
+        ),
+        "uid": pa.array([token.bytes] * 10, pa.binary(16)),
+        "missing": pa.nulls(10),
+    })
+    targets = [
+        ("id", 20),
+        ("small", 21),
+        ("score", 701),
+        ("ok", 16),
+        ("name", 25),
+        ("region", 1043),
+        ("day", 1082),
+        ("at", 1114),
+        ("uid", 2950),
+        ("missing", 23),
+    ]
+
+    decoded = _round_trip(table.slice(1), targets)
+
+    assert decoded.num_rows == 9
+    for name in ("id", "small", "score", "ok", "name", "day", "at"):
+        expected = table.slice(1).column(name).cast(decoded.schema.field(name).type).to_pylist()
+        assert decoded.column(name).to_pylist() == expected, name
+    assert decoded.column("region").to_pylist() == [f"r{index % 2}" for index in range(1, 10)]
+    assert decoded.column("uid").to_pylist()[0] == (token if hasattr(pa, "uuid") else token.bytes)
+    assert decoded.column("missing").null_count == 9
+
+
+def test_encoder_fixed_width_batches_use_single_layout() -> None:
+    import pyarrow as pa
+
+    table = pa.table({"id": pa.array([1, 2], pa.int32()), "at": pa.array([dt.date(2000, 1, 2)] * 2)})
+    encoder = create_pgcopy_encoder(table.schema, [("id", 23), ("at", 1082)])
+    assert encoder is not None
+
+    payload = encoder.encode(table.to_batches()[0])
+
+    assert payload == (struct.pack(">hiiii", 2, 4, 1, 4, 1) + struct.pack(">hiiii", 2, 4, 2, 4, 1))
+
+
+def test_encoder_rejects_unsupported_targets_and_types() -> None:
+    import pyarrow as pa
+
+    schema = pa.schema([("id", pa.int64()), ("label", pa.string())])
+
+    assert create_pgcopy_encoder(schema, [("id", 20), ("label", 3802)]) is None
+    assert create_pgcopy_encoder(schema, [("id", 20)]) is None
+    assert create_pgcopy_encoder(schema, [("id", 25), ("label", 25)]) is None
+    assert create_pgcopy_encoder(pa.schema([("total", pa.decimal128(10, 2))]), [("total", 701)]) is None
+    with pytest.raises(pa.ArrowInvalid):
+        _round_trip(pa.table({"id": pa.array([2**40])}), [("id", 23)])
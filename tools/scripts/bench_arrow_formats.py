@@ -0,0 +1,123 @@
+"""Compare Arrow IPC and Parquet encode/decode cost through the storage codecs."""
+
+import argparse
+import io
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+import click
+import pyarrow as pa
+
+from sqlspec.storage._arrow_payload import ArrowBatchDecoder, ArrowBatchEncoder, StorageFormat
+
+SCENARIOS: "tuple[tuple[StorageFormat, str | None], ...]" = (
+    ("parquet", "snappy"),
+    ("parquet", "zstd"),
+    ("arrow-ipc", None),
+    ("arrow-stream", None),
+    ("arrow-stream", "lz4"),
+    ("arrow-stream", "zstd"),
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Summary for one format/codec scenario."""
+
+    format: str
+    compression: str
+    encode_median_seconds: float
+    decode_median_seconds: float
+    payload_kib: float
+    row_count: int
+
+
+def _build_table(rows: int) -> "pa.Table":
+    return pa.table({
+        "id": pa.array(range(rows), type=pa.int64()),
+        "amount": pa.array([index * 0.25 for index in range(rows)], type=pa.float64()),
+        "region": pa.array([f"region-{index % 16}" for index in range(rows)]),
+        "note": pa.array([f"order {index} shipped" for index in range(rows)]),
+    })
+
+
+def _encode(table: "pa.Table", format_choice: StorageFormat, compression: "str | None", batch_size: int) -> bytes:
+    encoder = ArrowBatchEncoder(format_choice, compression=compression)
+    chunks = [encoder.encode(batch) for batch in table.to_batches(max_chunksize=batch_size)]
+    chunks.append(encoder.finish())
+    return b"".join(chunks)
+
+
+def _decode(payload: bytes, format_choice: StorageFormat, batch_size: int) -> int:
+    decoder = ArrowBatchDecoder(io.BytesIO(payload), format_choice, batch_size=batch_size)
+    row_count = 0
+    while (batch := decoder.read_next_batch()) is not None:
+        row_count += batch.num_rows
+    decoder.close()
+    return row_count
+
+
+def _median_seconds(fn: Callable[[], object], iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def run_benchmark(rows: int, iterations: int, batch_size: int) -> list[BenchmarkResult]:
+    """Run every format/codec scenario over the same table."""
+    table = _build_table(rows)
+    results = []
+    for format_choice, compression in SCENARIOS:
+        payload = _encode(table, format_choice, compression, batch_size)
+        row_count = _decode(payload, format_choice, batch_size)
+        if row_count != rows:
+            msg = f"{format_choice}/{compression} decoded {row_count} rows, expected {rows}"
+            raise RuntimeError(msg)
+        results.append(
+            BenchmarkResult(
+                format=format_choice,
+                compression=compression or "none",
+                encode_median_seconds=_median_seconds(
+                    lambda fc=format_choice, codec=compression: _encode(table, fc, codec, batch_size), iterations
+                ),
+                decode_median_seconds=_median_seconds(
+                    lambda data=payload, fc=format_choice: _decode(data, fc, batch_size), iterations
+                ),
+                payload_kib=len(payload) / 1024,
+                row_count=row_count,
+            )
+        )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a compact report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.iterations, args.batch_size)
+    if args.json:
+        click.echo(json.dumps([asdict(result) for result in results], indent=2, sort_keys=True))
+        return
+
+    click.echo(f"rows={args.rows} iterations={args.iterations} batch_size={args.batch_size}")
+    click.echo("format        codec    encode_s   decode_s   payload_kib")
+    for result in results:
+        click.echo(
+            f"{result.format:<13} {result.compression:<8} {result.encode_median_seconds:>8.4f} "
+            f"{result.decode_median_seconds:>10.4f} {result.payload_kib:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
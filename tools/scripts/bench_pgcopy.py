@@ -0,0 +1,157 @@
+"""Compare binary COPY (PGCOPY) Arrow codec throughput against the Python row path."""
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+import click
+import pyarrow as pa
+
+from sqlspec.utils.arrow_helpers import arrow_table_to_rows
+from sqlspec.utils.pgcopy import PgCopyBinaryDecoder, create_pgcopy_encoder, iter_pgcopy_chunks
+
+TARGET_COLUMNS: "list[tuple[str, int]]" = [
+    ("id", 20),
+    ("amount", 701),
+    ("placed_on", 1082),
+    ("region", 25),
+    ("note", 25),
+]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Summary for one direction/path scenario."""
+
+    direction: str
+    path: str
+    median_seconds: float
+    rows_per_second: float
+    mib_per_second: float
+    row_count: int
+
+
+def _build_table(rows: int) -> "pa.Table":
+    return pa.table({
+        "id": pa.array(range(rows), type=pa.int64()),
+        "amount": pa.array([index * 0.25 for index in range(rows)], type=pa.float64()),
+        "placed_on": pa.array([index % 3650 for index in range(rows)], type=pa.int32()).cast(pa.date32()),
+        "region": pa.array([f"region-{index % 16}" for index in range(rows)]),
+        "note": pa.array([None if index % 10 == 0 else f"order {index} shipped" for index in range(rows)]),
+    })
+
+
+def _encode_pgcopy(table: "pa.Table", batch_size: int) -> bytes:
+    encoder = create_pgcopy_encoder(table.schema, TARGET_COLUMNS)
+    if encoder is None:
+        msg = "benchmark table is not encodable"
+        raise RuntimeError(msg)
+    return b"".join(iter_pgcopy_chunks(table, encoder, batch_size=batch_size))
+
+
+def _decode_pgcopy(payload: bytes, batch_size: int, chunk_size: int) -> int:
+    decoder = PgCopyBinaryDecoder(TARGET_COLUMNS, batch_size=batch_size)
+    row_count = 0
+    for offset in range(0, len(payload), chunk_size):
+        row_count += sum(batch.num_rows for batch in decoder.feed(payload[offset : offset + chunk_size]))
+    return row_count + sum(batch.num_rows for batch in decoder.finish())
+
+
+def _decode_rows(records: "list[tuple[object, ...]]", schema: "pa.Schema", batch_size: int) -> int:
+    row_count = 0
+    for start in range(0, len(records), batch_size):
+        chunk = records[start : start + batch_size]
+        columns = [list(column) for column in zip(*chunk, strict=True)]
+        row_count += pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)], schema=schema
+        ).num_rows
+    return row_count
+
+
+def _median_seconds(fn: Callable[[], object], iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def _result(direction: str, path: str, seconds: float, rows: int, payload_bytes: int) -> BenchmarkResult:
+    return BenchmarkResult(
+        direction=direction,
+        path=path,
+        median_seconds=seconds,
+        rows_per_second=rows / seconds if seconds else 0.0,
+        mib_per_second=payload_bytes / 1024 / 1024 / seconds if seconds else 0.0,
+        row_count=rows,
+    )
+
+
+def run_benchmark(rows: int, iterations: int, batch_size: int, chunk_size: int) -> list[BenchmarkResult]:
+    """Time Arrow -> COPY payload (ingest) and COPY payload -> Arrow (export) for both paths.
+
+    The export row path starts from already-decoded Python tuples, so it leaves out
+    the driver's own wire decoding and is a lower bound for that path.
+    """
+    table = _build_table(rows)
+    payload = _encode_pgcopy(table, batch_size)
+    records = arrow_table_to_rows(table)[1]
+    if _decode_pgcopy(payload, batch_size, chunk_size) != rows:
+        msg = f"PGCOPY decode returned the wrong row count, expected {rows}"
+        raise RuntimeError(msg)
+    return [
+        _result("ingest", "rows", _median_seconds(lambda: arrow_table_to_rows(table), iterations), rows, len(payload)),
+        _result(
+            "ingest",
+            "pgcopy",
+            _median_seconds(lambda: _encode_pgcopy(table, batch_size), iterations),
+            rows,
+            len(payload),
+        ),
+        _result(
+            "export",
+            "rows",
+            _median_seconds(lambda: _decode_rows(records, table.schema, batch_size), iterations),
+            rows,
+            len(payload),
+        ),
+        _result(
+            "export",
+            "pgcopy",
+            _median_seconds(lambda: _decode_pgcopy(payload, batch_size, chunk_size), iterations),
+            rows,
+            len(payload),
+        ),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print a compact report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=65_536)
+    parser.add_argument("--chunk-size", type=int, default=65_536, help="Bytes per simulated COPY OUT message")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.iterations, args.batch_size, args.chunk_size)
+    if args.json:
+        click.echo(json.dumps([asdict(result) for result in results], indent=2, sort_keys=True))
+        return
+
+    click.echo(f"rows={args.rows} iterations={args.iterations} batch_size={args.batch_size}")
+    click.echo("direction  path     median_s   rows_per_s   MiB_per_s")
+    for result in results:
+        click.echo(
+            f"{result.direction:<10} {result.path:<8} {result.median_seconds:>8.4f} "
+            f"{result.rows_per_second:>12,.0f} {result.mib_per_second:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()